@@ -442,6 +442,9 @@ class WorkerSettings(BaseModel):
     worker_base_url: str = Field("http://queue-worker", alias="NOETL_WORKER_BASE_URL")
     worker_capacity_raw: Optional[str] = Field(None, alias="NOETL_WORKER_CAPACITY")
     worker_labels_raw: Optional[str] = Field(None, alias="NOETL_WORKER_LABELS")
+    # Tool kinds whose executors are imported in the background at startup
+    # (comma-separated, or "all"); every other tool imports on first use.
+    warm_tools_raw: Optional[str] = Field(None, alias="NOETL_WORKER_WARM_TOOLS")
     namespace: Optional[str] = Field(None, alias="POD_NAMESPACE")
     worker_id: Optional[str] = Field(None, alias="NOETL_WORKER_ID")
     deregister_retries: int = Field(3, alias="NOETL_DEREGISTER_RETRIES")
@@ -481,6 +484,9 @@ class WorkerSettings(BaseModel):
     throttle_poll_interval: float = Field(0.2, alias="NOETL_WORKER_THROTTLE_POLL_INTERVAL_SECONDS")
     postgres_pool_waiting_threshold: int = Field(2, alias="NOETL_WORKER_POSTGRES_POOL_WAITING_THRESHOLD")
     concurrency_probe_interval: float = Field(default=2.0, alias="NOETL_WORKER_CONCURRENCY_PROBE_INTERVAL")
+    # Worker-wide event micro-batching (0 disables coalescing)
+    event_linger_ms: float = Field(default=5.0, alias="NOETL_WORKER_EVENT_LINGER_MS")
+    event_batch_max_events: int = Field(64, alias="NOETL_WORKER_EVENT_BATCH_MAX_EVENTS")
 
     @field_validator('pool_runtime', mode='before')
     def normalize_runtime(cls, v):
@@ -521,6 +527,8 @@ class WorkerSettings(BaseModel):
         'throttle_poll_interval',
         'command_timeout_seconds',
         'concurrency_probe_interval',
+        'event_linger_ms',
+        'event_batch_max_events',
         mode='before'
     )
     def coerce_numeric(cls, v, info):
@@ -533,6 +541,7 @@ class WorkerSettings(BaseModel):
             'max_inflight_commands',
             'max_inflight_db_commands',
             'postgres_pool_waiting_threshold',
+            'event_batch_max_events',
         }:
             if isinstance(v, int):
                 return v
@@ -578,6 +587,10 @@ class WorkerSettings(BaseModel):
             raise ValueError("NOETL_WORKER_POSTGRES_POOL_WAITING_THRESHOLD must be >= 0")
         if self.command_timeout_seconds <= 0:
             raise ValueError("NOETL_WORKER_COMMAND_TIMEOUT_SECONDS must be > 0")
+        if self.event_linger_ms < 0:
+            raise ValueError("NOETL_WORKER_EVENT_LINGER_MS must be >= 0")
+        if self.event_batch_max_events < 1:
+            raise ValueError("NOETL_WORKER_EVENT_BATCH_MAX_EVENTS must be >= 1")
         return self
 
     @property
@@ -601,6 +614,12 @@ class WorkerSettings(BaseModel):
             return []
         return [label.strip() for label in self.worker_labels_raw.split(',') if label.strip()]
 
+    @property
+    def warm_tools(self) -> List[str]:
+        if not self.warm_tools_raw:
+            return []
+        return [kind.strip().lower() for kind in self.warm_tools_raw.split(',') if kind.strip()]
+
     @property
     def resolved_pool_name(self) -> str:
         if self.pool_name and self.pool_name.strip():
@@ -741,6 +760,7 @@ def get_worker_settings(reload: bool = False) -> WorkerSettings:
             NOETL_WORKER_BASE_URL=env.get('NOETL_WORKER_BASE_URL', 'http://queue-worker'),
             NOETL_WORKER_CAPACITY=env.get('NOETL_WORKER_CAPACITY'),
             NOETL_WORKER_LABELS=env.get('NOETL_WORKER_LABELS'),
+            NOETL_WORKER_WARM_TOOLS=env.get('NOETL_WORKER_WARM_TOOLS'),
             POD_NAMESPACE=env.get('POD_NAMESPACE'),
             NOETL_WORKER_ID=env.get('NOETL_WORKER_ID'),
             NOETL_DEREGISTER_RETRIES=env.get('NOETL_DEREGISTER_RETRIES', '3'),
@@ -781,6 +801,8 @@ def get_worker_settings(reload: bool = False) -> WorkerSettings:
             NOETL_WORKER_CONCURRENCY_PROBE_INTERVAL=env.get(
                 'NOETL_WORKER_CONCURRENCY_PROBE_INTERVAL', '2.0'
             ),
+            NOETL_WORKER_EVENT_LINGER_MS=env.get('NOETL_WORKER_EVENT_LINGER_MS', '5'),
+            NOETL_WORKER_EVENT_BATCH_MAX_EVENTS=env.get('NOETL_WORKER_EVENT_BATCH_MAX_EVENTS', '64'),
         )
     return _worker_settings
 
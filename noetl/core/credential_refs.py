@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
 from typing import Any, Callable, Optional
 
 from jinja2 import BaseLoader, Environment
@@ -181,7 +182,10 @@ def producer_scrub_payload(
     secret_values: Optional[set[str]] = None,
     redaction: str = REDACTED,
 ) -> Any:
-    """Return a storage-safe copy for producer-side result/temp writes."""
+    """Return a storage-safe copy for producer-side result/temp writes.
+
+    Strips keychain namespaces and redacts secrets in one walk of ``value``.
+    """
     context = context or {}
     manifest = context.get(KEYCHAIN_MANIFEST_KEY) if isinstance(context, dict) else None
     keys = set(HEADER_CREDENTIAL_KEYS)
@@ -200,12 +204,14 @@ def producer_scrub_payload(
     if isinstance(context, dict):
         values.update(_collect_secret_strings(context.get("keychain")))
 
-    stripped = strip_keychain_namespaces(value, manifest)
+    blocked = {"keychain"} | keychain_names_from_manifest(manifest)
+    blocked.discard(KEYCHAIN_MANIFEST_KEY)
     return redact_keychain_values(
-        stripped,
+        value,
         additional_keys=keys,
         secret_values=values,
         redaction=redaction,
+        drop_keys=blocked,
     )
 
 
@@ -216,7 +222,43 @@ def scrub_arrow_ipc_bytes(
     row_count: Optional[int] = None,
     context: Optional[dict[str, Any]] = None,
 ) -> tuple[bytes, str, Optional[int], bool]:
-    """Scrub valid Arrow IPC row payloads before durable or IPC-cache writes."""
+    """Scrub valid Arrow IPC row payloads before durable or IPC-cache writes.
+
+    Only columns that can carry secret values are decoded, one record batch
+    at a time, and string columns only by their distinct values; the full row
+    decode and re-encode runs only when a batch actually needs redaction.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        counted = 0
+        with pa.ipc.open_stream(data_bytes) as reader:
+            inspect = _arrow_columns_to_inspect(reader.schema, context)
+            for batch in reader if inspect is not None else ():
+                counted += batch.num_rows
+                nested = []
+                for index in inspect:
+                    field = batch.schema.field(index)
+                    if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+                        nested.append(index)
+                        continue
+                    # Scrubbing a string depends on its column name and value only.
+                    probe = [{field.name: value} for value in pc.unique(batch.column(index)).to_pylist()]
+                    if producer_scrub_payload(probe, context) != probe:
+                        inspect = None
+                        break
+                if inspect is not None and nested:
+                    rows = batch.select(nested).to_pylist()
+                    if producer_scrub_payload(rows, context) != rows:
+                        inspect = None
+                if inspect is None:
+                    break
+    except Exception:
+        return bytes(data_bytes), schema_digest, row_count, False
+    if inspect is not None:
+        return bytes(data_bytes), schema_digest, row_count if row_count is not None else counted, False
+
     try:
         from noetl.core.storage.arrow_ipc import arrow_ipc_to_rows, rows_to_arrow_ipc
 
@@ -232,6 +274,35 @@ def scrub_arrow_ipc_bytes(
     return payload, safe_schema_digest, safe_row_count, True
 
 
+def _arrow_columns_to_inspect(schema: Any, context: Optional[dict[str, Any]]) -> Optional[list[int]]:
+    """Indexes of the Arrow columns whose values need a scrub pass.
+
+    Numeric, boolean and temporal values never match secret value patterns,
+    so those columns are only checked by name.  Returns None when a column
+    name alone triggers redaction or removal.
+    """
+    import pyarrow as pa
+
+    inspect: list[int] = []
+    probe: dict[str, Any] = {}
+    for index, field in enumerate(schema):
+        value_safe = (
+            pa.types.is_integer(field.type)
+            or pa.types.is_floating(field.type)
+            or pa.types.is_boolean(field.type)
+            or pa.types.is_decimal(field.type)
+            or pa.types.is_temporal(field.type)
+            or pa.types.is_null(field.type)
+        )
+        if value_safe:
+            probe[field.name] = 0
+        else:
+            inspect.append(index)
+    if probe and producer_scrub_payload([probe], context) != [probe]:
+        return None
+    return inspect
+
+
 def _collect_secret_strings(value: Any) -> set[str]:
     values: set[str] = set()
     if isinstance(value, dict):
@@ -246,7 +317,8 @@ def _collect_secret_strings(value: Any) -> set[str]:
 
 
 def _strip_keychain_namespaces(value: Any, blocked: set[str]) -> Any:
-    if isinstance(value, dict):
+    # Mapping, not dict: engine render contexts are layered ChainMaps.
+    if isinstance(value, Mapping):
         result = {}
         for k, v in value.items():
             if str(k) == KEYCHAIN_MANIFEST_KEY:
@@ -16,6 +16,14 @@ Contract (see ``CursorDriver``):
   it continue to work through repeated ``claim`` calls.
 - ``close(handle)`` — release the connection/handle.
 
+Keyset partitioning: when ``options.partition.key`` is set and the loop
+runs more than one worker slot, drivers split the source into disjoint
+``(lower, upper]`` key ranges up front (``keyset_partitions``) and each
+slot drains only its own range.  The engine passes ``worker_slot_index``
+and ``worker_count`` in the spec handed to ``open``; all slots compute the
+same cut points from the same source so N workers scan N independent
+ranges instead of contending on one claim query.
+
 Drivers register themselves via ``register_driver(kind, driver)``; the
 engine and worker look up by ``cursor.kind``.  Unknown kinds raise a
 ``CursorDriverNotFoundError`` at load time so playbook authors get a
@@ -23,6 +31,7 @@ fast, clear failure.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Optional, Protocol, runtime_checkable
 
 
@@ -88,6 +97,86 @@ class CursorDriver(Protocol):
         ...
 
 
+@dataclass(frozen=True)
+class KeysetPartition:
+    """One disjoint key range of a partitioned cursor source.
+
+    ``lower`` is exclusive and ``upper`` inclusive; ``None`` leaves that
+    side unbounded so the first and last partitions cover keys outside the
+    sampled domain.  ``empty`` marks surplus slots when the source has
+    fewer distinct cut points than workers.
+    """
+
+    index: int
+    count: int
+    lower: Any = None
+    upper: Any = None
+    empty: bool = False
+
+    def as_params(self) -> dict[str, Any]:
+        return {
+            "partition_index": self.index,
+            "partition_count": self.count,
+            "partition_lower": self.lower,
+            "partition_upper": self.upper,
+        }
+
+
+def partition_fractions(count: int) -> list[float]:
+    """Quantile fractions for ``count`` partitions (``count - 1`` cut points)."""
+    return [i / count for i in range(1, max(1, int(count)))]
+
+
+def keyset_partitions(cut_points: list[Any], count: int) -> list[KeysetPartition]:
+    """Turn sorted quantile cut points into ``count`` disjoint key ranges."""
+    count = max(1, int(count))
+    bounds: list[Any] = []
+    for point in cut_points or []:
+        if point is None or (bounds and point <= bounds[-1]):
+            continue
+        bounds.append(point)
+    bounds = bounds[: count - 1]
+    edges = [None, *bounds, None]
+    partitions = [
+        KeysetPartition(index=i, count=count, lower=edges[i], upper=edges[i + 1])
+        for i in range(len(edges) - 1)
+    ]
+    partitions.extend(
+        KeysetPartition(index=i, count=count, empty=True)
+        for i in range(len(partitions), count)
+    )
+    return partitions
+
+
+def partition_options(spec: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Return ``options.partition`` when partitioning applies to this spec.
+
+    Partitioning is skipped for single-slot loops.  ``partition`` may be a
+    bare key column name or a mapping with at least ``key``.
+    """
+    options = spec.get("options") or {}
+    raw = options.get("partition")
+    if not raw:
+        return None
+    partition = {"key": raw} if isinstance(raw, str) else dict(raw)
+    if not partition.get("key"):
+        raise CursorDriverError("cursor options.partition requires a `key` column")
+    if int(spec.get("worker_count") or 1) <= 1:
+        return None
+    return partition
+
+
+def select_partition(spec: dict[str, Any], cut_points: list[Any]) -> KeysetPartition:
+    """Pick this worker slot's range from the shared cut points."""
+    count = max(1, int(spec.get("worker_count") or 1))
+    index = int(spec.get("worker_slot_index") or 0)
+    if not 0 <= index < count:
+        raise CursorDriverError(
+            f"cursor worker_slot_index={index} out of range for worker_count={count}"
+        )
+    return keyset_partitions(cut_points, count)[index]
+
+
 _registry: dict[str, CursorDriver] = {}
 
 
@@ -114,11 +203,17 @@ def registered_kinds() -> list[str]:
 
 # Auto-register built-in drivers.
 from . import postgres as _postgres  # noqa: E402,F401  (import registers)
+from . import duckdb as _duckdb  # noqa: E402,F401  (import registers)
 
 __all__ = [
     "CursorDriver",
     "CursorDriverError",
     "CursorDriverNotFoundError",
+    "KeysetPartition",
+    "keyset_partitions",
+    "partition_fractions",
+    "partition_options",
+    "select_partition",
     "register_driver",
     "get_driver",
     "registered_kinds",
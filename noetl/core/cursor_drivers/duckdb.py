@@ -0,0 +1,171 @@
+"""DuckDB / Parquet cursor driver.
+
+Scans a read-only source — typically Parquet files via ``read_parquet`` —
+instead of claiming rows from a mutable queue table.  ``claim`` is a plain
+``SELECT`` whose rows become loop items::
+
+    loop:
+      cursor:
+        kind: duckdb
+        claim: "SELECT * FROM read_parquet('/data/events/*.parquet')"
+        options:
+          partition: event_id
+      iterator: event
+      spec:
+        mode: cursor
+        max_in_flight: 8
+
+The source is static, so no row locking is needed: with
+``options.partition`` (a key column name or ``{key: ...}``) every slot
+computes the same ``quantile_disc`` cut points over the claim query and
+streams only its own ``(lower, upper]`` key range.  Without a partition key
+the source cannot be split, so only a single-slot loop is allowed.
+
+Delivery is at-least-once.  A slot keeps no claim state outside its open
+result stream, so a retried slot command (worker lost, command reaped)
+streams its range again from the start and rows it had already handed out
+are processed a second time.  Task pipelines over a duckdb cursor should
+be idempotent on the row key, e.g. upsert on the partition key; use a
+postgres claim table when each row must be claimed exactly once.
+
+``auth`` is optional; when given, the credential's ``database`` /
+``db_path`` selects a DuckDB database file (opened read-only).  Each slot
+owns its own connection and all blocking DuckDB calls run in a thread so
+the worker's event loop stays responsive.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from noetl.core.logger import setup_logger
+
+from . import (
+    CursorDriverError,
+    KeysetPartition,
+    partition_fractions,
+    partition_options,
+    register_driver,
+    select_partition,
+)
+
+logger = setup_logger(__name__, include_location=True)
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _database_path(auth: Any, options: dict[str, Any]) -> str:
+    credential = auth if isinstance(auth, dict) else {}
+    return str(
+        options.get("database")
+        or credential.get("database")
+        or credential.get("db_path")
+        or ":memory:"
+    )
+
+
+@dataclass
+class _Handle:
+    conn: Any
+    cursor: Any
+    columns: list[str]
+    partition: Optional[KeysetPartition] = None
+
+
+class DuckDBCursorDriver:
+    """DuckDB implementation of the :class:`CursorDriver` protocol."""
+
+    kind = "duckdb"
+
+    async def open(self, auth: Any, spec: dict[str, Any]) -> _Handle:
+        """Open a connection and start streaming this slot's key range."""
+        return await asyncio.to_thread(self._open_sync, auth, spec)
+
+    def _open_sync(self, auth: Any, spec: dict[str, Any]) -> _Handle:
+        import duckdb
+
+        options = dict(spec.get("options") or {})
+        source = str(spec["claim"]).strip().rstrip(";")
+        partition_cfg = partition_options(spec)
+        if partition_cfg is None and int(spec.get("worker_count") or 1) > 1:
+            raise CursorDriverError(
+                "duckdb cursor with more than one worker slot requires "
+                "options.partition (the key column to split the source on)"
+            )
+
+        database = _database_path(auth, options)
+        conn = duckdb.connect(database, read_only=database != ":memory:")
+        try:
+            threads = options.get("threads")
+            if threads:
+                conn.execute(f"SET threads = {int(threads)}")
+
+            partition: Optional[KeysetPartition] = None
+            query, params = f"SELECT * FROM ({source}) AS cursor_source", []
+            if partition_cfg is not None:
+                key = _quote_identifier(partition_cfg["key"])
+                row = conn.execute(
+                    f"SELECT quantile_disc({key}, ?) FROM ({source}) AS cursor_source",
+                    [partition_fractions(int(spec["worker_count"]))],
+                ).fetchone()
+                partition = select_partition(spec, list((row or [None])[0] or []))
+                if partition.empty:
+                    query = f"{query} WHERE false"
+                else:
+                    clauses = []
+                    if partition.lower is not None:
+                        clauses.append(f"{key} > ?")
+                        params.append(partition.lower)
+                    if partition.upper is not None:
+                        clauses.append(f"{key} <= ?")
+                        params.append(partition.upper)
+                    if clauses:
+                        query = f"{query} WHERE {' AND '.join(clauses)}"
+                    query = f"{query} ORDER BY {key}"
+                logger.info(
+                    "[CURSOR-DUCKDB] partition %s/%s key=%s range=(%r, %r]",
+                    partition.index,
+                    partition.count,
+                    partition_cfg["key"],
+                    partition.lower,
+                    partition.upper,
+                )
+
+            cursor = conn.execute(query, params)
+            columns = [desc[0] for desc in (cursor.description or [])]
+            return _Handle(conn=conn, cursor=cursor, columns=columns, partition=partition)
+        except Exception:
+            conn.close()
+            raise
+
+    async def claim(
+        self,
+        handle: _Handle,
+        context: dict[str, Any],
+    ) -> Optional[dict[str, Any]]:
+        """Return the next row of this slot's range or None when drained."""
+        rows = await self.claim_many(handle, context, 1)
+        return rows[0] if rows else None
+
+    async def claim_many(
+        self,
+        handle: _Handle,
+        context: dict[str, Any],
+        max_rows: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch up to ``max_rows`` rows from the open result stream.
+
+        Nothing is marked as claimed; see the module docstring on
+        at-least-once delivery.
+        """
+        batch = await asyncio.to_thread(handle.cursor.fetchmany, max(1, int(max_rows or 1)))
+        return [dict(zip(handle.columns, row)) for row in batch]
+
+    async def close(self, handle: _Handle) -> None:
+        await asyncio.to_thread(handle.conn.close)
+
+
+register_driver("duckdb", DuckDBCursorDriver())
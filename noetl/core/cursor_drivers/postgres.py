@@ -5,6 +5,26 @@ RETURNING`` patterns to atomically claim one or more work rows per call.  The
 caller supplies the full claim statement (flexible enough to support
 re-queueing, retry counters, partitioning columns, etc.).
 
+Keyset partitioning (``options.partition: {key, source}``): at ``open``
+each worker slot computes the same ``percentile_disc`` cut points over the
+``source`` query's key column and binds its own range to the claim
+statement as ``%(partition_lower)s`` / ``%(partition_upper)s`` (plus
+``%(partition_index)s`` / ``%(partition_count)s``), e.g.::
+
+    WHERE status = 'pending'
+      AND (%(partition_lower)s::bigint IS NULL OR id > %(partition_lower)s)
+      AND (%(partition_upper)s::bigint IS NULL OR id <= %(partition_upper)s)
+
+The bounds are bound only when the claim statement uses one of these
+placeholders; a literal ``%`` in such a statement must then be written as
+``%%``.  A claim without them runs as plain SQL with no escaping.
+
+``source`` should describe a stable key domain (e.g. the whole table, not
+the pending subset) so all slots agree on the cut points.  Once a slot's
+range is drained it makes an unbounded pass (``drain_remainder``, default
+on) so rows that fell between drifted cut points are still claimed; the
+claim statement's ``SKIP LOCKED`` keeps that pass safe.
+
 Connection pools are shared per (credential, process) via a module-level
 registry so N cursor_worker commands running in the same worker pod
 don't each open an independent pool (which blew past Postgres's
@@ -18,12 +38,20 @@ import asyncio
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from psycopg import sql
 from psycopg_pool import AsyncConnectionPool
 from psycopg.rows import dict_row
 
 from noetl.core.logger import setup_logger
 
-from . import register_driver
+from . import (
+    CursorDriverError,
+    KeysetPartition,
+    partition_fractions,
+    partition_options,
+    register_driver,
+    select_partition,
+)
 
 logger = setup_logger(__name__, include_location=True)
 
@@ -95,11 +123,57 @@ async def _get_shared_pool(conn_string: str, max_size: int) -> AsyncConnectionPo
         return pool
 
 
+_PARTITION_BOUNDS_SQL = (
+    "SELECT percentile_disc({fractions}::float8[]) WITHIN GROUP (ORDER BY {key}) AS cut_points "
+    "FROM ({source}) AS cursor_partition_source"
+)
+
+
+async def _partition_cut_points(
+    pool: AsyncConnectionPool,
+    *,
+    source: str,
+    key: str,
+    count: int,
+) -> list[Any]:
+    query = sql.SQL(_PARTITION_BOUNDS_SQL).format(
+        fractions=sql.Literal(partition_fractions(count)),
+        key=sql.Identifier(key),
+        source=sql.SQL(source.strip().rstrip(";")),
+    )
+    async with pool.connection() as conn:
+        await conn.set_autocommit(True)
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(query)
+            row = await cur.fetchone()
+    return list((row or {}).get("cut_points") or [])
+
+
+_PARTITION_PLACEHOLDER = "%(partition_"
+
+
 @dataclass
 class _Handle:
     pool: AsyncConnectionPool
     claim_sql: str
     options: dict[str, Any]
+    partition: Optional[KeysetPartition] = None
+    drain_remainder: bool = True
+    # Set once the slot's own range is exhausted and the unbounded
+    # remainder pass has started.
+    remainder_pass: bool = False
+
+    def claim_params(self) -> Optional[dict[str, Any]]:
+        # Binding parameters makes psycopg parse every ``%`` in the
+        # statement, so a claim without partition placeholders runs as
+        # plain SQL and its literal ``%`` (e.g. in LIKE) stays untouched.
+        if self.partition is None or _PARTITION_PLACEHOLDER not in self.claim_sql:
+            return None
+        if self.remainder_pass:
+            return KeysetPartition(
+                index=self.partition.index, count=self.partition.count,
+            ).as_params()
+        return self.partition.as_params()
 
 
 class PostgresCursorDriver:
@@ -121,11 +195,45 @@ class PostgresCursorDriver:
         options = dict(spec.get("options") or {})
         pool_size = int(options.get("pool_size") or 8)
         pool = await _get_shared_pool(conn_string, pool_size)
-        return _Handle(
+        handle = _Handle(
             pool=pool,
             claim_sql=spec["claim"],
             options=options,
         )
+        partition = partition_options(spec)
+        if partition is not None:
+            source = partition.get("source")
+            if not source:
+                raise CursorDriverError(
+                    "postgres cursor options.partition requires a `source` query "
+                    "returning the partition key column"
+                )
+            cut_points = await _partition_cut_points(
+                pool,
+                source=source,
+                key=str(partition["key"]),
+                count=int(spec["worker_count"]),
+            )
+            handle.partition = select_partition(spec, cut_points)
+            handle.drain_remainder = bool(partition.get("drain_remainder", True))
+            # Surplus slots have nothing of their own; they only help with
+            # the remainder pass (or stay idle when it is disabled).
+            handle.remainder_pass = handle.partition.empty
+            if _PARTITION_PLACEHOLDER not in handle.claim_sql:
+                logger.warning(
+                    "[CURSOR-PG] options.partition is set but the claim statement has no "
+                    "%(partition_lower)s / %(partition_upper)s placeholders; every slot "
+                    "claims from the whole table"
+                )
+            logger.info(
+                "[CURSOR-PG] partition %s/%s key=%s range=(%r, %r]",
+                handle.partition.index,
+                handle.partition.count,
+                partition["key"],
+                handle.partition.lower,
+                handle.partition.upper,
+            )
+        return handle
 
     async def claim(
         self,
@@ -143,6 +251,20 @@ class PostgresCursorDriver:
         max_rows: int,
     ) -> list[dict[str, Any]]:
         """Execute the claim statement and return all rows it claimed."""
+        if handle.remainder_pass and not handle.drain_remainder:
+            return []
+        rows = await self._execute_claim(handle, max_rows)
+        if (
+            not rows
+            and handle.partition is not None
+            and handle.drain_remainder
+            and not handle.remainder_pass
+        ):
+            handle.remainder_pass = True
+            rows = await self._execute_claim(handle, max_rows)
+        return rows
+
+    async def _execute_claim(self, handle: _Handle, max_rows: int) -> list[dict[str, Any]]:
         async with handle.pool.connection() as conn:
             # Autocommit per claim so the row lock is released immediately
             # once the claim-and-return round-trip finishes; the worker
@@ -151,9 +273,10 @@ class PostgresCursorDriver:
             async with conn.cursor(row_factory=dict_row) as cur:
                 # The claim SQL is rendered by the caller with worker /
                 # execution context substituted in (e.g. execution_id,
-                # facility_mapping_id, worker_slot_id).  Pass no params;
-                # any templating belongs upstream.
-                await cur.execute(handle.claim_sql)
+                # facility_mapping_id, worker_slot_id).  Only partition
+                # bounds are bound as parameters; any other templating
+                # belongs upstream.
+                await cur.execute(handle.claim_sql, handle.claim_params())
                 rows = await cur.fetchmany(max(1, int(max_rows or 1)))
                 return [dict(row) for row in rows]
 
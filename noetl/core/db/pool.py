@@ -14,6 +14,7 @@ import os
 import threading
 from typing import Optional, Dict
 from contextlib import asynccontextmanager
+from noetl.core.json_codec import fast_json_enabled, register_psycopg_json
 from noetl.core.logger import setup_logger
 
 logger = setup_logger(__name__, include_location=True)
@@ -80,6 +81,14 @@ def _build_pool_connect_kwargs() -> dict:
 _POOL_CONNECT_KWARGS = _build_pool_connect_kwargs()
 
 
+async def _configure_connection(conn: AsyncConnection) -> None:
+    """Per-connection setup run by the pool before a connection is handed out."""
+    if fast_json_enabled():
+        # JSONB columns (command context, event result/meta) decode and
+        # encode through the fast codec instead of stdlib json.
+        register_psycopg_json(conn)
+
+
 async def init_pool(conninfo: str):
     """
     Initialize the global AsyncConnectionPool with dict_row as default.
@@ -111,6 +120,7 @@ async def init_pool(conninfo: str):
                 max_lifetime=_DEFAULT_POOL_MAX_LIFETIME,
                 max_idle=_DEFAULT_POOL_MAX_IDLE,
                 kwargs=_POOL_CONNECT_KWARGS,
+                configure=_configure_connection,
                 name=os.getenv("NOETL_POSTGRES_POOL_NAME", "noetl_server"),
                 open=False,
             )
@@ -138,6 +148,7 @@ async def init_pool(conninfo: str):
                 max_lifetime=_DEFAULT_POOL_MAX_LIFETIME,
                 max_idle=_DEFAULT_POOL_MAX_IDLE,
                 kwargs=_POOL_CONNECT_KWARGS,
+                configure=_configure_connection,
                 name=os.getenv("NOETL_POSTGRES_POOL_NAME", "noetl_server") + "_bg",
                 open=False,
             )
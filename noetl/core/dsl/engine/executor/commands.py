@@ -8,6 +8,7 @@ from noetl.core.credential_refs import (
     render_preserving_keychain_refs,
     strip_keychain_namespaces,
 )
+from noetl.core.scheduler.dispatcher import dispatch_priority
 
 class CommandCreationMixin:
     async def _create_inline_command(
@@ -42,7 +43,7 @@ class CommandCreationMixin:
         """
         tool_kind = tool_spec.get("kind")
         if not tool_kind:
-            logger.warning(f"[INLINE-TASK] Task '{task_name}' missing tool kind")
+            logger.warning("[INLINE-TASK] Task '%s' missing tool kind", task_name)
             return None
 
         # Extract tool config (everything except 'kind')
@@ -65,11 +66,11 @@ class CommandCreationMixin:
             input={},
             render_context=safe_context,
             attempt=1,
-            priority=0,
+            priority=dispatch_priority(state, step_name),
             metadata={"inline_task": True, "task_name": task_name, "parent_step": step_name}
         )
 
-        logger.info(f"[INLINE-TASK] Created command for task '{task_name}' (kind={tool_kind})")
+        logger.info("[INLINE-TASK] Created command for task '%s' (kind=%s)", task_name, tool_kind)
         return command
 
     async def _create_task_sequence_command(
@@ -102,7 +103,7 @@ class CommandCreationMixin:
             Command object for the task sequence
         """
         if not task_list:
-            logger.warning(f"[TASK_SEQ] Empty task sequence for step {step_name}")
+            logger.warning("[TASK_SEQ] Empty task sequence for step %s", step_name)
             return None
 
         # Get task names for logging
@@ -111,7 +112,7 @@ class CommandCreationMixin:
             if isinstance(task, dict):
                 task_names.extend(task.keys())
 
-        logger.info(f"[TASK_SEQ] Creating command for step {step_name} with tasks: {task_names}")
+        logger.info("[TASK_SEQ] Creating command for step %s with tasks: %s", step_name, task_names)
 
         # Create command with "task_sequence" tool kind
         # The worker will recognize this and use TaskSequenceExecutor
@@ -128,7 +129,7 @@ class CommandCreationMixin:
             input={},
             render_context=strip_keychain_namespaces(context, context.get(KEYCHAIN_MANIFEST_KEY)),
             attempt=1,
-            priority=0,
+            priority=dispatch_priority(state, step_name),
             metadata={
                 "task_sequence": True,
                 "parent_step": step_name,
@@ -901,7 +902,7 @@ class CommandCreationMixin:
             base_context = optimized_context if optimized_context is not None else context
             # PERFORMANCE & CORRECTNESS: Shallow copy the top-level context, 
             # but MUST clone the nested 'iter' namespace to avoid parallel clobbering.
-            context = dict(base_context)
+            context = base_context.copy()
             if "iter" in context and isinstance(context["iter"], dict):
                 context["iter"] = dict(context["iter"])
             
@@ -995,7 +996,11 @@ class CommandCreationMixin:
             # (e.g., via `set` in policy rules). The worker's task_sequence_executor
             # will render templates at execution time with the proper context.
             pipeline = step.tool  # Pass raw list, worker renders at execution time
-            logger.info(f"[PIPELINE] Step '{step.step}' has pipeline with {len(pipeline or [])} tasks (deferred rendering)")
+            logger.info(
+                "[PIPELINE] Step '%s' has pipeline with %s tasks (deferred rendering)",
+                step.step,
+                len(pipeline or []),
+            )
 
             # For pipeline steps, use task_sequence as tool kind
             tool_kind = "task_sequence"
@@ -1019,7 +1024,11 @@ class CommandCreationMixin:
                 pipeline = [{"name": task_label, **tool_dict}]
                 tool_kind = "task_sequence"
                 tool_config = {"tasks": pipeline}
-                logger.info(f"[PIPELINE] Converted single tool with policy rules to task sequence for step '{step.step}'")
+                logger.info(
+                    "[PIPELINE] Converted single tool with policy rules to task sequence for step "
+                    "'%s'",
+                    step.step,
+                )
             else:
                 # NOTE: step.result removed in v10 - output config is now in tool.output or tool.spec.policy
 
@@ -1030,11 +1039,11 @@ class CommandCreationMixin:
         next_targets = None
         if step.next:
             next_targets = [arc.model_dump(exclude_none=True) for arc in _get_next_arcs(step)]
-            logger.debug(f"[NEXT] Step '{step.step}' has {len(next_targets)} next targets")
+            logger.debug("[NEXT] Step '%s' has %s next targets", step.step, len(next_targets))
 
         next_mode = _get_next_mode(step)
         command_spec = CommandSpec(next_mode=next_mode)
-        logger.debug(f"[SPEC] Step '{step.step}': next_mode={next_mode} (from next.spec.mode)")
+        logger.debug("[SPEC] Step '%s': next_mode=%s (from next.spec.mode)", step.step, next_mode)
 
         # For pipeline (task sequence) steps, use :task_sequence suffix in step name
         # This enables the engine to detect task sequence completion and sync ctx variables
@@ -1076,7 +1085,7 @@ class CommandCreationMixin:
             next_targets=next_targets,
             spec=command_spec,
             attempt=1,
-            priority=0,
+            priority=dispatch_priority(state, step.step),
             metadata=command_metadata,
         )
 
@@ -746,7 +746,7 @@ class BoundedCache(Generic[T]):
             # Evict oldest if at capacity
             while len(self._cache) >= self._max_size:
                 evicted_key, _ = self._cache.popitem(last=False)
-                logger.debug(f"BoundedCache: evicted {evicted_key} due to capacity")
+                logger.debug("BoundedCache: evicted %s due to capacity", evicted_key)
 
             self._cache[key] = (value, time.time())
 
@@ -783,7 +783,7 @@ class BoundedCache(Generic[T]):
         while len(self._cache) >= self._max_size:
             try:
                 evicted_key, _ = self._cache.popitem(last=False)
-                logger.debug(f"BoundedCache: evicted {evicted_key} due to capacity")
+                logger.debug("BoundedCache: evicted %s due to capacity", evicted_key)
             except KeyError:
                 break
 
@@ -797,7 +797,7 @@ class BoundedCache(Generic[T]):
         for k in expired:
             del self._cache[k]
         if expired:
-            logger.debug(f"BoundedCache: cleaned up {len(expired)} expired entries")
+            logger.debug("BoundedCache: cleaned up %s expired entries", len(expired))
 
     async def cleanup_expired(self):
         """Remove all expired entries (async)."""
@@ -855,9 +855,14 @@ class TemplateCache:
         # Log cache stats periodically (every 100 misses)
         if self._misses % 100 == 0:
             logger.debug(
-                f"[TEMPLATE-CACHE] Engine stats: size={len(self._cache)}/{self._max_size}, "
-                f"hits={self._hits}, misses={self._misses}, evictions={self._evictions}, "
-                f"hit_rate={self._hits / (self._hits + self._misses) * 100:.1f}%"
+                "[TEMPLATE-CACHE] Engine stats: size=%s/%s, hits=%s, misses=%s, evictions=%s, "
+                "hit_rate=%.1f%%",
+                len(self._cache),
+                self._max_size,
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._hits / (self._hits + self._misses) * 100
             )
 
         return compiled
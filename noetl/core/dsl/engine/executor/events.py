@@ -5,6 +5,7 @@ from .outbox import drain_executor_outbox, enqueue_executor_outbox
 from .state import ExecutionState
 from .store import PlaybookRepo, StateStore
 from noetl.core.event_store.ports import canonical_event_checksum
+from noetl.core.event_store.postgres import advance_stream_head
 from .transitions import _get_next_arcs, _get_next_mode
 
 class EventHandlingMixin:
@@ -155,15 +156,7 @@ class EventHandlingMixin:
                 await cur.execute("SELECT noetl.snowflake_id() AS id")
                 event_id = int((await cur.fetchone())["id"])
                 stream_id = f"execution/{state.execution_id}/stage/{stage['stage_id']}"
-                await cur.execute(
-                    """
-                    SELECT COALESCE(max(stream_version), 0) + 1 AS next_version
-                    FROM noetl.event
-                    WHERE stream_id = %s
-                    """,
-                    (stream_id,),
-                )
-                stream_version = int(((await cur.fetchone()) or {}).get("next_version") or 1)
+                stream_version = await advance_stream_head(cur, stream_id)
                 now = datetime.now(timezone.utc)
                 parent_event_id = state.last_event_id
                 tenant_id = stage.get("tenant_id") or "default"
@@ -365,12 +358,18 @@ class EventHandlingMixin:
         }
         save_buffer_token = bind_save_state_buffer(save_state_buffer)
         try:
-            return await self._handle_event_inner(
+            commands = await self._handle_event_inner(
                 event,
                 conn=conn,
                 already_persisted=already_persisted,
                 timing_capture=timing_capture,
             )
+            if commands and len(commands) > 1:
+                # Critical-path order: callers persist and publish in list
+                # order, so long-pole steps reach workers first.  The sort is
+                # stable, so equal priorities keep engine order.
+                commands.sort(key=lambda command: command.priority, reverse=True)
+            return commands
         finally:
             # Unbind the save-state buffer BEFORE flushing so the flush
             # itself doesn't recurse into the coalescing branch.
@@ -458,7 +457,7 @@ class EventHandlingMixin:
                 (time.perf_counter() - state_load_start) * 1000, 3
             )
         if not state:
-            logger.error(f"Execution state not found: {event.execution_id}")
+            logger.error("Execution state not found: %s", event.execution_id)
             return commands
 
         if cache_refreshed and preserved_loop_snapshots:
@@ -570,7 +569,7 @@ class EventHandlingMixin:
         is_task_sequence_step = event.step.endswith(":task_sequence")
         is_inline_task = ':' in event.step and state.get_step(event.step) is None and not is_task_sequence_step
         if is_inline_task:
-            logger.debug(f"Inline task: {event.step} - persisting event without orchestration")
+            logger.debug("Inline task: %s - persisting event without orchestration", event.step)
             # Persist the event but don't generate commands (no orchestration needed)
             # Skip if already persisted by API caller
             if not already_persisted:
@@ -579,7 +578,7 @@ class EventHandlingMixin:
             # This ensures issued_steps - completed_steps doesn't block workflow completion
             if event.name == "step.exit":
                 state.completed_steps.add(event.step)
-                logger.debug(f"Marked inline task {event.step} as completed")
+                logger.debug("Marked inline task %s as completed", event.step)
 
                 # Process any deferred next actions that were waiting for this inline task
                 deferred_commands = await self._process_deferred_next_actions(state, event.step, event)
@@ -593,9 +592,14 @@ class EventHandlingMixin:
                             continue
                         state.issued_steps.add(pending_key)
                         logger.info(
-                            f"[ISSUED] Added deferred {pending_key} to issued_steps for execution {state.execution_id}"
+                            "[ISSUED] Added deferred %s to issued_steps for execution %s",
+                            pending_key,
+                            state.execution_id
                         )
-                    logger.info(f"[INLINE-TASK] Processed deferred next actions, generated {len(deferred_commands)} command(s)")
+                    logger.info(
+                        "[INLINE-TASK] Processed deferred next actions, generated %s command(s)",
+                        len(deferred_commands),
+                    )
                     # Save state after processing deferred actions
                     await self.state_store.save_state(state, conn)
                     return commands
@@ -677,7 +681,10 @@ class EventHandlingMixin:
             if task_ctx and isinstance(task_ctx, dict):
                 for key, value in task_ctx.items():
                     state.variables[key] = value
-                    logger.debug(f"[TASK_SEQ] Synced ctx variable '{key}' from task sequence to execution state")
+                    logger.debug(
+                        "[TASK_SEQ] Synced ctx variable '%s' from task sequence to execution state",
+                        key,
+                    )
 
             # Get parent step definition for loop handling
             parent_step_def = state.get_step(parent_step)
@@ -759,7 +766,7 @@ class EventHandlingMixin:
                             _ts_set_rendered[key] = value_template
                         logger.debug("[SET] Rendered %s (type=%s)", key, type(_ts_set_rendered[key]).__name__)
                     except Exception as e:
-                        logger.error(f"[SET] Failed to render {key}: {e}")
+                        logger.error("[SET] Failed to render %s: %s", key, e)
                 _apply_set_mutations(state.variables, _ts_set_rendered)
 
             # Handle loop iteration tracking for task sequence steps
@@ -857,7 +864,10 @@ class EventHandlingMixin:
 
                         if iteration_terminal_claim:
                             state.add_loop_result(parent_step, iteration_result, failed=failed)
-                            logger.info(f"[TASK_SEQ] Added iteration result to loop aggregation for {parent_step}")
+                            logger.info(
+                                "[TASK_SEQ] Added iteration result to loop aggregation for %s",
+                                parent_step,
+                            )
                         elif iteration_terminal_claim is False:
                             logger.info(
                                 "[TASK_SEQ-LOOP] Duplicate terminal event ignored for %s epoch=%s iteration=%s",
@@ -931,13 +941,18 @@ class EventHandlingMixin:
                             if new_count <= 0 and nats_loop_state:
                                 new_count = int(nats_loop_state.get("completed_count", 0))
                             logger.warning(
-                                f"[TASK_SEQ-LOOP] Could not increment NATS loop count for {parent_step}; "
-                                f"falling back to persisted/local count {new_count}"
+                                "[TASK_SEQ-LOOP] Could not increment NATS loop count for %s; "
+                                "falling back to persisted/local count %s",
+                                parent_step,
+                                new_count
                             )
                         else:
                             logger.debug(
-                                f"[TASK_SEQ-LOOP] Incremented loop count in NATS K/V for "
-                                f"{parent_step} via {resolved_loop_event_id}: {new_count}"
+                                "[TASK_SEQ-LOOP] Incremented loop count in NATS K/V for %s via %s: "
+                                "%s",
+                                parent_step,
+                                resolved_loop_event_id,
+                                new_count
                             )
 
                         is_late_arrival = bool(
@@ -947,8 +962,11 @@ class EventHandlingMixin:
                         )
                         if is_late_arrival:
                             logger.info(
-                                f"[TASK_SEQ-LOOP] Late call.done for {parent_step} epoch {resolved_loop_event_id} "
-                                f"(active: {loop_state.get('event_id')}) — detaching loop_state"
+                                "[TASK_SEQ-LOOP] Late call.done for %s epoch %s (active: %s) — "
+                                "detaching loop_state",
+                                parent_step,
+                                resolved_loop_event_id,
+                                loop_state.get('event_id')
                             )
                             loop_state = dict(loop_state)
                         else:
@@ -1010,7 +1028,11 @@ class EventHandlingMixin:
                                 rendered_collection = self._normalize_loop_collection(rendered_collection, parent_step)
                                 loop_state["collection"] = list(rendered_collection)
                                 collection_size = len(rendered_collection or [])
-                                logger.info(f"[TASK_SEQ-LOOP] Re-rendered collection for {parent_step}: {collection_size} items")
+                                logger.info(
+                                    "[TASK_SEQ-LOOP] Re-rendered collection for %s: %s items",
+                                    parent_step,
+                                    collection_size,
+                                )
 
                             # Backfill NATS metadata if it was missing.
                             if collection_size > 0 and not nats_loop_state:
@@ -1245,7 +1267,12 @@ class EventHandlingMixin:
                                     # Loop done - mark completed and create loop.done event
                                     loop_state["completed"] = True
                                     loop_state["aggregation_finalized"] = True
-                                    logger.info(f"[TASK_SEQ-LOOP] Loop completed for {parent_step}: {new_count}/{collection_size}")
+                                    logger.info(
+                                        "[TASK_SEQ-LOOP] Loop completed for %s: %s/%s",
+                                        parent_step,
+                                        new_count,
+                                        collection_size,
+                                    )
 
                                     # Get aggregated result
                                     loop_aggregation = state.get_loop_aggregation(parent_step)
@@ -1274,17 +1301,24 @@ class EventHandlingMixin:
                                     state.add_emitted_loop_epoch(parent_step, "loop.done", str(resolved_loop_event_id))
                                     loop_done_commands = await self._evaluate_next_transitions(state, parent_step_def, loop_done_event)
                                     commands.extend(loop_done_commands)
-                                    logger.info(f"[TASK_SEQ-LOOP] Generated {len(loop_done_commands)} commands from loop.done")
+                                    logger.info(
+                                        "[TASK_SEQ-LOOP] Generated %s commands from loop.done",
+                                        len(loop_done_commands),
+                                    )
                         else:
                             # More iterations - create next command
                             if collection_size == 0:
                                 logger.warning(
-                                    f"[TASK_SEQ-LOOP] Collection size unresolved for {parent_step}; "
-                                    f"continuing without completion check"
+                                    "[TASK_SEQ-LOOP] Collection size unresolved for %s; continuing "
+                                    "without completion check",
+                                    parent_step
                                 )
                             logger.info(
-                                f"[TASK_SEQ-LOOP] Issuing iteration commands for {parent_step}: "
-                                f"{new_count}/{collection_size} (mode={parent_step_def.loop.mode})"
+                                "[TASK_SEQ-LOOP] Issuing iteration commands for %s: %s/%s (mode=%s)",
+                                parent_step,
+                                new_count,
+                                collection_size,
+                                parent_step_def.loop.mode
                             )
                             next_cmds = await self._issue_loop_commands(
                                 state,
@@ -1294,11 +1328,14 @@ class EventHandlingMixin:
                             commands.extend(next_cmds)
 
                     except Exception as e:
-                        logger.error(f"[TASK_SEQ-LOOP] Error handling loop: {e}", exc_info=True)
+                        logger.error("[TASK_SEQ-LOOP] Error handling loop: %s", e, exc_info=True)
             else:
                 # Not in loop - parent step was already marked completed above (before set processing)
                 # with the last tool's result promoted to the top level for flat template access.
-                logger.info(f"[TASK_SEQ] Parent step '{parent_step}' already marked completed with promoted result")
+                logger.info(
+                    "[TASK_SEQ] Parent step '%s' already marked completed with promoted result",
+                    parent_step,
+                )
 
                 # Process remaining actions from task sequence result (next, etc.)
                 remaining_actions = response_data.get("remaining_actions", [])
@@ -1308,12 +1345,18 @@ class EventHandlingMixin:
                         remaining_actions, state, event
                     )
                     commands.extend(seq_commands)
-                    logger.info(f"[TASK_SEQ] Generated {len(seq_commands)} commands from remaining actions")
+                    logger.info(
+                        "[TASK_SEQ] Generated %s commands from remaining actions",
+                        len(seq_commands),
+                    )
                 else:
                     # No remaining actions - evaluate next transitions for parent step
                     next_commands = await self._evaluate_next_transitions(state, parent_step_def, event)
                     commands.extend(next_commands)
-                    logger.info(f"[TASK_SEQ] Generated {len(next_commands)} commands from next transitions")
+                    logger.info(
+                        "[TASK_SEQ] Generated %s commands from next transitions",
+                        len(next_commands),
+                    )
 
             for idx, cmd in enumerate(commands):
                 if idx % 50 == 0: await asyncio.sleep(0)
@@ -1341,7 +1384,7 @@ class EventHandlingMixin:
         # step.exit event is iteration-informative and should not trigger global
         # completion checks or structural routing.
         if event.step.endswith(":task_sequence") and event.name == "step.exit":
-            logger.debug(f"[TASK_SEQ] Ignoring step.exit for task sequence step {event.step}")
+            logger.debug("[TASK_SEQ] Ignoring step.exit for task sequence step %s", event.step)
             return commands
 
         # Strip :task_sequence suffix when looking up step definition
@@ -1349,7 +1392,7 @@ class EventHandlingMixin:
         step_name = event.step.replace(":task_sequence", "") if event.step.endswith(":task_sequence") else event.step
         step_def = state.get_step(step_name)
         if not step_def:
-            logger.error(f"Step not found: {step_name} (original: {event.step})")
+            logger.error("Step not found: %s (original: %s)", step_name, event.step)
             return commands
 
         # Update current step (use original event.step to track task sequence state)
@@ -1403,7 +1446,10 @@ class EventHandlingMixin:
                     )
                 except Exception as _e:
                     logger.info("[DIAG-POST-MARK] failed: %s", _e)
-            logger.debug(f"[CALL.DONE] Stored result for step {event.step} in state BEFORE next evaluation")
+            logger.debug(
+                "[CALL.DONE] Stored result for step %s in state BEFORE next evaluation",
+                event.step,
+            )
         elif event.name == "call.error":
             # Mark step as completed even on error - it finished executing (with failure)
             error_data = (
@@ -1414,7 +1460,10 @@ class EventHandlingMixin:
             state.completed_steps.add(event.step)
             # CRITICAL: Track that execution has failures for final status determination
             state.failed = True
-            logger.debug(f"[CALL.ERROR] Marked step {event.step} as completed (with error), execution marked as failed")
+            logger.debug(
+                "[CALL.ERROR] Marked step %s as completed (with error), execution marked as failed",
+                event.step,
+            )
 
         # Get render context AFTER storing call.done response
         context = state.get_render_context(event)
@@ -1437,7 +1486,7 @@ class EventHandlingMixin:
                         rendered_step_set[key] = value_template
                     logger.debug("[SET] Rendered %s (type=%s)", key, type(rendered_step_set[key]).__name__)
                 except Exception as e:
-                    logger.error(f"[SET] Failed to render {key}: {e}")
+                    logger.error("[SET] Failed to render %s: %s", key, e)
             _apply_set_mutations(state.variables, rendered_step_set)
             # Refresh context after set to include new variables
             context = state.get_render_context(event)
@@ -1553,7 +1602,10 @@ class EventHandlingMixin:
 
                     if iteration_terminal_claim:
                         state.add_loop_result(event.step, response_data, failed=failed)
-                        logger.info(f"[LOOP-CALL.DONE] Added iteration result to loop aggregation for {event.step}")
+                        logger.info(
+                            "[LOOP-CALL.DONE] Added iteration result to loop aggregation for %s",
+                            event.step,
+                        )
                     elif iteration_terminal_claim is False:
                         logger.info(
                             "[LOOP-CALL.DONE] Duplicate terminal event ignored for %s epoch=%s iteration=%s",
@@ -1612,13 +1664,17 @@ class EventHandlingMixin:
                         if persisted_count >= 0:
                             new_count = max(new_count, persisted_count)
                         logger.warning(
-                            f"[LOOP-CALL.DONE] Could not increment NATS loop count for {event.step}; "
-                            f"falling back to persisted/local count {new_count}"
+                            "[LOOP-CALL.DONE] Could not increment NATS loop count for %s; falling "
+                            "back to persisted/local count %s",
+                            event.step,
+                            new_count
                         )
                     else:
                         logger.debug(
-                            f"[LOOP-CALL.DONE] Incremented loop count in NATS K/V for "
-                            f"{event.step} via {resolved_loop_event_id}: {new_count}"
+                            "[LOOP-CALL.DONE] Incremented loop count in NATS K/V for %s via %s: %s",
+                            event.step,
+                            resolved_loop_event_id,
+                            new_count
                         )
 
                     is_late_arrival = bool(
@@ -1628,8 +1684,11 @@ class EventHandlingMixin:
                     )
                     if is_late_arrival:
                         logger.info(
-                            f"[LOOP-CALL.DONE] Late call.done for {event.step} epoch {resolved_loop_event_id} "
-                            f"(active: {loop_state.get('event_id')}) — detaching loop_state"
+                            "[LOOP-CALL.DONE] Late call.done for %s epoch %s (active: %s) — "
+                            "detaching loop_state",
+                            event.step,
+                            resolved_loop_event_id,
+                            loop_state.get('event_id')
                         )
                         loop_state = dict(loop_state)
                     else:
@@ -1661,7 +1720,11 @@ class EventHandlingMixin:
                             rendered_collection = self._normalize_loop_collection(rendered_collection, event.step)
                             loop_state["collection"] = list(rendered_collection)
                             collection_size = len(rendered_collection or [])
-                            logger.info(f"[LOOP-CALL.DONE] Re-rendered collection for {event.step}: {collection_size} items")
+                            logger.info(
+                                "[LOOP-CALL.DONE] Re-rendered collection for %s: %s items",
+                                event.step,
+                                collection_size,
+                            )
 
                     # Check if loop is done
                     if collection_size > 0 and new_count >= collection_size:
@@ -1728,7 +1791,12 @@ class EventHandlingMixin:
                             if not _skip_loop_done and not is_late_arrival:
                                 loop_state["completed"] = True
                                 loop_state["aggregation_finalized"] = True
-                                logger.info(f"[LOOP-CALL.DONE] Loop completed for {event.step}: {new_count}/{collection_size}")
+                                logger.info(
+                                    "[LOOP-CALL.DONE] Loop completed for %s: %s/%s",
+                                    event.step,
+                                    new_count,
+                                    collection_size,
+                                )
 
                                 loop_aggregation = state.get_loop_aggregation(event.step)
                                 await state.mark_step_completed(event.step, loop_aggregation)
@@ -1752,13 +1820,17 @@ class EventHandlingMixin:
                                 )
                                 commands.extend(loop_done_commands)
                                 logger.info(
-                                    f"[LOOP-CALL.DONE] Generated {len(loop_done_commands)} commands from loop.done"
+                                    "[LOOP-CALL.DONE] Generated %s commands from loop.done",
+                                    len(loop_done_commands)
                                 )
                     else:
                         # More iterations needed
                         logger.info(
-                            f"[LOOP-CALL.DONE] Issuing iteration commands for {event.step}: "
-                            f"{new_count}/{collection_size} (mode={step_def.loop.mode})"
+                            "[LOOP-CALL.DONE] Issuing iteration commands for %s: %s/%s (mode=%s)",
+                            event.step,
+                            new_count,
+                            collection_size,
+                            step_def.loop.mode
                         )
                         iter_cmds = await self._issue_loop_commands(
                             state, step_def, {"__loop_continue": True}
@@ -1766,14 +1838,19 @@ class EventHandlingMixin:
                         commands.extend(iter_cmds)
 
                 except Exception as e:
-                    logger.error(f"[LOOP-CALL.DONE] Error handling loop: {e}", exc_info=True)
+                    logger.error("[LOOP-CALL.DONE] Error handling loop: %s", e, exc_info=True)
 
         # Identify retry commands (commands targeting the same step are retries)
         server_retry_commands = [c for c in next_commands if c.step == event.step]
 
         is_retrying = bool(server_retry_commands) or has_worker_retry
         if is_retrying:
-            logger.info(f"[ENGINE] Step {event.step} is retrying (server_retry={bool(server_retry_commands)}, worker_retry={has_worker_retry})")
+            logger.info(
+                "[ENGINE] Step %s is retrying (server_retry=%s, worker_retry=%s)",
+                event.step,
+                bool(server_retry_commands),
+                has_worker_retry,
+            )
             state.pagination_state.setdefault(event.step, {})["pending_retry"] = True
         else:
             # If no retry triggered by THIS event, clear pending flag
@@ -1797,7 +1874,11 @@ class EventHandlingMixin:
             
             # Use the is_retrying flag we just determined
             if is_retrying:
-                logger.debug(f"[LOOP_DEBUG] Pagination retry active for {event.step}; skipping aggregation and loop advance")
+                logger.debug(
+                    "[LOOP_DEBUG] Pagination retry active for %s; skipping aggregation and loop "
+                    "advance",
+                    event.step,
+                )
             
             # If pagination collected data for this step, merge it into the current result before aggregation
             # and reset pagination state for the next iteration/run when no retry is pending.
@@ -1831,8 +1912,11 @@ class EventHandlingMixin:
 
                     event.payload["result"] = current_result
                     logger.info(
-                        f"[PAGINATION] Merged collected pagination data into result for {event.step}: "
-                        f"{len(flattened_items)} total items over {pagination_state.get('iteration_count', 0)} pages"
+                        "[PAGINATION] Merged collected pagination data into result for %s: %s "
+                        "total items over %s pages",
+                        event.step,
+                        len(flattened_items),
+                        pagination_state.get('iteration_count', 0)
                     )
 
                 # Reset pagination state for next iteration/run to avoid bleed-over
@@ -1859,7 +1943,10 @@ class EventHandlingMixin:
                 if not loop_state.get("aggregation_finalized", False):
                     failed = event.payload.get("status", "").upper() == "FAILED"
                     state.add_loop_result(event.step, event.payload["result"], failed=failed)
-                    logger.info(f"Added iteration result to loop aggregation for step {event.step}")
+                    logger.info(
+                        "Added iteration result to loop aggregation for step %s",
+                        event.step,
+                    )
                     
                     # Sync completed count to distributed NATS K/V cache for multi-server deployments
                     # NOTE: We only increment the count, NOT store the actual result
@@ -1875,21 +1962,39 @@ class EventHandlingMixin:
                                 event_id=str(loop_event_id) if loop_event_id else None
                             )
                             if new_count >= 0:
-                                logger.debug(f"[LOOP-NATS] Incremented completion count in NATS K/V for {event.step}: {new_count}, event_id={loop_event_id}")
+                                logger.debug(
+                                    "[LOOP-NATS] Incremented completion count in NATS K/V for %s: "
+                                    "%s, event_id=%s",
+                                    event.step,
+                                    new_count,
+                                    loop_event_id,
+                                )
                             else:
-                                logger.error(f"[LOOP-NATS] Failed to increment completion count in NATS K/V for {event.step}, event_id={loop_event_id}")
+                                logger.error(
+                                    "[LOOP-NATS] Failed to increment completion count in NATS K/V "
+                                    "for %s, event_id=%s",
+                                    event.step,
+                                    loop_event_id,
+                                )
                         else:
                             logger.debug("[LOOP-NATS] Cache does not support completion increments for %s", event.step)
                     except Exception as e:
-                        logger.error(f"[LOOP-NATS] Error syncing to NATS K/V: {e}", exc_info=True)
+                        logger.error("[LOOP-NATS] Error syncing to NATS K/V: %s", e, exc_info=True)
                 else:
-                    logger.info(f"Loop aggregation already finalized for {event.step}, skipping result storage")
+                    logger.info(
+                        "Loop aggregation already finalized for %s, skipping result storage",
+                        event.step,
+                    )
             elif not is_retrying:
                 # Not in loop or loop done - store as normal step result
                 # SKIP for task sequence steps - the task sequence handler already stored
                 # the properly unwrapped result on call.done event
                 if event.step.endswith(":task_sequence"):
-                    logger.debug(f"Skipping step.exit result storage for task sequence step {event.step} (already handled on call.done)")
+                    logger.debug(
+                        "Skipping step.exit result storage for task sequence step %s (already "
+                        "handled on call.done)",
+                        event.step,
+                    )
                 else:
                     hydrated_result = await _hydrate_reference_only_step_result(event.payload["result"])
                     if event.step in ("load_next_facility", "setup_facility_work") or (isinstance(event.step, str) and event.step.startswith("mark_")):
@@ -1909,7 +2014,7 @@ class EventHandlingMixin:
                         except Exception as _e:
                             logger.info("[DIAG-EXIT] failed: %s", _e)
                     await state.mark_step_completed(event.step, hydrated_result)
-                    logger.debug(f"Stored result for step {event.step} in state")
+                    logger.debug("Stored result for step %s in state", event.step)
         
         # Note: call.done response was stored earlier (before next evaluation) to ensure
         # it's available in render_context when creating commands for subsequent steps
@@ -1942,7 +2047,7 @@ class EventHandlingMixin:
                     event
                 )
                 commands.extend(worker_commands)
-                logger.info(f"[ENGINE] Applied retry from worker for step {event.step}")
+                logger.info("[ENGINE] Applied retry from worker for step %s", event.step)
 
             elif action_type == "next":
                 # Worker sends steps as a list: [{"step": "upsert_user"}]
@@ -1953,19 +2058,22 @@ class EventHandlingMixin:
                     event
                 )
                 commands.extend(worker_commands)
-                logger.info(f"[ENGINE] Applied next from worker: {len(worker_commands)} commands generated")
+                logger.info(
+                    "[ENGINE] Applied next from worker: %s commands generated",
+                    len(worker_commands),
+                )
         
         # Handle loop.item events - continue loop iteration
         # Only process if next transitions didn't generate commands
         if not commands and event.name == "loop.item" and step_def.loop:
-            logger.debug(f"Processing loop.item event for {event.step}")
+            logger.debug("Processing loop.item event for %s", event.step)
             command = await self._create_command_for_step(state, step_def, {})
             if command:
                 commands.append(command)
-                logger.debug(f"Created command for next loop iteration")
+                logger.debug("Created command for next loop iteration")
             else:
                 # Loop completed, would emit loop.done below
-                logger.debug(f"Loop iteration complete, will check for loop.done")
+                logger.debug("Loop iteration complete, will check for loop.done")
 
         # Check if step has completed loop - emit loop.done event
         # Check on step.exit regardless of whether next transitions generated commands
@@ -1977,7 +2085,7 @@ class EventHandlingMixin:
             step_def.loop is not None,
         )
         if step_def.loop and event.name == "step.exit":
-            logger.debug(f"[LOOP-DEBUG] Entering loop completion check for {event.step}")
+            logger.debug("[LOOP-DEBUG] Entering loop completion check for %s", event.step)
 
             # Extract loop event ID for recovery check
             loop_state = state.loop_state.get(event.step)
@@ -1985,7 +2093,11 @@ class EventHandlingMixin:
 
             pagination_retry_pending = state.pagination_state.get(event.step, {}).get("pending_retry", False)
             if pagination_retry_pending:
-                logger.debug(f"[LOOP_DEBUG] Pagination retry pending for {event.step}; skipping completion/next iteration")
+                logger.debug(
+                    "[LOOP_DEBUG] Pagination retry pending for %s; skipping completion/next "
+                    "iteration",
+                    event.step,
+                )
             else:
                 # Get loop state from NATS K/V (distributed cache) or local fallback
                 nats_cache = await get_nats_cache()
@@ -1998,16 +2110,16 @@ class EventHandlingMixin:
                 )
                 
                 if not loop_state and not nats_loop_state:
-                    logger.warning(f"No loop state for step {event.step}")
+                    logger.warning("No loop state for step %s", event.step)
                 else:
                     # Use NATS count if available (authoritative), otherwise local cache
                     # NOTE: NATS K/V stores only completed_count, not results array
                     if nats_loop_state:
                         completed_count = nats_loop_state.get("completed_count", 0)
-                        logger.debug(f"[LOOP-NATS] Got count from NATS K/V: {completed_count}")
+                        logger.debug("[LOOP-NATS] Got count from NATS K/V: %s", completed_count)
                     elif loop_state:
                         completed_count = _loop_results_total(loop_state)
-                        logger.debug(f"[LOOP-LOCAL] Got count from local cache: {completed_count}")
+                        logger.debug("[LOOP-LOCAL] Got count from local cache: %s", completed_count)
                     else:
                         completed_count = 0
 
@@ -2065,7 +2177,11 @@ class EventHandlingMixin:
                             collection = self._render_template(step_def.loop.in_, context)
                             collection = self._normalize_loop_collection(collection, event.step)
                             loop_state["collection"] = list(collection)
-                            logger.info(f"[LOOP-SETUP] Rendered collection for {event.step}: {len(collection or [])} items")
+                            logger.info(
+                                "[LOOP-SETUP] Rendered collection for %s: %s items",
+                                event.step,
+                                len(collection or []),
+                            )
                         
                         # Store initial loop state in NATS K/V with event_id
                         # NOTE: We store only metadata and completed_count, NOT results array
@@ -2088,12 +2204,18 @@ class EventHandlingMixin:
                         )
                     
                     collection_size = len(loop_state["collection"]) if loop_state else (nats_loop_state.get("collection_size", 0) if nats_loop_state else 0)
-                    logger.info(f"[LOOP-CHECK] Step {event.step}: {completed_count}/{collection_size} iterations completed")
+                    logger.info(
+                        "[LOOP-CHECK] Step %s: %s/%s iterations completed",
+                        event.step,
+                        completed_count,
+                        collection_size,
+                    )
                     
                     if collection_size == 0:
                         logger.warning(
-                            f"[LOOP-CHECK] Step {event.step}: collection size unresolved; "
-                            "continuing loop without completion check"
+                            "[LOOP-CHECK] Step %s: collection size unresolved; continuing loop "
+                            "without completion check",
+                            event.step
                         )
 
                     if collection_size == 0 or completed_count < collection_size:
@@ -2156,7 +2278,10 @@ class EventHandlingMixin:
                             )
                         if not _skip_loop_done:
                             # Loop done - create aggregated result and store as step result
-                            logger.info(f"[LOOP] Loop completed for step {event.step}, creating aggregated result")
+                            logger.info(
+                                "[LOOP] Loop completed for step %s, creating aggregated result",
+                                event.step,
+                            )
 
                             # Mark loop as completed in local state
                             if loop_state:
@@ -2165,7 +2290,10 @@ class EventHandlingMixin:
                                 # NOTE: Results are stored locally in loop_state["results"] during execution
                                 # For distributed deployments, the aggregate service fetches from event table
                                 # NATS K/V only stores counts, NOT results (to respect 1MB limit)
-                                logger.debug(f"[LOOP-COMPLETE] Local results count: {len(loop_state.get('results', []))}")
+                                logger.debug(
+                                    "[LOOP-COMPLETE] Local results count: %s",
+                                    len(loop_state.get('results', [])),
+                                )
 
                             # Get aggregated loop results from local state
                             # NOTE: For distributed scenarios where local results may be incomplete,
@@ -2181,12 +2309,19 @@ class EventHandlingMixin:
                                         "collected_items": pagination_data["collected_data"],
                                         "iteration_count": pagination_data["iteration_count"]
                                     }
-                                    logger.info(f"Merged pagination data into loop result: {pagination_data['iteration_count']} iterations")
+                                    logger.info(
+                                        "Merged pagination data into loop result: %s iterations",
+                                        pagination_data['iteration_count'],
+                                    )
 
                             # Store aggregated result as the step result
                             # This makes it available to next steps via {{ loop_step_name }}
                             await state.mark_step_completed(event.step, loop_aggregation)
-                            logger.info(f"Stored aggregated loop result for {event.step}: {loop_aggregation['stats']}")
+                            logger.info(
+                                "Stored aggregated loop result for %s: %s",
+                                event.step,
+                                loop_aggregation['stats'],
+                            )
 
                             # Process loop.done event through next transitions
                             loop_done_event = Event(
@@ -2221,7 +2356,10 @@ class EventHandlingMixin:
             # Check if step failed - don't process next if it did
             step_status = event.payload.get("status", "").upper()
             if step_status == "FAILED":
-                logger.info(f"[STRUCTURAL-NEXT] Step {event.step} failed, skipping structural next")
+                logger.info(
+                    "[STRUCTURAL-NEXT] Step %s failed, skipping structural next",
+                    event.step,
+                )
             # Only proceed to next if loop is done (or no loop) and step didn't fail
             elif not step_def.loop or state.is_loop_done(event.step):
                 next_mode = _get_next_mode(step_def)
@@ -2242,9 +2380,17 @@ class EventHandlingMixin:
                     # Evaluate when condition if present
                     if when_condition:
                         if not self._evaluate_condition(when_condition, context):
-                            logger.debug(f"[STRUCTURAL-NEXT] Skipping {target_step}: condition not met ({when_condition})")
+                            logger.debug(
+                                "[STRUCTURAL-NEXT] Skipping %s: condition not met (%s)",
+                                target_step,
+                                when_condition,
+                            )
                             continue
-                        logger.info(f"[STRUCTURAL-NEXT] Condition matched for {target_step}: {when_condition}")
+                        logger.info(
+                            "[STRUCTURAL-NEXT] Condition matched for %s: %s",
+                            target_step,
+                            when_condition,
+                        )
 
                     next_step_def = state.get_step(target_step)
                     if next_step_def:
@@ -2274,7 +2420,9 @@ class EventHandlingMixin:
                             if pending_target:
                                 state.issued_steps.add(pending_target)
                             logger.info(
-                                f"[STRUCTURAL-NEXT] Created {len(issued_cmds)} command(s) for step {target_step}"
+                                "[STRUCTURAL-NEXT] Created %s command(s) for step %s",
+                                len(issued_cmds),
+                                target_step
                             )
 
                             # In exclusive mode, stop after first match
@@ -2319,7 +2467,13 @@ class EventHandlingMixin:
                     
                     # Update the step result with pagination data
                     await state.mark_step_completed(event.step, current_result)
-                    logger.info(f"[PAGINATION] Finalized pagination for {event.step}: {len(flattened_items)} total items collected over {pagination_data['iteration_count']} pages")
+                    logger.info(
+                        "[PAGINATION] Finalized pagination for %s: %s total items collected over "
+                        "%s pages",
+                        event.step,
+                        len(flattened_items),
+                        pagination_data['iteration_count'],
+                    )
         
         # Check for completion (only emit once) - prepare completion events but persist after current event
         # Completion primarily triggers on call.done/call.error, with step.exit kept as a
@@ -2433,7 +2587,11 @@ class EventHandlingMixin:
                         pending_count = row["pending_count"] if row else 0
                         has_pending_commands = pending_count > 0
                         if has_pending_commands:
-                            logger.debug(f"[COMPLETION] execution={event.execution_id} pending_in_db={pending_count}")
+                            logger.debug(
+                                "[COMPLETION] execution=%s pending_in_db=%s",
+                                event.execution_id,
+                                pending_count,
+                            )
         # Durable projection is the last word before a dead-end can complete an
         # execution. This keeps distributed pods from trusting an incomplete
         # in-memory issued/completed step set while command rows are still live.
@@ -2559,7 +2717,10 @@ class EventHandlingMixin:
             from noetl.core.dsl.engine.models import LifecycleEventPayload
             completion_status = "failed" if (state.failed or has_error) else "completed"
             if state.failed:
-                logger.info(f"[COMPLETION] Execution {event.execution_id} marked as failed due to earlier step failures")
+                logger.info(
+                    "[COMPLETION] Execution %s marked as failed due to earlier step failures",
+                    event.execution_id,
+                )
             
             # Persist current event FIRST to get its event_id for parent_event_id
             # Skip if already persisted by API caller
@@ -2585,7 +2746,13 @@ class EventHandlingMixin:
                 parent_event_id=current_event_id
             )
             completion_events.append(workflow_completion_event)
-            logger.info(f"Workflow {completion_status}: execution_id={event.execution_id}, final_step={event.step}, parent_event_id={current_event_id}")
+            logger.info(
+                "Workflow %s: execution_id=%s, final_step=%s, parent_event_id=%s",
+                completion_status,
+                event.execution_id,
+                event.step,
+                current_event_id,
+            )
             
             # Then, prepare playbook completion event as final lifecycle event (parent is workflow_completion)
             # We'll set parent after persisting workflow_completion
@@ -2603,7 +2770,12 @@ class EventHandlingMixin:
                 parent_event_id=None  # Will be set after workflow_completion is persisted
             )
             completion_events.append(playbook_completion_event)
-            logger.info(f"Playbook {completion_status}: execution_id={event.execution_id}, final_step={event.step}")
+            logger.info(
+                "Playbook %s: execution_id=%s, final_step=%s",
+                completion_status,
+                event.execution_id,
+                event.step,
+            )
         
         # Save state
         await self.state_store.save_state(state, conn)
@@ -2684,7 +2856,10 @@ class EventHandlingMixin:
                         event.step,
                     )
                 else:
-                    logger.error(f"[FAILURE] Received command.failed event for step {event.step}, stopping execution")
+                    logger.error(
+                        "[FAILURE] Received command.failed event for step %s, stopping execution",
+                        event.step,
+                    )
                     await _emit_failed_terminal_events(event.step or "workflow")
                     return []  # Return empty commands list to stop workflow
 
@@ -2692,7 +2867,7 @@ class EventHandlingMixin:
                 step_status = event.payload.get("status", "").upper()
                 if step_status == "FAILED":
                     state.failed = True  # Track failure for final status
-                    logger.error(f"[FAILURE] Step {event.step} failed, stopping execution")
+                    logger.error("[FAILURE] Step %s failed, stopping execution", event.step)
                     await _emit_failed_terminal_events(event.step or "workflow")
                     return []  # Return empty commands list to stop workflow
 
@@ -2704,8 +2879,10 @@ class EventHandlingMixin:
                 continue
             state.issued_steps.add(pending_key)
             logger.info(
-                f"[ISSUED] Added {pending_key} to issued_steps for execution {state.execution_id}, "
-                f"total issued={len(state.issued_steps)}"
+                "[ISSUED] Added %s to issued_steps for execution %s, total issued=%s",
+                pending_key,
+                state.execution_id,
+                len(state.issued_steps)
             )
 
         # Persist state periodically so the next handle_event can use the
@@ -24,7 +24,10 @@ class LifecycleMixin:
                     catalog_id = result['catalog_id'] if result else None
             
             if not catalog_id:
-                logger.error(f"Cannot persist event - no catalog_id for execution {event.execution_id}")
+                logger.error(
+                    "Cannot persist event - no catalog_id for execution %s",
+                    event.execution_id,
+                )
                 return
             
             parent_event_id = event.parent_event_id
@@ -392,14 +395,19 @@ class LifecycleMixin:
         playbook_path: str,
         payload: dict[str, Any],
         catalog_id: Optional[int] = None,
-        parent_execution_id: Optional[int] = None
+        parent_execution_id: Optional[int] = None,
+        playbook: Optional[Playbook] = None,
     ) -> tuple[str, list[Command]]:
-        """Start a new playbook execution."""
+        """Start a new playbook execution.
+
+        ``playbook`` lets batch starts reuse one already-loaded playbook
+        for every child instead of resolving it again per execution.
+        """
         execution_id = str(await get_snowflake_id())
         
-        if catalog_id:
+        if playbook is None and catalog_id:
             playbook = await self.playbook_repo.load_playbook_by_id(catalog_id)
-        else:
+        elif playbook is None:
             playbook = await self.playbook_repo.load_playbook(playbook_path)
         
         if not playbook:
@@ -422,7 +430,7 @@ class LifecycleMixin:
                 if keychain_manifest:
                     state.variables[KEYCHAIN_MANIFEST_KEY] = keychain_manifest
             except Exception as e:
-                logger.error(f"ENGINE: Failed to process keychain section: {e}")
+                logger.error("ENGINE: Failed to process keychain section: %s", e)
 
         entry_step_name = playbook.get_entry_step()
         start_step = state.get_step(entry_step_name)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections import ChainMap
+from collections.abc import Mapping
+
 from .common import *
 from .state import ExecutionState
 from .store import PlaybookRepo, StateStore
@@ -53,6 +56,58 @@ def _extract_reference_for_fast_path(value: Any) -> Any:
     return None
 
 
+# Context keys rendered as-is; every other dict/list value is a step result.
+_PLAIN_RENDER_KEYS = frozenset({"ctx", "iter", "loop", "event", "workload", "output", "job"})
+
+
+class _StepResultView(Mapping):
+    """Read-only view of a render context that wraps step results on access.
+
+    Jinja only looks up the names a template uses, so wrapping lazily keeps
+    a render independent of how many variables and steps the context holds.
+    """
+
+    __slots__ = ("_context", "_wrapped")
+
+    def __init__(self, context: Mapping[str, Any]):
+        self._context = context
+        self._wrapped: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._wrapped:
+            return self._wrapped[key]
+        value = self._context[key]
+        if key not in _PLAIN_RENDER_KEYS:
+            if isinstance(value, dict):
+                value = TaskResultProxy(value, name=key)
+            elif isinstance(value, list):
+                value = {"result": value}
+        self._wrapped[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._context
+
+    def __iter__(self):
+        return iter(self._context)
+
+    def __len__(self) -> int:
+        return len(self._context)
+
+
+def _render_compiled(template: Template, context: Mapping[str, Any]) -> str:
+    """``template.render(**context)`` without copying the context.
+
+    The view is handed to Jinja as a shared parent (globals chained behind
+    it), which is what ``Template.render`` builds from a fresh dict.
+    """
+    jinja_context = template.new_context(ChainMap(_StepResultView(context), template.globals), shared=True)
+    try:
+        return template.environment.concat(template.root_render_func(jinja_context))
+    except Exception:
+        return template.environment.handle_exception()
+
+
 class RenderingMixin:
     def _render_value_recursive(self, value: Any, context: dict[str, Any]) -> Any:
         """Recursively render templates in nested data structures."""
@@ -89,7 +144,7 @@ class RenderingMixin:
                         return context[part]
                 
                 for part in parts:
-                    if isinstance(value, dict) and part in value:
+                    if isinstance(value, Mapping) and part in value:
                         value = value[part]
                     elif isinstance(value, dict) and part not in value:
                         # Reference-chain resolution: the dict is a compact envelope
@@ -120,17 +175,7 @@ class RenderingMixin:
             
             # Standard Jinja2 rendering - use cached template
             template = self._template_cache.get_or_compile(self.jinja_env, template_str)
-            reserved = {"ctx", "iter", "loop", "event", "workload", "output", "job"}
-            render_context = context.copy()
-            for key, value in context.items():
-                if key in reserved:
-                    continue
-                if isinstance(value, dict):
-                    render_context[key] = TaskResultProxy(value, name=key)
-                elif isinstance(value, list):
-                    render_context[key] = {"result": value}
-
-            result = template.render(**render_context)
+            result = _render_compiled(template, context)
             
             # Try to parse as boolean for conditions
             if result.lower() in ("true", "false"):
@@ -142,7 +187,7 @@ class RenderingMixin:
                 "Template rendering error: %s | template_preview=%s | context_keys=%s",
                 e,
                 (template_str[:160] + "...") if isinstance(template_str, str) and len(template_str) > 160 else template_str,
-                list(context.keys()) if isinstance(context, dict) else [],
+                list(context.keys()) if isinstance(context, Mapping) else [],
             )
             raise
 
@@ -157,20 +202,32 @@ class RenderingMixin:
         if isinstance(value, set):
             return list(value)
         if isinstance(value, dict):
-            logger.warning(f"[LOOP] Step {step_name}: collection rendered as dict; wrapping as single item")
+            logger.warning(
+                "[LOOP] Step %s: collection rendered as dict; wrapping as single item",
+                step_name,
+            )
             return [value]
         if isinstance(value, (str, bytes, bytearray)):
             text = value.decode("utf-8", errors="replace") if not isinstance(value, str) else value
             if "{{" in text or "{%" in text:
-                logger.warning(f"[LOOP] Step {step_name}: collection template unresolved, defaulting to empty list")
+                logger.warning(
+                    "[LOOP] Step %s: collection template unresolved, defaulting to empty list",
+                    step_name,
+                )
                 return []
-            logger.warning(f"[LOOP] Step {step_name}: collection rendered as scalar string; wrapping as single item")
+            logger.warning(
+                "[LOOP] Step %s: collection rendered as scalar string; wrapping as single item",
+                step_name,
+            )
             return [text]
         if hasattr(value, "__iter__"):
             try:
                 return list(value)
             except Exception:
-                logger.warning(f"[LOOP] Step {step_name}: failed to materialize iterable collection; wrapping value")
+                logger.warning(
+                    "[LOOP] Step %s: failed to materialize iterable collection; wrapping value",
+                    step_name,
+                )
                 return [value]
         return [value]
 
@@ -1,10 +1,119 @@
 from __future__ import annotations
 
+from collections import ChainMap
+
 from .common import *
 
 from noetl.core.dsl.engine.planner import FanoutReducePlan, build_fanout_reduce_plan
 from noetl.core.credential_refs import KEYCHAIN_MANIFEST_KEY, keychain_names_from_manifest, strip_keychain_namespaces
 
+# Render-context keys owned by the per-event overlay; step results and
+# variables with these names are never spread into the context.
+_RENDER_RESERVED_KEYS = frozenset({"event", "ctx", "iter", "workload"})
+# System fields set from the execution itself; never overridable.
+_RENDER_PROTECTED_KEYS = frozenset({"execution_id", "catalog_id", "job"})
+
+
+class _TrackedDict(dict):
+    """Dict that counts top-level writes and remembers the keys they touched.
+
+    ``ExecutionState`` keeps ``variables`` and ``step_results`` in tracked
+    dicts so the cached render layers are only patched for the keys that
+    changed. ``changed`` is None when the changes are unknown (``clear`` or an
+    unpickled copy) and the layer must be rebuilt.
+    """
+
+    version = 0
+    changed: Optional[set] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.changed = set()
+
+    def _touch(self, key: Any) -> None:
+        self.version += 1
+        if self.changed is not None:
+            self.changed.add(key)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._touch(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._touch(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, key, *default):
+        if key in self:
+            self._touch(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._touch(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return super().__getitem__(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+        self.changed = None
+
+    def drain_changes(self) -> Optional[set]:
+        """Return the keys written since the last drain (None = unknown) and reset."""
+        changed, self.changed = self.changed, set()
+        return changed
+
+
+class _RenderLayer(dict):
+    """Cached render layer; ``readers`` counts the live contexts built on it.
+
+    ``ExecutionState`` patches a layer in place while no context reads it
+    and copies it first otherwise, so a context never sees later writes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.readers = 0
+
+    def __reduce__(self):
+        # A copy is read by no context yet.
+        return type(self), (dict(self),)
+
+
+class RenderContext(ChainMap):
+    """Layered Jinja context returned by ``ExecutionState.get_render_context``.
+
+    ``maps[0]`` is a small per-call overlay (event, iter, loop, output, error
+    and anything the caller sets); the layers behind it are cached views of
+    execution state shared between calls, so writes and deletes only ever
+    touch the overlay. Lookups cost the same whatever the state size;
+    iterating or ``dict(context)`` still walks every layer.
+    """
+
+    def __init__(self, *maps):
+        super().__init__(*maps)
+        # Covers new_child(), parents and copy() as well.
+        self._layers = tuple(layer for layer in self.maps if isinstance(layer, _RenderLayer))
+        for layer in self._layers:
+            layer.readers += 1
+
+    def __del__(self):
+        for layer in getattr(self, "_layers", ()):
+            layer.readers -= 1
+
 
 class ExecutionState:
     """Tracks state of a playbook execution."""
@@ -19,6 +128,15 @@ class ExecutionState:
         # Phase 6: cache the static fan-out/reduce plan once per execution so
         # transition evaluation doesn't re-run the planner on every fan-out.
         self._fanout_reduce_plan: Optional[FanoutReducePlan] = None
+        # Cached render layers, see get_render_context().
+        self._variables_layer: Optional[_RenderLayer] = None
+        self._variables_layer_source: Optional[_TrackedDict] = None
+        self._variables_layer_version = -1
+        self._step_results_layer: Optional[_RenderLayer] = None
+        self._step_results_layer_source: Optional[_TrackedDict] = None
+        self._step_results_layer_version = -1
+        self._system_layer: Optional[dict[str, Any]] = None
+        self._system_layer_key: Optional[tuple] = None
         self.variables: dict[str, Any] = {}
         self.last_event_id: Optional[int] = None  # Track last persisted event ID
         self.step_event_ids: dict[str, int] = {}  # Track last event per step
@@ -56,7 +174,7 @@ class ExecutionState:
             if k == "ctx" and isinstance(v, dict):
                 # Merge execution request ctx into variables for v10 compatibility.
                 self.variables.update(v)
-                logger.debug(f"[STATE-INIT] Merged execution ctx into variables: {list(v.keys())}")
+                logger.debug("[STATE-INIT] Merged execution ctx into variables: %s", list(v.keys()))
             else:
                 # Other keys go directly into variables
                 self.variables[k] = v
@@ -168,6 +286,27 @@ class ExecutionState:
         state.pending_next_actions = data.get("pending_next_actions", {})
         return state
 
+    @property
+    def variables(self) -> dict[str, Any]:
+        return self._variables
+
+    @variables.setter
+    def variables(self, value: dict[str, Any]) -> None:
+        self._variables = value if isinstance(value, _TrackedDict) else _TrackedDict(value or {})
+
+    @property
+    def step_results(self) -> dict[str, Any]:
+        return self._step_results
+
+    @step_results.setter
+    def step_results(self, value: dict[str, Any]) -> None:
+        self._step_results = value if isinstance(value, _TrackedDict) else _TrackedDict(value or {})
+
+    @property
+    def render_version(self) -> tuple[int, int]:
+        """Write counters of ``variables`` and ``step_results``; render layers are cached per version."""
+        return self._variables.version, self._step_results.version
+
     @property
     def fanout_reduce_plan(self) -> FanoutReducePlan:
         """Static fan-out/reduce plan derived from the playbook.
@@ -383,7 +522,13 @@ class ExecutionState:
             "event_id": event_id,
             "omitted_results_count": 0,  # Number of older results evicted from memory buffer
         }
-        logger.debug(f"Initialized loop for step {step_name}: {len(collection or [])} items, mode={mode}, event_id={event_id}")
+        logger.debug(
+            "Initialized loop for step %s: %s items, mode=%s, event_id=%s",
+            step_name,
+            len(collection or []),
+            mode,
+            event_id,
+        )
     
     def get_next_loop_item(self, step_name: str, collection: list = None) -> tuple[Any, int] | None:
         """Get next item from loop. Returns (item, index) or None if done."""
@@ -461,7 +606,12 @@ class ExecutionState:
     
     def add_emitted_loop_epoch(self, step_name: str, event_name: str, loop_event_id: str):
         """Mark a specific transition event as already emitted for deduplication."""
-        logger.info(f"[ENGINE-STATE] Marking transition emitted: {step_name}:{event_name}:{loop_event_id}")
+        logger.info(
+            "[ENGINE-STATE] Marking transition emitted: %s:%s:%s",
+            step_name,
+            event_name,
+            loop_event_id,
+        )
         self.emitted_loop_epochs.add(f"{step_name}:{event_name}:{loop_event_id}")
 
         # On loop.done: prune stale state to prevent unbounded growth.
@@ -469,25 +619,134 @@ class ExecutionState:
         if event_name == "loop.done":
             self.prune_stale_state(keep_steps={step_name})
 
-    def get_render_context(self, event: Event) -> dict[str, Any]:
+    def _get_variables_layer(self) -> dict[str, Any]:
+        """ctx/workload plus the variable spread, patched only for changed keys.
+
+        The layer is patched in place unless a live context still reads it,
+        in which case it is copied first so that context keeps its snapshot.
+        """
+        variables = self._variables
+        layer = self._variables_layer
+        if self._variables_layer_source is variables and self._variables_layer_version == variables.version:
+            return layer
+
+        changed = variables.drain_changes()
+        keychain_manifest = variables.get(KEYCHAIN_MANIFEST_KEY)
+        if (
+            layer is None
+            or self._variables_layer_source is not variables
+            or changed is None
+            or KEYCHAIN_MANIFEST_KEY in changed
+        ):
+            context_vars = strip_keychain_namespaces(variables, keychain_manifest)
+            layer = _RenderLayer(ctx=context_vars, workload=context_vars)
+            keychain_names = keychain_names_from_manifest(keychain_manifest)
+            for k, v in variables.items():
+                if k == "keychain" or k in keychain_names:
+                    continue
+                if k not in _RENDER_RESERVED_KEYS and k not in _RENDER_PROTECTED_KEYS:
+                    layer[k] = v
+        else:
+            blocked = {"keychain"} | keychain_names_from_manifest(keychain_manifest)
+            context_vars = layer["ctx"]
+            if layer.readers:
+                context_vars = dict(context_vars)
+                layer = _RenderLayer(layer)
+            for k in changed:
+                if str(k) in blocked:
+                    continue
+                if k in variables:
+                    context_vars[k] = strip_keychain_namespaces(variables[k], keychain_manifest)
+                    if k not in _RENDER_RESERVED_KEYS and k not in _RENDER_PROTECTED_KEYS:
+                        layer[k] = variables[k]
+                else:
+                    context_vars.pop(k, None)
+                    if k not in _RENDER_RESERVED_KEYS and k not in _RENDER_PROTECTED_KEYS:
+                        layer.pop(k, None)
+            layer["ctx"] = context_vars
+            layer["workload"] = context_vars
+
+        self._variables_layer = layer
+        self._variables_layer_source = variables
+        self._variables_layer_version = variables.version
+        return layer
+
+    def _get_step_results_layer(self) -> dict[str, Any]:
+        """Step results addressable as {{ step_name.field }}, patched only for changed steps.
+
+        Copied before patching while a live context reads it, like the variables layer.
+        """
+        step_results = self._step_results
+        layer = self._step_results_layer
+        if self._step_results_layer_source is step_results and self._step_results_layer_version == step_results.version:
+            return layer
+
+        changed = step_results.drain_changes()
+        if layer is None or self._step_results_layer_source is not step_results or changed is None:
+            layer = _RenderLayer(
+                (step_name, step_result)
+                for step_name, step_result in step_results.items()
+                if step_name not in _RENDER_RESERVED_KEYS and step_name not in _RENDER_PROTECTED_KEYS
+            )
+        else:
+            if layer.readers:
+                layer = _RenderLayer(layer)
+            for step_name in changed:
+                if step_name in _RENDER_RESERVED_KEYS or step_name in _RENDER_PROTECTED_KEYS:
+                    continue
+                if step_name in step_results:
+                    layer[step_name] = step_results[step_name]
+                else:
+                    layer.pop(step_name, None)
+
+        self._step_results_layer = layer
+        self._step_results_layer_source = step_results
+        self._step_results_layer_version = step_results.version
+        return layer
+
+    def _get_system_layer(self) -> dict[str, Any]:
+        # CRITICAL: Convert IDs to strings to prevent JavaScript precision loss with Snowflake IDs
+        key = (self.execution_id, self.catalog_id)
+        if self._system_layer_key != key:
+            execution_id = str(self.execution_id) if self.execution_id else None
+            self._system_layer = {
+                "execution_id": execution_id,
+                "catalog_id": str(self.catalog_id) if self.catalog_id else None,
+                "job": {"uuid": execution_id, "execution_id": execution_id, "id": execution_id},
+            }
+            self._system_layer_key = key
+        return self._system_layer
+
+    def get_render_context(self, event: Event) -> RenderContext:
         """Get context for Jinja2 rendering.
 
+        The context is layered, highest priority first:
+
+        - a per-call overlay: ``event``, ``iter``, ``loop``, ``output``/``error``;
+        - protected system fields (``execution_id``, ``catalog_id``, ``job``);
+        - step results, so ``{{ step_name.field }}`` resolves through TaskResultProxy;
+        - ``ctx``/``workload`` (variables without keychain namespaces) and the
+          variables themselves.
+
+        The lower layers are cached and only patched for the keys written to
+        ``variables``/``step_results`` since the previous call, so building a
+        context does not grow with the number of variables or steps. While an
+        earlier context is still alive, the patch copies the layer instead,
+        which costs O(state) again.
         Loop variables are added to state.variables in _create_command_for_step,
-        so they will be available via **self.variables spread below.
+        so they will be available via the variables layer.
         """
-        logger.debug(
-            "ENGINE.get_render_context execution_id=%s catalog_id=%s variables_count=%s variable_keys=%s",
-            self.execution_id,
-            self.catalog_id,
-            len(self.variables),
-            _sample_keys(self.variables),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "ENGINE.get_render_context execution_id=%s catalog_id=%s variables_count=%s variable_keys=%s",
+                self.execution_id,
+                self.catalog_id,
+                len(self.variables),
+                _sample_keys(self.variables),
+            )
 
         event_payload = _unwrap_event_payload(event.payload)
-        
-        # Protected system fields that should not be overridden by workload variables
-        protected_fields = {"execution_id", "catalog_id", "job"}
-        
+
         # Separate iteration-scoped variables (loop iterator, loop index)
         iter_vars = {}
         if event.step and event.step in self.loop_state:
@@ -501,60 +760,28 @@ class ExecutionState:
             collection_size = len(loop_state["collection"]) if "collection" in loop_state else int(loop_state.get("collection_size", 0))
             iter_vars["_last"] = loop_state["index"] >= (collection_size - 1)
 
-        keychain_manifest = self.variables.get(KEYCHAIN_MANIFEST_KEY)
-        context_vars = strip_keychain_namespaces(self.variables, keychain_manifest)
-
-        context = {
+        overlay = {
             "event": {
                 "name": event.name,
                 "payload": event_payload,
                 "step": event.step,
                 "timestamp": event.timestamp.isoformat() if event.timestamp else None,
             },
-            # ctx = execution-scoped, iter = iteration-scoped
-            "ctx": context_vars,
+            # iter = iteration-scoped; ctx (execution-scoped) lives in the variables layer
             "iter": iter_vars,
-            # Backward compatibility: workload namespace for {{ workload.xxx }}
-            "workload": context_vars,
         }
 
-        # Step results are accessed via {{ step_name.field }} through TaskResultProxy.
-        # Only inject compact reference envelopes — resolution happens on-demand
-        # in TaskResultProxy.__getattr__ from shared cache (TempStore).
-        # This keeps the render context bounded regardless of step count.
-        for step_name, step_result in self.step_results.items():
-            if step_name not in context and step_name not in protected_fields:
-                context[step_name] = step_result
-
-        # Add variables to context only if they don't collide with reserved keys
-        keychain_names = keychain_names_from_manifest(keychain_manifest)
-        for k, v in self.variables.items():
-            if k == "keychain" or k in keychain_names:
-                continue
-            if k not in context and k not in protected_fields:
-                context[k] = v
-        
-        # Set protected fields AFTER spreading variables to ensure they are not overridden
-        # CRITICAL: Convert IDs to strings to prevent JavaScript precision loss with Snowflake IDs
-        context["execution_id"] = str(self.execution_id) if self.execution_id else None
-        context["catalog_id"] = str(self.catalog_id) if self.catalog_id else None
-        context["job"] = {
-            "uuid": str(self.execution_id) if self.execution_id else None,
-            "execution_id": str(self.execution_id) if self.execution_id else None,
-            "id": str(self.execution_id) if self.execution_id else None
-        }
-        
         # Add loop metadata context if step has active loop
         if event.step and event.step in self.loop_state:
             loop_state = self.loop_state[event.step]
-            context["loop"] = {
+            overlay["loop"] = {
                 "index": loop_state["index"] - 1 if loop_state["index"] > 0 else 0,  # Current item index
                 "first": loop_state["index"] == 1,
                 "length": loop_state.get("collection_size", 0),
                 "done": loop_state["completed"]
             }
             # Note: Iterator variable itself (e.g., {{ num }}) comes from state.variables
-        
+
         # Add event-specific data (strict reference-only contract).
         if isinstance(event_payload, dict):
             step_result = self.step_results.get(event.step) if event.step else None
@@ -565,8 +792,13 @@ class ExecutionState:
                 event_payload=event_payload,
                 step_result=step_result,
             )
-            context["output"] = output_view
+            overlay["output"] = output_view
             if output_view.get("error") is not None:
-                context["error"] = output_view.get("error")
+                overlay["error"] = output_view.get("error")
 
-        return context
+        return RenderContext(
+            overlay,
+            self._get_system_layer(),
+            self._get_step_results_layer(),
+            self._get_variables_layer(),
+        )
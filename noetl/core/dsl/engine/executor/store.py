@@ -52,7 +52,7 @@ class PlaybookRepo:
                 playbook_dict = yaml.safe_load(row["content"])
                 api_version = playbook_dict.get("apiVersion")
                 if api_version != "noetl.io/v2":
-                    logger.error(f"Playbook {path} has unsupported apiVersion: {api_version}")
+                    logger.error("Playbook %s has unsupported apiVersion: %s", path, api_version)
                     return None
                     
                 playbook = Playbook(**playbook_dict)
@@ -60,7 +60,7 @@ class PlaybookRepo:
                 await self._cache.set(path, playbook)
                 return playbook
             except Exception as e:
-                logger.error(f"Failed to parse playbook {path}: {e}")
+                logger.error("Failed to parse playbook %s: %s", path, e)
                 return None
                 
         return None
@@ -94,7 +94,11 @@ class PlaybookRepo:
                 playbook_dict = yaml.safe_load(row["content"])
                 api_version = playbook_dict.get("apiVersion")
                 if api_version != "noetl.io/v2":
-                    logger.error(f"Playbook {catalog_id} has unsupported apiVersion: {api_version}")
+                    logger.error(
+                        "Playbook %s has unsupported apiVersion: %s",
+                        catalog_id,
+                        api_version,
+                    )
                     return None
                     
                 playbook = Playbook(**playbook_dict)
@@ -111,7 +115,7 @@ class PlaybookRepo:
                     
                 return playbook
             except Exception as e:
-                logger.error(f"Failed to parse playbook {catalog_id}: {e}")
+                logger.error("Failed to parse playbook %s: %s", catalog_id, e)
                 return None
                 
         return None
@@ -274,10 +278,16 @@ class StateStore:
                 await cur.execute(sql, params)
                 
         t4 = time.perf_counter()
-        log.info(f"[PERF] save_state total={t4-t0:.3f}s to_dict={t1-t0:.3f}s dumps={t3-t2:.3f}s db={t4-t3:.3f}s")
+        log.info(
+            "[PERF] save_state total=%.3fs to_dict=%.3fs dumps=%.3fs db=%.3fs",
+            t4-t0,
+            t1-t0,
+            t3-t2,
+            t4-t3,
+        )
 
 
-        logger.debug(f"[STATE-SAVE] State saved to Postgres for execution {state.execution_id}")
+        logger.debug("[STATE-SAVE] State saved to Postgres for execution %s", state.execution_id)
 
     async def save_state_terminal_lightweight(
         self,
@@ -10,8 +10,10 @@ from .outbox import drain_executor_outbox, enqueue_executor_outbox
 from .state import ExecutionState
 from .store import PlaybookRepo, StateStore
 from noetl.core.event_store.ports import canonical_event_checksum
+from noetl.core.event_store.postgres import advance_stream_head
 # Plan access is now cached on ExecutionState; planner module is referenced via state.fanout_reduce_plan
 from noetl.core.dsl.render import render_template
+from noetl.core.scheduler.dispatcher import dispatch_priority
 
 class TransitionMixin:
     def _get_loop_max_in_flight(self, step: Step, context: dict[str, Any] | None = None) -> int:
@@ -304,7 +306,7 @@ class TransitionMixin:
                 next_targets=next_targets,
                 spec=command_spec,
                 attempt=1,
-                priority=0,
+                priority=dispatch_priority(state, step_def.step),
                 metadata=command_metadata,
             )
             commands.append(command)
@@ -403,6 +405,7 @@ class TransitionMixin:
                 if not owns_transaction:
                     await cur.execute(f"SAVEPOINT {savepoint_name}")
                 try:
+                    envelope["stream_version"] = await advance_stream_head(cur, stream_id)
                     await cur.execute(
                         """
                         INSERT INTO noetl.event (
@@ -418,7 +421,7 @@ class TransitionMixin:
                             %s, %s, %s, %s,
                             %s, 'stage.opened', %s, %s, 'OPEN',
                             %s, %s, %s, 'noetl-server',
-                            %s, %s, %s, 1,
+                            %s, %s, %s, %s,
                             %s, 'stage', 'noetl.stage.opened', 1,
                             %s, 'noetl-server', %s, %s,
                             %s, NULL, %s, %s
@@ -438,6 +441,7 @@ class TransitionMixin:
                             tenant_id,
                             organization_id,
                             stream_id,
+                            envelope["stream_version"],
                             f"stage/{stage_id}",
                             event_time,
                             envelope["causation_id"],
@@ -725,7 +729,13 @@ class TransitionMixin:
         next_mode = _get_next_mode(step_def)
         next_items = _get_next_arcs(step_def)
 
-        logger.info(f"[NEXT-EVAL] Step {event.step} has {len(next_items)} next targets, mode={next_mode}, evaluating for event {event.name}")
+        logger.info(
+            "[NEXT-EVAL] Step %s has %s next targets, mode=%s, evaluating for event %s",
+            event.step,
+            len(next_items),
+            next_mode,
+            event.name,
+        )
 
         any_matched = False
         any_raised = False
@@ -737,27 +747,42 @@ class TransitionMixin:
             arc_set = next_target.set or {}
 
             if not target_step:
-                logger.warning(f"[NEXT-EVAL] Skipping next entry {idx} with no step")
+                logger.warning("[NEXT-EVAL] Skipping next entry %s with no step", idx)
                 continue
 
             # Evaluate when condition (if present)
             if when_condition:
-                logger.debug(f"[NEXT-EVAL] Evaluating next[{idx}].when: {when_condition}")
+                logger.debug("[NEXT-EVAL] Evaluating next[%s].when: %s", idx, when_condition)
                 matched, raised = self._evaluate_condition_with_status(when_condition, context)
                 if raised:
                     any_raised = True
                 if not matched:
-                    logger.debug(f"[NEXT-EVAL] Next[{idx}] condition not matched: {when_condition}")
+                    logger.debug(
+                        "[NEXT-EVAL] Next[%s] condition not matched: %s",
+                        idx,
+                        when_condition,
+                    )
                     continue
-                logger.info(f"[NEXT-MATCH] Step {event.step}: matched next[{idx}] -> {target_step} (when: {when_condition})")
+                logger.info(
+                    "[NEXT-MATCH] Step %s: matched next[%s] -> %s (when: %s)",
+                    event.step,
+                    idx,
+                    target_step,
+                    when_condition,
+                )
             else:
                 # No when condition = always matches
-                logger.info(f"[NEXT-MATCH] Step {event.step}: matched next[{idx}] -> {target_step} (unconditional)")
+                logger.info(
+                    "[NEXT-MATCH] Step %s: matched next[%s] -> %s (unconditional)",
+                    event.step,
+                    idx,
+                    target_step,
+                )
 
             # Get target step definition — must exist before we count this as a match
             target_step_def = state.get_step(target_step)
             if not target_step_def:
-                logger.error(f"[NEXT-EVAL] Target step not found: {target_step}")
+                logger.error("[NEXT-EVAL] Target step not found: %s", target_step)
                 continue
 
             # Arc condition matched AND target step exists.
@@ -780,7 +805,11 @@ class TransitionMixin:
                         target_step,
                     )
                 else:
-                    logger.warning(f"[NEXT-EVAL] Skipping duplicate command for step '{target_step}' - already in issued_steps")
+                    logger.warning(
+                        "[NEXT-EVAL] Skipping duplicate command for step '%s' - already in "
+                        "issued_steps",
+                        target_step,
+                    )
                     continue
 
             # Apply arc-level set mutations to state before issuing the command.
@@ -803,8 +832,9 @@ class TransitionMixin:
                 # from parallel event processing
                 state.issued_steps.add(target_step)
                 logger.info(
-                    f"[NEXT-MATCH] Created {len(issued_cmds)} command(s) for step {target_step}, "
-                    "added to issued_steps"
+                    "[NEXT-MATCH] Created %s command(s) for step %s, added to issued_steps",
+                    len(issued_cmds),
+                    target_step
                 )
 
             # In exclusive mode: first match wins
@@ -812,7 +842,7 @@ class TransitionMixin:
                 break
 
         if not any_matched:
-            logger.debug(f"[NEXT-EVAL] No next targets matched for step {event.step}")
+            logger.debug("[NEXT-EVAL] No next targets matched for step %s", event.step)
         if any_raised:
             logger.warning(
                 "[NEXT-EVAL] Step %s had arc condition(s) that raised during rendering; "
@@ -988,7 +1018,11 @@ class TransitionMixin:
 
             if task_list:
                 # Create a single command for the task sequence
-                logger.info(f"[TASK_SEQ] Processing task sequence for step {event.step} with {len(task_list)} tasks")
+                logger.info(
+                    "[TASK_SEQ] Processing task sequence for step %s with %s tasks",
+                    event.step,
+                    len(task_list),
+                )
                 command = await self._create_task_sequence_command(
                     state, event.step, task_list, remaining_actions, context
                 )
@@ -1032,7 +1066,11 @@ class TransitionMixin:
                     # This is a named task - create a command for it
                     tool_spec = task_config["tool"]
                     if isinstance(tool_spec, dict) and "kind" in tool_spec:
-                        logger.info(f"[THEN-TASK] Processing named task '{task_name}' with tool kind '{tool_spec.get('kind')}'")
+                        logger.info(
+                            "[THEN-TASK] Processing named task '%s' with tool kind '%s'",
+                            task_name,
+                            tool_spec.get('kind'),
+                        )
                         command = await self._create_inline_command(
                             state, event.step, task_name, tool_spec, context
                         )
@@ -1058,7 +1096,11 @@ class TransitionMixin:
                         'inline_tasks': set(inline_task_step_names),
                         'context_event_step': event.step
                     }
-                logger.info(f"[THEN-TASK] Deferred {len(deferred_next_actions)} next action(s) until inline tasks complete: {inline_task_step_names}")
+                logger.info(
+                    "[THEN-TASK] Deferred %s next action(s) until inline tasks complete: %s",
+                    len(deferred_next_actions),
+                    inline_task_step_names,
+                )
 
             # Return only inline task commands (next actions are deferred)
             commands.extend(inline_task_commands)
@@ -1118,7 +1160,7 @@ class TransitionMixin:
                     # Get target step definition
                     step_def = state.get_step(target_step)
                     if not step_def:
-                        logger.error(f"Target step not found: {target_step}")
+                        logger.error("Target step not found: %s", target_step)
                         continue
 
                     # Create command for target step
@@ -1140,7 +1182,7 @@ class TransitionMixin:
             elif "fail" in action:
                 # Mark execution as failed
                 state.failed = True
-                logger.info(f"Execution {state.execution_id} marked as failed")
+                logger.info("Execution %s marked as failed", state.execution_id)
             
             if "collect" in action:
                 # Collect data for pagination accumulation
@@ -1162,7 +1204,7 @@ class TransitionMixin:
                 result_data = event.payload.get("result")
 
                 if result_data is None:
-                    logger.warning(f"[COLLECT] No result payload to collect for step {step_name}")
+                    logger.warning("[COLLECT] No result payload to collect for step %s", step_name)
                 else:
                     data_to_collect = result_data
                     if path and isinstance(result_data, dict):
@@ -1170,7 +1212,7 @@ class TransitionMixin:
                             if isinstance(data_to_collect, dict) and part in data_to_collect:
                                 data_to_collect = data_to_collect[part]
                             else:
-                                logger.warning(f"Path {path} not found in result for collect")
+                                logger.warning("Path %s not found in result for collect", path)
                                 data_to_collect = None
                                 break
 
@@ -1188,13 +1230,18 @@ class TransitionMixin:
                         # If this collect matched a terminal page (no retry), clear pending flag
                         state.pagination_state[step_name]["pending_retry"] = False
                         logger.info(
-                            f"[COLLECT] Accumulated {len(collected)} items for step {step_name} "
-                            f"(iteration {state.pagination_state[step_name]['iteration_count']})"
+                            "[COLLECT] Accumulated %s items for step %s (iteration %s)",
+                            len(collected),
+                            step_name,
+                            state.pagination_state[step_name]['iteration_count']
                         )
                         if state.pagination_state[step_name]["iteration_count"] >= max_pages:
                             state.pagination_state[step_name]["pending_retry"] = False
                             logger.warning(
-                                f"[PAGINATION] Reached max_pages={max_pages} for step {step_name}; stopping pagination retries"
+                                "[PAGINATION] Reached max_pages=%s for step %s; stopping "
+                                "pagination retries",
+                                max_pages,
+                                step_name
                             )
 
             # Pagination retry (params/url/etc) can coexist with collect
@@ -1211,14 +1258,17 @@ class TransitionMixin:
                     state.pagination_state.setdefault(event.step, {}).setdefault("pending_retry", False)
                     state.pagination_state[event.step]["pending_retry"] = False
                     logger.warning(
-                        f"[PAGINATION] Skip retry for {event.step}: iteration_count={iteration_count} reached max_pages={max_pages}"
+                        "[PAGINATION] Skip retry for %s: iteration_count=%s reached max_pages=%s",
+                        event.step,
+                        iteration_count,
+                        max_pages
                     )
                     continue
 
                 # Get current step definition
                 step_def = state.get_step(event.step)
                 if not step_def:
-                    logger.error(f"Cannot retry: step {event.step} not found")
+                    logger.error("Cannot retry: step %s not found", event.step)
                     continue
 
                 # Extract updated parameters from retry spec
@@ -1253,8 +1303,10 @@ class TransitionMixin:
                     loop_state["index"] -= 1
                     rewind_applied = True
                     logger.info(
-                        f"[RETRY] Rewound loop index for step {event.step} to reuse current item "
-                        f"(index now {loop_state['index']})"
+                        "[RETRY] Rewound loop index for step %s to reuse current item (index now "
+                        "%s)",
+                        event.step,
+                        loop_state['index']
                     )
 
                 # Create retry command with updated input (same step)
@@ -1275,7 +1327,9 @@ class TransitionMixin:
                     state.pagination_state[event.step]["pending_retry"] = True
                     commands.append(command)
                     logger.info(
-                        f"[RETRY] Created pagination retry command for {event.step} with updated params: {list(updated_args.keys())}"
+                        "[RETRY] Created pagination retry command for %s with updated params: %s",
+                        event.step,
+                        list(updated_args.keys())
                     )
 
             if "call" in action:
@@ -1299,14 +1353,14 @@ class TransitionMixin:
                 # Get target step definition
                 step_def = state.get_step(target_step)
                 if not step_def:
-                    logger.error(f"Call target step not found: {target_step}")
+                    logger.error("Call target step not found: %s", target_step)
                     continue
                 
                 # Create command for target step
                 command = await self._create_command_for_step(state, step_def, rendered_args)
                 if command:
                     commands.append(command)
-                    logger.info(f"Call action: invoking step {target_step}")
+                    logger.info("Call action: invoking step %s", target_step)
             
             if "retry" in action and not handled_pagination_retry:
                 # Retry current step with optional backoff
@@ -1322,15 +1376,18 @@ class TransitionMixin:
                 # Check if max attempts exceeded
                 if current_attempt >= max_attempts:
                     logger.warning(
-                        f"[RETRY-EXHAUSTED] Step {event.step} has reached max retry attempts "
-                        f"({current_attempt}/{max_attempts}). Skipping retry action."
+                        "[RETRY-EXHAUSTED] Step %s has reached max retry attempts (%s/%s). "
+                        "Skipping retry action.",
+                        event.step,
+                        current_attempt,
+                        max_attempts
                     )
                     continue
                 
                 # Get current step
                 step_def = state.get_step(event.step)
                 if not step_def:
-                    logger.error(f"Retry: current step not found: {event.step}")
+                    logger.error("Retry: current step not found: %s", event.step)
                     continue
                 
                 logger.info(
@@ -1349,8 +1406,10 @@ class TransitionMixin:
                     command.retry_backoff = backoff
                     commands.append(command)
                     logger.info(
-                        f"[RETRY-ACTION] Re-attempting step {event.step} "
-                        f"(attempt {command.attempt}/{max_attempts})"
+                        "[RETRY-ACTION] Re-attempting step %s (attempt %s/%s)",
+                        event.step,
+                        command.attempt,
+                        max_attempts
                     )
 
             # NOTE: Inline tasks (with tool: inside) are processed by the code above
@@ -1383,7 +1442,7 @@ class TransitionMixin:
         if "fail" in action:
             # Mark execution as failed
             state.failed = True
-            logger.info(f"Execution {state.execution_id} marked as failed")
+            logger.info("Execution %s marked as failed", state.execution_id)
 
     async def _process_deferred_next_actions(
         self,
@@ -1423,10 +1482,16 @@ class TransitionMixin:
         all_completed = all(task in state.completed_steps for task in inline_tasks)
 
         if not all_completed:
-            logger.debug(f"[DEFERRED-NEXT] Not all inline tasks completed yet. Waiting for: {inline_tasks - state.completed_steps}")
+            logger.debug(
+                "[DEFERRED-NEXT] Not all inline tasks completed yet. Waiting for: %s",
+                inline_tasks - state.completed_steps,
+            )
             return commands
 
-        logger.info(f"[DEFERRED-NEXT] All inline tasks completed, processing {len(next_actions)} deferred next action(s)")
+        logger.info(
+            "[DEFERRED-NEXT] All inline tasks completed, processing %s deferred next action(s)",
+            len(next_actions),
+        )
 
         # Get context from the original step that triggered the inline tasks
         # Create a synthetic event for context
@@ -1476,7 +1541,7 @@ class TransitionMixin:
                 # Get target step definition
                 step_def = state.get_step(target_step)
                 if not step_def:
-                    logger.error(f"[DEFERRED-NEXT] Target step not found: {target_step}")
+                    logger.error("[DEFERRED-NEXT] Target step not found: %s", target_step)
                     continue
 
                 # Create command for target step
@@ -1484,7 +1549,9 @@ class TransitionMixin:
                 if issued_cmds:
                     commands.extend(issued_cmds)
                     logger.info(
-                        f"[DEFERRED-NEXT] Created {len(issued_cmds)} command(s) for step: {target_step}"
+                        "[DEFERRED-NEXT] Created %s command(s) for step: %s",
+                        len(issued_cmds),
+                        target_step
                     )
 
         # Clean up pending actions for all inline tasks in this group
@@ -128,9 +128,9 @@ class CursorSpec(BaseModel):
     Describes a pull-model data source where workers atomically claim one
     work item at a time.  Alternative to `loop.in` (collection-based).
 
-    The cursor's `kind` selects a driver (postgres / mysql / snowflake /
-    redis / nats_stream / ...); `auth` is a credential name resolved the
-    same way tool.auth is resolved today.  `claim` is a driver-specific
+    The cursor's `kind` selects a driver (postgres / duckdb / mysql /
+    snowflake / redis / nats_stream / ...); `auth` is a credential name
+    resolved the same way tool.auth is resolved today.  `claim` is a driver-specific
     statement that returns one row (or nothing when the cursor is drained).
 
     Canonical format:
@@ -149,11 +149,14 @@ class CursorSpec(BaseModel):
     """
     kind: str = Field(
         ...,
-        description="Driver kind: postgres, mysql, snowflake, redis, nats_stream, ..."
+        description="Driver kind: postgres, duckdb, mysql, snowflake, redis, nats_stream, ..."
     )
-    auth: str = Field(
-        ...,
-        description="Credential name for the cursor connection (same lookup as tool.auth)"
+    auth: Optional[str] = Field(
+        None,
+        description=(
+            "Credential name for the cursor connection (same lookup as tool.auth). "
+            "Required by drivers that connect to a remote store; optional for duckdb."
+        )
     )
     claim: str = Field(
         ...,
@@ -161,7 +164,11 @@ class CursorSpec(BaseModel):
     )
     options: Optional[dict[str, Any]] = Field(
         None,
-        description="Driver-specific options (timeout, reclaim_after, max_attempts, ...)"
+        description=(
+            "Driver-specific options (timeout, reclaim_after, max_attempts, ...). "
+            "`partition: {key, source}` splits the source into disjoint keyset "
+            "ranges, one per worker slot."
+        )
     )
 
 
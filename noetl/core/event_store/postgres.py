@@ -44,23 +44,148 @@ async def _drain_event_store_outbox() -> None:
         logger.warning("Event-store outbox drain failed: %s", exc)
 
 
+# Streams that predate the head table are backfilled once, in the
+# transaction that creates it; later schema applies skip the event scan.
+_EVENT_STREAM_HEAD_DDL = """
+DO $$
+BEGIN
+    IF to_regclass('noetl.event_stream_head') IS NULL THEN
+        CREATE TABLE noetl.event_stream_head (
+            stream_id TEXT PRIMARY KEY,
+            version BIGINT NOT NULL,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+        INSERT INTO noetl.event_stream_head (stream_id, version)
+        SELECT stream_id, max(stream_version)
+        FROM noetl.event
+        WHERE stream_id IS NOT NULL
+          AND stream_id NOT LIKE '%/frame/%'
+        GROUP BY stream_id;
+    END IF;
+END $$;
+"""
+
+# Appends with no expected version, or expecting an empty stream, create the
+# head on first use.  The row lock taken here serializes writers of one
+# stream until commit; a waiter re-checks the WHERE against the new version.
+_BUMP_OR_CREATE_HEAD_SQL = """
+INSERT INTO noetl.event_stream_head AS head (stream_id, version, updated_at)
+VALUES (%(stream_id)s, %(count)s, now())
+ON CONFLICT (stream_id) DO UPDATE
+SET version = head.version + %(count)s,
+    updated_at = now()
+WHERE %(expected)s::bigint IS NULL OR head.version = %(expected)s::bigint
+RETURNING version
+"""
+
+_BUMP_HEAD_SQL = """
+UPDATE noetl.event_stream_head
+SET version = version + %(count)s,
+    updated_at = now()
+WHERE stream_id = %(stream_id)s
+  AND version = %(expected)s
+RETURNING version
+"""
+
+_EVENT_COLUMNS = (
+    "event_id", "execution_id", "event_type", "node_name", "status",
+    "result", "meta", "tenant_id", "organization_id", "stream_id",
+    "stream_version", "aggregate_id", "aggregate_type", "schema_name",
+    "schema_version", "event_time", "producer", "causation_id",
+    "correlation_id", "idempotency_key", "payload_ref", "envelope_checksum",
+)
+_EVENT_ROW_SQL = "(" + ", ".join(["%s"] * len(_EVENT_COLUMNS)) + ", now(), now())"
+
+
+async def advance_stream_head(cur: Any, stream_id: str, count: int = 1) -> int:
+    """Advance ``stream_id``'s head by ``count`` and return the new version.
+
+    For writers that insert into a versioned stream without going through
+    :class:`PostgresEventStore` (stage lifecycle events).  Run it in the
+    transaction that inserts the events so a rollback also undoes the bump.
+    """
+    await cur.execute(_BUMP_OR_CREATE_HEAD_SQL, {"stream_id": stream_id, "count": count, "expected": None})
+    row = await cur.fetchone()
+    return int(row["version"] if isinstance(row, dict) else row[0])
+
+
+def _insert_events_sql(count: int) -> str:
+    return (
+        f"INSERT INTO noetl.event ({', '.join(_EVENT_COLUMNS)}, ingest_time, created_at) VALUES "
+        + ", ".join([_EVENT_ROW_SQL] * count)
+    )
+
+
+def _event_row(envelope: dict[str, Any]) -> list[Any]:
+    row = []
+    for column in _EVENT_COLUMNS:
+        value = envelope.get(column)
+        if column in ("result", "meta"):
+            value = Json(value or {})
+        elif column == "payload_ref":
+            value = Json(value) if value else None
+        row.append(value)
+    return row
+
+
 class PostgresEventStore:
-    """Postgres `noetl.event` reference event-store adapter."""
+    """Postgres `noetl.event` reference event-store adapter.
+
+    Stream versions live in ``noetl.event_stream_head``, one row per
+    stream, so an append costs the same whatever the size of
+    ``noetl.event``: bump the head (the optimistic concurrency check), take
+    the event ids in one round trip, insert every record in one statement.
+
+    Every dense stream writer keeps the head current: this adapter and the
+    stage lifecycle events (through :func:`advance_stream_head`).  Frame
+    streams (``.../frame/<id>``) are the exception: their versions are the
+    sparse event ids, they have no head row, and appending to them here is
+    not supported.
+    """
 
-    async def _next_event_id(self, cur: Any) -> int:
-        await cur.execute("SELECT noetl.snowflake_id() AS snowflake_id")
+    async def ensure_schema(self) -> None:
+        async with get_pool_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(_EVENT_STREAM_HEAD_DDL)
+            await conn.commit()
+
+    async def _next_event_ids(self, cur: Any, count: int) -> list[int]:
+        await cur.execute(
+            "SELECT noetl.snowflake_id() AS snowflake_id FROM generate_series(1, %s)",
+            (count,),
+        )
+        rows = await cur.fetchall()
+        if len(rows) != count:
+            raise RuntimeError("Failed to generate snowflake IDs from database")
+        return [int(row.get("snowflake_id") if isinstance(row, dict) else row[0]) for row in rows]
+
+    async def _bump_head(
+        self,
+        cur: Any,
+        stream_id: str,
+        count: int,
+        expected_version: Optional[int],
+    ) -> int:
+        """Advance the stream head by ``count`` and return the new version."""
+        params = {"stream_id": stream_id, "count": count, "expected": expected_version}
+        if expected_version is None or expected_version == 0:
+            await cur.execute(_BUMP_OR_CREATE_HEAD_SQL, params)
+        else:
+            await cur.execute(_BUMP_HEAD_SQL, params)
         row = await cur.fetchone()
-        if not row:
-            raise RuntimeError("Failed to generate snowflake ID from database")
-        return int(row.get("snowflake_id") if isinstance(row, dict) else row[0])
+        if row:
+            return int(row["version"])
 
-    async def _current_version(self, cur: Any, stream_id: str) -> int:
         await cur.execute(
-            "SELECT COALESCE(max(stream_version), 0) AS version FROM noetl.event WHERE stream_id = %s",
+            "SELECT version FROM noetl.event_stream_head WHERE stream_id = %s",
             (stream_id,),
         )
         row = await cur.fetchone()
-        return int((row or {}).get("version") or 0)
+        raise ExpectedVersionConflict(
+            stream_id=stream_id,
+            expected_version=expected_version,
+            actual_version=int((row or {}).get("version") or 0),
+        )
 
     async def append(
         self,
@@ -74,53 +199,23 @@ class PostgresEventStore:
 
         async with get_pool_connection() as conn:
             async with conn.cursor(row_factory=dict_row) as cur:
-                await cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (stream_id,))
-                current_version = await self._current_version(cur, stream_id)
-                if expected_version is not None and current_version != expected_version:
-                    raise ExpectedVersionConflict(
-                        stream_id=stream_id,
-                        expected_version=expected_version,
-                        actual_version=current_version,
-                    )
-
-                next_version = current_version
-                for record in events:
-                    next_version += 1
-                    event_id = await self._next_event_id(cur)
-                    envelope = record.envelope(stream_version=next_version, event_id=event_id)
-                    await cur.execute(
-                        """
-                        INSERT INTO noetl.event (
-                            event_id, execution_id, event_type, node_name, status,
-                            result, meta, tenant_id, organization_id, stream_id,
-                            stream_version, aggregate_id, aggregate_type, schema_name,
-                            schema_version, event_time, ingest_time, producer,
-                            causation_id, correlation_id, idempotency_key, payload_ref,
-                            envelope_checksum, created_at
-                        )
-                        VALUES (
-                            %(event_id)s, %(execution_id)s, %(event_type)s,
-                            %(node_name)s, %(status)s, %(result)s, %(meta)s,
-                            %(tenant_id)s, %(organization_id)s, %(stream_id)s,
-                            %(stream_version)s, %(aggregate_id)s, %(aggregate_type)s,
-                            %(schema_name)s, %(schema_version)s, %(event_time)s, now(),
-                            %(producer)s, %(causation_id)s, %(correlation_id)s,
-                            %(idempotency_key)s, %(payload_ref)s,
-                            %(envelope_checksum)s, now()
-                        )
-                        """,
-                        {
-                            **envelope,
-                            "result": Json(envelope.get("result") or {}),
-                            "meta": Json(envelope.get("meta") or {}),
-                            "payload_ref": Json(envelope["payload_ref"]) if envelope.get("payload_ref") else None,
-                        },
-                    )
+                last_version = await self._bump_head(cur, stream_id, len(events), expected_version)
+                first_version = last_version - len(events) + 1
+                event_ids = await self._next_event_ids(cur, len(events))
+                envelopes = [
+                    record.envelope(stream_version=first_version + offset, event_id=event_id)
+                    for offset, (record, event_id) in enumerate(zip(events, event_ids))
+                ]
+                await cur.execute(
+                    _insert_events_sql(len(envelopes)),
+                    [value for envelope in envelopes for value in _event_row(envelope)],
+                )
+                for envelope in envelopes:
                     await _enqueue_event_store_outbox(cur, envelope)
 
                 await conn.commit()
                 await _drain_event_store_outbox()
-                return next_version
+                return last_version
 
     async def read(
         self,
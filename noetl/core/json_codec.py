@@ -0,0 +1,152 @@
+"""Fast JSON codec for hot API routes and psycopg JSONB columns.
+
+Opt-in via ``NOETL_FAST_JSON=true``.  When enabled and ``orjson`` is
+installed (``pip install noetl[fastjson]``) encoding/decoding runs through
+orjson; otherwise the same functions fall back to the stdlib ``json``
+module with compact separators, so callers never need to branch on the
+library.
+
+``RawJson`` wraps an already-encoded JSON document (for example a JSONB
+column selected as ``::text``) so it can be embedded in a response without
+being decoded and re-encoded.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import decimal
+import enum
+import json
+import os
+import re
+import uuid
+from typing import Any
+
+try:  # optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+_TRUTHY = {"1", "true", "yes", "on"}
+# orjson decodes integers outside [-2**63, 2**64) as floats; only literals
+# of 19+ digits can be out of range.
+_WIDE_INT_BYTES = re.compile(rb"-?\d{19,}")
+_WIDE_INT_STR = re.compile(r"-?\d{19,}")
+
+
+def fast_json_enabled() -> bool:
+    """Return True when the fast codec path is switched on for hot routes."""
+    return os.getenv("NOETL_FAST_JSON", "false").strip().lower() in _TRUTHY
+
+
+class RawJson:
+    """Pre-encoded JSON embedded verbatim by :func:`dumps`."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes | bytearray | memoryview | str):
+        self.data = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+
+    def __repr__(self) -> str:
+        return f"RawJson({len(self.data)} bytes)"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RawJson) and other.data == self.data
+
+    def decode(self) -> Any:
+        return loads(self.data)
+
+
+def _common_default(obj: Any) -> Any:
+    if isinstance(obj, decimal.Decimal):
+        # Same mapping as FastAPI's jsonable_encoder.
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).decode("utf-8", errors="replace")
+    model_dump = getattr(obj, "model_dump", None)
+    if callable(model_dump):
+        return model_dump(mode="json")
+    # Same contract as ``json.dumps``: unknown types are an error, not a
+    # silently stringified value.
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, RawJson):
+        return orjson.Fragment(obj.data)
+    return _common_default(obj)
+
+
+def _stdlib_default(obj: Any) -> Any:
+    if isinstance(obj, RawJson):
+        return json.loads(obj.data)
+    if isinstance(obj, (_dt.datetime, _dt.date, _dt.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    return _common_default(obj)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(
+        obj, default=_stdlib_default, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+        except (orjson.JSONEncodeError, TypeError):
+            # orjson rejects ints beyond 64 bits and a few exotic types the
+            # stdlib encoder accepts; keep the fast path lossless.
+            pass
+    return _stdlib_dumps(obj)
+
+
+def _has_wide_int(data: bytes | bytearray | str) -> bool:
+    """True when ``data`` may hold an integer literal orjson cannot keep exact."""
+    pattern = _WIDE_INT_STR if isinstance(data, str) else _WIDE_INT_BYTES
+    return any(not -(2**63) <= int(match) < 2**64 for match in pattern.findall(data))
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decode a JSON document.
+
+    Documents with integers wider than 64 bits are decoded with the stdlib,
+    which keeps them exact, so the fast path is lossless like ``dumps``.
+    """
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    if orjson is not None and not _has_wide_int(data):
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def register_psycopg_json(context: Any) -> None:
+    """Route psycopg JSON/JSONB load and dump through this codec on ``context``.
+
+    ``context`` is a connection (or cursor); adapters registered there apply
+    to every ``Json(...)`` parameter and JSONB result on it.
+    """
+    from psycopg.types.json import set_json_dumps, set_json_loads
+
+    set_json_loads(loads, context)
+    set_json_dumps(dumps, context)
+
+
+__all__ = [
+    "HAS_ORJSON",
+    "RawJson",
+    "dumps",
+    "fast_json_enabled",
+    "loads",
+    "register_psycopg_json",
+]
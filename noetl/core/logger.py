@@ -1,10 +1,15 @@
 from datetime import datetime
+import atexit
 import os
+import queue
 import re
 import sys
 import json
 import logging
+import logging.handlers
+import threading
 import time
+import weakref
 from typing import Dict, TYPE_CHECKING
 import traceback
 
@@ -161,23 +166,139 @@ def _truncate(text: str, max_len: int = _LOG_VALUE_MAX_CHARS) -> str:
     return text[: max_len - 3] + "..."
 
 
+def _sanitize_truncated(text: str, max_len: int = _LOG_VALUE_MAX_CHARS) -> str:
+    """Truncate ``text`` first, then sanitize only the part that is kept.
+
+    A redacted prefix collapses to the redaction marker, so a long token
+    cut by the truncation is still hidden.
+    """
+    if len(text) <= max_len:
+        return str(sanitize_sensitive_data(text))
+    head = text[: max_len - 3]
+    sanitized = sanitize_sensitive_data(head)
+    if sanitized != head:
+        return str(sanitized)
+    return head + "..."
+
+
 def _safe_message(record: logging.LogRecord) -> str:
     try:
         rendered = record.getMessage()
     except Exception:
         rendered = str(record.msg)
-    sanitized = sanitize_sensitive_data(rendered)
-    return _truncate(str(sanitized))
+    return _sanitize_truncated(rendered)
 
 
 def stringify_extra(value):
     if isinstance(value, (list, dict, tuple, set)):
         return sanitize_for_logging(value, max_length=_LOG_VALUE_MAX_CHARS)
     if isinstance(value, str):
-        return _truncate(str(sanitize_sensitive_data(value)))
+        return _sanitize_truncated(value)
     return value
 
 
+# Records are formatted, sanitized and written on one listener thread so the
+# event loop never blocks on stdout or the VictoriaLogs handler.  Disable
+# with NOETL_LOG_QUEUE=false to log synchronously (e.g. when debugging
+# interleaving with print output).
+_LOG_QUEUE_ENABLED = os.getenv("NOETL_LOG_QUEUE", "true").strip().lower() in {"1", "true", "yes", "on"}
+_MUTABLE_LOG_ARGS = (dict, list, set, bytearray)
+
+_log_queue_lock = threading.Lock()
+_log_queue = None
+_log_listener = None
+_queued_handlers: "weakref.WeakSet[QueuedLogHandler]" = weakref.WeakSet()
+
+
+class _DispatchingQueueListener(logging.handlers.QueueListener):
+    """Hand each queued ``(handler, record)`` pair to its own handler."""
+
+    def handle(self, item):
+        target, record = item
+        if target is None:
+            # flush_logs() marker
+            record.set()
+            return
+        if record.levelno >= target.level:
+            target.handle(record)
+
+
+def _start_log_listener() -> queue.SimpleQueue:
+    global _log_queue, _log_listener
+    with _log_queue_lock:
+        if _log_queue is None:
+            _log_queue = queue.SimpleQueue()
+            _log_listener = _DispatchingQueueListener(_log_queue)
+            _log_listener.start()
+        return _log_queue
+
+
+def _stop_log_listener() -> None:
+    global _log_queue, _log_listener
+    with _log_queue_lock:
+        listener, _log_listener, _log_queue = _log_listener, None, None
+    if listener is not None:
+        # Drains queued records; logging.shutdown() flushes the targets.
+        listener.stop()
+
+
+def _restart_log_listener_after_fork() -> None:
+    # The listener thread does not survive fork(); give the child its own.
+    global _log_queue, _log_listener, _log_queue_lock
+    _log_queue_lock = threading.Lock()
+    _log_queue = None
+    _log_listener = None
+    handlers = list(_queued_handlers)
+    if handlers:
+        log_queue = _start_log_listener()
+        for handler in handlers:
+            handler.queue = log_queue
+
+
+atexit.register(_stop_log_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_log_listener_after_fork)
+
+
+class QueuedLogHandler(logging.handlers.QueueHandler):
+    """Queue records for ``target`` on the shared log listener thread."""
+
+    def __init__(self, target: logging.Handler):
+        super().__init__(_start_log_listener())
+        self.target = target
+        self.setLevel(target.level)
+        _queued_handlers.add(self)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Lazy %-style args are rendered on the listener thread, except
+        # mutable containers, which are snapshotted now so the message shows
+        # their value at call time.
+        args = record.args
+        if args and (
+            isinstance(args, _MUTABLE_LOG_ARGS)
+            or any(isinstance(arg, _MUTABLE_LOG_ARGS) for arg in args)
+        ):
+            try:
+                record.msg = record.getMessage()
+                record.args = None
+            except Exception:
+                pass
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put_nowait((self.target, record))
+
+
+def flush_logs(timeout: float = 5.0) -> bool:
+    """Block until records queued so far have been written."""
+    log_queue = _log_queue
+    if log_queue is None:
+        return True
+    done = threading.Event()
+    log_queue.put_nowait((None, done))
+    return done.wait(timeout)
+
+
 class CustomFormatter(logging.Formatter):
 
     def __init__(self, fmt="%(message)s", include_location=False, highlight_scope=True):
@@ -343,7 +464,7 @@ def setup_logger(name: str, include_location=False, use_json=False):
     configured_level = os.getenv("NOETL_LOG_LEVEL", os.getenv("LOG_LEVEL", "INFO")).upper()
     log_level = getattr(logging, configured_level, logging.INFO)
     # use_json = "json"
-    if not any(isinstance(h, logging.StreamHandler) for h in logger.handlers):
+    if not any(isinstance(h, (logging.StreamHandler, QueuedLogHandler)) for h in logger.handlers):
         if use_json == "victorialogs":
             stream_handler = VictoriaLogsHandler(
                 url=os.getenv("NOETL_VICTORIALOGS_URL", "http://localhost:9428"),
@@ -361,6 +482,8 @@ def setup_logger(name: str, include_location=False, use_json=False):
                 stream_handler.setFormatter(JSONFormatter())
             else:
                 stream_handler.setFormatter(CustomFormatter(include_location=include_location))
+        if _LOG_QUEUE_ENABLED:
+            stream_handler = QueuedLogHandler(stream_handler)
         logger.addHandler(stream_handler)
     logger.setLevel(log_level)
     logger.propagate = False
@@ -17,6 +17,7 @@ import json
 import math
 import re
 import time
+from collections import deque
 from contextlib import suppress
 from typing import Any, Optional, Callable, Awaitable
 import nats
@@ -105,6 +106,21 @@ class NATSCommandPublisher:
             raise RuntimeError("Not connected to NATS")
         await self._js.publish(subject or self.subject, payload)
 
+    async def _publish_affinity(self, payload: bytes, worker_id: str) -> None:
+        """Fire-and-forget copy of a command notification to one worker.
+
+        Core NATS, no persistence: if the worker is gone the JetStream
+        copy still reaches the pool once the preference window closes.
+        """
+        from noetl.core.runtime.pool_routing import affinity_subject
+
+        try:
+            if self._nc is None:
+                raise RuntimeError("Not connected to NATS")
+            await self._nc.publish(affinity_subject(self.subject, worker_id), payload)
+        except Exception as exc:
+            logger.debug("Affinity publish to worker %s skipped: %s", worker_id, exc)
+
     async def connect(self):
         """Connect to NATS and setup JetStream."""
         try:
@@ -162,6 +178,7 @@ class NATSCommandPublisher:
         server_url: str,
         tool_kind: Optional[str] = None,
         playbook_path: Optional[str] = None,
+        preferred_worker: Optional[str] = None,
     ):
         """
         Publish command notification to NATS.
@@ -188,6 +205,11 @@ class NATSCommandPublisher:
         system worker pool claim ``system/outbox_publisher`` commands
         even though they use the generic ``tool: http`` /
         ``tool: nats`` kinds.  See noetl/ai-meta#46 Phase 2.a.2.
+
+        ``preferred_worker`` is the worker that produced the command's
+        large inputs.  It gets a best-effort core-NATS copy on its
+        :func:`~noetl.core.runtime.pool_routing.affinity_subject` so it
+        can claim inside its locality preference window.
         """
         await self.ensure_connected()
 
@@ -208,6 +230,9 @@ class NATSCommandPublisher:
         }
         payload = json.dumps(message).encode()
 
+        if preferred_worker:
+            await self._publish_affinity(payload, preferred_worker)
+
         try:
             await self._publish_payload(payload, subject=subject)
             logger.debug(f"Published command notification: event_id={event_id} command_id={command_id}")
@@ -326,6 +351,160 @@ class NATSEventPublisher(NATSCommandPublisher):
             await self._publish_event_payload(subject, payload)
 
 
+class _Heartbeat:
+    __slots__ = ("msg", "interval", "active")
+
+    def __init__(self, msg, interval: float):
+        self.msg = msg
+        self.interval = interval
+        self.active = interval > 0
+
+
+class _HeartbeatWheel:
+    """
+    Extend the ack deadline of every in-flight message from a single timer.
+
+    Registered messages are filed into ``tick_seconds`` slots by their next
+    due time.  One task sleeps until the earliest slot, sends ``in_progress``
+    for every message due in it and files them again one interval later, so
+    the number of timers does not grow with the number of in-flight messages.
+    A heartbeat may go out up to one tick late, which is well inside the
+    ack-wait budget.
+    """
+
+    def __init__(self, tick_seconds: float = 1.0):
+        self._tick = max(0.001, float(tick_seconds))
+        self._slots: dict[int, list[_Heartbeat]] = {}
+        self._next_slot: Optional[int] = None
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._active = 0
+
+    def __len__(self) -> int:
+        return self._active
+
+    def add(self, msg, interval_seconds: float) -> _Heartbeat:
+        entry = _Heartbeat(msg, float(interval_seconds))
+        if not entry.active:
+            return entry
+        self._active += 1
+        self._file(entry, asyncio.get_running_loop().time())
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return entry
+
+    def discard(self, entry: _Heartbeat) -> None:
+        # Lazy removal: the entry is dropped when its slot comes due.
+        if entry.active:
+            entry.active = False
+            self._active -= 1
+
+    def _file(self, entry: _Heartbeat, now: float) -> None:
+        slot = math.ceil((now + entry.interval) / self._tick)
+        self._slots.setdefault(slot, []).append(entry)
+        if self._next_slot is None or slot < self._next_slot:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._slots:
+                self._next_slot = None
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            slot = min(self._slots)
+            self._next_slot = slot
+            delay = slot * self._tick - loop.time()
+            if delay > 0:
+                self._wakeup.clear()
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                continue
+            for entry in self._slots.pop(slot):
+                if not entry.active:
+                    continue
+                try:
+                    await entry.msg.in_progress()
+                except Exception:
+                    logger.warning("Failed to send in-progress ack for message", exc_info=True)
+                    self.discard(entry)
+                    continue
+                if entry.active:
+                    self._file(entry, loop.time())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+class _AckPipeline:
+    """
+    Write message acks, naks and terms from one task.
+
+    ``submit`` queues the action and returns at once; the writer publishes
+    everything queued since its last pass back to back.  Callers never wait
+    on their ack, and the observer hears about each action once it is written.
+    """
+
+    def __init__(self, observer: Callable[[str, Optional[float]], None]):
+        self._observer = observer
+        self._pending: deque = deque()
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(self, msg, action: str, delay_seconds: Optional[float] = None) -> None:
+        self._pending.append((msg, action, delay_seconds))
+        self._idle.clear()
+        self._ready.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    @staticmethod
+    def _send(msg, action: str, delay_seconds: Optional[float]) -> Awaitable[None]:
+        if action == "nak":
+            if delay_seconds is not None and delay_seconds > 0:
+                return msg.nak(delay=delay_seconds)
+            return msg.nak()
+        if action == "term":
+            return msg.term()
+        return msg.ack()
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                self._idle.set()
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            msg, action, delay_seconds = self._pending.popleft()
+            try:
+                await self._send(msg, action, delay_seconds)
+            except Exception as ack_error:
+                logger.warning("Failed to send %s for message: %s", action, ack_error)
+                continue
+            self._observer(action, delay_seconds)
+
+    async def close(self) -> None:
+        """Flush queued actions, then stop the writer."""
+        if self._task is None:
+            return
+        if not self._task.done():
+            await self._idle.wait()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+
 class NATSCommandSubscriber:
     """
     Subscriber for command notifications.
@@ -334,7 +513,10 @@ class NATSCommandSubscriber:
 
     Performance optimizations:
     - Process in background task (don't block fetch loop)
-    - Ack only after callback outcome to preserve queue-based backpressure/retry
+    - Fetch as many messages as there are free in-flight permits
+    - One heartbeat wheel extends the ack deadline of every in-flight message
+    - Ack only after callback outcome to preserve queue-based backpressure/retry;
+      acks are queued to a single writer rather than awaited per message
     - Exactly-once handled by database advisory locks
     """
 
@@ -388,8 +570,14 @@ class NATSCommandSubscriber:
         self._nc: Optional[NATSClient] = None
         self._js: Optional[JetStreamContext] = None
         self._subscription = None
+        self._affinity_subscription = None
         self._background_tasks: set = set()
         self._inflight_semaphore = asyncio.Semaphore(self.max_inflight)
+        # Permits the fetch loop holds for an outstanding long-poll fetch that
+        # no message owns yet.  Affinity deliveries may borrow them.
+        self._fetch_reserved = 0
+        self._heartbeats = _HeartbeatWheel(tick_seconds=min(1.0, self.callback_progress_interval_seconds / 8.0))
+        self._acks = _AckPipeline(self._record_message_action)
         self._throttle_hits = 0
         self._fetch_recovery_last_attempt = 0.0
 
@@ -438,36 +626,6 @@ class NATSCommandSubscriber:
         minimum_ack_wait_seconds = float(ws.command_timeout_seconds) + float(ws.nats_ack_wait_buffer_seconds)
         return max(float(ws.nats_ack_wait_seconds), minimum_ack_wait_seconds)
 
-    async def _keep_message_in_progress(
-        self,
-        msg,
-        stop_event: asyncio.Event,
-        interval_seconds: Optional[float] = None,
-    ) -> None:
-        """
-        Periodically extend the JetStream ack deadline while callback work is active.
-
-        This prevents long-running commands from being redelivered mid-flight.
-        """
-        interval = float(
-            interval_seconds
-            if interval_seconds is not None
-            else self.callback_progress_interval_seconds
-        )
-        if interval <= 0:
-            return
-
-        while True:
-            try:
-                await asyncio.wait_for(stop_event.wait(), timeout=interval)
-                return
-            except asyncio.TimeoutError:
-                try:
-                    await msg.in_progress()
-                except Exception:
-                    logger.warning("Failed to send in-progress ack for message", exc_info=True)
-                    return
-
     async def _run_callback_with_message_heartbeat(
         self,
         callback: Callable[[dict], Awaitable[Optional[str]]],
@@ -477,14 +635,13 @@ class NATSCommandSubscriber:
         """
         Run the subscriber callback with JetStream heartbeat extension and a hard timeout.
 
-        The hard timeout is intentionally much larger than the nominal command timeout so
-        long-running but healthy callbacks keep their lease, while truly stuck callbacks
-        still get cancelled and released.
+        The message is registered with the subscriber's heartbeat wheel for the
+        duration of the callback, so long-running commands are not redelivered
+        mid-flight.  The hard timeout is intentionally much larger than the
+        nominal command timeout so long-running but healthy callbacks keep their
+        lease, while truly stuck callbacks still get cancelled and released.
         """
-        progress_stop = asyncio.Event()
-        progress_task = asyncio.create_task(
-            self._keep_message_in_progress(msg, progress_stop)
-        )
+        heartbeat = self._heartbeats.add(msg, self.callback_progress_interval_seconds)
         callback_task = asyncio.create_task(callback(data))
         try:
             return await asyncio.wait_for(
@@ -501,10 +658,30 @@ class NATSCommandSubscriber:
                 await asyncio.wait_for(callback_task, timeout=5.0)
             raise
         finally:
-            progress_stop.set()
-            progress_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await progress_task
+            self._heartbeats.discard(heartbeat)
+
+    async def _acquire_fetch_permits(self) -> int:
+        """Wait for one in-flight permit, then take every other permit that is free."""
+        await self._inflight_semaphore.acquire()
+        permits = 1
+        # acquire() on an unlocked semaphore returns without suspending.
+        while not self._inflight_semaphore.locked():
+            await self._inflight_semaphore.acquire()
+            permits += 1
+        return permits
+
+    def _release_permits(self, count: int) -> None:
+        for _ in range(count):
+            self._inflight_semaphore.release()
+
+    def _take_fetch_reservation(self) -> int:
+        """Return the permits still reserved for the outstanding fetch and clear them."""
+        reserved, self._fetch_reserved = self._fetch_reserved, 0
+        return reserved
+
+    def _send_message_action(self, msg, action: str, delay_seconds: Optional[float] = None) -> None:
+        """Queue the ack/nak/term for ``msg`` without waiting for it to be written."""
+        self._acks.submit(msg, action, delay_seconds)
 
     @staticmethod
     def _is_not_found_error(exc: Exception) -> bool:
@@ -739,19 +916,7 @@ class NATSCommandSubscriber:
             except Exception as e:
                 logger.error(f"Error processing message: {e}", exc_info=True)
             finally:
-                try:
-                    if callback_action == "nak":
-                        if callback_nak_delay_seconds is not None and callback_nak_delay_seconds > 0:
-                            await msg.nak(delay=callback_nak_delay_seconds)
-                        else:
-                            await msg.nak()
-                    elif callback_action == "term":
-                        await msg.term()
-                    else:
-                        await msg.ack()
-                    self._record_message_action(callback_action, callback_nak_delay_seconds)
-                except Exception as ack_error:
-                    logger.warning("Failed to send %s for message: %s", callback_action, ack_error)
+                self._send_message_action(msg, callback_action, callback_nak_delay_seconds)
                 self._inflight_semaphore.release()
 
         try:
@@ -811,23 +976,30 @@ class NATSCommandSubscriber:
                                 self.max_inflight,
                             )
 
-                    await self._inflight_semaphore.acquire()
+                    permits = await self._acquire_fetch_permits()
+                    self._fetch_reserved = permits
 
                     # Long-poll: blocks until message arrives (not polling!)
+                    # - batch: one message per free in-flight permit
                     # - timeout=30: max wait time (not polling interval)
                     # - heartbeat=5: keeps connection alive during wait
-                    # - Returns IMMEDIATELY when message is available
+                    # - Returns IMMEDIATELY with whatever is available
                     messages = await self._subscription.fetch(
-                        batch=1,
+                        batch=permits,
                         timeout=self.fetch_timeout,
                         heartbeat=self.fetch_heartbeat
                     )
-
-                    if not messages:
-                        self._inflight_semaphore.release()
-                        continue
-
-                    for msg in messages:
+                    # Each fetched message now owns one permit; hand back the
+                    # rest.  Affinity deliveries may have borrowed permits
+                    # while the fetch was parked: messages beyond what is
+                    # left go straight back to the stream.
+                    reserved = self._take_fetch_reservation()
+                    self._release_permits(max(0, reserved - len(messages)))
+
+                    for index, msg in enumerate(messages):
+                        if index >= reserved:
+                            self._send_message_action(msg, "nak")
+                            continue
                         try:
                             data = self._message_decoder(bytes(msg.data))
                             # Process in background and ack/nak based on callback result.
@@ -836,18 +1008,14 @@ class NATSCommandSubscriber:
                         except Exception as e:
                             self._inflight_semaphore.release()
                             logger.error(f"Error handling message: {e}")
-                            try:
-                                await msg.nak()
-                                self._record_message_action("nak", None)
-                            except:
-                                pass
+                            self._send_message_action(msg, "nak")
 
                 except asyncio.TimeoutError:
-                    self._inflight_semaphore.release()
+                    self._release_permits(self._take_fetch_reservation())
                     # No messages in 30s, reconnect fetch (normal)
                     continue
                 except Exception as e:
-                    self._inflight_semaphore.release()
+                    self._release_permits(self._take_fetch_reservation())
                     logger.error(f"Error fetching messages: {e}")
                     try:
                         await self._recover_fetch_subscription()
@@ -863,11 +1031,62 @@ class NATSCommandSubscriber:
             logger.error(f"Subscribe failed: {e}", exc_info=True)
             raise
 
+    async def subscribe_affinity(
+        self,
+        worker_id: str,
+        callback: Callable[[dict], Awaitable[Optional[str]]],
+    ) -> None:
+        """Receive command notifications addressed to ``worker_id`` directly.
+
+        The server sends these core-NATS copies to the worker that produced
+        a command's large inputs (see :func:`affinity_subject`).  A copy
+        takes a free in-flight permit, or one the fetch loop has reserved
+        for its parked long-poll, so an idle worker still runs it.  There is
+        nothing to ack: when every permit is owned by a running command the
+        copy is dropped and the JetStream copy is claimed through the normal
+        fetch loop instead.
+        """
+        if not self._nc:
+            raise RuntimeError("Not connected to NATS")
+        from noetl.core.runtime.pool_routing import affinity_subject
+
+        async def run(data: dict) -> None:
+            try:
+                await asyncio.wait_for(callback(data), timeout=self.callback_hard_timeout_seconds)
+            except Exception as exc:
+                logger.warning("Affinity command callback failed: %s", exc)
+            finally:
+                self._inflight_semaphore.release()
+
+        async def on_message(msg) -> None:
+            try:
+                data = self._message_decoder(bytes(msg.data))
+            except Exception as exc:
+                logger.debug("Dropping undecodable affinity notification: %s", exc)
+                return
+            if not self._inflight_semaphore.locked():
+                await self._inflight_semaphore.acquire()
+            elif self._fetch_reserved > 0:
+                # Borrow a permit the parked fetch holds but no message owns.
+                self._fetch_reserved -= 1
+            else:
+                return
+            task = asyncio.create_task(run(data))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+        self._affinity_subscription = await self._nc.subscribe(affinity_subject(self.subject, worker_id), cb=on_message)
+        logger.info("Subscribed to affinity notifications for worker %s", worker_id)
+
     async def close(self):
         """Close NATS connection."""
         # Wait for background tasks to complete
         if self._background_tasks:
             await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await self._acks.close()
+        await self._heartbeats.close()
+        if self._affinity_subscription:
+            await self._affinity_subscription.unsubscribe()
         if self._subscription:
             await self._subscription.unsubscribe()
         if self._nc:
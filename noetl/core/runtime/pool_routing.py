@@ -176,6 +176,19 @@ def route_subject(
     return f"{base_subject}.{pool}.{execution_id}"
 
 
+def affinity_subject(base_subject: str, worker_id: str) -> str:
+    """Core-NATS subject that reaches one worker directly.
+
+    Used to nudge the worker holding a command's large inputs (see
+    ``locality_preference`` in command meta) while the JetStream copy
+    on :func:`route_subject` stays the durable delivery.  The subject
+    sits beside ``<base_subject>`` rather than under it so the command
+    stream's ``<base_subject>.>`` wildcard never captures it.
+    """
+    token = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in str(worker_id)) or "unknown"
+    return f"{base_subject}-affinity.{token}"
+
+
 def command_stream_subjects(base_subject: str) -> list[str]:
     """Return the JetStream subject list a command stream must accept.
 
@@ -199,6 +212,7 @@ __all__ = [
     "POOL_PATH_PREFIX_MAP",
     "DEFAULT_POOL_SEGMENT",
     "ROUTING_ENABLED_ENV",
+    "affinity_subject",
     "command_stream_subjects",
     "is_routing_enabled",
     "pool_segment_for_kind",
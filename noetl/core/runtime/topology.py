@@ -11,6 +11,17 @@ from noetl.core.resource_locator import ResourceLocatorError, build_noetl_locato
 
 LOCALITY_DISTANCES = ("node", "zone", "region", "cluster", "any")
 
+# Result refs at least this large carry the producing worker's locality so
+# the command consuming them can be steered back to that worker.
+LOCALITY_HINT_MIN_BYTES = int(os.getenv("NOETL_LOCALITY_HINT_MIN_BYTES", str(1024 * 1024)))
+# How long the producing worker has the claim to itself; 0 disables it.
+LOCALITY_PREFERENCE_SECONDS = float(os.getenv("NOETL_LOCALITY_PREFERENCE_SECONDS", "0.5"))
+# Bound on nodes visited when scanning a command context for result refs.
+_LOCALITY_SCAN_MAX_NODES = 4096
+_LOCALITY_SCAN_MAX_DEPTH = 8
+
+_local_worker_id: str | None = None
+
 
 @dataclass(frozen=True)
 class WorkerLocatorParts:
@@ -167,6 +178,89 @@ def placement_evaluation(
     }
 
 
+def set_local_worker_id(worker_id: str | None) -> None:
+    """Record the id of the worker running in this process for producer hints."""
+    global _local_worker_id
+    _local_worker_id = str(worker_id) if worker_id else None
+
+
+def producer_locality(env: Mapping[str, str] | None = None) -> dict[str, str] | None:
+    """Return this worker's locality plus ``worker_id``; ``None`` outside a worker."""
+    if not _local_worker_id:
+        return None
+    return {**worker_locality_from_env(env), "worker_id": _local_worker_id}
+
+
+def locality_hint_from_refs(value: Any, *, min_bytes: int | None = None) -> dict[str, Any] | None:
+    """Return the producer locality holding most of the ref bytes in ``value``.
+
+    Walks dicts and lists (bounded) for result refs that carry a producer
+    ``locality``, sums their ``meta.bytes`` per producing worker and returns
+    that worker's locality with the total as ``bytes`` when it reaches
+    ``min_bytes``.
+    """
+    threshold = LOCALITY_HINT_MIN_BYTES if min_bytes is None else int(min_bytes)
+    totals: dict[str, int] = {}
+    localities: dict[str, Mapping[str, Any]] = {}
+    stack: list[tuple[Any, int]] = [(value, 0)]
+    visited = 0
+    while stack and visited < _LOCALITY_SCAN_MAX_NODES:
+        node, depth = stack.pop()
+        visited += 1
+        if isinstance(node, Mapping):
+            locality = node.get("locality")
+            if node.get("kind") in ("result_ref", "temp_ref") and isinstance(locality, Mapping):
+                worker_id = str(locality.get("worker_id") or "")
+                if worker_id:
+                    meta = node.get("meta") if isinstance(node.get("meta"), Mapping) else {}
+                    try:
+                        size = int(meta.get("bytes") or 0)
+                    except (TypeError, ValueError):
+                        size = 0
+                    totals[worker_id] = totals.get(worker_id, 0) + size
+                    localities[worker_id] = locality
+                continue
+            children = node.values()
+        elif isinstance(node, (list, tuple)):
+            children = node
+        else:
+            continue
+        if depth < _LOCALITY_SCAN_MAX_DEPTH:
+            stack.extend((child, depth + 1) for child in children if isinstance(child, (Mapping, list, tuple)))
+
+    if not totals:
+        return None
+    worker_id = max(totals, key=totals.__getitem__)
+    if totals[worker_id] < threshold:
+        return None
+    return {**localities[worker_id], "worker_id": worker_id, "bytes": totals[worker_id]}
+
+
+def locality_preference_wait(
+    preference: Mapping[str, Any] | None,
+    *,
+    worker_id: str,
+    command_age_seconds: float,
+    window_seconds: float | None = None,
+) -> float:
+    """Seconds ``worker_id`` must wait before claiming a command with ``preference``.
+
+    0 when there is no preference, the claimant is the preferred worker, or
+    the preference window since the command was issued has elapsed.
+    """
+    if not isinstance(preference, Mapping):
+        return 0.0
+    preferred = str(preference.get("worker_id") or "")
+    if not preferred or preferred == worker_id:
+        return 0.0
+    if window_seconds is None:
+        try:
+            window_seconds = float(preference.get("window_seconds", LOCALITY_PREFERENCE_SECONDS))
+        except (TypeError, ValueError):
+            window_seconds = LOCALITY_PREFERENCE_SECONDS
+    return max(0.0, float(window_seconds) - max(0.0, float(command_age_seconds)))
+
+
 def _same_non_empty(source: Mapping[str, Any], target: Mapping[str, Any], key: str) -> bool:
     source_value = str(source.get(key) or "").strip()
     target_value = str(target.get(key) or "").strip()
@@ -175,10 +269,16 @@ def _same_non_empty(source: Mapping[str, Any], target: Mapping[str, Any], key: s
 
 __all__ = [
     "LOCALITY_DISTANCES",
+    "LOCALITY_HINT_MIN_BYTES",
+    "LOCALITY_PREFERENCE_SECONDS",
     "locality_distance",
+    "locality_hint_from_refs",
+    "locality_preference_wait",
     "locality_within",
     "placement_evaluation",
     "parse_worker_locator",
+    "producer_locality",
+    "set_local_worker_id",
     "WorkerLocatorParts",
     "worker_locality_from_env",
     "worker_locator",
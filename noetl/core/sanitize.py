@@ -12,8 +12,9 @@ Usage:
     safe_data = sanitize_sensitive_data(data)
 """
 
+import functools
 import re
-from typing import Any, Dict, Iterable, List, Optional, Set, Union
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
 # Keys that indicate sensitive data (case-insensitive matching)
 SENSITIVE_KEYS: Set[str] = {
@@ -142,6 +143,118 @@ RESPONSE_SENSITIVE_KEYS: Set[str] = {
 # Default redaction placeholder
 REDACTED = "[REDACTED]"
 
+# Single-pass equivalents of ``SENSITIVE_PATTERNS`` / ``SECRET_VALUE_PATTERNS``.
+# The per-pattern lists above stay the documented source of truth; these
+# factor them into one alternation (anchored shapes under one ``^``, the
+# delimiter-prefixed provider prefixes under one lookbehind) so each leaf
+# is scanned once instead of once per pattern.  ``tests/core`` asserts the
+# two stay equivalent.
+_SENSITIVE_VALUE_RE = re.compile(
+    r"^(?:"
+    r"(?i:bearer\s+[A-Za-z0-9\-_\.])"
+    r"|(?i:basic\s+[A-Za-z0-9+/=])"
+    r"|eyJ[A-Za-z0-9\-_]+\.eyJ[A-Za-z0-9\-_]+\.[A-Za-z0-9\-_]+$"
+    r"|[A-Za-z0-9]{32,}$"
+    r"|[A-Za-z0-9/+=]{40}$"
+    r")"
+    r"|-----BEGIN (?:RSA |EC |DSA |OPENSSH )?PRIVATE KEY-----"
+)
+
+_SECRET_VALUE_RE = re.compile(
+    r"^(?:"
+    r"(?i:bearer\s+\S)"
+    r"|(?i:basic\s+[A-Za-z0-9+/=])"
+    r"|eyJ[A-Za-z0-9\-_]+\.eyJ[A-Za-z0-9\-_]+\.[A-Za-z0-9\-_]+$"
+    r")"
+    r"|(?:^|(?<=[\"':\s]))(?:"
+    r"sk-[A-Za-z0-9][A-Za-z0-9_\-]{12,}"  # also covers sk-ant-
+    r"|AIza[0-9A-Za-z_\-]{20,}"
+    r"|ya29\.[0-9A-Za-z_\-]"
+    r"|gh[pousr]_[0-9A-Za-z_]{20,}"
+    r"|github_pat_[0-9A-Za-z_]{20,}"
+    r"|xox[baprs]-[0-9A-Za-z\-]{20,}"
+    r")"
+    r"|-----BEGIN (?:RSA |EC |DSA |OPENSSH )?PRIVATE KEY-----"
+    r"|[?&](?i:key|api[_-]?key|token|access[_-]?token|id[_-]?token|"
+    r"refresh[_-]?token|client[_-]?secret|signature)=[^&\s]"
+)
+
+# No value-shape pattern (or URL userinfo) can match a string shorter than
+# this (``ya29.x`` / ``?key=x``); shorter leaves only need the exact
+# ``secret_values`` lookup.
+_MIN_SECRET_SHAPE_LENGTH = 6
+
+# Key classification is memoized: event pages and result bodies repeat the
+# same few hundred key names across thousands of rows.
+_KEY_CACHE_SIZE = 4096
+
+# Compiled matchers for caller-supplied ``secret_values`` sets, keyed by the
+# frozen set; the keychain values for an execution repeat across requests.
+_SECRET_MATCHER_CACHE_SIZE = 64
+
+
+def _literal_alternation(words: Iterable[str]) -> str:
+    """Build a prefix-factored regex matching any of ``words`` as a substring.
+
+    Literals sharing a prefix share one branch, so a search tests each text
+    position against at most one character per trie level instead of every
+    word.  A word that is a prefix of another already proves a match, so the
+    longer word's tail is dropped.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _emit(node: Dict[str, dict]) -> str:
+        parts: List[str] = []
+        while "" not in node:
+            if len(node) == 1:
+                ((char, node),) = node.items()
+                parts.append(re.escape(char))
+                continue
+            branches = [re.escape(char) + _emit(child) for char, child in sorted(node.items())]
+            parts.append("(?:" + "|".join(branches) + ")")
+            break
+        return "".join(parts)
+
+    return _emit(trie) if trie else ""
+
+
+_SENSITIVE_KEY_RE = re.compile(_literal_alternation(SENSITIVE_KEYS))
+_RESPONSE_SENSITIVE_KEY_RE = re.compile(
+    _literal_alternation(
+        SENSITIVE_KEYS | {key.replace("-", "_") for key in RESPONSE_SENSITIVE_KEYS}
+    )
+)
+
+
+@functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
+def _classify_sensitive_key(key: str) -> bool:
+    return _SENSITIVE_KEY_RE.search(key.lower().replace("-", "_")) is not None
+
+
+@functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
+def _classify_response_key(key_text: str) -> Tuple[str, bool]:
+    """Return ``(normalized_key, partial_match_sensitive)`` for a response key."""
+    key_normalized = key_text.lower().replace("-", "_")
+    return key_normalized, _RESPONSE_SENSITIVE_KEY_RE.search(key_normalized) is not None
+
+
+@functools.lru_cache(maxsize=_SECRET_MATCHER_CACHE_SIZE)
+def _secret_values_matcher(secret_values: FrozenSet[str]) -> Optional[re.Pattern]:
+    """Compile the embedded-match regex for caller-supplied secret values.
+
+    Only values of 8+ characters are matched as substrings (shorter ones
+    would hit ordinary text); every value still matches exactly.
+    """
+    embedded = [secret for secret in secret_values if len(secret) >= 8]
+    if not embedded:
+        return None
+    return re.compile(_literal_alternation(embedded))
+
 
 def _is_sensitive_key(key: str) -> bool:
     """
@@ -155,18 +268,7 @@ def _is_sensitive_key(key: str) -> bool:
     """
     if not isinstance(key, str):
         return False
-    key_lower = key.lower().replace("-", "_")
-
-    # Direct match
-    if key_lower in SENSITIVE_KEYS:
-        return True
-
-    # Partial match (key contains sensitive term)
-    for sensitive in SENSITIVE_KEYS:
-        if sensitive in key_lower:
-            return True
-
-    return False
+    return _classify_sensitive_key(key)
 
 
 def _is_sensitive_value(value: str) -> bool:
@@ -181,12 +283,7 @@ def _is_sensitive_value(value: str) -> bool:
     """
     if not isinstance(value, str):
         return False
-
-    for pattern in SENSITIVE_PATTERNS:
-        if pattern.search(value):
-            return True
-
-    return False
+    return _SENSITIVE_VALUE_RE.search(value) is not None
 
 
 def sanitize_sensitive_data(
@@ -227,6 +324,7 @@ def redact_keychain_values(
     secret_values: Optional[Iterable[str]] = None,
     redaction: str = REDACTED,
     max_depth: int = 20,
+    drop_keys: Optional[Set[str]] = None,
 ) -> Any:
     """
     Redact secret-bearing values from API response payloads.
@@ -240,23 +338,47 @@ def redact_keychain_values(
     - value-shape matching for bearer headers, JWTs, common provider key
       prefixes, private keys, and URLs carrying secret query parameters;
     - optional exact or embedded matches for caller-provided secret values.
+
+    Dict entries whose key is in ``drop_keys`` are removed at any depth in
+    the same walk (producer scrub uses this to strip keychain namespaces).
     """
     normalized_keys = {str(key).lower().replace("-", "_") for key in (additional_keys or set())}
-    normalized_values = {
+    normalized_values = frozenset(
         str(value)
         for value in (secret_values or set())
         if isinstance(value, str) and value
-    }
+    )
     return _redact_response_recursive(
         data,
         normalized_keys,
         normalized_values,
+        _secret_values_matcher(normalized_values),
         redaction,
         max_depth,
         0,
+        frozenset(drop_keys or ()),
     )
 
 
+# Same value as credential_refs.KEYCHAIN_MANIFEST_KEY, inlined to avoid the
+# circular import.  The manifest keeps its keys under drop_keys.
+_KEYCHAIN_MANIFEST_KEY = "_keychain_manifest"
+
+
+def _drop_keys_recursive(data: Any, drop_keys: FrozenSet[str]) -> Any:
+    if isinstance(data, dict):
+        return {
+            k: v if str(k) == _KEYCHAIN_MANIFEST_KEY else _drop_keys_recursive(v, drop_keys)
+            for k, v in data.items()
+            if str(k) not in drop_keys
+        }
+    if isinstance(data, list):
+        return [_drop_keys_recursive(item, drop_keys) for item in data]
+    if isinstance(data, tuple):
+        return tuple(_drop_keys_recursive(item, drop_keys) for item in data)
+    return data
+
+
 def _looks_like_template_or_code(value: str) -> bool:
     """Best-effort detection of strings that are templates or source code
     rather than resolved leaf values.
@@ -304,46 +426,44 @@ def _looks_like_template_or_code(value: str) -> bool:
 
 
 def _is_response_secret_value(value: str, secret_values: Set[str]) -> bool:
+    return _matches_response_secret(
+        value, secret_values, _secret_values_matcher(frozenset(secret_values))
+    )
+
+
+def _matches_response_secret(
+    value: str,
+    secret_values: FrozenSet[str],
+    secret_matcher: Optional[re.Pattern],
+) -> bool:
     if not isinstance(value, str) or not value:
         return False
 
     if value in secret_values:
         return True
-    for secret in secret_values:
-        if len(secret) >= 8 and secret in value:
-            return True
-
-    # Template / code-shaped strings skip the structural value-shape
-    # checks below.  They can still be flagged as secrets by the
-    # explicit ``secret_values`` set above (e.g. when a known token
-    # appears as a substring), but the URL-credential and
-    # SECRET_VALUE_PATTERNS regex checks would otherwise produce
-    # destructive false positives on f-string URL builders and
-    # multi-line python code blocks.  See ``_looks_like_template_or_code``
-    # docstring + noetl/ai-meta#20.
-    if _looks_like_template_or_code(value):
-        return False
-
-    if redact_url_credentials(value) != value:
+    if secret_matcher is not None and secret_matcher.search(value):
         return True
 
-    for pattern in SECRET_VALUE_PATTERNS:
-        if pattern.search(value):
-            return True
+    if len(value) < _MIN_SECRET_SHAPE_LENGTH:
+        return False
+    shaped = _SECRET_VALUE_RE.search(value) is not None or (
+        "://" in value and redact_url_credentials(value) != value
+    )
+    if not shaped:
+        return False
 
-    return False
+    # Template / code-shaped strings skip the structural value-shape
+    # checks.  They can still be flagged as secrets by the explicit
+    # ``secret_values`` set above (e.g. when a known token appears as a
+    # substring), but the URL-credential and SECRET_VALUE_PATTERNS regex
+    # checks would otherwise produce destructive false positives on
+    # f-string URL builders and multi-line python code blocks.  See
+    # ``_looks_like_template_or_code`` docstring + noetl/ai-meta#20.
+    return not _looks_like_template_or_code(value)
 
 
 def _is_response_sensitive_key(key: str) -> bool:
-    if _is_sensitive_key(key):
-        return True
-    key_lower = key.lower().replace("-", "_")
-    if key_lower in RESPONSE_SENSITIVE_KEYS:
-        return True
-    for sensitive in RESPONSE_SENSITIVE_KEYS:
-        if sensitive.replace("-", "_") in key_lower:
-            return True
-    return False
+    return _classify_response_key(str(key))[1]
 
 
 def _is_noetl_keychain_placeholder(value: Any) -> bool:
@@ -375,21 +495,23 @@ def _is_noetl_keychain_placeholder(value: Any) -> bool:
 def _redact_response_recursive(
     data: Any,
     additional_keys: Set[str],
-    secret_values: Set[str],
+    secret_values: FrozenSet[str],
+    secret_matcher: Optional[re.Pattern],
     redaction: str,
     max_depth: int,
     current_depth: int,
+    drop_keys: FrozenSet[str] = frozenset(),
 ) -> Any:
     if current_depth >= max_depth:
-        return data
+        return _drop_keys_recursive(data, drop_keys) if drop_keys else data
 
     if isinstance(data, dict):
         result = {}
         for key, value in data.items():
-            key_text = str(key)
-            key_normalized = key_text.lower().replace("-", "_")
+            if drop_keys and str(key) in drop_keys:
+                continue
+            key_normalized, partial_match_sensitive = _classify_response_key(str(key))
             caller_blind_redact = key_normalized in additional_keys
-            partial_match_sensitive = _is_response_sensitive_key(key_text)
             if caller_blind_redact:
                 # The caller explicitly named this key as one that always
                 # carries a credential value (HTTP header keys like
@@ -461,7 +583,7 @@ def _redact_response_recursive(
                 #     the same key trap.
                 #   - Other scalars (int, bool, None): pass through.
                 if isinstance(value, str):
-                    if _is_response_secret_value(value, secret_values):
+                    if _matches_response_secret(value, secret_values, secret_matcher):
                         result[key] = redaction
                     else:
                         result[key] = value
@@ -479,9 +601,11 @@ def _redact_response_recursive(
                     value,
                     additional_keys,
                     secret_values,
+                    secret_matcher,
                     redaction,
                     max_depth,
                     current_depth + 1,
+                    frozenset() if str(key) == _KEYCHAIN_MANIFEST_KEY else drop_keys,
                 )
         return result
 
@@ -491,9 +615,11 @@ def _redact_response_recursive(
                 item,
                 additional_keys,
                 secret_values,
+                secret_matcher,
                 redaction,
                 max_depth,
                 current_depth + 1,
+                drop_keys,
             )
             for item in data
         ]
@@ -504,14 +630,16 @@ def _redact_response_recursive(
                 item,
                 additional_keys,
                 secret_values,
+                secret_matcher,
                 redaction,
                 max_depth,
                 current_depth + 1,
+                drop_keys,
             )
             for item in data
         )
 
-    if isinstance(data, str) and _is_response_secret_value(data, secret_values):
+    if isinstance(data, str) and _matches_response_secret(data, secret_values, secret_matcher):
         return redaction
 
     return data
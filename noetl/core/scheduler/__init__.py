@@ -3,4 +3,5 @@
 from .plan_types import StepSpec, Edge, ResourceCap, Schedule
 from .cp_sat_scheduler import CpSatScheduler
 from .plan_builder import build_plan
-from .duration_model import estimate_duration_ms
+from .duration_model import StepDurationModel, duration_model, estimate_duration_ms
+from .dispatcher import Dispatcher, critical_path_priorities, default_dispatcher
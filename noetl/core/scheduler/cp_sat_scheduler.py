@@ -1,5 +1,4 @@
 from typing import List
-from ortools.sat.python import cp_model
 from .plan_types import StepSpec, Edge, ResourceCap, Schedule
 
 
@@ -14,6 +13,10 @@ class CpSatScheduler:
         capacities: List[ResourceCap],
         horizon_ms: int | None = None,
     ) -> Schedule:
+        # Imported here so the engine can use the dispatcher's critical-path
+        # priorities without loading OR-Tools.
+        from ortools.sat.python import cp_model
+
         m = cp_model.CpModel()
         durs = {s.id: max(1, int(s.duration_ms)) for s in steps}
         H = int(horizon_ms or sum(durs.values()) or 1)
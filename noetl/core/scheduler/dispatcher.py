@@ -1,23 +1,198 @@
 from __future__ import annotations
-from typing import List
-from .plan_types import Schedule, StepSpec
+
+import os
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .duration_model import StepDurationModel, duration_model
+from .plan_builder import build_plan
+from .plan_types import Edge, ResourceCap, Schedule, StepSpec
+
+_PRIORITY_CACHE_MAX_ENTRIES = 256
+
+
+def drop_back_edges(steps: List[StepSpec], edges: List[Edge]) -> List[Edge]:
+    """Return ``edges`` without the ones that close a cycle.
+
+    Workflows may route back to earlier steps (retries, pagination); the
+    scheduler plans the forward DAG.  Depth-first from the entry steps, then
+    from anything left unvisited (a cycle with no entry).
+    """
+    ids = {s.id for s in steps}
+    successors: Dict[str, List[Edge]] = defaultdict(list)
+    has_pred = set()
+    for e in edges:
+        if e.u in ids and e.v in ids:
+            successors[e.u].append(e)
+            has_pred.add(e.v)
+
+    back = set()
+    done = set()
+    on_stack = set()
+    for root in [s.id for s in steps if s.id not in has_pred] + [s.id for s in steps]:
+        if root in done:
+            continue
+        stack: List[Tuple[str, int]] = [(root, 0)]
+        on_stack.add(root)
+        while stack:
+            node, index = stack[-1]
+            out = successors.get(node, [])
+            if index == len(out):
+                stack.pop()
+                on_stack.discard(node)
+                done.add(node)
+                continue
+            stack[-1] = (node, index + 1)
+            edge = out[index]
+            if edge.v in on_stack:
+                back.add(id(edge))
+            elif edge.v not in done:
+                stack.append((edge.v, 0))
+                on_stack.add(edge.v)
+    return [e for e in edges if e.u in ids and e.v in ids and id(e) not in back]
+
+
+def critical_path_priorities(steps: List[StepSpec], edges: List[Edge]) -> Dict[str, int]:
+    """Longest remaining path (ms, own duration included) from each step to an exit.
+
+    Steps on the critical path get the largest values, so starting ready
+    work in descending order starts the long pole first.  Edges that close
+    a cycle are ignored (see :func:`drop_back_edges`).
+    """
+    durations = {s.id: max(0, int(s.duration_ms)) for s in steps}
+    successors: Dict[str, List[str]] = defaultdict(list)
+    pending = {sid: 0 for sid in durations}
+    for e in drop_back_edges(steps, edges):
+        successors[e.u].append(e.v)
+        pending[e.u] += 1
+    predecessors: Dict[str, List[str]] = defaultdict(list)
+    for u, vs in successors.items():
+        for v in vs:
+            predecessors[v].append(u)
+
+    # Reverse topological order: exits first.
+    rank: Dict[str, int] = {}
+    ready = [sid for sid, count in pending.items() if count == 0]
+    while ready:
+        node = ready.pop()
+        rank[node] = durations[node] + max((rank[v] for v in successors.get(node, [])), default=0)
+        for u in predecessors.get(node, []):
+            pending[u] -= 1
+            if pending[u] == 0:
+                ready.append(u)
+    return rank
+
+
+def _playbook_dict(playbook: Any) -> Dict[str, Any]:
+    if isinstance(playbook, dict):
+        return playbook
+    return playbook.model_dump(mode="python", exclude_none=True)
+
+
+def _playbook_path(playbook: Any) -> Optional[str]:
+    metadata = playbook.get("metadata") if isinstance(playbook, dict) else getattr(playbook, "metadata", None)
+    if isinstance(metadata, dict):
+        return metadata.get("path") or metadata.get("name")
+    return None
 
 
 class Dispatcher:
-    """Stub dispatcher that would enqueue jobs to workers respecting earliest starts.
+    """Critical-path dispatch priorities for a playbook's steps.
 
-    For minimal scope in this change, we only keep the interface. Server integration is out of scope.
+    Durations come from the history-trained :class:`StepDurationModel`.
+    Without resource capacities the priority of a step is its critical-path
+    rank, which is exactly the order the CP-SAT optimum starts an
+    unconstrained DAG in.  With capacities the plan is solved with
+    :class:`CpSatScheduler` and steps are ranked by solved start time,
+    breaking ties by critical-path rank.  Results are cached per playbook
+    and duration-model version.
     """
 
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        model: Optional[StepDurationModel] = None,
+        resource_caps: Optional[Mapping[str, int]] = None,
+        solver_max_seconds: float = 1.0,
+    ):
+        self.model = model or duration_model
+        self.resource_caps = dict(resource_caps or {})
+        self.solver_max_seconds = solver_max_seconds
+        self._cache: OrderedDict[Tuple[int, Optional[str], int], Tuple[Any, Dict[str, int]]] = OrderedDict()
+
+    def plan(self, playbook: Any) -> tuple[list[StepSpec], list[Edge], list[ResourceCap]]:
+        path = _playbook_path(playbook)
+        return build_plan(
+            _playbook_dict(playbook),
+            self.resource_caps,
+            duration_fn=lambda step_id, kind: self.model.estimate(step_id, kind, path=path),
+        )
+
+    def priorities(self, playbook: Any) -> Dict[str, int]:
+        """Map step name -> dispatch priority (higher starts first)."""
+        key = (id(playbook), _playbook_path(playbook), self.model.version)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] is playbook:
+            self._cache.move_to_end(key)
+            return cached[1]
+
+        steps, edges, caps = self.plan(playbook)
+        priorities = critical_path_priorities(steps, edges)
+        if caps and steps:
+            priorities = self._solved_priorities(steps, edges, caps, priorities)
+
+        self._cache[key] = (playbook, priorities)
+        while len(self._cache) > _PRIORITY_CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        return priorities
+
+    def step_priority(self, playbook: Any, step_name: str) -> int:
+        return int(self.priorities(playbook).get(step_name, 0))
+
+    def _solved_priorities(
+        self,
+        steps: List[StepSpec],
+        edges: List[Edge],
+        caps: List[ResourceCap],
+        ranks: Dict[str, int],
+    ) -> Dict[str, int]:
+        from .cp_sat_scheduler import CpSatScheduler
+
+        schedule = CpSatScheduler(max_seconds=self.solver_max_seconds).solve(steps, drop_back_edges(steps, edges), caps)
+        # Earlier solved start first; critical-path rank breaks ties.
+        order = sorted(ranks, key=lambda sid: (schedule.starts_ms.get(sid, 0), -ranks[sid]))
+        return {sid: len(order) - index for index, sid in enumerate(order)}
 
     def dispatch(self, schedule: Schedule, steps: List[StepSpec]):
-        # Placeholder: in a real system, we would enqueue based on schedule.starts_ms and resource tags
+        """Order ``steps`` for enqueueing by solved start, long pole first on ties."""
+        durations = {s.id: s.duration_ms for s in steps}
+        ordered = sorted(steps, key=lambda s: (schedule.starts_ms.get(s.id, 0), -s.duration_ms))
         return {
-            "enqueued": [s.id for s in steps],
+            "enqueued": [s.id for s in ordered],
             "plan": {
                 "starts_ms": schedule.starts_ms,
                 "ends_ms": schedule.ends_ms,
+                "durations_ms": durations,
             },
         }
+
+
+def critical_path_dispatch_enabled() -> bool:
+    return os.getenv("NOETL_CRITICAL_PATH_DISPATCH", "true").strip().lower() in {"1", "true", "yes", "on"}
+
+
+default_dispatcher = Dispatcher()
+
+
+def dispatch_priority(state: Any, step_name: str) -> int:
+    """Priority for a command of ``step_name`` in ``state.playbook``; higher is published first.
+
+    0 when ``NOETL_CRITICAL_PATH_DISPATCH`` is off or the playbook cannot be
+    planned, so dispatch falls back to engine order.
+    """
+    playbook = getattr(state, "playbook", None)
+    if playbook is None or not critical_path_dispatch_enabled():
+        return 0
+    try:
+        return default_dispatcher.step_priority(playbook, step_name)
+    except Exception:
+        return 0
@@ -1,20 +1,31 @@
+import asyncio
 import json
 import os
-from typing import Dict
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
-# Very simple duration estimator with static defaults and optional JSON cache override
+# Step duration estimator: static defaults, an optional JSON cache override,
+# and a history model learned from completed commands in ``noetl.event``.
 
 _DEFAULTS_MS: Dict[str, int] = {
     "http": 1200,
     "postgres": 800,
     "duckdb": 8000,
     "iterator": 0,
+    # Steps without a tool only route; the server evaluates them inline.
+    "router": 0,
 }
 
 _CACHE_PATH = os.environ.get("NOETL_DURATION_CACHE", os.path.join(os.path.dirname(__file__), "duration_cache.json"))
 
 _cache: Dict[str, int] = {}
 
+# Seconds between history refreshes on the server; 0 disables the refresher.
+REFRESH_INTERVAL_SECONDS = float(os.environ.get("NOETL_DURATION_MODEL_REFRESH_SECONDS", "300"))
+# Only commands completed this recently are read from ``noetl.event``, so a
+# model without a persisted watermark seeds from a bounded window instead of
+# replaying the whole command history.
+HISTORY_WINDOW_SECONDS = float(os.environ.get("NOETL_DURATION_MODEL_HISTORY_SECONDS", "86400"))
+
 
 def _load_cache():
     global _cache
@@ -33,10 +44,265 @@ def _load_cache():
 _load_cache()
 
 
-def estimate_duration_ms(step_id: str, step_type: str) -> int:
-    # Prefer explicit step_id overrides, then type, then defaults
-    if step_id in _cache:
-        return int(_cache[step_id])
-    if step_type in _cache:
-        return int(_cache[step_type])
-    return int(_DEFAULTS_MS.get(step_type, 1000))
+# One row per completed command: its playbook path, step, tool kind and
+# wall-clock in ms.  ``duration`` wins when the worker reported one;
+# otherwise the time from command.started (or command.issued) to
+# command.completed.  Joins use idx_event_exec_type_command_id_event_id_desc.
+_HISTORY_SQL = """
+    SELECT done.event_id,
+           cat.path,
+           issued.node_name AS step,
+           issued.node_type AS tool_kind,
+           COALESCE(
+               done.duration,
+               EXTRACT(EPOCH FROM (done.created_at - COALESCE(started.created_at, issued.created_at))) * 1000
+           ) AS duration_ms
+    FROM noetl.event done
+    JOIN noetl.event issued
+      ON issued.execution_id = done.execution_id
+     AND issued.event_type = 'command.issued'
+     AND issued.command_id = done.command_id
+    LEFT JOIN LATERAL (
+        SELECT created_at
+        FROM noetl.event
+        WHERE execution_id = done.execution_id
+          AND event_type = 'command.started'
+          AND command_id = done.command_id
+        ORDER BY event_id DESC
+        LIMIT 1
+    ) started ON TRUE
+    JOIN noetl.catalog cat ON cat.catalog_id = done.catalog_id
+    WHERE done.event_type = 'command.completed'
+      AND done.command_id IS NOT NULL
+      AND done.event_id > %(after_event_id)s
+      AND done.created_at > now() - make_interval(secs => %(window_seconds)s)
+    ORDER BY done.event_id
+    LIMIT %(limit)s
+"""
+
+# Learned estimates shared by all servers.  One server (the lease holder)
+# reads new history and upserts the keys it changed; the others load the
+# table.  ``max(last_event_id)`` is the persisted history watermark.  Key
+# levels the model leaves open are stored as ''.
+_SNAPSHOT_SQL = """
+    SELECT path, step, tool_kind, ewma_ms, samples, last_event_id
+    FROM noetl.step_duration_estimate
+"""
+
+_WATERMARK_SQL = """
+    SELECT COALESCE(max(last_event_id), 0) AS last_event_id
+    FROM noetl.step_duration_estimate
+"""
+
+_PERSIST_SQL = """
+    INSERT INTO noetl.step_duration_estimate (path, step, tool_kind, ewma_ms, samples, last_event_id, updated_at)
+    VALUES (%s, %s, %s, %s, %s, %s, now())
+    ON CONFLICT (path, step, tool_kind) DO UPDATE
+    SET ewma_ms = EXCLUDED.ewma_ms,
+        samples = EXCLUDED.samples,
+        last_event_id = EXCLUDED.last_event_id,
+        updated_at = EXCLUDED.updated_at
+"""
+
+_Key = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+class StepDurationModel:
+    """Exponentially weighted step durations learned from command history.
+
+    Estimates are kept at three levels so new steps still get a sensible
+    value: ``(path, step, tool_kind)``, then ``(path, step)``, then the tool
+    kind across all playbooks.  ``version`` changes whenever estimates do,
+    so callers can cache anything derived from them.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        defaults: Optional[Mapping[str, int]] = None,
+        overrides: Optional[Mapping[str, int]] = None,
+    ):
+        self.alpha = float(alpha)
+        self.defaults = dict(_DEFAULTS_MS if defaults is None else defaults)
+        self.overrides = dict(_cache if overrides is None else overrides)
+        self.version = 0
+        self.last_event_id = 0
+        self._ewma: Dict[_Key, float] = {}
+        self._samples: Dict[_Key, int] = {}
+        self._dirty: set = set()
+
+    def observe(self, path: Optional[str], step: Optional[str], tool_kind: Optional[str], duration_ms: Any) -> None:
+        try:
+            value = float(duration_ms)
+        except (TypeError, ValueError):
+            return
+        if value < 0 or value != value:
+            return
+        for key in ((path, step, tool_kind), (path, step, None), (None, None, tool_kind)):
+            if key == (None, None, None):
+                continue
+            previous = self._ewma.get(key)
+            self._ewma[key] = value if previous is None else previous + self.alpha * (value - previous)
+            self._samples[key] = self._samples.get(key, 0) + 1
+            self._dirty.add(key)
+        self.version += 1
+
+    def observe_rows(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Fold ``_HISTORY_SQL``-shaped rows into the model; return how many."""
+        count = 0
+        for row in rows:
+            # Task-sequence and inline-task commands are named ``step:suffix``;
+            # the plan knows the workflow step.
+            step = str(row.get("step") or "").partition(":")[0] or None
+            self.observe(row.get("path"), step, row.get("tool_kind"), row.get("duration_ms"))
+            event_id = row.get("event_id")
+            if event_id is not None:
+                self.last_event_id = max(self.last_event_id, int(event_id))
+            count += 1
+        return count
+
+    def samples(self, path: Optional[str], step: Optional[str], tool_kind: Optional[str] = None) -> int:
+        return self._samples.get((path, step, tool_kind), 0)
+
+    def estimate(self, step: str, tool_kind: str, path: Optional[str] = None) -> int:
+        """Best estimate in ms: override by step, history, override by kind, default."""
+        if step in self.overrides:
+            return int(self.overrides[step])
+        for key in ((path, step, tool_kind), (path, step, None), (None, None, tool_kind)):
+            learned = self._ewma.get(key)
+            if learned is not None:
+                return int(round(learned))
+        if tool_kind in self.overrides:
+            return int(self.overrides[tool_kind])
+        return int(self.defaults.get(tool_kind, 1000))
+
+    async def refresh(self, conn=None, limit: int = 5000) -> int:
+        """Read commands completed since the last refresh; return rows folded in."""
+        from psycopg.rows import dict_row
+
+        if conn is None:
+            from noetl.core.db.pool import get_bg_pool_connection
+
+            async with get_bg_pool_connection() as pooled:
+                return await self.refresh(pooled, limit=limit)
+
+        total = 0
+        while True:
+            async with conn.cursor(row_factory=dict_row) as cur:
+                await cur.execute(
+                    _HISTORY_SQL,
+                    {
+                        "after_event_id": self.last_event_id,
+                        "window_seconds": HISTORY_WINDOW_SECONDS,
+                        "limit": limit,
+                    },
+                )
+                rows = await cur.fetchall()
+            total += self.observe_rows(rows)
+            if len(rows) < limit:
+                return total
+
+    async def load_snapshot(self, conn) -> bool:
+        """Adopt the shared estimates when their watermark is ahead of ours."""
+        from psycopg.rows import dict_row
+
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(_WATERMARK_SQL)
+            row = await cur.fetchone()
+            watermark = int((row or {}).get("last_event_id") or 0)
+            if watermark <= self.last_event_id:
+                return False
+            await cur.execute(_SNAPSHOT_SQL)
+            rows = await cur.fetchall()
+        ewma: Dict[_Key, float] = {}
+        samples: Dict[_Key, int] = {}
+        for row in rows:
+            key = (row["path"] or None, row["step"] or None, row["tool_kind"] or None)
+            ewma[key] = float(row["ewma_ms"])
+            samples[key] = int(row["samples"])
+        self._ewma, self._samples, self._dirty = ewma, samples, set()
+        self.last_event_id = watermark
+        self.version += 1
+        return True
+
+    async def persist(self, conn) -> int:
+        """Upsert the estimates changed since the last persist; return how many."""
+        if not self._dirty:
+            return 0
+        params = [
+            (key[0] or "", key[1] or "", key[2] or "", self._ewma[key], self._samples[key], self.last_event_id)
+            for key in self._dirty
+        ]
+        async with conn.cursor() as cur:
+            await cur.executemany(_PERSIST_SQL, params)
+        self._dirty = set()
+        return len(params)
+
+    async def sync(self, leader: bool = True, conn=None) -> int:
+        """Catch up with the shared estimates; the leader also folds new history.
+
+        Returns the history rows folded in (always 0 for followers).
+        """
+        if conn is None:
+            from noetl.core.db.pool import get_bg_pool_connection
+
+            async with get_bg_pool_connection() as pooled:
+                return await self.sync(leader, pooled)
+
+        await self.load_snapshot(conn)
+        if not leader:
+            return 0
+        rows = await self.refresh(conn)
+        await self.persist(conn)
+        return rows
+
+
+duration_model = StepDurationModel()
+
+
+def estimate_duration_ms(step_id: str, step_type: str, path: Optional[str] = None) -> int:
+    # Prefer explicit step_id overrides, then history, then type, then defaults
+    return duration_model.estimate(step_id, step_type, path=path)
+
+
+async def run_duration_model_refresher(
+    stop_event: asyncio.Event,
+    interval_seconds: Optional[float] = None,
+    model: Optional[StepDurationModel] = None,
+    lease=None,
+) -> None:
+    """Keep ``model`` current until ``stop_event`` is set.
+
+    With a ``RuntimeLease`` (see :mod:`noetl.server.runtime_leases`) only the
+    lease holder reads ``noetl.event`` history; the other servers load the
+    estimates it persists.  Without one this process is the reader.
+    """
+    from noetl.core.logger import setup_logger
+
+    logger = setup_logger(__name__, include_location=True)
+    model = model or duration_model
+    interval = REFRESH_INTERVAL_SECONDS if interval_seconds is None else float(interval_seconds)
+    try:
+        while not stop_event.is_set():
+            try:
+                leader = True
+                if lease is not None:
+                    lease_state = await lease.try_acquire_or_renew()
+                    leader = bool(getattr(lease_state, "acquired", False))
+                rows = await model.sync(leader=leader)
+                if rows:
+                    logger.debug("[DURATION-MODEL] folded %s completed commands (version=%s)", rows, model.version)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("[DURATION-MODEL] refresh failed: %s", exc)
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        if lease is not None:
+            try:
+                await lease.release()
+            except Exception:  # pragma: no cover - best-effort release
+                pass
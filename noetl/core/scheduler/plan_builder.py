@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import copy
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .duration_model import estimate_duration_ms
 from .plan_types import Edge, ResourceCap, StepSpec
@@ -13,10 +13,34 @@ DEFAULT_DEMANDS: Dict[str, Dict[str, int]] = {
 }
 
 
+def _tool_kind(step: Dict[str, Any]) -> Optional[str]:
+    # Legacy steps carry ``tool: <kind>``; v10 steps a tool object or a
+    # task pipeline, which the worker runs as one task_sequence command.
+    tool = step.get("tool")
+    if isinstance(tool, dict):
+        return tool.get("kind")
+    if isinstance(tool, list):
+        return "task_sequence" if tool else None
+    return tool
+
+
+def _next_steps(step: Dict[str, Any]) -> List[str]:
+    nexts = step.get("next") or []
+    if isinstance(nexts, dict):
+        # v10 router: next: {spec: ..., arcs: [{step: ...}, ...]}
+        nexts = (nexts.get("arcs") or []) if "arcs" in nexts else [nexts]
+    names = []
+    for nxt in nexts:
+        name = nxt.get("step") if isinstance(nxt, dict) else nxt
+        if isinstance(name, str) and name:
+            names.append(name)
+    return names
+
+
 def _infer_resources(step: Dict[str, Any]) -> Dict[str, int]:
     # explicit resources on the step override defaults
     res = step.get("resources") or {}
-    stype = step.get("tool")
+    stype = _tool_kind(step)
     if res:
         return {str(k): int(v) for k, v in res.items()}
     if stype in DEFAULT_DEMANDS:
@@ -30,8 +54,16 @@ def _normalize_playbook(pb: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def build_plan(
-    playbook: Dict[str, Any], resource_caps: Dict[str, int]
+    playbook: Dict[str, Any],
+    resource_caps: Dict[str, int],
+    duration_fn: Optional[Callable[[str, str], int]] = None,
 ) -> tuple[list[StepSpec], list[Edge], list[ResourceCap]]:
+    """Expand a playbook into scheduler steps, precedence edges and caps.
+
+    ``duration_fn(step_id, tool_kind)`` estimates each step; it defaults to
+    :func:`estimate_duration_ms` without a playbook path.
+    """
+    estimate = duration_fn or estimate_duration_ms
     pb = _normalize_playbook(playbook)
     workflow: List[Dict[str, Any]] = pb.get("workflow", [])
 
@@ -47,7 +79,7 @@ def build_plan(
     # First pass: expand steps
     for s in workflow:
         name = s.get("step")
-        stype = s.get("tool")
+        stype = _tool_kind(s)
         if stype == "iterator":
             # Expand collection items into separate steps
             coll_expr = s.get("collection")
@@ -65,7 +97,7 @@ def build_plan(
                 resources = task.get("resources") or DEFAULT_DEMANDS.get(
                     task_type, {"http_pool": 1}
                 )
-                dur = estimate_duration_ms(iter_id, task_type)
+                dur = estimate(iter_id, task_type)
                 steps.append(
                     StepSpec(
                         id=iter_id,
@@ -82,7 +114,7 @@ def build_plan(
             produced[name] = [node_id]
             resources = _infer_resources(s)
             step_kind = stype or "router"
-            dur = estimate_duration_ms(node_id, step_kind)
+            dur = estimate(node_id, step_kind)
             steps.append(
                 StepSpec(
                     id=node_id,
@@ -96,16 +128,9 @@ def build_plan(
     # Second pass: edges and barriers
     for s in workflow:
         name = s.get("step")
-        nexts = s.get("next", []) or []
-        # Expand next into list
-        if isinstance(nexts, dict):
-            next_list = [nexts]
-        else:
-            next_list = list(nexts)
         # If current produces multiple nodes (iterator), successors should depend on all via a barrier
         curr_nodes = produced.get(name, [name])
-        for nxt in next_list:
-            succ_name = nxt.get("step")
+        for succ_name in _next_steps(s):
             succ_nodes = produced.get(succ_name, [succ_name])
             if len(curr_nodes) > 1 and len(succ_nodes) >= 1:
                 # create barrier node that depends on all curr_nodes
@@ -142,19 +142,17 @@ def _build_safe_arrow_table(rows: list[dict[str, Any]], columns: list[str]):
     return pa.Table.from_pylist(nested_rows, schema=None)
 
 
-def rows_to_arrow_ipc(
+def rows_to_arrow_table(
     rows: Iterable[Mapping[str, Any]],
     *,
     columns: Optional[list[str]] = None,
-) -> tuple[bytes, str, int]:
-    """Serialize row dictionaries to Arrow streaming IPC bytes.
+):
+    """Build a mixed-type-tolerant ``pa.Table`` from row dictionaries.
 
-    Returns ``(payload, schema_digest, row_count)``.  The digest is computed
-    from Arrow's serialized schema, not from the row values, so consumers can
-    cheaply check whether two frames share a logical shape.
+    Column order follows ``columns`` or first appearance across rows.
     """
     try:
-        import pyarrow as pa
+        import pyarrow as pa  # noqa: F401
     except Exception as exc:  # pragma: no cover - exercised when optional dep missing
         raise RuntimeError("pyarrow is required for Arrow IPC frame serialization") from exc
 
@@ -179,13 +177,33 @@ def rows_to_arrow_ipc(
     table = _build_safe_arrow_table(normalized_rows, columns)
     if columns:
         table = table.select([column for column in columns if column in table.column_names])
+    return table
 
+
+def arrow_schema_digest(schema: Any) -> str:
+    """Digest of Arrow's serialized schema (shape, not values)."""
+    return hashlib.sha256(schema.serialize().to_pybytes()).hexdigest()
+
+
+def rows_to_arrow_ipc(
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    columns: Optional[list[str]] = None,
+) -> tuple[bytes, str, int]:
+    """Serialize row dictionaries to Arrow streaming IPC bytes.
+
+    Returns ``(payload, schema_digest, row_count)``.  The digest is computed
+    from Arrow's serialized schema, not from the row values, so consumers can
+    cheaply check whether two frames share a logical shape.
+    """
+    import pyarrow as pa
+
+    table = rows_to_arrow_table(rows, columns=columns)
     sink = BytesIO()
     with pa.ipc.new_stream(sink, table.schema) as writer:
         writer.write_table(table)
     payload = sink.getvalue()
-    schema_digest = hashlib.sha256(table.schema.serialize().to_pybytes()).hexdigest()
-    return payload, schema_digest, len(materialized_rows)
+    return payload, arrow_schema_digest(table.schema), table.num_rows
 
 
 def arrow_ipc_to_rows(payload: bytes) -> list[dict[str, Any]]:
@@ -253,6 +271,8 @@ __all__ = [
     "ARROW_STREAM_MEDIA_TYPE",
     "arrow_feather_to_rows",
     "arrow_ipc_to_rows",
+    "arrow_schema_digest",
     "rows_to_arrow_feather",
     "rows_to_arrow_ipc",
+    "rows_to_arrow_table",
 ]
@@ -169,6 +169,11 @@ class ResultRef(BaseModel):
         default=None,
         description="Optional Tier 1.5 same-node IPC hint; durable ref remains authoritative"
     )
+    locality: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Producing worker's locality (worker_id, node_id, zone, ...) for large payloads "
+        "kept in its local tiers; lets the consuming command prefer that worker"
+    )
     # Accumulation fields
     is_accumulated: bool = Field(default=False, description="Is part of accumulation")
     accumulation_index: Optional[int] = Field(default=None, description="Index in accumulation")
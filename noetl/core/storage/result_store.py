@@ -45,6 +45,7 @@ from noetl.core.storage.router import StorageRouter, default_router
 from noetl.core.storage.extractor import create_preview
 from noetl.core.storage.backends import get_backend
 from noetl.core.logger import setup_logger
+from noetl.core.runtime.topology import LOCALITY_HINT_MIN_BYTES, producer_locality
 
 logger = setup_logger(__name__, include_location=True)
 
@@ -266,15 +267,19 @@ class TempStore:
         data: Any,
         *,
         compress: bool,
+        serialized: Optional[bytes] = None,
     ) -> tuple[bytes, TempRefMeta, Optional[Dict[str, Any]], int]:
         """Serialize and optionally compress payload bytes off the event loop."""
-        serialized = json.dumps(data, default=str)
-        data_bytes = serialized.encode("utf-8")
+        if serialized is None:
+            serialized = json.dumps(data, default=str).encode("utf-8")
+        data_bytes = serialized
         original_size = len(data_bytes)
 
         compression = "none"
         if compress or original_size > 10240:
-            data_bytes = gzip.compress(data_bytes)
+            # Level 6 (zlib's default) compresses JSON about as well as the
+            # gzip module's default of 9 at a fraction of the CPU.
+            data_bytes = gzip.compress(data_bytes, compresslevel=6)
             compression = "gzip"
 
         meta = TempRefMeta(
@@ -298,6 +303,7 @@ class TempStore:
         correlation: Optional[Dict[str, Any]] = None,
         compress: bool = False,
         scrub_context: Optional[Dict[str, Any]] = None,
+        serialized: Optional[bytes] = None,
     ) -> TempRef:
         """
         Store data and return a TempRef pointer.
@@ -313,18 +319,23 @@ class TempStore:
             parent_execution_id: Parent execution ID for workflow-scope tracking
             correlation: Loop/pagination tracking
             compress: Whether to compress data
+            serialized: UTF-8 JSON of ``data`` (``json.dumps(data,
+                default=str)``) that the caller already scrubbed and
+                encoded; skips the scrub and serialization here
 
         Returns:
             TempRef pointer to the stored data
         """
         # Producer boundary per agents/rules/execution-model.md secrets rule.
-        data = producer_scrub_payload(data, scrub_context)
+        if serialized is None:
+            data = producer_scrub_payload(data, scrub_context)
         correlation = producer_scrub_payload(correlation, scrub_context)
 
         data_bytes, meta, preview, original_size = await asyncio.to_thread(
             self._prepare_data_for_storage,
             data,
             compress=compress,
+            serialized=serialized,
         )
         if meta.compression != "none":
             logger.debug(
@@ -358,6 +369,7 @@ class TempStore:
 
         # Store data in appropriate backend
         await self._store_data(temp_ref, data_bytes)
+        self._attach_producer_locality(temp_ref)
 
         # Cache ref metadata + register scope tracking consistently for all callers.
         self._set_ref_cache(
@@ -400,7 +412,9 @@ class TempStore:
         if not isinstance(data_bytes, (bytes, bytearray, memoryview)):
             raise TypeError("data_bytes must be bytes-like")
         # Producer boundary per agents/rules/execution-model.md secrets rule.
-        payload, schema_digest, row_count, scrubbed = scrub_arrow_ipc_bytes(
+        # Scrubbing reads the record batches; keep it off the event loop.
+        payload, schema_digest, row_count, scrubbed = await asyncio.to_thread(
+            scrub_arrow_ipc_bytes,
             bytes(data_bytes),
             schema_digest=schema_digest,
             row_count=row_count,
@@ -454,6 +468,7 @@ class TempStore:
                 logger.debug("TEMP: IPC cache admission skipped for %s: %s", temp_ref.ref, exc)
 
         await self._store_data(temp_ref, payload)
+        self._attach_producer_locality(temp_ref)
         self._set_ref_cache(
             temp_ref=temp_ref,
             execution_id=execution_id,
@@ -489,6 +504,25 @@ class TempStore:
         self._ipc_stats["fallback_reads"] += 1
         return await self._retrieve_data_bytes(temp_ref)
 
+    async def get_arrow_ipc_bytes(self, ref: Union[str, TempRef]) -> Optional[bytes]:
+        """Return stored Arrow IPC stream bytes for ``ref`` without decoding.
+
+        Prefers the same-node shared-memory copy when the ref carries a valid
+        IPC hint and falls back to the durable tier.  Returns ``None`` when the
+        ref is unknown here or does not hold an Arrow IPC stream, so callers
+        can fall back to :meth:`resolve`.
+        """
+        temp_ref = ref if isinstance(ref, TempRef) else await self._lookup_ref(ref)
+        if temp_ref is None:
+            return None
+        media_type = temp_ref.meta.media_type or temp_ref.meta.content_type
+        if str(media_type or "").lower() != ARROW_STREAM_MEDIA_TYPE:
+            return None
+        return await self.get_ipc_bytes(
+            temp_ref,
+            ipc_cache=self._default_ipc_cache_for_ref(temp_ref),
+        )
+
     async def get(self, ref: Union[str, TempRef]) -> Any:
         """
         Retrieve data by TempRef.
@@ -811,6 +845,20 @@ class TempStore:
             self._set_memory_cache(temp_ref.ref, data_bytes)
             return f"memory://{temp_ref.ref}"
 
+    @staticmethod
+    def _attach_producer_locality(temp_ref: TempRef) -> None:
+        """Tag large payloads held in this worker's local tiers with its locality.
+
+        Only MEMORY/DISK payloads and refs with an IPC hint are cheaper to
+        read on the producing worker; KV and cloud tiers cost the same from
+        anywhere.  Outside a worker ``producer_locality()`` is ``None``.
+        """
+        if temp_ref.meta.bytes < LOCALITY_HINT_MIN_BYTES:
+            return
+        if temp_ref.store not in (StoreTier.MEMORY, StoreTier.DISK) and temp_ref.ipc is None:
+            return
+        temp_ref.locality = producer_locality()
+
     async def _store_data_fallback(self, temp_ref: TempRef, data_bytes: bytes, fallback_tier: StoreTier) -> str:
         """Store data using a fallback tier."""
         temp_ref.store = fallback_tier
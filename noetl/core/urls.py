@@ -20,3 +20,16 @@ def build_api_url(server_url: Optional[str], path: str) -> str:
     if normalized_path.startswith("api/"):
         normalized_path = normalized_path[4:]
     return f"{base}/api/{normalized_path}"
+
+
+# Sent with execution-scoped API calls so a sharded server can hand the
+# request to the process that owns the execution without reading the body
+# (see ``noetl.server.sharding``).
+EXECUTION_ID_HEADER = "X-NoETL-Execution-Id"
+
+
+def execution_routing_headers(execution_id: object) -> dict[str, str]:
+    """Headers routing an API call to the owner of ``execution_id``; empty if unknown."""
+    if execution_id is None or execution_id == "":
+        return {}
+    return {EXECUTION_ID_HEADER: str(execution_id)}
@@ -0,0 +1,236 @@
+"""Payload-size-aware compression for worker <-> server control-plane JSON.
+
+Bodies of at least ``NOETL_WIRE_COMPRESSION_MIN_BYTES`` (default 8 KiB) are
+compressed with zstd when ``zstandard`` is installed on both ends
+(``pip install noetl[wirezstd]``), otherwise with gzip.  The JSON schema
+does not change; only ``Content-Encoding`` does.
+
+Responses follow the standard ``Accept-Encoding`` exchange; httpx advertises
+and decodes gzip (and zstd when ``zstandard`` is installed) on its own.  For
+request bodies the server advertises the codings it accepts with an
+``Accept-Encoding`` response header (RFC 7694).  ``RequestCompressor``
+remembers that per server origin and compresses only after it has been
+seen, so a worker never sends compressed bodies to a server that cannot
+read them.  ``NOETL_WIRE_COMPRESSION=false`` turns compression off on
+either side.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import zlib
+from typing import Any, Mapping, Optional
+
+try:  # optional codec
+    import zstandard
+except ImportError:  # pragma: no cover - exercised when zstandard is absent
+    zstandard = None  # type: ignore[assignment]
+
+HAS_ZSTD = zstandard is not None
+
+_TRUTHY = {"1", "true", "yes", "on"}
+# Latency over ratio: gzip level 1 is ~2.5x faster than level 6 on JSON
+# contexts for ~10% more bytes.
+_GZIP_LEVEL = 1
+_ZSTD_LEVEL = 3
+
+
+class DecompressedSizeExceeded(ValueError):
+    """A compressed body expands past ``max_decompressed_bytes()``."""
+
+
+def wire_compression_enabled() -> bool:
+    return os.getenv("NOETL_WIRE_COMPRESSION", "true").strip().lower() in _TRUTHY
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def compression_min_bytes() -> int:
+    return max(0, _env_int("NOETL_WIRE_COMPRESSION_MIN_BYTES", 8192))
+
+
+def max_decompressed_bytes() -> int:
+    return max(1, _env_int("NOETL_WIRE_MAX_DECOMPRESSED_BYTES", 256 * 1024 * 1024))
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Content codings this process can read and write, preferred first."""
+    return ("zstd", "gzip") if HAS_ZSTD else ("gzip",)
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the preferred supported coding allowed by an ``Accept-Encoding`` value."""
+    if not accept_encoding:
+        return None
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    for encoding in supported_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0.0:
+            return encoding
+    return None
+
+
+def compressor(encoding: str) -> Any:
+    """Streaming compressor with ``compress(chunk)`` and ``flush()``."""
+    if encoding == "zstd" and HAS_ZSTD:
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compressobj()
+    if encoding == "gzip":
+        return zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 31)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "zstd" and HAS_ZSTD:
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+    stream = compressor(encoding)
+    return stream.compress(data) + stream.flush()
+
+
+def decompress(data: bytes, encoding: str, max_bytes: Optional[int] = None) -> bytes:
+    """Decode a whole body, refusing to expand past ``max_bytes``."""
+    limit = max_decompressed_bytes() if max_bytes is None else max_bytes
+    if encoding == "zstd" and HAS_ZSTD:
+        chunks = []
+        total = 0
+        try:
+            with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+                while True:
+                    chunk = reader.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    total += len(chunk)
+                    if total > limit:
+                        raise DecompressedSizeExceeded(f"Decompressed body exceeds {limit} bytes")
+                    chunks.append(chunk)
+        except zstandard.ZstdError as exc:
+            raise ValueError(f"Invalid zstd body: {exc}") from exc
+        return b"".join(chunks)
+    if encoding == "gzip":
+        stream = zlib.decompressobj(31)
+        try:
+            out = stream.decompress(data, limit + 1)
+        except zlib.error as exc:
+            raise ValueError(f"Invalid gzip body: {exc}") from exc
+        if len(out) > limit or stream.unconsumed_tail:
+            raise DecompressedSizeExceeded(f"Decompressed body exceeds {limit} bytes")
+        return out
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def _origin(url: Any) -> str:
+    text = str(url)
+    scheme, _, rest = text.partition("://")
+    return f"{scheme}://{rest.split('/', 1)[0]}".lower()
+
+
+class RequestCompressor:
+    """Request-body compression negotiated with each server origin."""
+
+    def __init__(self) -> None:
+        self._encodings: dict[str, str] = {}
+
+    def encoding_for(self, url: Any) -> Optional[str]:
+        return self._encodings.get(_origin(url))
+
+    def observe(self, url: Any, headers: Mapping[str, str]) -> None:
+        """Record the request codings a server advertised in a response."""
+        if not wire_compression_enabled():
+            return
+        advertised = headers.get("accept-encoding")
+        if advertised is None:
+            return
+        encoding = choose_encoding(advertised)
+        if encoding:
+            self._encodings[_origin(url)] = encoding
+        else:
+            self._encodings.pop(_origin(url), None)
+
+    async def observe_response(self, response: Any) -> None:
+        """httpx ``response`` event hook."""
+        self.observe(response.request.url, response.headers)
+
+    def reject(self, url: Any) -> None:
+        """Stop compressing for a server that refused a compressed body."""
+        self._encodings.pop(_origin(url), None)
+
+    def encode_json(self, url: Any, data: Any) -> Optional[tuple[bytes, Optional[str]]]:
+        """Serialize ``data`` for ``url`` when the server accepts compressed bodies.
+
+        Returns None when no coding was negotiated (the caller posts
+        ``json=data`` as before), else ``(body, encoding)`` where
+        ``encoding`` is None for bodies under the size threshold.
+        """
+        encoding = self.encoding_for(url)
+        if encoding is None or not wire_compression_enabled():
+            return None
+        # Same encoding httpx applies to ``json=``.
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+        if len(body) < compression_min_bytes():
+            return body, None
+        return compress(body, encoding), encoding
+
+
+def _refused_encoding(response: Any) -> bool:
+    """True when the server refused the request for its content coding."""
+    if response.status_code == 415:
+        return True
+    if response.status_code != 400:
+        return False
+    try:
+        text = response.text
+    except Exception:
+        return False
+    # ``WireCompressionMiddleware`` answers "Invalid gzip body: ..." /
+    # "Invalid zstd body: ..." for bodies it cannot decode.
+    return "invalid gzip body" in text.lower() or "invalid zstd body" in text.lower()
+
+
+async def post_json(
+    client: Any,
+    url: Any,
+    data: Any,
+    *,
+    request_compressor: Optional[RequestCompressor],
+    headers: Optional[Mapping[str, str]] = None,
+    **kwargs: Any,
+) -> Any:
+    """POST ``data`` as JSON, compressed when the server negotiated it.
+
+    A compressed body refused for its coding (415, or a 400 whose body
+    says the gzip/zstd body could not be decoded; for example from a
+    server behind the same load balancer that predates compression) is
+    sent once more uncompressed, and compression stays off until the
+    server advertises it again.  Other errors are returned as they are.
+    """
+    encoded = request_compressor.encode_json(url, data) if request_compressor is not None else None
+    if encoded is None:
+        if headers is not None:
+            kwargs["headers"] = headers
+        return await client.post(url, json=data, **kwargs)
+
+    body, encoding = encoded
+    body_headers = {**(headers or {}), "Content-Type": "application/json"}
+    if encoding is not None:
+        body_headers["Content-Encoding"] = encoding
+    response = await client.post(url, content=body, headers=body_headers, **kwargs)
+    if encoding is not None and _refused_encoding(response):
+        request_compressor.reject(url)
+        if headers is not None:
+            kwargs["headers"] = headers
+        return await client.post(url, json=data, **kwargs)
+    return response
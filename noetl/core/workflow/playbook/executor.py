@@ -65,6 +65,51 @@ def log_task_event(
     )
 
 
+def _start_child_executions(
+    server_url: str,
+    request_payload: Dict[str, Any],
+    payloads: list,
+) -> Dict[str, Any]:
+    """
+    Start one child execution per payload of the same playbook.
+
+    Sends a single ``/execute/batch`` request so the server resolves the
+    catalog entry and loads the playbook once for every child.  Servers
+    without the batch route (404/405) get one ``/execute`` per payload.
+
+    Args:
+        server_url: Server API base URL (ending in ``/api``)
+        request_payload: ExecuteRequest fields shared by every child
+        payloads: One workload dictionary per child
+
+    Returns:
+        ExecuteBatchResponse-shaped dictionary
+    """
+    import requests
+
+    batch_request = {**request_payload, "payloads": payloads}
+    response = requests.post(f"{server_url}/execute/batch", json=batch_request, timeout=60)
+    if response.status_code == 200:
+        return response.json()
+    if response.status_code not in (404, 405):
+        error_detail = response.json().get('detail', response.text) if response.text else 'Unknown error'
+        raise Exception(f"Server returned status {response.status_code}: {error_detail}")
+
+    logger.info("PLAYBOOK: /execute/batch unavailable; starting children one by one")
+    executions = []
+    for payload in payloads:
+        response = requests.post(
+            f"{server_url}/execute",
+            json={**request_payload, "payload": payload},
+            timeout=30
+        )
+        if response.status_code != 200:
+            error_detail = response.json().get('detail', response.text) if response.text else 'Unknown error'
+            raise Exception(f"Server returned status {response.status_code}: {error_detail}")
+        executions.append(response.json())
+    return {"status": "started", "executions": executions}
+
+
 def execute_playbook_task(
     task_config: Dict[str, Any],
     context: Dict[str, Any],
@@ -82,6 +127,10 @@ def execute_playbook_task(
     4. Validates configuration (no deprecated loop blocks)
     5. Delegates to broker for orchestration
     6. Returns execution result
+
+    When ``task_config['inputs']`` is a list, one child execution is
+    started per item (each item merged over ``task_with``) through a
+    single batch request, and ``execution_ids`` lists them in order.
     
     Args:
         task_config: The task configuration
@@ -96,6 +145,7 @@ def execute_playbook_task(
         - status: 'success' or 'error'
         - data: Broker execution result (if success)
         - execution_id: Nested execution ID (if success)
+        - execution_ids: Nested execution IDs (batch inputs only)
         - duration: Task duration in seconds
         - error: Error message (if error)
         
@@ -183,24 +233,39 @@ def execute_playbook_task(
                 except (ValueError, TypeError):
                     pass  # Keep as None if not a valid integer
             
-            # Make synchronous HTTP POST request
-            response = requests.post(
-                execute_url,
-                json=request_payload,
-                timeout=30
-            )
-            
-            if response.status_code != 200:
-                error_detail = response.json().get('detail', response.text) if response.text else 'Unknown error'
-                raise Exception(f"Server returned status {response.status_code}: {error_detail}")
-            
-            result = response.json()
-            
-            logger.info(
-                f"PLAYBOOK: Server execution accepted with "
-                f"status={result.get('status')}, "
-                f"execution_id={result.get('execution_id')}"
-            )
+            batch_inputs = task_config.get('inputs')
+            if isinstance(batch_inputs, list):
+                request_payload.pop("payload")
+                result = _start_child_executions(
+                    server_url,
+                    request_payload,
+                    [build_nested_context(context, {**task_with, **(item or {})}) for item in batch_inputs],
+                )
+                execution_ids = [item.get('execution_id') for item in result.get('executions', [])]
+                logger.info(
+                    f"PLAYBOOK: Server accepted {len(execution_ids)} child executions "
+                    f"with status={result.get('status')}"
+                )
+            else:
+                # Make synchronous HTTP POST request
+                response = requests.post(
+                    execute_url,
+                    json=request_payload,
+                    timeout=30
+                )
+
+                if response.status_code != 200:
+                    error_detail = response.json().get('detail', response.text) if response.text else 'Unknown error'
+                    raise Exception(f"Server returned status {response.status_code}: {error_detail}")
+
+                result = response.json()
+                execution_ids = None
+
+                logger.info(
+                    f"PLAYBOOK: Server execution accepted with "
+                    f"status={result.get('status')}, "
+                    f"execution_id={result.get('execution_id')}"
+                )
             
             end_time = datetime.datetime.now()
             duration = (end_time - start_time).total_seconds()
@@ -221,6 +286,8 @@ def execute_playbook_task(
                 'execution_id': result.get('execution_id'),
                 'duration': duration
             }
+            if execution_ids is not None:
+                success_result['execution_ids'] = execution_ids
             
             logger.debug(f"PLAYBOOK: Exit (success) - result={success_result}")
             return success_result
@@ -15,9 +15,11 @@ from typing import Any, Iterable, Mapping, Optional
 
 DEFAULT_MAX_STEPS = 3
 DEFAULT_MAX_DEPTH = 3
-DEFAULT_ALLOWED_TOOL_KINDS = frozenset({"python", "mcp", "noop"})
+DEFAULT_ALLOWED_TOOL_KINDS = frozenset({"python", "mcp", "noop", "postgres", "duckdb", "http"})
 DEFAULT_ALLOW_LIST = ("automation/agents/mcp/*",)
 ALLOW_LIST_ENV = "NOETL_INLINE_TRIVIAL_CHILDREN_ALLOW_LIST"
+DEFAULT_MAX_LOOP_ITERATIONS = 100
+MAX_LOOP_ITERATIONS_ENV = "NOETL_INLINE_MAX_LOOP_ITERATIONS"
 
 
 @dataclass(frozen=True)
@@ -135,7 +137,7 @@ def detect_inline_child(
     else:
         reasons.append("output_ref:ok:none")
 
-    loop_blocked = _append_loop_reasons(workflow, reasons)
+    loop_blocked = _append_loop_reasons(workflow, reasons, load_max_loop_iterations_from_env())
     blocked = blocked or loop_blocked
 
     tool_blocked = _append_tool_reasons(workflow, reasons, allowed_kinds)
@@ -160,6 +162,16 @@ def load_allow_list_from_env(env: Mapping[str, str] | None = None) -> tuple[str,
     return tuple(item.strip() for item in raw.split(",") if item.strip())
 
 
+def load_max_loop_iterations_from_env(env: Mapping[str, str] | None = None) -> int:
+    """Return the iteration bound for loops run inline."""
+    env = env if env is not None else os.environ
+    raw = str(env.get(MAX_LOOP_ITERATIONS_ENV, "") or "").strip()
+    try:
+        return max(0, int(raw)) if raw else DEFAULT_MAX_LOOP_ITERATIONS
+    except ValueError:
+        return DEFAULT_MAX_LOOP_ITERATIONS
+
+
 def _resolve_depth(parent_context: Mapping[str, Any], explicit_depth: Optional[int]) -> int:
     if explicit_depth is not None:
         return max(0, int(explicit_depth))
@@ -184,7 +196,7 @@ def _path_matches_allow_list(path: Optional[str], patterns: Iterable[str]) -> bo
     return any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
 
 
-def _append_loop_reasons(workflow: list[Any], reasons: list[str]) -> bool:
+def _append_loop_reasons(workflow: list[Any], reasons: list[str], max_iterations: int) -> bool:
     blocked = False
     loop_seen = False
     for idx, raw_step in enumerate(workflow):
@@ -205,6 +217,13 @@ def _append_loop_reasons(workflow: list[Any], reasons: list[str]) -> bool:
         elif str(loop_policy.get("exec") or "").lower() == "distributed":
             reasons.append(f"loop:block:step[{idx}].policy_exec=distributed")
             blocked = True
+        elif loop.get("in") in (None, ""):
+            reasons.append(f"loop:block:step[{idx}].missing_in")
+            blocked = True
+        elif isinstance(loop.get("in"), list) and len(loop["in"]) > max_iterations:
+            # Templated collections are bounded by the runner at render time.
+            reasons.append(f"loop:block:step[{idx}].items={len(loop['in'])}>{max_iterations}")
+            blocked = True
         else:
             reasons.append(f"loop:ok:step[{idx}].mode={mode or 'sequential'}")
     if not loop_seen:
@@ -234,6 +253,10 @@ def _append_tool_reasons(
             elif kind not in allowed_kinds:
                 reasons.append(f"tool:block:step[{idx}].kind={kind}")
                 blocked = True
+            elif kind == "http" and _has_http_pagination(_as_mapping(raw_step).get("tool")):
+                # Paginating retries re-enter the step; leave them to dispatch.
+                reasons.append(f"tool:block:step[{idx}].http_pagination")
+                blocked = True
             else:
                 reasons.append(f"tool:ok:step[{idx}].kind={kind}")
     return blocked
@@ -289,6 +312,16 @@ def _tool_kinds(tool: Any) -> list[str]:
     return [str(kind).strip().lower()] if kind is not None else []
 
 
+def _has_http_pagination(tool: Any) -> bool:
+    for item in tool if isinstance(tool, list) else [tool]:
+        retry = _as_mapping(item).get("retry")
+        for policy in retry if isinstance(retry, list) else []:
+            then_block = _as_mapping(_as_mapping(policy).get("then"))
+            if "next_call" in then_block or "collect" in then_block:
+                return True
+    return False
+
+
 def _contains_async_true(value: Any) -> bool:
     if isinstance(value, Mapping):
         for key, item in value.items():
@@ -6,7 +6,9 @@ round-trip and the NATS dispatch round-trip.
 
 The runner is intentionally narrow in scope:
 - It only accepts children that ``detect_inline_child`` has already approved.
-- It only runs steps whose ``tool.kind`` is ``python``, ``mcp``, or ``noop``.
+- It only runs steps whose ``tool.kind`` is ``python``, ``mcp``, ``noop``,
+  ``postgres``, ``duckdb`` or ``http``, plus sequential ``loop`` steps over
+  at most ``NOETL_INLINE_MAX_LOOP_ITERATIONS`` items.
 - It allocates a fresh child ``execution_id`` using ``uuid`` (the server-side
   snowflake allocator is async and server-local; the runner mirrors the id
   shape without reaching the database).
@@ -46,7 +48,9 @@ from typing import Any, Callable, Dict, List, Optional
 from noetl.core.logger import setup_logger
 from noetl.core.workflow.playbook.inline_execution import (
     DEFAULT_MAX_DEPTH,
+    MAX_LOOP_ITERATIONS_ENV,
     InlineDecision,
+    load_max_loop_iterations_from_env,
 )
 
 logger = setup_logger(__name__, include_location=True)
@@ -366,17 +370,51 @@ async def run_inline(
             child_execution_id,
         )
 
+        loop_spec = raw_step.get("loop") if isinstance(raw_step, dict) else None
+
         # Emit command.started + step.enter
-        await _emit_step_enter(
-            child_execution_id=child_execution_id,
-            step_name=step_name,
-            command_id=step_command_id,
-            inline_meta=inline_meta,
-            batch_event_emitter=batch_event_emitter,
-        )
+        if not loop_spec:
+            await _emit_step_enter(
+                child_execution_id=child_execution_id,
+                step_name=step_name,
+                command_id=step_command_id,
+                inline_meta=inline_meta,
+                batch_event_emitter=batch_event_emitter,
+            )
 
         # Execute the tool
         try:
+            if loop_spec:
+                step_result = await _run_inline_loop(
+                    loop_spec=loop_spec,
+                    tool_kind=tool_kind,
+                    tool_config=tool_config,
+                    step=raw_step,
+                    child_execution_id=child_execution_id,
+                    parent_execution_id=parent_execution_id,
+                    child_context=child_context,
+                    jinja_env=jinja_env,
+                    depth=depth,
+                    inline_meta=inline_meta,
+                    cancellation_probe=cancellation_probe,
+                    batch_event_emitter=batch_event_emitter,
+                )
+                if step_result is None:
+                    cancelled = True
+                    await _emit_cancelled_events(
+                        child_execution_id=child_execution_id,
+                        step_name=step_name,
+                        inline_meta=inline_meta,
+                        batch_event_emitter=batch_event_emitter,
+                    )
+                    break
+                # Loop aggregation: iterations were scrubbed and emitted
+                # individually, so store the aggregate as the step result.
+                last_result = step_result
+                if step_name and step_name not in _BOUNDARY_STEP_NAMES:
+                    last_meaningful_result = step_result
+                child_context[step_name] = step_result
+                continue
             step_result = await _execute_inline_step(
                 tool_kind=tool_kind,
                 tool_config=tool_config,
@@ -885,6 +923,159 @@ async def _emit_workflow_cancelled(
     await _safe_emit(batch_event_emitter, child_execution_id, events)
 
 
+# ---------------------------------------------------------------------------
+# Private helpers — loops
+# ---------------------------------------------------------------------------
+
+
+class _EventBuffer:
+    """Emitter stand-in that collects events so a loop flushes them in one batch."""
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+
+    async def __call__(self, execution_id: str, events: List[Dict[str, Any]]) -> bool:
+        self.events.extend(events)
+        return True
+
+
+def _render_loop_collection(loop_spec: Dict[str, Any], child_context: Dict[str, Any], jinja_env: Any) -> List[Any]:
+    """Render ``loop.in`` against the child context and normalise it to a list."""
+    raw = loop_spec.get("in")
+    if isinstance(raw, str):
+        from noetl.core.dsl.render import render_template
+
+        raw = render_template(jinja_env, raw, child_context)
+    if raw is None:
+        return []
+    if isinstance(raw, (list, tuple, set)):
+        return list(raw)
+    if isinstance(raw, dict):
+        return [raw]
+    if isinstance(raw, str) and ("{{" in raw or "{%" in raw):
+        raise ValueError(f"loop.in did not render to a collection: {raw[:200]}")
+    return [raw]
+
+
+async def _run_inline_loop(
+    *,
+    loop_spec: Dict[str, Any],
+    tool_kind: str,
+    tool_config: Dict[str, Any],
+    step: Any,
+    child_execution_id: str,
+    parent_execution_id: str,
+    child_context: Dict[str, Any],
+    jinja_env: Any,
+    depth: int,
+    inline_meta: Dict[str, Any],
+    cancellation_probe: Callable[[str], Any],
+    batch_event_emitter: Callable,
+) -> Optional[Dict[str, Any]]:
+    """Run a sequential loop step inline and return its aggregated result.
+
+    Iterations get the same per-command events the dispatched loop writes,
+    tagged with ``iter_index``, followed by ``loop.done``.  They are
+    buffered and emitted in one batch.  A failed iteration is counted and
+    the loop continues, as the engine does.  The aggregate matches
+    ``ExecutionState.get_loop_aggregation``.  Returns ``None`` when the
+    parent was cancelled between iterations.
+    """
+    step_name = _step_name(step)
+    collection = _render_loop_collection(loop_spec, child_context, jinja_env)
+    max_iterations = load_max_loop_iterations_from_env()
+    if len(collection) > max_iterations:
+        raise ValueError(
+            f"Loop step '{step_name}' has {len(collection)} items; inline loops are "
+            f"limited to {max_iterations} ({MAX_LOOP_ITERATIONS_ENV})."
+        )
+    iterator = str(loop_spec.get("iterator") or "item")
+    buffer = _EventBuffer()
+    iterations = 0
+    failed_count = 0
+    last_iteration_result: Any = None
+    cancelled = False
+
+    for index, item in enumerate(collection):
+        if index and await _probe_cancellation(cancellation_probe, parent_execution_id, child_execution_id):
+            cancelled = True
+            break
+        iterations += 1
+        iteration_meta = {**inline_meta, "iter_index": index}
+        command_id = _allocate_child_execution_id()
+        iteration_context = {
+            **child_context,
+            iterator: item,
+            "iter": {
+                iterator: item,
+                "_index": index,
+                "_first": index == 0,
+                "_last": index == len(collection) - 1,
+            },
+        }
+        await _emit_step_enter(
+            child_execution_id=child_execution_id,
+            step_name=step_name,
+            command_id=command_id,
+            inline_meta=iteration_meta,
+            batch_event_emitter=buffer,
+        )
+        try:
+            result = await _execute_inline_step(
+                tool_kind=tool_kind,
+                tool_config=tool_config,
+                step=step,
+                child_context=iteration_context,
+                jinja_env=jinja_env,
+                depth=depth,
+            )
+        except Exception as exc:
+            failed_count += 1
+            await _emit_step_error(
+                child_execution_id=child_execution_id,
+                step_name=step_name,
+                command_id=command_id,
+                error_message=str(exc),
+                inline_meta=iteration_meta,
+                batch_event_emitter=buffer,
+            )
+            continue
+        last_iteration_result = await _scrub_result(
+            execution_id=child_execution_id,
+            step_name=step_name,
+            result=result,
+            render_context=iteration_context,
+        )
+        await _emit_step_exit(
+            child_execution_id=child_execution_id,
+            step_name=step_name,
+            command_id=command_id,
+            result=last_iteration_result,
+            inline_meta=iteration_meta,
+            batch_event_emitter=buffer,
+        )
+
+    aggregation = {
+        "results": [last_iteration_result] if last_iteration_result else [],
+        "stats": {"total": iterations, "success": iterations - failed_count, "failed": failed_count},
+    }
+    if not cancelled:
+        buffer.events.append(
+            {
+                "step": step_name,
+                "name": "loop.done",
+                "payload": _with_inline_meta(
+                    {"status": "completed", "iterations": iterations, "result": {"status": "completed", "context": aggregation}},
+                    inline_meta,
+                ),
+                "actionable": False,
+                "informative": True,
+            }
+        )
+    await _safe_emit(batch_event_emitter, child_execution_id, buffer.events)
+    return None if cancelled else aggregation
+
+
 # ---------------------------------------------------------------------------
 # Private helpers — tool execution
 # ---------------------------------------------------------------------------
@@ -934,8 +1125,9 @@ async def _execute_inline_step(
 ) -> Any:
     """Execute a single step using the same tool surfaces as the dispatched path.
 
-    Only ``python``, ``mcp``, and ``noop`` are accepted; the detector guards
-    against any other kind before this function is ever called.
+    Only ``python``, ``mcp``, ``noop``, ``postgres``, ``duckdb`` and ``http``
+    are accepted; the detector guards against any other kind before this
+    function is ever called.
     """
     step_dict = step if isinstance(step, dict) else {}
     step_name = _step_name(step)
@@ -969,6 +1161,36 @@ async def _execute_inline_step(
         result = await execute_mcp_task(task_config, child_context, jinja_env, task_with)
         return result
 
+    if tool_kind in {"postgres", "duckdb", "http"}:
+        task_config = {
+            **tool_config,
+            "name": step_name,
+            **(step_dict.get("with") or {}),
+        }
+        args = dict(step_dict.get("args") or {})
+        if tool_kind == "postgres":
+            from noetl.tools.postgres import execute_postgres_task_async
+
+            if task_config.get("auth") in (None, "", {}) and args.get("auth") in (None, "", {}):
+                raise ValueError(f"Postgres step '{step_name}' is missing auth.")
+            result = await execute_postgres_task_async(task_config, child_context, jinja_env, {**task_config, **args})
+        elif tool_kind == "duckdb":
+            from noetl.tools.duckdb import execute_duckdb_task
+
+            result = await asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: execute_duckdb_task(task_config, child_context, jinja_env, {**task_config, **args}),
+            )
+        else:
+            from noetl.tools.http import execute_http_task
+
+            result = await execute_http_task(task_config, child_context, jinja_env, args)
+        # Same result handling as the worker's dispatched path: an error
+        # envelope fails the step, a success envelope yields its ``data``.
+        if isinstance(result, dict) and result.get("status") == "error":
+            raise RuntimeError(str(result.get("error") or f"{tool_kind} step '{step_name}' failed"))
+        return result.get("data", result) if isinstance(result, dict) else result
+
     # Should never be reached because the detector blocked non-allowed kinds.
     raise ValueError(
         f"Inline runner received unsupported tool kind '{tool_kind}' for step '{step_name}'. "
@@ -346,6 +346,28 @@ CREATE INDEX IF NOT EXISTS idx_event_tenant_org_execution_event_id
 CREATE INDEX IF NOT EXISTS idx_event_stream_version
     ON noetl.event (tenant_id, organization_id, stream_id, stream_version)
     WHERE stream_id IS NOT NULL;
+-- Current version of each event-store stream.  PostgresEventStore.append
+-- bumps this row as its optimistic concurrency check instead of scanning
+-- noetl.event for max(stream_version), which no index or partition key serves.
+-- Stage lifecycle writers bump it too (advance_stream_head); frame streams
+-- use sparse event-id versions and have no head row.  Streams that predate
+-- the table are backfilled once, when it is created.
+DO $$
+BEGIN
+    IF to_regclass('noetl.event_stream_head') IS NULL THEN
+        CREATE TABLE noetl.event_stream_head (
+            stream_id TEXT PRIMARY KEY,
+            version BIGINT NOT NULL,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+        INSERT INTO noetl.event_stream_head (stream_id, version)
+        SELECT stream_id, max(stream_version)
+        FROM noetl.event
+        WHERE stream_id IS NOT NULL
+          AND stream_id NOT LIKE '%/frame/%'
+        GROUP BY stream_id;
+    END IF;
+END $$;
 CREATE INDEX IF NOT EXISTS idx_event_aggregate_event_id
     ON noetl.event (tenant_id, organization_id, aggregate_type, aggregate_id, event_id DESC)
     WHERE aggregate_id IS NOT NULL;
@@ -732,6 +754,13 @@ CREATE INDEX IF NOT EXISTS idx_execution_start_time ON noetl.execution (start_ti
 CREATE INDEX IF NOT EXISTS idx_execution_list_page
     ON noetl.execution ((COALESCE(start_time, created_at)) DESC NULLS LAST, execution_id DESC)
     INCLUDE (catalog_id, parent_execution_id, status, last_event_type, last_node_name, last_event_id, end_time, error);
+-- Auto-resume candidates (noetl.server.auto_resume): live parent executions.
+-- FAILED stays in the index: the projection reports FAILED on any
+-- command.failed while retries may still be pending.
+DROP INDEX IF EXISTS noetl.idx_execution_active_parent;
+CREATE INDEX IF NOT EXISTS idx_execution_live_parent
+    ON noetl.execution (created_at DESC)
+    WHERE parent_execution_id IS NULL AND status NOT IN ('COMPLETED', 'CANCELLED');
 -- Execution projection is maintained by the projection worker and state store.
 -- Explicitly remove the old row-level trigger so schema re-application after
 -- Postgres recovery cannot recreate the high-contention hot path.
@@ -907,6 +936,52 @@ CREATE INDEX IF NOT EXISTS idx_event_loop_epoch_coalesce
     ON noetl.event (execution_id, node_name, (COALESCE(meta->>'loop_event_id', meta->>'__loop_epoch_id')))
     WHERE COALESCE(meta->>'loop_event_id', meta->>'__loop_epoch_id') IS NOT NULL;
 
+-- ============================================================================
+-- noetl.loop_iteration_result — Materialized per-iteration loop results
+-- ============================================================================
+-- One row per (execution, loop epoch, iteration), written in the same
+-- transaction as the terminal call.done / call.error event.  `result` holds
+-- the reference-only envelope ({status, reference, context}), never inline
+-- payload data.  Aggregation reads the PK as an ordered range instead of
+-- scanning noetl.event with result::text LIKE filters.  status is COMPLETED,
+-- FAILED, or SKIPPED for skipped and control-step iterations.  A retried
+-- iteration overwrites its row only with a newer event_id.
+CREATE TABLE IF NOT EXISTS noetl.loop_iteration_result (
+    execution_id        BIGINT NOT NULL,
+    loop_event_id       TEXT NOT NULL,
+    iteration_index     INT NOT NULL,
+    step_name           TEXT NOT NULL,
+    event_id            BIGINT NOT NULL,
+    command_id          BIGINT,
+    status              TEXT NOT NULL,
+    result              JSONB,
+    created_at          TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (execution_id, loop_event_id, iteration_index)
+);
+
+-- Resolve the latest loop epoch for a step without touching noetl.event.
+CREATE INDEX IF NOT EXISTS idx_loop_iteration_result_step_event
+    ON noetl.loop_iteration_result (execution_id, step_name, event_id DESC);
+
+-- ============================================================================
+-- noetl.step_duration_estimate — Learned step durations for dispatch priority
+-- ============================================================================
+-- One row per (playbook path, step, tool kind) key of the duration model,
+-- '' where the key level is open.  The server holding the duration_model
+-- lease folds new command.completed history into the model and upserts the
+-- keys it changed; the other servers load this table instead of scanning
+-- noetl.event.  max(last_event_id) is the history watermark.
+CREATE TABLE IF NOT EXISTS noetl.step_duration_estimate (
+    path                TEXT NOT NULL DEFAULT '',
+    step                TEXT NOT NULL DEFAULT '',
+    tool_kind           TEXT NOT NULL DEFAULT '',
+    ewma_ms             DOUBLE PRECISION NOT NULL,
+    samples             BIGINT NOT NULL,
+    last_event_id       BIGINT NOT NULL,
+    updated_at          TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (path, step, tool_kind)
+);
+
 -- ============================================================================
 -- noetl.command — Runtime worker instruction projection (HASH-partitioned)
 -- ============================================================================
@@ -1005,6 +1080,14 @@ CREATE INDEX IF NOT EXISTS idx_command_execution_status
     WHERE status IN ('PENDING', 'CLAIMED', 'RUNNING');
 CREATE INDEX IF NOT EXISTS idx_command_worker
     ON noetl.command (worker_id, updated_at) WHERE status = 'CLAIMED';
+-- Command reaper sweeps (noetl.server.command_reaper): oldest lease first
+-- among active rows, oldest creation first among pending rows.  Both stay
+-- as small as the live work because the reaper retires leftovers of
+-- concluded executions (emitting a command.cancelled event for each).
+CREATE INDEX IF NOT EXISTS idx_command_active_lease
+    ON noetl.command (claimed_at) WHERE status IN ('CLAIMED', 'RUNNING');
+CREATE INDEX IF NOT EXISTS idx_command_pending_created
+    ON noetl.command (created_at) WHERE status = 'PENDING';
 CREATE INDEX IF NOT EXISTS idx_command_loop
     ON noetl.command (execution_id, loop_event_id, status)
     WHERE loop_event_id IS NOT NULL;
@@ -8,6 +8,7 @@ Usage:
     python -m noetl.server
     python -m noetl.server --host 0.0.0.0 --port 8082
     python -m noetl.server --init-db
+    python -m noetl.server --shards 4   # one process per shard of executions
 """
 
 import argparse
@@ -89,6 +90,13 @@ def main():
         default=8082,
         help="Server port (default: 8082)"
     )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=None,
+        help="Server processes, each owning a hash shard of executions "
+             "(default: NOETL_SERVER_SHARDS or 1; see noetl.server.sharding)"
+    )
     parser.add_argument(
         "--init-db",
         action="store_true",
@@ -112,6 +120,16 @@ def main():
     try:
         import uvicorn
         from noetl.server.app import create_app
+        from noetl.server.sharding import load_server_shards, run_sharded_server
+
+        shards = args.shards if args.shards is not None else load_server_shards()
+        if shards > 1:
+            sys.exit(run_sharded_server(
+                host=args.host,
+                port=args.port,
+                shards=shards,
+                uvicorn_kwargs={"timeout_keep_alive": _load_timeout_keep_alive()},
+            ))
 
         logging.getLogger("uvicorn.access").addFilter(
             AccessLogFilter(_load_suppressed_access_paths())
@@ -3,12 +3,14 @@ NoETL Aggregate API Endpoints - FastAPI routes for aggregate operations.
 
 Provides REST endpoints for:
 - Loop iteration result aggregation
+- Streaming loop iteration results (NDJSON)
 - Event-sourced data retrieval
 """
 
-from typing import Any, Dict
+import json
+from typing import Any, AsyncIterator, Dict, Optional
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from noetl.core.logger import setup_logger
 from noetl.core.sanitize import redact_keychain_values
 from .service import AggregateService
@@ -18,7 +20,11 @@ router = APIRouter()
 
 
 @router.get("/aggregate/loop/results", response_class=JSONResponse)
-async def get_loop_iteration_results(execution_id: str, step_name: str) -> Dict[str, Any]:
+async def get_loop_iteration_results(
+    execution_id: str,
+    step_name: str,
+    loop_event_id: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Return the list of per-iteration results for a given execution and loop step.
     
@@ -30,6 +36,7 @@ async def get_loop_iteration_results(execution_id: str, step_name: str) -> Dict[
     **Query Parameters**:
     - `execution_id`: Execution ID to query
     - `step_name`: Loop step name
+    - `loop_event_id`: Optional loop epoch (defaults to the latest one)
     
     **Example**:
     ```
@@ -45,12 +52,13 @@ async def get_loop_iteration_results(execution_id: str, step_name: str) -> Dict[
             {"city": "Los Angeles", "max_temp": 92, "alert": true}
         ],
         "count": 2,
-        "method": "loop_metadata"
+        "method": "loop_iteration_result"
     }
     ```
     
     **Method Types**:
-    - `loop_metadata`: Results retrieved using loop metadata fields (preferred)
+    - `loop_iteration_result`: Results read from the materialized per-iteration table (preferred)
+    - `loop_metadata`: Results retrieved from the event log using loop metadata fields
     - `legacy_content_filter`: Results retrieved using legacy content-based filtering
     
     **Note**: The legacy method includes a `debug` field with additional information
@@ -59,10 +67,39 @@ async def get_loop_iteration_results(execution_id: str, step_name: str) -> Dict[
     try:
         result = await AggregateService.get_loop_iteration_results(
             execution_id=execution_id,
-            step_name=step_name
+            step_name=step_name,
+            loop_event_id=loop_event_id,
         )
         # Convert Pydantic model to dict for JSONResponse
         return redact_keychain_values(result.model_dump(exclude_none=True))
     except Exception as e:
         logger.exception(f"AGGREGATE.API: Failed to fetch loop results: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/aggregate/loop/results/stream")
+async def stream_loop_iteration_results(
+    execution_id: str,
+    step_name: str,
+    loop_event_id: Optional[str] = None,
+) -> StreamingResponse:
+    """
+    Stream per-iteration results as NDJSON in iteration order.
+
+    Reads the materialized noetl.loop_iteration_result projection page by
+    page, so very large loops are never held in server memory.  Each line is
+    ``{"index": <iteration_index>, "result": <reference-only result>}``.
+    """
+
+    async def _lines() -> AsyncIterator[bytes]:
+        async for row in AggregateService.iter_loop_iteration_results(
+            execution_id, step_name, loop_event_id=loop_event_id
+        ):
+            parsed = AggregateService._parse_results([row])
+            line = {
+                "index": row.get("iteration_index"),
+                "result": parsed[0] if parsed else None,
+            }
+            yield (json.dumps(redact_keychain_values(line), default=str) + "\n").encode("utf-8")
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
@@ -27,7 +27,7 @@ class LoopIterationResultsResponse(BaseModel):
     )
     method: str = Field(
         default="loop_metadata",
-        description="Method used to retrieve results (loop_metadata or legacy_content_filter)"
+        description="Method used to retrieve results (loop_iteration_result, loop_metadata or legacy_content_filter)"
     )
     debug: Optional[Dict[str, Any]] = Field(
         default=None,
@@ -2,13 +2,15 @@
 NoETL Aggregate API Service - Business logic for aggregate operations.
 
 Handles:
-- Loop iteration result aggregation from event log
+- Loop iteration result aggregation from the materialized
+  noetl.loop_iteration_result projection (event log fallback)
 - Event-sourced data retrieval
 - Result filtering and deduplication
 """
 
-from typing import Any, Dict, List, Set
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
 import json
+import os
 from psycopg.rows import dict_row
 from noetl.core.common import get_async_db_connection
 from noetl.core.logger import setup_logger
@@ -16,54 +18,144 @@ from .schema import LoopIterationResultsResponse
 
 logger = setup_logger(__name__, include_location=True)
 
+_LOOP_RESULT_PAGE_SIZE = max(
+    1,
+    int(os.getenv("NOETL_AGGREGATE_LOOP_RESULT_PAGE_SIZE", "1000")),
+)
+
 
 class AggregateService:
     """Service for aggregating execution results from event log."""
-    
+
+    @staticmethod
+    async def iter_loop_iteration_results(
+        execution_id: str,
+        step_name: str,
+        loop_event_id: Optional[str] = None,
+        page_size: int = _LOOP_RESULT_PAGE_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream completed iteration rows from noetl.loop_iteration_result.
+
+        Skipped iterations and control-step results are left out; they are
+        recorded with status ``SKIPPED`` when the row is written.
+        Rows are yielded in iteration order using keyset pages over the
+        ``(execution_id, loop_event_id, iteration_index)`` primary key, so
+        memory stays bounded by ``page_size`` regardless of loop size.  When
+        ``loop_event_id`` is omitted the most recent loop epoch recorded for
+        the step is used.
+
+        Args:
+            execution_id: The execution ID
+            step_name: The loop step name
+            loop_event_id: Optional loop epoch to read
+            page_size: Rows fetched per index range read
+
+        Yields:
+            Dicts with ``iteration_index``, ``loop_event_id`` and ``result``
+        """
+        exec_id = int(execution_id)
+        step = str(step_name).replace(":task_sequence", "")
+        async with get_async_db_connection() as conn:
+            async with conn.cursor(row_factory=dict_row) as cur:
+                if not loop_event_id:
+                    await cur.execute(
+                        """
+                        SELECT loop_event_id
+                        FROM noetl.loop_iteration_result
+                        WHERE execution_id = %s AND step_name = %s
+                        ORDER BY event_id DESC
+                        LIMIT 1
+                        """,
+                        (exec_id, step),
+                    )
+                    row = await cur.fetchone()
+                    if not row:
+                        return
+                    loop_event_id = row["loop_event_id"]
+
+                last_index = -1
+                while True:
+                    await cur.execute(
+                        """
+                        SELECT iteration_index, loop_event_id, result
+                        FROM noetl.loop_iteration_result
+                        WHERE execution_id = %s
+                          AND loop_event_id = %s
+                          AND iteration_index > %s
+                          AND status = 'COMPLETED'
+                        ORDER BY iteration_index
+                        LIMIT %s
+                        """,
+                        (exec_id, str(loop_event_id), last_index, page_size),
+                    )
+                    rows = await cur.fetchall()
+                    for row in rows:
+                        yield row
+                    if len(rows) < page_size:
+                        return
+                    last_index = rows[-1]["iteration_index"]
+
     @staticmethod
     async def get_loop_iteration_results(
         execution_id: str,
-        step_name: str
+        step_name: str,
+        loop_event_id: Optional[str] = None,
     ) -> LoopIterationResultsResponse:
         """
         Get the list of per-iteration results for a given execution and loop step.
         
-        This method sources data from event log only (event-sourced server side),
-        avoiding any worker-side DB access. Uses generic loop metadata fields
-        for robust filtering instead of content-specific logic.
+        Reads the materialized noetl.loop_iteration_result projection first
+        (written at call.done time).  Executions recorded before the
+        projection existed fall back to the event log, using generic loop
+        metadata fields (restricted to ``loop_event_id`` when given) and
+        finally legacy content-based filtering, which predates loop epochs.
         
         Args:
             execution_id: The execution ID
             step_name: The loop step name
+            loop_event_id: Optional loop epoch; defaults to the latest one
             
         Returns:
             LoopIterationResultsResponse with iteration results
         """
+        materialized_rows = [
+            row
+            async for row in AggregateService.iter_loop_iteration_results(
+                execution_id, step_name, loop_event_id=loop_event_id
+            )
+        ]
+        if materialized_rows:
+            results = AggregateService._parse_results(materialized_rows)
+            return LoopIterationResultsResponse(
+                status="ok",
+                results=results,
+                count=len(results),
+                method="loop_iteration_result",
+            )
+
         async with get_async_db_connection() as conn:
             async with conn.cursor(row_factory=dict_row) as cur:
                 # First, try to get results using proper loop metadata fields
                 await cur.execute(
                     """
-                    SELECT DISTINCT
-                        result,
-                        current_index,
-                        loop_id,
-                        node_id,
-                        timestamp
+                    SELECT result
                     FROM noetl.event
                     WHERE execution_id = %s
-                      AND loop_name = %s
-                      AND event_type IN ('result','action_completed')
-                      AND lower(status) IN ('completed','success')
-                      AND result IS NOT NULL 
-                      AND result != '{}' 
-                      AND loop_id IS NOT NULL
-                      AND current_index IS NOT NULL
+                      AND node_name = %s
+                      AND event_type = 'call.done'
+                      AND COALESCE(meta->>'loop_event_id', meta->>'__loop_epoch_id') IS NOT NULL
+                      AND (
+                        %s::text IS NULL
+                        OR COALESCE(meta->>'loop_event_id', meta->>'__loop_epoch_id') = %s::text
+                      )
+                      AND meta ? 'loop_iteration_index'
+                      AND result IS NOT NULL
                       AND NOT (result::text LIKE '%%"skipped": true%%')
                       AND NOT (result::text LIKE '%%"reason": "control_step"%%')
-                    ORDER BY current_index, created_at
+                    ORDER BY (meta->>'loop_iteration_index')::int, event_id
                     """,
-                    (execution_id, step_name)
+                    (int(execution_id), step_name, loop_event_id or None, loop_event_id or None)
                 )
                 metadata_rows = await cur.fetchall()
                 
@@ -99,7 +191,7 @@ class AggregateService:
                       AND NOT (result::text LIKE '%%"reason": "control_step"%%')
                     ORDER BY created_at
                     """,
-                    (execution_id, step_name, f"{execution_id}-step-%-iter-%")
+                    (int(execution_id), step_name, f"{execution_id}-step-%-iter-%")
                 )
                 rows = await cur.fetchall()
         
@@ -1,7 +1,13 @@
 from fastapi import APIRouter
 from .core import get_engine, get_nats_publisher
-from .models import ExecuteRequest, ExecuteResponse, StartExecutionRequest
-from .execution import execute, start_execution
+from .models import (
+    ExecuteBatchRequest,
+    ExecuteBatchResponse,
+    ExecuteRequest,
+    ExecuteResponse,
+    StartExecutionRequest,
+)
+from .execution import execute, execute_batch, start_execution
 from .execution import router as execution_router
 from .commands import router as commands_router
 from .events import router as events_router
@@ -30,8 +36,11 @@ __all__ = [
     "get_nats_publisher",
     "ExecuteRequest",
     "ExecuteResponse",
+    "ExecuteBatchRequest",
+    "ExecuteBatchResponse",
     "StartExecutionRequest",
     "execute",
+    "execute_batch",
     "start_execution",
     "ensure_batch_acceptor_started",
     "shutdown_batch_acceptor",
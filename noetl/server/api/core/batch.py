@@ -15,6 +15,8 @@ from noetl.core.dsl.engine.models import Event
 from noetl.core.messaging import NATSEventPublisher
 from noetl.core.outbox import enqueue_outbox, publish_outbox_batch
 from noetl.core.sanitize import redact_keychain_values
+from noetl.server.api.execution.event_tail import notify_execution_events
+from noetl.server.responses import FastJSONRoute
 from .core import (
     logger, get_engine,
     _BATCH_ACCEPT_QUEUE_MAXSIZE, _BATCH_ACCEPT_WORKERS,
@@ -36,9 +38,10 @@ from .db import (
 from .metrics import _inc_batch_metric, _observe_batch_metric
 from .metrics import get_batch_metrics_snapshot as _get_batch_metrics_snapshot
 from .cache import _active_claim_cache_invalidate
+from .loop_results import _loop_iteration_result_row, _record_loop_iteration_results
 from .recovery import _publish_commands_with_recovery
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 _batch_event_subject_publisher: NATSEventPublisher | None = None
 
 @dataclass(slots=True)
@@ -170,6 +173,7 @@ async def _persist_batch_status_event(execution_id: int, catalog_id: Optional[in
                 ),
             )
             await conn.commit()
+    notify_execution_events(execution_id)
     await _drain_batch_outbox()
 
 async def _persist_batch_failed_event(job: _BatchAcceptJob, code: str, message: str) -> None:
@@ -210,6 +214,7 @@ async def _persist_batch_acceptance(req: BatchEventRequest, idempotency_key: Opt
             event_ids, last_act_evt, last_act_evt_id, term_cmd_ids = [], None, None, set()
             now = datetime.now(timezone.utc)
             insert_params = []
+            loop_result_rows = []
             command_updates = []
             for item in req.events:
                 _validate_reference_only_payload(item.payload)
@@ -226,6 +231,18 @@ async def _persist_batch_acceptance(req: BatchEventRequest, idempotency_key: Opt
                     Json(result_obj),
                     Json(meta), req.worker_id, _extract_event_error(item.payload), cmd_id, now
                 ))
+                if loop_row := _loop_iteration_result_row(
+                    execution_id=exec_id,
+                    step=item.step,
+                    event_name=item.name,
+                    event_id=evt_id,
+                    command_id=cmd_id,
+                    payload=item.payload,
+                    meta=meta,
+                    result_obj=result_obj,
+                    created_at=now,
+                ):
+                    loop_result_rows.append(loop_row)
                 mirrored_events.append(_event_envelope(
                     event_id=evt_id,
                     execution_id=exec_id,
@@ -256,6 +273,7 @@ async def _persist_batch_acceptance(req: BatchEventRequest, idempotency_key: Opt
                     INSERT INTO noetl.event (event_id, execution_id, catalog_id, event_type, node_id, node_name, status, result, meta, worker_id, error, command_id, created_at)
                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """, insert_params)
+            await _record_loop_iteration_results(cur, loop_result_rows)
 
             for event_name, evt_id, worker_id, result_obj, error_text, cmd_id in command_updates:
                 if event_name == "command.started":
@@ -312,12 +330,13 @@ async def _persist_batch_acceptance(req: BatchEventRequest, idempotency_key: Opt
             for event in mirrored_events:
                 await _enqueue_batch_outbox(cur, event)
             await conn.commit()
+            notify_execution_events(exec_id)
             for cid in term_cmd_ids: _active_claim_cache_invalidate(command_id=cid)
     await _drain_batch_outbox()
     return _BatchAcceptanceResult(job=_BatchAcceptJob(request_id, exec_id, catalog_id, req.worker_id, idempotency_key, req.events, last_act_evt, last_act_evt_id, accepted_evt_id, time.perf_counter()), event_ids=event_ids, duplicate=False)
 
 async def _issue_commands_for_batch(job: _BatchAcceptJob, commands: list) -> None:
-    from .commands import _build_command_context, _validate_postgres_command_context_or_422, _store_command_context_if_needed
+    from .commands import _build_command_context, _validate_postgres_command_context_or_422, _store_command_context_if_needed, _locality_preference_meta, _preferred_worker_from_meta
     from .events import _command_issued_envelope
     if not commands: return
     server_url = os.getenv("NOETL_SERVER_URL", "http://noetl.noetl.svc.cluster.local:8082")
@@ -355,6 +374,8 @@ async def _issue_commands_for_batch(job: _BatchAcceptJob, commands: list) -> Non
                     "batch_request_id": job.request_id, 
                     **(cmd.metadata or {})
                 }
+                for key, value in _locality_preference_meta(ctx).items():
+                    meta.setdefault(key, value)
                 prepared_commands.append({
                     "cmd_id": cmd_id, "evt_id": new_evt_id, "ctx": ctx, "meta": meta, "step": cmd.step, "execution_id": int(cmd.execution_id), "tool_kind": cmd.tool.kind
                 })
@@ -416,6 +437,7 @@ async def _issue_commands_for_batch(job: _BatchAcceptJob, commands: list) -> Non
                         ),
                     )
                 await conn.commit()
+                notify_execution_events(*{p["execution_id"] for p in prepared_commands})
 
     await _drain_batch_outbox()
 
@@ -430,7 +452,7 @@ async def _issue_commands_for_batch(job: _BatchAcceptJob, commands: list) -> Non
     # the lookup is free after the first batch for any given playbook.
     from .catalog_path import catalog_path_for
     playbook_path = await catalog_path_for(cat_id)
-    publish_items = [(p["execution_id"], p["evt_id"], p["cmd_id"], p["step"], p.get("tool_kind"), playbook_path) for p in prepared_commands]
+    publish_items = [(p["execution_id"], p["evt_id"], p["cmd_id"], p["step"], p.get("tool_kind"), playbook_path, _preferred_worker_from_meta(p["meta"])) for p in prepared_commands]
     await _publish_commands_with_recovery(publish_items, server_url=server_url)
 
 async def _process_accepted_batch(
@@ -501,6 +523,9 @@ async def _process_accepted_batch(
                 timing_capture["transaction_ms"] = round(
                     (time.perf_counter() - tx_start) * 1000, 3
                 )
+        # The engine may have committed terminal events (playbook.completed,
+        # ...) that issue no commands; wake status/event long-polls now.
+        notify_execution_events(job.last_actionable_event.execution_id)
     elif timing_capture is not None:
         timing_capture["actionable_event"] = False
     issue_start = time.perf_counter()
@@ -5,10 +5,18 @@ from fastapi import APIRouter, HTTPException
 from psycopg.rows import dict_row
 from psycopg_pool import PoolTimeout
 from noetl.core.db.pool import get_pool_connection
+from noetl.core.json_codec import RawJson, fast_json_enabled
 from noetl.core.sanitize import redact_keychain_values
-from noetl.core.runtime.topology import placement_evaluation, worker_locator
+from noetl.core.runtime.topology import (
+    LOCALITY_PREFERENCE_SECONDS,
+    locality_hint_from_refs,
+    locality_preference_wait,
+    placement_evaluation,
+    worker_locator,
+)
 from noetl.core.storage import Scope, default_store, estimate_size
 from noetl.claim_policy import decide_reclaim_for_existing_claim
+from noetl.server.responses import FastJSONResponse, FastJSONRoute
 from .core import (
     logger,
     _COMMAND_CONTEXT_INLINE_MAX_BYTES,
@@ -42,7 +50,7 @@ from .cache import (
     _active_claim_cache_invalidate,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 _COMMAND_CONTEXT_FIELD_INLINE_MAX_BYTES = int(
     os.getenv("NOETL_COMMAND_CONTEXT_FIELD_INLINE_MAX_BYTES", "8192")
 )
@@ -90,6 +98,38 @@ def _claim_topology_metadata(
         )
     return meta
 
+def _locality_preference_meta(context: Any) -> dict[str, Any]:
+    """Command meta steering a command toward the worker holding its large inputs.
+
+    Scans the command context for result refs tagged with their producer's
+    locality (see ``ResultRef.locality``).  When one worker produced enough
+    of the referenced bytes, the command records that worker as
+    ``source_locality`` and gives it a ``locality_preference`` window at
+    claim time.
+    """
+    if LOCALITY_PREFERENCE_SECONDS <= 0:
+        return {}
+    hint = locality_hint_from_refs(context)
+    if not hint:
+        return {}
+    source_locality = {key: value for key, value in hint.items() if key != "bytes"}
+    return {
+        "source_locality": source_locality,
+        "locality_preference": {
+            "worker_id": hint["worker_id"],
+            "bytes": hint["bytes"],
+            "window_seconds": LOCALITY_PREFERENCE_SECONDS,
+        },
+    }
+
+
+def _preferred_worker_from_meta(meta: dict[str, Any] | None) -> Optional[str]:
+    preference = (meta or {}).get("locality_preference")
+    if isinstance(preference, dict) and preference.get("worker_id"):
+        return str(preference["worker_id"])
+    return None
+
+
 def _command_input_from_model(cmd: Any) -> dict[str, Any]:
     cmd_input = getattr(cmd, "input", None)
     return cmd_input if isinstance(cmd_input, dict) else {}
@@ -340,9 +380,61 @@ async def get_command(event_id: int):
                 }
     except HTTPException: raise
     except Exception as e:
-        logger.error(f"get_command failed: {e}", exc_info=True)
+        logger.error("get_command failed: %s", e, exc_info=True)
         raise HTTPException(500, str(e))
 
+def _claim_response(*, event_id: int, execution_id: int, step: str, tool_kind: str, context: Any, meta: dict[str, Any]) -> Any:
+    if isinstance(context, RawJson) and not context.data.lstrip().startswith(b"{"):
+        # ClaimResponse requires an object; anything else is decoded and
+        # validated below instead of being passed through.
+        context = context.decode()
+    if isinstance(context, RawJson):
+        # Same wire shape as ClaimResponse; rendered directly so the raw
+        # context bytes are embedded without validation or re-encoding.
+        return FastJSONResponse({
+            "status": "ok", "event_id": event_id, "execution_id": execution_id, "node_id": step,
+            "node_name": step, "action": tool_kind, "context": context, "meta": meta,
+        })
+    return ClaimResponse(status="ok", event_id=event_id, execution_id=execution_id, node_id=step, node_name=step, action=tool_kind, context=context, meta=meta)
+
+async def _raise_if_locality_preferred(cur, meta: dict[str, Any], issued_at: Any, worker_id: str) -> None:
+    """409 ``locality_preferred`` while the producer of the command's inputs may still claim it.
+
+    The preferred worker only keeps its window while its runtime heartbeat
+    is fresh, so a gone producer never delays the command.
+    """
+    preference = meta.get("locality_preference") if isinstance(meta, dict) else None
+    if not isinstance(preference, dict) or not isinstance(issued_at, datetime):
+        return
+    if issued_at.tzinfo is None:
+        issued_at = issued_at.replace(tzinfo=timezone.utc)
+    wait_seconds = locality_preference_wait(
+        preference,
+        worker_id=worker_id,
+        command_age_seconds=(datetime.now(timezone.utc) - issued_at).total_seconds(),
+    )
+    if wait_seconds <= 0:
+        return
+    preferred = str(preference.get("worker_id"))
+    await cur.execute(
+        "SELECT status, heartbeat FROM noetl.runtime WHERE kind = 'worker_pool' AND name = %s ORDER BY updated_at DESC LIMIT 1",
+        (preferred,),
+    )
+    row = await cur.fetchone()
+    heartbeat = (row or {}).get("heartbeat")
+    if not row or (row.get("status") or "").lower() != "ready" or not isinstance(heartbeat, datetime):
+        return
+    if heartbeat.tzinfo is None:
+        heartbeat = heartbeat.replace(tzinfo=timezone.utc)
+    if (datetime.now(timezone.utc) - heartbeat).total_seconds() > _CLAIM_WORKER_HEARTBEAT_STALE_SECONDS:
+        return
+    raise HTTPException(409, detail={
+        "code": "locality_preferred",
+        "message": f"Command inputs are local to {preferred}",
+        "worker_id": preferred,
+        "retry_after_seconds": round(wait_seconds, 3),
+    }, headers={"Retry-After": f"{wait_seconds:.3f}"})
+
 @router.post("/commands/{event_id}/claim", response_model=ClaimResponse)
 async def claim_command(event_id: int, req: ClaimRequest):
     try:
@@ -354,20 +446,25 @@ async def claim_command(event_id: int, req: ClaimRequest):
                 "worker_id": cached_claim.worker_id, "claim_policy": "cache_fast_path",
             }, headers={"Retry-After": str(max(1, _CLAIM_ACTIVE_RETRY_AFTER_SECONDS))})
 
+        # Fast path: context is returned to the worker unchanged, so fetch
+        # the JSONB as text and embed it verbatim instead of decoding it here
+        # and re-encoding it in the response.
+        raw_context = fast_json_enabled()
+        context_column = "context::text AS context" if raw_context else "context"
         async with get_pool_connection(timeout=_CLAIM_DB_ACQUIRE_TIMEOUT_SECONDS) as conn:
             async with conn.cursor(row_factory=dict_row) as cur:
                 # Primary: query the command projection table (single-row PK lookup)
-                await cur.execute("""
-                    SELECT command_id, execution_id, catalog_id, step_name, tool_kind, context, meta,
-                           status, worker_id, claimed_at, started_at, updated_at
+                await cur.execute(f"""
+                    SELECT command_id, execution_id, catalog_id, step_name, tool_kind, {context_column}, meta,
+                           status, worker_id, claimed_at, started_at, updated_at, created_at
                     FROM noetl.command
                     WHERE event_id = %s
                 """, (event_id,))
                 cmd_row = await cur.fetchone()
                 if not cmd_row:
                     # Fallback: query event table for pre-command-table commands
-                    await cur.execute("""
-                        SELECT execution_id, catalog_id, node_name as step_name, node_type as tool_kind, context, meta
+                    await cur.execute(f"""
+                        SELECT execution_id, catalog_id, node_name as step_name, node_type as tool_kind, {context_column}, meta, created_at
                         FROM noetl.event WHERE event_id = %s AND event_type = 'command.issued'
                     """, (event_id,))
                     cmd_row = await cur.fetchone()
@@ -379,6 +476,8 @@ async def claim_command(event_id: int, req: ClaimRequest):
                 step = cmd_row['step_name']
                 tool_kind = cmd_row['tool_kind']
                 context, meta = cmd_row['context'] or {}, cmd_row['meta'] or {}
+                if raw_context and isinstance(context, str):
+                    context = RawJson(context)
                 # command_id is BIGINT snowflake. Fall back to event_id when neither
                 # cmd_row nor meta has a usable id (last-resort, same numeric domain).
                 _raw_cid = cmd_row.get('command_id') or meta.get('command_id')
@@ -476,7 +575,10 @@ async def claim_command(event_id: int, req: ClaimRequest):
                                                     headers={"Retry-After": str(_CLAIM_ACTIVE_RETRY_AFTER_SECONDS)})
                     if not stale_reclaim:
                         _active_claim_cache_set(event_id, command_id, req.worker_id)
-                        return ClaimResponse(status="ok", event_id=event_id, execution_id=execution_id, node_id=step, node_name=step, action=tool_kind, context=context, meta=meta)
+                        return _claim_response(event_id=event_id, execution_id=execution_id, step=step, tool_kind=tool_kind, context=context, meta=meta)
+
+                if not existing:
+                    await _raise_if_locality_preferred(cur, meta, cmd_row.get("created_at"), req.worker_id)
 
                 claim_evt_id = await _next_snowflake_id(cur)
                 claim_meta = {
@@ -539,15 +641,15 @@ async def claim_command(event_id: int, req: ClaimRequest):
                 await conn.commit()
                 await _drain_core_outbox()
                 _active_claim_cache_set(event_id, command_id, req.worker_id)
-                logger.info(f"[CLAIM] Command {command_id} claimed by {req.worker_id}")
-                return ClaimResponse(status="ok", event_id=event_id, execution_id=execution_id, node_id=step, node_name=step, action=tool_kind, context=context, meta=meta)
+                logger.info("[CLAIM] Command %s claimed by %s", command_id, req.worker_id)
+                return _claim_response(event_id=event_id, execution_id=execution_id, step=step, tool_kind=tool_kind, context=context, meta=meta)
     except HTTPException: raise
     except PoolTimeout:
         raise HTTPException(status_code=503, detail={"code": "pool_saturated"}, headers={"Retry-After": _compute_retry_after()})
     except Exception as e:
         if retry_after := _record_db_unavailable_failure(e, operation="claim_command"):
             raise HTTPException(status_code=503, detail={"code": "db_unavailable"}, headers={"Retry-After": retry_after})
-        logger.error(f"claim_command failed: {e}", exc_info=True)
+        logger.error("claim_command failed: %s", e, exc_info=True)
         raise HTTPException(500, detail={"code": "internal_error", "message": str(e)})
 
 from psycopg.types.json import Json
@@ -11,6 +11,8 @@ from noetl.core.dsl.engine.models import Event
 from noetl.core.outbox import enqueue_outbox, publish_outbox_batch
 from noetl.core.messaging import NATSEventPublisher
 from noetl.server.api.supervision import supervise_persisted_event, supervise_command_issued
+from noetl.server.api.execution.event_tail import notify_execution_events
+from noetl.server.responses import FastJSONRoute
 from .core import (
     logger,
     get_engine,
@@ -35,9 +37,10 @@ from .db import (
     _raise_if_db_short_circuit_enabled,
 )
 from .cache import _active_claim_cache_invalidate
+from .loop_results import _loop_iteration_result_row, _record_loop_iteration_results
 from .recovery import _publish_commands_with_recovery
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 _event_mirror_publisher: NATSEventPublisher | None = None
 _event_subject_publisher: NATSEventPublisher | None = None
 
@@ -233,7 +236,7 @@ async def _invalidate_execution_state_cache(execution_id: str, reason: str, engi
 
 @router.post("/events", response_model=EventResponse)
 async def handle_event(req: EventRequest) -> EventResponse:
-    from .commands import _build_reference_only_result, _build_command_context, _validate_postgres_command_context_or_422, _store_command_context_if_needed
+    from .commands import _build_reference_only_result, _build_command_context, _validate_postgres_command_context_or_422, _store_command_context_if_needed, _locality_preference_meta, _preferred_worker_from_meta
     engine = None
     commands_generated = False
     try:
@@ -292,6 +295,7 @@ async def handle_event(req: EventRequest) -> EventResponse:
                             ),
                         )
                         await conn.commit()
+                        notify_execution_events(req.execution_id)
                         await _drain_core_outbox()
                         _record_db_operation_success()
                         return EventResponse(status="ok", event_id=evt_id, commands_generated=0)
@@ -326,10 +330,23 @@ async def handle_event(req: EventRequest) -> EventResponse:
                         return EventResponse(status="ok", event_id=int(duplicate['event_id']), commands_generated=0)
                 evt_id = await _next_snowflake_id(cur)
                 event_meta["persisted_event_id"] = str(evt_id)
+                created_at = datetime.now(timezone.utc)
                 await cur.execute("""
                     INSERT INTO noetl.event (event_id, execution_id, catalog_id, event_type, node_id, node_name, status, result, meta, error, created_at)
                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (evt_id, int(req.execution_id), catalog_id, req.name, req.step, req.step, status, Json(res_obj), Json(event_meta), error_text, datetime.now(timezone.utc)))
+                """, (evt_id, int(req.execution_id), catalog_id, req.name, req.step, req.step, status, Json(res_obj), Json(event_meta), error_text, created_at))
+                if loop_row := _loop_iteration_result_row(
+                    execution_id=int(req.execution_id),
+                    step=req.step,
+                    event_name=req.name,
+                    event_id=evt_id,
+                    command_id=command_id,
+                    payload=req.payload,
+                    meta=event_meta,
+                    result_obj=res_obj,
+                    created_at=created_at,
+                ):
+                    await _record_loop_iteration_results(cur, [loop_row])
                 await _enqueue_event_outbox(
                     cur,
                     _event_envelope(
@@ -345,6 +362,7 @@ async def handle_event(req: EventRequest) -> EventResponse:
                     ),
                 )
                 await conn.commit()
+                notify_execution_events(req.execution_id)
                 _record_db_operation_success()
 
                 # Update the mutable command projection for lifecycle events
@@ -401,6 +419,9 @@ async def handle_event(req: EventRequest) -> EventResponse:
                     async with engine_conn.cursor() as cur: await cur.execute("SELECT pg_advisory_xact_lock(%s)", (int(req.execution_id),))
                     commands = await engine.handle_event(event, conn=engine_conn, already_persisted=True)
             commands_generated = bool(commands)
+            # Terminal events the engine committed issue no commands; wake
+            # status/event long-polls for them here.
+            notify_execution_events(req.execution_id)
 
         server_url = os.getenv("NOETL_SERVER_URL", "http://noetl.noetl.svc.cluster.local:8082")
         command_events, supervisor_commands = [], []
@@ -414,6 +435,8 @@ async def handle_event(req: EventRequest) -> EventResponse:
                     ctx = _build_command_context(cmd)
                     _validate_postgres_command_context_or_422(step=cmd.step, tool_kind=cmd.tool.kind, context=ctx)
                     meta = {"command_id": cmd_id, "step": cmd.step, "tool_kind": cmd.tool.kind, "triggered_by": req.name, "trigger_step": req.step, "actionable": True, **(cmd.metadata or {})}
+                    for key, value in _locality_preference_meta(ctx).items():
+                        meta.setdefault(key, value)
                     ctx = await _store_command_context_if_needed(execution_id=int(cmd.execution_id), step=cmd.step, command_id=cmd_id, context=ctx)
                     _now = datetime.now(timezone.utc)
                     stage_id = meta.get("stage_id")
@@ -473,9 +496,10 @@ async def handle_event(req: EventRequest) -> EventResponse:
                     # DB transaction commits (commands in this batch
                     # may span multiple executions / catalog_ids when
                     # the engine returns cross-execution work).
-                    command_events.append((int(cmd.execution_id), new_evt_id, cmd_id, cmd.step, cmd.tool.kind, cat_id))
+                    command_events.append((int(cmd.execution_id), new_evt_id, cmd_id, cmd.step, cmd.tool.kind, cat_id, _preferred_worker_from_meta(meta)))
                     supervisor_commands.append((str(cmd.execution_id), cmd_id, cmd.step, int(new_evt_id), dict(meta)))
                 await conn.commit()
+                notify_execution_events(*{exec_id for exec_id, *_ in command_events})
 
         await _drain_core_outbox()
         for s_exec, s_cmd, s_step, s_evt, s_meta in supervisor_commands:
@@ -486,9 +510,9 @@ async def handle_event(req: EventRequest) -> EventResponse:
         from .catalog_path import catalog_path_for
         resolved_events = []
         for ev in command_events:
-            *prefix, ev_cat_id = ev
+            *prefix, ev_cat_id, preferred_worker = ev
             path = await catalog_path_for(ev_cat_id)
-            resolved_events.append((*prefix, path))
+            resolved_events.append((*prefix, path, preferred_worker))
         await _publish_commands_with_recovery(resolved_events, server_url=server_url)
         
         if req.name == "command.completed" and req.step.lower() != "end":
@@ -508,7 +532,7 @@ async def handle_event(req: EventRequest) -> EventResponse:
         if engine and commands_generated: await _invalidate_execution_state_cache(req.execution_id, reason=f"command_issue_failed:{type(e).__name__}", engine=engine)
         if retry_after := _record_db_unavailable_failure(e, operation="handle_event"):
             raise HTTPException(status_code=503, detail={"code": "db_unavailable"}, headers={"Retry-After": retry_after})
-        logger.error(f"handle_event failed: {e}", exc_info=True)
+        logger.error("handle_event failed: %s", e, exc_info=True)
         raise HTTPException(500, str(e))
 
 import json
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 from datetime import datetime, timezone
 from typing import Any, Optional
 from fastapi import APIRouter, HTTPException
@@ -10,8 +12,9 @@ from noetl.core.messaging import NATSEventPublisher
 from noetl.core.outbox import enqueue_outbox, publish_outbox_batch
 from noetl.server.api.supervision import supervise_command_issued
 from noetl.server.api.event_queries import PENDING_COMMAND_COUNT_SQL
+from noetl.server.api.execution.event_tail import event_notifier
 from .core import logger, get_engine
-from .models import ExecuteRequest, ExecuteResponse
+from .models import ExecuteBatchRequest, ExecuteBatchResponse, ExecuteRequest, ExecuteResponse
 from .utils import (
     _iso_timestamp, _duration_fields, _compact_status_variables,
 )
@@ -29,6 +32,11 @@ _STATUS_TERMINAL_EVENT_TYPES = (
     "command.failed",
 )
 _EXECUTABLE_CATALOG_KINDS = {"playbook", "agent"}
+_EXECUTE_BATCH_MAX = max(1, int(os.getenv("NOETL_EXECUTE_BATCH_MAX", "1000")))
+MAX_STATUS_WAIT_SECONDS = 60.0
+STATUS_WAIT_RECHECK_SECONDS = max(
+    0.1, float(os.getenv("NOETL_EXECUTION_STATUS_WAIT_RECHECK_SECONDS", "5"))
+)
 
 
 async def _mirror_execution_events(events: list[dict[str, Any]]) -> None:
@@ -74,157 +82,268 @@ def _normalize_catalog_kind(value: Optional[str]) -> Optional[str]:
     }
     return aliases.get(normalized, normalized) if normalized else None
 
-@router.post("/execute", response_model=ExecuteResponse)
-async def execute(req: ExecuteRequest) -> ExecuteResponse:
+async def _resolve_executable_catalog_entry(req: ExecuteRequest | ExecuteBatchRequest) -> tuple[str, Any]:
+    """Return ``(path, catalog_id)`` of the catalog entry ``req`` names."""
+    requested_kind = _normalize_catalog_kind(req.resource_kind)
+    if requested_kind and requested_kind not in _EXECUTABLE_CATALOG_KINDS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Catalog kind '{req.resource_kind}' is not executable",
+        )
+    allowed_kinds = [requested_kind] if requested_kind else sorted(_EXECUTABLE_CATALOG_KINDS)
+    async with get_pool_connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            if req.catalog_id:
+                await cur.execute(
+                    """
+                    SELECT c.path, c.catalog_id, c.kind
+                    FROM noetl.catalog c
+                    WHERE c.catalog_id = %(catalog_id)s
+                      AND lower(c.kind) = ANY(%(allowed_kinds)s)
+                    """,
+                    {
+                        "catalog_id": req.catalog_id,
+                        "allowed_kinds": allowed_kinds,
+                    },
+                )
+                row = await cur.fetchone()
+                if not row: raise HTTPException(404, f"Executable catalog entry not found: catalog_id={req.catalog_id}")
+                return row['path'], row['catalog_id']
+            if req.version is not None:
+                await cur.execute(
+                    """
+                    SELECT c.catalog_id, c.path
+                    FROM noetl.catalog c
+                    WHERE c.path = %(path)s
+                      AND c.version = %(version)s
+                      AND lower(c.kind) = ANY(%(allowed_kinds)s)
+                    """,
+                    {
+                        "path": req.path,
+                        "version": req.version,
+                        "allowed_kinds": allowed_kinds,
+                    },
+                )
+            else:
+                await cur.execute(
+                    """
+                    SELECT c.catalog_id, c.path
+                    FROM noetl.catalog c
+                    WHERE c.path = %(path)s
+                      AND lower(c.kind) = ANY(%(allowed_kinds)s)
+                    ORDER BY c.version DESC
+                    LIMIT 1
+                    """,
+                    {
+                        "path": req.path,
+                        "allowed_kinds": allowed_kinds,
+                    },
+                )
+            row = await cur.fetchone()
+            if not row: raise HTTPException(404, f"Executable catalog entry not found: {req.path}")
+            return row['path'], row['catalog_id']
+
+
+async def _issue_start_commands(
+    cur: Any,
+    *,
+    execution_id: str,
+    catalog_id: Any,
+    path: str,
+    commands: list,
+    parent_execution_id: Optional[int],
+    command_events: list,
+    supervisor_commands: list,
+) -> None:
+    """Insert the initial ``command.issued`` events and command rows of one execution."""
     from .commands import _build_command_context, _validate_postgres_command_context_or_422, _store_command_context_if_needed
     from .events import _command_issued_envelope
+
+    await cur.execute("SELECT event_id FROM noetl.event WHERE execution_id = %s AND event_type = 'playbook.initialized' LIMIT 1", (int(execution_id),))
+    root_evt_id = (await cur.fetchone() or {}).get('event_id')
+    for cmd in commands:
+        cmd_id, evt_id = await _next_snowflake_id(cur), await _next_snowflake_id(cur)
+        ctx = _build_command_context(cmd)
+        _validate_postgres_command_context_or_422(step=cmd.step, tool_kind=cmd.tool.kind, context=ctx)
+        meta = {"command_id": cmd_id, "step": cmd.step, "tool_kind": cmd.tool.kind, "max_attempts": cmd.max_attempts or 3, "attempt": 1, "execution_id": str(execution_id), "catalog_id": str(catalog_id), "actionable": True, **(cmd.metadata or {})}
+        ctx = await _store_command_context_if_needed(execution_id=int(execution_id), step=cmd.step, command_id=cmd_id, context=ctx)
+        now = datetime.now(timezone.utc)
+        stage_id = meta.get("stage_id")
+        frame_id = meta.get("frame_id")
+        await cur.execute("""
+            INSERT INTO noetl.event (event_id, execution_id, catalog_id, event_type, node_id, node_name, node_type, status, context, meta, parent_event_id, parent_execution_id, command_id, stage_id, frame_id, created_at)
+            VALUES (%(event_id)s, %(execution_id)s, %(catalog_id)s, 'command.issued', %(node_id)s, %(node_name)s, %(node_type)s, 'PENDING', %(context)s, %(meta)s, %(parent_event_id)s, %(parent_execution_id)s, %(command_id)s, %(stage_id)s, %(frame_id)s, %(created_at)s)
+        """, {"event_id": evt_id, "execution_id": int(execution_id), "catalog_id": catalog_id, "node_id": cmd.step, "node_name": cmd.step, "node_type": cmd.tool.kind, "context": Json(ctx), "meta": Json(meta), "parent_event_id": root_evt_id, "parent_execution_id": parent_execution_id, "command_id": cmd_id, "stage_id": stage_id, "frame_id": frame_id, "created_at": now})
+        await cur.execute("""
+            INSERT INTO noetl.command (
+                command_id, event_id, execution_id, catalog_id, parent_execution_id,
+                step_name, tool_kind, status, context, loop_event_id, iter_index, meta, stage_id, frame_id, created_at
+            )
+            VALUES (
+                %(command_id)s, %(event_id)s, %(execution_id)s, %(catalog_id)s, %(parent_execution_id)s,
+                %(step_name)s, %(tool_kind)s, 'PENDING', %(context)s, %(loop_event_id)s, %(iter_index)s, %(meta)s, %(stage_id)s, %(frame_id)s, %(created_at)s
+            )
+            ON CONFLICT (execution_id, command_id) DO NOTHING
+        """, {
+            "command_id": cmd_id,
+            "event_id": evt_id,
+            "execution_id": int(execution_id),
+            "catalog_id": catalog_id,
+            "parent_execution_id": parent_execution_id,
+            "step_name": cmd.step,
+            "tool_kind": cmd.tool.kind,
+            "context": Json(ctx),
+            "loop_event_id": meta.get("__loop_epoch_id") or meta.get("loop_event_id"),
+            "iter_index": meta.get("__loop_claimed_index") or meta.get("iter_index"),
+            "meta": Json(meta),
+            "stage_id": stage_id,
+            "frame_id": frame_id,
+            "created_at": now,
+        })
+        # 6-tuple per noetl/ai-meta#42 + #46 Phase 2.a.2 —
+        # trailing ``(tool_kind, playbook_path)`` drives NATS
+        # subject derivation when pool routing is enabled.
+        # ``path`` here is the catalog row's path, captured
+        # when resolving ``req.path`` / ``req.catalog_id``.
+        command_events.append((int(execution_id), evt_id, cmd_id, cmd.step, cmd.tool.kind, path))
+        await _enqueue_execution_outbox(
+            cur,
+            _command_issued_envelope(
+                event_id=evt_id,
+                execution_id=int(execution_id),
+                catalog_id=catalog_id,
+                command_id=cmd_id,
+                step=cmd.step,
+                tool_kind=cmd.tool.kind,
+                context=ctx,
+                meta=meta,
+                parent_event_id=root_evt_id,
+                parent_execution_id=parent_execution_id,
+                stage_id=stage_id,
+                frame_id=frame_id,
+                created_at=now,
+            ),
+        )
+        supervisor_commands.append((str(execution_id), cmd_id, cmd.step, int(evt_id), dict(meta)))
+
+
+async def _dispatch_start_commands(command_events: list, supervisor_commands: list) -> None:
+    await _drain_execution_outbox()
+    for s_exec, s_cmd, s_step, s_evt, s_meta in supervisor_commands:
+        await supervise_command_issued(s_exec, s_cmd, s_step, event_id=s_evt, meta=s_meta)
+    server_url = os.getenv("NOETL_SERVER_URL", "http://noetl.noetl.svc.cluster.local:8082")
+    await _publish_commands_with_recovery(command_events, server_url=server_url)
+
+
+@router.post("/execute", response_model=ExecuteResponse)
+async def execute(req: ExecuteRequest) -> ExecuteResponse:
     try:
         engine = get_engine()
-        requested_kind = _normalize_catalog_kind(req.resource_kind)
-        if requested_kind and requested_kind not in _EXECUTABLE_CATALOG_KINDS:
-            raise HTTPException(
-                status_code=422,
-                detail=f"Catalog kind '{req.resource_kind}' is not executable",
-            )
-        allowed_kinds = [requested_kind] if requested_kind else sorted(_EXECUTABLE_CATALOG_KINDS)
+        path, catalog_id = await _resolve_executable_catalog_entry(req)
+        execution_id, commands = await engine.start_execution(path, req.payload, catalog_id, req.parent_execution_id)
+        command_events, supervisor_commands = [], []
         async with get_pool_connection() as conn:
             async with conn.cursor(row_factory=dict_row) as cur:
-                if req.catalog_id:
-                    await cur.execute(
-                        """
-                        SELECT c.path, c.catalog_id, c.kind
-                        FROM noetl.catalog c
-                        WHERE c.catalog_id = %(catalog_id)s
-                          AND lower(c.kind) = ANY(%(allowed_kinds)s)
-                        """,
-                        {
-                            "catalog_id": req.catalog_id,
-                            "allowed_kinds": allowed_kinds,
-                        },
-                    )
-                    row = await cur.fetchone()
-                    if not row: raise HTTPException(404, f"Executable catalog entry not found: catalog_id={req.catalog_id}")
-                    path, catalog_id = row['path'], row['catalog_id']
-                else:
-                    if req.version is not None:
-                        await cur.execute(
-                            """
-                            SELECT c.catalog_id, c.path
-                            FROM noetl.catalog c
-                            WHERE c.path = %(path)s
-                              AND c.version = %(version)s
-                              AND lower(c.kind) = ANY(%(allowed_kinds)s)
-                            """,
-                            {
-                                "path": req.path,
-                                "version": req.version,
-                                "allowed_kinds": allowed_kinds,
-                            },
-                        )
-                    else:
-                        await cur.execute(
-                            """
-                            SELECT c.catalog_id, c.path
-                            FROM noetl.catalog c
-                            WHERE c.path = %(path)s
-                              AND lower(c.kind) = ANY(%(allowed_kinds)s)
-                            ORDER BY c.version DESC
-                            LIMIT 1
-                            """,
-                            {
-                                "path": req.path,
-                                "allowed_kinds": allowed_kinds,
-                            },
-                        )
-                    row = await cur.fetchone()
-                    if not row: raise HTTPException(404, f"Executable catalog entry not found: {req.path}")
-                    catalog_id, path = row['catalog_id'], row['path']
-        
-        execution_id, commands = await engine.start_execution(path, req.payload, catalog_id, req.parent_execution_id)
+                await _issue_start_commands(
+                    cur,
+                    execution_id=execution_id,
+                    catalog_id=catalog_id,
+                    path=path,
+                    commands=commands,
+                    parent_execution_id=req.parent_execution_id,
+                    command_events=command_events,
+                    supervisor_commands=supervisor_commands,
+                )
+                await conn.commit()
+        await _dispatch_start_commands(command_events, supervisor_commands)
+        return ExecuteResponse(execution_id=execution_id, status="started", commands_generated=len(commands))
+    except HTTPException: raise
+    except Exception as e: logger.error(f"execute failed: {e}", exc_info=True); raise HTTPException(500, str(e))
+
+
+@router.post("/execute/batch", response_model=ExecuteBatchResponse)
+async def execute_batch(req: ExecuteBatchRequest) -> ExecuteBatchResponse:
+    """Start one execution of the same catalog entry per payload.
+
+    The catalog entry is resolved and its playbook loaded once for the
+    whole batch.  Initial commands of every child are written in one
+    transaction and published together.
+    """
+    try:
+        if len(req.payloads) > _EXECUTE_BATCH_MAX:
+            raise HTTPException(422, f"At most {_EXECUTE_BATCH_MAX} payloads per batch (got {len(req.payloads)})")
+        engine = get_engine()
+        path, catalog_id = await _resolve_executable_catalog_entry(req)
+        playbook = await engine.playbook_repo.load_playbook_by_id(catalog_id)
+        if not playbook:
+            raise HTTPException(404, f"Executable catalog entry not found: catalog_id={catalog_id}")
+        started = []
+        for payload in req.payloads:
+            execution_id, commands = await engine.start_execution(
+                path, payload, catalog_id, req.parent_execution_id, playbook=playbook
+            )
+            started.append((execution_id, commands))
+        command_events, supervisor_commands = [], []
         async with get_pool_connection() as conn:
             async with conn.cursor(row_factory=dict_row) as cur:
-                await cur.execute("SELECT event_id FROM noetl.event WHERE execution_id = %s AND event_type = 'playbook.initialized' LIMIT 1", (int(execution_id),))
-                root_evt_id = (await cur.fetchone() or {}).get('event_id')
-                server_url = os.getenv("NOETL_SERVER_URL", "http://noetl.noetl.svc.cluster.local:8082")
-                command_events, supervisor_commands = [], []
-                for cmd in commands:
-                    cmd_id, evt_id = await _next_snowflake_id(cur), await _next_snowflake_id(cur)
-                    ctx = _build_command_context(cmd)
-                    _validate_postgres_command_context_or_422(step=cmd.step, tool_kind=cmd.tool.kind, context=ctx)
-                    meta = {"command_id": cmd_id, "step": cmd.step, "tool_kind": cmd.tool.kind, "max_attempts": cmd.max_attempts or 3, "attempt": 1, "execution_id": str(execution_id), "catalog_id": str(catalog_id), "actionable": True, **(cmd.metadata or {})}
-                    ctx = await _store_command_context_if_needed(execution_id=int(execution_id), step=cmd.step, command_id=cmd_id, context=ctx)
-                    now = datetime.now(timezone.utc)
-                    stage_id = meta.get("stage_id")
-                    frame_id = meta.get("frame_id")
-                    await cur.execute("""
-                        INSERT INTO noetl.event (event_id, execution_id, catalog_id, event_type, node_id, node_name, node_type, status, context, meta, parent_event_id, parent_execution_id, command_id, stage_id, frame_id, created_at)
-                        VALUES (%(event_id)s, %(execution_id)s, %(catalog_id)s, 'command.issued', %(node_id)s, %(node_name)s, %(node_type)s, 'PENDING', %(context)s, %(meta)s, %(parent_event_id)s, %(parent_execution_id)s, %(command_id)s, %(stage_id)s, %(frame_id)s, %(created_at)s)
-                    """, {"event_id": evt_id, "execution_id": int(execution_id), "catalog_id": catalog_id, "node_id": cmd.step, "node_name": cmd.step, "node_type": cmd.tool.kind, "context": Json(ctx), "meta": Json(meta), "parent_event_id": root_evt_id, "parent_execution_id": req.parent_execution_id, "command_id": cmd_id, "stage_id": stage_id, "frame_id": frame_id, "created_at": now})
-                    await cur.execute("""
-                        INSERT INTO noetl.command (
-                            command_id, event_id, execution_id, catalog_id, parent_execution_id,
-                            step_name, tool_kind, status, context, loop_event_id, iter_index, meta, stage_id, frame_id, created_at
-                        )
-                        VALUES (
-                            %(command_id)s, %(event_id)s, %(execution_id)s, %(catalog_id)s, %(parent_execution_id)s,
-                            %(step_name)s, %(tool_kind)s, 'PENDING', %(context)s, %(loop_event_id)s, %(iter_index)s, %(meta)s, %(stage_id)s, %(frame_id)s, %(created_at)s
-                        )
-                        ON CONFLICT (execution_id, command_id) DO NOTHING
-                    """, {
-                        "command_id": cmd_id,
-                        "event_id": evt_id,
-                        "execution_id": int(execution_id),
-                        "catalog_id": catalog_id,
-                        "parent_execution_id": req.parent_execution_id,
-                        "step_name": cmd.step,
-                        "tool_kind": cmd.tool.kind,
-                        "context": Json(ctx),
-                        "loop_event_id": meta.get("__loop_epoch_id") or meta.get("loop_event_id"),
-                        "iter_index": meta.get("__loop_claimed_index") or meta.get("iter_index"),
-                        "meta": Json(meta),
-                        "stage_id": stage_id,
-                        "frame_id": frame_id,
-                        "created_at": now,
-                    })
-                    # 6-tuple per noetl/ai-meta#42 + #46 Phase 2.a.2 —
-                    # trailing ``(tool_kind, playbook_path)`` drives NATS
-                    # subject derivation when pool routing is enabled.
-                    # ``path`` here is the catalog row's path, captured
-                    # above when resolving ``req.path`` / ``req.catalog_id``.
-                    command_events.append((int(execution_id), evt_id, cmd_id, cmd.step, cmd.tool.kind, path))
-                    await _enqueue_execution_outbox(
+                for execution_id, commands in started:
+                    await _issue_start_commands(
                         cur,
-                        _command_issued_envelope(
-                            event_id=evt_id,
-                            execution_id=int(execution_id),
-                            catalog_id=catalog_id,
-                            command_id=cmd_id,
-                            step=cmd.step,
-                            tool_kind=cmd.tool.kind,
-                            context=ctx,
-                            meta=meta,
-                            parent_event_id=root_evt_id,
-                            parent_execution_id=req.parent_execution_id,
-                            stage_id=stage_id,
-                            frame_id=frame_id,
-                            created_at=now,
-                        ),
+                        execution_id=execution_id,
+                        catalog_id=catalog_id,
+                        path=path,
+                        commands=commands,
+                        parent_execution_id=req.parent_execution_id,
+                        command_events=command_events,
+                        supervisor_commands=supervisor_commands,
                     )
-                    supervisor_commands.append((str(execution_id), cmd_id, cmd.step, int(evt_id), dict(meta)))
                 await conn.commit()
-        await _drain_execution_outbox()
-        for s_exec, s_cmd, s_step, s_evt, s_meta in supervisor_commands:
-            await supervise_command_issued(s_exec, s_cmd, s_step, event_id=s_evt, meta=s_meta)
-        await _publish_commands_with_recovery(command_events, server_url=server_url)
-        return ExecuteResponse(execution_id=execution_id, status="started", commands_generated=len(commands))
+        await _dispatch_start_commands(command_events, supervisor_commands)
+        return ExecuteBatchResponse(
+            status="started",
+            executions=[
+                ExecuteResponse(execution_id=execution_id, status="started", commands_generated=len(commands))
+                for execution_id, commands in started
+            ],
+        )
     except HTTPException: raise
-    except Exception as e: logger.error(f"execute failed: {e}", exc_info=True); raise HTTPException(500, str(e))
+    except Exception as e: logger.error(f"execute_batch failed: {e}", exc_info=True); raise HTTPException(500, str(e))
 
 async def start_execution(req: ExecuteRequest) -> ExecuteResponse:
     return await execute(req)
 
 @router.get("/executions/{execution_id}/status")
-async def get_execution_status(execution_id: str, full: bool = False):
+async def get_execution_status(execution_id: str, full: bool = False, wait_seconds: float = 0.0):
+    """Return the execution's status.
+
+    With ``wait_seconds`` > 0 the call parks until the execution completes
+    or fails (or the wait elapses) instead of the caller re-polling.  Event
+    commits in this process wake it through :data:`event_notifier`; it
+    re-checks every ``NOETL_EXECUTION_STATUS_WAIT_RECHECK_SECONDS`` for
+    writers in other server processes.
+    """
+    wait_seconds = min(max(float(wait_seconds or 0.0), 0.0), MAX_STATUS_WAIT_SECONDS)
+    deadline = time.monotonic() + wait_seconds
+    while True:
+        waiter = event_notifier.register(execution_id) if wait_seconds > 0 else None
+        try:
+            status = await _execution_status(execution_id, full)
+            remaining = deadline - time.monotonic()
+            if waiter is None or remaining <= 0 or status.get("completed") or status.get("failed"):
+                return status
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(waiter),
+                    timeout=min(remaining, STATUS_WAIT_RECHECK_SECONDS),
+                )
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            if waiter is not None:
+                event_notifier.discard(execution_id, waiter)
+
+
+async def _execution_status(execution_id: str, full: bool) -> dict[str, Any]:
     try:
         engine = get_engine(); state = await engine.state_store.load_state(execution_id)
         if not state:
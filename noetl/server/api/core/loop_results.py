@@ -0,0 +1,117 @@
+"""Materialized per-iteration loop results.
+
+Terminal iteration events (``call.done`` / ``call.error``) that carry loop
+metadata are projected into ``noetl.loop_iteration_result`` in the same
+transaction that persists the event.  The row holds the reference-only
+result envelope (``{status, reference, context}``) keyed by
+``(execution_id, loop_event_id, iteration_index)`` so aggregation becomes an
+ordered index range read instead of a ``result::text LIKE`` scan over
+``noetl.event``.  Skipped iterations and control-step results are classified
+once here, as ``SKIPPED``, so readers filter on ``status`` alone.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from psycopg.types.json import Json
+
+_LOOP_RESULT_EVENT_STATUS = {
+    "call.done": "COMPLETED",
+    "call.error": "FAILED",
+}
+_LOOP_RESULT_SKIPPED = "SKIPPED"
+
+# Retries of an iteration emit a newer terminal event; snowflake event ids
+# are monotonic so the latest terminal event wins.
+_UPSERT_LOOP_ITERATION_RESULT_SQL = """
+    INSERT INTO noetl.loop_iteration_result (
+        execution_id, loop_event_id, iteration_index, step_name,
+        event_id, command_id, status, result, created_at
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (execution_id, loop_event_id, iteration_index) DO UPDATE
+    SET step_name = EXCLUDED.step_name,
+        event_id = EXCLUDED.event_id,
+        command_id = EXCLUDED.command_id,
+        status = EXCLUDED.status,
+        result = EXCLUDED.result,
+        created_at = EXCLUDED.created_at
+    WHERE noetl.loop_iteration_result.event_id < EXCLUDED.event_id
+"""
+
+
+def _loop_step_name(step: Any) -> str:
+    return str(step or "").replace(":task_sequence", "")
+
+
+def _loop_iteration_key(payload: Any, meta: Any) -> Optional[tuple[str, int]]:
+    """Return ``(loop_event_id, iteration_index)`` for a loop event, if any."""
+    m = meta if isinstance(meta, dict) else {}
+    p = payload if isinstance(payload, dict) else {}
+    loop_event_id = m.get("loop_event_id") or m.get("__loop_epoch_id") or p.get("loop_event_id")
+    index = m.get("loop_iteration_index")
+    if index is None:
+        index = p.get("loop_iteration_index")
+    if not loop_event_id or index is None:
+        return None
+    try:
+        return str(loop_event_id), int(index)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_skipped_result(value: Any) -> bool:
+    """True for results the event-log readers drop with their ``LIKE`` filters.
+
+    Matches a ``"skipped": true`` or ``"reason": "control_step"`` entry at any
+    depth of the reference-only envelope.
+    """
+    if isinstance(value, dict):
+        if value.get("skipped") is True or value.get("reason") == "control_step":
+            return True
+        return any(_is_skipped_result(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_is_skipped_result(item) for item in value)
+    return False
+
+
+def _loop_iteration_result_row(
+    *,
+    execution_id: int,
+    step: Any,
+    event_name: str,
+    event_id: int,
+    command_id: Optional[int],
+    payload: Any,
+    meta: Any,
+    result_obj: dict[str, Any],
+    created_at: datetime,
+) -> Optional[tuple]:
+    """Build an upsert row for ``noetl.loop_iteration_result`` or ``None``."""
+    status = _LOOP_RESULT_EVENT_STATUS.get(event_name)
+    if status is None:
+        return None
+    key = _loop_iteration_key(payload, meta)
+    if key is None:
+        return None
+    loop_event_id, iteration_index = key
+    if status == "COMPLETED" and _is_skipped_result(result_obj):
+        status = _LOOP_RESULT_SKIPPED
+    return (
+        int(execution_id),
+        loop_event_id,
+        iteration_index,
+        _loop_step_name(step),
+        int(event_id),
+        command_id,
+        status,
+        Json(result_obj),
+        created_at,
+    )
+
+
+async def _record_loop_iteration_results(cur: Any, rows: list[tuple]) -> None:
+    """Upsert materialized iteration rows on the caller's transaction."""
+    if not rows:
+        return
+    await cur.executemany(_UPSERT_LOOP_ITERATION_RESULT_SQL, rows)
@@ -33,6 +33,36 @@ class ExecuteResponse(BaseModel):
     status: str
     commands_generated: int
 
+class ExecuteBatchRequest(BaseModel):
+    """Request to start one execution of the same playbook per payload."""
+    path: Optional[str] = Field(None, description="Playbook catalog path")
+    catalog_id: Optional[int] = Field(None, description="Catalog ID (alternative to path)")
+    version: Optional[int] = Field(None, description="Specific version to execute (used with path)")
+    resource_kind: Optional[str] = Field(
+        None,
+        description="Executable catalog kind to run. Defaults to playbook or agent.",
+    )
+    payloads: list[dict[str, Any]] = Field(
+        default_factory=list,
+        alias="workloads",
+        description="One input payload/workload per child execution",
+    )
+    parent_execution_id: Optional[int] = Field(None, description="Parent execution ID")
+
+    class Config:
+        populate_by_name = True
+
+    @model_validator(mode='after')
+    def validate_path_or_catalog_id(self):
+        if not self.path and not self.catalog_id:
+            raise ValueError("Either 'path' or 'catalog_id' must be provided")
+        return self
+
+class ExecuteBatchResponse(BaseModel):
+    """Response for a batch start, one entry per payload in request order."""
+    status: str
+    executions: list[ExecuteResponse]
+
 class EventRequest(BaseModel):
     """Worker event - reports task completion with result.
 
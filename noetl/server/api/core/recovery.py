@@ -40,15 +40,16 @@ async def _recover_unclaimed_command_after_delay(execution_id: int, event_id: in
     except Exception as exc:
         logger.error("[PUBLISH-RECOVERY] Recovery failed for %s: %s", command_id, exc, exc_info=True)
 
-# The publish tuple is 6-wide:
-#   ``(execution_id, evt_id, cmd_id, step, tool_kind, playbook_path)``.
-# The trailing two fields drive the NATS subject derivation when pool
-# routing is enabled (noetl/ai-meta#42 for tool_kind +
-# noetl/ai-meta#46 Phase 2.a.2 for playbook_path).  Old 4-tuple and
-# 5-tuple callers stay compatible: the helper unpacks defensively and
-# treats missing ``tool_kind`` / ``playbook_path`` as ``None`` (routes
-# to the shared subject, same as today's behaviour for non-privileged
-# playbooks).
+# The publish tuple is up to 7-wide:
+#   ``(execution_id, evt_id, cmd_id, step, tool_kind, playbook_path, preferred_worker)``.
+# ``tool_kind`` / ``playbook_path`` drive the NATS subject derivation when
+# pool routing is enabled (noetl/ai-meta#42 for tool_kind +
+# noetl/ai-meta#46 Phase 2.a.2 for playbook_path).  ``preferred_worker``
+# is the producer of the command's large inputs; it also gets a direct
+# affinity notification.  Shorter legacy tuples stay compatible: the
+# helper unpacks defensively and treats missing fields as ``None``
+# (routes to the shared subject, same as today's behaviour for
+# non-privileged playbooks).
 async def _publish_commands_with_recovery(command_events: list[tuple], *, server_url: str) -> None:
     if not command_events: return
     nats_pub = None
@@ -57,10 +58,10 @@ async def _publish_commands_with_recovery(command_events: list[tuple], *, server
     except Exception as exc:
         logger.warning("[PUBLISH-RECOVERY] NATS publisher unavailable; scheduling delayed recovery: %s", exc)
 
-    async def _safe_publish(exec_id, evt_id, cid, step, tool_kind=None, playbook_path=None):
+    async def _safe_publish(exec_id, evt_id, cid, step, tool_kind=None, playbook_path=None, preferred_worker=None):
         if nats_pub:
             try:
-                await nats_pub.publish_command(execution_id=exec_id, event_id=evt_id, command_id=cid, step=step, server_url=server_url, tool_kind=tool_kind, playbook_path=playbook_path)
+                await nats_pub.publish_command(execution_id=exec_id, event_id=evt_id, command_id=cid, step=step, server_url=server_url, tool_kind=tool_kind, playbook_path=playbook_path, preferred_worker=preferred_worker)
             except Exception as exc:
                 logger.warning("[PUBLISH-RECOVERY] Initial publish failed for %s: %s", cid, exc)
 
@@ -79,7 +80,7 @@ async def _publish_commands_with_recovery(command_events: list[tuple], *, server
     publish_semaphore = asyncio.Semaphore(50) # Max 50 parallel NATS publishes
     async def _sem_publish(args):
         async with publish_semaphore:
-            # Defensive unpack — accept legacy 4-tuple, 5-tuple or new 6-tuple.
+            # Defensive unpack — accept legacy 4- to 6-tuples or the 7-tuple.
             await _safe_publish(*args)
 
     await asyncio.gather(*[_sem_publish(args) for args in command_events])
@@ -4,7 +4,7 @@ import os
 import time
 from collections import Counter, defaultdict
 from datetime import datetime, timezone
-from typing import Annotated, Any, Optional
+from typing import Annotated, Any, Literal, Optional
 from urllib.parse import quote
 from fastapi import APIRouter, HTTPException, Body, Query
 from fastapi.responses import JSONResponse
@@ -16,7 +16,10 @@ from noetl.core.sanitize import redact_keychain_values
 from noetl.core.common import convert_snowflake_ids_for_api, normalize_execution_id_for_db
 from noetl.core.messaging import NATSEventPublisher
 from noetl.core.outbox import enqueue_outbox, publish_outbox_batch
+from noetl.server.api.core.catalog_path import catalog_path_for
 from noetl.server.api.event_queries import PENDING_COMMAND_COUNT_SQL
+from noetl.server.api.execution.event_tail import event_notifier
+from noetl.server.responses import json_response
 from .schema import (
     ExecutionEntryResponse,
     ExecutionDetailResponse,
@@ -48,6 +51,17 @@ DEFAULT_EXECUTIONS_PAGE_SIZE = 100
 MAX_EXECUTIONS_PAGE_SIZE = 200
 MAX_EXECUTIONS_OFFSET = 5000
 
+# Event-feed totals are served from a short-lived cache so polling clients
+# do not re-run COUNT(*) over the execution's events on every page.
+EVENT_TOTAL_CACHE_TTL_SECONDS = float(os.getenv("NOETL_EXECUTION_EVENTS_TOTAL_TTL_SECONDS", "5"))
+_EVENT_TOTAL_CACHE_MAX_ENTRIES = 1024
+_event_total_cache: dict[tuple, tuple[int, float]] = {}
+
+MAX_EVENTS_WAIT_SECONDS = 60.0
+EVENTS_TAIL_RECHECK_SECONDS = max(
+    0.1, float(os.getenv("NOETL_EXECUTION_EVENTS_TAIL_RECHECK_SECONDS", "2"))
+)
+
 
 async def _mirror_execution_route_events(events: list[dict[str, Any]]) -> None:
     from noetl.server.api.core.events import _mirror_events
@@ -132,6 +146,7 @@ def _build_execution_event_filters(
     *,
     since_event_id: Optional[int] = None,
     event_type: Optional[str] = None,
+    before_event_id: Optional[int] = None,
 ) -> tuple[str, dict[str, Any]]:
     where_clauses = ["execution_id = %(execution_id)s"]
     params: dict[str, Any] = {"execution_id": execution_id}
@@ -140,6 +155,10 @@ def _build_execution_event_filters(
         where_clauses.append("event_id > %(since_event_id)s")
         params["since_event_id"] = since_event_id
 
+    if before_event_id is not None:
+        where_clauses.append("event_id < %(before_event_id)s")
+        params["before_event_id"] = before_event_id
+
     if event_type:
         where_clauses.append("event_type = %(event_type)s")
         params["event_type"] = event_type
@@ -168,21 +187,29 @@ def _deserialize_event_row(row: dict[str, Any], execution_id: str) -> dict[str,
     return event_data
 
 
-async def _fetch_execution_events_page(
+async def _count_execution_events(
     cursor,
     *,
     execution_id: str,
-    page: int,
-    page_size: int,
     since_event_id: Optional[int],
     event_type: Optional[str],
-) -> tuple[list[dict[str, Any]], dict[str, int | bool]]:
+) -> tuple[int, bool]:
+    """Return ``(total, estimated)`` for the feed filters.
+
+    ``estimated`` is True when the count came from the TTL cache and may
+    lag events committed in the last ``EVENT_TOTAL_CACHE_TTL_SECONDS``.
+    """
+    key = (str(execution_id), since_event_id, event_type)
+    now = time.monotonic()
+    cached = _event_total_cache.get(key)
+    if cached is not None and now - cached[1] < EVENT_TOTAL_CACHE_TTL_SECONDS:
+        return cached[0], True
+
     where_sql, params = _build_execution_event_filters(
         execution_id,
         since_event_id=since_event_id,
         event_type=event_type,
     )
-
     await cursor.execute(
         f"""
         SELECT COUNT(*) as total
@@ -192,12 +219,44 @@ async def _fetch_execution_events_page(
         params,
     )
     count_row = await cursor.fetchone()
-    total_events = count_row["total"] if count_row else 0
-    total_pages = (total_events + page_size - 1) // page_size if total_events > 0 else 1
-    offset = (page - 1) * page_size
+    total = int(count_row["total"]) if count_row else 0
+    if EVENT_TOTAL_CACHE_TTL_SECONDS > 0:
+        if len(_event_total_cache) >= _EVENT_TOTAL_CACHE_MAX_ENTRIES:
+            _event_total_cache.clear()
+        _event_total_cache[key] = (total, now)
+    return total, False
+
+
+async def _fetch_execution_events_page(
+    cursor,
+    *,
+    execution_id: str,
+    page: int,
+    page_size: int,
+    since_event_id: Optional[int],
+    event_type: Optional[str],
+    before_event_id: Optional[int] = None,
+    order: str = "desc",
+    include_total: bool = True,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Fetch one page of an execution's events.
+
+    ``before_event_id`` (descending) or ``since_event_id`` (ascending) make
+    this an ``event_id`` keyset page that reads only ``page_size + 1`` index
+    entries; without a cursor, ``page`` falls back to OFFSET paging.  The
+    extra row decides ``has_next``; totals are optional and cached.
+    """
+    ascending = order == "asc"
+    keyset = before_event_id is not None or (ascending and since_event_id is not None)
+    where_sql, params = _build_execution_event_filters(
+        execution_id,
+        since_event_id=since_event_id,
+        event_type=event_type,
+        before_event_id=before_event_id,
+    )
 
-    params["page_size"] = page_size
-    params["offset"] = offset
+    params["limit"] = page_size + 1
+    params["offset"] = 0 if keyset else (page - 1) * page_size
     await cursor.execute(
         f"""
         SELECT event_id,
@@ -215,22 +274,48 @@ async def _fetch_execution_events_page(
                duration
         FROM noetl.event
         WHERE {where_sql}
-        ORDER BY event_id DESC
-        LIMIT %(page_size)s OFFSET %(offset)s
+        ORDER BY event_id {"ASC" if ascending else "DESC"}
+        LIMIT %(limit)s OFFSET %(offset)s
         """,
         params,
     )
     rows = await cursor.fetchall()
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
     events = [_deserialize_event_row(row, execution_id) for row in rows]
 
-    return events, {
+    pagination: dict[str, Any] = {
         "page": page,
         "page_size": page_size,
-        "total_events": total_events,
-        "total_pages": total_pages,
-        "has_next": page < total_pages,
-        "has_prev": page > 1,
+        "total_events": None,
+        "total_pages": None,
+        "total_estimated": False,
+        "has_next": has_next,
+        "has_prev": before_event_id is not None or (not keyset and page > 1),
+        # The next page continues past the last row in page order: older
+        # events (before_event_id) descending, newer (since_event_id) ascending.
+        "next_cursor": str(rows[-1]["event_id"]) if has_next and rows else None,
+        "next_cursor_param": "since_event_id" if ascending else "before_event_id",
+        "tail_cursor": _tail_cursor(rows, since_event_id),
     }
+    if include_total:
+        total_events, estimated = await _count_execution_events(
+            cursor,
+            execution_id=execution_id,
+            since_event_id=since_event_id,
+            event_type=event_type,
+        )
+        pagination["total_events"] = total_events
+        pagination["total_pages"] = (total_events + page_size - 1) // page_size if total_events > 0 else 1
+        pagination["total_estimated"] = estimated
+    return events, pagination
+
+
+def _tail_cursor(rows: list[dict[str, Any]], since_event_id: Optional[int]) -> Optional[str]:
+    event_ids = [int(row["event_id"]) for row in rows if row.get("event_id") is not None]
+    if since_event_id is not None:
+        event_ids.append(int(since_event_id))
+    return str(max(event_ids)) if event_ids else None
 
 
 async def _fetch_pending_command_counts_for_executions(
@@ -501,6 +586,57 @@ def _derive_execution_terminal_status(row: Optional[dict[str, Any]]) -> str:
 
 _PENDING_COMMAND_COUNT_SQL = PENDING_COMMAND_COUNT_SQL
 
+_FIRST_EVENT_SQL = """
+    SELECT event_id, event_type, catalog_id, parent_execution_id, created_at, status
+    FROM noetl.event
+    WHERE execution_id = %(execution_id)s
+    ORDER BY event_id ASC
+    LIMIT 1
+"""
+
+_TERMINAL_EVENT_SQL = """
+    SELECT event_type, status, created_at, error
+    FROM noetl.event
+    WHERE execution_id = %(execution_id)s
+      AND event_type IN ('execution.cancelled', 'playbook.failed', 'workflow.failed',
+                         'command.failed', 'playbook.completed', 'workflow.completed')
+    ORDER BY event_id DESC
+    LIMIT 1
+"""
+
+_LATEST_EVENT_SQL = """
+    SELECT event_type, node_name, created_at, status, error
+    FROM noetl.event
+    WHERE execution_id = %(execution_id)s
+    ORDER BY event_id DESC
+    LIMIT 1
+"""
+
+
+async def _fetch_execution_status_rows(cursor, execution_id: str):
+    """Return ``(terminal_event, latest_event, pending_row)`` for status inference."""
+    await cursor.execute(_TERMINAL_EVENT_SQL, {"execution_id": execution_id})
+    terminal_event = await cursor.fetchone()
+
+    # Latest event for end_time and fallback completion inference
+    await cursor.execute(_LATEST_EVENT_SQL, {"execution_id": execution_id})
+    latest_event = await cursor.fetchone()
+
+    pending_row = {"pending_count": 0}
+    should_check_pending_commands = (
+        terminal_event is None
+        and latest_event is not None
+        and latest_event.get("event_type") == "batch.completed"
+        and latest_event.get("status") == "COMPLETED"
+    )
+    if should_check_pending_commands:
+        await cursor.execute(
+            _PENDING_COMMAND_COUNT_SQL,
+            {"execution_id": execution_id},
+        )
+        pending_row = await cursor.fetchone()
+    return terminal_event, latest_event, pending_row
+
 
 def _infer_execution_completion_from_events(
     latest_event: Optional[dict[str, Any]],
@@ -1282,50 +1418,11 @@ async def get_execution(
                 )
 
             # Also get execution metadata (first event info) in a separate efficient query
-            await cursor.execute("""
-                SELECT event_id, event_type, catalog_id, parent_execution_id, created_at, status
-                FROM noetl.event
-                WHERE execution_id = %(execution_id)s
-                ORDER BY event_id ASC
-                LIMIT 1
-            """, {"execution_id": execution_id})
+            await cursor.execute(_FIRST_EVENT_SQL, {"execution_id": execution_id})
             first_event = await cursor.fetchone()
-
-            # Get terminal status efficiently
-            await cursor.execute("""
-                SELECT event_type, status, created_at, error
-                FROM noetl.event
-                WHERE execution_id = %(execution_id)s
-                  AND event_type IN ('execution.cancelled', 'playbook.failed', 'workflow.failed',
-                                     'command.failed', 'playbook.completed', 'workflow.completed')
-                ORDER BY event_id DESC
-                LIMIT 1
-            """, {"execution_id": execution_id})
-            terminal_event = await cursor.fetchone()
-
-            # Get latest event for end_time and fallback completion inference
-            await cursor.execute("""
-                SELECT event_type, node_name, created_at, status, error
-                FROM noetl.event
-                WHERE execution_id = %(execution_id)s
-                ORDER BY event_id DESC
-                LIMIT 1
-            """, {"execution_id": execution_id})
-            latest_event = await cursor.fetchone()
-
-            pending_row = {"pending_count": 0}
-            should_check_pending_commands = (
-                terminal_event is None
-                and latest_event is not None
-                and latest_event.get("event_type") == "batch.completed"
-                and latest_event.get("status") == "COMPLETED"
+            terminal_event, latest_event, pending_row = await _fetch_execution_status_rows(
+                cursor, execution_id
             )
-            if should_check_pending_commands:
-                await cursor.execute(
-                    _PENDING_COMMAND_COUNT_SQL,
-                    {"execution_id": execution_id},
-                )
-                pending_row = await cursor.fetchone()
 
     if first_event is None:
         # No events found - check engine fallback
@@ -1413,39 +1510,102 @@ async def get_execution(
     )
 
 
+async def _fetch_execution_feed_header(cursor, execution_id: str) -> Optional[dict[str, Any]]:
+    """Path and status for the events feed without building the full detail."""
+    await cursor.execute(_FIRST_EVENT_SQL, {"execution_id": execution_id})
+    first_event = await cursor.fetchone()
+    if first_event is None:
+        return None
+    terminal_event, latest_event, pending_row = await _fetch_execution_status_rows(cursor, execution_id)
+    status, _ = _infer_execution_completion_from_events(
+        dict(latest_event) if latest_event else None,
+        dict(terminal_event) if terminal_event else None,
+        int((pending_row or {}).get("pending_count", 0)),
+    )
+    return {"catalog_id": first_event.get("catalog_id"), "status": status}
+
+
 @router.get("/executions/{execution_id}/events", response_class=JSONResponse)
 async def get_execution_events(
     execution_id: str,
-    page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
+    page: int = Query(default=1, ge=1, description="Page number (1-indexed); prefer before_event_id for deep pages"),
     page_size: int = Query(default=100, ge=10, le=500, description="Events per page"),
     since_event_id: Optional[int] = Query(default=None, description="Get events after this event_id (for incremental loading)"),
     event_type: Optional[str] = Query(default=None, description="Filter by event type"),
+    before_event_id: Optional[int] = Query(default=None, description="Keyset cursor: events older than this event_id (pagination.next_cursor when order=desc)"),
+    order: Literal["desc", "asc"] = Query(default="desc", description="Sort by event_id; use asc with since_event_id to tail"),
+    include_total: bool = Query(default=True, description="Include total_events/total_pages (cached estimate)"),
+    wait_seconds: float = Query(default=0.0, ge=0.0, le=MAX_EVENTS_WAIT_SECONDS, description="Long-poll: wait up to this long for new events when the page is empty"),
 ):
-    detail = await get_execution(
-        execution_id=execution_id,
-        page=1,
-        page_size=1,
-        since_event_id=None,
-        event_type=None,
-        include_events=False,
-    )
-    async with get_pool_connection() as conn:
-        async with conn.cursor(row_factory=dict_row) as cursor:
-            events, pagination = await _fetch_execution_events_page(
-                cursor,
-                execution_id=execution_id,
-                page=page,
-                page_size=page_size,
-                since_event_id=since_event_id,
-                event_type=event_type,
-            )
-    return {
-        "execution_id": detail.execution_id,
-        "path": detail.path,
-        "status": detail.status,
+    """
+    Page through an execution's events, or tail them.
+
+    Deep pages should follow ``pagination.next_cursor`` instead of ``page``,
+    passed as the parameter named by ``pagination.next_cursor_param``
+    (``before_event_id`` descending, ``since_event_id`` ascending).  To tail, pass
+    ``order=asc&since_event_id=<pagination.tail_cursor>&wait_seconds=N``:
+    an empty page parks until the event routes commit new events for the
+    execution (or ``wait_seconds`` elapses) instead of the client re-polling.
+    """
+    deadline = time.monotonic() + wait_seconds
+    header: dict[str, Any] = {}
+    while True:
+        waiter = event_notifier.register(execution_id) if wait_seconds > 0 else None
+        try:
+            async with get_pool_connection() as conn:
+                async with conn.cursor(row_factory=dict_row) as cursor:
+                    # Status is re-read on every pass, before the page, so a
+                    # parked tail returns as soon as the execution concludes
+                    # and the page already holds the events behind the status.
+                    feed = await _fetch_execution_feed_header(cursor, execution_id)
+                    events, pagination = await _fetch_execution_events_page(
+                        cursor,
+                        execution_id=execution_id,
+                        page=page,
+                        page_size=page_size,
+                        since_event_id=since_event_id,
+                        event_type=event_type,
+                        before_event_id=before_event_id,
+                        order=order,
+                        include_total=include_total,
+                    )
+            if feed is None:
+                # No events persisted: the detail builder falls back to engine
+                # state or raises 404.
+                detail = await get_execution(
+                    execution_id=execution_id,
+                    page=1,
+                    page_size=10,
+                    since_event_id=None,
+                    event_type=None,
+                    include_events=False,
+                )
+                header = {"path": detail.path, "status": detail.status}
+            else:
+                path = header.get("path") or await catalog_path_for(feed.get("catalog_id")) or "unknown"
+                header = {"path": path, "status": feed["status"]}
+
+            remaining = deadline - time.monotonic()
+            if events or waiter is None or remaining <= 0 or header["status"] != "RUNNING":
+                break
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(waiter),
+                    timeout=min(remaining, EVENTS_TAIL_RECHECK_SECONDS),
+                )
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            if waiter is not None:
+                event_notifier.discard(execution_id, waiter)
+
+    return json_response({
+        "execution_id": execution_id,
+        "path": header["path"],
+        "status": header["status"],
         "events": redact_keychain_values(events),
         "pagination": pagination,
-    }
+    })
 
 
 @router.post("/executions/{execution_id}/analyze", response_model=AnalyzeExecutionResponse)
@@ -0,0 +1,66 @@
+"""In-process wake-ups for long-poll readers of an execution's event feed.
+
+``GET /api/executions/{id}/events?wait_seconds=N`` parks on
+:data:`event_notifier` instead of re-querying ``noetl.event`` while an
+execution is quiet.  The event and batch routes call
+:func:`notify_execution_events` after each commit.  Writers in other server
+processes cannot reach this notifier, so readers still re-check the table
+every ``NOETL_EXECUTION_EVENTS_TAIL_RECHECK_SECONDS`` while they wait.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+
+class ExecutionEventNotifier:
+    """Per-execution futures resolved when new events are committed."""
+
+    def __init__(self) -> None:
+        self._waiters: dict[str, set[asyncio.Future]] = {}
+
+    def register(self, execution_id: Any) -> asyncio.Future:
+        """Return a future resolved by the next :meth:`notify` for ``execution_id``.
+
+        Register before querying so an event committed between the query
+        and the wait is not missed.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(str(execution_id), set()).add(waiter)
+        return waiter
+
+    def discard(self, execution_id: Any, waiter: asyncio.Future) -> None:
+        key = str(execution_id)
+        waiters = self._waiters.get(key)
+        if waiters is None:
+            return
+        waiters.discard(waiter)
+        if not waiters:
+            self._waiters.pop(key, None)
+
+    def notify(self, execution_id: Any) -> int:
+        """Wake every reader waiting on ``execution_id``; return how many."""
+        waiters = self._waiters.pop(str(execution_id), None)
+        if not waiters:
+            return 0
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(True)
+        return len(waiters)
+
+    def waiting(self, execution_id: Any) -> int:
+        return len(self._waiters.get(str(execution_id), ()))
+
+
+event_notifier = ExecutionEventNotifier()
+
+
+def notify_execution_events(*execution_ids: Any) -> None:
+    """Wake long-poll readers of each execution in ``execution_ids``."""
+    for execution_id in execution_ids:
+        if execution_id is not None:
+            event_notifier.notify(execution_id)
+
+
+__all__ = ["ExecutionEventNotifier", "event_notifier", "notify_execution_events"]
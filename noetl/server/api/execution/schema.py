@@ -42,10 +42,16 @@ class ExecutionEventsPagination(AppBaseModel):
 
     page: int = Field(..., ge=1)
     page_size: int = Field(..., ge=1)
-    total_events: int = Field(..., ge=0)
-    total_pages: int = Field(..., ge=1)
+    total_events: Optional[int] = Field(None, ge=0, description="Matching events; omitted when include_total is false")
+    total_pages: Optional[int] = Field(None, ge=1)
+    total_estimated: bool = Field(False, description="True when total_events was served from the short-lived count cache")
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = Field(None, description="event_id keyset cursor for the next page")
+    next_cursor_param: Optional[str] = Field(
+        None, description="Query parameter that takes next_cursor: before_event_id (desc) or since_event_id (asc)"
+    )
+    tail_cursor: Optional[str] = Field(None, description="Newest event_id seen; pass as since_event_id to tail")
 
 class ExecutionEntryResponse(AppBaseModel):
     """Response schema for a single execution entry."""
@@ -17,7 +17,7 @@ from noetl.core.messaging import NATSEventPublisher
 from noetl.core.outbox import enqueue_outbox, publish_outbox_batch
 from noetl.core.runtime.topology import placement_evaluation, worker_locator
 
-from noetl.server.api.core.db import _next_snowflake_id
+from noetl.server.api.core.db import _next_snowflake_id, _next_snowflake_ids
 
 from .schema import FrameClaimRequest, FrameCommitRequest, FrameHeartbeatRequest
 
@@ -154,38 +154,6 @@ async def _load_idempotent_claimed_frame(
     return dict(frame) if frame else None
 
 
-async def _load_frame_by_claim_key(
-    cur: Any,
-    *,
-    stage_id: int,
-    cursor: dict[str, Any] | None,
-) -> dict[str, Any] | None:
-    claim_key = _frame_claim_key(stage_id=stage_id, cursor=cursor)
-    if claim_key is None:
-        return None
-    _, worker_slot_id, frame_index = claim_key
-    await cur.execute(
-        """
-        SELECT f.*,
-               (
-                   f.status IN ('CLAIMED','RUNNING')
-                   AND (f.lease_until IS NULL OR f.lease_until < now())
-               ) AS expired_lease
-        FROM noetl.frame f
-        WHERE f.stage_id = %s
-          AND f.cursor->>'worker_slot_id' = %s
-          AND f.cursor->>'frame_index' = %s
-          AND f.status IN ('PENDING','CLAIMED','RUNNING')
-        ORDER BY f.frame_id DESC
-        FOR UPDATE SKIP LOCKED
-        LIMIT 1
-        """,
-        (stage_id, worker_slot_id, frame_index),
-    )
-    frame = await cur.fetchone()
-    return dict(frame) if frame else None
-
-
 def _frame_stream_id(*, execution_id: int, stage_id: int) -> str:
     return f"execution/{execution_id}/stage/{stage_id}"
 
@@ -242,59 +210,176 @@ async def _resolve_parent_frame_id(cur: Any, *, stage_id: int, cursor: dict[str,
     return (row or {}).get("frame_id")
 
 
-async def _load_claimable_frame(cur: Any, *, stage_id: int) -> dict[str, Any] | None:
+async def _claim_frame_batch(
+    cur: Any,
+    *,
+    stage_id: int,
+    worker_id: str,
+    command_id: int | None,
+    lease_seconds: int,
+    limit: int,
+    frame_ids: list[int] | None = None,
+    claim_key: tuple[int, str, str] | None = None,
+) -> list[dict[str, Any]]:
+    """Lease up to ``limit`` pending or lease-expired frames in one statement.
+
+    Candidates are locked with ``FOR UPDATE SKIP LOCKED`` so concurrent
+    claimers partition the backlog instead of queueing on each other.  The
+    pre-claim owner/lease/attempts are returned alongside the updated row so
+    the caller can emit ``frame.abandoned`` for reclaimed leases.
+    """
+    filters = ""
+    params: dict[str, Any] = {
+        "stage_id": stage_id,
+        "worker_id": worker_id,
+        "command_id": command_id,
+        "lease_seconds": lease_seconds,
+        "limit": limit,
+    }
+    if frame_ids is not None:
+        filters += "\n          AND f.frame_id = ANY(%(frame_ids)s)"
+        params["frame_ids"] = list(frame_ids)
+    if claim_key is not None:
+        filters += (
+            "\n          AND f.cursor->>'worker_slot_id' = %(worker_slot_id)s"
+            "\n          AND f.cursor->>'frame_index' = %(frame_index)s"
+        )
+        params["worker_slot_id"] = claim_key[1]
+        params["frame_index"] = claim_key[2]
     await cur.execute(
-        """
-        SELECT f.*,
-               (
-                   f.status IN ('CLAIMED','RUNNING')
-                   AND (f.lease_until IS NULL OR f.lease_until < now())
-               ) AS expired_lease
-        FROM noetl.frame f
-        WHERE f.stage_id = %s
-          AND (
-            f.status = 'PENDING'
-            OR (f.status IN ('CLAIMED','RUNNING')
-                AND (f.lease_until IS NULL OR f.lease_until < now()))
-          )
-        ORDER BY f.frame_id
-        FOR UPDATE SKIP LOCKED
-        LIMIT 1
+        f"""
+        WITH candidates AS (
+            SELECT f.frame_id,
+                   f.owner_worker AS previous_owner_worker,
+                   f.lease_until AS previous_lease_until,
+                   f.attempts AS previous_attempts,
+                   f.status IN ('CLAIMED','RUNNING') AS expired_lease
+            FROM noetl.frame f
+            WHERE f.stage_id = %(stage_id)s
+              AND (
+                f.status = 'PENDING'
+                OR (f.status IN ('CLAIMED','RUNNING')
+                    AND (f.lease_until IS NULL OR f.lease_until < now()))
+              ){filters}
+            ORDER BY f.frame_id
+            FOR UPDATE SKIP LOCKED
+            LIMIT %(limit)s
+        )
+        UPDATE noetl.frame f
+        SET status = 'CLAIMED',
+            owner_worker = %(worker_id)s,
+            command_id = COALESCE(f.command_id, %(command_id)s),
+            claimed_event_id = noetl.snowflake_id(),
+            lease_until = now() + (%(lease_seconds)s || ' seconds')::interval,
+            attempts = f.attempts + 1,
+            updated_at = now()
+        FROM candidates c
+        WHERE f.frame_id = c.frame_id
+        RETURNING f.*, c.expired_lease, c.previous_owner_worker,
+                  c.previous_lease_until, c.previous_attempts
         """,
-        (stage_id,),
+        params,
     )
-    frame = await cur.fetchone()
-    return dict(frame) if frame else None
+    rows = await cur.fetchall()
+    return sorted((dict(row) for row in rows), key=lambda row: row["frame_id"])
 
 
-async def _insert_frame_event(
+async def _mint_frames(
     cur: Any,
+    *,
+    stage: dict[str, Any],
+    command_id: int | None,
+    cursor: dict[str, Any] | None,
+    count: int,
+) -> list[int]:
+    """Insert ``count`` PENDING frames in one statement and return new ids.
+
+    Frame rows are minted lazily after the cursor driver has claimed
+    external work.  Duplicate retries converge on the
+    stage/worker-slot/frame-index key via the partial unique index instead
+    of a hot-path advisory transaction lock, so ids that lost the race are
+    simply absent from the result.
+    """
+    if count <= 0:
+        return []
+    stage_id = int(stage["stage_id"])
+    frame_ids = sorted(await _next_snowflake_ids(cur, count))
+    parent_frame_id = await _resolve_parent_frame_id(cur, stage_id=stage_id, cursor=cursor)
+    # Frames minted together chain onto each other in id order, matching
+    # what one-at-a-time minting recorded as the latest parent.
+    parent_ids = [parent_frame_id, *frame_ids[:-1]]
+    params: list[Any] = []
+    for frame_id, parent_id in zip(frame_ids, parent_ids):
+        params.extend(
+            (
+                frame_id,
+                stage_id,
+                stage["execution_id"],
+                parent_id,
+                Json(cursor or {}),
+                command_id,
+                stage["tenant_id"],
+                stage["organization_id"],
+            )
+        )
+    values = ",\n".join(["(%s, %s, %s, %s, %s, 0, 'PENDING', %s, %s, %s)"] * len(frame_ids))
+    await cur.execute(
+        f"""
+        INSERT INTO noetl.frame (
+            frame_id, stage_id, execution_id, parent_frame_id,
+            cursor, row_count, status, command_id,
+            tenant_id, organization_id
+        )
+        VALUES {values}
+        ON CONFLICT DO NOTHING
+        RETURNING frame_id
+        """,
+        params,
+    )
+    return [int(row["frame_id"]) for row in await cur.fetchall()]
+
+
+_FRAME_EVENT_INSERT_SQL = """
+        INSERT INTO noetl.event (
+            event_id, execution_id, catalog_id, event_type, node_name, status, result, meta,
+            worker_id, tenant_id, organization_id, stream_id, aggregate_id,
+            aggregate_type, schema_name, schema_version, event_time, ingest_time,
+            producer, idempotency_key, payload_ref, stream_version,
+            envelope_checksum, stage_id, frame_id, created_at
+        )
+        VALUES
+"""
+
+
+def _frame_event_values_sql(suffix: str = "") -> str:
+    return """(
+            %(event_id{s})s, %(execution_id{s})s, %(catalog_id{s})s, %(event_type{s})s, %(node_name{s})s,
+            %(status{s})s, %(result{s})s, %(meta{s})s, %(worker_id{s})s, %(tenant_id{s})s,
+            %(organization_id{s})s, %(stream_id{s})s, %(aggregate_id{s})s, 'frame',
+            %(schema_name{s})s, 1, %(now{s})s, %(now{s})s, %(producer{s})s,
+            %(idempotency_key{s})s, %(payload_ref{s})s, %(stream_version{s})s,
+            %(envelope_checksum{s})s, %(stage_id{s})s, %(frame_id{s})s, %(now{s})s
+        )""".format(s=suffix)
+
+
+def _build_frame_event(
     *,
     frame: dict[str, Any],
+    catalog_id: Any,
     event_type: str,
     status: str,
     worker_id: str,
+    event_id: int,
     result: dict[str, Any] | None = None,
     meta_extra: dict[str, Any] | None = None,
-    event_id: int | None = None,
-) -> dict[str, Any]:
-    event_id = int(event_id) if event_id is not None else await _next_snowflake_id(cur)
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return ``(insert_params, event)`` for one frame event row."""
     stream_id = _frame_event_stream_id(
         execution_id=int(frame["execution_id"]),
         stage_id=int(frame["stage_id"]),
         frame_id=int(frame["frame_id"]),
     )
     now = datetime.now(timezone.utc)
-    catalog_id = frame.get("catalog_id")
-    if catalog_id is None:
-        await cur.execute(
-            "SELECT catalog_id FROM noetl.execution WHERE execution_id = %s",
-            (frame["execution_id"],),
-        )
-        catalog_row = await cur.fetchone()
-        if not catalog_row:
-            raise RuntimeError(f"execution not found for frame event: {frame['execution_id']}")
-        catalog_id = catalog_row.get("catalog_id")
     # Frame events are high-frequency runtime telemetry. Use the Snowflake event
     # id as a sparse per-stream version so consumers retain deterministic order
     # without serializing every heartbeat through an advisory lock and max scan.
@@ -302,6 +387,10 @@ async def _insert_frame_event(
     payload_ref = (result or {}).get("reference")
     event_result = result or {"status": status}
     event_meta = _event_meta(frame=frame, worker_id=worker_id, extra=meta_extra)
+    idempotency_key = (
+        f"{frame['tenant_id']}/{frame['organization_id']}/"
+        f"{frame['execution_id']}/frame/{frame['frame_id']}/{event_type}"
+    )
     envelope_checksum = canonical_event_checksum(
         {
             "tenant_id": frame["tenant_id"],
@@ -318,10 +407,7 @@ async def _insert_frame_event(
             "producer": worker_id,
             "causation_id": None,
             "correlation_id": None,
-            "idempotency_key": (
-                f"{frame['tenant_id']}/{frame['organization_id']}/"
-                f"{frame['execution_id']}/frame/{frame['frame_id']}/{event_type}"
-            ),
+            "idempotency_key": idempotency_key,
             "payload_ref": payload_ref,
             "result": event_result,
             "meta": event_meta,
@@ -329,52 +415,30 @@ async def _insert_frame_event(
             "node_name": frame.get("step_name"),
         }
     )
-    await cur.execute(
-        """
-        INSERT INTO noetl.event (
-            event_id, execution_id, catalog_id, event_type, node_name, status, result, meta,
-            worker_id, tenant_id, organization_id, stream_id, aggregate_id,
-            aggregate_type, schema_name, schema_version, event_time, ingest_time,
-            producer, idempotency_key, payload_ref, stream_version,
-            envelope_checksum, stage_id, frame_id, created_at
-        )
-        VALUES (
-            %(event_id)s, %(execution_id)s, %(catalog_id)s, %(event_type)s, %(node_name)s,
-            %(status)s, %(result)s, %(meta)s, %(worker_id)s, %(tenant_id)s,
-            %(organization_id)s, %(stream_id)s, %(aggregate_id)s, 'frame',
-            %(schema_name)s, 1, %(now)s, %(now)s, %(producer)s,
-            %(idempotency_key)s, %(payload_ref)s, %(stream_version)s,
-            %(envelope_checksum)s, %(stage_id)s, %(frame_id)s, %(now)s
-        )
-        """,
-        {
-            "event_id": event_id,
-            "execution_id": frame["execution_id"],
-            "catalog_id": catalog_id,
-            "event_type": event_type,
-            "node_name": frame.get("step_name"),
-            "status": status,
-            "result": Json(event_result),
-            "meta": Json(event_meta),
-            "worker_id": worker_id,
-            "tenant_id": frame["tenant_id"],
-            "organization_id": frame["organization_id"],
-            "stream_id": stream_id,
-            "aggregate_id": f"frame/{frame['frame_id']}",
-            "schema_name": f"noetl.{event_type}",
-            "producer": worker_id,
-            "idempotency_key": (
-                f"{frame['tenant_id']}/{frame['organization_id']}/"
-                f"{frame['execution_id']}/frame/{frame['frame_id']}/{event_type}"
-            ),
-            "payload_ref": Json(payload_ref) if payload_ref else None,
-            "stream_version": stream_version,
-            "envelope_checksum": envelope_checksum,
-            "stage_id": frame["stage_id"],
-            "frame_id": frame["frame_id"],
-            "now": now,
-        },
-    )
+    params = {
+        "event_id": int(event_id),
+        "execution_id": frame["execution_id"],
+        "catalog_id": catalog_id,
+        "event_type": event_type,
+        "node_name": frame.get("step_name"),
+        "status": status,
+        "result": Json(event_result),
+        "meta": Json(event_meta),
+        "worker_id": worker_id,
+        "tenant_id": frame["tenant_id"],
+        "organization_id": frame["organization_id"],
+        "stream_id": stream_id,
+        "aggregate_id": f"frame/{frame['frame_id']}",
+        "schema_name": f"noetl.{event_type}",
+        "producer": worker_id,
+        "idempotency_key": idempotency_key,
+        "payload_ref": Json(payload_ref) if payload_ref else None,
+        "stream_version": stream_version,
+        "envelope_checksum": envelope_checksum,
+        "stage_id": frame["stage_id"],
+        "frame_id": frame["frame_id"],
+        "now": now,
+    }
     event = {
         "event_id": int(event_id),
         "execution_id": frame["execution_id"],
@@ -396,17 +460,82 @@ async def _insert_frame_event(
         "event_time": now,
         "ingest_time": now,
         "producer": worker_id,
-        "idempotency_key": (
-            f"{frame['tenant_id']}/{frame['organization_id']}/"
-            f"{frame['execution_id']}/frame/{frame['frame_id']}/{event_type}"
-        ),
+        "idempotency_key": idempotency_key,
         "payload_ref": payload_ref,
         "envelope_checksum": envelope_checksum,
     }
+    return params, event
+
+
+async def _insert_frame_event(
+    cur: Any,
+    *,
+    frame: dict[str, Any],
+    event_type: str,
+    status: str,
+    worker_id: str,
+    result: dict[str, Any] | None = None,
+    meta_extra: dict[str, Any] | None = None,
+    event_id: int | None = None,
+) -> dict[str, Any]:
+    event_id = int(event_id) if event_id is not None else await _next_snowflake_id(cur)
+    catalog_id = frame.get("catalog_id")
+    if catalog_id is None:
+        await cur.execute(
+            "SELECT catalog_id FROM noetl.execution WHERE execution_id = %s",
+            (frame["execution_id"],),
+        )
+        catalog_row = await cur.fetchone()
+        if not catalog_row:
+            raise RuntimeError(f"execution not found for frame event: {frame['execution_id']}")
+        catalog_id = catalog_row.get("catalog_id")
+    params, event = _build_frame_event(
+        frame=frame,
+        catalog_id=catalog_id,
+        event_type=event_type,
+        status=status,
+        worker_id=worker_id,
+        event_id=event_id,
+        result=result,
+        meta_extra=meta_extra,
+    )
+    await cur.execute(_FRAME_EVENT_INSERT_SQL + _frame_event_values_sql(), params)
     await _enqueue_frame_outbox(cur, event)
     return event
 
 
+async def _insert_frame_events(cur: Any, specs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Insert several frame events with one multi-row INSERT.
+
+    Each spec carries the ``_insert_frame_event`` keyword arguments; ``frame``
+    must include ``catalog_id`` and ``event_id`` must be preallocated.
+    """
+    if not specs:
+        return []
+    params: dict[str, Any] = {}
+    values: list[str] = []
+    events: list[dict[str, Any]] = []
+    for index, spec in enumerate(specs):
+        row_params, event = _build_frame_event(
+            frame=spec["frame"],
+            catalog_id=spec["frame"]["catalog_id"],
+            event_type=spec["event_type"],
+            status=spec["status"],
+            worker_id=spec["worker_id"],
+            event_id=spec["event_id"],
+            result=spec.get("result"),
+            meta_extra=spec.get("meta_extra"),
+        )
+        suffix = f"_{index}"
+        params.update({f"{key}{suffix}": value for key, value in row_params.items()})
+        values.append(_frame_event_values_sql(suffix))
+        events.append(event)
+    await cur.execute(_FRAME_EVENT_INSERT_SQL + ",\n".join(values), params)
+    for event in events:
+        await _enqueue_frame_outbox(cur, event)
+    return events
+
+
 def _frame_commit_result(
     *,
     status: str,
@@ -520,6 +649,161 @@ def _frame_response(frame: dict[str, Any], event_id: int | None = None) -> dict[
     return response
 
 
+async def _extend_idempotent_claim(
+    cur: Any,
+    *,
+    frame: dict[str, Any],
+    stage: dict[str, Any],
+    req: FrameClaimRequest,
+) -> dict[str, Any]:
+    """Extend the lease of a frame this worker already holds for the claim key."""
+    await cur.execute(
+        """
+        UPDATE noetl.frame
+        SET lease_until = now() + (%s || ' seconds')::interval,
+            updated_at = now()
+        WHERE frame_id = %s
+        RETURNING *
+        """,
+        (req.lease_seconds, frame["frame_id"]),
+    )
+    updated = dict(await cur.fetchone())
+    updated["step_name"] = stage["step_name"]
+    updated["catalog_id"] = stage["catalog_id"]
+    return _frame_response(updated, updated.get("claimed_event_id"))
+
+
+async def _record_frame_claims(
+    cur: Any,
+    *,
+    frames: list[dict[str, Any]],
+    stage: dict[str, Any],
+    req: FrameClaimRequest,
+) -> list[dict[str, Any]]:
+    """Write abandoned/dispatched events for freshly leased frames in one insert."""
+    frame_policy = req.frame_policy or stage.get("frame_policy") or {}
+    recovery = _frame_recovery_policy(frame_policy)
+    locality = req.locality or {}
+    locator = worker_locator(
+        tenant_id=stage.get("tenant_id"),
+        organization_id=stage.get("organization_id"),
+        worker_id=req.worker_id,
+        locality=locality,
+    )
+    abandoned_ids = iter(
+        await _next_snowflake_ids(cur, sum(1 for frame in frames if frame.get("expired_lease")))
+    )
+    specs: list[dict[str, Any]] = []
+    for frame in frames:
+        frame["step_name"] = stage["step_name"]
+        frame["catalog_id"] = stage["catalog_id"]
+        if frame.get("expired_lease"):
+            previous_owner = frame.get("previous_owner_worker")
+            specs.append(
+                {
+                    "frame": frame,
+                    "event_type": "frame.abandoned",
+                    "status": "ABANDONED",
+                    "worker_id": str(previous_owner or req.worker_id),
+                    "event_id": next(abandoned_ids),
+                    "meta_extra": {
+                        "previous_owner_worker": previous_owner,
+                        "reclaimer_worker": req.worker_id,
+                        "lease_until": str(frame.get("previous_lease_until")),
+                        "reason": "lease_expired",
+                        "previous_attempt": frame.get("previous_attempts"),
+                        "recovery": recovery,
+                    },
+                }
+            )
+        specs.append(
+            {
+                "frame": frame,
+                "event_type": "frame.dispatched",
+                "status": "CLAIMED",
+                "worker_id": req.worker_id,
+                "event_id": frame["claimed_event_id"],
+                "meta_extra": {
+                    "attempt": frame.get("attempts"),
+                    "frame_policy": frame_policy,
+                    "recovery": recovery,
+                    "locality": locality,
+                    **_claim_locality_metadata(frame=frame, request_locality=locality),
+                    "worker_locator": locator,
+                },
+            }
+        )
+    events = await _insert_frame_events(cur, specs)
+    dispatched = [event for event in events if event["event_type"] == "frame.dispatched"]
+    claimed: list[dict[str, Any]] = []
+    for frame, event in zip(frames, dispatched):
+        frame["claimed_event_id"] = event["event_id"]
+        claimed.append(_frame_response(frame, event["event_id"]))
+    return claimed
+
+
+async def _claim_or_mint_frames(
+    cur: Any,
+    *,
+    stage: dict[str, Any],
+    command_id: int | None,
+    req: FrameClaimRequest,
+) -> list[dict[str, Any]]:
+    """Lease up to ``req.requested_count`` frames, minting the shortfall in bulk."""
+    stage_id = int(stage["stage_id"])
+    claim_args = {
+        "stage_id": stage_id,
+        "worker_id": req.worker_id,
+        "command_id": command_id,
+        "lease_seconds": req.lease_seconds,
+    }
+    frames = await _claim_frame_batch(cur, limit=req.requested_count, **claim_args)
+    reclaimed: list[dict[str, Any]] = []
+    missing = req.requested_count - len(frames)
+    claim_key = _frame_claim_key(stage_id=stage_id, cursor=req.cursor)
+    if missing > 0:
+        # A claim key names exactly one frame, so at most one is minted for
+        # it; keyless claims mint the whole shortfall.
+        minted_ids = await _mint_frames(
+            cur,
+            stage=stage,
+            command_id=command_id,
+            cursor=req.cursor,
+            count=1 if claim_key is not None else missing,
+        )
+        if minted_ids:
+            frames += await _claim_frame_batch(
+                cur,
+                limit=len(minted_ids),
+                frame_ids=minted_ids,
+                **claim_args,
+            )
+        elif claim_key is not None:
+            # Lost the mint race on this key: a concurrent retry of ours may
+            # already hold it, otherwise take it over if it is claimable.
+            frame = await _load_idempotent_claimed_frame(
+                cur,
+                stage_id=stage_id,
+                command_id=command_id,
+                worker_id=req.worker_id,
+                cursor=req.cursor,
+            )
+            if frame:
+                reclaimed.append(await _extend_idempotent_claim(cur, frame=frame, stage=stage, req=req))
+            else:
+                frames += await _claim_frame_batch(cur, limit=1, claim_key=claim_key, **claim_args)
+    if not frames and not reclaimed:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "code": "frame_claim_conflict",
+                "stage_id": stage_id,
+                "claim_key": claim_key,
+            },
+        )
+    return await _record_frame_claims(cur, frames=frames, stage=stage, req=req) + reclaimed
+
+
 @router.post("/stages/{stage_id}/frames/claim")
 async def claim_frames(stage_id: int, req: FrameClaimRequest) -> dict[str, Any]:
     """Claim existing pending/expired frames or lazily mint frame leases."""
@@ -535,188 +819,24 @@ async def claim_frames(stage_id: int, req: FrameClaimRequest) -> dict[str, Any]:
                     worker_id=req.worker_id,
                     requested_command_id=req.command_id,
                 )
-                claimed: list[dict[str, Any]] = []
-                for _ in range(req.requested_count):
-                    frame = await _load_idempotent_claimed_frame(
+                # A retried claim for the same worker-slot/frame-index key
+                # gets its existing lease back instead of a second frame.
+                frame = await _load_idempotent_claimed_frame(
+                    cur,
+                    stage_id=stage_id,
+                    command_id=command_id,
+                    worker_id=req.worker_id,
+                    cursor=req.cursor,
+                )
+                if frame:
+                    claimed = [await _extend_idempotent_claim(cur, frame=frame, stage=stage, req=req)]
+                else:
+                    claimed = await _claim_or_mint_frames(
                         cur,
-                        stage_id=stage_id,
+                        stage=stage,
                         command_id=command_id,
-                        worker_id=req.worker_id,
-                        cursor=req.cursor,
-                    )
-                    if frame:
-                        await cur.execute(
-                            """
-                            UPDATE noetl.frame
-                            SET lease_until = now() + (%s || ' seconds')::interval,
-                                updated_at = now()
-                            WHERE frame_id = %s
-                            RETURNING *
-                            """,
-                            (req.lease_seconds, frame["frame_id"]),
-                        )
-                        updated = dict(await cur.fetchone())
-                        updated["step_name"] = stage["step_name"]
-                        updated["catalog_id"] = stage["catalog_id"]
-                        claimed.append(_frame_response(updated, updated.get("claimed_event_id")))
-                        continue
-
-                    frame = await _load_claimable_frame(cur, stage_id=stage_id)
-                    frame_id: int | None = None
-                    if not frame:
-                        # Frame rows are minted lazily after the cursor driver has
-                        # claimed external work. Duplicate retries converge on the
-                        # stage/worker-slot/frame-index key via the partial unique
-                        # index instead of a hot-path advisory transaction lock.
-                        frame_id = await _next_snowflake_id(cur)
-                        frame = await _load_idempotent_claimed_frame(
-                            cur,
-                            stage_id=stage_id,
-                            command_id=command_id,
-                            worker_id=req.worker_id,
-                            cursor=req.cursor,
-                        )
-                        if frame:
-                            await cur.execute(
-                                """
-                                UPDATE noetl.frame
-                                SET lease_until = now() + (%s || ' seconds')::interval,
-                                    updated_at = now()
-                                WHERE frame_id = %s
-                                RETURNING *
-                                """,
-                                (req.lease_seconds, frame["frame_id"]),
-                            )
-                            updated = dict(await cur.fetchone())
-                            updated["step_name"] = stage["step_name"]
-                            updated["catalog_id"] = stage["catalog_id"]
-                            claimed.append(_frame_response(updated, updated.get("claimed_event_id")))
-                            continue
-                        frame = await _load_claimable_frame(cur, stage_id=stage_id)
-                    if not frame:
-                        parent_frame_id = await _resolve_parent_frame_id(
-                            cur,
-                            stage_id=stage_id,
-                            cursor=req.cursor,
-                        )
-                        await cur.execute(
-                            """
-                            INSERT INTO noetl.frame (
-                                frame_id, stage_id, execution_id, parent_frame_id,
-                                cursor, row_count, status, command_id,
-                                tenant_id, organization_id
-                            )
-                            VALUES (%s, %s, %s, %s, %s, 0, 'PENDING', %s, %s, %s)
-                            ON CONFLICT DO NOTHING
-                            RETURNING *
-                            """,
-                            (
-                                frame_id,
-                                stage_id,
-                                stage["execution_id"],
-                                parent_frame_id,
-                                Json(req.cursor or {}),
-                                command_id,
-                                stage["tenant_id"],
-                                stage["organization_id"],
-                            ),
-                        )
-                        frame = await cur.fetchone()
-                        if not frame:
-                            claim_key = _frame_claim_key(stage_id=stage_id, cursor=req.cursor)
-                            frame = await _load_frame_by_claim_key(
-                                cur,
-                                stage_id=stage_id,
-                                cursor=req.cursor,
-                            )
-                        if not frame and claim_key is None:
-                            frame = await _load_claimable_frame(cur, stage_id=stage_id)
-                        if not frame:
-                            raise HTTPException(
-                                status_code=409,
-                                detail={
-                                    "code": "frame_claim_conflict",
-                                    "stage_id": stage_id,
-                                    "claim_key": claim_key,
-                                },
-                            )
-                        frame = dict(frame)
-                        frame["step_name"] = stage["step_name"]
-                    else:
-                        frame["step_name"] = stage["step_name"]
-
-                    if frame.get("expired_lease"):
-                        await _insert_frame_event(
-                            cur,
-                            frame={**frame, "catalog_id": stage["catalog_id"]},
-                            event_type="frame.abandoned",
-                            status="ABANDONED",
-                            worker_id=str(frame.get("owner_worker") or req.worker_id),
-                            meta_extra={
-                                "previous_owner_worker": frame.get("owner_worker"),
-                                "reclaimer_worker": req.worker_id,
-                                "lease_until": str(frame.get("lease_until")),
-                                "reason": "lease_expired",
-                                "previous_attempt": frame.get("attempts"),
-                                "recovery": _frame_recovery_policy(
-                                    req.frame_policy or stage.get("frame_policy") or {}
-                                ),
-                            },
-                        )
-
-                    await cur.execute(
-                        """
-                        UPDATE noetl.frame
-                        SET status = 'CLAIMED',
-                            owner_worker = %s,
-                            command_id = COALESCE(command_id, %s),
-                            claimed_event_id = noetl.snowflake_id(),
-                            lease_until = now() + (%s || ' seconds')::interval,
-                            attempts = attempts + 1,
-                            updated_at = now()
-                        WHERE frame_id = %s
-                        RETURNING *
-                        """,
-                        (
-                            req.worker_id,
-                            command_id,
-                            req.lease_seconds,
-                            frame["frame_id"],
-                        ),
-                    )
-                    updated = dict(await cur.fetchone())
-                    updated["step_name"] = stage["step_name"]
-                    updated["catalog_id"] = stage["catalog_id"]
-                    locality = req.locality or {}
-                    locality_metadata = _claim_locality_metadata(
-                        frame=updated,
-                        request_locality=locality,
-                    )
-                    event = await _insert_frame_event(
-                        cur,
-                        frame=updated,
-                        event_type="frame.dispatched",
-                        status="CLAIMED",
-                        worker_id=req.worker_id,
-                        meta_extra={
-                            "attempt": updated.get("attempts"),
-                            "frame_policy": req.frame_policy or stage.get("frame_policy") or {},
-                            "recovery": _frame_recovery_policy(
-                                req.frame_policy or stage.get("frame_policy") or {}
-                            ),
-                            "locality": locality,
-                            **locality_metadata,
-                            "worker_locator": worker_locator(
-                                tenant_id=stage.get("tenant_id"),
-                                organization_id=stage.get("organization_id"),
-                                worker_id=req.worker_id,
-                                locality=locality,
-                            ),
-                        },
-                        event_id=updated.get("claimed_event_id"),
+                        req=req,
                     )
-                    updated["claimed_event_id"] = event["event_id"]
-                    claimed.append(_frame_response(updated, event["event_id"]))
 
                 await conn.commit()
                 await _drain_frame_outbox()
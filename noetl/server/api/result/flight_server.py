@@ -35,51 +35,354 @@ consumer reads with `RecordBatchStreamReader` — zero-copy, columnar.
 
 - **Ticket**: the `noetl://execution/<eid>/result/<step>/<id>` URI as
   raw bytes.  Consumers already have it from `result.reference.ref`
-  on the call.done event — no separate lookup needed.
-- **DoGet response**: Arrow IPC stream of the materialized RecordBatch.
-  For tabular results → encoded via `rows_to_arrow_ipc` (the same
-  function the worker uses for the shm fast path, so the wire format
-  is identical regardless of producer).
-- **Non-tabular results**: returned via `FlightError::Unimplemented`
-  for Phase A — consumers fall back to `/api/result/resolve` HTTP.
+  on the call.done event — no separate lookup needed.  Partition
+  tickets handed out by `get_flight_info` are JSON
+  (`{"ref": ..., "offset": N, "length": M}`) and select a row range.
+- **DoGet response**: a stream of record batches.  Results stored as
+  Arrow IPC (`put_ipc_bytes`, worker shm fast path, DoPut uploads) are
+  streamed batch by batch straight from the stored IPC bytes —
+  zero-copy slices, no table materialisation, no JSON round-trip.
+  Row-shaped JSON results are converted once with `rows_to_arrow_table`
+  and streamed in `NOETL_FLIGHT_BATCH_ROWS` chunks.
+- **FlightInfo**: results larger than `NOETL_FLIGHT_ENDPOINT_ROWS` rows
+  are advertised as several endpoints (disjoint row ranges) so
+  consumers can fetch partitions in parallel.  The opened result is
+  cached for `NOETL_FLIGHT_SOURCE_CACHE_SECONDS` (bounded by
+  `NOETL_FLIGHT_SOURCE_CACHE_BYTES`), so the partition DoGets slice one
+  store read instead of each loading the whole payload.
+- **DoPut**: workers upload Arrow record batches directly.  The
+  descriptor command is JSON `{"execution_id", "name", "step"?,
+  "store"?}` (`store` pins a StoreTier, else the router picks); the
+  batches are re-framed as one IPC stream, scrubbed and stored through
+  `default_store.put_ipc_bytes`, and the resulting ResultRef is
+  returned as JSON in the put-result metadata.  Uploads larger than
+  `NOETL_FLIGHT_MAX_PUT_BYTES` are rejected while streaming.
+- **Non-tabular results**: returned via `FlightUnavailableError` —
+  consumers fall back to `/api/result/resolve` HTTP.
 
 ## Boundary discipline
 
 This endpoint is a thin Flight wrapper around the existing
 `default_store.resolve`.  All scrubbing + tier dispatch + auth
 happens in the underlying store; the Flight server adds no new
-trust boundary.  The cluster-internal gRPC port (default 8083) is
-not exposed publicly — same trust model as the existing
-`/api/result/resolve`.
-
-## R-2.3 follow-up scope
-
-Phase A (this module):
-  - `do_get(ticket)` for tabular results.
-  - Single in-cluster endpoint; no `FlightInfo` indirection yet.
+trust boundary for reads.  The cluster-internal gRPC port (default
+8083) is not exposed publicly — same trust model as the existing
+`/api/result/resolve`.  DoPut writes into the store, so it always needs
+a bearer token: one of `NOETL_FLIGHT_BEARER_TOKENS`, or the
+`NOETL_INTERNAL_API_TOKEN` service token when those are unset.
+
+## R-2.3 scope
+
+This module:
+  - Streaming `do_get(ticket)` for tabular results, whole refs or
+    partition tickets.
+  - `get_flight_info` advertising multi-endpoint row-range partitions
+    over one cached store read.
+  - `do_put` uploads stored through `default_store.put_ipc_bytes`.
+  - TLS, mTLS (`NOETL_FLIGHT_CLIENT_CA`) and bearer-token auth.
   - Spawned alongside the FastAPI server in `app.py`'s lifespan.
 
-Phase B (deferred):
+Deferred:
   - Rust consumer via `arrow-flight` crate in noetl-worker.
   - Benchmark vs HTTP/JSON path.
-
-Phase C (deferred):
-  - Multi-endpoint `FlightInfo` for sharded result tiers.
-  - mTLS + token auth for non-cluster-internal callers.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import os
+import secrets
 import threading
-from typing import Any, Optional
-
-from noetl.core.storage import default_store
-from noetl.core.storage.arrow_ipc import ARROW_STREAM_MEDIA_TYPE, rows_to_arrow_ipc
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+from noetl.core.storage import default_store, default_tracker
+from noetl.core.storage.arrow_ipc import (
+    ARROW_STREAM_MEDIA_TYPE,
+    arrow_schema_digest,
+    rows_to_arrow_table,
+)
 
 logger = logging.getLogger(__name__)
 
+# Rows per advertised FlightInfo endpoint; larger results are split into
+# several row-range partitions that consumers can fetch in parallel.
+_FLIGHT_ENDPOINT_ROWS = max(1, int(os.getenv("NOETL_FLIGHT_ENDPOINT_ROWS", "250000")))
+# Max rows per record batch when streaming row-shaped (JSON) results.
+_FLIGHT_BATCH_ROWS = max(1, int(os.getenv("NOETL_FLIGHT_BATCH_ROWS", "65536")))
+# Opened results are kept briefly so a FlightInfo call and the DoGets of
+# its partitions share one store read instead of one full load per call.
+_FLIGHT_SOURCE_CACHE_SECONDS = max(0.0, float(os.getenv("NOETL_FLIGHT_SOURCE_CACHE_SECONDS", "60")))
+_FLIGHT_SOURCE_CACHE_BYTES = max(0, int(os.getenv("NOETL_FLIGHT_SOURCE_CACHE_BYTES", str(512 * 1024 * 1024))))
+# Largest Arrow IPC stream a single DoPut may upload.
+_FLIGHT_MAX_PUT_BYTES = max(1, int(os.getenv("NOETL_FLIGHT_MAX_PUT_BYTES", str(256 * 1024 * 1024))))
+# Service token accepted for DoPut when no Flight bearer tokens are set;
+# the same secret that gates ``/api/internal/*``.
+_INTERNAL_TOKEN_ENV = "NOETL_INTERNAL_API_TOKEN"
+
+
+def _run_async(coro: Any) -> Any:
+    """Run a store coroutine from a Flight handler thread.
+
+    Flight handlers run on gRPC worker threads, so each call gets its own
+    short-lived loop; this keeps the Flight server independent of the
+    FastAPI app's loop.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _encode_ticket(ref_uri: str, offset: Optional[int] = None, length: Optional[int] = None) -> bytes:
+    """Ticket bytes for a whole result (raw ref) or a row-range partition."""
+    if offset is None and length is None:
+        return ref_uri.encode("utf-8")
+    return json.dumps({"ref": ref_uri, "offset": offset or 0, "length": length}).encode("utf-8")
+
+
+def _decode_ticket(raw: bytes) -> tuple[str, int, Optional[int]]:
+    """Return ``(ref_uri, offset, length)`` from raw or partition ticket bytes."""
+    text = bytes(raw).decode("utf-8")
+    if not text.startswith("{"):
+        return text, 0, None
+    spec = json.loads(text)
+    length = spec.get("length")
+    return str(spec["ref"]), max(0, int(spec.get("offset") or 0)), (None if length is None else int(length))
+
+
+def _plan_partitions(row_count: int, rows_per_endpoint: int) -> list[tuple[Optional[int], Optional[int]]]:
+    """Row ranges for FlightInfo endpoints; ``[(None, None)]`` means whole result."""
+    if row_count <= rows_per_endpoint:
+        return [(None, None)]
+    return [
+        (offset, min(rows_per_endpoint, row_count - offset))
+        for offset in range(0, row_count, rows_per_endpoint)
+    ]
+
+
+def _slice_batches(batches: Iterator[Any], offset: int, length: Optional[int]) -> Iterator[Any]:
+    """Yield the ``[offset, offset + length)`` row window as zero-copy slices."""
+    remaining = length
+    skip = offset
+    for batch in batches:
+        if remaining is not None and remaining <= 0:
+            return
+        rows = batch.num_rows
+        if skip >= rows:
+            skip -= rows
+            continue
+        take = rows - skip if remaining is None else min(rows - skip, remaining)
+        yield batch if (skip == 0 and take == rows) else batch.slice(skip, take)
+        skip = 0
+        if remaining is not None:
+            remaining -= take
+
+
+@dataclass
+class _ResultSource:
+    """An opened result: schema plus a factory for a fresh batch iterator."""
+
+    schema: Any
+    row_count: int
+    total_bytes: int
+    open_batches: Callable[[], Iterator[Any]]
+
+
+def _open_result_source(ref_uri: str, store: Any = None) -> _ResultSource:
+    """Open a stored result for streaming.
+
+    Arrow IPC results are read lazily from the stored stream bytes (shm
+    cache / KV / disk tier via ``get_arrow_ipc_bytes``).  Row-shaped JSON
+    results fall back to ``resolve`` + one table conversion.  Raises
+    ``LookupError`` for non-tabular data.
+    """
+    import pyarrow as pa
+
+    store = store or default_store
+    get_ipc = getattr(store, "get_arrow_ipc_bytes", None)
+    ipc_bytes = _run_async(get_ipc(ref_uri)) if get_ipc is not None else None
+    if ipc_bytes is not None:
+        buffer = pa.py_buffer(ipc_bytes)
+
+        def _ipc_batches() -> Iterator[Any]:
+            with pa.ipc.open_stream(buffer) as reader:
+                yield from reader
+
+        with pa.ipc.open_stream(buffer) as reader:
+            schema = reader.schema
+            # Counting walks batch headers only; the column buffers stay
+            # zero-copy views into ``buffer``.
+            row_count = sum(batch.num_rows for batch in reader)
+        return _ResultSource(
+            schema=schema,
+            row_count=row_count,
+            total_bytes=len(ipc_bytes),
+            open_batches=_ipc_batches,
+        )
+
+    rows = _extract_rows(_run_async(store.resolve(ref_uri)))
+    if rows is None:
+        raise LookupError(ref_uri)
+    table = rows_to_arrow_table(rows)
+    return _ResultSource(
+        schema=table.schema,
+        row_count=table.num_rows,
+        total_bytes=table.nbytes,
+        open_batches=lambda: iter(table.to_batches(max_chunksize=_FLIGHT_BATCH_ROWS)),
+    )
+
+
+class _SourceCache:
+    """Short-lived LRU of opened results, bounded by age and payload bytes.
+
+    Results behind a ref are immutable, so partitions of one FlightInfo can
+    slice the same opened source.  Concurrent opens of one ref wait for the
+    first load instead of each reading the payload.  Results that are not
+    tabular (``LookupError``) are not cached.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, _ResultSource]] = OrderedDict()
+        self._loading: dict[str, threading.Lock] = {}
+        self._bytes = 0
+
+    def get(self, ref_uri: str, load: Callable[[str], _ResultSource]) -> _ResultSource:
+        if _FLIGHT_SOURCE_CACHE_SECONDS <= 0 or _FLIGHT_SOURCE_CACHE_BYTES <= 0:
+            return load(ref_uri)
+        with self._lock:
+            cached = self._lookup(ref_uri)
+            if cached is not None:
+                return cached
+            ref_lock = self._loading.setdefault(ref_uri, threading.Lock())
+        with ref_lock:
+            with self._lock:
+                cached = self._lookup(ref_uri)
+            if cached is not None:
+                return cached
+            try:
+                source = load(ref_uri)
+            except BaseException:
+                with self._lock:
+                    self._loading.pop(ref_uri, None)
+                raise
+            # Store before dropping the loader so a caller arriving in
+            # between finds the entry instead of loading the ref again.
+            with self._lock:
+                self._store(ref_uri, source)
+                self._loading.pop(ref_uri, None)
+            return source
+
+    def _lookup(self, ref_uri: str) -> Optional[_ResultSource]:
+        entry = self._entries.get(ref_uri)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._evict(ref_uri)
+            return None
+        self._entries.move_to_end(ref_uri)
+        return entry[1]
+
+    def _store(self, ref_uri: str, source: _ResultSource) -> None:
+        if ref_uri in self._entries:
+            self._evict(ref_uri)
+        if source.total_bytes > _FLIGHT_SOURCE_CACHE_BYTES:
+            return
+        now = time.monotonic()
+        for key in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+            self._evict(key)
+        while self._entries and self._bytes + source.total_bytes > _FLIGHT_SOURCE_CACHE_BYTES:
+            self._evict(next(iter(self._entries)))
+        self._entries[ref_uri] = (now + _FLIGHT_SOURCE_CACHE_SECONDS, source)
+        self._bytes += source.total_bytes
+
+    def _evict(self, ref_uri: str) -> None:
+        _, source = self._entries.pop(ref_uri)
+        self._bytes -= source.total_bytes
+
+
+def _parse_put_descriptor(descriptor: Any) -> dict[str, Any]:
+    """Parse the DoPut descriptor: JSON command or ``[execution_id, name]`` path."""
+    command = getattr(descriptor, "command", None)
+    if command:
+        spec = json.loads(bytes(command).decode("utf-8"))
+        if not isinstance(spec, dict):
+            raise ValueError("DoPut descriptor command must be a JSON object")
+    else:
+        path = [
+            p.decode("utf-8") if isinstance(p, bytes) else str(p)
+            for p in (getattr(descriptor, "path", None) or [])
+        ]
+        if len(path) != 2:
+            raise ValueError("DoPut path descriptor must be [execution_id, name]")
+        spec = {"execution_id": path[0], "name": path[1]}
+    if not spec.get("execution_id") or not spec.get("name"):
+        raise ValueError("DoPut descriptor requires execution_id and name")
+    if spec.get("store"):
+        from noetl.core.storage.models import StoreTier
+
+        StoreTier(spec["store"])  # ValueError on an unknown tier
+    return spec
+
+
+class _UploadTooLarge(ValueError):
+    """A DoPut stream grew past ``NOETL_FLIGHT_MAX_PUT_BYTES``."""
+
+
+def _store_uploaded_batches(
+    spec: dict[str, Any],
+    schema: Any,
+    batches: Iterator[Any],
+    store: Any = None,
+    max_bytes: Optional[int] = None,
+) -> dict[str, Any]:
+    """Re-frame uploaded batches as one IPC stream and store it as a ResultRef.
+
+    Raises ``_UploadTooLarge`` as soon as the re-framed stream passes
+    ``max_bytes``, so an oversized upload is never buffered whole.
+    """
+    import pyarrow as pa
+
+    from noetl.core.storage.models import StoreTier
+
+    store = store or default_store
+    limit = _FLIGHT_MAX_PUT_BYTES if max_bytes is None else max_bytes
+    tier = StoreTier(spec["store"]) if spec.get("store") else None
+    sink = pa.BufferOutputStream()
+    row_count = 0
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            row_count += batch.num_rows
+            if sink.tell() > limit:
+                raise _UploadTooLarge(f"DoPut stream exceeds {limit} bytes")
+    payload = sink.getvalue().to_pybytes()
+    temp_ref = _run_async(
+        store.put_ipc_bytes(
+            str(spec["execution_id"]),
+            str(spec["name"]),
+            payload,
+            schema_digest=arrow_schema_digest(schema),
+            row_count=row_count,
+            store=tier,
+            source_step=spec.get("step"),
+            media_type=ARROW_STREAM_MEDIA_TYPE,
+        )
+    )
+    # Same scope bookkeeping as ``PUT /api/result/{execution_id}``.
+    default_tracker.register_ref(
+        temp_ref,
+        execution_id=str(spec["execution_id"]),
+        step_name=spec.get("step"),
+    )
+    return temp_ref.model_dump(mode="json")
+
 
 def _extract_rows(data: Any) -> Optional[list[dict[str, Any]]]:
     """Try to pull a list-of-dict rowset out of a resolved result.
@@ -112,6 +415,27 @@ def _extract_rows(data: Any) -> Optional[list[dict[str, Any]]]:
     return rows  # type: ignore[return-value]
 
 
+def _bearer_token(headers: Any) -> Optional[str]:
+    """The token from an ``Authorization: Bearer <token>`` call header.
+
+    ``headers`` is pyarrow.flight's multi-valued mapping; gRPC metadata
+    keys are lowercase on the wire, but both casings are tried to be
+    robust against transport differences, and the scheme is matched
+    case-insensitively.
+    """
+    for key in ("authorization", "Authorization"):
+        values = headers.get(key) if hasattr(headers, "get") else None
+        if values is None:
+            continue
+        for value in values if isinstance(values, (list, tuple)) else [values]:
+            if isinstance(value, bytes):
+                value = value.decode("utf-8", errors="replace")
+            parts = value.split(None, 1)
+            if len(parts) == 2 and parts[0].lower() == "bearer":
+                return parts[1].strip()
+    return None
+
+
 def _parse_bearer_tokens(raw: Optional[str]) -> set[str]:
     """Parse a comma-separated list of bearer tokens into a set.
 
@@ -231,6 +555,7 @@ class NoetlFlightServer:
         self.bearer_tokens: Optional[set[str]] = (
             bearer_tokens if bearer_tokens else None
         )
+        self._sources = _SourceCache()
         self._server: Any = None  # pyarrow.flight.FlightServerBase instance
         self._thread: Optional[threading.Thread] = None
         self._serve_exception: Optional[BaseException] = None
@@ -301,16 +626,15 @@ class NoetlFlightServer:
         with open(self.client_ca_path, "rb") as f:
             return f.read()
 
-    def _build_middleware(self) -> Optional[dict[str, Any]]:
+    def _build_middleware(self) -> dict[str, Any]:
         """Construct the `pyarrow.flight` middleware mapping.
 
-        Phase C2.3 adds a single bearer-token validator middleware
-        when ``self.bearer_tokens`` is set.  No-auth mode (empty /
-        None) returns ``None`` and ``FlightServerBase`` runs without
-        any per-call middleware.
+        Phase C2.3 adds a bearer-token validator for every call when
+        ``self.bearer_tokens`` is set.  DoPut writes into the result
+        store, so it is never anonymous: without Flight bearer tokens
+        it must carry the ``NOETL_INTERNAL_API_TOKEN`` service token,
+        and it is refused when neither is configured.
         """
-        if not self.bearer_tokens:
-            return None
         import pyarrow.flight as flight
 
         tokens = self.bearer_tokens
@@ -323,83 +647,78 @@ class NoetlFlightServer:
             success; raises ``FlightUnauthenticatedError`` on missing
             or invalid token — pyarrow.flight surfaces that as a
             gRPC `UNAUTHENTICATED` status to the client.
-
-            Header lookup is case-insensitive per HTTP/2 spec
-            (`grpc-metadata` is always lowercase on the wire) and
-            tolerates the `Bearer ` prefix in either canonical or
-            lowercased form.
             """
 
             def start_call(self, info: Any, headers: Any) -> Optional[Any]:
-                # `headers` is a multi-valued mapping (`dict[str, list[str]]`).
-                # The actual key shape pyarrow.flight produces is
-                # lowercased per HTTP/2 / gRPC convention.
-                auth_values: list[str] = []
-                # Try a few common casings to be robust against
-                # transport differences.
-                for key in ("authorization", "Authorization"):
-                    if key in headers:
-                        v = headers[key]
-                        if isinstance(v, (list, tuple)):
-                            auth_values.extend(v)
-                        else:
-                            auth_values.append(v)
-
-                for value in auth_values:
-                    # Tolerate `Bearer <token>` + `bearer <token>` casings.
-                    parts = value.split(None, 1)
-                    if len(parts) == 2 and parts[0].lower() == "bearer":
-                        token = parts[1].strip()
-                        if token in tokens:
-                            return None  # accept; no per-call middleware
-
-                raise flight.FlightUnauthenticatedError(
-                    "Missing or invalid bearer token; expected "
-                    "Authorization: Bearer <token> with a token from "
-                    "NOETL_FLIGHT_BEARER_TOKENS."
-                )
+                if tokens:
+                    if _bearer_token(headers) in tokens:
+                        return None  # accept; no per-call middleware
+                    raise flight.FlightUnauthenticatedError(
+                        "Missing or invalid bearer token; expected "
+                        "Authorization: Bearer <token> with a token from "
+                        "NOETL_FLIGHT_BEARER_TOKENS."
+                    )
+                if info.method == flight.FlightMethod.DO_PUT:
+                    expected = (os.getenv(_INTERNAL_TOKEN_ENV) or "").strip()
+                    if not expected:
+                        raise flight.FlightUnauthenticatedError(
+                            "Flight DoPut is disabled: set NOETL_FLIGHT_BEARER_TOKENS "
+                            f"or {_INTERNAL_TOKEN_ENV} on the server."
+                        )
+                    token = _bearer_token(headers) or ""
+                    # Constant-time comparison — never use ``==`` on secrets.
+                    if not secrets.compare_digest(token.encode(), expected.encode()):
+                        raise flight.FlightUnauthenticatedError(
+                            f"Flight DoPut requires Authorization: Bearer <{_INTERNAL_TOKEN_ENV}>."
+                        )
+                return None
 
         return {"bearer-auth": BearerTokenMiddlewareFactory()}
 
     def _build_server(self) -> Any:
         """Construct the pyarrow.flight server.  Lazy-imported."""
+        import pyarrow as pa
         import pyarrow.flight as flight
 
         outer = self
 
         class _Server(flight.FlightServerBase):
             def do_get(self, context: Any, ticket: Any) -> Any:
-                ref_uri = ticket.ticket.decode("utf-8")
-                logger.debug("Flight do_get: ref=%s", ref_uri)
-                # Run the async resolve on the store's event loop —
-                # FlightServerBase.do_get is called on a worker thread,
-                # so we use asyncio.run_coroutine_threadsafe via a
-                # newly-created loop (default_store.resolve is async).
-                # This keeps the Flight server independent of the
-                # FastAPI app's loop.
-                loop = asyncio.new_event_loop()
+                ref_uri, offset, length = _decode_ticket(ticket.ticket)
+                logger.debug("Flight do_get: ref=%s offset=%s length=%s", ref_uri, offset, length)
                 try:
-                    data = loop.run_until_complete(default_store.resolve(ref_uri))
-                finally:
-                    loop.close()
-
-                rows = _extract_rows(data)
-                if rows is None:
+                    source = outer._sources.get(ref_uri, _open_result_source)
+                except LookupError:
                     raise flight.FlightUnavailableError(
                         f"Flight do_get only serves tabular results; ref={ref_uri} "
                         "has no row data.  Consumer should fall back to HTTP "
                         "/api/result/resolve."
                     )
+                # Partitions of one FlightInfo share the cached source and
+                # slice it; GeneratorStream pulls one batch at a time, so
+                # peak memory is the stored payload plus one in-flight batch.
+                return flight.GeneratorStream(
+                    source.schema,
+                    _slice_batches(source.open_batches(), offset, length),
+                )
+
+            def do_put(self, context: Any, descriptor: Any, reader: Any, writer: Any) -> None:
+                try:
+                    spec = _parse_put_descriptor(descriptor)
+                except (ValueError, KeyError, UnicodeDecodeError) as exc:
+                    raise flight.FlightServerError(f"Invalid DoPut descriptor: {exc}")
 
-                payload, _digest, _row_count = rows_to_arrow_ipc(rows)
+                def _batches() -> Iterator[Any]:
+                    for chunk in reader:
+                        if chunk.data is not None:
+                            yield chunk.data
 
-                # Stream the IPC bytes back.  RecordBatchStream reads
-                # from a pyarrow Buffer / file-like, so we wrap the
-                # already-encoded bytes.
-                import pyarrow as pa
-                buffer = pa.py_buffer(payload)
-                reader = pa.ipc.open_stream(buffer)
-                return flight.RecordBatchStream(reader)
+                try:
+                    ref = _store_uploaded_batches(spec, reader.schema, _batches())
+                except _UploadTooLarge as exc:
+                    raise flight.FlightServerError(f"DoPut rejected: {exc} (NOETL_FLIGHT_MAX_PUT_BYTES)")
+                logger.debug("Flight do_put: stored ref=%s rows=%s", ref.get("ref"), ref.get("meta", {}).get("row_count"))
+                writer.write(pa.py_buffer(json.dumps(ref).encode("utf-8")))
 
             def list_actions(self, context: Any) -> list[Any]:
                 return []
@@ -408,16 +727,10 @@ class NoetlFlightServer:
                 return iter([])
 
             def get_flight_info(self, context: Any, descriptor: Any) -> Any:
-                # R-2.3 Phase C1: return a FlightInfo summary so the
-                # consumer can read schema + row count without
-                # materialising the full payload.  Useful for clients
-                # that want to size buffers, pick a backend, or skip
-                # the fetch entirely for non-tabular refs.
-                #
                 # Wire convention: the descriptor's `cmd` field carries
                 # the same `noetl://execution/<eid>/result/<step>/<id>`
                 # URI bytes the Ticket uses (Phase A).  Path-shaped
-                # descriptors aren't supported in Phase C1.
+                # descriptors aren't supported.
                 if not getattr(descriptor, "command", None):
                     raise flight.FlightServerError(
                         "FlightInfo requires a Cmd-shaped descriptor whose "
@@ -427,57 +740,40 @@ class NoetlFlightServer:
                 ref_uri = bytes(descriptor.command).decode("utf-8", errors="replace")
                 logger.debug("Flight get_flight_info: ref=%s", ref_uri)
 
-                loop = asyncio.new_event_loop()
                 try:
-                    data = loop.run_until_complete(default_store.resolve(ref_uri))
-                finally:
-                    loop.close()
-
-                rows = _extract_rows(data)
-                if rows is None:
-                    # Same signal Phase A do_get raises for non-
-                    # tabular refs.  Consumers fall back to HTTP.
+                    source = outer._sources.get(ref_uri, _open_result_source)
+                except LookupError:
+                    # Same signal do_get raises for non-tabular refs.
+                    # Consumers fall back to HTTP.
                     raise flight.FlightUnavailableError(
                         f"FlightInfo lookup found a non-tabular result for "
                         f"ref={ref_uri}; consumer should fall back to HTTP "
                         f"/api/result/resolve."
                     )
 
-                # Encode a sample to extract the Arrow schema +
-                # row_count without paying the full materialisation
-                # cost twice — `rows_to_arrow_ipc` returns
-                # (payload, _digest, row_count) AND the FlightInfo
-                # carries the schema bytes inline, so we run the same
-                # encode here that do_get would.  For multi-MB results
-                # a future optimisation can compute the schema from
-                # rows[:1] and persist row_count metadata in the store
-                # to skip the full encode.
-                import pyarrow as pa
-                payload, _digest, row_count = rows_to_arrow_ipc(rows)
-                with pa.ipc.open_stream(payload) as reader:
-                    schema = reader.schema
-
-                # Single endpoint pointing back at this server.  The
-                # ticket is the same bytes the consumer would submit
-                # to do_get directly — clients with a known ref URI
-                # can skip get_flight_info and call do_get straight.
-                endpoint = flight.FlightEndpoint(
-                    ticket=flight.Ticket(ref_uri.encode("utf-8")),
-                    locations=[outer.location],
-                )
+                # One endpoint per row-range partition.  A small result
+                # keeps the single raw-ref ticket, so clients with a known
+                # ref URI can still skip get_flight_info and call do_get.
+                endpoints = [
+                    flight.FlightEndpoint(
+                        ticket=flight.Ticket(_encode_ticket(ref_uri, offset, length)),
+                        locations=[outer.location],
+                    )
+                    for offset, length in _plan_partitions(source.row_count, _FLIGHT_ENDPOINT_ROWS)
+                ]
                 return flight.FlightInfo(
-                    schema=schema,
+                    schema=source.schema,
                     descriptor=descriptor,
-                    endpoints=[endpoint],
-                    total_records=row_count,
-                    total_bytes=len(payload),
+                    endpoints=endpoints,
+                    total_records=source.row_count,
+                    total_bytes=source.total_bytes,
                 )
 
         # TLS certs (Phase C2.1) — None in plaintext mode, otherwise
         # the single (cert, key) pair loaded from disk.
         tls_certs = outer._load_tls_certificates()
-        # Auth middleware (Phase C2.3) — None when bearer-tokens is
-        # empty / unset.
+        # Auth middleware (Phase C2.3): bearer tokens for every call
+        # when configured, and the DoPut write guard.
         middleware = outer._build_middleware()
         # Client CA bundle (Phase C2.4) — None when mTLS disabled;
         # otherwise pass with `verify_client=True` so pyarrow.flight
@@ -487,8 +783,7 @@ class NoetlFlightServer:
             "location": outer.location,
             "tls_certificates": tls_certs,
         }
-        if middleware is not None:
-            kwargs["middleware"] = middleware
+        kwargs["middleware"] = middleware
         if client_ca is not None:
             kwargs["verify_client"] = True
             kwargs["root_certificates"] = client_ca
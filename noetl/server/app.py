@@ -13,10 +13,14 @@ from fastapi import APIRouter
 from noetl.core.common import get_async_db_connection, get_pgdb_connection, get_snowflake_id
 from noetl.core.db.pool import init_pool, close_pool
 from noetl.core.logger import setup_logger
+from noetl.core.scheduler.duration_model import (
+    REFRESH_INTERVAL_SECONDS as DURATION_MODEL_REFRESH_SECONDS,
+    run_duration_model_refresher,
+)
 from noetl.core.urls import normalize_server_base_url
 from noetl.server.api import router as api_router
 from noetl.server.api.result.flight_server import NoetlFlightServer
-from noetl.server.middleware import catch_exceptions_middleware
+from noetl.server.middleware import RequestMiddleware, WireCompressionMiddleware
 
 # Import core execution API
 from noetl.server.api.core import (
@@ -188,6 +192,14 @@ def _create_app(settings: Settings) -> FastAPI:
                 logical_name=logical_name,
                 lease_seconds=control_lease_seconds,
             )
+            duration_model_lease = RuntimeLease(
+                task_name="duration_model",
+                instance_name=instance_name,
+                server_url=server_url,
+                hostname=hostname,
+                logical_name=logical_name,
+                lease_seconds=control_lease_seconds,
+            )
             async def _server_heartbeat_loop():
                 while not stop_event.is_set():
                     try:
@@ -319,6 +331,7 @@ def _create_app(settings: Settings) -> FastAPI:
             sweeper_task: Optional[asyncio.Task] = None
             auto_resume_task: Optional[asyncio.Task] = None
             command_reaper_task: Optional[asyncio.Task] = None
+            duration_model_task: Optional[asyncio.Task] = None
             try:
                 logger.info("Starting server heartbeat background task...")
                 heartbeat_task = asyncio.create_task(_server_heartbeat_loop(), name="server-heartbeat")
@@ -360,6 +373,15 @@ def _create_app(settings: Settings) -> FastAPI:
             except Exception as e:
                 logger.error(f"Command reaper startup failed (non-fatal): {e}", exc_info=True)
 
+            # Step durations for critical-path dispatch priorities are learned
+            # from completed commands; the lease holder reads new history and
+            # persists the estimates, the other servers load them.
+            if DURATION_MODEL_REFRESH_SECONDS > 0:
+                duration_model_task = asyncio.create_task(
+                    run_duration_model_refresher(stop_event=stop_event, lease=duration_model_lease),
+                    name="duration-model-refresh",
+                )
+
             # R-2.3 Phase A: spawn the Arrow Flight gRPC server in a
             # background thread alongside the FastAPI process.  Provides
             # a columnar zero-copy DoGet path for tabular result-store
@@ -421,6 +443,10 @@ def _create_app(settings: Settings) -> FastAPI:
                         await command_reaper_task
                 except Exception as e:
                     logger.exception(f"Critical error during command reaper task shutdown: {e}")
+            if duration_model_task:
+                duration_model_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await duration_model_task
             # R-2.3 Phase A: stop the Flight server thread.  Shutdown
             # is best-effort — if the join times out the daemon thread
             # is reclaimed by interpreter exit.
@@ -465,18 +491,14 @@ def _create_app(settings: Settings) -> FastAPI:
         allow_headers=["*"],
     )
 
-    app.middleware('http')(catch_exceptions_middleware)
+    # Simple request counter (exclude /metrics to avoid recursion)
+    def _count_request(path: str) -> None:
+        if not path.startswith("/metrics"):
+            _metrics_counters[_request_count_key] = _metrics_counters.get(_request_count_key, 0) + 1
 
-    # Simple request counter middleware (exclude /metrics to avoid recursion)
-    @app.middleware("http")
-    async def _count_requests(request, call_next):
-        if not request.url.path.startswith("/metrics"):
-            try:
-                _metrics_counters[_request_count_key] = _metrics_counters.get(_request_count_key, 0) + 1
-            except Exception:
-                pass
-        response = await call_next(request)
-        return response
+    app.add_middleware(RequestMiddleware, on_request=_count_request)
+    # Outermost, so request logging and handlers see decoded JSON bodies.
+    app.add_middleware(WireCompressionMiddleware)
 
     app.include_router(router, prefix="/api")
 
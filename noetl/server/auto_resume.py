@@ -311,6 +311,16 @@ async def get_recovery_candidates() -> list[Dict[str, Any]]:
     Return recent parent playbooks that may need recovery.
 
     Parent only: `parent_execution_id IS NULL`.
+
+    Driven by the ``noetl.execution`` projection through the partial
+    ``idx_execution_live_parent`` index, so the sweep only visits parents
+    in the lookback window that have not completed or been cancelled;
+    per candidate, the event log is touched through
+    ``idx_event_exec_type`` / ``idx_event_exec_id_event_id_desc`` probes.
+    A ``FAILED`` projection does not exclude a parent: the projection
+    flips to FAILED on any ``command.failed`` while retries may still be
+    pending, so only the terminal-event probe decides that it failed (it
+    also catches cancellations that reach the event log first).
     """
     fetch_limit = max(
         max(_AUTO_RESUME_MAX_CANDIDATES, 1) * 10,
@@ -321,29 +331,37 @@ async def get_recovery_candidates() -> list[Dict[str, Any]]:
             await cur.execute(
                 """
                 SELECT
-                    e.execution_id,
+                    x.execution_id,
                     c.path,
-                    e.catalog_id,
-                    e.result,
-                    e.created_at,
+                    x.catalog_id,
+                    init.result,
+                    x.created_at,
                     latest.event_type AS latest_event_type,
                     latest.created_at AS latest_event_at
-                FROM noetl.event e
-                JOIN noetl.catalog c ON c.catalog_id = e.catalog_id
+                FROM noetl.execution x
+                JOIN noetl.catalog c ON c.catalog_id = x.catalog_id
+                JOIN LATERAL (
+                    SELECT ev.result
+                    FROM noetl.event ev
+                    WHERE ev.execution_id = x.execution_id
+                      AND ev.event_type = 'playbook.initialized'
+                    ORDER BY ev.event_id DESC
+                    LIMIT 1
+                ) init ON TRUE
                 JOIN LATERAL (
                     SELECT ev.event_type, ev.created_at
                     FROM noetl.event ev
-                    WHERE ev.execution_id = e.execution_id
+                    WHERE ev.execution_id = x.execution_id
                     ORDER BY ev.event_id DESC
                     LIMIT 1
                 ) latest ON TRUE
-                WHERE e.event_type = 'playbook.initialized'
-                  AND e.parent_execution_id IS NULL
-                  AND e.created_at > NOW() - (%s * INTERVAL '1 minute')
+                WHERE x.parent_execution_id IS NULL
+                  AND x.status NOT IN ('COMPLETED', 'CANCELLED')
+                  AND x.created_at > NOW() - (%s * INTERVAL '1 minute')
                   AND NOT EXISTS (
                     SELECT 1
                     FROM noetl.event t
-                    WHERE t.execution_id = e.execution_id
+                    WHERE t.execution_id = x.execution_id
                       AND t.event_type IN (
                           'playbook.completed',
                           'workflow.completed',
@@ -352,7 +370,7 @@ async def get_recovery_candidates() -> list[Dict[str, Any]]:
                           'execution.cancelled'
                       )
                   )
-                ORDER BY e.created_at DESC
+                ORDER BY x.created_at DESC
                 LIMIT %s
                 """,
                 (_AUTO_RESUME_LOOKBACK_MINUTES, fetch_limit),
@@ -426,6 +444,19 @@ async def mark_execution_cancelled(
                         created_at,
                     ),
                 )
+                # Keep the projection in step so the auto-resume and reaper
+                # sweeps drop this execution without probing the event log.
+                await cur.execute(
+                    """
+                    UPDATE noetl.execution
+                    SET status = 'CANCELLED',
+                        end_time = COALESCE(end_time, %s),
+                        updated_at = %s
+                    WHERE execution_id = %s
+                      AND status NOT IN ('COMPLETED', 'CANCELLED')
+                    """,
+                    (created_at, created_at, execution_id),
+                )
                 await _enqueue_auto_resume_outbox(
                     cur,
                     {
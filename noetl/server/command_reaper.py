@@ -33,6 +33,17 @@ Two recovery categories are covered:
    retry window without ever being CLAIMED. These typically result from a
    transient NATS publish failure right after the command row was committed.
 
+Both sweeps are driven by partial indexes on ``noetl.command``
+(``idx_command_active_lease`` and ``idx_command_pending_created``), so they
+only ever touch non-terminal rows. The execution-terminal check runs once
+per distinct candidate execution against the ``noetl.execution`` projection
+(plus an ``idx_event_exec_type`` probe, since cancellations can land in the
+event log before the projection catches up) instead of once per command.
+Due rows whose execution has already concluded are retired to
+``CANCELLED`` in the same statement, each with a matching
+``command.cancelled`` event, which keeps the partial indexes — and
+therefore sweep cost — proportional to live work rather than history.
+
 The loop runs under a ``RuntimeLease`` so only one server instance performs
 recovery at a time. See ``noetl.server.runtime_leases``.
 
@@ -56,6 +67,8 @@ NOETL_COMMAND_REAPER_PENDING_RETRY_SECONDS
     (default: ``60``, minimum 15).
 NOETL_COMMAND_REAPER_MAX_PER_RUN
     Maximum commands re-published in a single cycle (default: ``100``).
+NOETL_COMMAND_REAPER_PUBLISH_CONCURRENCY
+    Maximum NATS re-publishes in flight at once (default: ``50``).
 """
 
 from __future__ import annotations
@@ -87,6 +100,12 @@ _TERMINAL_EXECUTION_EVENT_TYPES = [
     "execution.cancelled",
 ]
 
+# ``noetl.execution.status`` values that only a concluded execution carries.
+# ``FAILED`` is not one of them: the projection flips to FAILED on any
+# ``command.failed`` while retries may still be pending, so a failed
+# execution only counts as concluded through its terminal event.
+_TERMINAL_EXECUTION_STATUSES = ["COMPLETED", "CANCELLED"]
+
 # Kept as a module attribute so historical event-based tests can still
 # reference it; some auxiliary tooling may also consult it.
 _TERMINAL_COMMAND_EVENT_TYPES = [
@@ -114,6 +133,9 @@ _REAPER_PENDING_RETRY_SECONDS = max(
 _REAPER_MAX_PER_RUN = max(
     1, int(os.getenv("NOETL_COMMAND_REAPER_MAX_PER_RUN", "100"))
 )
+_REAPER_PUBLISH_CONCURRENCY = max(
+    1, int(os.getenv("NOETL_COMMAND_REAPER_PUBLISH_CONCURRENCY", "50"))
+)
 
 
 def get_reaper_interval_seconds() -> float:
@@ -124,6 +146,110 @@ def is_reaper_enabled() -> bool:
     return _REAPER_ENABLED
 
 
+# Each sweep reads at most this many due rows per returned row, oldest
+# first off its partial index, so one cycle's cost is bounded even when a
+# backlog of leftovers from concluded executions is still being retired.
+_SWEEP_SCAN_FACTOR = 10
+
+# Appended to each sweep's ``due`` CTE.  ``concluded`` checks every
+# distinct candidate execution once: projection status first (primary-key
+# lookup), then the terminal event probe.  ``retiring`` allocates one
+# ``command.cancelled`` event id per due row of a concluded execution;
+# ``retired`` moves those rows out of the partial indexes and
+# ``retired_events`` records the matching event, so the command projection
+# never changes without an event behind it.  Data-modifying CTEs run even
+# though the final SELECT does not read them.
+_SWEEP_TAIL_SQL = """
+                concluded AS (
+                    SELECT d.execution_id
+                    FROM (SELECT DISTINCT execution_id FROM due) d
+                    LEFT JOIN noetl.execution x
+                        ON x.execution_id = d.execution_id
+                    WHERE x.status = ANY(%s)
+                       OR EXISTS (
+                            SELECT 1 FROM noetl.event et
+                            WHERE et.execution_id = d.execution_id
+                              AND et.event_type = ANY(%s)
+                       )
+                ),
+                retiring AS MATERIALIZED (
+                    SELECT d.execution_id, d.command_id, d.status,
+                           noetl.snowflake_id() AS cancel_event_id
+                    FROM due d
+                    JOIN concluded t ON t.execution_id = d.execution_id
+                ),
+                retired AS (
+                    UPDATE noetl.command c
+                    SET status = 'CANCELLED',
+                        completed_at = NOW(),
+                        latest_event_id = r.cancel_event_id,
+                        updated_at = NOW()
+                    FROM retiring r
+                    WHERE c.execution_id = r.execution_id
+                      AND c.command_id = r.command_id
+                      AND c.status = r.status
+                    RETURNING c.execution_id, c.catalog_id, c.command_id,
+                              c.event_id, c.step_name, r.cancel_event_id
+                ),
+                retired_events AS (
+                    INSERT INTO noetl.event (
+                        execution_id, catalog_id, event_id, parent_event_id,
+                        event_type, node_id, node_name, status, result, meta,
+                        command_id, created_at
+                    )
+                    SELECT
+                        r.execution_id, r.catalog_id, r.cancel_event_id, r.event_id,
+                        'command.cancelled', r.step_name, r.step_name, 'CANCELLED',
+                        jsonb_build_object(
+                            'status', 'CANCELLED',
+                            'context', jsonb_build_object('reason', 'execution_concluded')
+                        ),
+                        jsonb_build_object(
+                            'command_id', r.command_id::text,
+                            'actionable', false,
+                            'informative', true,
+                            'command_reaper', true
+                        ),
+                        r.command_id, NOW()
+                    FROM retired r
+                    RETURNING 1
+                )
+                SELECT
+                    d.event_id AS event_id,
+                    d.execution_id AS execution_id,
+                    d.command_id::text AS command_id,
+                    d.step_name AS step,
+                    d.tool_kind AS tool_kind,
+                    cat.path AS playbook_path
+                FROM due d
+                LEFT JOIN noetl.catalog cat
+                    ON cat.catalog_id = d.catalog_id
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM concluded t WHERE t.execution_id = d.execution_id
+                )
+"""
+
+_DUE_COLUMNS_SQL = """
+                        c.event_id,
+                        c.execution_id,
+                        c.command_id,
+                        c.step_name,
+                        c.tool_kind,
+                        c.catalog_id,
+                        c.status,
+                        c.claimed_at,
+                        c.created_at
+"""
+
+
+async def _run_sweep(sql: str, params: tuple) -> list[dict]:
+    async with get_bg_pool_connection(timeout=5.0) as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(sql, params)
+            rows = await cur.fetchall()
+    return list(rows or [])
+
+
 async def _find_stale_active_commands(
     *,
     stale_seconds: float,
@@ -133,14 +259,19 @@ async def _find_stale_active_commands(
     """
     Return CLAIMED/RUNNING ``noetl.command`` rows that look orphaned.
 
-    A row is considered orphaned when its execution has not yet reached a
-    terminal lifecycle event AND any of the following holds:
+    A row is considered orphaned when its execution has not yet concluded
+    AND any of the following holds:
 
     * the ``worker_id`` is missing from ``noetl.runtime`` entirely;
     * the worker's runtime status is not ``ready``;
     * the worker's heartbeat is older than ``stale_seconds``;
     * the claim has lived past ``healthy_hard_timeout_seconds``.
 
+    The status literals match the ``idx_command_active_lease`` predicate so
+    the planner can prove the partial index applies. Orphaned rows of
+    concluded executions are retired to ``CANCELLED`` (with a
+    ``command.cancelled`` event) as a side effect.
+
     Each returned row carries the fields needed to republish via NATS:
     ``event_id``, ``execution_id``, ``command_id`` (string), ``step``,
     plus ``tool_kind`` + ``playbook_path`` for pool-routing (see
@@ -148,50 +279,40 @@ async def _find_stale_active_commands(
     notifications would route to ``shared`` even for ``system/*``
     playbooks and the wrong pool could claim them).
     """
-    async with get_bg_pool_connection(timeout=5.0) as conn:
-        async with conn.cursor(row_factory=dict_row) as cur:
-            await cur.execute(
-                """
-                SELECT
-                    c.event_id AS event_id,
-                    c.execution_id AS execution_id,
-                    c.command_id::text AS command_id,
-                    c.step_name AS step,
-                    c.tool_kind AS tool_kind,
-                    cat.path AS playbook_path
-                FROM noetl.command c
-                LEFT JOIN noetl.runtime r
-                    ON r.kind = 'worker_pool'
-                   AND r.name = c.worker_id
-                LEFT JOIN noetl.catalog cat
-                    ON cat.catalog_id = c.catalog_id
-                WHERE c.status = ANY(%s)
-                  AND c.worker_id IS NOT NULL
-                  AND c.claimed_at IS NOT NULL
-                  AND (
-                        r.name IS NULL
-                     OR r.status IS DISTINCT FROM 'ready'
-                     OR r.heartbeat < (NOW() - make_interval(secs => %s))
-                     OR c.claimed_at < (NOW() - make_interval(secs => %s))
-                  )
-                  AND NOT EXISTS (
-                      SELECT 1 FROM noetl.event et
-                      WHERE et.execution_id = c.execution_id
-                        AND et.event_type = ANY(%s)
-                  )
-                ORDER BY c.claimed_at ASC
+    return await _run_sweep(
+        """
+                WITH due AS (
+                    SELECT"""
+        + _DUE_COLUMNS_SQL
+        + """                    FROM noetl.command c
+                    LEFT JOIN noetl.runtime r
+                        ON r.kind = 'worker_pool'
+                       AND r.name = c.worker_id
+                    WHERE c.status IN ('CLAIMED', 'RUNNING')
+                      AND c.worker_id IS NOT NULL
+                      AND c.claimed_at IS NOT NULL
+                      AND (
+                            r.name IS NULL
+                         OR r.status IS DISTINCT FROM 'ready'
+                         OR r.heartbeat < (NOW() - make_interval(secs => %s))
+                         OR c.claimed_at < (NOW() - make_interval(secs => %s))
+                      )
+                    ORDER BY c.claimed_at ASC
+                    LIMIT %s
+                ),"""
+        + _SWEEP_TAIL_SQL
+        + """                ORDER BY d.claimed_at ASC
                 LIMIT %s
-                """,
-                (
-                    list(_ACTIVE_COMMAND_STATUSES),
-                    stale_seconds,
-                    healthy_hard_timeout_seconds,
-                    _TERMINAL_EXECUTION_EVENT_TYPES,
-                    max_commands,
-                ),
-            )
-            rows = await cur.fetchall()
-    return list(rows or [])
+        """,
+        (
+            stale_seconds,
+            healthy_hard_timeout_seconds,
+            max_commands * _SWEEP_SCAN_FACTOR,
+            _TERMINAL_EXECUTION_STATUSES,
+            _TERMINAL_EXECUTION_EVENT_TYPES,
+            max_commands,
+        ),
+    )
 
 
 async def _find_stranded_pending_commands(
@@ -205,41 +326,34 @@ async def _find_stranded_pending_commands(
     lost (publisher disconnect, transient broker outage) right after the
     command row committed.
 
-    Rows for executions that have already terminated are excluded so we
-    do not republish work that the playbook has moved past.
+    Served by ``idx_command_pending_created``. Rows for executions that
+    have already concluded are excluded from the result and retired with a
+    ``command.cancelled`` event, so we do not republish work that the
+    playbook has moved past.
     """
-    async with get_bg_pool_connection(timeout=5.0) as conn:
-        async with conn.cursor(row_factory=dict_row) as cur:
-            await cur.execute(
-                """
-                SELECT
-                    c.event_id AS event_id,
-                    c.execution_id AS execution_id,
-                    c.command_id::text AS command_id,
-                    c.step_name AS step,
-                    c.tool_kind AS tool_kind,
-                    cat.path AS playbook_path
-                FROM noetl.command c
-                LEFT JOIN noetl.catalog cat
-                    ON cat.catalog_id = c.catalog_id
-                WHERE c.status = 'PENDING'
-                  AND c.created_at < (NOW() - make_interval(secs => %s))
-                  AND NOT EXISTS (
-                      SELECT 1 FROM noetl.event et
-                      WHERE et.execution_id = c.execution_id
-                        AND et.event_type = ANY(%s)
-                  )
-                ORDER BY c.created_at ASC
+    return await _run_sweep(
+        """
+                WITH due AS (
+                    SELECT"""
+        + _DUE_COLUMNS_SQL
+        + """                    FROM noetl.command c
+                    WHERE c.status = 'PENDING'
+                      AND c.created_at < (NOW() - make_interval(secs => %s))
+                    ORDER BY c.created_at ASC
+                    LIMIT %s
+                ),"""
+        + _SWEEP_TAIL_SQL
+        + """                ORDER BY d.created_at ASC
                 LIMIT %s
-                """,
-                (
-                    pending_retry_seconds,
-                    _TERMINAL_EXECUTION_EVENT_TYPES,
-                    max_commands,
-                ),
-            )
-            rows = await cur.fetchall()
-    return list(rows or [])
+        """,
+        (
+            pending_retry_seconds,
+            max_commands * _SWEEP_SCAN_FACTOR,
+            _TERMINAL_EXECUTION_STATUSES,
+            _TERMINAL_EXECUTION_EVENT_TYPES,
+            max_commands,
+        ),
+    )
 
 
 async def _get_nats_publisher():
@@ -293,34 +407,41 @@ async def reap_orphaned_commands_once(server_url: str) -> int:
         )
 
     nats_pub = await _get_nats_publisher()
-    republished = 0
-    for cmd in recovered:
-        try:
-            await nats_pub.publish_command(
-                execution_id=int(cmd["execution_id"]),
-                event_id=int(cmd["event_id"]),
-                command_id=str(cmd["command_id"]),
-                step=str(cmd["step"]),
-                server_url=server_url,
-                tool_kind=cmd.get("tool_kind"),
-                playbook_path=cmd.get("playbook_path"),
-            )
-            republished += 1
-            logger.info(
-                "[COMMAND-REAPER] Re-published execution_id=%s command_id=%s step=%s",
-                cmd["execution_id"],
-                cmd["command_id"],
-                cmd["step"],
-            )
-        except Exception as pub_err:
-            logger.error(
-                "[COMMAND-REAPER] Failed to re-publish execution_id=%s event_id=%s command_id=%s: %s",
-                cmd.get("execution_id"),
-                cmd.get("event_id"),
-                cmd.get("command_id"),
-                pub_err,
-                exc_info=True,
-            )
+    publish_semaphore = asyncio.Semaphore(_REAPER_PUBLISH_CONCURRENCY)
+
+    async def _republish(cmd: dict) -> bool:
+        async with publish_semaphore:
+            try:
+                await nats_pub.publish_command(
+                    execution_id=int(cmd["execution_id"]),
+                    event_id=int(cmd["event_id"]),
+                    command_id=str(cmd["command_id"]),
+                    step=str(cmd["step"]),
+                    server_url=server_url,
+                    tool_kind=cmd.get("tool_kind"),
+                    playbook_path=cmd.get("playbook_path"),
+                )
+            except Exception as pub_err:
+                logger.error(
+                    "[COMMAND-REAPER] Failed to re-publish execution_id=%s event_id=%s command_id=%s: %s",
+                    cmd.get("execution_id"),
+                    cmd.get("event_id"),
+                    cmd.get("command_id"),
+                    pub_err,
+                    exc_info=True,
+                )
+                return False
+        logger.info(
+            "[COMMAND-REAPER] Re-published execution_id=%s command_id=%s step=%s",
+            cmd["execution_id"],
+            cmd["command_id"],
+            cmd["step"],
+        )
+        return True
+
+    # Tasks start in sweep order (oldest orphaned first, then stranded).
+    outcomes = await asyncio.gather(*[_republish(cmd) for cmd in recovered])
+    republished = sum(1 for ok in outcomes if ok)
 
     logger.info(
         "[COMMAND-REAPER] Re-published %d/%d recovered commands",
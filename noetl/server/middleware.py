@@ -1,27 +1,23 @@
 import asyncio
 import json
 import os
+import re
 import time
 import logging
-from fastapi import Request, Response
+from typing import Any, Callable, Optional
+
 from noetl.core.logger import logger
 from noetl.core.sanitize import sanitize_for_logging
-
-# https://stackoverflow.com/questions/69669808/fastapi-custom-middleware-getting-body-of-request-inside
-
-# set_body and get_body functions are used for unbloking getting body of request into next middlewares
-
-
-async def set_body(request: Request, body: bytes):
-    async def receive():
-        return {"type": "http.request", "body": body}
-    request._receive = receive
-
-
-async def get_body(request: Request) -> bytes:
-    body = await request.body()
-    await set_body(request, body)
-    return body
+from noetl.core.wire_compression import (
+    DecompressedSizeExceeded,
+    choose_encoding,
+    compress,
+    compression_min_bytes,
+    decompress,
+    max_decompressed_bytes,
+    supported_encodings,
+    wire_compression_enabled,
+)
 
 
 def _filter_paths(path: str, ignore: list[str]) -> bool:
@@ -65,85 +61,323 @@ def _payload_meta(raw_body: bytes) -> dict:
     return meta
 
 
-async def catch_exceptions_middleware(request: Request, call_next):
-    start_time = time.time()
-    request_body = await get_body(request)
-    ignore = [
-        "heartbeat",
-        "/api/executions"
-    ]
-    debug_logging_enabled = logger.isEnabledFor(logging.DEBUG)
-    should_debug_log = debug_logging_enabled and not _filter_paths(request.url.path, ignore)
-    include_error_payload = os.getenv(
+_IGNORE_DEBUG_PATHS = ("heartbeat", "/api/executions")
+# Debug previews only need enough bytes to describe the payload; cap the
+# copies so a multi-MB batch body is never duplicated in full.
+_DEBUG_CAPTURE_MAX_BYTES = 256 * 1024
+
+
+def _include_error_payload() -> bool:
+    return os.getenv(
         "NOETL_LOG_INCLUDE_PAYLOAD_ON_ERROR", "false"
     ).strip().lower() in {"1", "true", "yes", "on"}
 
-    try:
-        response: Response = await asyncio.wait_for(call_next(request), timeout=1799.0)
-        process_time_sec = time.time() - start_time
-
-        # Keep fast path lightweight: only consume/rebuild the response body for debug previews.
-        if not should_debug_log:
-            return response
-
-        response_body = b""
-        async for chunk in response.body_iterator:
-            response_body += chunk
-
-        logger.debug(
-            "%s %s (%.2fs) status=%s request_meta=%s response_meta=%s",
-            request.method,
-            request.url,
-            round(process_time_sec, 2),
-            response.status_code,
-            _payload_meta(request_body),
-            {"kind": "openapi"} if "/openapi.json" in request.url.path else _payload_meta(response_body),
-        )
 
-        rebuilt_response = Response(
-            content=response_body,
-            status_code=response.status_code,
-            media_type=response.media_type,
-            background=response.background,
-        )
-        raw_headers = getattr(response, "raw_headers", None)
-        if raw_headers is not None:
-            # Preserve duplicate headers (e.g. multiple Set-Cookie) from the original response.
-            rebuilt_response.raw_headers = [
-                (k, v) for (k, v) in raw_headers if k.lower() != b"content-length"
-            ]
-            rebuilt_response.headers["content-length"] = str(len(response_body))
-        else:
-            for key, value in response.headers.items():
-                rebuilt_response.headers[key] = value
-        return rebuilt_response
-    except asyncio.TimeoutError as err:
-        process_time_sec = time.time() - start_time
-        request_preview = (
-            _payload_preview(request_body, max_length=800) if include_error_payload else "<omitted>"
-        )
-        logger.error(
-            "%s %s (%.2fs) status=504 error=%s request_meta=%s request=%s",
-            request.method,
-            request.url,
-            round(process_time_sec, 2),
-            err,
-            _payload_meta(request_body),
-            request_preview,
+class _BodyCapture:
+    """Bounded copy of a streamed body, kept only for log previews."""
+
+    __slots__ = ("chunks", "size", "total")
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.size = 0
+        self.total = 0
+
+    def add(self, chunk: bytes) -> None:
+        self.total += len(chunk)
+        if chunk and self.size < _DEBUG_CAPTURE_MAX_BYTES:
+            piece = chunk[: _DEBUG_CAPTURE_MAX_BYTES - self.size]
+            self.chunks.append(piece)
+            self.size += len(piece)
+
+    def meta(self) -> dict:
+        if self.total > self.size:
+            return {"bytes": self.total, "kind": "truncated"}
+        return _payload_meta(b"".join(self.chunks))
+
+    def preview(self, max_length: int) -> str:
+        return _payload_preview(b"".join(self.chunks), max_length=max_length)
+
+
+class RequestMiddleware:
+    """Pure ASGI request middleware: counting, timeout, errors, debug previews.
+
+    Replaces the ``BaseHTTPMiddleware``-based exception and counter
+    middlewares.  Request and response bodies stream straight through; they
+    are teed into a bounded buffer only when debug logging is enabled for the
+    path (or ``NOETL_LOG_INCLUDE_PAYLOAD_ON_ERROR`` asks for error previews),
+    so large ``/api/events/batch`` payloads are never read up front.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        *,
+        timeout_seconds: float = 1799.0,
+        on_request: Optional[Callable[[str], None]] = None,
+        ignore_debug_paths: tuple[str, ...] = _IGNORE_DEBUG_PATHS,
+    ) -> None:
+        self.app = app
+        self.timeout_seconds = timeout_seconds
+        self.on_request = on_request
+        self.ignore_debug_paths = list(ignore_debug_paths)
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope.get("path", "")
+        if self.on_request is not None:
+            try:
+                self.on_request(path)
+            except Exception:
+                pass
+
+        start_time = time.perf_counter()
+        should_debug_log = logger.isEnabledFor(logging.DEBUG) and not _filter_paths(
+            path, self.ignore_debug_paths
         )
-        return Response(content="Request processing time exceeded the maximum timeout", status_code=504)
-    except Exception as err:
-        process_time_sec = time.time() - start_time
+        include_error_payload = _include_error_payload()
+        request_capture = _BodyCapture() if (should_debug_log or include_error_payload) else None
+        response_capture = _BodyCapture() if should_debug_log else None
+        response_status: Optional[int] = None
+
+        if request_capture is not None:
+            downstream_receive = receive
+
+            async def receive() -> dict:
+                message = await downstream_receive()
+                if message["type"] == "http.request":
+                    request_capture.add(message.get("body", b""))
+                return message
+
+        async def send_wrapper(message: dict) -> None:
+            nonlocal response_status
+            if message["type"] == "http.response.start":
+                response_status = message["status"]
+            elif response_capture is not None and message["type"] == "http.response.body":
+                response_capture.add(message.get("body", b""))
+            await send(message)
+
+        try:
+            async with asyncio.timeout(self.timeout_seconds):
+                await self.app(scope, receive, send_wrapper)
+        except TimeoutError as err:
+            self._log_failure(scope, start_time, 504, err, request_capture, include_error_payload)
+            if response_status is None:
+                await _send_plain(send, 504, b"Request processing time exceeded the maximum timeout")
+            return
+        except Exception as err:
+            self._log_failure(scope, start_time, 500, err, request_capture, include_error_payload)
+            if response_status is not None:
+                # Headers are already on the wire; let the server drop the
+                # connection rather than emit a second response.
+                raise
+            await _send_plain(send, 500, f"Detail: {err}".encode("utf-8", errors="replace"))
+            return
+
+        if should_debug_log:
+            logger.debug(
+                "%s %s (%.2fs) status=%s request_meta=%s response_meta=%s",
+                scope.get("method"),
+                _request_url(scope),
+                round(time.perf_counter() - start_time, 2),
+                response_status,
+                request_capture.meta(),
+                {"kind": "openapi"} if "/openapi.json" in path else response_capture.meta(),
+            )
+
+    @staticmethod
+    def _log_failure(
+        scope: dict,
+        start_time: float,
+        status: int,
+        err: BaseException,
+        request_capture: Optional[_BodyCapture],
+        include_error_payload: bool,
+    ) -> None:
+        request_meta = request_capture.meta() if request_capture is not None else {"bytes": "<not captured>"}
         request_preview = (
-            _payload_preview(request_body, max_length=800) if include_error_payload else "<omitted>"
+            request_capture.preview(max_length=800)
+            if include_error_payload and request_capture is not None
+            else "<omitted>"
         )
-        logger.exception(
-            "%s %s (%.2fs) status=500 error=%s request_meta=%s request=%s",
-            request.method,
-            request.url,
-            round(process_time_sec, 2),
+        log = logger.error if status == 504 else logger.exception
+        log(
+            "%s %s (%.2fs) status=%s error=%s request_meta=%s request=%s",
+            scope.get("method"),
+            _request_url(scope),
+            round(time.perf_counter() - start_time, 2),
+            status,
             err,
-            _payload_meta(request_body),
+            request_meta,
             request_preview,
         )
-        return Response(content=f"Detail: {err}", status_code=500)
+
+
+def _request_url(scope: dict) -> str:
+    query = scope.get("query_string") or b""
+    path = scope.get("path", "")
+    return f"{path}?{query.decode('latin-1')}" if query else path
+
+
+async def _send_plain(
+    send: Callable,
+    status: int,
+    body: bytes,
+    headers: Optional[list[tuple[bytes, bytes]]] = None,
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                *(headers or []),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+# Worker control-plane routes: event emission, command claim (full context
+# and meta in the response) and execution variables.
+_WIRE_COMPRESSION_PATHS = re.compile(r"^/api/(events|events/batch|commands/[^/]+/claim|vars/[^/]+)/?$")
+# Bodies above this are (de)compressed in a thread instead of on the loop.
+_WIRE_OFFLOAD_BYTES = 256 * 1024
+
+
+async def _wire_codec(function: Callable, data: bytes, encoding: str) -> bytes:
+    if len(data) >= _WIRE_OFFLOAD_BYTES:
+        return await asyncio.to_thread(function, data, encoding)
+    return function(data, encoding)
+
+
+class WireCompressionMiddleware:
+    """Pure ASGI content coding for the worker control-plane routes.
+
+    Decodes gzip/zstd request bodies, compresses responses of at least
+    ``NOETL_WIRE_COMPRESSION_MIN_BYTES`` for clients that accept it, and
+    advertises the accepted request codings in an ``Accept-Encoding``
+    response header so workers know they may compress (RFC 7694).  The JSON
+    itself is untouched; see ``noetl.core.wire_compression``.
+    """
+
+    def __init__(self, app: Any, *, paths: re.Pattern = _WIRE_COMPRESSION_PATHS) -> None:
+        self.app = app
+        self.paths = paths
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.paths.match(scope.get("path", ""))
+            or not wire_compression_enabled()
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        advertised = ", ".join(supported_encodings()).encode("ascii")
+        content_encoding = ""
+        accept_encoding = None
+        for name, value in scope.get("headers") or []:
+            if name == b"content-encoding":
+                content_encoding = value.decode("latin-1").strip().lower()
+            elif name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+
+        if content_encoding and content_encoding != "identity":
+            if content_encoding not in supported_encodings():
+                await _send_plain(
+                    send,
+                    415,
+                    f"Unsupported Content-Encoding: {content_encoding}".encode("utf-8", errors="replace"),
+                    [(b"accept-encoding", advertised)],
+                )
+                return
+            try:
+                body = await _read_body(receive)
+                if body is None:
+                    return
+                body = await _wire_codec(decompress, body, content_encoding)
+            except DecompressedSizeExceeded:
+                await _send_plain(send, 413, b"Decompressed request body is too large")
+                return
+            except ValueError as err:
+                await _send_plain(send, 400, f"Detail: {err}".encode("utf-8", errors="replace"))
+                return
+            scope = dict(scope)
+            scope["headers"] = [
+                (name, value)
+                for name, value in scope.get("headers") or []
+                if name not in (b"content-encoding", b"content-length")
+            ] + [(b"content-length", str(len(body)).encode("ascii"))]
+            receive = _replay_body(body, receive)
+
+        response_encoding = choose_encoding(accept_encoding)
+        response_start: Optional[dict] = None
+
+        async def send_wrapper(message: dict) -> None:
+            nonlocal response_start
+            if message["type"] == "http.response.start":
+                # Held until the first body chunk shows whether to compress.
+                response_start = message
+                return
+            if message["type"] != "http.response.body" or response_start is None:
+                await send(message)
+                return
+            start, response_start = response_start, None
+            headers = list(start.get("headers") or [])
+            headers.append((b"accept-encoding", advertised))
+            body = message.get("body", b"")
+            if (
+                response_encoding is not None
+                and not message.get("more_body", False)
+                and len(body) >= compression_min_bytes()
+                and not any(name.lower() == b"content-encoding" for name, _value in headers)
+            ):
+                body = await _wire_codec(compress, body, response_encoding)
+                headers = [(name, value) for name, value in headers if name.lower() != b"content-length"]
+                headers += [
+                    (b"content-encoding", response_encoding.encode("ascii")),
+                    (b"content-length", str(len(body)).encode("ascii")),
+                    (b"vary", b"Accept-Encoding"),
+                ]
+                message = {**message, "body": body}
+            await send({**start, "headers": headers})
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+async def _read_body(receive: Callable) -> Optional[bytes]:
+    """Whole compressed request body, or None if the client went away."""
+    chunks = []
+    size = 0
+    limit = max_decompressed_bytes()
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > limit:
+            # Compressed bodies never legitimately exceed the expanded limit.
+            raise DecompressedSizeExceeded(f"Request body exceeds {limit} bytes")
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+def _replay_body(body: bytes, receive: Callable) -> Callable:
+    sent = False
+
+    async def replay() -> dict:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
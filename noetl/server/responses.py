@@ -0,0 +1,56 @@
+"""Response and route classes for the opt-in fast JSON path.
+
+See :mod:`noetl.core.json_codec`.  ``FastJSONRoute`` parses request bodies
+with the fast codec and ``FastJSONResponse`` renders with it, skipping
+FastAPI's ``jsonable_encoder`` pass when a handler returns it directly.
+Both are no-ops unless ``NOETL_FAST_JSON`` is enabled.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from noetl.core import json_codec
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by :func:`noetl.core.json_codec.dumps`."""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps(content)
+
+
+class _FastJSONRequest(Request):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = json_codec.loads(await self.body())
+        return self._json
+
+
+class FastJSONRoute(APIRoute):
+    """APIRoute whose JSON request bodies are decoded by the fast codec."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            if json_codec.fast_json_enabled():
+                request = _FastJSONRequest(request.scope, request.receive)
+            return await handler(request)
+
+        return route_handler
+
+
+def json_response(content: Any, status_code: int = 200) -> Any:
+    """Return ``content`` as a FastJSONResponse when the fast path is enabled.
+
+    Otherwise ``content`` is returned unchanged so FastAPI serializes it the
+    usual way (response_model validation + ``jsonable_encoder``).
+    """
+    if json_codec.fast_json_enabled():
+        return FastJSONResponse(content, status_code=status_code)
+    return content
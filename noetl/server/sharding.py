@@ -0,0 +1,430 @@
+"""
+Execution-sharded multi-process server mode.
+
+Background
+----------
+The batch acceptor queue and its per-execution locks
+(``noetl.server.api.core.batch``), the active-claim cache
+(``noetl.server.api.core.cache``), the events-feed long-poll waiters and
+the playbook cache all live in process memory.  Plain ``uvicorn --workers``
+spreads requests over processes at random, so every extra process dilutes
+coalescing and cache hits and lets two processes race on one execution.
+
+This module runs ``shards`` server processes on one host instead.  Every
+process binds the public port with ``SO_REUSEPORT`` (the kernel spreads
+connections) and a private unix socket in ``socket_dir``.  Each request
+that names an execution is owned by exactly one process,
+``shard_for_execution(execution_id, shards)``.  A process serves requests
+it owns and the requests that name no execution.  It forwards the rest
+over the owner's unix socket, one local hop, so an execution's acceptor
+lock, caches and waiters stay in a single process.
+
+The execution is read, in order, from:
+
+* the ``X-NoETL-Execution-Id`` header (``noetl.core.urls``), which workers
+  send on claim and event calls;
+* the path, for ``/api/executions/{id}/...`` and ``/api/vars/{id}``;
+* the JSON body of ``POST /api/events`` and ``POST /api/events/batch``
+  from clients that do not send the header (the body is buffered once and
+  replayed downstream).
+
+Forwarded requests carry ``X-NoETL-Shard-Hop`` and are always served where
+they land, so a request is forwarded at most once.  Postgres stays the
+source of truth: a request served by the wrong process is still correct,
+only colder.
+
+Environment variables
+---------------------
+NOETL_SERVER_SHARDS
+    Number of server processes (default: ``1``, sharding off).
+NOETL_SERVER_SHARD_SOCKET_DIR
+    Directory for the per-shard unix sockets (default: a fresh temp dir).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import signal
+import socket
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from noetl.core.json_codec import loads as json_loads
+from noetl.core.logger import setup_logger
+from noetl.core.urls import EXECUTION_ID_HEADER
+
+logger = setup_logger(__name__, include_location=True)
+
+SHARD_HOP_HEADER = "X-NoETL-Shard-Hop"
+
+_EXECUTION_HEADER_KEY = EXECUTION_ID_HEADER.lower().encode("latin-1")
+_HOP_HEADER_KEY = SHARD_HOP_HEADER.lower().encode("latin-1")
+_EXECUTION_PATH_RE = re.compile(r"^/api/(?:executions|vars)/(\d+)(?:/|$)")
+_BODY_ROUTED_PATHS = frozenset({"/api/events", "/api/events/batch"})
+_HOP_BY_HOP_HEADERS = frozenset({
+    b"connection", b"keep-alive", b"proxy-authenticate", b"proxy-authorization",
+    b"te", b"trailer", b"transfer-encoding", b"upgrade",
+})
+_MASK64 = (1 << 64) - 1
+
+
+def shard_for_execution(execution_id: Any, shards: int) -> int:
+    """Owning shard of ``execution_id``; stable across processes and restarts.
+
+    Snowflake ids carry time and sequence in their low bits, so they are
+    mixed (splitmix64 finalizer) before the modulo.
+    """
+    if shards <= 1:
+        return 0
+    x = int(execution_id) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    x ^= x >> 31
+    return x % shards
+
+
+def load_server_shards() -> int:
+    raw = os.getenv("NOETL_SERVER_SHARDS", "").strip()
+    try:
+        return max(1, int(raw)) if raw else 1
+    except ValueError:
+        return 1
+
+
+@dataclass(frozen=True, slots=True)
+class ShardLayout:
+    shards: int
+    index: int
+    socket_dir: str
+
+    def socket_path(self, index: int) -> str:
+        return os.path.join(self.socket_dir, f"shard-{index}.sock")
+
+    def owner(self, execution_id: Any) -> int:
+        return shard_for_execution(execution_id, self.shards)
+
+
+def _header(scope: dict, key: bytes) -> Optional[bytes]:
+    for name, value in scope.get("headers") or ():
+        if name.lower() == key:
+            return value
+    return None
+
+
+def _as_execution_id(value: Any) -> Optional[int]:
+    try:
+        execution_id = int(value)
+    except (TypeError, ValueError):
+        return None
+    return execution_id if execution_id > 0 else None
+
+
+def execution_id_from_scope(scope: dict) -> Optional[int]:
+    """Execution named by the routing header or the path, if any."""
+    header = _header(scope, _EXECUTION_HEADER_KEY)
+    if header is not None:
+        return _as_execution_id(header.decode("latin-1").strip())
+    match = _EXECUTION_PATH_RE.match(scope.get("path", ""))
+    return _as_execution_id(match.group(1)) if match else None
+
+
+def execution_id_from_body(body: bytes) -> Optional[int]:
+    if not body:
+        return None
+    try:
+        payload = json_loads(body)
+    except (TypeError, ValueError):
+        return None
+    if isinstance(payload, dict):
+        return _as_execution_id(payload.get("execution_id"))
+    return None
+
+
+async def _read_body(receive: Callable) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    return b"".join(chunks)
+
+
+def _replay(body: bytes, receive: Callable) -> Callable:
+    sent = False
+
+    async def replay() -> dict:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+def _uds_transport(path: str):
+    import httpx
+
+    return httpx.AsyncHTTPTransport(uds=path, limits=httpx.Limits(max_connections=256, max_keepalive_connections=64))
+
+
+class ShardRouterMiddleware:
+    """Pure ASGI middleware: serve owned requests, forward the rest to their shard.
+
+    ``transport_factory`` maps a shard socket path to an httpx transport;
+    tests swap it for an in-process transport.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        *,
+        layout: ShardLayout,
+        transport_factory: Callable[[str], Any] = _uds_transport,
+    ) -> None:
+        self.app = app
+        self.layout = layout
+        self.transport_factory = transport_factory
+        self._clients: dict[int, Any] = {}
+
+    def _client(self, index: int):
+        client = self._clients.get(index)
+        if client is None:
+            import httpx
+
+            client = httpx.AsyncClient(
+                transport=self.transport_factory(self.layout.socket_path(index)),
+                base_url="http://noetl-shard",
+                # The owner applies its own request timeout.
+                timeout=httpx.Timeout(None, connect=5.0),
+            )
+            self._clients[index] = client
+        return client
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or self.layout.shards <= 1 or _header(scope, _HOP_HEADER_KEY) is not None:
+            await self.app(scope, receive, send)
+            return
+
+        body: Optional[bytes] = None
+        execution_id = execution_id_from_scope(scope)
+        if execution_id is None and scope.get("method") == "POST" and scope.get("path") in _BODY_ROUTED_PATHS:
+            body = await _read_body(receive)
+            execution_id = execution_id_from_body(body)
+            receive = _replay(body, receive)
+
+        owner = self.layout.index if execution_id is None else self.layout.owner(execution_id)
+        if owner == self.layout.index:
+            await self.app(scope, receive, send)
+            return
+        await self._forward(owner, scope, receive, send, body)
+
+    async def _forward(self, owner: int, scope: dict, receive: Callable, send: Callable, body: Optional[bytes]) -> None:
+        import httpx
+
+        headers = [
+            (name, value)
+            for name, value in scope.get("headers") or ()
+            if name.lower() not in _HOP_BY_HOP_HEADERS and not (body is not None and name.lower() == b"content-length")
+        ]
+        headers.append((_HOP_HEADER_KEY, str(self.layout.index).encode("latin-1")))
+        if body is None:
+            has_body = any(name.lower() == b"content-length" for name, _ in headers) or (
+                _header(scope, b"transfer-encoding") is not None
+            )
+
+            async def _stream():
+                while True:
+                    message = await receive()
+                    if message["type"] != "http.request":
+                        return
+                    chunk = message.get("body", b"")
+                    if chunk:
+                        yield chunk
+                    if not message.get("more_body"):
+                        return
+
+            content = _stream() if has_body else None
+        else:
+            content = body
+
+        raw_path = scope.get("raw_path") or scope.get("path", "/").encode("latin-1")
+        query = scope.get("query_string") or b""
+        target = raw_path + (b"?" + query if query else b"")
+        client = self._client(owner)
+        request = client.build_request(scope["method"], target.decode("latin-1"), headers=headers, content=content)
+        try:
+            response = await client.send(request, stream=True)
+        except httpx.TransportError as exc:
+            logger.warning(
+                "[SHARD] Forward to shard %s failed for %s %s: %s", owner, scope["method"], scope.get("path"), exc
+            )
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [(b"content-type", b"application/json"), (b"retry-after", b"1")],
+            })
+            await send({
+                "type": "http.response.body",
+                "body": json.dumps({"detail": {"code": "shard_unavailable", "shard": owner}}).encode(),
+            })
+            return
+
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [
+                    (name, value) for name, value in response.headers.raw
+                    if name.lower() not in _HOP_BY_HOP_HEADERS
+                ],
+            })
+            async for chunk in response.aiter_raw():
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            await response.aclose()
+
+
+def _bind_public_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    return sock
+
+
+def _bind_unix_socket(path: str) -> socket.socket:
+    if os.path.exists(path):
+        os.unlink(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    return sock
+
+
+def _serve_shard(
+    index: int,
+    shards: int,
+    host: str,
+    port: int,
+    socket_dir: str,
+    app_factory: str,
+    uvicorn_kwargs: dict,
+) -> None:
+    os.environ["NOETL_SERVER_SHARDS"] = str(shards)
+    os.environ["NOETL_SERVER_SHARD_INDEX"] = str(index)
+    instance_name = os.getenv("NOETL_SERVER_INSTANCE_NAME", "").strip()
+    if instance_name:
+        os.environ["NOETL_SERVER_INSTANCE_NAME"] = f"{instance_name}-shard-{index}"
+    if index:
+        # The Arrow Flight listener binds a fixed port; shard 0 runs it.
+        os.environ["NOETL_FLIGHT_DISABLED"] = "1"
+
+    import logging
+
+    import uvicorn
+    from uvicorn.importer import import_from_string
+
+    from noetl.server.__main__ import AccessLogFilter, _load_suppressed_access_paths
+
+    logging.getLogger("uvicorn.access").addFilter(AccessLogFilter(_load_suppressed_access_paths()))
+    layout = ShardLayout(shards=shards, index=index, socket_dir=socket_dir)
+    app = ShardRouterMiddleware(import_from_string(app_factory)(), layout=layout)
+    sockets = [_bind_public_socket(host, port), _bind_unix_socket(layout.socket_path(index))]
+    uvicorn.Server(uvicorn.Config(app, **uvicorn_kwargs)).run(sockets=sockets)
+
+
+def run_sharded_server(
+    *,
+    host: str,
+    port: int,
+    shards: int,
+    app_factory: str = "noetl.server.app:create_app",
+    socket_dir: Optional[str] = None,
+    uvicorn_kwargs: Optional[dict] = None,
+) -> int:
+    """Run ``shards`` server processes until one exits or a signal arrives.
+
+    Returns the exit code for the supervisor: 0 after a requested stop,
+    otherwise the code of the first shard that died (the orchestrator
+    restarts the whole group; a partial group would leave executions
+    without their owner).
+    """
+    import multiprocessing
+    from multiprocessing.connection import wait
+
+    socket_dir = socket_dir or os.getenv("NOETL_SERVER_SHARD_SOCKET_DIR", "").strip() or None
+    owns_dir = socket_dir is None
+    if owns_dir:
+        socket_dir = tempfile.mkdtemp(prefix="noetl-shards-")
+    os.makedirs(socket_dir, exist_ok=True)
+    ctx = multiprocessing.get_context("spawn")
+    processes = [
+        ctx.Process(
+            target=_serve_shard,
+            args=(index, shards, host, port, socket_dir, app_factory, dict(uvicorn_kwargs or {})),
+            name=f"noetl-server-shard-{index}",
+        )
+        for index in range(shards)
+    ]
+    stopping = False
+
+    def _stop(*_args) -> None:
+        nonlocal stopping
+        stopping = True
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    previous = {sig: signal.signal(sig, _stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+    exit_code = 0
+    try:
+        for process in processes:
+            process.start()
+        logger.info("[SHARD] Started %d server shards on %s:%s (sockets in %s)", shards, host, port, socket_dir)
+        while True:
+            alive = [process for process in processes if process.is_alive()]
+            if not alive:
+                break
+            wait([process.sentinel for process in alive])
+            for process in processes:
+                if not process.is_alive() and not stopping:
+                    logger.error("[SHARD] %s exited with code %s; stopping all shards", process.name, process.exitcode)
+                    exit_code = process.exitcode or 1
+                    _stop()
+    finally:
+        for process in processes:
+            process.join(timeout=30)
+            if process.is_alive():
+                process.kill()
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+        if owns_dir:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+    return exit_code
+
+
+__all__ = [
+    "SHARD_HOP_HEADER",
+    "ShardLayout",
+    "ShardRouterMiddleware",
+    "execution_id_from_body",
+    "execution_id_from_scope",
+    "load_server_shards",
+    "run_sharded_server",
+    "shard_for_execution",
+]
@@ -25,6 +25,7 @@ _MODULES = {
     "nats": "noetl.tools.nats",
     "agent": "noetl.tools.agent",
     "mcp": "noetl.tools.mcp",
+    "script": "noetl.tools.script",
 }
 
 _EXECUTORS = {
@@ -36,6 +37,7 @@ _EXECUTORS = {
     "execute_duckdb_task": ("noetl.tools.duckdb", "execute_duckdb_task"),
     "execute_ducklake_task": ("noetl.tools.ducklake", "execute_ducklake_task"),
     "execute_snowflake_task": ("noetl.tools.snowflake", "execute_snowflake_task"),
+    "execute_snowflake_task_async": ("noetl.tools.snowflake", "execute_snowflake_task_async"),
     "execute_snowflake_transfer_task": ("noetl.tools.snowflake", "execute_snowflake_transfer_task"),
     "execute_transfer_action": ("noetl.tools.transfer", "execute_transfer_action"),
     "execute_snowflake_transfer_action": (
@@ -50,6 +52,10 @@ _EXECUTORS = {
     "execute_nats_task": ("noetl.tools.nats", "execute_nats_task"),
     "execute_agent_task": ("noetl.tools.agent", "execute_agent_task"),
     "execute_mcp_task": ("noetl.tools.mcp", "execute_mcp_task"),
+    "execute_script_task": ("noetl.tools.script", "execute_script_task"),
+    "execute_secrets_task": ("noetl.core.secrets", "execute_secrets_task"),
+    "execute_workbook_task": ("noetl.core.workflow.workbook", "execute_workbook_task"),
+    "execute_playbook_task": ("noetl.core.workflow.playbook", "execute_playbook_task"),
     "execute_task": ("noetl.core.runtime.execution", "execute_task"),
     "execute_task_resolved": ("noetl.core.runtime.execution", "execute_task_resolved"),
 }
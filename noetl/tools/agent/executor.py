@@ -99,6 +99,7 @@ def _wait_for_sub_execution_terminal(
     *,
     timeout_seconds: float = 300.0,
     poll_interval_seconds: float = 1.0,
+    long_poll_seconds: float = 30.0,
 ) -> Dict[str, Any]:
     """Poll noetl-server's /api/executions/{id}/status until terminal.
 
@@ -111,6 +112,12 @@ def _wait_for_sub_execution_terminal(
     because the parent's normalised_status stays "started" instead
     of "error".
 
+    Each request long-polls with ``wait_seconds`` (up to
+    ``long_poll_seconds``), so the server answers as soon as the child's
+    terminal event commits instead of the caller re-polling every
+    second.  A server that ignores ``wait_seconds`` answers at once; the
+    loop then falls back to sleeping ``poll_interval_seconds``.
+
     Returns the status doc from /api/executions/{id}/status (with
     keys ``completed``, ``failed``, optionally ``current_step`` /
     ``error``) once the execution reaches terminal status, OR a
@@ -145,8 +152,14 @@ def _wait_for_sub_execution_terminal(
 
     while time.time() < deadline:
         poll_n += 1
+        wait_seconds = max(0.0, min(float(long_poll_seconds), deadline - time.time()))
+        poll_started = time.time()
         try:
-            resp = requests.get(status_url, timeout=10)
+            resp = requests.get(
+                status_url,
+                params={"wait_seconds": round(wait_seconds, 3)} if wait_seconds > 0 else None,
+                timeout=10 + wait_seconds,
+            )
             resp.raise_for_status()
             last_doc = resp.json()
         except Exception as exc:
@@ -165,7 +178,11 @@ def _wait_for_sub_execution_terminal(
             )
             return last_doc
 
-        time.sleep(max(0.1, float(poll_interval_seconds)))
+        # Only sleep when the server answered without parking (older
+        # servers ignore ``wait_seconds``).
+        remaining_interval = max(0.1, float(poll_interval_seconds)) - (time.time() - poll_started)
+        if remaining_interval > 0:
+            time.sleep(remaining_interval)
 
     logger.warning(
         "AGENT.WAIT: %s did not reach terminal within %.1fs (last status: %s)",
@@ -1,5 +1,5 @@
 """MCP tool executor."""
 
-from .executor import execute_mcp_task
+from .executor import close_mcp_sessions, execute_mcp_task
 
-__all__ = ["execute_mcp_task"]
+__all__ = ["execute_mcp_task", "close_mcp_sessions"]
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import json
 import math
 import os
+import time
 from typing import Any, Dict, Optional
 from urllib.parse import urlsplit, urlunsplit
 
@@ -122,12 +125,22 @@ def _resolve_health_endpoint(endpoint: str) -> str:
     return urlunsplit((parts.scheme, parts.netloc, path, "", ""))
 
 
+class _McpSessionExpired(RuntimeError):
+    """The server no longer knows the session; a new ``initialize`` is needed."""
+
+
+# JSON-RPC error code MCP servers return with "Session not found" when a
+# session id is unknown (some answer it inside a 200 envelope).
+_SESSION_NOT_FOUND_CODE = -32001
+
+
 async def _post_jsonrpc(
     client: httpx.AsyncClient,
     endpoint: str,
     payload: Dict[str, Any],
     *,
     session_id: Optional[str] = None,
+    timeout: Optional[float] = None,
 ) -> tuple[Dict[str, Any], httpx.Headers]:
     headers = {
         "Content-Type": "application/json",
@@ -136,17 +149,168 @@ async def _post_jsonrpc(
     if session_id:
         headers["Mcp-Session-Id"] = session_id
 
-    response = await client.post(endpoint, json=payload, headers=headers)
+    response = await client.post(endpoint, json=payload, headers=headers, timeout=timeout)
+    if session_id and response.status_code == 404:
+        # Streamable HTTP servers answer 404 for a terminated or expired session.
+        raise _McpSessionExpired(f"MCP session {session_id} expired")
     response.raise_for_status()
     envelope = _parse_mcp_envelope(response.text, str(payload.get("method") or "request"))
     if envelope.get("error"):
         error = envelope["error"]
+        code = error.get("code") if isinstance(error, dict) else None
         if isinstance(error, dict):
-            raise RuntimeError(error.get("message") or json.dumps(error, default=str))
-        raise RuntimeError(str(error))
+            message = error.get("message") or json.dumps(error, default=str)
+        else:
+            message = str(error)
+        # Match the code only: tool errors may well mention "session".
+        if session_id and code == _SESSION_NOT_FOUND_CODE:
+            raise _McpSessionExpired(message)
+        raise RuntimeError(message)
     return envelope, response.headers
 
 
+class _McpSession:
+    """An initialized MCP session shared by every step calling the same server."""
+
+    __slots__ = ("session_id", "initialize", "tools", "last_used", "_ids")
+
+    def __init__(self, session_id: Optional[str], initialize: Any, first_request_id: int):
+        self.session_id = session_id
+        self.initialize = initialize
+        # Cached ``tools/list`` envelope; tool catalogs only change with the session.
+        self.tools: Optional[Dict[str, Any]] = None
+        self.last_used = time.monotonic()
+        self._ids = itertools.count(first_request_id)
+
+    def next_request_id(self) -> int:
+        return next(self._ids)
+
+
+# Shared clients keyed by loop id; sessions and their locks keyed by
+# (loop_id, endpoint, protocol_version, handshake).  Like the shared HTTP
+# clients, nothing is used from an event loop other than the one that made it.
+_MCP_CLIENTS: Dict[int, httpx.AsyncClient] = {}
+_MCP_SESSIONS: Dict[tuple, _McpSession] = {}
+_MCP_SESSION_LOCKS: Dict[tuple, asyncio.Lock] = {}
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    loop_id = id(asyncio.get_running_loop())
+    client = _MCP_CLIENTS.get(loop_id)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient()
+        _MCP_CLIENTS[loop_id] = client
+    return client
+
+
+def _initialize_params(config: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "protocolVersion": str(config.get("protocol_version") or "2025-03-26"),
+        "capabilities": config.get("capabilities") or {},
+        "clientInfo": {
+            "name": str(config.get("client_name") or "noetl-worker"),
+            "version": str(config.get("client_version") or "0"),
+        },
+    }
+
+
+def _session_key(endpoint: str, init_params: Dict[str, Any]) -> tuple:
+    handshake = json.dumps(
+        [init_params["capabilities"], init_params["clientInfo"]],
+        sort_keys=True,
+        default=str,
+    )
+    return (id(asyncio.get_running_loop()), endpoint, init_params["protocolVersion"], handshake)
+
+
+async def _get_session(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    init_params: Dict[str, Any],
+    *,
+    request_id: int,
+    timeout: float,
+    server: str,
+) -> tuple[_McpSession, bool]:
+    """Return a pooled session for the endpoint, initializing one if needed.
+
+    The flag is True when the session was reused rather than just created.
+    """
+    key = _session_key(endpoint, init_params)
+    max_idle = _read_float_env("NOETL_MCP_SESSION_MAX_IDLE_SECONDS", 300.0, min_value=0.0)
+    lock = _MCP_SESSION_LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        session = _MCP_SESSIONS.get(key)
+        if session is not None and time.monotonic() - session.last_used <= max_idle:
+            session.last_used = time.monotonic()
+            return session, True
+
+        init_envelope, init_headers = await _post_jsonrpc(
+            client,
+            endpoint,
+            {"jsonrpc": "2.0", "id": request_id, "method": "initialize", "params": init_params},
+            timeout=timeout,
+        )
+        session_id = init_headers.get("mcp-session-id") or init_headers.get("Mcp-Session-Id")
+        if not session_id:
+            logger.debug(
+                "MCP server %s did not return a session id; continuing as stateless JSON-RPC",
+                server,
+            )
+        session = _McpSession(session_id, init_envelope.get("result"), request_id + 1)
+        _MCP_SESSIONS[key] = session
+        return session, False
+
+
+def _drop_session(endpoint: str, init_params: Dict[str, Any], session: _McpSession) -> None:
+    key = _session_key(endpoint, init_params)
+    if _MCP_SESSIONS.get(key) is session:
+        _MCP_SESSIONS.pop(key, None)
+
+
+async def _request(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    session: _McpSession,
+    method: str,
+    params: Dict[str, Any],
+    timeout: float,
+) -> Dict[str, Any]:
+    if method == "tools/list" and session.tools is not None:
+        return session.tools
+    envelope, _headers = await _post_jsonrpc(
+        client,
+        endpoint,
+        {
+            "jsonrpc": "2.0",
+            "id": session.next_request_id(),
+            "method": method,
+            "params": params,
+        },
+        session_id=session.session_id,
+        timeout=timeout,
+    )
+    if method == "tools/list":
+        session.tools = envelope
+    return envelope
+
+
+async def close_mcp_sessions() -> None:
+    """Terminate pooled MCP sessions and close the shared client for this loop."""
+    loop_id = id(asyncio.get_running_loop())
+    client = _MCP_CLIENTS.pop(loop_id, None)
+    for key in [key for key in _MCP_SESSIONS if key[0] == loop_id]:
+        session = _MCP_SESSIONS.pop(key)
+        _MCP_SESSION_LOCKS.pop(key, None)
+        if client is not None and session.session_id:
+            try:
+                await client.delete(key[1], headers={"Mcp-Session-Id": session.session_id}, timeout=5.0)
+            except httpx.HTTPError as exc:
+                logger.debug("Failed to terminate MCP session at %s: %s", key[1], exc)
+    if client is not None:
+        await client.aclose()
+
+
 async def execute_mcp_task(
     task_config: Dict[str, Any],
     context: Dict[str, Any],
@@ -157,8 +321,13 @@ async def execute_mcp_task(
 
     Supported actions:
     - `health`: GET `<endpoint>/healthz`
-    - `tools/list`: initialize, then list tools
-    - `tools/call`: initialize, then call one tool with `arguments`
+    - `tools/list`: list tools (cached for the life of the session)
+    - `tools/call`: call one tool with `arguments`
+
+    Sessions are initialized once per endpoint, protocol version and
+    handshake and then reused by later steps on the same worker.  A session
+    the server has expired is dropped and the request retried once on a new
+    one.
     """
     server = "kubernetes"
     endpoint: Optional[str] = None
@@ -175,78 +344,58 @@ async def execute_mcp_task(
         method = str(config.get("method") or config.get("action") or "tools/call")
         timeout = _resolve_timeout_seconds(config.get("timeout_seconds"))
         request_id = int(config.get("request_id") or 1)
-
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            if method == "health":
-                response = await client.get(_resolve_health_endpoint(endpoint))
-                response.raise_for_status()
-                return {
-                    "status": "ok",
-                    "server": server,
-                    "endpoint": endpoint,
-                    "method": method,
-                    "healthy": True,
-                    "text": response.text,
-                }
-
-            init_envelope, init_headers = await _post_jsonrpc(
-                client,
-                endpoint,
-                {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": str(config.get("protocol_version") or "2025-03-26"),
-                        "capabilities": config.get("capabilities") or {},
-                        "clientInfo": {
-                            "name": str(config.get("client_name") or "noetl-worker"),
-                            "version": str(config.get("client_version") or "0"),
-                        },
-                    },
-                },
-            )
-            session_id = init_headers.get("mcp-session-id") or init_headers.get("Mcp-Session-Id")
-            if not session_id:
-                logger.debug(
-                    "MCP server %s did not return a session id; continuing as stateless JSON-RPC",
-                    server,
-                )
-
-            if method == "tools/call":
-                tool_name = config.get("tool") or config.get("tool_name")
-                if not tool_name:
-                    raise ValueError("mcp tool name is required for tools/call")
-                arguments = config.get("arguments")
-                if arguments is None:
-                    arguments = config.get("args")
-                if arguments is None:
-                    arguments = {}
-                if isinstance(arguments, str):
-                    arguments = json.loads(arguments)
-                if not isinstance(arguments, dict):
-                    raise ValueError("mcp arguments must be an object")
-                params = {"name": str(tool_name), "arguments": arguments}
-            elif method == "tools/list":
-                params = {}
-            else:
-                params = config.get("params") or {}
-                if isinstance(params, str):
-                    params = json.loads(params)
-                if not isinstance(params, dict):
-                    raise ValueError("mcp params must be an object")
-
-            envelope, _headers = await _post_jsonrpc(
-                client,
-                endpoint,
-                {
-                    "jsonrpc": "2.0",
-                    "id": request_id + 1,
-                    "method": method,
-                    "params": params,
-                },
-                session_id=session_id,
+        client = _get_shared_client()
+
+        if method == "health":
+            response = await client.get(_resolve_health_endpoint(endpoint), timeout=timeout)
+            response.raise_for_status()
+            return {
+                "status": "ok",
+                "server": server,
+                "endpoint": endpoint,
+                "method": method,
+                "healthy": True,
+                "text": response.text,
+            }
+
+        if method == "tools/call":
+            tool_name = config.get("tool") or config.get("tool_name")
+            if not tool_name:
+                raise ValueError("mcp tool name is required for tools/call")
+            arguments = config.get("arguments")
+            if arguments is None:
+                arguments = config.get("args")
+            if arguments is None:
+                arguments = {}
+            if isinstance(arguments, str):
+                arguments = json.loads(arguments)
+            if not isinstance(arguments, dict):
+                raise ValueError("mcp arguments must be an object")
+            params = {"name": str(tool_name), "arguments": arguments}
+        elif method == "tools/list":
+            params = {}
+        else:
+            params = config.get("params") or {}
+            if isinstance(params, str):
+                params = json.loads(params)
+            if not isinstance(params, dict):
+                raise ValueError("mcp params must be an object")
+
+        init_params = _initialize_params(config)
+        session, reused = await _get_session(
+            client, endpoint, init_params, request_id=request_id, timeout=timeout, server=server
+        )
+        try:
+            envelope = await _request(client, endpoint, session, method, params, timeout)
+        except _McpSessionExpired as exc:
+            _drop_session(endpoint, init_params, session)
+            if not reused:
+                raise
+            logger.debug("Re-initializing MCP session for %s after: %s", endpoint, exc)
+            session, _reused = await _get_session(
+                client, endpoint, init_params, request_id=request_id, timeout=timeout, server=server
             )
+            envelope = await _request(client, endpoint, session, method, params, timeout)
 
         result = envelope.get("result") or {}
         if not isinstance(result, dict):
@@ -262,7 +411,7 @@ async def execute_mcp_task(
             "arguments": params.get("arguments") if isinstance(params, dict) else None,
             "text": text,
             "result": result,
-            "initialize": init_envelope.get("result"),
+            "initialize": session.initialize,
         }
     except (ValueError, RuntimeError, json.JSONDecodeError, httpx.HTTPError) as exc:
         logger.warning(
@@ -8,6 +8,8 @@ This package provides Snowflake database task execution capabilities with:
 - Multi-statement support with proper quote handling
 - Warehouse management
 - Result formatting and error handling
+- Arrow batch fetch; large results stored in TempStore as Arrow IPC
+- Worker-level session reuse keyed by credential fingerprint
 - MCP-compliant interface
 - Chunked data transfer between Snowflake and PostgreSQL
 
@@ -44,6 +46,16 @@ Usage:
     )
 """
 
-from noetl.tools.snowflake.executor import execute_snowflake_task, execute_snowflake_transfer_task
+from noetl.tools.snowflake.executor import (
+    execute_snowflake_task,
+    execute_snowflake_task_async,
+    execute_snowflake_transfer_task,
+)
+from noetl.tools.snowflake.session import close_snowflake_sessions
 
-__all__ = ['execute_snowflake_task', 'execute_snowflake_transfer_task']
+__all__ = [
+    'execute_snowflake_task',
+    'execute_snowflake_task_async',
+    'execute_snowflake_transfer_task',
+    'close_snowflake_sessions',
+]
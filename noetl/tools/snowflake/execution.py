@@ -5,7 +5,8 @@ Handles database connections and SQL statement execution for Snowflake.
 Supports both password-based and key-pair authentication.
 """
 
-from typing import Dict, List, Optional
+import os
+from typing import Callable, Dict, List, Optional
 from decimal import Decimal
 from datetime import datetime, date, time
 import snowflake.connector
@@ -18,6 +19,17 @@ from noetl.core.logger import setup_logger
 logger = setup_logger(__name__, include_location=True)
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+# Result sets above this many rows are stored as Arrow IPC instead of inline rows.
+_INLINE_MAX_ROWS = max(0, _env_int("NOETL_SNOWFLAKE_INLINE_MAX_ROWS", 1000))
+
+
 def connect_to_snowflake(
     account: str,
     user: str,
@@ -121,17 +133,27 @@ def connect_to_snowflake(
 
 def execute_sql_statements(
     conn: snowflake.connector.SnowflakeConnection,
-    statements: List[str]
+    statements: List[str],
+    store_arrow: Optional[Callable[[memoryview, str, int, str], Dict]] = None,
 ) -> Dict[str, Dict]:
     """
     Execute multiple SQL statements and collect results.
     
     Each statement is executed independently. If a statement fails,
     the error is captured and execution continues with the next statement.
+
+    Result sets are read through the connector's Arrow batch API.  Results of
+    up to NOETL_SNOWFLAKE_INLINE_MAX_ROWS rows are returned inline as
+    ``result`` rows.  Larger results are written batch by batch into one Arrow
+    IPC stream and handed to ``store_arrow(payload, schema_digest, row_count,
+    statement_key)``, which returns the reference stored as ``rows_ref``; no
+    Python row dicts are built for them.  Without ``store_arrow`` every result
+    is returned inline.
     
     Args:
         conn: Active Snowflake connection
         statements: List of SQL statements to execute
+        store_arrow: Optional callback storing Arrow IPC results (see above)
         
     Returns:
         Dictionary mapping statement index to execution results:
@@ -147,6 +169,14 @@ def execute_sql_statements(
                 'error': 'Error message',
                 'query': 'INSERT...'
             },
+            'statement_2': {
+                'status': 'success',
+                'row_count': 1000000,
+                'rows_ref': {...},
+                'schema_digest': '...',
+                'media_type': 'application/vnd.apache.arrow.stream',
+                'query': 'SELECT...'
+            },
             ...
         }
     """
@@ -154,6 +184,7 @@ def execute_sql_statements(
     
     for idx, statement in enumerate(statements):
         statement_key = f'statement_{idx}'
+        query = statement[:200] + ('...' if len(statement) > 200 else '')
         logger.debug(f"Executing statement {idx + 1}/{len(statements)}")
         
         try:
@@ -162,24 +193,30 @@ def execute_sql_statements(
             
             # Check if statement returns results (SELECT, SHOW, DESCRIBE, etc.)
             if cursor.description:
-                rows = cursor.fetchall()
-                # Normalize values for JSON serialization (Decimal, datetime, etc.)
-                serialized_rows = [_serialize_row(row) for row in rows]
+                columns = [desc[0] for desc in cursor.description]
+                fetched = _fetch_arrow_result(cursor, statement_key, store_arrow)
+                if fetched is None:
+                    # Result set is not Arrow-backed (JSON result format)
+                    rows = cursor.fetchall()
+                    fetched = {
+                        'row_count': len(rows),
+                        # Normalize values for JSON serialization (Decimal, datetime, etc.)
+                        'result': [_serialize_row(row) for row in rows],
+                    }
                 results[statement_key] = {
                     'status': 'success',
-                    'row_count': len(rows),
-                    'result': serialized_rows,
-                    'query': statement[:200] + ('...' if len(statement) > 200 else ''),
-                    'columns': [desc[0] for desc in cursor.description] if cursor.description else []
+                    **fetched,
+                    'query': query,
+                    'columns': columns
                 }
-                logger.info(f"Statement {idx + 1} returned {len(rows)} rows")
+                logger.info(f"Statement {idx + 1} returned {fetched['row_count']} rows")
             else:
                 # DML statements (INSERT, UPDATE, DELETE, etc.)
                 rows_affected = cursor.rowcount
                 results[statement_key] = {
                     'status': 'success',
                     'rows_affected': rows_affected,
-                    'query': statement[:200] + ('...' if len(statement) > 200 else '')
+                    'query': query
                 }
                 logger.info(f"Statement {idx + 1} affected {rows_affected} rows")
             
@@ -191,12 +228,95 @@ def execute_sql_statements(
             results[statement_key] = {
                 'status': 'error',
                 'error': error_msg,
-                'query': statement[:200] + ('...' if len(statement) > 200 else '')
+                'query': query
             }
     
     return results
 
 
+def _fetch_arrow_result(cursor, statement_key: str, store_arrow) -> Optional[Dict]:
+    """
+    Read a result set through ``cursor.fetch_arrow_batches()``.
+
+    Batches are kept while the result may still be returned inline; once it
+    grows past the inline limit they are written to an Arrow IPC stream and
+    every later batch goes straight to the stream.
+
+    Returns:
+        ``{'row_count', 'result'}`` or ``{'row_count', 'rows_ref', ...}``, or
+        None when the result set is not available as Arrow.
+    """
+    try:
+        batches = iter(cursor.fetch_arrow_batches())
+    except Exception as e:
+        logger.debug(f"Arrow fetch unavailable for {statement_key}, using fetchall: {e}")
+        return None
+
+    import pyarrow as pa
+    from noetl.core.storage import ARROW_STREAM_MEDIA_TYPE
+    from noetl.core.storage.arrow_ipc import arrow_schema_digest
+
+    inline = []
+    schema = None
+    sink = None
+    writer = None
+    row_count = 0
+    try:
+        for table in batches:
+            table = _widen_integer_columns(table)
+            if schema is None:
+                schema = table.schema
+            elif not table.schema.equals(schema):
+                table = table.cast(schema)
+            row_count += table.num_rows
+            if writer is not None:
+                writer.write(table)
+                continue
+            inline.append(table)
+            if store_arrow is not None and row_count > _INLINE_MAX_ROWS:
+                sink = pa.BufferOutputStream()
+                writer = pa.ipc.new_stream(sink, schema)
+                for kept in inline:
+                    writer.write(kept)
+                inline = []
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        return {
+            'row_count': row_count,
+            'result': [_serialize_row(row) for table in inline for row in table.to_pylist()],
+        }
+
+    schema_digest = arrow_schema_digest(schema)
+    payload = memoryview(sink.getvalue())
+    logger.info(f"{statement_key}: storing {row_count} rows ({payload.nbytes} bytes) as Arrow IPC")
+    return {
+        'row_count': row_count,
+        'rows_ref': store_arrow(payload, schema_digest, row_count, statement_key),
+        'schema_digest': schema_digest,
+        'media_type': ARROW_STREAM_MEDIA_TYPE,
+    }
+
+
+def _widen_integer_columns(table):
+    """
+    Cast integer columns to int64.
+
+    Snowflake picks the narrowest integer type per result chunk, so batches
+    of one NUMBER column may disagree (int8 in one, int32 in the next).
+    """
+    import pyarrow as pa
+
+    if not any(pa.types.is_integer(field.type) and field.type != pa.int64() for field in table.schema):
+        return table
+    return table.cast(pa.schema([
+        field.with_type(pa.int64()) if pa.types.is_integer(field.type) else field
+        for field in table.schema
+    ]))
+
+
 def _serialize_value(value):
     """Convert Snowflake values to JSON-serializable types."""
     if isinstance(value, Decimal):
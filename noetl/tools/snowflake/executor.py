@@ -11,9 +11,15 @@ Main entry point for executing Snowflake tasks with:
 - Chunked data transfer between Snowflake and PostgreSQL
 """
 
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import os
+import threading
 import uuid
 import datetime
-from typing import Dict
+from typing import Callable, Dict, Optional
 from jinja2 import Environment
 from noetl.core.common import make_serializable
 from noetl.core.logger import setup_logger
@@ -21,18 +27,54 @@ from noetl.core.logger import setup_logger
 from .auth import resolve_snowflake_auth, validate_and_render_connection_params
 from .command import escape_task_with_params, decode_base64_commands, render_and_split_commands
 from .execution import connect_to_snowflake, execute_sql_statements
+from .session import acquire_session, credential_fingerprint, release_session, statements_change_session
 from .response import process_results, format_success_response, format_error_response, format_exception_response
 from .transfer import transfer_snowflake_to_postgres, transfer_postgres_to_snowflake
 
 logger = setup_logger(__name__, include_location=True)
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+# Connector calls block for the whole statement, so async tasks run on their
+# own threads: a long Snowflake query never takes a default-executor thread
+# that the TempStore write (Arrow scrub, storage client) needs to finish it.
+_TASK_THREADS = max(1, _env_int("NOETL_SNOWFLAKE_TASK_THREADS", 8))
+_STORE_TIMEOUT_SECONDS = max(1.0, _env_float("NOETL_SNOWFLAKE_STORE_TIMEOUT_SECONDS", 300.0))
+
+_TASK_EXECUTOR: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_TASK_EXECUTOR_LOCK = threading.Lock()
+
+
+def _task_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _TASK_EXECUTOR
+    with _TASK_EXECUTOR_LOCK:
+        if _TASK_EXECUTOR is None:
+            _TASK_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_TASK_THREADS, thread_name_prefix="noetl-snowflake"
+            )
+        return _TASK_EXECUTOR
+
+
 def execute_snowflake_task(
     task_config: Dict,
     context: Dict,
     jinja_env: Environment,
     task_with: Dict,
-    log_event_callback=None
+    log_event_callback=None,
+    store_arrow: Optional[Callable] = None
 ) -> Dict:
     """
     Execute a Snowflake task.
@@ -41,7 +83,7 @@ def execute_snowflake_task(
     1. Resolve authentication (unified auth or legacy credentials)
     2. Validate and render connection parameters
     3. Decode and parse SQL commands
-    4. Connect to Snowflake database
+    4. Connect to Snowflake database (reusing a pooled session when possible)
     5. Execute SQL statements
     6. Process results and log events
     7. Return formatted response
@@ -66,6 +108,8 @@ def execute_snowflake_task(
             - authenticator: Authentication method (optional, default: snowflake)
         log_event_callback: Optional callback function to log events with signature:
             (event_type, task_id, task_name, task_type, status, duration, context, result, metadata, parent_event_id)
+        store_arrow: Optional callback storing large Arrow IPC results, see
+            execute_sql_statements.  Without it every result is returned inline.
 
     Returns:
         A dictionary containing the task execution result:
@@ -125,28 +169,35 @@ def execute_snowflake_task(
                 {'with_params': task_with}, None
             )
 
-        # Step 7: Connect to Snowflake
-        conn = connect_to_snowflake(
-            account=account,
-            user=user,
-            password=password,
-            private_key=private_key,
-            private_key_passphrase=private_key_passphrase,
-            warehouse=warehouse,
-            database=database,
-            schema=schema,
-            role=role,
-            authenticator=authenticator
-        )
+        # Step 7: Connect to Snowflake (idle sessions are shared per credential fingerprint)
+        connection_params = {
+            'account': account,
+            'user': user,
+            'password': password,
+            'private_key': private_key,
+            'private_key_passphrase': private_key_passphrase,
+            'warehouse': warehouse,
+            'database': database,
+            'schema': schema,
+            'role': role,
+            'authenticator': authenticator,
+        }
+        fingerprint = credential_fingerprint(**connection_params)
+        conn, reused = acquire_session(fingerprint, lambda: connect_to_snowflake(**connection_params))
 
         # Step 8: Execute SQL statements
         results = {}
-        if commands:
-            results = execute_sql_statements(conn, commands)
-
-        # Step 9: Close connection
-        conn.close()
-        logger.info(f"Snowflake connection closed")
+        reusable = False
+        try:
+            if commands:
+                results = execute_sql_statements(conn, commands, store_arrow=store_arrow)
+            reusable = not statements_change_session(commands) and not any(
+                result.get('status') == 'error' for result in results.values()
+            )
+        finally:
+            # Step 9: Return the session to the pool, or close it
+            release_session(fingerprint, conn, reusable=reusable)
+        logger.info(f"Snowflake session {'released' if reusable else 'closed'} (reused={reused})")
 
         # Step 10: Process results
         end_time = datetime.datetime.now()
@@ -186,6 +237,69 @@ def execute_snowflake_task(
         return format_exception_response(task_id, e)
 
 
+async def execute_snowflake_task_async(
+    task_config: Dict,
+    context: Dict,
+    jinja_env: Environment,
+    task_with: Dict,
+    log_event_callback=None
+) -> Dict:
+    """
+    Execute a Snowflake task from the worker event loop.
+
+    The connector is synchronous, so the whole task (credential lookup, login,
+    statement execution and Arrow fetch) runs on the Snowflake task threads
+    (NOETL_SNOWFLAKE_TASK_THREADS).  Result sets above
+    NOETL_SNOWFLAKE_INLINE_MAX_ROWS rows are stored in TempStore as Arrow IPC
+    and returned as ``rows_ref``; the store call is scheduled back onto this
+    loop and fails the statement after NOETL_SNOWFLAKE_STORE_TIMEOUT_SECONDS.
+
+    Args and return value are the same as execute_snowflake_task.
+    """
+    from noetl.core.storage import ARROW_STREAM_MEDIA_TYPE, Scope, default_store
+
+    loop = asyncio.get_running_loop()
+    execution_id = str(context.get('execution_id') or 'unknown') if isinstance(context, dict) else 'unknown'
+    task_name = task_config.get('task', 'snowflake_task')
+
+    def store_arrow(payload, schema_digest: str, row_count: int, statement_key: str) -> Dict:
+        stored = asyncio.run_coroutine_threadsafe(
+            default_store.put_ipc_bytes(
+                execution_id=execution_id,
+                name=f"snowflake-{task_name}-{statement_key}",
+                data_bytes=payload,
+                schema_digest=schema_digest,
+                row_count=row_count,
+                scope=Scope.EXECUTION,
+                source_step=task_name,
+                media_type=ARROW_STREAM_MEDIA_TYPE,
+                scrub_context=context,
+            ),
+            loop,
+        )
+        try:
+            return stored.result(timeout=_STORE_TIMEOUT_SECONDS).model_dump(mode="json")
+        except concurrent.futures.TimeoutError:
+            stored.cancel()
+            raise TimeoutError(
+                f"Storing {statement_key} of {task_name} took longer than {_STORE_TIMEOUT_SECONDS:.0f}s"
+            ) from None
+
+    return await loop.run_in_executor(
+        _task_executor(),
+        functools.partial(
+            contextvars.copy_context().run,
+            execute_snowflake_task,
+            task_config,
+            context,
+            jinja_env,
+            task_with,
+            log_event_callback,
+            store_arrow,
+        ),
+    )
+
+
 def execute_snowflake_transfer_task(
     task_config: Dict,
     context: Dict,
@@ -0,0 +1,137 @@
+"""
+Snowflake session cache.
+
+Opening a Snowflake connection costs an authentication round trip and a
+session setup, so tasks run on a worker share idle connections instead of
+logging in per task.  Connections are keyed by a fingerprint of every
+connection parameter (account, user, secret, warehouse, database, schema,
+role, authenticator) and are only handed back to tasks with the same
+fingerprint.
+
+A connection the task may have left session state on is closed instead of
+being pooled: ``USE``, ``ALTER SESSION``, ``SET``/``UNSET``, an open
+transaction, session-scoped objects (``CREATE TEMPORARY``/``TEMP``/
+``VOLATILE`` tables, stages, functions, ...) and ``CALL`` / ``EXECUTE
+IMMEDIATE``, whose bodies are not inspected.  Detection goes by the leading
+keywords of each statement, so state created some other way (a session
+policy, for instance) can still reach a later task with the same
+credentials; set ``NOETL_SNOWFLAKE_SESSION_MAX_PER_KEY=0`` to log in per
+task in that case.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from noetl.core.logger import setup_logger
+
+logger = setup_logger(__name__, include_location=True)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+_SESSION_MAX_IDLE_SECONDS = max(0.0, _env_float("NOETL_SNOWFLAKE_SESSION_MAX_IDLE_SECONDS", 300.0))
+_SESSION_MAX_PER_KEY = max(0, _env_int("NOETL_SNOWFLAKE_SESSION_MAX_PER_KEY", 4))
+
+_SESSION_STATE_STATEMENT = re.compile(
+    r"^\s*("
+    r"use|alter\s+session|set|unset|begin|start\s+transaction|call|execute\s+immediate"
+    r"|create\s+(or\s+replace\s+)?((local|global)\s+)?(temp|temporary|volatile)"
+    r")\b",
+    re.IGNORECASE,
+)
+
+# fingerprint -> idle connections, most recently released last.
+_IDLE_SESSIONS: Dict[str, List[Tuple[Any, float]]] = {}
+_IDLE_SESSIONS_LOCK = threading.Lock()
+
+
+def credential_fingerprint(**connection_params: Any) -> str:
+    """Stable digest of the connection parameters; secrets never leave it."""
+    encoded = json.dumps(connection_params, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def statements_change_session(statements: Iterable[str]) -> bool:
+    """True if any statement changes session state that must not leak to other tasks."""
+    return any(_SESSION_STATE_STATEMENT.match(statement or "") for statement in statements)
+
+
+def _is_closed(conn: Any) -> bool:
+    try:
+        return bool(conn.is_closed())
+    except Exception:
+        return True
+
+
+def _close_quietly(conn: Any) -> None:
+    try:
+        conn.close()
+    except Exception as exc:
+        logger.debug(f"Ignoring error while closing Snowflake connection: {exc}")
+
+
+def acquire_session(fingerprint: str, connect: Callable[[], Any]) -> Tuple[Any, bool]:
+    """
+    Return an idle connection for ``fingerprint`` or open one with ``connect``.
+
+    Returns:
+        Tuple of (connection, reused)
+    """
+    now = time.monotonic()
+    expired = []
+    conn = None
+    with _IDLE_SESSIONS_LOCK:
+        idle = _IDLE_SESSIONS.get(fingerprint) or []
+        while idle:
+            candidate, released_at = idle.pop()
+            if now - released_at > _SESSION_MAX_IDLE_SECONDS:
+                expired.append(candidate)
+                continue
+            conn = candidate
+            break
+        if not idle:
+            _IDLE_SESSIONS.pop(fingerprint, None)
+    for stale in expired:
+        _close_quietly(stale)
+    if conn is not None and not _is_closed(conn):
+        logger.debug("Reusing pooled Snowflake session")
+        return conn, True
+    return connect(), False
+
+
+def release_session(fingerprint: str, conn: Any, reusable: bool = True) -> None:
+    """Return ``conn`` to the idle pool, or close it when it cannot be shared."""
+    if reusable and _SESSION_MAX_PER_KEY > 0 and not _is_closed(conn):
+        with _IDLE_SESSIONS_LOCK:
+            idle = _IDLE_SESSIONS.setdefault(fingerprint, [])
+            if len(idle) < _SESSION_MAX_PER_KEY:
+                idle.append((conn, time.monotonic()))
+                return
+    _close_quietly(conn)
+
+
+def close_snowflake_sessions() -> int:
+    """Close every idle pooled connection.  Called on worker shutdown."""
+    with _IDLE_SESSIONS_LOCK:
+        pooled = [conn for idle in _IDLE_SESSIONS.values() for conn, _released_at in idle]
+        _IDLE_SESSIONS.clear()
+    for conn in pooled:
+        _close_quietly(conn)
+    return len(pooled)
@@ -45,6 +45,8 @@ logger = setup_logger(__name__, include_location=True)
 # via cursor.options.max_iterations; the default is generous for the
 # PFT-style 10 000-row per-facility workloads.
 _DEFAULT_MAX_ITERATIONS = 100_000
+# Cursor kinds that can read a local source without a credential.
+_AUTH_OPTIONAL_KINDS = frozenset({"duckdb"})
 
 _FRAME_IPC_CACHE: Optional[ArrowIpcSharedMemoryCache] = None
 _FRAME_EVENT_TIMEOUT_SECONDS = max(
@@ -607,7 +609,7 @@ async def execute_cursor_worker(
     auth_key = cursor_spec.get("auth")
     claim_template = cursor_spec.get("claim")
     options = dict(cursor_spec.get("options") or {})
-    if not kind or not auth_key or not claim_template:
+    if not kind or not claim_template or (not auth_key and kind not in _AUTH_OPTIONAL_KINDS):
         raise ValueError(
             "cursor_worker: cursor spec requires kind/auth/claim "
             f"(got kind={kind!r}, auth={auth_key!r}, "
@@ -657,21 +659,28 @@ async def execute_cursor_worker(
     )
 
     # Resolve the credential via the same endpoint tools use today.
-    credential = await fetch_credential_by_key_async(auth_key)
-    if not credential:
-        raise ValueError(
-            f"cursor_worker: credential {auth_key!r} not found or empty"
-        )
+    # Local file-backed drivers (duckdb over Parquet) may run without one.
+    credential: Any = None
+    if auth_key:
+        credential = await fetch_credential_by_key_async(auth_key)
+        if not credential:
+            raise ValueError(
+                f"cursor_worker: credential {auth_key!r} not found or empty"
+            )
 
     try:
         driver = get_driver(kind)
     except CursorDriverNotFoundError:
         raise
 
+    # Slot coordinates let drivers split the source into disjoint keyset
+    # partitions (options.partition) so slots do not share one claim stream.
     driver_spec = {
         "kind": kind,
         "claim": rendered_claim_sql,
         "options": options,
+        "worker_slot_index": int(config.get("worker_slot_index") or 0),
+        "worker_count": int(config.get("worker_count") or 1),
     }
     stage_id = config.get("stage_id")
 
@@ -0,0 +1,206 @@
+"""
+Worker-wide event micro-batching.
+
+Problem: every in-flight command emits its own ``POST /api/events`` (or a
+small per-command ``/api/events/batch``).  A worker running dozens of short
+commands concurrently turns into hundreds of tiny requests per second, each
+paying HTTP, auth, DB transaction and engine-lock overhead on the server.
+
+Solution: commands hand their events to one ``EventCoalescer`` per worker
+process.  Events for the same ``(server_url, execution_id)`` and retry
+policy are appended to a pending bucket that is flushed as a single ``/api/events/batch`` request
+when either:
+
+  - the linger window (a few milliseconds) elapses, or
+  - the bucket reaches ``max_batch_events``.
+
+Ordering: each submission's events stay contiguous and in order inside a
+bucket, buckets are appended in submission order, and flushes for the same
+key are chained so batch N+1 is only sent after batch N finished.  A command
+awaits its submission before emitting its next events, so per-command event
+order on the server matches emission order.
+
+Backpressure: the send callable goes through the worker's
+``AdaptiveConcurrencyController``.  While a flush for a key is waiting on the
+controller (503 backoff, exhausted slots) the next bucket keeps growing up to
+``max_batch_events`` instead of queueing more small requests.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# send_batch(server_url, execution_id, events, timeout_seconds, max_retries) -> bool
+SendBatch = Callable[[str, Any, list[dict], Optional[float], Optional[int]], Awaitable[bool]]
+
+
+_Key = tuple[str, str, Optional[float], Optional[int]]
+
+
+class _PendingBatch:
+    __slots__ = ("events", "waiters", "linger_expired", "timer")
+
+    def __init__(self) -> None:
+        self.events: list[dict] = []
+        self.waiters: list[asyncio.Future] = []
+        self.linger_expired = False
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class EventCoalescer:
+    """
+    Coalesces events from all in-flight commands of one worker process into
+    ``/api/events/batch`` requests.
+
+    Usage:
+        coalescer = EventCoalescer(send_batch, linger_seconds=0.005, max_batch_events=64)
+        ok = await coalescer.submit(server_url, execution_id, events)
+        ...
+        await coalescer.close()  # flush everything still pending
+    """
+
+    def __init__(
+        self,
+        send_batch: SendBatch,
+        *,
+        linger_seconds: float = 0.005,
+        max_batch_events: int = 64,
+    ) -> None:
+        self._send_batch = send_batch
+        self._linger_seconds = max(0.0, float(linger_seconds))
+        self._max_batch_events = max(1, int(max_batch_events))
+        self._pending: dict[_Key, _PendingBatch] = {}
+        # Last scheduled flush per key; new flushes chain behind it.
+        self._inflight: dict[_Key, asyncio.Task] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._batches_sent = 0
+        self._events_sent = 0
+
+    @property
+    def max_batch_events(self) -> int:
+        return self._max_batch_events
+
+    def get_status(self) -> dict:
+        return {
+            "pending_keys": len(self._pending),
+            "pending_events": sum(len(b.events) for b in self._pending.values()),
+            "inflight_flushes": len(self._tasks),
+            "batches_sent": self._batches_sent,
+            "events_sent": self._events_sent,
+        }
+
+    async def submit(
+        self,
+        server_url: str,
+        execution_id: Any,
+        events: list[dict],
+        *,
+        timeout_seconds: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ) -> bool:
+        """
+        Queue ``events`` for the execution and wait until the batch carrying
+        them was accepted.
+
+        Submissions are only coalesced with others that share the same retry
+        policy, so a short-timeout informational emit never rides on (or
+        stretches) a terminal batch.  Send failures propagate to every
+        submitter of the failed batch.
+        """
+        if not events:
+            return True
+        key = (server_url, str(execution_id), timeout_seconds, max_retries)
+        loop = asyncio.get_running_loop()
+
+        batch = self._pending.get(key)
+        if batch is not None and len(batch.events) + len(events) > self._max_batch_events:
+            self._seal(key)
+            batch = None
+        if batch is None:
+            batch = _PendingBatch()
+            self._pending[key] = batch
+            batch.timer = loop.call_later(self._linger_seconds, self._on_linger, key, batch)
+
+        future: asyncio.Future = loop.create_future()
+        batch.events.extend(events)
+        batch.waiters.append(future)
+        if len(batch.events) >= self._max_batch_events:
+            self._seal(key)
+        return await future
+
+    async def close(self) -> None:
+        """Flush every pending bucket and wait for in-flight batches."""
+        for key in list(self._pending):
+            self._seal(key)
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def _on_linger(self, key: _Key, batch: _PendingBatch) -> None:
+        if self._pending.get(key) is not batch:
+            return
+        batch.linger_expired = True
+        if key in self._inflight:
+            # Previous batch for this execution is still being sent (often
+            # waiting on the concurrency gate); let this bucket keep growing
+            # and flush it when that batch completes.
+            return
+        self._seal(key)
+
+    def _seal(self, key: _Key) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        previous = self._inflight.get(key)
+        task = asyncio.get_running_loop().create_task(self._flush(key, batch, previous))
+        self._inflight[key] = task
+        self._tasks.add(task)
+        task.add_done_callback(lambda t, k=key: self._on_flush_done(k, t))
+
+    def _on_flush_done(self, key: _Key, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if self._inflight.get(key) is not task:
+            return
+        del self._inflight[key]
+        pending = self._pending.get(key)
+        if pending is not None and pending.linger_expired:
+            self._seal(key)
+
+    async def _flush(
+        self,
+        key: _Key,
+        batch: _PendingBatch,
+        previous: Optional[asyncio.Task],
+    ) -> None:
+        if previous is not None and not previous.done():
+            await asyncio.wait({previous})
+        server_url, execution_id, timeout_seconds, max_retries = key
+        try:
+            ok = await self._send_batch(
+                server_url,
+                execution_id,
+                batch.events,
+                timeout_seconds,
+                max_retries,
+            )
+        except asyncio.CancelledError:
+            for waiter in batch.waiters:
+                waiter.cancel()
+            raise
+        except Exception as exc:
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.set_exception(exc)
+            logger.debug(
+                "[COALESCE] batch of %s events for execution %s failed: %s",
+                len(batch.events), execution_id, exc,
+            )
+            return
+        self._batches_sent += 1
+        self._events_sent += len(batch.events)
+        for waiter in batch.waiters:
+            if not waiter.done():
+                waiter.set_result(bool(ok))
@@ -18,6 +18,7 @@ import logging
 import httpx
 import os
 import random
+import sys
 import time
 import uuid
 from collections import OrderedDict
@@ -27,6 +28,7 @@ from datetime import datetime, timezone
 
 from noetl.core.messaging import NATSCommandSubscriber
 from noetl.worker.adaptive_concurrency import AdaptiveConcurrencyController
+from noetl.worker.event_coalescer import EventCoalescer
 from noetl.core.logging_context import LoggingContext
 from noetl.core.logger import setup_logger
 from noetl.core.sanitize import redact_url_credentials
@@ -34,8 +36,10 @@ from noetl.core.credential_refs import (
     resolve_credential_references,
     strip_keychain_namespaces,
 )
+from noetl.core.wire_compression import RequestCompressor, post_json
 from noetl.core.urls import (
     build_api_url as _api_url,
+    execution_routing_headers as _execution_routing_headers,
     normalize_server_base_url as _normalize_server_base_url,
 )
 logger = setup_logger(__name__, include_location=True)
@@ -46,6 +50,9 @@ _HOT_PATH_INITIAL_EVENT_TIMEOUT_SECONDS = float(
 _HOT_PATH_INITIAL_EVENT_MAX_RETRIES = max(
     1, int(os.getenv("NOETL_HOT_PATH_INITIAL_EVENT_MAX_RETRIES", "1"))
 )
+_SUB_PLAYBOOK_STATUS_WAIT_SECONDS = max(
+    0.0, float(os.getenv("NOETL_SUB_PLAYBOOK_STATUS_WAIT_SECONDS", "30"))
+)
 
 
 def _optional_int_env(name: str) -> Optional[int]:
@@ -68,28 +75,78 @@ def _is_hot_path_initial_event_step(tool_kind: Optional[str]) -> bool:
     return str(tool_kind or "").strip().lower() == "task_sequence"
 
 
-# Pre-import tool executors at module level to avoid 5s cold-start delay
-# These were previously imported inside _execute_tool() causing slow first execution
-from noetl.tools import http, postgres, duckdb, python
-# noetl.tools.http import lazified below, same reason as postgres/duckdb.
-# Lazy imports for noetl.tools.postgres + noetl.tools.duckdb live inside the
-# dispatch branches below.  Both submodules import from noetl.worker.*
-# (auth_compatibility, keychain_resolver) at module load, so importing
-# them at the top of noetl.worker.nats_worker creates a circular dependency
-# that breaks pytest collection across iterator/, plugin/, render/,
-# api/, core/, and test_*.py — see noetl/noetl#663 Cluster C.
-# Cached in sys.modules after first call; subsequent dispatches are O(1).
-from noetl.tools.snowflake import execute_snowflake_task
-from noetl.tools.gcs import execute_gcs_task
-from noetl.tools.transfer import execute_transfer_action
-from noetl.tools.transfer.snowflake_transfer import execute_snowflake_transfer_action
-from noetl.tools.script import execute_script_task
-from noetl.tools.agent import execute_agent_task
-from noetl.tools.mcp import execute_mcp_task
-from noetl.core.secrets import execute_secrets_task
-from noetl.core.workflow.workbook import execute_workbook_task
-from noetl.core.workflow.playbook import execute_playbook_task
-from noetl.tools.python import execute_python_task_async
+# Tool executors resolve on first dispatch through the lazy ``_EXECUTORS``
+# map in noetl.tools.  Importing them here pulled snowflake-connector,
+# google-cloud-storage, duckdb and boto3 into every worker before its first
+# claim, and tool modules import noetl.worker.* helpers, so eager imports
+# also created circular initialization paths (noetl/noetl#663 Cluster C).
+# NOETL_WORKER_WARM_TOOLS imports a chosen set in the background at start.
+import noetl.tools as _tools
+
+_TOOL_KIND_EXECUTORS: dict[str, tuple[str, ...]] = {
+    "python": ("execute_python_task_async",),
+    "http": ("execute_http_task",),
+    "postgres": ("execute_postgres_task_async",),
+    "duckdb": ("execute_duckdb_task",),
+    "ducklake": ("execute_ducklake_task",),
+    "snowflake": ("execute_snowflake_task_async",),
+    "transfer": ("execute_transfer_action",),
+    "snowflake_transfer": ("execute_snowflake_transfer_action",),
+    "script": ("execute_script_task",),
+    "secrets": ("execute_secrets_task",),
+    "workbook": ("execute_workbook_task",),
+    "playbook": ("execute_playbook_task",),
+    "gcs": ("execute_gcs_task",),
+    "nats": ("execute_nats_task",),
+    "agent": ("execute_agent_task",),
+    "mcp": ("execute_mcp_task",),
+    "artifact": ("execute_artifact_get", "execute_artifact_put"),
+}
+
+
+def _tool_executor(name: str) -> Any:
+    """Return a tool executor, importing its module on first use.
+
+    Resolved executors are cached as module globals, so later dispatches are
+    a dict lookup and tests can monkeypatch them by name.
+    """
+    executor = globals().get(name)
+    if executor is None:
+        executor = getattr(_tools, name)
+        globals()[name] = executor
+    return executor
+
+
+def __getattr__(name: str) -> Any:
+    if name in _tools._EXECUTORS:
+        return _tool_executor(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def warm_tool_executors(kinds: list[str]) -> list[str]:
+    """Import the executors for ``kinds`` (``"all"`` = every tool kind).
+
+    Returns the tool kinds that were warmed; unknown kinds and tools whose
+    optional dependencies are missing are logged and skipped.
+    """
+    if "all" in kinds:
+        kinds = list(_TOOL_KIND_EXECUTORS)
+    warmed = []
+    for kind in kinds:
+        names = _TOOL_KIND_EXECUTORS.get(kind)
+        if names is None:
+            logger.warning("Unknown tool kind in NOETL_WORKER_WARM_TOOLS: %s", kind)
+            continue
+        try:
+            for name in names:
+                _tool_executor(name)
+        except ImportError as exc:
+            logger.warning("Could not warm %s tool executor: %s", kind, exc)
+            continue
+        warmed.append(kind)
+    return warmed
+
+
 from jinja2 import Environment, BaseLoader
 from noetl.core.storage import Scope, default_store, estimate_size
 from noetl.worker.keychain_resolver import populate_keychain_context
@@ -135,8 +192,12 @@ class _WorkerTemplateCache:
         # Log stats periodically
         if self._misses % 100 == 0:
             logger.debug(
-                f"[TEMPLATE-CACHE] Worker stats: size={len(self._cache)}/{self._max_size}, "
-                f"hits={self._hits}, misses={self._misses}, hit_rate={self._hits / (self._hits + self._misses) * 100:.1f}%"
+                "[TEMPLATE-CACHE] Worker stats: size=%s/%s, hits=%s, misses=%s, hit_rate=%.1f%%",
+                len(self._cache),
+                self._max_size,
+                self._hits,
+                self._misses,
+                self._hits / (self._hits + self._misses) * 100
             )
 
         return compiled
@@ -192,6 +253,8 @@ class Worker:
         self.server_url = server_url  # Fallback, usually comes from notification
         self._running = False
         self._http_client: Optional[httpx.AsyncClient] = None
+        # Request-body compression negotiated per server from its responses.
+        self._wire_compressor = RequestCompressor()
         # Multi-subscriber list per noetl/ai-meta#42 PR-2b: the Python
         # worker subscribes to one NATSCommandSubscriber per pool
         # segment listed in ``NOETL_WORKER_POOL_SEGMENTS``.  Default
@@ -203,6 +266,7 @@ class Worker:
         # commands).  Points at the first subscriber in the list.
         self._nats_subscriber: Optional[NATSCommandSubscriber] = None
         self._heartbeat_task: Optional[asyncio.Task] = None
+        self._warm_tools_task: Optional[asyncio.Task] = None
         self._registered = False
         self._max_inflight_commands = max(1, int(worker_settings.max_inflight_commands))
         self._max_inflight_db_commands = max(1, int(os.getenv("NOETL_WORKER_DB_SEMAPHORE", "32")))
@@ -220,6 +284,9 @@ class Worker:
         )
         self._recent_command_activity: dict[str, float] = {}
         self._recent_command_activity_last_prune_monotonic = 0.0
+        # Command ids with a claim request outstanding; the affinity and
+        # JetStream copies of one notification must not both claim.
+        self._claims_in_flight: set[str] = set()
         self._command_heartbeat_interval_seconds = max(
             2.0,
             float(os.getenv("NOETL_COMMAND_HEARTBEAT_INTERVAL_SECONDS", "15")),
@@ -241,6 +308,18 @@ class Worker:
             max_limit=float(self._max_inflight_commands),
             probe_interval=worker_settings.concurrency_probe_interval,
         )
+        # Worker-wide event micro-batching: events from all in-flight
+        # commands of one execution are coalesced into /api/events/batch
+        # requests.  Disabled with NOETL_WORKER_EVENT_LINGER_MS=0.
+        self._event_coalescer: Optional[EventCoalescer] = None
+        # NOETL_WORKER_EVENT_BATCH_MAX_EVENTS must stay within the server's
+        # NOETL_BATCH_MAX_EVENTS_PER_REQUEST (default 256).
+        if float(worker_settings.event_linger_ms) > 0:
+            self._event_coalescer = EventCoalescer(
+                self._send_coalesced_events,
+                linger_seconds=float(worker_settings.event_linger_ms) / 1000.0,
+                max_batch_events=int(worker_settings.event_batch_max_events),
+            )
         self._jinja_env = Environment(loader=BaseLoader())
         self._jinja_env = add_b64encode_filter(self._jinja_env)
 
@@ -260,6 +339,8 @@ class Worker:
 
         Returns True when any pool shows active queueing beyond threshold.
         """
+        if "noetl.tools.postgres.pool" not in sys.modules:
+            return False  # no postgres step has run, so there are no pools
         try:
             from noetl.tools.postgres.pool import get_plugin_pool_stats
 
@@ -916,13 +997,17 @@ class Worker:
             response = await self._http_client.post(register_url, json=payload, timeout=10.0)
             if response.status_code == 200:
                 self._registered = True
-                logger.debug(f"Worker {self.worker_id} registered in runtime table")
+                logger.debug("Worker %s registered in runtime table", self.worker_id)
                 return True
             else:
-                logger.warning(f"Worker registration failed: {response.status_code} - {response.text}")
+                logger.warning(
+                    "Worker registration failed: %s - %s",
+                    response.status_code,
+                    response.text,
+                )
                 return False
         except Exception as e:
-            logger.warning(f"Worker registration error: {e}")
+            logger.warning("Worker registration error: %s", e)
             return False
     
     async def _deregister_worker(self, server_url: str) -> bool:
@@ -938,18 +1023,18 @@ class Worker:
             response = await self._http_client.post(deregister_url, json=payload, timeout=10.0)
             if response.status_code == 200:
                 self._registered = False
-                logger.debug(f"Worker {self.worker_id} deregistered from runtime table")
+                logger.debug("Worker %s deregistered from runtime table", self.worker_id)
                 return True
             else:
-                logger.warning(f"Worker deregistration failed: {response.status_code}")
+                logger.warning("Worker deregistration failed: %s", response.status_code)
                 return False
         except Exception as e:
-            logger.warning(f"Worker deregistration error: {e}")
+            logger.warning("Worker deregistration error: %s", e)
             return False
     
     async def _heartbeat_loop(self, server_url: str):
         """Background task to send heartbeat updates to runtime table."""
-        logger.info(f"Worker {self.worker_id} heartbeat loop started (interval: 15s)")
+        logger.info("Worker %s heartbeat loop started (interval: 15s)", self.worker_id)
         _cycles = 0
         while self._running:
             try:
@@ -973,10 +1058,10 @@ class Worker:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.warning(f"Heartbeat error: {e}")
+                logger.warning("Heartbeat error: %s", e)
                 await asyncio.sleep(5)  # Back off on error
 
-        logger.info(f"Worker {self.worker_id} heartbeat loop stopped")
+        logger.info("Worker %s heartbeat loop stopped", self.worker_id)
     
     async def start(self):
         """Start the worker NATS subscription.
@@ -1000,7 +1085,10 @@ class Worker:
         from noetl.core.config import get_worker_settings
         worker_settings = get_worker_settings()
         self._running = True
-        self._http_client = httpx.AsyncClient(timeout=worker_settings.http_client_timeout)
+        self._http_client = httpx.AsyncClient(
+            timeout=worker_settings.http_client_timeout,
+            event_hooks={"response": [self._wire_compressor.observe_response]},
+        )
 
         segments_env = os.getenv("NOETL_WORKER_POOL_SEGMENTS", "legacy,shared,python")
         segments = [s.strip() for s in segments_env.split(",") if s.strip()]
@@ -1052,6 +1140,22 @@ class Worker:
                 subscriber.filter_subject or "(none)",
             )
 
+        # Import the configured tool executors off the event loop so the
+        # first claim does not wait for them; other tools import on first use.
+        if worker_settings.warm_tools:
+            self._warm_tools_task = asyncio.create_task(self._warm_tools(worker_settings.warm_tools))
+
+        # Large results this worker writes carry its locality; the server
+        # nudges the commands consuming them back here on the affinity
+        # subject (see noetl.core.runtime.pool_routing.affinity_subject).
+        from noetl.core.runtime.topology import set_local_worker_id
+
+        set_local_worker_id(self.worker_id)
+        try:
+            await self._nats_subscribers[0].subscribe_affinity(self.worker_id, self._handle_affinity_notification)
+        except Exception as exc:
+            logger.warning("Affinity subscription unavailable for worker %s: %s", self.worker_id, exc)
+
         # Register worker in runtime table
         server_url = _normalize_server_base_url(self.server_url or worker_settings.server_url)
         if server_url:
@@ -1087,10 +1191,23 @@ class Worker:
                     exc_info=result,
                 )
     
+    async def _warm_tools(self, kinds: list[str]) -> None:
+        started = time.perf_counter()
+        warmed = await asyncio.to_thread(warm_tool_executors, kinds)
+        logger.info(
+            "Warmed tool executors %s in %.2fs",
+            warmed,
+            time.perf_counter() - started,
+        )
+
     async def cleanup(self):
         """Cleanup resources."""
         self._running = False
 
+        # Flush coalesced events while the HTTP client is still open
+        if self._event_coalescer is not None:
+            await self._event_coalescer.close()
+
         # Stop adaptive concurrency controller probe
         await self._concurrency.stop()
 
@@ -1133,7 +1250,7 @@ class Worker:
             await close_all_plugin_pools()
             logger.info("Closed all Postgres connection pools")
         except Exception as e:
-            logger.warning(f"Error closing connection pools: {e}")
+            logger.warning("Error closing connection pools: %s", e)
 
         # Close shared async HTTP clients
         try:
@@ -1141,9 +1258,27 @@ class Worker:
             await close_shared_async_http_clients()
             logger.info("Closed shared async HTTP clients")
         except Exception as e:
-            logger.warning(f"Error closing shared HTTP clients: {e}")
+            logger.warning("Error closing shared HTTP clients: %s", e)
+
+        # Terminate pooled MCP sessions, if any MCP step ran on this worker
+        if "noetl.tools.mcp.executor" in sys.modules:
+            try:
+                from noetl.tools.mcp import close_mcp_sessions
+                await close_mcp_sessions()
+                logger.info("Closed pooled MCP sessions")
+            except Exception as e:
+                logger.warning("Error closing MCP sessions: %s", e)
+
+        # Close idle pooled Snowflake sessions, if any Snowflake step ran on this worker
+        if "noetl.tools.snowflake.session" in sys.modules:
+            try:
+                from noetl.tools.snowflake import close_snowflake_sessions
+                closed = await asyncio.to_thread(close_snowflake_sessions)
+                logger.info("Closed %s pooled Snowflake sessions", closed)
+            except Exception as e:
+                logger.warning("Error closing Snowflake sessions: %s", e)
         
-        logger.info(f"Worker {self.worker_id} stopped")
+        logger.info("Worker %s stopped", self.worker_id)
     
     def stop(self):
         """Stop the worker."""
@@ -1174,11 +1309,11 @@ class Worker:
                     continue
                 
                 # Log summary
-                logger.info(f"Connection pool health check: {len(stats)} active pools")
+                logger.info("Connection pool health check: %s active pools", len(stats))
                 
                 for pool_key, pool_stats in stats.items():
                     if "error" in pool_stats:
-                        logger.warning(f"Pool {pool_key}: {pool_stats['error']}")
+                        logger.warning("Pool %s: %s", pool_key, pool_stats['error'])
                         continue
                     
                     # Check for warning conditions
@@ -1188,29 +1323,33 @@ class Worker:
                     
                     if waiting > 5:
                         logger.warning(
-                            f"Pool {pool_stats['name']}: {waiting} requests waiting, "
-                            f"{available} connections available"
+                            "Pool %s: %s requests waiting, %s connections available",
+                            pool_stats['name'],
+                            waiting,
+                            available
                         )
                     
                     if age > 3600:  # 1 hour
                         logger.info(
-                            f"Pool {pool_stats['name']}: Active for {age}s, "
-                            f"will be refreshed on next use"
+                            "Pool %s: Active for %ss, will be refreshed on next use",
+                            pool_stats['name'],
+                            age
                         )
                     
                     # Log healthy pool stats at debug level
                     logger.debug(
-                        f"Pool {pool_stats['name']}: "
-                        f"size={pool_stats.get('size')}, "
-                        f"available={available}, "
-                        f"waiting={waiting}, "
-                        f"age={age}s"
+                        "Pool %s: size=%s, available=%s, waiting=%s, age=%ss",
+                        pool_stats['name'],
+                        pool_stats.get('size'),
+                        available,
+                        waiting,
+                        age
                     )
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in pool health monitor: {e}", exc_info=True)
+                logger.error("Error in pool health monitor: %s", e, exc_info=True)
                 await asyncio.sleep(60)  # Back off on error
         
         logger.info("Stopped connection pool health monitor")
@@ -1232,12 +1371,19 @@ class Worker:
             if response.status_code == 200:
                 data = response.json()
                 if data.get("cancelled", False):
-                    logger.info(f"[CANCEL] Execution {execution_id} has been cancelled - skipping command")
+                    logger.info(
+                        "[CANCEL] Execution %s has been cancelled - skipping command",
+                        execution_id,
+                    )
                     return True
             return False
         except Exception as e:
             # If we can't check, continue with execution (fail-open)
-            logger.warning(f"[CANCEL] Could not check cancellation status for {execution_id}: {e}")
+            logger.warning(
+                "[CANCEL] Could not check cancellation status for %s: %s",
+                execution_id,
+                e,
+            )
             return False
     
     async def _handle_command_notification(self, notification: dict) -> str:
@@ -1262,7 +1408,13 @@ class Worker:
                 step = notification["step"]
                 server_url = _normalize_server_base_url(notification["server_url"])
 
-                logger.info(f"[EVENT] Worker {self.worker_id} received notification: exec={execution_id}, command={command_id}, step={step}")
+                logger.info(
+                    "[EVENT] Worker %s received notification: exec=%s, command=%s, step=%s",
+                    self.worker_id,
+                    execution_id,
+                    command_id,
+                    step,
+                )
 
                 if self._is_recent_command_activity(command_id):
                     logger.info(
@@ -1273,10 +1425,23 @@ class Worker:
                     return "ack"
 
                 # Single atomic call: claim + cancel check + fetch command details
+                if str(command_id) in self._claims_in_flight:
+                    # The other copy of this notification is claiming right now.
+                    return "nak:1.000"
+
                 t_claim_start = time.perf_counter()
-                command, claim_decision, retry_after_seconds = await self._claim_and_fetch_command(server_url, event_id)
+                self._claims_in_flight.add(str(command_id))
+                try:
+                    command, claim_decision, retry_after_seconds = await self._claim_and_fetch_command(
+                        server_url, event_id, execution_id
+                    )
+                finally:
+                    self._claims_in_flight.discard(str(command_id))
                 t_claim_end = time.perf_counter()
-                logger.info(f"[PERF] claim_and_fetch took {(t_claim_end - t_claim_start)*1000:.1f}ms")
+                logger.info(
+                    "[PERF] claim_and_fetch took %.1fms",
+                    (t_claim_end - t_claim_start)*1000,
+                )
 
                 if claim_decision == "retry_later":
                     retry_after_seconds = max(0.0, float(retry_after_seconds))
@@ -1301,7 +1466,7 @@ class Worker:
                     return "ack"
 
                 self._remember_recent_command_activity(command_id)
-                logger.info(f"[EVENT] Worker {self.worker_id} claimed command {command_id}")
+                logger.info("[EVENT] Worker %s claimed command %s", self.worker_id, command_id)
 
                 command_tool = command.get("action")
                 if self._is_db_heavy_tool(command_tool):
@@ -1313,11 +1478,19 @@ class Worker:
                 t_command_start = time.perf_counter()
                 await self._execute_command(command, server_url, command_id)
                 t_command_end = time.perf_counter()
-                logger.info(f"[PERF] _execute_command for {step} took {(t_command_end - t_command_start)*1000:.1f}ms")
+                logger.info(
+                    "[PERF] _execute_command for %s took %.1fms",
+                    step,
+                    (t_command_end - t_command_start)*1000,
+                )
 
                 # Total time
                 t_total_end = time.perf_counter()
-                logger.info(f"[PERF] TOTAL command handling for {step} took {(t_total_end - t_total_start)*1000:.1f}ms")
+                logger.info(
+                    "[PERF] TOTAL command handling for %s took %.1fms",
+                    step,
+                    (t_total_end - t_total_start)*1000,
+                )
                 return "ack"
 
             except ClaimTerminalError as e:
@@ -1340,14 +1513,27 @@ class Worker:
                 )
                 return "ack"
             except Exception as e:
-                logger.exception(f"Error handling command notification: {e}")
+                logger.exception("Error handling command notification: %s", e)
                 return "nak"
             finally:
                 if db_slot_acquired:
                     self._db_command_semaphore.release()
     
+    async def _handle_affinity_notification(self, notification: dict) -> None:
+        """Claim a command sent directly to this worker because it holds the inputs.
+
+        Best effort: the JetStream copy remains the durable delivery, so the
+        outcome here is only logged.
+        """
+        action = await self._handle_command_notification(notification)
+        logger.debug(
+            "[AFFINITY] Notification for command %s handled (action=%s)",
+            notification.get("command_id"),
+            action,
+        )
+
     async def _claim_and_fetch_command(
-        self, server_url: str, event_id: int
+        self, server_url: str, event_id: int, execution_id: Optional[int] = None
     ) -> tuple[Optional[dict], Literal["claimed", "skip_ack", "retry_later"], float]:
         """
         Atomically claim a command and fetch its details in a single call.
@@ -1359,6 +1545,9 @@ class Worker:
         4. Inserts command.claimed event
         5. Returns command details
 
+        ``execution_id`` rides along as ``X-NoETL-Execution-Id`` so a sharded
+        server serves the claim in the process that owns the execution.
+
         Returns:
             - (command, "claimed", 0.0) on successful claim
             - (None, "skip_ack", 0.0) for ACKed no-op outcomes
@@ -1411,9 +1600,12 @@ class Worker:
                 except Exception:
                     logger.debug("[CLAIM] Failed to attach worker locality to claim", exc_info=True)
 
-                response = await self._http_client.post(
+                response = await post_json(
+                    self._http_client,
                     _api_url(server_url, f"commands/{event_id}/claim"),
-                    json=claim_payload,
+                    claim_payload,
+                    request_compressor=self._wire_compressor,
+                    headers=_execution_routing_headers(execution_id),
                 )
 
                 if response.status_code == 200:
@@ -1423,7 +1615,7 @@ class Worker:
                     resolved_context = await self._resolve_command_context_if_needed(
                         data.get("context")
                     )
-                    logger.info(f"[CLAIM] Successfully claimed command for event_id={event_id}")
+                    logger.info("[CLAIM] Successfully claimed command for event_id=%s", event_id)
                     return ({
                         "execution_id": data["execution_id"],
                         "node_id": data["node_id"],
@@ -1448,6 +1640,16 @@ class Worker:
                         # claim remains authoritative, and the command reaper handles
                         # recovery if that worker later dies.
                         return None, "skip_ack", 0.0
+                    if code == "locality_preferred":
+                        # The worker holding this command's large inputs gets
+                        # the first chance; come back when its window closes.
+                        retry_after = _parse_retry_after_seconds(response.headers.get("Retry-After"), default=1.0)
+                        logger.info(
+                            "[CLAIM] Command for event_id=%s is preferred on its input producer; retrying in %.2fs",
+                            event_id,
+                            retry_after,
+                        )
+                        return None, "retry_later", retry_after
                     if code in {"already_terminal", "execution_cancelled"}:
                         logger.info(
                             "[CLAIM] Command for event_id=%s is terminal/cancelled (code=%s), skipping",
@@ -1591,18 +1793,25 @@ class Worker:
             )
 
             if response.status_code == 200:
-                logger.info(f"[EVENT] Successfully claimed command {command_id}")
+                logger.info("[EVENT] Successfully claimed command %s", command_id)
                 return True
             elif response.status_code == 409:
                 # Command already claimed by another worker - this is expected in multi-worker setup
-                logger.info(f"[EVENT] Command {command_id} already claimed by another worker, skipping")
+                logger.info(
+                    "[EVENT] Command %s already claimed by another worker, skipping",
+                    command_id,
+                )
                 return False
             else:
-                logger.warning(f"[EVENT] Failed to claim command {command_id}: {response.status_code}")
+                logger.warning(
+                    "[EVENT] Failed to claim command %s: %s",
+                    command_id,
+                    response.status_code,
+                )
                 return False
 
         except Exception as e:
-            logger.error(f"[EVENT] Error claiming command {command_id}: {e}")
+            logger.error("[EVENT] Error claiming command %s: %s", command_id, e)
             return False
     
     async def _fetch_command_details(self, server_url: str, event_id: int) -> Optional[dict]:
@@ -1618,19 +1827,27 @@ class Worker:
             )
             
             if response.status_code == 404:
-                logger.error(f"[EVENT] No command.issued event found for event_id={event_id}")
+                logger.error("[EVENT] No command.issued event found for event_id=%s", event_id)
                 return None
             
             if response.status_code != 200:
-                logger.error(f"[EVENT] Failed to fetch command details: {response.status_code} - {response.text}")
+                logger.error(
+                    "[EVENT] Failed to fetch command details: %s - %s",
+                    response.status_code,
+                    response.text,
+                )
                 return None
             
             command = response.json()
-            logger.info(f"[EVENT] Fetched command details: step={command.get('node_name')}, tool={command.get('action')}")
+            logger.info(
+                "[EVENT] Fetched command details: step=%s, tool=%s",
+                command.get('node_name'),
+                command.get('action'),
+            )
             return command
             
         except Exception as e:
-            logger.error(f"[EVENT] Error fetching command details: {e}", exc_info=True)
+            logger.error("[EVENT] Error fetching command details: %s", e, exc_info=True)
             return None
     
     async def _emit_command_failed(self, server_url: str, execution_id: int, command_id: str, step: str, error_msg: str):
@@ -1654,7 +1871,7 @@ class Worker:
                 }
             )
         except Exception as e:
-            logger.error(f"[EVENT] Failed to emit command.failed: {e}")
+            logger.error("[EVENT] Failed to emit command.failed: %s", e)
     
     async def _fetch_execution_variables(
         self,
@@ -1683,10 +1900,10 @@ class Worker:
                     variables = data.get('variables', {})
                     return {name: meta.get('value') for name, meta in variables.items()}
                 else:
-                    logger.warning(f"[VARS] Failed to fetch variables: {response.status_code}")
+                    logger.warning("[VARS] Failed to fetch variables: %s", response.status_code)
                     return {}
         except Exception as e:
-            logger.error(f"[VARS] Error fetching variables: {e}")
+            logger.error("[VARS] Error fetching variables: %s", e)
             return {}
     
     async def _evaluate_case_blocks_with_event(
@@ -1735,7 +1952,12 @@ class Worker:
         if not case_blocks or not isinstance(case_blocks, list):
             return None
         
-        logger.info(f"[CASE-EVAL] Evaluating {len(case_blocks)} case blocks | event={event_name} | has_error={error is not None}")
+        logger.info(
+            "[CASE-EVAL] Evaluating %s case blocks | event=%s | has_error=%s",
+            len(case_blocks),
+            event_name,
+            error is not None,
+        )
 
         # Canonical DSL context: output + event + error.
         eval_context = build_eval_context(
@@ -1776,14 +1998,23 @@ class Worker:
                     result_lower = result_stripped.lower()
                     matches = bool(result_stripped) and result_lower not in ['false', '0', 'no', 'none', '']
                     
-                    logger.info(f"[CASE-EVAL] Case {idx} condition: {when_condition[:100]}... = {matches}")
+                    logger.info(
+                        "[CASE-EVAL] Case %s condition: %s... = %s",
+                        idx,
+                        when_condition[:100],
+                        matches,
+                    )
                     
                     if not matches:
                         # Condition not met - break retry loop and try next case
                         break
                     
                     # Case matched - extract action
-                    logger.info(f"[CASE-EVAL] Case {idx} matched (event={event_name})! Extracting action")
+                    logger.info(
+                        "[CASE-EVAL] Case %s matched (event=%s)! Extracting action",
+                        idx,
+                        event_name,
+                    )
                     
                     # Normalize then_block to list of action dicts
                     # then_block can be: dict, list of dicts, or list with 'next' key
@@ -1856,7 +2087,11 @@ class Worker:
 
                     # Handle retry locally in the worker (don't send to server)
                     if has_retry:
-                        logger.info(f"[CASE-EVAL] Case {idx} triggered retry - returning retry action for local handling")
+                        logger.info(
+                            "[CASE-EVAL] Case %s triggered retry - returning retry action for "
+                            "local handling",
+                            idx,
+                        )
                         return {
                             'type': 'retry',
                             'config': retry_config,
@@ -1874,7 +2109,7 @@ class Worker:
                             }
                     
                     if set_config:
-                        logger.info(f"[CASE-EVAL] Case {idx} has set action - updating variables")
+                        logger.info("[CASE-EVAL] Case %s has set action - updating variables", idx)
                         return {
                             'type': 'set',
                             'config': set_config,
@@ -1890,7 +2125,10 @@ class Worker:
                     error_msg = str(e)
                     if ('undefined' in error_msg.lower() or 'not defined' in error_msg.lower()) and attempt == 0 and not variables_fetched:
                         # First attempt failed due to missing variable - fetch from server
-                        logger.warning(f"[CASE-EVAL] Missing variable in condition, fetching from server: {error_msg}")
+                        logger.warning(
+                            "[CASE-EVAL] Missing variable in condition, fetching from server: %s",
+                            error_msg,
+                        )
                         
                         # Fetch variables from server API
                         server_vars = await self._fetch_execution_variables(server_url, execution_id)
@@ -1907,15 +2145,23 @@ class Worker:
                             # Continue to retry with enriched context
                             continue
                         else:
-                            logger.error(f"[CASE-EVAL] Failed to fetch variables from server")
+                            logger.error("[CASE-EVAL] Failed to fetch variables from server")
                             break
                     else:
                         # Other error or retry exhausted
-                        logger.error(f"[CASE-EVAL] Error evaluating case {idx} (attempt {attempt + 1}): {e}")
+                        logger.error(
+                            "[CASE-EVAL] Error evaluating case %s (attempt %s): %s",
+                            idx,
+                            attempt + 1,
+                            e,
+                        )
                         break
         
         # No matching case with routing action
-        logger.info(f"[CASE-EVAL] No matching case with routing action found for event={event_name}")
+        logger.info(
+            "[CASE-EVAL] No matching case with routing action found for event=%s",
+            event_name,
+        )
         return None
     
     async def _evaluate_case_blocks(
@@ -2014,7 +2260,12 @@ class Worker:
         if spec:
             case_mode = spec.get("case_mode", "exclusive")
             eval_mode = spec.get("eval_mode", "on_entry")
-            logger.debug(f"[SPEC] Step '{step}' spec: case_mode={case_mode}, eval_mode={eval_mode}")
+            logger.debug(
+                "[SPEC] Step '%s' spec: case_mode=%s, eval_mode=%s",
+                step,
+                case_mode,
+                eval_mode,
+            )
         
         # Merge tool.input with top-level command input (top-level values take precedence).
         tool_input = tool_config.get("input")
@@ -2046,7 +2297,7 @@ class Worker:
             render_context["execution_id"] = execution_id
         if catalog_id and "catalog_id" not in render_context:
             render_context["catalog_id"] = catalog_id
-            logger.debug(f"[KEYCHAIN] Added catalog_id to render_context for step {step}")
+            logger.debug("[KEYCHAIN] Added catalog_id to render_context for step %s", step)
         if command_id:
             render_context["command_id"] = command_id
             event_context = render_context.get("event")
@@ -2091,7 +2342,10 @@ class Worker:
                 raise_on_failure=False,
             )
             t_events_end = time.perf_counter()
-            logger.info(f"[PERF] emit_initial_events (batch) took {(t_events_end - t_events_start)*1000:.1f}ms")
+            logger.info(
+                "[PERF] emit_initial_events (batch) took %.1fms",
+                (t_events_end - t_events_start)*1000,
+            )
             if not initial_events_ok:
                 logger.debug(
                     "[EVENT] Initial informational events not accepted in time for step=%s tool=%s execution=%s; continuing",
@@ -2175,7 +2429,11 @@ class Worker:
                             pass
 
             t_tool_end = time.perf_counter()
-            logger.info(f"[PERF] Tool execution for {step} took {(t_tool_end - t_tool_start)*1000:.1f}ms")
+            logger.info(
+                "[PERF] Tool execution for %s took %.1fms",
+                step,
+                (t_tool_end - t_tool_start)*1000,
+            )
 
             # Process result through ResultHandler for event transport.
             # Contract: worker owns payload persistence; events carry refs/metadata only.
@@ -2194,19 +2452,29 @@ class Worker:
                     output_config=event_output_config,
                     scrub_context=render_context,
                 )
-                logger.info(f"[DEBUG-PAYLOAD] Step {step} processed_response: {json.dumps(processed_response, default=str)[:1000]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "[DEBUG-PAYLOAD] Step %s processed_response: %s",
+                        step,
+                        json.dumps(processed_response, default=str)[:1000],
+                    )
                 if is_result_ref(processed_response):
                     logger.info(
-                        f"[RESULT] Step {step}: stored result for event transport | "
-                        f"store={processed_response.get('_store', 'unknown')} | "
-                        f"size={processed_response.get('_size_bytes', 0)}b"
+                        "[RESULT] Step %s: stored result for event transport | store=%s | size=%sb",
+                        step,
+                        processed_response.get('_store', 'unknown'),
+                        processed_response.get('_size_bytes', 0)
                     )
                 response_for_events = processed_response
             except Exception as result_err:
-                logger.warning(f"[RESULT] Failed to process result for {step}: {result_err}")
+                logger.warning("[RESULT] Failed to process result for %s: %s", step, result_err)
                 response_for_events = {"_store_failed": True, "_store_error": str(result_err)[:300]}
             t_result_end = time.perf_counter()
-            logger.debug(f"[PERF] Result processing for {step} took {(t_result_end - t_result_start)*1000:.1f}ms")
+            logger.debug(
+                "[PERF] Result processing for %s took %.1fms",
+                step,
+                (t_result_end - t_result_start)*1000,
+            )
 
             # Note: _internal_data will be cleaned up before emitting final events
             
@@ -2217,15 +2485,20 @@ class Worker:
                 type(case_blocks).__name__,
                 len(case_blocks) if isinstance(case_blocks, list) else 0,
             )
-            logger.debug(f"[DEBUG] After tool execution for step: {step}")
-            logger.debug(f"[DEBUG] case_blocks is None: {case_blocks is None}")
-            logger.debug(f"[DEBUG] case_blocks bool: {bool(case_blocks)}")
+            logger.debug("[DEBUG] After tool execution for step: %s", step)
+            logger.debug("[DEBUG] case_blocks is None: %s", case_blocks is None)
+            logger.debug("[DEBUG] case_blocks bool: %s", bool(case_blocks))
             if case_blocks:
-                logger.debug(f"[DEBUG] case_blocks length: {len(case_blocks)}")
+                logger.debug("[DEBUG] case_blocks length: %s", len(case_blocks))
                 for idx, cb in enumerate(case_blocks):
                     logger.debug("[DEBUG] case_block[%s] keys=%s", idx, _safe_keys(cb))
 
-            logger.debug(f"[DEBUG] context has_case={'case' in context} | case_blocks={case_blocks is not None} | case_count={len(case_blocks) if case_blocks else 0}")
+            logger.debug(
+                "[DEBUG] context has_case=%s | case_blocks=%s | case_count=%s",
+                'case' in context,
+                case_blocks is not None,
+                len(case_blocks) if case_blocks else 0,
+            )
             
             # Check if tool returned error status FIRST (before case evaluation)
             # This allows case blocks to handle errors via call.error event
@@ -2272,7 +2545,12 @@ class Worker:
             # Uses CaseEvaluator with proper exclusive/inclusive mode support
             case_action = None
             if case_blocks:
-                logger.info(f"[CASE-CHECK] Evaluating case blocks for {step} | mode={case_mode} | has_error={tool_error is not None}")
+                logger.info(
+                    "[CASE-CHECK] Evaluating case blocks for %s | mode=%s | has_error=%s",
+                    step,
+                    case_mode,
+                    tool_error is not None,
+                )
 
                 # Build evaluation context based on success or error
                 eval_event_name = "call.error" if tool_error else "call.done"
@@ -2318,7 +2596,11 @@ class Worker:
                 
                 # If case action resulted in routing (next/retry), report and handle
                 if case_action and case_action.get('type') in ['next', 'retry']:
-                    logger.info(f"[CASE-ACTION] Case evaluation triggered {case_action['type']} action for {step}")
+                    logger.info(
+                        "[CASE-ACTION] Case evaluation triggered %s action for %s",
+                        case_action['type'],
+                        step,
+                    )
 
                     # ARCHITECTURE PRINCIPLE #3:
                     # Report case action to server via ACTIONABLE event
@@ -2416,13 +2698,17 @@ class Worker:
                         case_action_events,
                     )
 
-                    logger.info(f"[EVENT] Completed {step} with case action for execution {execution_id}")
+                    logger.info(
+                        "[EVENT] Completed %s with case action for execution %s",
+                        step,
+                        execution_id,
+                    )
                     return  # Exit - server will handle routing based on case_action
             
             # No case action handled it - check for unhandled tool errors
             if tool_error:
                 # Tool returned error - treat as failure (no case handled it)
-                logger.error(f"Tool execution failed for {step}: {tool_error}")
+                logger.error("Tool execution failed for %s: %s", step, tool_error)
                 # Use processed response (externalized when large) to avoid persisting
                 # raw oversized payloads in failure events.
                 error_event_response = response_for_events if error_response is not None else error_response
@@ -2462,12 +2748,16 @@ class Worker:
                         # Also remove 'data' field which is a duplicate for backwards compat
                         response_data.pop('data', None)
 
-                        if internal_data:
+                        if internal_data and logger.isEnabledFor(logging.INFO):
+                            logger.info(
+                                "[CLEANUP] Removed _internal_data and data before event emission | "
+                                "payload_size_reduction: ~%s bytes",
+                                len(str(internal_data))
+                            )
                             logger.info(
-                                f"[CLEANUP] Removed _internal_data and data before event emission | "
-                                f"payload_size_reduction: ~{len(str(internal_data))} bytes"
+                                "[CLEANUP] Response now contains only reference: %s",
+                                response_data.get('data_reference', {}),
                             )
-                            logger.info(f"[CLEANUP] Response now contains only reference: {response_data.get('data_reference', {})}")
                 
                 await self._emit_terminal_event_batch(
                     server_url,
@@ -2491,7 +2781,7 @@ class Worker:
                 
             except Exception as emit_error:
                 # Event emission failed - try to report failure
-                logger.exception(f"Failed to emit success events for {step}: {emit_error}")
+                logger.exception("Failed to emit success events for %s: %s", step, emit_error)
                 try:
                     # Attempt to emit command.failed to mark execution as failed
                     if command_id:
@@ -2507,12 +2797,12 @@ class Worker:
                             }
                         )
                 except Exception as recovery_error:
-                    logger.exception(f"Failed to emit recovery failure event: {recovery_error}")
+                    logger.exception("Failed to emit recovery failure event: %s", recovery_error)
                 # Re-raise so the command handler knows it failed
                 raise emit_error
             
         except Exception as e:
-            logger.error(f"Execution error for {step}: {e}", exc_info=True)
+            logger.error("Execution error for %s: %s", step, e, exc_info=True)
             
             # Emit error event
             await self._emit_terminal_event_batch(
@@ -2625,7 +2915,7 @@ class Worker:
                 config = resolved_payload.get("config", config)
                 args = resolved_payload.get("args", args)
             k_end = time.perf_counter()
-            logger.debug(f"[PERF] keychain dispatch resolution took {k_end - k_start:.4f}s")
+            logger.debug("[PERF] keychain dispatch resolution took %.4fs", k_end - k_start)
         
         import time
         t_jinja_start = time.perf_counter()
@@ -2637,7 +2927,7 @@ class Worker:
         jinja_env = add_b64encode_filter(jinja_env)  # Add custom filters including tojson
         register_token_functions(jinja_env, context)
         t_jinja_end = time.perf_counter()
-        logger.debug(f"[PERF] Jinja2 setup took {t_jinja_end - t_jinja_start:.4f}s")
+        logger.debug("[PERF] Jinja2 setup took %.4fs", t_jinja_end - t_jinja_start)
         
         # Map Core config format to plugin task_config format
         # Plugins use different field names than Core DSL
@@ -2662,7 +2952,7 @@ class Worker:
             # - Base64 code support
             # - Kwargs unpacking
             # - Error handling
-            result = await execute_python_task_async(task_config, context, jinja_env, args)
+            result = await _tool_executor("execute_python_task_async")(task_config, context, jinja_env, args)
             # Check if plugin returned error status
             if isinstance(result, dict) and result.get('status') == 'error':
                 # Keep error response intact (worker needs status field to detect error)
@@ -2687,10 +2977,15 @@ class Worker:
                             has_pagination_retry = True
                             break
 
-            logger.debug(f"HTTP TOOL: config_keys={list(config.keys()) if isinstance(config, dict) else 'not dict'} | retry={retry_config is not None} | policies={len(retry_config) if isinstance(retry_config, list) else 0} | has_pagination={has_pagination_retry}")
+            logger.debug(
+                "HTTP TOOL: config_keys=%s | retry=%s | policies=%s | has_pagination=%s",
+                list(config.keys()) if isinstance(config, dict) else 'not dict',
+                retry_config is not None,
+                len(retry_config) if isinstance(retry_config, list) else 0,
+                has_pagination_retry,
+            )
 
-            # Lazy import — see module-top comment about the circular cycle.
-            from noetl.tools.http import execute_http_task
+            execute_http_task = _tool_executor("execute_http_task")
 
             if has_pagination_retry:
                 logger.info("HTTP tool using execute_with_retry_async for pagination support")
@@ -2728,8 +3023,7 @@ class Worker:
             # This lets the plugin pool reuse connections (same loop_id → same pool key).
             # The old pattern (run_in_executor + asyncio.run) created a new event loop
             # per call, causing a fresh pool each time and leaking connections.
-            # Lazy import — see module-top comment about the circular cycle.
-            from noetl.tools.postgres import execute_postgres_task_async
+            execute_postgres_task_async = _tool_executor("execute_postgres_task_async")
             task_with = {**config, **args}  # Merge config (has auth) with args
             result = await execute_postgres_task_async(task_config, context, jinja_env, task_with)
             # Check if plugin returned error status
@@ -2741,8 +3035,7 @@ class Worker:
         elif tool_kind == "duckdb":
             # Use plugin's execute_duckdb_task (sync function - run in executor)
             # Pass full tool config as task_with to ensure auth is available
-            # Lazy import — see module-top comment about the circular cycle.
-            from noetl.tools.duckdb import execute_duckdb_task
+            execute_duckdb_task = _tool_executor("execute_duckdb_task")
             task_with = {**config, **args}  # Merge config (has auth) with args
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
@@ -2757,7 +3050,7 @@ class Worker:
 
         elif tool_kind == "ducklake":
             # Use plugin's execute_ducklake_task (sync function - run in executor)
-            from noetl.tools.ducklake import execute_ducklake_task
+            execute_ducklake_task = _tool_executor("execute_ducklake_task")
             # Pass full tool config as task_with to ensure auth is available
             task_with = {**config, **args}  # Merge config (has auth) with args
             loop = asyncio.get_running_loop()
@@ -2772,13 +3065,11 @@ class Worker:
             return result.get('data', result) if isinstance(result, dict) else result
 
         elif tool_kind == "snowflake":
-            # Use plugin's execute_snowflake_task (sync wrapper)
+            # The connector runs in a thread; large results go to TempStore as Arrow IPC
             # Pass full tool config as task_with to ensure auth is available
             task_with = {**config, **args}  # Merge config (has auth) with args
-            loop = asyncio.get_running_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: execute_snowflake_task(task_config, context, jinja_env, task_with)
+            result = await _tool_executor("execute_snowflake_task_async")(
+                task_config, context, jinja_env, task_with
             )
             if isinstance(result, dict) and result.get('status') == 'error':
                 return result
@@ -2789,7 +3080,7 @@ class Worker:
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: execute_transfer_action(task_config, context, jinja_env, args)
+                lambda: _tool_executor("execute_transfer_action")(task_config, context, jinja_env, args)
             )
             if isinstance(result, dict) and result.get('status') == 'error':
                 return result
@@ -2800,7 +3091,7 @@ class Worker:
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: execute_snowflake_transfer_action(task_config, context, jinja_env, args)
+                lambda: _tool_executor("execute_snowflake_transfer_action")(task_config, context, jinja_env, args)
             )
             if isinstance(result, dict) and result.get('status') == 'error':
                 return result
@@ -2808,7 +3099,7 @@ class Worker:
 
         elif tool_kind == "script":
             # Execute script as Kubernetes job (async plugin)
-            result = await execute_script_task(task_config, context, jinja_env, args)
+            result = await _tool_executor("execute_script_task")(task_config, context, jinja_env, args)
             if isinstance(result, dict) and result.get('status') == 'error':
                 return result
             return result
@@ -2818,7 +3109,7 @@ class Worker:
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: execute_secrets_task(task_config, context, jinja_env)
+                lambda: _tool_executor("execute_secrets_task")(task_config, context, jinja_env)
             )
             # Check if plugin returned error status
             if isinstance(result, dict) and result.get('status') == 'error':
@@ -2828,7 +3119,7 @@ class Worker:
 
         elif tool_kind == "workbook":
             # Call async execute_workbook_task directly (don't use executor for async functions)
-            result = await execute_workbook_task(task_config, context, jinja_env, args)
+            result = await _tool_executor("execute_workbook_task")(task_config, context, jinja_env, args)
             # Check if plugin returned error status
             if isinstance(result, dict) and result.get('status') == 'error':
                 # Keep error response intact (worker needs status field to detect error)
@@ -2846,7 +3137,7 @@ class Worker:
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: execute_playbook_task(task_config, context, jinja_env, playbook_args or {})
+                lambda: _tool_executor("execute_playbook_task")(task_config, context, jinja_env, playbook_args or {})
             )
             return result
             
@@ -2856,7 +3147,7 @@ class Worker:
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: execute_gcs_task(task_config, context, jinja_env, task_with)
+                lambda: _tool_executor("execute_gcs_task")(task_config, context, jinja_env, task_with)
             )
             # Check if plugin returned error status
             if isinstance(result, dict) and result.get('status') == 'error':
@@ -2875,7 +3166,7 @@ class Worker:
 
         elif tool_kind == "nats":
             # NATS tool for K/V Store, Object Store, and JetStream operations
-            from noetl.tools.nats import execute_nats_task
+            execute_nats_task = _tool_executor("execute_nats_task")
             task_with = {**config, **args}
             result = await execute_nats_task(task_config, context, jinja_env, task_with)
             # Check if plugin returned error status
@@ -2903,7 +3194,7 @@ class Worker:
             # — execute_agent_task wraps their raw output in the same
             # envelope shape, so the caller-visible structure is uniform.
             task_with = {**config, **args}
-            result = await execute_agent_task(task_config, context, jinja_env, task_with)
+            result = await _tool_executor("execute_agent_task")(task_config, context, jinja_env, task_with)
             return result
 
         elif tool_kind == "mcp":
@@ -2912,14 +3203,15 @@ class Worker:
             # Pass only runtime overrides. task_config already contains merged
             # input/args, and stale config values must not override it again.
             task_with = dict(args or {})
-            result = await execute_mcp_task(task_config, context, jinja_env, task_with)
+            result = await _tool_executor("execute_mcp_task")(task_config, context, jinja_env, task_with)
             if isinstance(result, dict) and result.get("status") == "error":
                 return result
             return result.get("data", result) if isinstance(result, dict) else result
 
         elif tool_kind == "artifact":
             # Artifact tool for loading/storing externalized results
-            from noetl.tools.artifact.executor import execute_artifact_get, execute_artifact_put
+            execute_artifact_get = _tool_executor("execute_artifact_get")
+            execute_artifact_put = _tool_executor("execute_artifact_put")
             task_with = {**config, **args}
             action = config.get('action', 'get')
             loop = asyncio.get_running_loop()
@@ -2964,7 +3256,7 @@ class Worker:
                                 return ast.literal_eval(stripped)
                     return rendered
                 except Exception as e:
-                    logger.error(f"Template rendering error: {e} | template={template[:100]}...")
+                    logger.error("Template rendering error: %s | template=%s...", e, template[:100])
                     return template
 
             def render_dict_templates(data: dict, ctx: dict) -> dict:
@@ -3023,7 +3315,11 @@ class Worker:
                                     return rendered
                     return rendered
                 except Exception as e:
-                    logger.error(f"[CURSOR-WORKER] template render error: {e} | template={template[:100]}...")
+                    logger.error(
+                        "[CURSOR-WORKER] template render error: %s | template=%s...",
+                        e,
+                        template[:100],
+                    )
                     return template
 
             def render_dict_templates(data: dict, ctx: dict) -> dict:
@@ -3046,7 +3342,7 @@ class Worker:
         elif tool_kind == "noop":
             # No-operation tool - used for case-driven steps that don't need tool execution
             # Returns empty result, step logic is driven by case conditions
-            logger.debug(f"[NOOP] Step '{step}' - no-op execution")
+            logger.debug("[NOOP] Step '%s' - no-op execution", step)
             return {"status": "noop", "step": step}
 
         elif tool_kind == "shell":
@@ -3317,46 +3613,35 @@ class Worker:
                     )
                     await asyncio.sleep(delay)
 
-        response = await _request_with_transient_retry(
-            lambda: self._http_client.post(
-                _api_url(server_url, "execute"),
-                json=payload,
-                timeout=30.0,
-            ),
-            "spawn request",
-        )
-        response.raise_for_status()
-        result = response.json()
-        
-        execution_id = result.get("execution_id")
-        
-        # Poll for sub-playbook completion if return_step is specified
-        if return_step:
-            max_wait = config.get("timeout", 300)  # Default 5 minutes
+        async def _wait_for_terminal(execution_id: Any, max_wait: float) -> Optional[dict]:
+            # Long-poll /status: the server parks the request until the child's
+            # terminal event commits.  Servers that ignore ``wait_seconds``
+            # answer at once and are re-polled every ``poll_interval``.
+            # /api/executions/{id} can show transient COMPLETED for intermediate
+            # command.completed events, which is not a terminal playbook state.
             poll_interval = 2  # seconds
-            elapsed = 0
             failed_statuses = {"FAILED", "ERROR", "CANCELLED", "CANCELED"}
-            
-            while elapsed < max_wait:
-                await asyncio.sleep(poll_interval)
-                elapsed += poll_interval
-                
-                # Check execution status using engine state endpoint.
-                # /api/executions/{id} can show transient COMPLETED for intermediate
-                # command.completed events, which is not a terminal playbook state.
+            deadline = time.monotonic() + max_wait
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                wait_seconds = round(min(remaining, _SUB_PLAYBOOK_STATUS_WAIT_SECONDS), 3)
+                poll_started = time.monotonic()
                 status_response = await _request_with_transient_retry(
                     lambda: self._http_client.get(
                         _api_url(server_url, f"executions/{execution_id}/status"),
-                        timeout=10.0,
+                        params={"wait_seconds": wait_seconds},
+                        timeout=10.0 + wait_seconds,
                     ),
                     f"status polling for execution {execution_id}",
                 )
-                
+
                 if status_response.status_code == 200:
                     status_data = status_response.json()
                     state_completed = bool(status_data.get("completed"))
                     state_failed = bool(status_data.get("failed"))
-                    
+
                     if state_completed or state_failed:
                         return status_data
                 else:
@@ -3381,9 +3666,89 @@ class Worker:
 
                         if state_completed or state_failed:
                             return fallback_data
-            
+                if time.monotonic() - poll_started < poll_interval:
+                    await asyncio.sleep(poll_interval)
+
+        batch_inputs = config.get("inputs")
+        if isinstance(batch_inputs, list):
+            child_payloads = []
+            for index, item in enumerate(batch_inputs):
+                if item is not None and not isinstance(item, dict):
+                    raise ValueError(
+                        f"Playbook 'inputs' items must be objects; item {index} is {type(item).__name__}"
+                    )
+                child_payloads.append({**args, **(item or {})})
+            # One /execute/batch request starts every child of this playbook.
+            batch_payload = {key: value for key, value in payload.items() if key != "payload"}
+            batch_payload["payloads"] = child_payloads
+            response = await _request_with_transient_retry(
+                lambda: self._http_client.post(
+                    _api_url(server_url, "execute/batch"),
+                    json=batch_payload,
+                    timeout=60.0,
+                ),
+                "batch spawn request",
+            )
+            if response.status_code in (404, 405):
+                # Servers without the batch route (rolling upgrade) get one
+                # /execute per payload, like the playbook tool.
+                logger.info("Sub-playbook /execute/batch unavailable; starting children one by one")
+                execution_ids = []
+                for child_payload in child_payloads:
+                    child_response = await _request_with_transient_retry(
+                        lambda: self._http_client.post(
+                            _api_url(server_url, "execute"),
+                            json={**payload, "payload": child_payload},
+                            timeout=30.0,
+                        ),
+                        "spawn request",
+                    )
+                    child_response.raise_for_status()
+                    execution_ids.append(child_response.json().get("execution_id"))
+            else:
+                response.raise_for_status()
+                execution_ids = [item.get("execution_id") for item in response.json().get("executions", [])]
+            if not return_step:
+                return {"status": "started", "execution_ids": execution_ids, "path": path, "async": True}
+            max_wait = config.get("timeout", 300)
+            outcomes = await asyncio.gather(
+                *(_wait_for_terminal(execution_id, max_wait) for execution_id in execution_ids)
+            )
+            results = []
+            for execution_id, outcome in zip(execution_ids, outcomes):
+                if outcome is None:
+                    logger.warning("Sub-playbook %s timed out after %ss", execution_id, max_wait)
+                    outcome = {"status": "started", "execution_id": execution_id, "path": path, "async": False}
+                results.append(outcome)
+            return {
+                "execution_ids": execution_ids,
+                "completed": all(bool(item.get("completed")) for item in results),
+                "failed": any(bool(item.get("failed")) for item in results),
+                "results": results,
+            }
+
+        response = await _request_with_transient_retry(
+            lambda: self._http_client.post(
+                _api_url(server_url, "execute"),
+                json=payload,
+                timeout=30.0,
+            ),
+            "spawn request",
+        )
+        response.raise_for_status()
+        result = response.json()
+        
+        execution_id = result.get("execution_id")
+        
+        # Wait for sub-playbook completion if return_step is specified
+        if return_step:
+            max_wait = config.get("timeout", 300)  # Default 5 minutes
+            status_data = await _wait_for_terminal(execution_id, max_wait)
+            if status_data is not None:
+                return status_data
+
             # Timeout - return what we have
-            logger.warning(f"Sub-playbook {execution_id} timed out after {max_wait}s")
+            logger.warning("Sub-playbook %s timed out after %ss", execution_id, max_wait)
         
         # Async execution - return execution info immediately
         return {
@@ -3434,16 +3799,34 @@ class Worker:
         timeout_seconds: Optional[float] = None,
         max_retries: Optional[int] = None,
         raise_on_failure: bool = True,
+        coalesce: bool = True,
     ):
         """
         Emit multiple events in a single HTTP call via /api/events/batch.
 
+        With the worker-wide coalescer enabled, multi-event lists are queued
+        and shipped together with events from other in-flight commands of the
+        same execution (``coalesce=False`` sends them directly).  A single
+        event always goes to /api/events: heartbeats and recovery
+        ``command.failed`` rely on its inline engine evaluation, dedupe and
+        409 semantics, which the batch endpoint does not provide.
+
         Falls back to individual _emit_event calls if the batch endpoint is
         unavailable (404) or if events list has only one item.
         """
         if not events:
             return True
 
+        if coalesce and self._event_coalescer is not None and len(events) > 1:
+            return await self._submit_coalesced_events(
+                server_url,
+                execution_id,
+                events,
+                timeout_seconds=timeout_seconds,
+                max_retries=max_retries,
+                raise_on_failure=raise_on_failure,
+            )
+
         # Single event: just use the regular endpoint
         if len(events) == 1:
             evt = events[0]
@@ -3455,6 +3838,7 @@ class Worker:
                 evt.get("payload", {}),
                 actionable=evt.get("actionable", False),
                 informative=evt.get("informative", True),
+                meta=evt.get("meta"),
                 timeout_seconds=timeout_seconds,
                 max_retries=max_retries,
                 raise_on_failure=raise_on_failure,
@@ -3498,10 +3882,12 @@ class Worker:
             await self._concurrency.acquire()
             _released = False
             try:
-                response = await self._http_client.post(
+                response = await post_json(
+                    self._http_client,
                     batch_url,
-                    json=batch_data,
-                    headers={"Idempotency-Key": batch_idempotency_key},
+                    batch_data,
+                    request_compressor=self._wire_compressor,
+                    headers={"Idempotency-Key": batch_idempotency_key, **_execution_routing_headers(execution_id)},
                     timeout=request_timeout,
                 )
                 if response.status_code == 404:
@@ -3518,6 +3904,7 @@ class Worker:
                             evt.get("payload", {}),
                             actionable=evt.get("actionable", False),
                             informative=evt.get("informative", True),
+                            meta=evt.get("meta"),
                             timeout_seconds=timeout_seconds,
                             max_retries=1,
                             raise_on_failure=raise_on_failure,
@@ -3603,6 +3990,50 @@ class Worker:
                 )
                 await asyncio.sleep(delay)
 
+    async def _send_coalesced_events(
+        self,
+        server_url: str,
+        execution_id: Any,
+        events: list[dict],
+        timeout_seconds: Optional[float],
+        max_retries: Optional[int],
+    ) -> bool:
+        """EventCoalescer send callable: one direct /api/events/batch call."""
+        return await self._emit_batch_events(
+            server_url,
+            execution_id,
+            events,
+            timeout_seconds=timeout_seconds,
+            max_retries=max_retries,
+            raise_on_failure=True,
+            coalesce=False,
+        )
+
+    async def _submit_coalesced_events(
+        self,
+        server_url: str,
+        execution_id: int,
+        events: list[dict],
+        *,
+        timeout_seconds: Optional[float],
+        max_retries: Optional[int],
+        raise_on_failure: bool,
+    ) -> bool:
+        try:
+            return await self._event_coalescer.submit(
+                server_url,
+                execution_id,
+                events,
+                timeout_seconds=timeout_seconds,
+                max_retries=max_retries,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if raise_on_failure:
+                raise
+            return False
+
     async def _emit_terminal_event_batch(
         self,
         server_url: str,
@@ -3761,9 +4192,12 @@ class Worker:
                     retry_count,
                 )
 
-                response = await self._http_client.post(
+                response = await post_json(
+                    self._http_client,
                     event_url,
-                    json=event_data,
+                    event_data,
+                    request_compressor=self._wire_compressor,
+                    headers=_execution_routing_headers(execution_id),
                     timeout=request_timeout,
                 )
 
@@ -3796,7 +4230,12 @@ class Worker:
                 _released = True
 
                 t_http_end = time.perf_counter()
-                logger.debug(f"[PERF] emit_event({name}) HTTP took {(t_http_end - t_http_start)*1000:.1f}ms - status={response.status_code}")
+                logger.debug(
+                    "[PERF] emit_event(%s) HTTP took %.1fms - status=%s",
+                    name,
+                    (t_http_end - t_http_start)*1000,
+                    response.status_code,
+                )
                 return True  # Success - exit retry loop
 
             except asyncio.CancelledError:
@@ -3812,8 +4251,11 @@ class Worker:
                 if is_last_attempt:
                     t_emit_end = time.perf_counter()
                     logger.error(
-                        f"[HTTP] Failed to emit event {name} after {retry_count} attempts "
-                        f"({(t_emit_end - t_emit_start)*1000:.1f}ms total): {e}",
+                        "[HTTP] Failed to emit event %s after %s attempts (%.1fms total): %s",
+                        name,
+                        retry_count,
+                        (t_emit_end - t_emit_start)*1000,
+                        e,
                         exc_info=True,
                     )
                     if raise_on_failure:
@@ -3822,8 +4264,12 @@ class Worker:
                 else:
                     delay = base_delay * (2 ** attempt)  # Fast exponential backoff: 50ms, 100ms, 200ms
                     logger.warning(
-                        f"[HTTP] Event {name} emission failed "
-                        f"(attempt {attempt + 1}/{retry_count}): {e}. Retrying in {delay*1000:.0f}ms..."
+                        "[HTTP] Event %s emission failed (attempt %s/%s): %s. Retrying in %.0fms...",
+                        name,
+                        attempt + 1,
+                        retry_count,
+                        e,
+                        delay*1000
                     )
                     await asyncio.sleep(delay)
 
@@ -3870,7 +4316,7 @@ async def run_worker(
     except KeyboardInterrupt:
         logger.info("Worker interrupted by user")
     except Exception as e:
-        logger.error(f"Worker error: {e}", exc_info=True)
+        logger.error("Worker error: %s", e, exc_info=True)
         raise
     finally:
         if metrics_server is not None:
@@ -3911,7 +4357,12 @@ def run_worker_sync(
             f.write(f"Server URL: {server_url}\n")
             f.flush()
 
-        logger.info(f"Starting Core worker {worker_id} | NATS={safe_nats_url} | Server={server_url}")
+        logger.info(
+            "Starting Core worker %s | NATS=%s | Server=%s",
+            worker_id,
+            safe_nats_url,
+            server_url,
+        )
         
         with open("/tmp/worker_before_run.txt", "w") as f:
             f.write(f"About to call asyncio.run at {datetime.now()}\n")
@@ -3936,5 +4387,5 @@ def run_worker_sync(
             f.write(traceback.format_exc())
             f.flush()
         
-        logger.error(f"Worker failed to start: {e}", exc_info=True)
+        logger.error("Worker failed to start: %s", e, exc_info=True)
         sys.exit(1)
@@ -19,8 +19,10 @@ Usage in worker:
     # Returns: {"_ref": ResultRef, "status": "ok", "count": 100, ...extracted fields}
 """
 
+import asyncio
+import json
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, timezone
 
 from noetl.core.storage import (
@@ -45,6 +47,28 @@ INLINE_MAX_BYTES = int(os.getenv("NOETL_INLINE_MAX_BYTES", "10485760"))  # 64KB
 PREVIEW_MAX_BYTES = int(os.getenv("NOETL_PREVIEW_MAX_BYTES", "1024"))  # 1KB
 
 
+def _scrub_and_encode(
+    result: Any,
+    scrub_context: Optional[Dict[str, Any]],
+    threshold: int,
+) -> Tuple[Any, int, Optional[bytes]]:
+    """Scrub ``result`` and measure it by encoding it once.
+
+    Returns the scrubbed result, its exact JSON size and, when that exceeds
+    ``threshold``, the encoded bytes so the store does not scrub and
+    serialize the payload again.  The encoding matches TempStore's.
+    """
+    # Producer boundary per agents/rules/execution-model.md secrets rule.
+    scrubbed = producer_scrub_payload(result, scrub_context)
+    try:
+        encoded = json.dumps(scrubbed, default=str).encode("utf-8")
+    except (TypeError, ValueError):
+        # Not JSON-encodable as-is (e.g. a reference cycle); estimate and
+        # let the store surface the error if it has to be externalized.
+        return scrubbed, estimate_size(scrubbed), None
+    return scrubbed, len(encoded), encoded if len(encoded) > threshold else None
+
+
 def _compact_control_data(result: Any, *, max_items: int = 10) -> Optional[Dict[str, Any]]:
     """Return a bounded control-plane view for large MCP-like results.
 
@@ -172,12 +196,12 @@ class ResultHandler:
             return {"_value": None}
 
         output_config = output_config or {}
-        # Producer boundary per agents/rules/execution-model.md secrets rule.
-        result = producer_scrub_payload(result, scrub_context)
-
-        # Check size
-        size_bytes = estimate_size(result)
         threshold = output_config.get("inline_max_bytes", self.inline_max_bytes)
+        # One scrub and one encode, off the event loop: large tool results
+        # would otherwise block it for seconds.
+        result, size_bytes, encoded = await asyncio.to_thread(
+            _scrub_and_encode, result, scrub_context, threshold
+        )
 
         logger.debug(
             f"[RESULT] Step {step_name}: size={size_bytes}b, threshold={threshold}b, "
@@ -214,6 +238,7 @@ class ResultHandler:
                 scope=Scope.EXECUTION,
                 store=tier,
                 source_step=step_name,
+                serialized=encoded,
             )
             logger.info(f"[RESULT] Stored {step_name} -> {ref.ref} (tier={tier.value})")
         except Exception as e:
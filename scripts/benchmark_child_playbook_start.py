@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+"""Benchmark starting and waiting on many child executions of one playbook.
+
+Runs the real ``/execute``, ``/execute/batch`` and
+``/executions/{id}/status`` handlers in-process.  The database, NATS
+publish and engine state store are replaced by stand-ins that each cost
+``--db-rtt-ms`` per round trip, so the numbers track round trips and
+handler overhead, not Postgres itself.
+
+Start phase (``--children`` children of the same catalog entry):
+
+- ``single``: one ``execute`` call per child, the way a loop over a
+  sub-playbook step starts children today;
+- ``batch``: one ``execute_batch`` call for all children.
+
+Wait phase: every child finishes after ``--child-seconds`` (staggered by
+up to 50%).  The waiter either polls status every ``--poll-interval``
+seconds or long-polls with ``wait_seconds``, woken by the terminal-event
+notification.
+
+Reports starts per second, database round trips, status requests per
+child and detection latency, as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from types import SimpleNamespace
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self.round_trips = 0
+        self.publishes = 0
+        self.status_calls = 0
+
+
+class _Cursor:
+    def __init__(self, stats: _Stats, rtt: float):
+        self._stats = stats
+        self._rtt = rtt
+        self._query = ""
+        self._params = None
+
+    async def execute(self, query, params=None):
+        self._stats.round_trips += 1
+        self._query, self._params = query, params
+        await asyncio.sleep(self._rtt)
+
+    async def fetchone(self):
+        if "FROM noetl.catalog" in self._query:
+            return {"catalog_id": 5, "path": "bench/child"}
+        if "playbook.initialized" in self._query:
+            return {"event_id": 1}
+        return None
+
+
+class _CursorCtx:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    async def __aenter__(self):
+        return self._cursor
+
+    async def __aexit__(self, *_exc):
+        return False
+
+
+class _Conn:
+    def __init__(self, stats: _Stats, rtt: float):
+        self._stats = stats
+        self._rtt = rtt
+
+    def cursor(self, **_kwargs):
+        return _CursorCtx(_Cursor(self._stats, self._rtt))
+
+    async def commit(self):
+        self._stats.round_trips += 1
+        await asyncio.sleep(self._rtt)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+
+class _Engine:
+    """Engine stand-in: resolving the playbook and saving state each cost a round trip."""
+
+    def __init__(self, stats: _Stats, rtt: float):
+        self._stats = stats
+        self._rtt = rtt
+        self._ids = iter(range(1, 10_000_000))
+        engine = self
+
+        class _Repo:
+            async def load_playbook_by_id(self, _catalog_id):
+                engine._stats.round_trips += 1
+                await asyncio.sleep(engine._rtt)
+                return SimpleNamespace(name="child")
+
+        self.playbook_repo = _Repo()
+
+    async def start_execution(self, path, payload, catalog_id, parent_execution_id, playbook=None):
+        if playbook is None:
+            playbook = await self.playbook_repo.load_playbook_by_id(catalog_id)
+        self._stats.round_trips += 1
+        await asyncio.sleep(self._rtt)
+        command = SimpleNamespace(
+            execution_id=next(self._ids),
+            step="start",
+            tool=SimpleNamespace(kind="python"),
+            max_attempts=3,
+            metadata={},
+        )
+        return str(command.execution_id), [command]
+
+
+def _install_stand_ins(stats: _Stats, rtt: float):
+    import noetl.server.api.core.commands as commands_module
+    import noetl.server.api.core.execution as execution_module
+
+    ids = iter(range(1, 10_000_000))
+    engine = _Engine(stats, rtt)
+
+    async def next_id(_cur):
+        return next(ids)
+
+    async def store_context(**kwargs):
+        return kwargs["context"]
+
+    async def enqueue(_cur, _event):
+        return None
+
+    async def drain():
+        return None
+
+    async def supervise(*_args, **_kwargs):
+        return None
+
+    async def publish(items, *, server_url):
+        stats.publishes += 1
+        await asyncio.sleep(rtt)
+
+    execution_module.get_engine = lambda: engine
+    execution_module.get_pool_connection = lambda: _Conn(stats, rtt)
+    execution_module._next_snowflake_id = next_id
+    execution_module._enqueue_execution_outbox = enqueue
+    execution_module._drain_execution_outbox = drain
+    execution_module._publish_commands_with_recovery = publish
+    execution_module.supervise_command_issued = supervise
+    commands_module._build_command_context = lambda _cmd: {}
+    commands_module._validate_postgres_command_context_or_422 = lambda **_kwargs: None
+    commands_module._store_command_context_if_needed = store_context
+    return execution_module
+
+
+async def _start(args, mode: str) -> dict:
+    from noetl.server.api.core.models import ExecuteBatchRequest, ExecuteRequest
+
+    stats = _Stats()
+    execution_module = _install_stand_ins(stats, args.db_rtt_ms / 1000.0)
+    payloads = [{"item": index} for index in range(args.children)]
+    started = time.perf_counter()
+    if mode == "single":
+        for payload in payloads:
+            await execution_module.execute(ExecuteRequest(path="bench/child", workload=payload))
+    else:
+        await execution_module.execute_batch(ExecuteBatchRequest(path="bench/child", payloads=payloads))
+    elapsed = time.perf_counter() - started
+    return {
+        "starts_per_second": round(args.children / elapsed, 1),
+        "db_round_trips": stats.round_trips,
+        "publish_calls": stats.publishes,
+    }
+
+
+async def _wait(args, mode: str) -> dict:
+    import noetl.server.api.core.execution as execution_module
+    from noetl.server.api.execution.event_tail import notify_execution_events
+
+    stats = _Stats()
+    rtt = args.db_rtt_ms / 1000.0
+    rng = random.Random(7)
+    done_at: dict[str, float] = {}
+    t0 = time.monotonic()
+    finish = {
+        str(index): t0 + args.child_seconds * (1.0 + rng.random() * 0.5)
+        for index in range(args.children)
+    }
+
+    async def status(execution_id, full):
+        stats.status_calls += 1
+        await asyncio.sleep(rtt)
+        completed = time.monotonic() >= finish[execution_id]
+        return {"execution_id": execution_id, "completed": completed, "failed": False}
+
+    async def complete(execution_id):
+        await asyncio.sleep(finish[execution_id] - time.monotonic())
+        notify_execution_events(execution_id)
+
+    execution_module._execution_status = status
+
+    async def waiter(execution_id):
+        while True:
+            if mode == "poll":
+                doc = await execution_module.get_execution_status(execution_id)
+            else:
+                doc = await execution_module.get_execution_status(execution_id, wait_seconds=30.0)
+            if doc["completed"]:
+                done_at[execution_id] = time.monotonic()
+                return
+            if mode == "poll":
+                await asyncio.sleep(args.poll_interval)
+
+    await asyncio.gather(
+        *(complete(execution_id) for execution_id in finish),
+        *(waiter(execution_id) for execution_id in finish),
+    )
+    latencies = sorted(done_at[execution_id] - finish[execution_id] for execution_id in finish)
+    return {
+        "status_requests_per_child": round(stats.status_calls / args.children, 2),
+        "detect_latency_ms_p50": round(latencies[len(latencies) // 2] * 1000.0, 1),
+        "detect_latency_ms_max": round(latencies[-1] * 1000.0, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark batch child-playbook start and status long-poll")
+    parser.add_argument("--children", default=1000, type=int)
+    parser.add_argument("--db-rtt-ms", default=0.5, type=float, help="Cost of one simulated database round trip")
+    parser.add_argument("--child-seconds", default=3.0, type=float, help="Base child run time for the wait phase")
+    parser.add_argument("--poll-interval", default=1.0, type=float, help="Status poll interval of the polling waiter")
+    args = parser.parse_args(argv)
+
+    import noetl.server.api.core.execution  # noqa: F401  (keep import time out of the first run)
+
+    results = {
+        "start": {mode: asyncio.run(_start(args, mode)) for mode in ("single", "batch")},
+        "wait": {mode: asyncio.run(_wait(args, mode)) for mode in ("poll", "long_poll")},
+    }
+    print(json.dumps({"children": args.children, "db_rtt_ms": args.db_rtt_ms, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""Benchmark makespan of critical-path dispatch on synthetic DAG playbooks.
+
+Generates ``--playbooks`` random layered DAG playbooks (v10 ``next.arcs``
+routing, mixed tool kinds, a per-step "true" duration) and runs each on a
+simulated pool of ``--workers`` stand-in workers that take commands in
+publish order.  A step becomes ready once all of its predecessors finish;
+every run jitters durations by ``--noise``.  Reports mean makespan for:
+
+- ``fifo``: commands published in engine (arc) order, today's behaviour;
+- ``static``: critical-path priorities from the static per-kind defaults;
+- ``learned``: critical-path priorities after ``--history`` prior runs per
+  playbook were folded into :class:`StepDurationModel` as
+  ``command.completed`` rows.
+
+Results are printed as JSON so runs can be diffed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import random
+
+_KINDS = ("http", "postgres", "duckdb", "python")
+
+
+def _playbook(rng: random.Random, index: int, layers: int, width: int) -> tuple[dict, dict[str, float]]:
+    names = [[f"s{layer}_{i}" for i in range(rng.randint(1, width))] for layer in range(layers)]
+    workflow = [{"step": "start", "next": {"arcs": [{"step": name} for name in names[0]]}}]
+    truth: dict[str, float] = {}
+    for layer, row in enumerate(names):
+        following = names[layer + 1] if layer + 1 < len(names) else ["end"]
+        for name in row:
+            targets = rng.sample(following, k=min(len(following), rng.randint(1, 2)))
+            workflow.append({
+                "step": name,
+                "tool": {"kind": rng.choice(_KINDS)},
+                "next": {"arcs": [{"step": target} for target in targets]},
+            })
+            # Heavy-tailed: most steps are short, a few are long poles.
+            truth[name] = rng.lognormvariate(6.5, 1.2)
+    workflow.append({"step": "end"})
+    return {"metadata": {"path": f"bench/dag_{index}"}, "workflow": workflow}, truth
+
+
+def _graph(playbook: dict) -> tuple[dict[str, list[str]], dict[str, int]]:
+    successors = {step["step"]: [arc["step"] for arc in (step.get("next") or {}).get("arcs", [])] for step in playbook["workflow"]}
+    indegree = {name: 0 for name in successors}
+    for targets in successors.values():
+        for target in targets:
+            indegree[target] += 1
+    return successors, indegree
+
+
+def _simulate(playbook, truth, workers, priorities, rng, noise) -> tuple[float, list[dict]]:
+    """Event-driven run; returns makespan and command.completed-shaped rows."""
+    successors, indegree = _graph(playbook)
+    kinds = {step["step"]: (step.get("tool") or {}).get("kind") for step in playbook["workflow"]}
+    queue: list[str] = []
+    running: list[tuple[float, int, str]] = []
+    free, now, seq, rows = workers, 0.0, 0, []
+    # Jitter is drawn per step up front so every mode sees the same run.
+    actual = {name: mean * rng.uniform(1 - noise, 1 + noise) for name, mean in sorted(truth.items())}
+
+    def release(name: str) -> None:
+        # Tool-less routers complete inline on the server.
+        ready = [name]
+        while ready:
+            current = ready.pop(0)
+            batch = []
+            for target in successors.get(current, []):
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    batch.append(target)
+            if priorities is not None:
+                batch.sort(key=lambda step: priorities.get(step, 0), reverse=True)
+            for target in batch:
+                (queue if kinds.get(target) else ready).append(target)
+
+    release("start")
+    while queue or running:
+        while free and queue:
+            name = queue.pop(0)
+            duration = actual[name]
+            seq += 1
+            heapq.heappush(running, (now + duration, seq, name))
+            free -= 1
+            rows.append({"event_id": seq, "path": playbook["metadata"]["path"], "step": name,
+                         "tool_kind": kinds[name], "duration_ms": duration})
+        now, _, name = heapq.heappop(running)
+        free += 1
+        release(name)
+    return now, rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark critical-path dispatch makespan")
+    parser.add_argument("--playbooks", default=50, type=int)
+    parser.add_argument("--layers", default=4, type=int)
+    parser.add_argument("--width", default=10, type=int, help="Maximum steps per DAG layer")
+    parser.add_argument("--workers", default=2, type=int)
+    parser.add_argument("--history", default=3, type=int, help="Prior runs folded into the duration model")
+    parser.add_argument("--noise", default=0.2, type=float, help="Relative duration jitter per run")
+    parser.add_argument("--seed", default=7, type=int)
+    args = parser.parse_args(argv)
+
+    from noetl.core.scheduler import Dispatcher, StepDurationModel
+
+    rng = random.Random(args.seed)
+    totals = {"fifo": 0.0, "static": 0.0, "learned": 0.0}
+    for index in range(args.playbooks):
+        playbook, truth = _playbook(rng, index, args.layers, args.width)
+        static = Dispatcher(model=StepDurationModel(overrides={})).priorities(playbook)
+        model = StepDurationModel(overrides={})
+        for _ in range(args.history):
+            model.observe_rows(_simulate(playbook, truth, args.workers, None, rng, args.noise)[1])
+        learned = Dispatcher(model=model).priorities(playbook)
+        run_seed = rng.random()
+        for mode, priorities in (("fifo", None), ("static", static), ("learned", learned)):
+            totals[mode] += _simulate(playbook, truth, args.workers, priorities, random.Random(run_seed), args.noise)[0]
+
+    means = {mode: round(total / args.playbooks, 1) for mode, total in totals.items()}
+    print(json.dumps({
+        "playbooks": args.playbooks,
+        "workers": args.workers,
+        "mean_makespan_ms": means,
+        "reduction_vs_fifo_pct": {
+            mode: round(100.0 * (1 - means[mode] / means["fifo"]), 1) for mode in ("static", "learned")
+        },
+    }, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
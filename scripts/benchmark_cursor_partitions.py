@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+"""Benchmark keyset-partitioned cursor scans as worker slots scale.
+
+Drains a cursor source with 1..N worker slots, each slot in its own process
+(as separate worker pods would), and reports rows/sec per slot count:
+
+- ``parquet``: a generated Parquet fixture read through the ``duckdb``
+  cursor driver with ``options.partition``;
+- ``postgres`` (with ``--dsn``): a generated queue table claimed through the
+  ``postgres`` cursor driver with partition-bound claim statements.
+
+Results are printed as JSON so runs can be diffed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+_PG_TABLE = "noetl_bench_cursor_queue"
+
+_PG_CLAIM_SQL = f"""
+WITH c AS (
+    SELECT id FROM {_PG_TABLE}
+    WHERE status = 'pending'
+      AND (%(partition_lower)s::bigint IS NULL OR id > %(partition_lower)s)
+      AND (%(partition_upper)s::bigint IS NULL OR id <= %(partition_upper)s)
+    ORDER BY id
+    FOR UPDATE SKIP LOCKED
+    LIMIT 500
+)
+UPDATE {_PG_TABLE} q SET status = 'claimed'
+FROM c WHERE q.id = c.id
+RETURNING q.id, q.payload
+"""
+
+
+def _write_parquet(path: Path, rows: int) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.table({
+        "id": list(range(rows)),
+        "payload": [f"payload-{i:08d}" for i in range(rows)],
+    })
+    pq.write_table(table, path, row_group_size=max(1, rows // 64))
+
+
+def _seed_postgres(dsn: str, rows: int) -> None:
+    import psycopg
+
+    with psycopg.connect(dsn) as conn, conn.cursor() as cur:
+        cur.execute(f"DROP TABLE IF EXISTS {_PG_TABLE}")
+        cur.execute(f"CREATE TABLE {_PG_TABLE} (id bigint PRIMARY KEY, payload text, status text NOT NULL)")
+        with cur.copy(f"COPY {_PG_TABLE} (id, payload, status) FROM STDIN") as copy:
+            for i in range(rows):
+                copy.write_row((i, f"payload-{i:08d}", "pending"))
+        cur.execute(f"ANALYZE {_PG_TABLE}")
+
+
+def _postgres_credential(dsn: str) -> dict:
+    from psycopg.conninfo import conninfo_to_dict
+
+    info = conninfo_to_dict(dsn)
+    return {
+        "db_host": info.get("host", "localhost"),
+        "db_port": info.get("port", 5432),
+        "db_user": info.get("user"),
+        "db_password": info.get("password"),
+        "db_name": info.get("dbname"),
+    }
+
+
+async def _drain_slot(kind: str, auth, spec: dict, batch: int) -> int:
+    from noetl.core.cursor_drivers import get_driver
+
+    driver = get_driver(kind)
+    handle = await driver.open(auth, spec)
+    count = 0
+    try:
+        while True:
+            rows = await driver.claim_many(handle, {}, batch)
+            if not rows:
+                return count
+            count += len(rows)
+    finally:
+        await driver.close(handle)
+
+
+def _run_slot(args: tuple) -> int:
+    kind, auth, spec, batch = args
+    return asyncio.run(_drain_slot(kind, auth, spec, batch))
+
+
+def _time_slots(kind: str, auth, base_spec: dict, slots: int, batch: int) -> dict:
+    specs = [
+        (kind, auth, {**base_spec, "worker_slot_index": i, "worker_count": slots}, batch)
+        for i in range(slots)
+    ]
+    with ProcessPoolExecutor(max_workers=slots) as pool:
+        # Warm the processes (imports) before timing.
+        list(pool.map(_noop, range(slots)))
+        started = time.perf_counter()
+        counts = list(pool.map(_run_slot, specs))
+        elapsed = time.perf_counter() - started
+    total = sum(counts)
+    return {
+        "slots": slots,
+        "rows": total,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(total / elapsed, 1) if elapsed > 0 else 0.0,
+        "per_slot_rows": counts,
+    }
+
+
+def _noop(_value: int) -> None:
+    import noetl.core.cursor_drivers  # noqa: F401
+
+
+def _with_speedup(results: list[dict]) -> list[dict]:
+    base = results[0]["rows_per_sec"] or 1.0
+    for result in results:
+        result["speedup"] = round(result["rows_per_sec"] / base, 2)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark keyset-partitioned cursor scans")
+    parser.add_argument("--rows", default=2_000_000, type=int)
+    parser.add_argument("--slots", default="1,2,4,8", help="Comma-separated worker slot counts")
+    parser.add_argument("--batch", default=1000, type=int, help="Rows per claim_many call")
+    parser.add_argument("--dsn", default=None, help="Also benchmark the postgres driver against this DSN")
+    args = parser.parse_args(argv)
+
+    slot_counts = [int(value) for value in args.slots.split(",") if value.strip()]
+    report: dict = {"rows": args.rows, "batch": args.batch}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cursor_bench.parquet"
+        _write_parquet(path, args.rows)
+        spec = {
+            "claim": f"SELECT * FROM read_parquet('{path}')",
+            "options": {"partition": "id", "threads": 1},
+        }
+        report["parquet"] = _with_speedup(
+            [_time_slots("duckdb", None, spec, slots, args.batch) for slots in slot_counts]
+        )
+
+    if args.dsn:
+        credential = _postgres_credential(args.dsn)
+        results = []
+        for slots in slot_counts:
+            _seed_postgres(args.dsn, args.rows)
+            spec = {
+                "claim": _PG_CLAIM_SQL,
+                "options": {"partition": {"key": "id", "source": f"SELECT id FROM {_PG_TABLE}"}},
+            }
+            results.append(_time_slots("postgres", credential, spec, slots, args.batch))
+        report["postgres"] = _with_speedup(results)
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+"""Benchmark ``PostgresEventStore.append`` as ``noetl.event`` grows.
+
+For each size in ``--rows`` an on-disk SQLite database is seeded with that
+many events in streams of ``--stream-length``.  The table keeps the same
+shape as ``noetl.event``: clustered by ``(execution_id, event_id)``, with
+``idx_event_stream_version`` on ``(tenant_id, organization_id, stream_id,
+stream_version)``, so a lookup by ``stream_id`` alone has no usable index
+or partition key.  It then times ``--appends`` appends of ``--batch``
+records, alternating between existing and new streams:
+
+- ``before``: ``max(stream_version)`` for the stream, one id allocation and
+  one INSERT per record;
+- ``after``: one upsert of the ``event_stream_head`` row (the optimistic
+  concurrency check), ids for the whole batch in one query, one multi-row
+  INSERT.
+
+Reports append latency (mean and p95 milliseconds) per size and mode, and
+the one-time head backfill cost, as JSON.  ``after`` should stay flat.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+
+def _seed(path: str, rows: int, stream_length: int) -> sqlite3.Connection:
+    db = sqlite3.connect(path, isolation_level=None)
+    db.executescript(
+        f"""
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = OFF;
+        PRAGMA cache_size = -262144;
+        CREATE TABLE event (
+            execution_id INTEGER, event_id INTEGER, tenant_id TEXT, organization_id TEXT,
+            stream_id TEXT, stream_version INTEGER, event_type TEXT, result TEXT,
+            PRIMARY KEY (execution_id, event_id)
+        ) WITHOUT ROWID;
+        WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i + 1 < {rows})
+        INSERT INTO event
+        SELECT i / {stream_length}, i, 'default', 'default', 'execution/' || (i / {stream_length}),
+               i % {stream_length} + 1, 'command.completed', '{{"status":"COMPLETED"}}'
+        FROM n;
+        CREATE INDEX idx_event_stream_version ON event (tenant_id, organization_id, stream_id, stream_version);
+        """
+    )
+    return db
+
+
+def _ids(db: sqlite3.Connection, count: int) -> list[int]:
+    # Stand-in for noetl.snowflake_id(): one statement allocates ``count`` ids.
+    last = db.execute("UPDATE id_seq SET last = last + ? RETURNING last", (count,)).fetchone()[0]
+    return list(range(last - count + 1, last + 1))
+
+
+def _append_before(db: sqlite3.Connection, stream: int, batch: int) -> None:
+    stream_id = f"execution/{stream}"
+    db.execute("BEGIN IMMEDIATE")
+    version = db.execute("SELECT coalesce(max(stream_version), 0) FROM event WHERE stream_id = ?", (stream_id,)).fetchone()[0]
+    for _ in range(batch):
+        version += 1
+        event_id = _ids(db, 1)[0]
+        db.execute("INSERT INTO event VALUES (?, ?, 'default', 'default', ?, ?, 'bench.event', '{}')",
+                   (stream, event_id, stream_id, version))
+    db.execute("COMMIT")
+
+
+def _append_after(db: sqlite3.Connection, stream: int, batch: int) -> None:
+    stream_id = f"execution/{stream}"
+    db.execute("BEGIN IMMEDIATE")
+    last = db.execute(
+        "INSERT INTO event_stream_head AS head (stream_id, version) VALUES (?, ?) "
+        "ON CONFLICT (stream_id) DO UPDATE SET version = head.version + excluded.version RETURNING version",
+        (stream_id, batch),
+    ).fetchone()[0]
+    ids = _ids(db, batch)
+    db.execute(
+        "INSERT INTO event VALUES " + ", ".join(["(?, ?, 'default', 'default', ?, ?, 'bench.event', '{}')"] * batch),
+        [value for offset, event_id in enumerate(ids)
+         for value in (stream, event_id, stream_id, last - batch + 1 + offset)],
+    )
+    db.execute("COMMIT")
+
+
+def _time_appends(db: sqlite3.Connection, append, args, streams: int, rng: random.Random) -> dict:
+    latencies = []
+    next_new = streams
+    for index in range(args.appends):
+        if index % 2:
+            stream, next_new = next_new, next_new + 1
+        else:
+            stream = rng.randrange(streams)
+        started = time.perf_counter()
+        append(db, stream, args.batch)
+        latencies.append((time.perf_counter() - started) * 1000.0)
+    latencies.sort()
+    return {
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))], 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark event-store append latency against table size")
+    parser.add_argument("--rows", default="1000000,50000000", help="Comma-separated noetl.event sizes")
+    parser.add_argument("--stream-length", default=20, type=int, help="Events per seeded stream")
+    parser.add_argument("--appends", default=40, type=int)
+    parser.add_argument("--batch", default=8, type=int, help="Records per append")
+    parser.add_argument("--db-dir", default=tempfile.gettempdir())
+    parser.add_argument("--seed", default=7, type=int)
+    args = parser.parse_args(argv)
+
+    results = {}
+    for rows in (int(value) for value in args.rows.split(",") if value.strip()):
+        path = os.path.join(args.db_dir, f"noetl-event-bench-{rows}.sqlite")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        try:
+            started = time.perf_counter()
+            db = _seed(path, rows, args.stream_length)
+            seed_seconds = time.perf_counter() - started
+            db.execute("CREATE TABLE id_seq (last INTEGER NOT NULL)")
+            db.execute("INSERT INTO id_seq VALUES (?)", (rows,))
+            streams = -(-rows // args.stream_length)
+
+            before = _time_appends(db, _append_before, args, streams, random.Random(args.seed))
+
+            started = time.perf_counter()
+            db.executescript(
+                """
+                CREATE TABLE event_stream_head (stream_id TEXT PRIMARY KEY, version INTEGER NOT NULL);
+                INSERT INTO event_stream_head
+                SELECT stream_id, max(stream_version) FROM event WHERE stream_id IS NOT NULL GROUP BY stream_id;
+                """
+            )
+            backfill_seconds = time.perf_counter() - started
+            # Streams created by the ``before`` pass count as existing now.
+            after = _time_appends(db, _append_after, args, streams + args.appends, random.Random(args.seed))
+            db.close()
+        finally:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+        results[str(rows)] = {
+            "seed_seconds": round(seed_seconds, 1),
+            "head_backfill_seconds": round(backfill_seconds, 1),
+            "before": before,
+            "after": after,
+        }
+    print(json.dumps({"batch": args.batch, "appends": args.appends, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
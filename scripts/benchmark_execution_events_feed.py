@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""Benchmark the execution events feed on a large execution.
+
+Loads ``--events`` events for one running execution (plus ``--noise``
+events for other executions) into an in-memory SQLite table with the
+``(execution_id, event_id)`` and ``idx_event_exec_type`` indexes of
+``noetl.event`` and replays the statements
+``GET /api/executions/{id}/events`` issues per request:
+
+- ``before``: the full ``get_execution`` detail (first/terminal/latest event
+  lookups, an OFFSET page and ``COUNT(*)``), then the
+  OFFSET page and ``COUNT(*)`` again for the feed itself;
+- ``after``: the feed header lookups and one ``event_id`` keyset page of
+  ``page_size + 1`` rows; the total comes from the TTL cache.
+
+Each mode walks ``--pages`` pages spread across the whole execution and
+reports milliseconds per request at the first, middle and last page.
+Results are printed as JSON so runs can be diffed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import time
+
+
+def _load(events: int, noise: int) -> sqlite3.Connection:
+    db = sqlite3.connect(":memory:")
+    db.execute(
+        """
+        CREATE TABLE event (
+            execution_id INTEGER, event_id INTEGER, event_type TEXT, node_name TEXT,
+            status TEXT, created_at TEXT, result TEXT, meta TEXT,
+            PRIMARY KEY (execution_id, event_id)
+        )
+        """
+    )
+    payload = json.dumps({"rows": [{"id": i, "value": i * 0.5} for i in range(20)]})
+    db.executemany(
+        "INSERT INTO event VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            (1, i, "call.done" if i % 3 else "command.issued", f"step_{i % 40}", "COMPLETED",
+             "2026-03-21T08:00:00", payload, json.dumps({"command_id": str(i)}))
+            for i in range(1, events + 1)
+        ),
+    )
+    db.executemany(
+        "INSERT INTO event VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        ((2 + i % 50, i, "call.done", "step", "COMPLETED", "2026-03-21T08:00:00", "{}", "{}") for i in range(noise)),
+    )
+    db.execute("CREATE INDEX idx_event_exec_type ON event (execution_id, event_type, event_id DESC)")
+    db.execute("ANALYZE")
+    return db
+
+
+_PAGE_COLUMNS = "SELECT event_id, event_type, node_name, status, created_at, result FROM event"
+
+
+def _header(db: sqlite3.Connection) -> None:
+    db.execute("SELECT event_id, event_type FROM event WHERE execution_id = 1 ORDER BY event_id ASC LIMIT 1").fetchall()
+    db.execute(
+        # Postgres answers this from idx_event_exec_type; SQLite's planner needs the hint.
+        "SELECT event_type, status FROM event INDEXED BY idx_event_exec_type WHERE execution_id = 1 "
+        "AND event_type IN ('playbook.failed', 'playbook.completed') ORDER BY event_id DESC LIMIT 1"
+    ).fetchall()
+    db.execute("SELECT event_type, status FROM event WHERE execution_id = 1 ORDER BY event_id DESC LIMIT 1").fetchall()
+
+
+def _offset_page(db: sqlite3.Connection, page: int, page_size: int) -> list:
+    rows = db.execute(
+        f"{_PAGE_COLUMNS} WHERE execution_id = 1 ORDER BY event_id DESC LIMIT ? OFFSET ?",
+        (page_size, (page - 1) * page_size),
+    ).fetchall()
+    db.execute("SELECT COUNT(*) FROM event WHERE execution_id = 1").fetchone()
+    return rows
+
+
+def _before(db: sqlite3.Connection, page: int, page_size: int, _cursor) -> list:
+    _header(db)
+    _offset_page(db, 1, 10)
+    return _offset_page(db, page, page_size)
+
+
+def _after(db: sqlite3.Connection, _page: int, page_size: int, cursor) -> list:
+    _header(db)
+    return db.execute(
+        f"{_PAGE_COLUMNS} WHERE execution_id = 1 AND event_id < ? ORDER BY event_id DESC LIMIT ?",
+        (cursor, page_size + 1),
+    ).fetchall()[:page_size]
+
+
+def _walk(db: sqlite3.Connection, fetch, events: int, page_size: int, pages: int) -> list[dict]:
+    last_page = (events + page_size - 1) // page_size
+    samples = []
+    for index in range(pages):
+        page = 1 + (last_page - 1) * index // max(1, pages - 1)
+        cursor = events - (page - 1) * page_size + 1
+        started = time.perf_counter()
+        rows = fetch(db, page, page_size, cursor)
+        samples.append({"page": page, "ms": round((time.perf_counter() - started) * 1000, 2), "rows": len(rows)})
+    return samples
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the execution events feed")
+    parser.add_argument("--events", default=100_000, type=int, help="Events in the benchmarked execution")
+    parser.add_argument("--noise", default=200_000, type=int, help="Events for other executions")
+    parser.add_argument("--page-size", default=100, type=int)
+    parser.add_argument("--pages", default=5, type=int, help="Pages sampled across the execution")
+    args = parser.parse_args(argv)
+
+    db = _load(args.events, args.noise)
+    results = {}
+    for mode, fetch in (("before", _before), ("after", _after)):
+        samples = _walk(db, fetch, args.events, args.page_size, args.pages)
+        results[mode] = {
+            "samples": samples,
+            "mean_ms": round(sum(sample["ms"] for sample in samples) / len(samples), 2),
+        }
+    print(json.dumps({"events": args.events, "page_size": args.page_size, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
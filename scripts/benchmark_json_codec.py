@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""Benchmark CPU spent on JSON for hot server routes.
+
+Measures process CPU time per operation for the two JSON-heavy hot paths,
+comparing the stdlib path used today with :mod:`noetl.core.json_codec`:
+
+- ``claim``: a claim response carrying a large command context.  The
+  ``stdlib`` path decodes the JSONB column, validates ``ClaimResponse`` and
+  re-encodes through ``jsonable_encoder`` + ``json.dumps``; the ``fast`` path
+  embeds the ``context::text`` column as :class:`RawJson` and renders once.
+- ``events_batch``: parsing an ``/api/events/batch`` body into
+  ``BatchEventRequest`` and dumping each event payload for its JSONB column.
+
+Results are printed as JSON so runs can be diffed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+
+def _context(keys: int) -> dict:
+    return {
+        "workload": {f"key_{i}": {"value": i, "label": f"label-{i}", "tags": ["a", "b"]} for i in range(keys)},
+        "vars": {"rows": [{"id": i, "name": f"row-{i}", "score": i * 0.5} for i in range(keys)]},
+    }
+
+
+def _batch_body(events: int) -> bytes:
+    return json.dumps({
+        "execution_id": "1",
+        "events": [
+            {"step": f"step_{i}", "name": "call.done", "payload": {"result": {"rows": list(range(50))}}}
+            for i in range(events)
+        ],
+    }).encode()
+
+
+def _cpu_per_op(fn, iterations: int) -> float:
+    fn()
+    started = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - started) / iterations
+
+
+def _claim_ops(context_keys: int):
+    from fastapi.encoders import jsonable_encoder
+
+    from noetl.core import json_codec
+    from noetl.server.api.core.models import ClaimResponse
+
+    context_text = json.dumps(_context(context_keys))
+    fields = {
+        "status": "ok",
+        "event_id": 1,
+        "execution_id": 2,
+        "node_id": "step",
+        "node_name": "step",
+        "action": "python",
+        "meta": {"command_id": "3", "max_attempts": 3},
+    }
+
+    def stdlib() -> bytes:
+        response = ClaimResponse(context=json.loads(context_text), **fields)
+        return json.dumps(jsonable_encoder(response), separators=(",", ":")).encode()
+
+    def fast() -> bytes:
+        return json_codec.dumps({**fields, "context": json_codec.RawJson(context_text)})
+
+    return len(context_text), stdlib, fast
+
+
+def _batch_ops(events: int):
+    from noetl.core import json_codec
+    from noetl.server.api.core.models import BatchEventRequest
+
+    body = _batch_body(events)
+
+    def stdlib() -> None:
+        request = BatchEventRequest.model_validate(json.loads(body))
+        for item in request.events:
+            json.dumps(item.payload)
+
+    def fast() -> None:
+        request = BatchEventRequest.model_validate(json_codec.loads(body))
+        for item in request.events:
+            json_codec.dumps(item.payload)
+
+    return len(body), stdlib, fast
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON codec CPU on hot routes")
+    parser.add_argument("--iterations", default=500, type=int)
+    parser.add_argument("--context-keys", default=500, type=int, help="Entries per claim context section")
+    parser.add_argument("--batch-events", default=256, type=int, help="Events per /api/events/batch body")
+    args = parser.parse_args(argv)
+
+    from noetl.core import json_codec
+
+    results = []
+    for route, (size, stdlib, fast) in (
+        ("claim", _claim_ops(args.context_keys)),
+        ("events_batch", _batch_ops(args.batch_events)),
+    ):
+        stdlib_us = _cpu_per_op(stdlib, args.iterations) * 1e6
+        fast_us = _cpu_per_op(fast, args.iterations) * 1e6
+        results.append({
+            "route": route,
+            "body_bytes": size,
+            "stdlib_cpu_us": round(stdlib_us, 1),
+            "fast_cpu_us": round(fast_us, 1),
+            "speedup": round(stdlib_us / fast_us, 2) if fast_us else None,
+        })
+    print(json.dumps({"orjson": json_codec.HAS_ORJSON, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""Benchmark locality-preferred claims for commands reading large results.
+
+Simulates ``--commands`` consumer commands, each reading one result ref of
+``--min-mb``..``--max-mb`` written by a random producer among ``--workers``
+workers.  Workers stay busy for a random share of time, so the producer
+is sometimes unavailable.  Claim policies:
+
+- ``any``: the first free worker to see the notification claims it (today);
+- ``preferred``: the command meta carries the hint that
+  :func:`locality_hint_from_refs` derives from the ref's producer locality.
+  The producer claims as soon as it is free.  Other workers are held back by
+  :func:`locality_preference_wait` until the ``--window`` closes.
+
+A local read costs ``bytes / --local-mbps``.  A remote read (cloud or KV
+re-fetch) costs ``--remote-latency-ms`` plus ``bytes / --remote-mbps``.
+Reports bytes re-fetched remotely and the mean time to have the input in
+hand (claim delay + read), as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+
+
+def _run(args, policy: str, rng: random.Random) -> dict:
+    from noetl.core.runtime.topology import locality_hint_from_refs, locality_preference_wait
+
+    remote_bytes = 0
+    total_ms = 0.0
+    local_claims = 0
+    for index in range(args.commands):
+        size = int(rng.uniform(args.min_mb, args.max_mb) * 1024 * 1024)
+        producer = f"worker-{rng.randrange(args.workers)}"
+        ref = {"kind": "result_ref", "ref": f"noetl://execution/1/result/s/{index}",
+               "meta": {"bytes": size}, "locality": {"worker_id": producer}}
+        # Seconds until each worker is free to claim (0 = idle now).
+        free_at = {f"worker-{w}": (rng.expovariate(1.0 / args.busy_seconds) if rng.random() < args.busy_share else 0.0)
+                   for w in range(args.workers)}
+        preference = None
+        if policy == "preferred":
+            hint = locality_hint_from_refs({"input": {"_ref": ref}})
+            if hint:
+                preference = {"worker_id": hint["worker_id"], "window_seconds": args.window}
+
+        # Earliest (claim_time, worker) any worker is allowed to claim at.
+        candidates = []
+        for worker, ready in free_at.items():
+            wait = locality_preference_wait(preference, worker_id=worker, command_age_seconds=ready)
+            # Idle workers race for the queue copy; the producer also gets the
+            # direct affinity copy when a preference is set.
+            tie = 0.0 if preference and worker == producer else rng.random() + 1.0
+            candidates.append((ready + wait, tie, worker))
+        claim_at, _, claimer = min(candidates)
+
+        if claimer == producer:
+            local_claims += 1
+            read_ms = size / (args.local_mbps * 1024 * 1024) * 1000
+        else:
+            remote_bytes += size
+            read_ms = args.remote_latency_ms + size / (args.remote_mbps * 1024 * 1024) * 1000
+        total_ms += claim_at * 1000 + read_ms
+    return {
+        "local_claim_pct": round(100.0 * local_claims / args.commands, 1),
+        "remote_refetch_mb": round(remote_bytes / (1024 * 1024), 1),
+        "mean_input_ready_ms": round(total_ms / args.commands, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark locality-preferred command claims")
+    parser.add_argument("--commands", default=2000, type=int)
+    parser.add_argument("--workers", default=8, type=int)
+    parser.add_argument("--min-mb", default=2.0, type=float)
+    parser.add_argument("--max-mb", default=64.0, type=float)
+    parser.add_argument("--busy-share", default=0.3, type=float, help="Chance a worker is busy when the command is issued")
+    parser.add_argument("--busy-seconds", default=1.0, type=float, help="Mean remaining busy time")
+    parser.add_argument("--window", default=0.5, type=float, help="Locality preference window in seconds")
+    parser.add_argument("--local-mbps", default=800.0, type=float)
+    parser.add_argument("--remote-mbps", default=100.0, type=float)
+    parser.add_argument("--remote-latency-ms", default=40.0, type=float)
+    parser.add_argument("--seed", default=7, type=int)
+    args = parser.parse_args(argv)
+
+    results = {policy: _run(args, policy, random.Random(args.seed)) for policy in ("any", "preferred")}
+    print(json.dumps({"commands": args.commands, "workers": args.workers, "window_seconds": args.window,
+                      "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""Benchmark per-event logging overhead on the caller (event loop) thread.
+
+Replays the log-call mix of one ``handle_event`` / ``_execute_command``
+pass (INFO progress lines, one INFO payload preview, DEBUG lines that are
+disabled at the default level) ``--events`` times and reports caller-thread
+microseconds per event for:
+
+- ``before``: eager f-string messages, a synchronous handler, and the
+  previous sanitize-then-truncate ``_safe_message``;
+- ``after``: lazy %-style messages through :class:`QueuedLogHandler`, with
+  truncate-first sanitizing on the listener thread.
+
+``--sink-delay-ms`` makes every write sleep, simulating a blocked stdout
+pipe or log shipper.  Results are printed as JSON so runs can be diffed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+
+
+class _Sink:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.bytes = 0
+
+    def write(self, text: str) -> int:
+        if self.delay:
+            time.sleep(self.delay)
+        self.bytes += len(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def _legacy_safe_message(record: logging.LogRecord) -> str:
+    from noetl.core import logger as noetl_logger
+
+    try:
+        rendered = record.getMessage()
+    except Exception:
+        rendered = str(record.msg)
+    return noetl_logger._truncate(str(noetl_logger.sanitize_sensitive_data(rendered)))
+
+
+def _eager_event(log: logging.Logger, i: int, payload: dict) -> None:
+    log.info(f"[EVENT] Worker worker-1 received notification: exec=1, command={i}, step=step_{i % 20}")
+    log.info(f"[PERF] claim_and_fetch took {1.25:.1f}ms")
+    for j in range(12):
+        log.debug(f"[STATE] step=step_{i % 20} key={j} context={payload}")
+    log.info(f"[DEBUG-PAYLOAD] Step step_{i % 20} processed_response: {payload}")
+    log.info(f"[PERF] _execute_command for step_{i % 20} took {3.5:.1f}ms")
+    log.info(f"[EVENT] Emitted call.done for command {i}")
+
+
+def _lazy_event(log: logging.Logger, i: int, payload: dict) -> None:
+    log.info("[EVENT] Worker %s received notification: exec=%s, command=%s, step=%s", "worker-1", 1, i, f"step_{i % 20}")
+    log.info("[PERF] claim_and_fetch took %.1fms", 1.25)
+    for j in range(12):
+        log.debug("[STATE] step=%s key=%s context=%s", f"step_{i % 20}", j, payload)
+    log.info("[DEBUG-PAYLOAD] Step %s processed_response: %s", f"step_{i % 20}", payload)
+    log.info("[PERF] _execute_command for %s took %.1fms", f"step_{i % 20}", 3.5)
+    log.info("[EVENT] Emitted call.done for command %s", i)
+
+
+def _run(mode: str, events: int, payload_rows: int, delay: float) -> dict:
+    from noetl.core import logger as noetl_logger
+
+    sink = _Sink(delay)
+    target = logging.StreamHandler(sink)
+    target.setFormatter(noetl_logger.CustomFormatter(include_location=True))
+    log = logging.getLogger(f"noetl.benchmark.{mode}")
+    log.handlers.clear()
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    payload = {"rows": [{"id": n, "name": f"row-{n}", "value": n * 0.5} for n in range(payload_rows)]}
+
+    original = noetl_logger._safe_message
+    if mode == "before":
+        noetl_logger._safe_message = _legacy_safe_message
+        log.addHandler(target)
+        emit = _eager_event
+    else:
+        log.addHandler(noetl_logger.QueuedLogHandler(target))
+        emit = _lazy_event
+    try:
+        started = time.perf_counter()
+        for i in range(events):
+            emit(log, i, payload)
+        caller = time.perf_counter() - started
+        noetl_logger.flush_logs(timeout=600)
+        total = time.perf_counter() - started
+    finally:
+        noetl_logger._safe_message = original
+        log.handlers.clear()
+
+    return {
+        "mode": mode,
+        "events": events,
+        "caller_us_per_event": round(caller * 1e6 / events, 1),
+        "drained_us_per_event": round(total * 1e6 / events, 1),
+        "bytes_written": sink.bytes,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-event logging overhead")
+    parser.add_argument("--events", default=2000, type=int)
+    parser.add_argument("--payload-rows", default=200, type=int, help="Rows in the logged payload dict")
+    parser.add_argument("--sink-delay-ms", default=0.0, type=float, help="Sleep per write to the log sink")
+    args = parser.parse_args(argv)
+
+    delay = args.sink_delay_ms / 1000.0
+    results = [_run(mode, args.events, args.payload_rows, delay) for mode in ("before", "after")]
+    print(json.dumps({"results": results, "sink_delay_ms": args.sink_delay_ms}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+"""Benchmark loop result aggregation: event-log scan vs noetl.loop_iteration_result.
+
+Seeds a synthetic execution with ``--iterations`` terminal ``call.done``
+events (plus the matching materialized rows) into a local Postgres that
+already has the NoETL schema, then times:
+
+- ``event_scan``: the legacy ``noetl.event`` scan with ``result::text LIKE``
+  filters used by the aggregate fallback path;
+- ``materialized``: keyset range reads over ``noetl.loop_iteration_result``.
+
+The seeded rows are removed afterwards unless ``--keep`` is passed.  Results
+are printed as JSON so runs can be diffed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+
+import psycopg
+
+_EVENT_SCAN_SQL = """
+    SELECT result
+    FROM noetl.event
+    WHERE execution_id = %s
+      AND node_name = %s
+      AND event_type = 'call.done'
+      AND COALESCE(meta->>'loop_event_id', meta->>'__loop_epoch_id') IS NOT NULL
+      AND meta ? 'loop_iteration_index'
+      AND result IS NOT NULL
+      AND NOT (result::text LIKE '%%"skipped": true%%')
+      AND NOT (result::text LIKE '%%"reason": "control_step"%%')
+    ORDER BY (meta->>'loop_iteration_index')::int, event_id
+"""
+
+_MATERIALIZED_PAGE_SQL = """
+    SELECT iteration_index, result
+    FROM noetl.loop_iteration_result
+    WHERE execution_id = %s
+      AND loop_event_id = %s
+      AND iteration_index > %s
+      AND status = 'COMPLETED'
+    ORDER BY iteration_index
+    LIMIT %s
+"""
+
+
+def _seed(conn: psycopg.Connection, *, execution_id: int, catalog_id: int, step: str, loop_event_id: str, iterations: int) -> None:
+    base_event_id = execution_id + 1
+    with conn.cursor() as cur:
+        with cur.copy(
+            "COPY noetl.event (execution_id, catalog_id, event_id, event_type, node_id, node_name, status, result, meta) FROM STDIN"
+        ) as copy:
+            for index in range(iterations):
+                result = {
+                    "status": "COMPLETED",
+                    "reference": {"kind": "result_ref", "ref": f"noetl://execution/{execution_id}/result/{step}/{index}"},
+                    "context": {"row_count": 1},
+                }
+                meta = {"__loop_epoch_id": loop_event_id, "loop_iteration_index": index}
+                copy.write_row((
+                    execution_id, catalog_id, base_event_id + index, "call.done", step, step,
+                    "COMPLETED", json.dumps(result), json.dumps(meta),
+                ))
+        with cur.copy(
+            "COPY noetl.loop_iteration_result (execution_id, loop_event_id, iteration_index, step_name, event_id, status, result) FROM STDIN"
+        ) as copy:
+            for index in range(iterations):
+                result = {
+                    "status": "COMPLETED",
+                    "reference": {"kind": "result_ref", "ref": f"noetl://execution/{execution_id}/result/{step}/{index}"},
+                    "context": {"row_count": 1},
+                }
+                copy.write_row((
+                    execution_id, loop_event_id, index, step, base_event_id + index, "COMPLETED", json.dumps(result),
+                ))
+    conn.commit()
+    with conn.cursor() as cur:
+        cur.execute("ANALYZE noetl.loop_iteration_result")
+    conn.commit()
+
+
+def _cleanup(conn: psycopg.Connection, execution_id: int) -> None:
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM noetl.loop_iteration_result WHERE execution_id = %s", (execution_id,))
+        cur.execute("DELETE FROM noetl.event WHERE execution_id = %s", (execution_id,))
+    conn.commit()
+
+
+def _time_event_scan(conn: psycopg.Connection, execution_id: int, step: str) -> tuple[float, int]:
+    started = time.perf_counter()
+    with conn.cursor() as cur:
+        cur.execute(_EVENT_SCAN_SQL, (execution_id, step))
+        count = len(cur.fetchall())
+    return time.perf_counter() - started, count
+
+
+def _time_materialized(conn: psycopg.Connection, execution_id: int, loop_event_id: str, page_size: int) -> tuple[float, int]:
+    started = time.perf_counter()
+    count, last_index = 0, -1
+    with conn.cursor() as cur:
+        while True:
+            cur.execute(_MATERIALIZED_PAGE_SQL, (execution_id, loop_event_id, last_index, page_size))
+            rows = cur.fetchall()
+            count += len(rows)
+            if len(rows) < page_size:
+                break
+            last_index = rows[-1][0]
+    return time.perf_counter() - started, count
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "min_ms": round(ordered[0] * 1000, 3),
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark NoETL loop iteration result aggregation")
+    parser.add_argument("--dsn", required=True, help="Postgres DSN with the NoETL schema applied")
+    parser.add_argument("--catalog-id", required=True, type=int, help="Existing noetl.catalog id for the seeded events")
+    parser.add_argument("--iterations", default=100_000, type=int)
+    parser.add_argument("--repeat", default=5, type=int)
+    parser.add_argument("--page-size", default=1000, type=int)
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded rows after the run")
+    args = parser.parse_args(argv)
+
+    # Synthetic execution ids sit in the current snowflake range so they land
+    # in a live event partition; the random low bits avoid collisions.
+    execution_id = (int((time.time() - 1704067200) * 1000) << 23) | random.getrandbits(22)
+    step = "bench_loop"
+    loop_event_id = f"bench-{execution_id}"
+
+    with psycopg.connect(args.dsn) as conn:
+        seed_started = time.perf_counter()
+        _seed(conn, execution_id=execution_id, catalog_id=args.catalog_id, step=step, loop_event_id=loop_event_id, iterations=args.iterations)
+        seed_seconds = time.perf_counter() - seed_started
+        try:
+            scan_samples, materialized_samples = [], []
+            scan_count = materialized_count = 0
+            for _ in range(max(1, args.repeat)):
+                elapsed, scan_count = _time_event_scan(conn, execution_id, step)
+                scan_samples.append(elapsed)
+                elapsed, materialized_count = _time_materialized(conn, execution_id, loop_event_id, args.page_size)
+                materialized_samples.append(elapsed)
+        finally:
+            if not args.keep:
+                _cleanup(conn, execution_id)
+
+    report = {
+        "iterations": args.iterations,
+        "page_size": args.page_size,
+        "seed_seconds": round(seed_seconds, 3),
+        "event_scan": {"rows": scan_count, **_summary(scan_samples)},
+        "materialized": {"rows": materialized_count, **_summary(materialized_samples)},
+    }
+    report["speedup_p50"] = round(
+        report["event_scan"]["p50_ms"] / max(report["materialized"]["p50_ms"], 0.001), 2
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
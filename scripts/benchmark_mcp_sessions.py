@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""Benchmark MCP steps against a local stub MCP server.
+
+Starts a streamable-HTTP stand-in for an MCP server on ``--port`` in a
+background thread.  It answers ``initialize`` with a fresh
+``mcp-session-id``, and answers ``tools/list`` and ``tools/call`` for
+known sessions.  A loop of ``--steps`` MCP steps then runs through
+:func:`execute_mcp_task`, one ``tools/list`` followed by tool calls, the
+way an agent playbook iterates:
+
+- ``per_call``: the session pool is emptied and the client closed before
+  every step.  This matches the old executor, which opened a new client
+  and ran ``initialize`` for every step;
+- ``pooled``: the worker-level session pool is kept between steps.
+
+Reports milliseconds per step, and the RPCs and TCP connections per step
+seen by the stub, as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import threading
+import time
+from collections import Counter
+
+
+def _stub_app(counts: Counter, connections: set):
+    sessions = itertools.count(1)
+    live: set[str] = set()
+
+    async def app(scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                await send({"type": message["type"] + ".complete"})
+                if message["type"] == "lifespan.shutdown":
+                    return
+        if scope["type"] != "http":
+            return
+        connections.add(tuple(scope["client"] or ()))
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        headers = {key.decode().lower(): value.decode() for key, value in scope["headers"]}
+        if scope["method"] == "DELETE":
+            live.discard(headers.get("mcp-session-id", ""))
+            await send({"type": "http.response.start", "status": 204, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        request = json.loads(body)
+        counts[request["method"]] += 1
+        extra = []
+        if request["method"] == "initialize":
+            session_id = f"stub-{next(sessions)}"
+            live.add(session_id)
+            extra = [(b"mcp-session-id", session_id.encode())]
+            result = {"protocolVersion": request["params"]["protocolVersion"], "serverInfo": {"name": "stub"}}
+        elif headers.get("mcp-session-id") not in live:
+            await send({"type": "http.response.start", "status": 404, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        elif request["method"] == "tools/list":
+            result = {"tools": [{"name": f"tool_{index}", "inputSchema": {"type": "object"}} for index in range(20)]}
+        else:
+            result = {"content": [{"type": "text", "text": json.dumps(request["params"]["arguments"])}]}
+        payload = json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result}).encode()
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json")] + extra})
+        await send({"type": "http.response.body", "body": payload})
+
+    return app
+
+
+def _start_stub(port: int, counts: Counter, connections: set):
+    import uvicorn
+
+    config = uvicorn.Config(_stub_app(counts, connections), host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, thread
+
+
+async def _run_steps(args, pooled: bool) -> float:
+    from jinja2 import Environment
+
+    from noetl.tools.mcp import close_mcp_sessions, execute_mcp_task
+    from noetl.tools.mcp import executor as mcp_executor
+
+    env = Environment()
+    endpoint = f"http://127.0.0.1:{args.port}/mcp"
+    started = time.perf_counter()
+    for step in range(args.steps):
+        if not pooled:
+            mcp_executor._MCP_SESSIONS.clear()
+            client = mcp_executor._MCP_CLIENTS.pop(id(asyncio.get_running_loop()), None)
+            if client is not None:
+                await client.aclose()
+        config = {"endpoint": endpoint, "method": "tools/list"} if step == 0 else {
+            "endpoint": endpoint, "method": "tools/call", "tool": "tool_1", "arguments": {"step": step},
+        }
+        result = await execute_mcp_task(config, {}, env, {})
+        assert result["status"] == "ok", result
+    elapsed = time.perf_counter() - started
+    await close_mcp_sessions()
+    return elapsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pooled MCP sessions against a stub server")
+    parser.add_argument("--port", default=18093, type=int)
+    parser.add_argument("--steps", default=500, type=int, help="MCP steps in the loop")
+    args = parser.parse_args(argv)
+
+    counts: Counter = Counter()
+    connections: set = set()
+    server, thread = _start_stub(args.port, counts, connections)
+    results = {}
+    try:
+        for mode in ("per_call", "pooled"):
+            counts.clear()
+            connections.clear()
+            elapsed = asyncio.run(_run_steps(args, pooled=mode == "pooled"))
+            results[mode] = {
+                "ms_per_step": round(elapsed * 1000.0 / args.steps, 3),
+                "rpcs_per_step": round(sum(counts.values()) / args.steps, 3),
+                "connections_per_step": round(len(connections) / args.steps, 3),
+                "initialize_calls": counts["initialize"],
+                "tools_list_calls": counts["tools/list"],
+            }
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+    print(json.dumps({"steps": args.steps, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
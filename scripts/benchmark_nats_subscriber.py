@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+"""Benchmark ``NATSCommandSubscriber`` overhead against ``max_inflight``.
+
+Drives :meth:`NATSCommandSubscriber.subscribe` against an in-process
+stand-in for the JetStream pull subscription.  Each ``fetch`` costs
+``--fetch-rtt-ms`` and returns up to ``batch`` of the queued notifications
+(``--messages-per-permit`` per in-flight permit).  Every callback holds its permit for ``--hold`` seconds,
+long enough for several ``in_progress`` heartbeats at ``--heartbeat``
+seconds, then acks.
+
+For each ``--inflight`` value it reports:
+
+- CPU microseconds per message and messages per second;
+- fetch round trips;
+- peak asyncio tasks and peak scheduled timer handles, sampled every 10 ms.
+
+Output is JSON.  Tasks and timers should track the in-flight callbacks
+only, and CPU per message should stay flat as ``max_inflight`` grows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+
+class _Msg:
+    __slots__ = ("data", "heartbeats", "acked")
+
+    def __init__(self, index: int):
+        self.data = json.dumps({"execution_id": "1", "command_id": str(index)}).encode()
+        self.heartbeats = 0
+        self.acked = False
+
+    async def in_progress(self):
+        self.heartbeats += 1
+
+    async def ack(self):
+        self.acked = True
+
+    async def nak(self, delay=None):
+        self.acked = True
+
+    async def term(self):
+        self.acked = True
+
+
+class _Subscription:
+    def __init__(self, messages: list[_Msg], rtt_seconds: float):
+        self._messages = messages
+        self._next = 0
+        self._rtt = rtt_seconds
+        self.fetches = 0
+
+    async def fetch(self, batch, timeout, heartbeat):
+        self.fetches += 1
+        await asyncio.sleep(self._rtt)
+        if self._next >= len(self._messages):
+            await asyncio.sleep(timeout)
+            raise asyncio.TimeoutError
+        taken = self._messages[self._next:self._next + batch]
+        self._next += len(taken)
+        return taken
+
+    async def unsubscribe(self):
+        return None
+
+
+class _JetStream:
+    def __init__(self, subscription: _Subscription):
+        self._subscription = subscription
+
+    async def stream_info(self, _stream):
+        return SimpleNamespace(config=SimpleNamespace(subjects=[]))
+
+    async def update_stream(self, config):
+        return None
+
+    async def pull_subscribe(self, subject, durable):
+        return self._subscription
+
+
+async def _measure(args, max_inflight: int) -> dict:
+    from noetl.core.messaging import nats_client
+
+    subscriber = nats_client.NATSCommandSubscriber(
+        consumer_name="bench", stream_name="NOETL_COMMANDS", max_ack_pending=max_inflight, max_inflight=max_inflight,
+    )
+    subscriber.callback_progress_interval_seconds = args.heartbeat
+    subscriber._heartbeats = nats_client._HeartbeatWheel(tick_seconds=args.heartbeat / 8.0)
+
+    async def _no_consumer_changes():
+        return None
+
+    subscriber._ensure_consumer = _no_consumer_changes
+    messages = [_Msg(index) for index in range(args.messages_per_permit * max_inflight)]
+    subscription = _Subscription(messages, args.fetch_rtt_ms / 1000.0)
+    subscriber._js = _JetStream(subscription)
+    done = asyncio.Event()
+    completed = 0
+
+    async def callback(_data):
+        nonlocal completed
+        await asyncio.sleep(args.hold)
+        completed += 1
+        if completed == len(messages):
+            done.set()
+        return "ack"
+
+    loop = asyncio.get_running_loop()
+    peaks = {"tasks": 0, "timers": 0}
+
+    async def sample():
+        while True:
+            peaks["tasks"] = max(peaks["tasks"], len(asyncio.all_tasks()))
+            peaks["timers"] = max(peaks["timers"], len(loop._scheduled))
+            await asyncio.sleep(0.01)
+
+    sampler = asyncio.create_task(sample())
+    cpu, wall = time.process_time(), time.perf_counter()
+    runner = asyncio.create_task(subscriber.subscribe(callback))
+    await done.wait()
+    await subscriber._acks.close()
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    runner.cancel()
+    sampler.cancel()
+    await asyncio.gather(runner, sampler, return_exceptions=True)
+    await subscriber.close()
+    assert all(msg.acked for msg in messages)
+    return {
+        "cpu_us_per_message": round(cpu * 1e6 / len(messages), 1),
+        "messages_per_second": round(len(messages) / wall, 1),
+        "fetch_round_trips": subscription.fetches,
+        "heartbeats": sum(msg.heartbeats for msg in messages),
+        "peak_tasks": peaks["tasks"],
+        "peak_timers": peaks["timers"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark NATS command subscriber overhead")
+    parser.add_argument("--inflight", default="16,128,512", help="Comma-separated max_inflight values")
+    parser.add_argument("--messages-per-permit", default=4, type=int)
+    parser.add_argument("--hold", default=0.5, type=float, help="Seconds each callback runs")
+    parser.add_argument("--heartbeat", default=0.1, type=float, help="in_progress interval in seconds")
+    parser.add_argument("--fetch-rtt-ms", default=1.0, type=float)
+    args = parser.parse_args(argv)
+
+    import noetl.core.messaging.nats_client  # noqa: F401  (keep import time out of the first run)
+
+    results = {}
+    for max_inflight in (int(value) for value in args.inflight.split(",") if value.strip()):
+        results[str(max_inflight)] = asyncio.run(_measure(args, max_inflight))
+    print(json.dumps({"hold": args.hold, "heartbeat": args.heartbeat, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
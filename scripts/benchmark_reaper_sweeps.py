@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+"""Benchmark the command reaper and auto-resume sweeps as history grows.
+
+For each size in ``--executions`` an in-memory SQLite database is seeded
+with that many concluded executions of ``--commands-per-execution``
+commands (one ``command.completed`` event per command, start/end events per
+execution).  A fixed live population rides on top: ``--live`` running
+parent executions with one stale-lease and one stranded PENDING command
+each.  Concluded history also leaks ``--leftover-rate`` CLAIMED/RUNNING
+rows (workers that died after the playbook moved on), so leftovers grow
+with history the way they do in production.
+
+Each sweep runs ``--cycles`` times per mode:
+
+- ``before``: the correlated ``NOT EXISTS`` scans over ``command`` and the
+  ``playbook.initialized``-driven auto-resume query, on the old indexes;
+- ``after``: due rows off the ``idx_command_active_lease`` /
+  ``idx_command_pending_created`` partial indexes, one terminal check per
+  distinct execution against the ``execution`` projection, retirement of
+  leftovers with one ``command.cancelled`` event each, and auto-resume off
+  ``idx_execution_live_parent``.
+
+Reports milliseconds per cycle (first cycle and steady state) and rows
+returned, as JSON.  Steady-state ``after`` should stay flat across sizes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sqlite3
+import time
+
+_NOW = 2_000_000_000.0
+_TERMINAL_EVENTS = "('playbook.completed', 'workflow.completed', 'playbook.failed', 'workflow.failed', 'execution.cancelled')"
+_STALE_SECONDS = 60
+_HARD_TIMEOUT_SECONDS = 1800
+_PENDING_RETRY_SECONDS = 60
+_LOOKBACK_SECONDS = 15 * 60
+_MAX_PER_RUN = 100
+_SCAN_FACTOR = 10
+
+
+def _load(executions: int, per_execution: int, live: int, leftover_rate: float, days: float, seed: int) -> sqlite3.Connection:
+    rng = random.Random(seed)
+    db = sqlite3.connect(":memory:")
+    db.executescript(
+        """
+        CREATE TABLE command (
+            execution_id INTEGER, command_id INTEGER, event_id INTEGER, catalog_id INTEGER,
+            step_name TEXT, tool_kind TEXT, status TEXT, worker_id TEXT,
+            claimed_at REAL, created_at REAL,
+            PRIMARY KEY (execution_id, command_id)
+        );
+        CREATE TABLE event (
+            execution_id INTEGER, event_id INTEGER, event_type TEXT, parent_execution_id INTEGER,
+            catalog_id INTEGER, result TEXT, created_at REAL,
+            PRIMARY KEY (execution_id, event_id)
+        );
+        CREATE TABLE execution (
+            execution_id INTEGER PRIMARY KEY, catalog_id INTEGER, parent_execution_id INTEGER,
+            status TEXT, created_at REAL
+        );
+        CREATE TABLE runtime (name TEXT PRIMARY KEY, status TEXT, heartbeat REAL);
+        CREATE TABLE catalog (catalog_id INTEGER PRIMARY KEY, path TEXT);
+        INSERT INTO catalog VALUES (1, 'bench/playbook');
+        INSERT INTO runtime VALUES ('worker-live', 'ready', 2000000000.0), ('worker-dead', 'offline', 1999990000.0);
+        """
+    )
+    span = days * 86400
+    ids = iter(range(1, 1 << 62))
+    # Concluded executions spread over the history span; live ones started
+    # within the last ten minutes.
+    starts = [0.0] + [_NOW - (rng.random() * span if execution_id <= executions else rng.random() * 600)
+                      for execution_id in range(1, executions + live + 1)]
+
+    def commands():
+        for execution_id in range(1, executions + live + 1):
+            concluded = execution_id <= executions
+            started = starts[execution_id]
+            for index in range(per_execution):
+                command_id = next(ids)
+                status, worker, claimed = "COMPLETED", "worker-live", started + index
+                if concluded and rng.random() < leftover_rate:
+                    status, worker = rng.choice(("CLAIMED", "RUNNING")), "worker-dead"
+                elif not concluded and index == 0:
+                    status, worker = "RUNNING", "worker-dead"
+                elif not concluded and index == 1:
+                    status, worker, claimed = "PENDING", None, None
+                yield (execution_id, command_id, command_id, 1, f"step_{index}", "python", status, worker,
+                       claimed, started + index - (_PENDING_RETRY_SECONDS * 2 if status == "PENDING" else 0))
+
+    def events():
+        for execution_id in range(1, executions + live + 1):
+            concluded = execution_id <= executions
+            started = starts[execution_id]
+            yield (execution_id, next(ids), "playbook.initialized", None, 1, '{"workload": {}}', started)
+            for index in range(per_execution):
+                yield (execution_id, next(ids), "command.completed", None, 1, None, started + index)
+            if concluded:
+                yield (execution_id, next(ids), "playbook.completed", None, 1, None, started + per_execution)
+
+    db.executemany("INSERT INTO command VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", commands())
+    db.executemany("INSERT INTO event VALUES (?, ?, ?, ?, ?, ?, ?)", events())
+    db.execute(
+        "INSERT INTO execution SELECT execution_id, 1, NULL, "
+        f"CASE WHEN execution_id <= {executions} THEN 'COMPLETED' ELSE 'RUNNING' END, created_at "
+        "FROM event WHERE event_type = 'playbook.initialized'"
+    )
+    db.executescript(
+        """
+        CREATE INDEX idx_event_type ON event (event_type);
+        CREATE INDEX idx_event_created_at ON event (created_at);
+        CREATE INDEX idx_event_exec_type ON event (execution_id, event_type, event_id DESC);
+        CREATE INDEX idx_command_status ON command (status) WHERE status IN ('PENDING', 'CLAIMED');
+        CREATE INDEX idx_command_execution_status ON command (execution_id, status)
+            WHERE status IN ('PENDING', 'CLAIMED', 'RUNNING');
+        CREATE INDEX idx_execution_status ON execution (status);
+        ANALYZE;
+        """
+    )
+    return db
+
+
+def _add_new_indexes(db: sqlite3.Connection) -> None:
+    db.executescript(
+        """
+        CREATE INDEX idx_command_active_lease ON command (claimed_at) WHERE status IN ('CLAIMED', 'RUNNING');
+        CREATE INDEX idx_command_pending_created ON command (created_at) WHERE status = 'PENDING';
+        CREATE INDEX idx_execution_live_parent ON execution (created_at DESC)
+            WHERE parent_execution_id IS NULL AND status NOT IN ('COMPLETED', 'CANCELLED');
+        ANALYZE;
+        """
+    )
+
+
+def _before(db: sqlite3.Connection) -> int:
+    terminal = f"NOT EXISTS (SELECT 1 FROM event et WHERE et.execution_id = c.execution_id AND et.event_type IN {_TERMINAL_EVENTS})"
+    active = db.execute(
+        f"""
+        SELECT c.event_id, c.execution_id, c.command_id, c.step_name, c.tool_kind, cat.path
+        FROM command c
+        LEFT JOIN runtime r ON r.name = c.worker_id
+        LEFT JOIN catalog cat ON cat.catalog_id = c.catalog_id
+        WHERE c.status IN ('CLAIMED', 'RUNNING') AND c.worker_id IS NOT NULL AND c.claimed_at IS NOT NULL
+          AND (r.name IS NULL OR r.status IS NOT 'ready' OR r.heartbeat < ? OR c.claimed_at < ?)
+          AND {terminal}
+        ORDER BY c.claimed_at LIMIT ?
+        """,
+        (_NOW - _STALE_SECONDS, _NOW - _HARD_TIMEOUT_SECONDS, _MAX_PER_RUN),
+    ).fetchall()
+    pending = db.execute(
+        f"""
+        SELECT c.event_id, c.execution_id, c.command_id, c.step_name, c.tool_kind, cat.path
+        FROM command c LEFT JOIN catalog cat ON cat.catalog_id = c.catalog_id
+        WHERE c.status = 'PENDING' AND c.created_at < ? AND {terminal}
+        ORDER BY c.created_at LIMIT ?
+        """,
+        (_NOW - _PENDING_RETRY_SECONDS, _MAX_PER_RUN),
+    ).fetchall()
+    resume = db.execute(
+        f"""
+        SELECT e.execution_id, e.result, e.created_at,
+               (SELECT ev.event_type FROM event ev WHERE ev.execution_id = e.execution_id ORDER BY ev.event_id DESC LIMIT 1)
+        FROM event e
+        WHERE e.event_type = 'playbook.initialized' AND e.parent_execution_id IS NULL AND e.created_at > ?
+          AND NOT EXISTS (SELECT 1 FROM event t WHERE t.execution_id = e.execution_id AND t.event_type IN {_TERMINAL_EVENTS})
+        ORDER BY e.created_at DESC LIMIT ?
+        """,
+        (_NOW - _LOOKBACK_SECONDS, _MAX_PER_RUN * 10),
+    ).fetchall()
+    return len(active) + len(pending) + len(resume)
+
+
+def _sweep_after(db: sqlite3.Connection, due_sql: str, params: tuple, order: str) -> list:
+    # SQLite has no data-modifying CTEs: the same steps as the Postgres
+    # statement, run inside one transaction.
+    db.execute("DROP TABLE IF EXISTS temp.due")
+    db.execute(f"CREATE TEMP TABLE due AS {due_sql}", params)
+    concluded = [
+        row[0] for row in db.execute(
+            f"""
+            SELECT d.execution_id FROM (SELECT DISTINCT execution_id FROM temp.due) d
+            LEFT JOIN execution x ON x.execution_id = d.execution_id
+            WHERE x.status IN ('COMPLETED', 'CANCELLED')
+               OR EXISTS (SELECT 1 FROM event et WHERE et.execution_id = d.execution_id AND et.event_type IN {_TERMINAL_EVENTS})
+            """
+        )
+    ]
+    db.execute("CREATE TEMP TABLE IF NOT EXISTS concluded (execution_id INTEGER PRIMARY KEY)")
+    db.execute("DELETE FROM temp.concluded")
+    db.executemany("INSERT INTO temp.concluded VALUES (?)", ((eid,) for eid in concluded))
+    retired = "(SELECT d.execution_id, d.command_id FROM temp.due d JOIN temp.concluded t ON t.execution_id = d.execution_id)"
+    db.execute(
+        "INSERT INTO event SELECT d.execution_id, d.command_id + (1 << 61), 'command.cancelled', NULL, d.catalog_id, NULL, ? "
+        f"FROM command d WHERE (d.execution_id, d.command_id) IN {retired} AND d.status IN ('PENDING', 'CLAIMED', 'RUNNING')",
+        (_NOW,),
+    )
+    db.execute(f"UPDATE command SET status = 'CANCELLED' WHERE (execution_id, command_id) IN {retired}")
+    rows = db.execute(
+        f"""
+        SELECT d.event_id, d.execution_id, d.command_id, d.step_name, d.tool_kind, cat.path
+        FROM temp.due d LEFT JOIN catalog cat ON cat.catalog_id = d.catalog_id
+        WHERE d.execution_id NOT IN (SELECT execution_id FROM temp.concluded)
+        ORDER BY d.{order} LIMIT ?
+        """,
+        (_MAX_PER_RUN,),
+    ).fetchall()
+    db.commit()
+    return rows
+
+
+def _after(db: sqlite3.Connection) -> int:
+    columns = "c.event_id, c.execution_id, c.command_id, c.step_name, c.tool_kind, c.catalog_id, c.claimed_at, c.created_at"
+    active = _sweep_after(
+        db,
+        f"""
+        SELECT {columns} FROM command c INDEXED BY idx_command_active_lease
+        LEFT JOIN runtime r ON r.name = c.worker_id
+        WHERE c.status IN ('CLAIMED', 'RUNNING') AND c.worker_id IS NOT NULL AND c.claimed_at IS NOT NULL
+          AND (r.name IS NULL OR r.status IS NOT 'ready' OR r.heartbeat < ? OR c.claimed_at < ?)
+        ORDER BY c.claimed_at LIMIT ?
+        """,
+        (_NOW - _STALE_SECONDS, _NOW - _HARD_TIMEOUT_SECONDS, _MAX_PER_RUN * _SCAN_FACTOR),
+        "claimed_at",
+    )
+    pending = _sweep_after(
+        db,
+        f"""
+        SELECT {columns} FROM command c INDEXED BY idx_command_pending_created
+        WHERE c.status = 'PENDING' AND c.created_at < ?
+        ORDER BY c.created_at LIMIT ?
+        """,
+        (_NOW - _PENDING_RETRY_SECONDS, _MAX_PER_RUN * _SCAN_FACTOR),
+        "created_at",
+    )
+    resume = db.execute(
+        f"""
+        SELECT x.execution_id,
+               (SELECT ev.result FROM event ev WHERE ev.execution_id = x.execution_id
+                  AND ev.event_type = 'playbook.initialized' ORDER BY ev.event_id DESC LIMIT 1),
+               x.created_at,
+               (SELECT ev.event_type FROM event ev WHERE ev.execution_id = x.execution_id ORDER BY ev.event_id DESC LIMIT 1)
+        FROM execution x INDEXED BY idx_execution_live_parent
+        WHERE x.parent_execution_id IS NULL AND x.status NOT IN ('COMPLETED', 'CANCELLED')
+          AND x.created_at > ?
+          AND NOT EXISTS (SELECT 1 FROM event t WHERE t.execution_id = x.execution_id AND t.event_type IN {_TERMINAL_EVENTS})
+        ORDER BY x.created_at DESC LIMIT ?
+        """,
+        (_NOW - _LOOKBACK_SECONDS, _MAX_PER_RUN * 10),
+    ).fetchall()
+    return len(active) + len(pending) + len(resume)
+
+
+def _cycles(db: sqlite3.Connection, sweep, cycles: int) -> dict:
+    timings, returned = [], 0
+    for _ in range(cycles):
+        started = time.perf_counter()
+        returned = sweep(db)
+        timings.append((time.perf_counter() - started) * 1000)
+    steady = timings[1:] or timings
+    return {
+        "first_cycle_ms": round(timings[0], 2),
+        "steady_cycle_ms": round(sum(steady) / len(steady), 2),
+        "rows_returned": returned,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark command reaper and auto-resume sweeps")
+    parser.add_argument("--executions", default="20000,200000", help="Comma-separated concluded execution counts")
+    parser.add_argument("--commands-per-execution", default=8, type=int)
+    parser.add_argument("--live", default=50, type=int, help="Running parent executions")
+    parser.add_argument("--leftover-rate", default=0.001, type=float, help="Share of concluded commands left non-terminal")
+    parser.add_argument("--days", default=30.0, type=float, help="History span")
+    parser.add_argument("--cycles", default=5, type=int)
+    parser.add_argument("--seed", default=7, type=int)
+    args = parser.parse_args(argv)
+
+    results = []
+    for executions in (int(value) for value in args.executions.split(",") if value.strip()):
+        db = _load(executions, args.commands_per_execution, args.live, args.leftover_rate, args.days, args.seed)
+        commands = db.execute("SELECT COUNT(*) FROM command").fetchone()[0]
+        events = db.execute("SELECT COUNT(*) FROM event").fetchone()[0]
+        before = _cycles(db, _before, args.cycles)
+        _add_new_indexes(db)
+        after = _cycles(db, _after, args.cycles)
+        results.append({"executions": executions, "commands": commands, "events": events,
+                        "before": before, "after": after})
+        db.close()
+    print(json.dumps({"live_executions": args.live, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""Benchmark response and log redaction on large payloads.
+
+Redacts an event-page-shaped payload (``--rows`` rows of mixed string,
+numeric and nested leaves) with ``--secrets`` caller-supplied keychain
+values and reports CPU per call and per leaf for:
+
+- ``legacy``: the previous per-leaf loop (every secret value, then
+  ``redact_url_credentials``, then each ``SECRET_VALUE_PATTERNS`` regex);
+- ``redact_keychain_values``: the compiled single-pass redactor;
+- ``sanitize_sensitive_data``: the logger sanitizer.
+
+Results are printed as JSON so runs can be diffed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+
+def _page(rows: int) -> dict:
+    return {
+        "events": [
+            {
+                "event_id": 10_000 + i,
+                "node_name": f"step_{i % 40}",
+                "status": "COMPLETED",
+                "message": f"fetched page {i} from https://api.example.invalid/v1/items?page={i}",
+                "result": {"rows": [{"id": j, "name": f"row-{j}", "score": j * 0.5} for j in range(5)]},
+                "db_credential": "pg_auth",
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def _legacy_redactor():
+    from noetl.core import sanitize
+
+    def _is_secret(value: str, secret_values: set) -> bool:
+        if not value:
+            return False
+        if value in secret_values:
+            return True
+        for secret in secret_values:
+            if len(secret) >= 8 and secret in value:
+                return True
+        if sanitize._looks_like_template_or_code(value):
+            return False
+        if sanitize.redact_url_credentials(value) != value:
+            return True
+        return any(pattern.search(value) for pattern in sanitize.SECRET_VALUE_PATTERNS)
+
+    def _walk(data, secret_values):
+        if isinstance(data, dict):
+            return {key: _walk(value, secret_values) for key, value in data.items()}
+        if isinstance(data, list):
+            return [_walk(item, secret_values) for item in data]
+        if isinstance(data, str) and _is_secret(data, secret_values):
+            return sanitize.REDACTED
+        return data
+
+    return _walk
+
+
+def _leaves(data) -> int:
+    if isinstance(data, dict):
+        return sum(_leaves(value) for value in data.values())
+    if isinstance(data, list):
+        return sum(_leaves(item) for item in data)
+    return 1
+
+
+def _cpu(fn, iterations: int) -> float:
+    fn()
+    started = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - started) / iterations
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark response/log redaction")
+    parser.add_argument("--rows", default=1000, type=int)
+    parser.add_argument("--secrets", default="1,100,1000", help="Comma-separated secret_values set sizes")
+    parser.add_argument("--iterations", default=5, type=int)
+    args = parser.parse_args(argv)
+
+    from noetl.core.sanitize import redact_keychain_values, sanitize_sensitive_data
+
+    page = _page(args.rows)
+    leaves = _leaves(page)
+    legacy = _legacy_redactor()
+    results = []
+    for count in [int(value) for value in args.secrets.split(",") if value.strip()]:
+        secrets = {f"kc-secret-value-{i:06d}" for i in range(count)}
+        timings = {
+            "legacy": _cpu(lambda: legacy(page, secrets), args.iterations),
+            "redact_keychain_values": _cpu(
+                lambda: redact_keychain_values(page, secret_values=secrets), args.iterations
+            ),
+        }
+        for name, seconds in timings.items():
+            results.append({
+                "impl": name,
+                "secrets": count,
+                "ms_per_call": round(seconds * 1000, 2),
+                "us_per_leaf": round(seconds * 1e6 / leaves, 3),
+            })
+    seconds = _cpu(lambda: sanitize_sensitive_data(page, max_depth=50), args.iterations)
+    results.append({
+        "impl": "sanitize_sensitive_data",
+        "secrets": 0,
+        "ms_per_call": round(seconds * 1000, 2),
+        "us_per_leaf": round(seconds * 1e6 / leaves, 3),
+    })
+    print(json.dumps({"leaves": leaves, "rows": args.rows, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""Benchmark engine render-context construction against execution state size.
+
+Builds an ``ExecutionState`` holding ``--sizes`` variables and as many step
+results.  For each size it times three patterns, in microseconds per
+operation:
+
+- ``context``: ``get_render_context`` for a new event, no state change;
+- ``render``: ``get_render_context`` then one Jinja template through
+  ``RenderingMixin._render_template``, the way transitions are evaluated;
+- ``loop_iteration``: set the loop iterator variable, then build and
+  render, the way loop commands are created.
+
+``legacy`` is the previous implementation (a fresh dict per call, with a
+keychain-stripped deep copy of all variables, and a copy of the whole context
+per template), reproduced here.  ``layered`` is the current one.  Layered
+timings should stay roughly flat as the state grows; ``loop_iteration``
+does only because each context is released before the next write (a
+context kept alive makes the next write copy the cached layers).  Output
+is JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+
+def _legacy_render_context(state, event) -> dict:
+    from noetl.core.credential_refs import KEYCHAIN_MANIFEST_KEY, keychain_names_from_manifest, strip_keychain_namespaces
+    from noetl.core.dsl.engine.executor.common import _build_output_view, _unwrap_event_payload
+
+    event_payload = _unwrap_event_payload(event.payload)
+    protected_fields = {"execution_id", "catalog_id", "job"}
+    keychain_manifest = state.variables.get(KEYCHAIN_MANIFEST_KEY)
+    context_vars = strip_keychain_namespaces(state.variables, keychain_manifest)
+    context = {
+        "event": {"name": event.name, "payload": event_payload, "step": event.step, "timestamp": None},
+        "ctx": context_vars,
+        "iter": {},
+        "workload": context_vars,
+    }
+    for step_name, step_result in state.step_results.items():
+        if step_name not in context and step_name not in protected_fields:
+            context[step_name] = step_result
+    keychain_names = keychain_names_from_manifest(keychain_manifest)
+    for k, v in state.variables.items():
+        if k == "keychain" or k in keychain_names:
+            continue
+        if k not in context and k not in protected_fields:
+            context[k] = v
+    context["execution_id"] = str(state.execution_id)
+    context["catalog_id"] = str(state.catalog_id)
+    context["job"] = {"uuid": str(state.execution_id), "execution_id": str(state.execution_id), "id": str(state.execution_id)}
+    if isinstance(event_payload, dict):
+        output_view = _build_output_view(event_payload=event_payload, step_result=state.step_results.get(event.step))
+        context["output"] = output_view
+        if output_view.get("error") is not None:
+            context["error"] = output_view.get("error")
+    return context
+
+
+def _legacy_render(template, context):
+    from noetl.core.dsl.render import TaskResultProxy
+
+    reserved = {"ctx", "iter", "loop", "event", "workload", "output", "job"}
+    render_context = context.copy()
+    for key, value in context.items():
+        if key in reserved:
+            continue
+        if isinstance(value, dict):
+            render_context[key] = TaskResultProxy(value, name=key)
+        elif isinstance(value, list):
+            render_context[key] = {"result": value}
+    return template.render(**render_context)
+
+
+def _make_state(size: int):
+    from noetl.core.dsl.engine.executor.state import ExecutionState
+    from noetl.core.dsl.engine.models import Playbook
+
+    playbook = Playbook.model_validate({
+        "apiVersion": "noetl.io/v10",
+        "kind": "Playbook",
+        "metadata": {"name": "bench"},
+        "workflow": [{"step": "start", "tool": {"kind": "python", "code": "result = {}"}}],
+    })
+    state = ExecutionState("1", playbook, {}, catalog_id=2)
+    for index in range(size):
+        state.variables[f"var_{index}"] = {"value": index, "tags": ["a", "b"], "nested": {"flag": True}}
+        state.step_results[f"step_{index}"] = {"status": "success", "context": {"row_count": index}}
+    state.variables["region"] = "us-central1"
+    return state
+
+
+def _time(operation, iterations: int) -> float:
+    operation()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return round((time.perf_counter() - started) * 1e6 / iterations, 2)
+
+
+def _measure(size: int, iterations: int) -> dict:
+    from jinja2 import Environment, StrictUndefined
+
+    from noetl.core.dsl.engine.executor.common import TemplateCache
+    from noetl.core.dsl.engine.executor.rendering import RenderingMixin
+    from noetl.core.dsl.engine.models import Event
+
+    class _Renderer(RenderingMixin):
+        def __init__(self):
+            self.jinja_env = Environment(undefined=StrictUndefined)
+            self._template_cache = TemplateCache()
+
+    renderer = _Renderer()
+    source = "{{ ctx.region }}/{{ step_0.status }}/{{ item }}"
+    template = renderer._template_cache.get_or_compile(renderer.jinja_env, source)
+    event = Event(execution_id="1", step="start", name="call.done", payload={})
+    results = {}
+    for mode in ("legacy", "layered"):
+        state = _make_state(size)
+        counter = iter(range(10**9))
+        if mode == "legacy":
+            def build():
+                return _legacy_render_context(state, event)
+
+            def render():
+                return _legacy_render(template, build())
+        else:
+            def build():
+                return state.get_render_context(event)
+
+            def render():
+                return renderer._render_template(source, build())
+
+        state.variables["item"] = 0
+
+        def loop_iteration():
+            state.variables["item"] = next(counter)
+            return render()
+
+        results[mode] = {
+            "context_us": _time(build, iterations),
+            "render_us": _time(render, iterations),
+            "loop_iteration_us": _time(loop_iteration, iterations),
+        }
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark engine render-context construction")
+    parser.add_argument("--sizes", default="10,100,1000,5000", help="Comma-separated variable/step counts")
+    parser.add_argument("--iterations", default=200, type=int)
+    args = parser.parse_args(argv)
+
+    import noetl.core.dsl.engine.executor  # noqa: F401  (keep import time out of the first run)
+
+    results = {}
+    for size in (int(value) for value in args.sizes.split(",") if value.strip()):
+        results[str(size)] = _measure(size, args.iterations)
+    print(json.dumps({"iterations": args.iterations, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""Benchmark server request middleware overhead on hot routes.
+
+Drives an in-process FastAPI app (httpx ASGI transport, no sockets) with
+claim-shaped and ``/api/events/batch``-shaped requests under three
+middleware stacks and reports requests/sec plus p50/p99 latency:
+
+- ``legacy``: the previous pair of ``@app.middleware("http")`` functions
+  (body read up front + ``asyncio.wait_for`` + a separate counter);
+- ``asgi``: :class:`noetl.server.middleware.RequestMiddleware`;
+- ``none``: no middleware, as a floor.
+
+Results are printed as JSON so runs can be diffed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from fastapi import FastAPI, Request
+
+
+def _legacy_stack(app) -> None:
+    counters = {"requests": 0}
+
+    @app.middleware("http")
+    async def _catch_exceptions(request, call_next):
+        body = await request.body()
+
+        async def receive():
+            return {"type": "http.request", "body": body}
+
+        request._receive = receive
+        return await asyncio.wait_for(call_next(request), timeout=1799.0)
+
+    @app.middleware("http")
+    async def _count_requests(request, call_next):
+        counters["requests"] += 1
+        return await call_next(request)
+
+
+def _build_app(stack: str):
+    from noetl.server.middleware import RequestMiddleware
+
+    app = FastAPI()
+
+    @app.post("/api/commands/{command_id}/claim")
+    async def claim(command_id: int, request: Request):
+        payload = await request.json()
+        return {"status": "ok", "command_id": command_id, "worker_id": payload.get("worker_id")}
+
+    @app.post("/api/events/batch", status_code=202)
+    async def events_batch(request: Request):
+        payload = await request.json()
+        return {"status": "accepted", "count": len(payload.get("events") or [])}
+
+    if stack == "legacy":
+        _legacy_stack(app)
+    elif stack == "asgi":
+        counters = {"requests": 0}
+
+        def _count(_path: str) -> None:
+            counters["requests"] += 1
+
+        app.add_middleware(RequestMiddleware, on_request=_count)
+    return app
+
+
+def _batch_body(events: int) -> bytes:
+    return json.dumps({
+        "execution_id": "1",
+        "events": [
+            {"step": f"step_{i}", "name": "call.done", "payload": {"result": {"rows": list(range(50))}}}
+            for i in range(events)
+        ],
+    }).encode()
+
+
+async def _run(stack: str, route: str, requests: int, concurrency: int, batch_events: int) -> dict:
+    import httpx
+
+    app = _build_app(stack)
+    if route == "claim":
+        url, body = "/api/commands/42/claim", json.dumps({"worker_id": "worker-1"}).encode()
+    else:
+        url, body = "/api/events/batch", _batch_body(batch_events)
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        headers = {"content-type": "application/json"}
+        for _ in range(min(50, requests)):
+            await client.post(url, content=body, headers=headers)
+
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for i in range(requests):
+            queue.put_nowait(i)
+
+        async def _worker() -> None:
+            while True:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                started = time.perf_counter()
+                response = await client.post(url, content=body, headers=headers)
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "stack": stack,
+        "route": route,
+        "requests": requests,
+        "body_bytes": len(body),
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark request middleware overhead")
+    parser.add_argument("--requests", default=5000, type=int)
+    parser.add_argument("--concurrency", default=32, type=int)
+    parser.add_argument("--batch-events", default=500, type=int, help="Events per /api/events/batch body")
+    parser.add_argument("--stacks", default="legacy,asgi,none")
+    args = parser.parse_args(argv)
+
+    results = []
+    for route in ("claim", "events_batch"):
+        for stack in [s.strip() for s in args.stacks.split(",") if s.strip()]:
+            results.append(
+                asyncio.run(_run(stack, route, args.requests, args.concurrency, args.batch_events))
+            )
+    print(json.dumps({"results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Benchmark ``ResultHandler.process_result`` on large tool results.
+
+Builds two result shapes of about ``--mb`` megabytes each:
+
+- ``postgres``: ``{"status", "row_count", "columns", "rows": [...]}`` with
+  ``--columns`` text/number columns per row;
+- ``http``: ``{"status", "headers", "data": {"items": [...], "next"}}``
+  with nested items and an Authorization header to scrub.
+
+Each is externalized into a memory-tier ``TempStore`` with an
+``output_select`` and the result is timed.  Reports process CPU seconds,
+wall seconds and time the event loop was blocked (the longest gap between
+ticks of a 1 ms heartbeat task).  Peak traced memory comes from a separate
+``tracemalloc`` run, because tracing slows execution.  Output is JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+
+def _postgres_result(mb: float, columns: int) -> dict:
+    row = {f"col_{index}": ("value-" * 4 if index % 2 else index * 1000) for index in range(columns)}
+    row_bytes = len(json.dumps(row))
+    count = max(1, int(mb * 1024 * 1024 / row_bytes))
+    rows = [{**row, "id": index} for index in range(count)]
+    return {"status": "success", "row_count": count, "columns": list(row), "rows": rows}
+
+
+def _http_result(mb: float) -> dict:
+    item = {"id": 0, "name": "offer", "price": {"amount": "199.00", "currency": "EUR"},
+            "segments": [{"from": "LHR", "to": "JFK", "carrier": "BA"}] * 3, "notes": "n" * 64}
+    item_bytes = len(json.dumps(item))
+    count = max(1, int(mb * 1024 * 1024 / item_bytes))
+    return {
+        "status": "success",
+        "headers": {"Authorization": "Bearer placeholder-token", "Content-Type": "application/json"},
+        "data": {"items": [{**item, "id": index} for index in range(count)], "next": None},
+    }
+
+
+async def _process(shape: str, result: dict) -> dict:
+    from noetl.core.storage import TempStore
+    from noetl.worker.result_handler import ResultHandler
+
+    handler = ResultHandler(execution_id="1", store=TempStore(), inline_max_bytes=65536)
+    output_config = {"store": {"kind": "memory"}, "output_select": ["status", "row_count", "data.next"]}
+
+    gaps = []
+
+    async def heartbeat():
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    ticker = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.01)
+    cpu, wall = time.process_time(), time.perf_counter()
+    processed = await handler.process_result(shape, result, output_config)
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    ticker.cancel()
+    assert "_ref" in processed, processed
+    return {
+        "cpu_seconds": round(cpu, 3),
+        "wall_seconds": round(wall, 3),
+        "loop_blocked_ms": round(max(gaps) * 1000.0, 1),
+        "size_bytes": processed["_size_bytes"],
+    }
+
+
+def _peak_mb(shape: str, result: dict) -> float:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    asyncio.run(_process(shape, result))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return round((peak - baseline) / (1024 * 1024), 1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark large-result processing in the worker")
+    parser.add_argument("--mb", default=50.0, type=float, help="Approximate result size")
+    parser.add_argument("--columns", default=12, type=int)
+    parser.add_argument("--repeat", default=3, type=int, help="Timed runs per shape (best is kept)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for shape, build in (("postgres", lambda: _postgres_result(args.mb, args.columns)),
+                         ("http", lambda: _http_result(args.mb))):
+        result = build()
+        runs = [asyncio.run(_process(shape, result)) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run["cpu_seconds"])
+        results[shape] = {**best, "peak_traced_mb": _peak_mb(shape, result)}
+    print(json.dumps({"mb": args.mb, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+"""Local load test for the execution-sharded server mode.
+
+Starts :func:`noetl.server.sharding.run_sharded_server` on ``--port`` with
+a stand-in app and drives it with ``--clients`` load-generator processes.
+The stand-in models the per-execution work of ``/api/events/batch``: it
+parses the body and takes the execution's acceptor lock.  It then reads the
+execution state from a process-local cache.  A miss burns
+``--miss-cpu-ms`` of CPU (state load, playbook parse); a hit burns
+``--hit-cpu-ms``.
+
+Modes, each with ``--shards`` processes:
+
+- ``random``: requests carry no routing header, so whichever process the
+  kernel hands the connection to serves it (plain multi-worker uvicorn);
+- ``sharded``: requests carry ``X-NoETL-Execution-Id``, so the owner of
+  the execution serves it, forwarded over one unix-socket hop if needed.
+
+Reports requests/s and the state-cache hit rate for each mode and shard
+count, as JSON.  Throughput only scales on a host with at least
+``shards + clients`` free cores.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import time
+
+_STATE_CACHE_MAX = int(os.getenv("BENCH_STATE_CACHE_MAX", "256"))
+
+
+def _burn(ms: float) -> None:
+    deadline = time.perf_counter() + ms / 1000.0
+    while time.perf_counter() < deadline:
+        pass
+
+
+def create_bench_app():
+    """ASGI stand-in for the event acceptor (imported by each shard)."""
+    from collections import OrderedDict
+
+    hit_ms = float(os.getenv("BENCH_HIT_CPU_MS", "0.2"))
+    miss_ms = float(os.getenv("BENCH_MISS_CPU_MS", "3.0"))
+    cache: OrderedDict[int, int] = OrderedDict()
+    locks: dict[int, asyncio.Lock] = {}
+
+    async def app(scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                await send({"type": message["type"] + ".complete"})
+                if message["type"] == "lifespan.shutdown":
+                    return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        execution_id = int(json.loads(body)["execution_id"])
+        async with locks.setdefault(execution_id, asyncio.Lock()):
+            hit = execution_id in cache
+            if hit:
+                cache.move_to_end(execution_id)
+            else:
+                cache[execution_id] = 0
+                while len(cache) > _STATE_CACHE_MAX:
+                    cache.popitem(last=False)
+            _burn(hit_ms if hit else miss_ms)
+            cache[execution_id] += 1
+        await send({"type": "http.response.start", "status": 202,
+                    "headers": [(b"x-cache", b"hit" if hit else b"miss"), (b"content-length", b"2")]})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    return app
+
+
+def _client(port: int, routed: bool, executions: int, seconds: float, concurrency: int, seed: int, out) -> None:
+    import random
+
+    import httpx
+
+    async def run() -> dict:
+        rng = random.Random(seed)
+        stats = {"requests": 0, "hits": 0, "errors": 0}
+        deadline = time.perf_counter() + seconds
+        # A fresh connection per request so the kernel spreads them across
+        # the SO_REUSEPORT listeners, like many workers would.
+        limits = httpx.Limits(max_keepalive_connections=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30.0) as client:
+            async def loop():
+                while time.perf_counter() < deadline:
+                    execution_id = 626611573817082718 + (rng.randrange(executions) << 22)
+                    headers = {"X-NoETL-Execution-Id": str(execution_id)} if routed else {}
+                    try:
+                        response = await client.post("/bench/events", content=json.dumps(
+                            {"execution_id": str(execution_id), "events": [{"name": "call.done"}]}), headers=headers)
+                        stats["requests"] += 1
+                        stats["hits"] += response.headers.get("x-cache") == "hit"
+                    except httpx.HTTPError:
+                        stats["errors"] += 1
+
+            await asyncio.gather(*(loop() for _ in range(concurrency)))
+        return stats
+
+    out.put(asyncio.run(run()))
+
+
+def _wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def _measure(args, shards: int, routed: bool) -> dict:
+    from noetl.server.sharding import run_sharded_server
+
+    ctx = multiprocessing.get_context("spawn")
+    server = ctx.Process(target=run_sharded_server, kwargs={
+        "host": "127.0.0.1", "port": args.port, "shards": shards,
+        "app_factory": "benchmark_sharded_server:create_bench_app",
+        "uvicorn_kwargs": {"log_level": "warning"},
+    })
+    server.start()
+    try:
+        _wait_for_port(args.port)
+        # Let every shard bind before load starts.
+        time.sleep(1.0 + 0.25 * shards)
+        out = ctx.Queue()
+        clients = [ctx.Process(target=_client, args=(args.port, routed, args.executions, args.seconds,
+                                                     args.concurrency, args.seed + index, out))
+                   for index in range(args.clients)]
+        for client in clients:
+            client.start()
+        results = [out.get() for _ in clients]
+        for client in clients:
+            client.join()
+    finally:
+        server.terminate()
+        server.join(timeout=30)
+    requests = sum(item["requests"] for item in results)
+    return {
+        "requests_per_second": round(requests / args.seconds, 1),
+        "cache_hit_pct": round(100.0 * sum(item["hits"] for item in results) / max(1, requests), 1),
+        "errors": sum(item["errors"] for item in results),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the execution-sharded server mode")
+    parser.add_argument("--shards", default="1,2,4", help="Comma-separated shard counts")
+    parser.add_argument("--port", default=18082, type=int)
+    parser.add_argument("--clients", default=2, type=int, help="Load generator processes")
+    parser.add_argument("--concurrency", default=32, type=int, help="In-flight requests per client")
+    parser.add_argument("--executions", default=400, type=int, help="Distinct executions in the load")
+    parser.add_argument("--seconds", default=5.0, type=float)
+    parser.add_argument("--hit-cpu-ms", default=0.2, type=float)
+    parser.add_argument("--miss-cpu-ms", default=3.0, type=float)
+    parser.add_argument("--state-cache", default=256, type=int, help="State cache entries per process")
+    parser.add_argument("--seed", default=7, type=int)
+    args = parser.parse_args(argv)
+
+    # Shards import the stand-in app by module name; spawn children inherit
+    # sys.path and the environment.
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.environ["BENCH_HIT_CPU_MS"] = str(args.hit_cpu_ms)
+    os.environ["BENCH_MISS_CPU_MS"] = str(args.miss_cpu_ms)
+    os.environ["BENCH_STATE_CACHE_MAX"] = str(args.state_cache)
+    os.environ.setdefault("NOETL_FLIGHT_DISABLED", "1")
+
+    results = {}
+    for shards in (int(value) for value in args.shards.split(",") if value.strip()):
+        modes = ("sharded",) if shards == 1 else ("random", "sharded")
+        results[str(shards)] = {mode: _measure(args, shards, routed=mode == "sharded") for mode in modes}
+    print(json.dumps({"cpu_count": os.cpu_count(), "executions": args.executions,
+                      "state_cache_per_process": args.state_cache, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
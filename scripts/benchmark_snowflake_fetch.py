@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+"""Benchmark Snowflake result retrieval and session reuse.
+
+Runs ``execute_sql_statements`` and ``execute_snowflake_task`` against an
+in-process connector stand-in whose cursor serves ``--rows`` rows (an
+integer id, a float amount, a timestamp and a short string) in Arrow batches
+of ``--batch-rows``, the way the connector hands out result chunks.
+
+Fetch phase, one ``SELECT`` per mode:
+
+- ``legacy``: ``fetchall`` into row dicts, ``_serialize_row`` per row and
+  ``json.dumps`` of the result, the previous path up to the TempStore write;
+- ``arrow``: ``fetch_arrow_batches`` into one Arrow IPC stream, passed
+  through the producer scrub (``scrub_arrow_ipc_bytes``) that
+  ``put_ipc_bytes`` applies.
+
+Reports rows per second, the Python heap peak (tracemalloc, from a
+separate run) and payload bytes.
+
+Session phase: ``--tasks`` single-statement tasks with the same credentials,
+each login costing ``--login-ms``, with and without the session pool.
+
+Output is JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import datetime
+import json
+import time
+import tracemalloc
+
+
+def _make_batches(rows: int, batch_rows: int):
+    import pyarrow as pa
+
+    start = datetime.datetime(2026, 1, 1)
+    batches = []
+    for offset in range(0, rows, batch_rows):
+        size = min(batch_rows, rows - offset)
+        ids = pa.array(range(offset, offset + size), pa.int64())
+        batches.append(pa.table({
+            "ID": ids,
+            "AMOUNT": pa.array([index * 0.25 for index in range(offset, offset + size)], pa.float64()),
+            "CREATED_AT": pa.array([start + datetime.timedelta(seconds=index) for index in range(offset, offset + size)], pa.timestamp("us")),
+            "REGION": pa.array([("us-east", "eu-west", "ap-south")[index % 3] for index in range(offset, offset + size)]),
+        }))
+    return batches
+
+
+class _Cursor:
+    def __init__(self, batches, arrow: bool):
+        self._batches = batches
+        self._arrow = arrow
+        self.description = [(name,) for name in batches[0].schema.names] if batches else None
+        self.rowcount = 0
+
+    def execute(self, _statement):
+        pass
+
+    def fetch_arrow_batches(self):
+        if not self._arrow:
+            raise NotImplementedError("legacy mode reads rows with fetchall")
+        return iter(self._batches)
+
+    def fetchall(self):
+        # DictCursor builds one dict per row from each result chunk.
+        return [row for batch in self._batches for row in batch.to_pylist()]
+
+    def close(self):
+        pass
+
+
+class _Connection:
+    def __init__(self, batches, arrow: bool):
+        self._batches = batches
+        self._arrow = arrow
+        self._closed = False
+
+    def cursor(self, _cursor_class=None):
+        return _Cursor(self._batches, self._arrow)
+
+    def is_closed(self):
+        return self._closed
+
+    def close(self):
+        self._closed = True
+
+
+def _fetch(batches, mode: str) -> dict:
+    from noetl.core.credential_refs import scrub_arrow_ipc_bytes
+    from noetl.tools.snowflake import execution
+
+    payload_bytes = 0
+
+    def store_arrow(payload, schema_digest, row_count, _statement_key):
+        nonlocal payload_bytes
+        safe, _digest, _count, _scrubbed = scrub_arrow_ipc_bytes(
+            payload, schema_digest=schema_digest, row_count=row_count
+        )
+        payload_bytes = len(safe)
+        return {"kind": "result_ref"}
+
+    def run():
+        nonlocal payload_bytes
+        conn = _Connection(batches, arrow=mode == "arrow")
+        if mode == "legacy":
+            results = execution.execute_sql_statements(conn, ["SELECT * FROM bench"])
+            payload_bytes = len(json.dumps(results["statement_0"]["result"]).encode("utf-8"))
+        else:
+            results = execution.execute_sql_statements(conn, ["SELECT * FROM bench"], store_arrow=store_arrow)
+        return results["statement_0"]["row_count"]
+
+    # Time and memory come from separate runs; tracemalloc slows allocation-heavy code.
+    started = time.perf_counter()
+    row_count = run()
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    run()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "rows_per_second": round(row_count / elapsed),
+        "seconds": round(elapsed, 3),
+        "python_peak_mb": round(peak / 2**20, 1),
+        "payload_mb": round(payload_bytes / 2**20, 1),
+    }
+
+
+def _sessions(tasks: int, login_seconds: float, pooled: bool) -> dict:
+    from jinja2 import Environment
+
+    from noetl.tools.snowflake import executor, session
+
+    logins = 0
+
+    def connect(**_params):
+        nonlocal logins
+        logins += 1
+        time.sleep(login_seconds)
+        return _Connection([], arrow=True)
+
+    executor.connect_to_snowflake = connect
+    session._SESSION_MAX_PER_KEY = 4 if pooled else 0
+    session.close_snowflake_sessions()
+    task_config = {"task": "bench", "command_b64": base64.b64encode(b"INSERT INTO t VALUES (1);").decode()}
+    task_with = {"account": "acme", "user": "bench", "password": "pw", "warehouse": "WH"}
+    started = time.perf_counter()
+    for _ in range(tasks):
+        executor.execute_snowflake_task(task_config, {"execution_id": "1"}, Environment(), dict(task_with))
+    elapsed = time.perf_counter() - started
+    session.close_snowflake_sessions()
+    return {"logins": logins, "ms_per_task": round(elapsed * 1000.0 / tasks, 2)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Snowflake Arrow fetch and session reuse")
+    parser.add_argument("--rows", default=1_000_000, type=int)
+    parser.add_argument("--batch-rows", default=100_000, type=int, help="Rows per connector result batch")
+    parser.add_argument("--tasks", default=50, type=int, help="Tasks for the session phase")
+    parser.add_argument("--login-ms", default=200.0, type=float, help="Cost of one simulated Snowflake login")
+    args = parser.parse_args(argv)
+
+    import logging
+
+    import noetl.tools.snowflake  # noqa: F401  (keep import time out of the first run)
+
+    logging.disable(logging.INFO)
+    batches = _make_batches(args.rows, args.batch_rows)
+    results = {
+        "fetch": {mode: _fetch(batches, mode) for mode in ("legacy", "arrow")},
+        "sessions": {
+            mode: _sessions(args.tasks, args.login_ms / 1000.0, pooled=mode == "pooled")
+            for mode in ("per_task", "pooled")
+        },
+    }
+    print(json.dumps({"rows": args.rows, "batch_rows": args.batch_rows, "results": results}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+"""Benchmark worker <-> server control-plane compression on large-context loops.
+
+Each loop iteration makes the worker's three control-plane calls against a
+stand-in server wrapped in the real ``WireCompressionMiddleware``:
+
+- ``POST /api/commands/{id}/claim``, whose response carries a
+  ``--context-bytes`` command context (loop items, rendered inputs);
+- ``POST /api/events`` with an inline result of ``--result-bytes``;
+- ``POST /api/events/batch`` with two such events.
+
+The stand-in parses every JSON body, the way the API routes do.  The
+worker side uses ``post_json`` and ``RequestCompressor`` exactly as
+``nats_worker`` does.  Requests go through an in-process link that charges
+``--rtt-ms`` per round trip plus the encoded bytes over ``--mbps``.
+
+Modes: ``off`` (``NOETL_WIRE_COMPRESSION=false``, the previous behaviour)
+and ``on`` (zstd when ``zstandard`` is installed, else gzip).  Reports
+bytes on the wire per iteration and the per-iteration latency (p50 and
+max), as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+
+class _Link:
+    def __init__(self) -> None:
+        self.sent = 0
+        self.received = 0
+
+
+def _make_transport(app, link: _Link, rtt: float, bytes_per_second: float):
+    import httpx
+
+    inner = httpx.ASGITransport(app=app)
+
+    class _LinkTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request):
+            body = await request.aread()
+            link.sent += len(body)
+            await asyncio.sleep(rtt / 2 + len(body) / bytes_per_second)
+            response = await inner.handle_async_request(request)
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+            link.received += len(raw)
+            await asyncio.sleep(rtt / 2 + len(raw) / bytes_per_second)
+            return httpx.Response(response.status_code, headers=response.headers, content=raw, request=request)
+
+    return _LinkTransport()
+
+
+def _server(context: dict):
+    from noetl.server.middleware import WireCompressionMiddleware
+
+    reply = json.dumps({
+        "execution_id": "1",
+        "node_id": "loop_step",
+        "node_name": "loop_step",
+        "action": "python",
+        "context": context,
+        "meta": {"attempt": 1},
+    }).encode()
+
+    async def app(scope, receive, send):
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        if body:
+            json.loads(body)
+        payload = reply if scope["path"].endswith("/claim") else b'{"status":"ok"}'
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+    return WireCompressionMiddleware(app)
+
+
+def _rows(target_bytes: int, rng: random.Random) -> list[dict]:
+    rows, size = [], 0
+    while size < target_bytes:
+        row = {
+            "id": len(rows),
+            "customer": f"customer-{rng.randrange(10_000)}",
+            "region": rng.choice(("us-east1", "europe-west4", "asia-south1")),
+            "amount": round(rng.random() * 1000, 2),
+            "status": rng.choice(("open", "paid", "void")),
+        }
+        rows.append(row)
+        size += len(json.dumps(row))
+    return rows
+
+
+async def _run(args, mode: str) -> dict:
+    import httpx
+
+    from noetl.core.wire_compression import RequestCompressor, post_json
+
+    os.environ["NOETL_WIRE_COMPRESSION"] = "true" if mode == "on" else "false"
+    rng = random.Random(7)
+    context = {"workload": {"items": _rows(args.context_bytes, rng)}, "iter": {"index": 0}}
+    result = {"status": "success", "data": {"rows": _rows(args.result_bytes, rng)}}
+    link = _Link()
+    compressor = RequestCompressor()
+    transport = _make_transport(_server(context), link, args.rtt_ms / 1000.0, args.mbps * 1e6 / 8)
+    latencies = []
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://server",
+        event_hooks={"response": [compressor.observe_response]},
+    ) as client:
+        for iteration in range(args.iterations + 1):
+            started = time.perf_counter()
+            claim = await post_json(
+                client, "http://server/api/commands/1/claim", {"worker_id": "bench"}, request_compressor=compressor
+            )
+            claim.json()
+            event = {"execution_id": "1", "step": "loop_step", "name": "call.done", "payload": {"result": result}}
+            await post_json(client, "http://server/api/events", event, request_compressor=compressor)
+            await post_json(
+                client,
+                "http://server/api/events/batch",
+                {"execution_id": "1", "worker_id": "bench", "events": [event, event]},
+                request_compressor=compressor,
+            )
+            if iteration == 0:
+                # The first round trip is uncompressed until the server advertises.
+                link.sent = link.received = 0
+                continue
+            latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return {
+        "encoding": compressor.encoding_for("http://server/") or "identity",
+        "sent_kb_per_iteration": round(link.sent / args.iterations / 1024, 1),
+        "received_kb_per_iteration": round(link.received / args.iterations / 1024, 1),
+        "latency_ms_p50": round(latencies[len(latencies) // 2] * 1000.0, 2),
+        "latency_ms_max": round(latencies[-1] * 1000.0, 2),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark control-plane compression on large-context loops")
+    parser.add_argument("--iterations", default=50, type=int)
+    parser.add_argument("--context-bytes", default=512 * 1024, type=int, help="JSON size of the claimed command context")
+    parser.add_argument("--result-bytes", default=256 * 1024, type=int, help="JSON size of each inline event result")
+    parser.add_argument("--mbps", default=1000.0, type=float, help="Simulated link bandwidth")
+    parser.add_argument("--rtt-ms", default=0.5, type=float, help="Simulated round-trip time")
+    args = parser.parse_args(argv)
+
+    import noetl.server.middleware  # noqa: F401  (keep import time out of the first run)
+
+    results = {mode: asyncio.run(_run(args, mode)) for mode in ("off", "on")}
+    print(json.dumps({
+        "iterations": args.iterations,
+        "context_bytes": args.context_bytes,
+        "result_bytes": args.result_bytes,
+        "mbps": args.mbps,
+        "rtt_ms": args.rtt_ms,
+        "results": results,
+    }, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+"""Check that hot-path modules log with lazy %-style arguments.
+
+``logger.info(f"... {value}")`` builds the message string on every call,
+even when the level is disabled.  ``logger.info("... %s", value)`` defers
+formatting to the logging pipeline (off the event loop, see
+``noetl.core.logger``), so hot-path modules must use the lazy form.
+
+Flags logger calls whose message argument is an f-string, a ``str.format``
+call, or a ``%`` expression.  ``--fix`` rewrites f-string messages in place
+to the equivalent %-style message plus arguments.
+
+Results are printed as JSON; the exit code is 1 when eager calls remain.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+# Modules on the per-event / per-command path: the worker command loop,
+# the server event and claim routes, and the engine executor package.
+HOT_PATHS = (
+    "noetl/worker/nats_worker.py",
+    "noetl/server/api/core/events.py",
+    "noetl/server/api/core/commands.py",
+    "noetl/server/api/core/batch.py",
+    "noetl/core/dsl/engine/executor",
+)
+
+_LOG_METHODS = {"debug", "info", "warning", "warn", "error", "exception", "critical", "success"}
+_LOGGER_NAMES = {"logger", "log", "_logger", "LOGGER"}
+_SIMPLE_SPEC = re.compile(r"^(?P<flags>[-+ 0#]*)(?P<width>\d*)(?P<precision>\.\d+)?(?P<type>[deEfFgGxXo])$")
+_CONVERSION_FUNCS = {"s": "str", "r": "repr", "a": "ascii"}
+_MAX_LINE = 100
+
+
+def _iter_files(paths: list[str], root: Path) -> list[Path]:
+    files: list[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        if not path.is_absolute():
+            path = root / path
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob("*.py") if "__pycache__" not in p.parts))
+        elif path.suffix == ".py":
+            files.append(path)
+    return files
+
+
+def _logger_name(func: ast.expr) -> str | None:
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def _eager_kind(arg: ast.expr) -> str | None:
+    if isinstance(arg, ast.JoinedStr):
+        return "f-string"
+    if isinstance(arg, ast.Call) and isinstance(arg.func, ast.Attribute) and arg.func.attr == "format":
+        return "str.format"
+    if isinstance(arg, ast.BinOp) and isinstance(arg.op, ast.Mod):
+        return "percent"
+    return None
+
+
+def _eager_calls(tree: ast.AST) -> list[tuple[ast.Call, str]]:
+    calls = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+            continue
+        if node.func.attr not in _LOG_METHODS or not node.args:
+            continue
+        if _logger_name(node.func.value) not in _LOGGER_NAMES:
+            continue
+        kind = _eager_kind(node.args[0])
+        if kind:
+            calls.append((node, kind))
+    return calls
+
+
+def _placeholder(value: ast.FormattedValue, source: str) -> tuple[str, str] | None:
+    expr = ast.get_source_segment(source, value.value)
+    if expr is None:
+        return None
+    expr = expr.strip()
+    if isinstance(value.value, (ast.Tuple, ast.NamedExpr, ast.Lambda, ast.Yield, ast.YieldFrom)):
+        expr = f"({expr})"
+    conversion = {-1: "s", ord("s"): "s", ord("r"): "r", ord("a"): "a"}[value.conversion]
+    if value.format_spec is None:
+        return f"%{conversion}", expr
+    if not all(isinstance(part, ast.Constant) for part in value.format_spec.values):
+        return None
+    spec = "".join(part.value for part in value.format_spec.values)
+    if value.conversion == -1 and _SIMPLE_SPEC.match(spec):
+        return f"%{spec}", expr
+    if value.conversion != -1:
+        expr = f"{_CONVERSION_FUNCS[conversion]}({expr})"
+    return "%s", f"format({expr}, {spec!r})"
+
+
+def _lazy_form(arg: ast.JoinedStr, source: str) -> tuple[str, list[str]] | None:
+    parts: list[str] = []
+    args: list[str] = []
+    for value in arg.values:
+        if isinstance(value, ast.Constant):
+            parts.append(value.value)
+            continue
+        converted = _placeholder(value, source)
+        if converted is None:
+            return None
+        placeholder, expr = converted
+        parts.append("\0" + placeholder)
+        args.append(expr)
+    if not args:
+        return "".join(parts), []
+    message = "".join(part if part.startswith("\0") else part.replace("%", "%%") for part in parts)
+    return message.replace("\0", ""), args
+
+
+def _literal(text: str) -> str:
+    return json.dumps(text, ensure_ascii=False)
+
+
+def _literal_block(message: str, indent: str, width: int) -> str:
+    pieces: list[str] = []
+    current = ""
+    for token in re.split(r"(?<= )", message):
+        if current and len(_literal(current + token)) > width:
+            pieces.append(current)
+            current = ""
+        current += token
+    pieces.append(current)
+    return ("\n" + indent).join(_literal(piece) for piece in pieces)
+
+
+def _render_hanging(message: str, args: list[str], column: int) -> str:
+    """Render the message argument when it already starts its own line."""
+    indent = " " * column
+    block = _literal_block(message, indent, max(40, _MAX_LINE - column))
+    return block + "".join(",\n" + indent + arg for arg in args)
+
+
+def _render_call(message: str, args: list[str], rest: list[str], base_indent: str) -> str:
+    """Render a whole argument list, one argument per line."""
+    indent = base_indent + "    "
+    block = _literal_block(message, indent, max(40, _MAX_LINE - len(indent)))
+    items = [block, *args, *rest]
+    return "(\n" + indent + (",\n" + indent).join(items) + ",\n" + base_indent + ")"
+
+
+def _offset(lines: list[str], lineno: int, col: int) -> int:
+    # ast columns are UTF-8 byte offsets.
+    prefix = lines[lineno - 1].encode("utf-8")[:col].decode("utf-8")
+    return sum(len(line) for line in lines[: lineno - 1]) + len(prefix)
+
+
+def _fix_source(source: str, calls: list[tuple[ast.Call, str]]) -> tuple[str, int]:
+    lines = source.splitlines(keepends=True)
+    edits = []
+    for call, kind in calls:
+        arg = call.args[0]
+        if kind != "f-string":
+            continue
+        lazy = _lazy_form(arg, source)
+        if lazy is None:
+            continue
+        message, args = lazy
+        start = _offset(lines, arg.lineno, arg.col_offset)
+        end = _offset(lines, arg.end_lineno, arg.end_col_offset)
+        column = start - _offset(lines, arg.lineno, 0)
+        single = ", ".join([_literal(message), *args])
+        tail = lines[arg.end_lineno - 1][end - _offset(lines, arg.end_lineno, 0):].rstrip("\n")
+        if "\n" not in single and column + len(single) + len(tail) <= _MAX_LINE:
+            edits.append((start, end, single))
+        elif arg.lineno == call.func.end_lineno:
+            rest = [ast.get_source_segment(source, node) for node in [*call.args[1:], *call.keywords]]
+            if any(segment is None for segment in rest):
+                continue
+            line = lines[call.lineno - 1]
+            base_indent = line[: len(line) - len(line.lstrip())]
+            paren = source.index("(", _offset(lines, call.func.end_lineno, call.func.end_col_offset))
+            call_end = _offset(lines, call.end_lineno, call.end_col_offset)
+            edits.append((paren, call_end, _render_call(message, args, rest, base_indent)))
+        else:
+            edits.append((start, end, _render_hanging(message, args, column)))
+    for start, end, text in sorted(edits, reverse=True):
+        source = source[:start] + text + source[end:]
+    return source, len(edits)
+
+
+def check(paths: list[str], root: Path, fix: bool = False) -> dict[str, Any]:
+    findings: list[dict[str, Any]] = []
+    fixed = 0
+    files = _iter_files(paths, root)
+    for path in files:
+        source = path.read_text()
+        tree = ast.parse(source)
+        calls = _eager_calls(tree)
+        if fix and calls:
+            source, count = _fix_source(source, calls)
+            if count:
+                path.write_text(source)
+                fixed += count
+                calls = _eager_calls(ast.parse(source))
+        for call, kind in calls:
+            findings.append({
+                "path": str(path.relative_to(root)) if path.is_relative_to(root) else str(path),
+                "line": call.lineno,
+                "method": call.func.attr,
+                "kind": kind,
+            })
+    return {"files": len(files), "fixed": fixed, "eager_calls": findings, "ok": not findings}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check hot-path modules for eager log formatting")
+    parser.add_argument("paths", nargs="*", help="Files or directories (default: hot-path modules)")
+    parser.add_argument("--root", default=str(Path(__file__).resolve().parents[1]))
+    parser.add_argument("--fix", action="store_true", help="Rewrite f-string messages to %%-style")
+    args = parser.parse_args(argv)
+
+    report = check(args.paths or list(HOT_PATHS), Path(args.root), fix=args.fix)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python
+"""Run the local end-to-end throughput benchmark suite.
+
+Each scenario registers a fixed playbook from
+``tests/fixtures/playbooks/perf``, starts one execution against a NoETL
+server, waits for it to finish, and derives throughput figures from the
+execution's rows in ``noetl.event``:
+
+- ``commands_per_sec``: ``command.issued`` events over the execution wall time;
+- ``events_per_sec``: all persisted events over the execution wall time;
+- ``step_latency_ms``: p50/p99 from ``command.issued`` to the command's
+  terminal lifecycle event;
+- ``timing_phases_ms``: p50/p99 for every ``*_ms`` phase the batch acceptor
+  records on ``batch.completed`` (the ``timing_capture`` breakdown).
+
+With ``--start-stack`` the script also launches one server and
+``--workers`` worker processes from this checkout, pointed at the local
+Postgres (``NOETL_*`` env from the caller) and the given ``--nats-url``, so a
+run needs nothing but a Linux box with Postgres and nats-server.
+
+The report is written as JSON.  Pass ``--baseline`` to diff it against a
+stored report; the exit code is 1 when any tracked metric regresses by more
+than ``--max-regression``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+# name -> (playbook path, helper playbooks registered first, default workload)
+SCENARIOS: dict[str, tuple[str, tuple[str, ...], dict[str, Any]]] = {
+    "linear_steps": ("tests/fixtures/playbooks/perf/linear_steps", (), {}),
+    "loop_10k": ("tests/fixtures/playbooks/perf/loop_10k", (), {"item_count": 10000}),
+    "nested_loops": (
+        "tests/fixtures/playbooks/perf/nested_loops",
+        ("tests/fixtures/playbooks/perf/nested_loops_inner",),
+        {"outer_count": 20, "inner_count": 50},
+    ),
+    "large_result": ("tests/fixtures/playbooks/perf/large_result", (), {"row_count": 200000}),
+}
+
+# Metric -> direction; "higher" means a drop is a regression.
+TRACKED_METRICS: dict[str, str] = {
+    "commands_per_sec": "higher",
+    "events_per_sec": "higher",
+    "wall_seconds": "lower",
+    "step_latency_ms.p50": "lower",
+    "step_latency_ms.p99": "lower",
+}
+
+_TERMINAL_COMMAND_EVENTS = {"command.completed", "command.failed", "command.cancelled"}
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile; ``None`` for an empty sample."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(pct / 100.0 * len(ordered))))
+    return round(ordered[rank - 1], 3)
+
+
+def _seconds(value: Any) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def summarize_execution_events(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    """Reduce ``noetl.event`` rows of one execution tree to benchmark metrics.
+
+    Each row needs ``event_type``, ``created_at`` and ``command_id``;
+    ``result`` is read for ``batch.completed`` timing phases.
+    """
+    if not rows:
+        return {"events": 0, "commands": 0}
+
+    times = [_seconds(row["created_at"]) for row in rows]
+    wall = max(max(times) - min(times), 1e-6)
+
+    issued_at: dict[Any, float] = {}
+    finished_at: dict[Any, float] = {}
+    phases: dict[str, list[float]] = {}
+    for row in rows:
+        event_type = row.get("event_type")
+        command_id = row.get("command_id")
+        at = _seconds(row["created_at"])
+        if event_type == "command.issued" and command_id is not None:
+            issued_at[command_id] = at
+        elif event_type in _TERMINAL_COMMAND_EVENTS and command_id is not None:
+            finished_at[command_id] = min(at, finished_at.get(command_id, at))
+        elif event_type == "batch.completed":
+            result = row.get("result") or {}
+            context = result.get("context") if isinstance(result, dict) else None
+            for key, value in (context or {}).items():
+                if key.endswith("_ms") and isinstance(value, (int, float)):
+                    phases.setdefault(key, []).append(float(value))
+
+    latencies = [
+        (finished_at[command_id] - started) * 1000.0
+        for command_id, started in issued_at.items()
+        if command_id in finished_at
+    ]
+    return {
+        "events": len(rows),
+        "commands": len(issued_at),
+        "commands_completed": len(latencies),
+        "wall_seconds": round(wall, 3),
+        "commands_per_sec": round(len(issued_at) / wall, 3),
+        "events_per_sec": round(len(rows) / wall, 3),
+        "step_latency_ms": {"p50": _percentile(latencies, 50), "p99": _percentile(latencies, 99)},
+        "timing_phases_ms": {
+            name: {"p50": _percentile(values, 50), "p99": _percentile(values, 99), "samples": len(values)}
+            for name, values in sorted(phases.items())
+        },
+    }
+
+
+def _metric(values: dict[str, Any], dotted: str) -> float | None:
+    current: Any = values
+    for part in dotted.split("."):
+        if not isinstance(current, dict):
+            return None
+        current = current.get(part)
+    return float(current) if isinstance(current, (int, float)) else None
+
+
+def compare_to_baseline(report: dict[str, Any], baseline: dict[str, Any], *, max_regression: float) -> list[dict[str, Any]]:
+    """Return one entry per tracked metric present in both reports."""
+    comparisons: list[dict[str, Any]] = []
+    baseline_scenarios = baseline.get("scenarios") or {}
+    for name, current in (report.get("scenarios") or {}).items():
+        previous = baseline_scenarios.get(name)
+        if not isinstance(previous, dict) or not isinstance(current, dict):
+            continue
+        for metric, direction in TRACKED_METRICS.items():
+            now, before = _metric(current, metric), _metric(previous, metric)
+            if now is None or before is None or before == 0:
+                continue
+            change = (now - before) / before
+            regressed = change < -max_regression if direction == "higher" else change > max_regression
+            comparisons.append({
+                "scenario": name,
+                "metric": metric,
+                "baseline": before,
+                "current": now,
+                "change": round(change, 4),
+                "regressed": regressed,
+            })
+    return comparisons
+
+
+def _http_json(method: str, url: str, payload: dict[str, Any] | None = None, *, timeout: float = 30.0) -> Any:
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    request = Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8") or "null")
+    except (HTTPError, URLError, TimeoutError) as exc:
+        raise RuntimeError(f"{method} {url} failed: {exc}") from exc
+
+
+def _register_playbook(server_url: str, playbook_path: str) -> None:
+    source = Path(playbook_path) / f"{Path(playbook_path).name}.yaml"
+    _http_json("POST", f"{server_url}/api/catalog/register", {"content": source.read_text(), "resource_type": "playbook"})
+
+
+def _wait_for_terminal(server_url: str, execution_id: str, *, timeout: float, poll: float) -> dict[str, Any]:
+    deadline = time.monotonic() + timeout
+    while True:
+        status = _http_json("GET", f"{server_url}/api/executions/{execution_id}/status")
+        if isinstance(status, dict) and (status.get("completed") or status.get("failed")):
+            return status
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"execution {execution_id} did not finish within {timeout}s")
+        time.sleep(poll)
+
+
+def _fetch_execution_events(dsn: str, execution_id: str) -> list[dict[str, Any]]:
+    import psycopg
+    from psycopg.rows import dict_row
+
+    with psycopg.connect(dsn, row_factory=dict_row) as conn:
+        rows = conn.execute(
+            """
+            WITH RECURSIVE tree(execution_id) AS (
+                SELECT %s::bigint
+                UNION
+                SELECT DISTINCT e.execution_id
+                FROM noetl.event e
+                JOIN tree t ON e.parent_execution_id = t.execution_id
+            )
+            SELECT e.event_type, e.created_at, e.command_id, e.result
+            FROM noetl.event e
+            JOIN tree t ON e.execution_id = t.execution_id
+            """,
+            (int(execution_id),),
+        ).fetchall()
+    return list(rows)
+
+
+def run_scenario(name: str, *, server_url: str, dsn: str, timeout: float, poll: float, workload: dict[str, Any]) -> dict[str, Any]:
+    playbook_path, helpers, defaults = SCENARIOS[name]
+    for helper in helpers:
+        _register_playbook(server_url, helper)
+    _register_playbook(server_url, playbook_path)
+
+    started = time.perf_counter()
+    response = _http_json("POST", f"{server_url}/api/execute", {"path": playbook_path, "workload": {**defaults, **workload}})
+    execution_id = str(response["execution_id"])
+    status = _wait_for_terminal(server_url, execution_id, timeout=timeout, poll=poll)
+    client_seconds = time.perf_counter() - started
+
+    summary = summarize_execution_events(_fetch_execution_events(dsn, execution_id))
+    return {
+        "execution_id": execution_id,
+        "failed": bool(status.get("failed")),
+        "client_seconds": round(client_seconds, 3),
+        **summary,
+    }
+
+
+def _start_stack(args: argparse.Namespace) -> list[subprocess.Popen]:
+    env = os.environ.copy()
+    repo_root = str(Path.cwd())
+    env["PYTHONPATH"] = repo_root if not env.get("PYTHONPATH") else f"{repo_root}{os.pathsep}{env['PYTHONPATH']}"
+    env.setdefault("NOETL_SERVER_URL", args.server_url)
+    env.setdefault("NOETL_LOG_LEVEL", "WARNING")
+    port = args.server_url.rsplit(":", 1)[-1].split("/")[0]
+    processes = [
+        subprocess.Popen([sys.executable, "-m", "noetl.server", "--host", "127.0.0.1", "--port", port], env=env)
+    ]
+    deadline = time.monotonic() + 60
+    while True:
+        try:
+            _http_json("GET", f"{args.server_url}/health", timeout=2)
+            break
+        except RuntimeError:
+            if time.monotonic() >= deadline:
+                _stop_stack(processes)
+                raise RuntimeError("server did not become healthy within 60s")
+            time.sleep(0.5)
+    for _ in range(max(1, args.workers)):
+        processes.append(
+            subprocess.Popen(
+                [sys.executable, "-m", "noetl.worker", "--nats-url", args.nats_url, "--server-url", args.server_url],
+                env=env,
+            )
+        )
+    return processes
+
+
+def _stop_stack(processes: list[subprocess.Popen]) -> None:
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def _parse_workload(raw: list[str]) -> dict[str, Any]:
+    workload: dict[str, Any] = {}
+    for item in raw:
+        if "=" not in item:
+            raise ValueError("--set must use KEY=VALUE")
+        key, value = item.split("=", 1)
+        try:
+            workload[key.strip()] = json.loads(value)
+        except json.JSONDecodeError:
+            workload[key.strip()] = value
+    return workload
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the NoETL local throughput benchmark suite")
+    parser.add_argument("--server-url", default="http://127.0.0.1:8082")
+    parser.add_argument("--dsn", default=os.environ.get("NOETL_BENCH_DSN"), help="Postgres DSN of the NoETL database")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Scenario to run (repeatable, default: all)")
+    parser.add_argument("--set", action="append", default=[], help="Workload override KEY=VALUE (JSON values accepted)")
+    parser.add_argument("--timeout", default=1800.0, type=float, help="Per-scenario completion timeout in seconds")
+    parser.add_argument("--poll", default=0.5, type=float)
+    parser.add_argument("--start-stack", action="store_true", help="Launch a server and workers from this checkout")
+    parser.add_argument("--nats-url", default="nats://127.0.0.1:4222")
+    parser.add_argument("--workers", default=2, type=int)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Stored report to diff against")
+    parser.add_argument("--max-regression", default=0.15, type=float, help="Allowed relative regression per metric")
+    args = parser.parse_args(argv)
+
+    if not args.dsn:
+        print(json.dumps({"matched": False, "error": "--dsn or NOETL_BENCH_DSN is required"}, indent=2))
+        return 1
+
+    args.server_url = args.server_url.rstrip("/")
+    workload = _parse_workload(args.set)
+    processes = _start_stack(args) if args.start_stack else []
+    report: dict[str, Any] = {"started_at": _utc_now(), "server_url": args.server_url, "scenarios": {}}
+    try:
+        for name in args.scenario or list(SCENARIOS):
+            try:
+                report["scenarios"][name] = run_scenario(
+                    name, server_url=args.server_url, dsn=args.dsn, timeout=args.timeout, poll=args.poll, workload=workload
+                )
+            except (RuntimeError, KeyError) as exc:
+                report["scenarios"][name] = {"error": str(exc)}
+    finally:
+        _stop_stack(processes)
+    report["finished_at"] = _utc_now()
+
+    matched = all("error" not in result and not result.get("failed") for result in report["scenarios"].values())
+    if args.baseline:
+        comparisons = compare_to_baseline(report, json.loads(args.baseline.read_text()), max_regression=args.max_regression)
+        report["baseline"] = {"path": str(args.baseline), "max_regression": args.max_regression, "comparisons": comparisons}
+        matched = matched and not any(item["regressed"] for item in comparisons)
+    report["matched"] = matched
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True, default=str) + "\n")
+    print(json.dumps(report, indent=2, sort_keys=True, default=str))
+    return 0 if matched else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,212 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+class _CursorCtx:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    async def __aenter__(self):
+        return self._cursor
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class _ConnCtx:
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def __aenter__(self):
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class _FakeConn:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.commits = 0
+
+    def cursor(self, **_kwargs):
+        return _CursorCtx(self._cursor)
+
+    async def commit(self):
+        self.commits += 1
+
+
+class _ExecuteCursor:
+    def __init__(self):
+        self.query = ""
+        self.params = None
+        self.executed = []
+
+    async def execute(self, query, params=None):
+        self.query = query
+        self.params = params
+        self.executed.append((query, params))
+
+    async def fetchone(self):
+        if "FROM noetl.catalog" in self.query:
+            return {"catalog_id": 5, "path": "playbook/child"}
+        if "event_type = 'playbook.initialized'" in self.query:
+            return {"event_id": 1000 + int(self.params[0])}
+        return None
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_resolves_catalog_once_and_publishes_all_children_together(monkeypatch):
+    import noetl.server.api.core.commands as commands_module
+    import noetl.server.api.core.execution as execution_module
+    from noetl.server.api.core.models import ExecuteBatchRequest
+
+    cursor = _ExecuteCursor()
+    conn = _FakeConn(cursor)
+    published = []
+    started = []
+    loads = []
+    snowflakes = iter(range(100, 200))
+    shared_playbook = object()
+
+    class FakeRepo:
+        async def load_playbook_by_id(self, catalog_id):
+            loads.append(catalog_id)
+            return shared_playbook
+
+    class FakeEngine:
+        playbook_repo = FakeRepo()
+
+        async def start_execution(self, path, payload, catalog_id, parent_execution_id, playbook=None):
+            assert playbook is shared_playbook
+            execution_id = str(len(started) + 1)
+            started.append((path, payload, catalog_id, parent_execution_id))
+            command = SimpleNamespace(
+                execution_id=int(execution_id),
+                step="fetch",
+                tool=SimpleNamespace(kind="http"),
+                max_attempts=3,
+                metadata={},
+            )
+            return execution_id, [command]
+
+    async def fake_next_snowflake_id(_cur):
+        return next(snowflakes)
+
+    async def fake_store_context_if_needed(**kwargs):
+        return kwargs["context"]
+
+    async def fake_enqueue(_cur, _event):
+        return None
+
+    async def fake_drain():
+        assert conn.commits == 1
+
+    async def fake_publish(items, *, server_url):
+        published.append(list(items))
+
+    async def fake_supervise(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(execution_module, "get_engine", lambda: FakeEngine())
+    monkeypatch.setattr(execution_module, "get_pool_connection", lambda: _ConnCtx(conn))
+    monkeypatch.setattr(execution_module, "_next_snowflake_id", fake_next_snowflake_id)
+    monkeypatch.setattr(execution_module, "_enqueue_execution_outbox", fake_enqueue)
+    monkeypatch.setattr(execution_module, "_drain_execution_outbox", fake_drain)
+    monkeypatch.setattr(execution_module, "_publish_commands_with_recovery", fake_publish)
+    monkeypatch.setattr(execution_module, "supervise_command_issued", fake_supervise)
+    monkeypatch.setattr(commands_module, "_build_command_context", lambda _cmd: {"url": "https://example.test"})
+    monkeypatch.setattr(commands_module, "_validate_postgres_command_context_or_422", lambda **_kwargs: None)
+    monkeypatch.setattr(commands_module, "_store_command_context_if_needed", fake_store_context_if_needed)
+
+    result = await execution_module.execute_batch(
+        ExecuteBatchRequest(
+            path="playbook/child",
+            workloads=[{"item": 1}, {"item": 2}, {"item": 3}],
+            parent_execution_id=42,
+        )
+    )
+
+    assert [item.execution_id for item in result.executions] == ["1", "2", "3"]
+    assert all(item.commands_generated == 1 for item in result.executions)
+    assert loads == [5]
+    assert [payload for _path, payload, _cat, _parent in started] == [{"item": 1}, {"item": 2}, {"item": 3}]
+    assert {parent for *_rest, parent in started} == {42}
+    catalog_queries = [query for query, _params in cursor.executed if "FROM noetl.catalog" in query]
+    assert len(catalog_queries) == 1
+    assert conn.commits == 1
+    assert len(published) == 1
+    assert [item[0] for item in published[0]] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_rejects_more_payloads_than_the_cap(monkeypatch):
+    from fastapi import HTTPException
+
+    import noetl.server.api.core.execution as execution_module
+    from noetl.server.api.core.models import ExecuteBatchRequest
+
+    monkeypatch.setattr(execution_module, "_EXECUTE_BATCH_MAX", 2)
+    monkeypatch.setattr(
+        execution_module,
+        "get_engine",
+        lambda: pytest.fail("oversized batches must be rejected before touching the engine"),
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await execution_module.execute_batch(
+            ExecuteBatchRequest(path="playbook/child", payloads=[{}, {}, {}])
+        )
+
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_status_wait_returns_when_terminal_event_is_notified(monkeypatch):
+    import noetl.server.api.core.execution as execution_module
+    from noetl.server.api.execution.event_tail import event_notifier, notify_execution_events
+
+    docs = [
+        {"execution_id": "7", "completed": False, "failed": False},
+        {"execution_id": "7", "completed": True, "failed": False},
+    ]
+    calls = []
+
+    async def fake_status(execution_id, full):
+        calls.append(execution_id)
+        return docs[min(len(calls), len(docs)) - 1]
+
+    monkeypatch.setattr(execution_module, "_execution_status", fake_status)
+    monkeypatch.setattr(execution_module, "STATUS_WAIT_RECHECK_SECONDS", 30.0)
+
+    task = asyncio.create_task(execution_module.get_execution_status("7", wait_seconds=10))
+    while not event_notifier.waiting("7"):
+        await asyncio.sleep(0)
+    assert not task.done()
+
+    notify_execution_events("7")
+    result = await asyncio.wait_for(task, timeout=1)
+
+    assert result["completed"] is True
+    assert calls == ["7", "7"]
+    assert event_notifier.waiting("7") == 0
+
+
+@pytest.mark.asyncio
+async def test_status_without_wait_returns_first_answer(monkeypatch):
+    import noetl.server.api.core.execution as execution_module
+
+    calls = []
+
+    async def fake_status(execution_id, full):
+        calls.append(execution_id)
+        return {"execution_id": execution_id, "completed": False, "failed": False}
+
+    monkeypatch.setattr(execution_module, "_execution_status", fake_status)
+
+    result = await execution_module.get_execution_status("7")
+
+    assert result["completed"] is False
+    assert calls == ["7"]
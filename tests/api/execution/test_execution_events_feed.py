@@ -0,0 +1,267 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+import noetl.server.api.execution.endpoint as execution_api
+from noetl.server.api.execution.event_tail import ExecutionEventNotifier, notify_execution_events
+
+
+def _event_row(event_id, event_type="call.done"):
+    return {
+        "event_id": event_id,
+        "event_type": event_type,
+        "node_id": "step",
+        "node_name": "step",
+        "status": "COMPLETED",
+        "created_at": datetime(2026, 3, 21, 8, 0, 0, tzinfo=timezone.utc),
+        "context": None,
+        "result": None,
+        "error": None,
+        "catalog_id": 7,
+        "parent_execution_id": None,
+        "parent_event_id": None,
+        "duration": None,
+    }
+
+
+class _CursorCtx:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    async def __aenter__(self):
+        return self._cursor
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class _FeedCursor:
+    """Answers the feed header and page queries; records every statement."""
+
+    def __init__(self, pages, *, total=0, latest_event=None, terminal_event=None):
+        self._pages = list(pages)
+        self._total = total
+        self._latest_event = latest_event or {
+            "event_type": "call.done",
+            "node_name": "step",
+            "created_at": datetime(2026, 3, 21, 8, 0, 0, tzinfo=timezone.utc),
+            "status": "COMPLETED",
+        }
+        self._terminal_event = terminal_event
+        self._query = ""
+        self.statements = []
+
+    async def execute(self, query, params=None):
+        self._query = query
+        self.statements.append((" ".join(query.split()), dict(params or {})))
+
+    async def fetchall(self):
+        if "SELECT event_id," in self._query:
+            return self._pages.pop(0) if self._pages else []
+        raise AssertionError(f"Unexpected fetchall query: {self._query}")
+
+    async def fetchone(self):
+        if "SELECT COUNT(*) as total" in self._query:
+            return {"total": self._total}
+        if "ORDER BY event_id ASC" in self._query:
+            return {"event_id": 1, "event_type": "playbook.initialized", "catalog_id": 7, "parent_execution_id": None}
+        if "AND event_type IN (" in self._query:
+            return self._terminal_event
+        if "SELECT event_type, node_name, created_at, status" in self._query:
+            return self._latest_event
+        if "SELECT COUNT(*) AS pending_count" in self._query:
+            return {"pending_count": 1}
+        raise AssertionError(f"Unexpected fetchone query: {self._query}")
+
+
+class _FakeConn:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self, row_factory=None):  # noqa: ARG002
+        return _CursorCtx(self._cursor)
+
+
+class _ConnCtx:
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def __aenter__(self):
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+@pytest.fixture(autouse=True)
+def _feed_env(monkeypatch):
+    execution_api._event_total_cache.clear()
+
+    async def _catalog_path_for(catalog_id):
+        return "tests/feed" if catalog_id == 7 else None
+
+    async def _no_detail(**_kwargs):
+        raise AssertionError("get_execution must not run when events exist")
+
+    monkeypatch.setattr(execution_api, "catalog_path_for", _catalog_path_for)
+    monkeypatch.setattr(execution_api, "get_execution", _no_detail)
+    yield
+    execution_api._event_total_cache.clear()
+
+
+def _use_cursor(monkeypatch, cursor):
+    monkeypatch.setattr(execution_api, "get_pool_connection", lambda: _ConnCtx(_FakeConn(cursor)))
+
+
+def _page_statements(cursor):
+    return [(sql, params) for sql, params in cursor.statements if sql.startswith("SELECT event_id, event_type, node_id")]
+
+
+@pytest.mark.asyncio
+async def test_events_keyset_page_reads_page_size_plus_one_without_offset(monkeypatch):
+    cursor = _FeedCursor([[_event_row(event_id) for event_id in range(500, 489, -1)]], total=100_000)
+    _use_cursor(monkeypatch, cursor)
+
+    result = await execution_api.get_execution_events(
+        "42", page=1, page_size=10, since_event_id=None, event_type=None,
+        before_event_id=501, order="desc", include_total=False, wait_seconds=0,
+    )
+
+    [(sql, params)] = _page_statements(cursor)
+    assert "event_id < %(before_event_id)s" in sql
+    assert "ORDER BY event_id DESC" in sql
+    assert params["limit"] == 11 and params["offset"] == 0
+    assert not any("COUNT(*) as total" in sql for sql, _ in cursor.statements)
+    assert result["path"] == "tests/feed"
+    assert result["status"] == "RUNNING"
+    assert [event["event_id"] for event in result["events"]] == list(range(500, 490, -1))
+    pagination = result["pagination"]
+    assert pagination["has_next"] is True
+    assert pagination["has_prev"] is True
+    assert pagination["next_cursor"] == "491"
+    assert pagination["total_events"] is None
+
+
+@pytest.mark.asyncio
+async def test_events_total_is_cached_and_marked_estimated(monkeypatch):
+    cursor = _FeedCursor([[_event_row(2)], [_event_row(2)]], total=100_000)
+    _use_cursor(monkeypatch, cursor)
+    kwargs = dict(page=1, page_size=10, since_event_id=None, event_type=None,
+                  before_event_id=None, order="desc", include_total=True, wait_seconds=0)
+
+    first = await execution_api.get_execution_events("42", **kwargs)
+    second = await execution_api.get_execution_events("42", **kwargs)
+
+    counts = [sql for sql, _ in cursor.statements if "COUNT(*) as total" in sql]
+    assert len(counts) == 1
+    assert first["pagination"]["total_events"] == 100_000
+    assert first["pagination"]["total_pages"] == 10_000
+    assert first["pagination"]["total_estimated"] is False
+    assert second["pagination"]["total_events"] == 100_000
+    assert second["pagination"]["total_estimated"] is True
+
+
+@pytest.mark.asyncio
+async def test_events_long_poll_wakes_on_commit_notification(monkeypatch):
+    cursor = _FeedCursor([[], [_event_row(11)]])
+    _use_cursor(monkeypatch, cursor)
+    monkeypatch.setattr(execution_api, "EVENTS_TAIL_RECHECK_SECONDS", 30.0)
+
+    task = asyncio.create_task(execution_api.get_execution_events(
+        "42", page=1, page_size=10, since_event_id=10, event_type=None,
+        before_event_id=None, order="asc", include_total=False, wait_seconds=30,
+    ))
+    while execution_api.event_notifier.waiting("42") == 0:
+        await asyncio.sleep(0)
+    notify_execution_events(42)
+    result = await asyncio.wait_for(task, timeout=5)
+
+    pages = _page_statements(cursor)
+    assert len(pages) == 2
+    assert all("event_id > %(since_event_id)s" in sql and "ORDER BY event_id ASC" in sql for sql, _ in pages)
+    assert [event["event_id"] for event in result["events"]] == [11]
+    assert result["pagination"]["tail_cursor"] == "11"
+    assert execution_api.event_notifier.waiting("42") == 0
+
+
+@pytest.mark.asyncio
+async def test_events_long_poll_returns_immediately_for_terminal_execution(monkeypatch):
+    cursor = _FeedCursor(
+        [[]],
+        terminal_event={"event_type": "playbook.completed", "node_name": "end", "status": "COMPLETED"},
+    )
+    _use_cursor(monkeypatch, cursor)
+
+    result = await asyncio.wait_for(execution_api.get_execution_events(
+        "42", page=1, page_size=10, since_event_id=10, event_type=None,
+        before_event_id=None, order="asc", include_total=False, wait_seconds=30,
+    ), timeout=5)
+
+    assert result["events"] == []
+    assert result["status"] != "RUNNING"
+    assert result["pagination"]["tail_cursor"] == "10"
+
+
+@pytest.mark.asyncio
+async def test_events_long_poll_rereads_status_after_each_wake_up(monkeypatch):
+    # The filter hides the terminal event itself, so only the status says
+    # the execution is over.
+    cursor = _FeedCursor([[], []])
+    _use_cursor(monkeypatch, cursor)
+    monkeypatch.setattr(execution_api, "EVENTS_TAIL_RECHECK_SECONDS", 30.0)
+
+    task = asyncio.create_task(execution_api.get_execution_events(
+        "42", page=1, page_size=10, since_event_id=10, event_type="call.done",
+        before_event_id=None, order="asc", include_total=False, wait_seconds=30,
+    ))
+    while execution_api.event_notifier.waiting("42") == 0:
+        await asyncio.sleep(0)
+    cursor._terminal_event = {"event_type": "playbook.completed", "node_name": "end", "status": "COMPLETED"}
+    notify_execution_events(42)
+    result = await asyncio.wait_for(task, timeout=5)
+
+    assert len(_page_statements(cursor)) == 2
+    assert result["events"] == []
+    assert result["status"] == "COMPLETED"
+    assert result["path"] == "tests/feed"
+
+
+@pytest.mark.asyncio
+async def test_events_next_cursor_names_its_parameter_per_direction(monkeypatch):
+    cursor = _FeedCursor([
+        [_event_row(event_id) for event_id in range(11, 22)],
+        [_event_row(event_id) for event_id in range(500, 489, -1)],
+    ])
+    _use_cursor(monkeypatch, cursor)
+    kwargs = dict(page=1, page_size=10, event_type=None, include_total=False, wait_seconds=0)
+
+    ascending = await execution_api.get_execution_events(
+        "42", since_event_id=10, before_event_id=None, order="asc", **kwargs
+    )
+    descending = await execution_api.get_execution_events(
+        "42", since_event_id=None, before_event_id=501, order="desc", **kwargs
+    )
+
+    assert ascending["pagination"]["next_cursor"] == "20"
+    assert ascending["pagination"]["next_cursor_param"] == "since_event_id"
+    assert descending["pagination"]["next_cursor"] == "491"
+    assert descending["pagination"]["next_cursor_param"] == "before_event_id"
+
+
+@pytest.mark.asyncio
+async def test_notifier_resolves_and_forgets_waiters():
+    notifier = ExecutionEventNotifier()
+    first = notifier.register(7)
+    second = notifier.register("7")
+    other = notifier.register(8)
+
+    assert notifier.waiting(7) == 2
+    assert notifier.notify(7) == 2
+    assert first.done() and second.done()
+    assert not other.done()
+    assert notifier.waiting(7) == 0
+
+    notifier.discard(8, other)
+    assert notifier.waiting(8) == 0
+    assert notifier.notify(8) == 0
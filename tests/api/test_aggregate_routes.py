@@ -8,4 +8,5 @@ def test_aggregate_routes_registered():
 
     paths = {r.path for r in app.routes}
     assert "/api/aggregate/loop/results" in paths
+    assert "/api/aggregate/loop/results/stream" in paths
 
@@ -134,3 +134,136 @@ def test_claim_topology_metadata_records_locator_and_placement():
         meta["worker_locator"]
         == "noetl://tenant/tenant-a/org/org-a/cluster/cluster-a/node/node-a/worker/worker-cpu-01"
     )
+
+
+@pytest.mark.asyncio
+async def test_claim_command_fast_json_embeds_raw_context(monkeypatch):
+    import json
+
+    from noetl.server.api.core import commands, events
+    from noetl.server.api.core.models import ClaimRequest
+
+    class _RawContextCursor(_FakeCursor):
+        async def fetchone(self):
+            row = await super().fetchone()
+            if row and "context" in row:
+                assert "context::text AS context" in self.query
+                row = {**row, "context": '{"url": "https://example.test", "n": 1}'}
+            return row
+
+    cursor = _RawContextCursor()
+    conn = _FakeConnection(cursor)
+
+    async def fake_next_snowflake_id(_cur):
+        return 501
+
+    async def noop(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setenv("NOETL_FAST_JSON", "true")
+    monkeypatch.setattr(commands, "get_pool_connection", lambda **_kwargs: conn)
+    monkeypatch.setattr(commands, "_next_snowflake_id", fake_next_snowflake_id)
+    monkeypatch.setattr(commands, "_active_claim_cache_get", lambda _event_id: None)
+    monkeypatch.setattr(commands, "_active_claim_cache_set", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(commands, "_record_db_operation_success", lambda: None)
+    monkeypatch.setattr(events, "_enqueue_event_outbox", noop)
+    monkeypatch.setattr(events, "_drain_core_outbox", noop)
+
+    response = await commands.claim_command(100, ClaimRequest(worker_id="worker-1"))
+
+    body = json.loads(response.body)
+    assert body["status"] == "ok"
+    assert body["context"] == {"url": "https://example.test", "n": 1}
+    assert body["meta"] == {"stage_id": "stage-1"}
+    assert set(body) == set(commands.ClaimResponse.model_fields)
+
+
+def test_claim_response_validates_non_object_raw_context():
+    from pydantic import ValidationError
+
+    from noetl.server.api.core import commands
+
+    kwargs = {"event_id": 1, "execution_id": 7, "step": "fetch", "tool_kind": "http", "meta": {}}
+
+    fast = commands._claim_response(context=commands.RawJson('{"n": 1}'), **kwargs)
+    assert fast.body.count(b'"context":{"n": 1}') == 1
+    with pytest.raises(ValidationError):
+        commands._claim_response(context=commands.RawJson("[1, 2]"), **kwargs)
+
+
+class _PreferredCursor(_FakeCursor):
+    """Command issued just now whose inputs are local to ``worker-a``."""
+
+    async def fetchone(self):
+        if "FROM noetl.runtime" in self.query:
+            return {"status": "ready", "heartbeat": datetime.now(timezone.utc)}
+        row = await super().fetchone()
+        if row and "command_id" in row and "meta" in row:
+            row = {
+                **row,
+                "created_at": datetime.now(timezone.utc),
+                "meta": {"locality_preference": {"worker_id": "worker-a", "bytes": 5 << 20, "window_seconds": 2.0}},
+            }
+        return row
+
+
+def _patch_claim(monkeypatch, conn):
+    from noetl.server.api.core import commands, events
+
+    async def fake_next_snowflake_id(_cur):
+        return 501
+
+    async def noop(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(commands, "get_pool_connection", lambda **_kwargs: conn)
+    monkeypatch.setattr(commands, "_next_snowflake_id", fake_next_snowflake_id)
+    monkeypatch.setattr(commands, "_active_claim_cache_get", lambda _event_id: None)
+    monkeypatch.setattr(commands, "_active_claim_cache_set", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(commands, "_record_db_operation_success", lambda: None)
+    monkeypatch.setattr(events, "_enqueue_event_outbox", noop)
+    monkeypatch.setattr(events, "_drain_core_outbox", noop)
+    return commands
+
+
+@pytest.mark.asyncio
+async def test_claim_command_holds_back_other_workers_inside_locality_window(monkeypatch):
+    from fastapi import HTTPException
+
+    from noetl.server.api.core.models import ClaimRequest
+
+    commands = _patch_claim(monkeypatch, _FakeConnection(_PreferredCursor()))
+
+    with pytest.raises(HTTPException) as excinfo:
+        await commands.claim_command(100, ClaimRequest(worker_id="worker-b"))
+
+    assert excinfo.value.status_code == 409
+    assert excinfo.value.detail["code"] == "locality_preferred"
+    assert excinfo.value.detail["worker_id"] == "worker-a"
+    assert 0 < float(excinfo.value.headers["Retry-After"]) <= 2.0
+
+
+@pytest.mark.asyncio
+async def test_claim_command_lets_preferred_worker_claim_immediately(monkeypatch):
+    from noetl.server.api.core.models import ClaimRequest
+
+    cursor = _PreferredCursor()
+    commands = _patch_claim(monkeypatch, _FakeConnection(cursor))
+
+    response = await commands.claim_command(100, ClaimRequest(worker_id="worker-a"))
+
+    assert response.status == "ok"
+    assert not any("FROM noetl.runtime" in query for query, _params in cursor.executed)
+
+
+def test_locality_preference_meta_points_at_largest_input_producer():
+    from noetl.server.api.core.commands import _locality_preference_meta, _preferred_worker_from_meta
+
+    ref = {"kind": "result_ref", "ref": "noetl://execution/7/result/load/1", "meta": {"bytes": 8 << 20},
+           "locality": {"worker_id": "worker-a", "node_id": "node-a"}}
+    meta = _locality_preference_meta({"render_context": {"load": {"_ref": ref}}})
+
+    assert meta["source_locality"] == {"worker_id": "worker-a", "node_id": "node-a"}
+    assert meta["locality_preference"]["worker_id"] == "worker-a"
+    assert _preferred_worker_from_meta(meta) == "worker-a"
+    assert _locality_preference_meta({"render_context": {"x": 1}}) == {}
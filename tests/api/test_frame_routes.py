@@ -342,7 +342,7 @@ async def test_load_idempotent_claimed_frame_matches_worker_slot_and_frame_index
 
 
 @pytest.mark.asyncio
-async def test_load_frame_by_claim_key_matches_pending_frame():
+async def test_claim_frame_batch_leases_by_claim_key_in_one_statement():
     from noetl.server.api.frames import endpoint
 
     class Cursor:
@@ -352,23 +352,111 @@ async def test_load_frame_by_claim_key_matches_pending_frame():
         async def execute(self, query, params=None):
             self.calls.append((query, params))
 
-        async def fetchone(self):
-            return {"frame_id": 9, "status": "PENDING"}
+        async def fetchall(self):
+            return [{"frame_id": 11, "status": "CLAIMED"}, {"frame_id": 9, "status": "CLAIMED"}]
 
     cur = Cursor()
 
-    frame = await endpoint._load_frame_by_claim_key(
+    frames = await endpoint._claim_frame_batch(
         cur,
         stage_id=8,
-        cursor={"worker_slot_id": "slot-1", "frame_index": 3},
+        worker_id="worker-a",
+        command_id=5,
+        lease_seconds=60,
+        limit=2,
+        claim_key=(8, "slot-1", "3"),
     )
 
-    assert frame == {"frame_id": 9, "status": "PENDING"}
+    assert [frame["frame_id"] for frame in frames] == [9, 11]
+    assert len(cur.calls) == 1
     query, params = cur.calls[0]
+    assert "FOR UPDATE SKIP LOCKED" in query
+    assert "UPDATE noetl.frame" in query
     assert "f.cursor->>'worker_slot_id'" in query
-    assert "f.cursor->>'frame_index'" in query
     assert "PENDING" in query
-    assert params == (8, "slot-1", "3")
+    assert params["limit"] == 2
+    assert (params["worker_slot_id"], params["frame_index"]) == ("slot-1", "3")
+
+
+@pytest.mark.asyncio
+async def test_mint_frames_inserts_shortfall_in_one_statement(monkeypatch):
+    from noetl.server.api.frames import endpoint
+
+    class Cursor:
+        def __init__(self):
+            self.calls = []
+
+        async def execute(self, query, params=None):
+            self.calls.append((query, params))
+
+        async def fetchone(self):
+            return {"frame_id": 3}
+
+        async def fetchall(self):
+            return [{"frame_id": 10}, {"frame_id": 11}, {"frame_id": 12}]
+
+    async def next_snowflake_ids(_cur, count):
+        return [12, 10, 11][:count]
+
+    monkeypatch.setattr(endpoint, "_next_snowflake_ids", next_snowflake_ids)
+    cur = Cursor()
+
+    minted = await endpoint._mint_frames(
+        cur,
+        stage={"stage_id": 8, "execution_id": 7, "tenant_id": "tenant-a", "organization_id": "org-a"},
+        command_id=5,
+        cursor={},
+        count=3,
+    )
+
+    assert minted == [10, 11, 12]
+    inserts = [(query, params) for query, params in cur.calls if "INSERT INTO noetl.frame" in query]
+    assert len(inserts) == 1
+    query, params = inserts[0]
+    assert "ON CONFLICT DO NOTHING" in query
+    # (frame_id, parent_frame_id) pairs chain in id order from the latest frame.
+    rows = [params[i:i + 8] for i in range(0, len(params), 8)]
+    assert [(row[0], row[3]) for row in rows] == [(10, 3), (11, 10), (12, 11)]
+
+
+@pytest.mark.asyncio
+async def test_insert_frame_events_writes_one_multi_row_insert(monkeypatch):
+    from noetl.server.api.frames import endpoint
+
+    class Cursor:
+        def __init__(self):
+            self.calls = []
+
+        async def execute(self, query, params=None):
+            self.calls.append((query, params))
+
+    monkeypatch.delenv("NOETL_EVENT_MIRROR_ENABLED", raising=False)
+    frame = {
+        "frame_id": 9,
+        "stage_id": 8,
+        "execution_id": 7,
+        "catalog_id": 6,
+        "tenant_id": "tenant-a",
+        "organization_id": "org-a",
+        "step_name": "fetch_rows",
+    }
+    cur = Cursor()
+
+    events = await endpoint._insert_frame_events(
+        cur,
+        [
+            {"frame": frame, "event_type": "frame.abandoned", "status": "ABANDONED", "worker_id": "w0", "event_id": 40},
+            {"frame": frame, "event_type": "frame.dispatched", "status": "CLAIMED", "worker_id": "w1", "event_id": 41},
+        ],
+    )
+
+    assert [event["stream_version"] for event in events] == [40, 41]
+    assert len(cur.calls) == 1
+    query, params = cur.calls[0]
+    assert query.count("%(event_id_") == 2
+    assert params["event_type_0"] == "frame.abandoned"
+    assert params["event_type_1"] == "frame.dispatched"
+    assert params["envelope_checksum_1"] == events[1]["envelope_checksum"]
 
 
 @pytest.mark.asyncio
@@ -475,6 +563,10 @@ class _ClaimEndpointCursor:
             "owner_worker": "worker-new",
             "lease_until": "later",
             "attempts": 2,
+            "claimed_event_id": 102,
+            "previous_owner_worker": "worker-old",
+            "previous_lease_until": "expired",
+            "previous_attempts": 1,
         }
 
     async def execute(self, query, params=None):
@@ -482,12 +574,18 @@ class _ClaimEndpointCursor:
 
     async def fetchone(self):
         query = self.queries[-1][0]
-        if "SELECT f.*" in query:
-            return self.expired_frame
-        if "UPDATE noetl.frame" in query and "RETURNING *" in query:
-            return self.claimed_frame
+        if "SELECT *" in query:
+            return None
         raise AssertionError(f"Unexpected fetchone query: {query}")
 
+    async def fetchall(self):
+        query = self.queries[-1][0]
+        if "WITH candidates" in query:
+            return [self.claimed_frame]
+        if "noetl.snowflake_id()" in query:
+            return [{"snowflake_id": 101}]
+        raise AssertionError(f"Unexpected fetchall query: {query}")
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
@@ -641,9 +739,9 @@ async def test_claim_frames_reclaims_expired_frame_with_abandoned_event(monkeypa
     async def resolve_command_id(_cur, **_kwargs):
         return 5
 
-    async def insert_frame_event(_cur, **kwargs):  # noqa: ARG001
-        emitted.append(kwargs)
-        return {"event_id": 100 + len(emitted), "event_type": kwargs["event_type"]}
+    async def insert_frame_events(_cur, specs):  # noqa: ARG001
+        emitted.extend(specs)
+        return [{"event_id": spec["event_id"], "event_type": spec["event_type"]} for spec in specs]
 
     async def drain_frame_outbox():
         return None
@@ -651,7 +749,7 @@ async def test_claim_frames_reclaims_expired_frame_with_abandoned_event(monkeypa
     monkeypatch.setattr(endpoint, "get_pool_connection", lambda: _ConnCtx(conn))
     monkeypatch.setattr(endpoint, "_load_stage", load_stage)
     monkeypatch.setattr(endpoint, "_resolve_claim_command_id", resolve_command_id)
-    monkeypatch.setattr(endpoint, "_insert_frame_event", insert_frame_event)
+    monkeypatch.setattr(endpoint, "_insert_frame_events", insert_frame_events)
     monkeypatch.setattr(endpoint, "_drain_frame_outbox", drain_frame_outbox)
 
     response = await endpoint.claim_frames(
@@ -679,6 +777,8 @@ async def test_claim_frames_reclaims_expired_frame_with_abandoned_event(monkeypa
     }
     assert emitted[1]["meta_extra"]["attempt"] == 2
     assert emitted[1]["meta_extra"]["recovery"]["retry_mode"] == "whole_frame"
+    assert emitted[0]["event_id"] == 101
+    assert sum("INSERT INTO noetl.frame" in query for query, _ in cursor.queries) == 0
     assert conn.commits == 1
 
 
@@ -701,34 +801,19 @@ async def test_claim_frames_mints_without_advisory_lock(monkeypatch):
             query = self.queries[-1][0]
             if "SELECT *" in query:
                 return None
-            if "SELECT f.*" in query:
+            if "SELECT frame_id" in query:
                 return None
+            raise AssertionError(f"Unexpected fetchone query: {query}")
+
+        async def fetchall(self):
+            query, params = self.queries[-1]
             if "INSERT INTO noetl.frame" in query:
-                return {
-                    "frame_id": 9,
-                    "stage_id": 8,
-                    "execution_id": 7,
-                    "parent_frame_id": None,
-                    "command_id": 5,
-                    "claimed_event_id": None,
-                    "terminal_event_id": None,
-                    "cursor": {
-                        "worker_slot_id": "slot-1",
-                        "frame_index": 0,
-                        "source_locality": {"zone": "us-central1-a"},
-                    },
-                    "row_count": 0,
-                    "status": "PENDING",
-                    "owner_worker": None,
-                    "lease_until": None,
-                    "output_ref": None,
-                    "events_emitted": 0,
-                    "attempts": 0,
-                    "tenant_id": "tenant-a",
-                    "organization_id": "org-a",
-                }
-            if "UPDATE noetl.frame" in query and "RETURNING *" in query:
-                return {
+                return [{"frame_id": 9}]
+            if "WITH candidates" in query and "frame_ids" not in params:
+                return []
+            if "WITH candidates" in query:
+                assert params["frame_ids"] == [9]
+                return [{
                     "frame_id": 9,
                     "stage_id": 8,
                     "execution_id": 7,
@@ -750,11 +835,9 @@ async def test_claim_frames_mints_without_advisory_lock(monkeypatch):
                     "attempts": 1,
                     "tenant_id": "tenant-a",
                     "organization_id": "org-a",
-                    "step_name": "fetch_rows",
-                }
-            if "SELECT frame_id" in query:
-                return None
-            raise AssertionError(f"Unexpected fetchone query: {query}")
+                    "expired_lease": False,
+                }]
+            raise AssertionError(f"Unexpected fetchall query: {query}")
 
     cursor = Cursor()
     conn = _FrameEndpointConn(cursor)
@@ -778,12 +861,12 @@ async def test_claim_frames_mints_without_advisory_lock(monkeypatch):
     async def resolve_command_id(_cur, **_kwargs):
         return 5
 
-    async def next_snowflake_id(_cur):
-        return 9
+    async def next_snowflake_ids(_cur, count):
+        return list(range(9, 9 + count))
 
-    async def insert_frame_event(_cur, **kwargs):  # noqa: ARG001
-        emitted.append(kwargs)
-        return {"event_id": kwargs["event_id"], "event_type": kwargs["event_type"]}
+    async def insert_frame_events(_cur, specs):  # noqa: ARG001
+        emitted.extend(specs)
+        return [{"event_id": spec["event_id"], "event_type": spec["event_type"]} for spec in specs]
 
     async def drain_frame_outbox():
         return None
@@ -791,8 +874,8 @@ async def test_claim_frames_mints_without_advisory_lock(monkeypatch):
     monkeypatch.setattr(endpoint, "get_pool_connection", lambda: _ConnCtx(conn))
     monkeypatch.setattr(endpoint, "_load_stage", load_stage)
     monkeypatch.setattr(endpoint, "_resolve_claim_command_id", resolve_command_id)
-    monkeypatch.setattr(endpoint, "_next_snowflake_id", next_snowflake_id)
-    monkeypatch.setattr(endpoint, "_insert_frame_event", insert_frame_event)
+    monkeypatch.setattr(endpoint, "_next_snowflake_ids", next_snowflake_ids)
+    monkeypatch.setattr(endpoint, "_insert_frame_events", insert_frame_events)
     monkeypatch.setattr(endpoint, "_drain_frame_outbox", drain_frame_outbox)
 
     response = await endpoint.claim_frames(
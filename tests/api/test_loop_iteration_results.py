@@ -0,0 +1,213 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+
+def test_loop_iteration_result_row_from_call_done_meta():
+    from noetl.server.api.core.loop_results import _loop_iteration_result_row
+
+    now = datetime.now(timezone.utc)
+    row = _loop_iteration_result_row(
+        execution_id=11,
+        step="fetch:task_sequence",
+        event_name="call.done",
+        event_id=99,
+        command_id=5,
+        payload={"response": {"status": "ok"}},
+        meta={"__loop_epoch_id": "loop-1", "loop_iteration_index": "3"},
+        result_obj={"status": "COMPLETED", "reference": {"ref": "noetl://x"}},
+        created_at=now,
+    )
+
+    assert row is not None
+    assert row[:7] == (11, "loop-1", 3, "fetch", 99, 5, "COMPLETED")
+    assert row[7].obj == {"status": "COMPLETED", "reference": {"ref": "noetl://x"}}
+    assert row[8] is now
+
+
+def test_loop_iteration_result_row_ignores_non_loop_and_non_terminal_events():
+    from noetl.server.api.core.loop_results import _loop_iteration_result_row
+
+    common = dict(
+        execution_id=1,
+        step="s",
+        event_id=2,
+        command_id=None,
+        result_obj={"status": "COMPLETED"},
+        created_at=datetime.now(timezone.utc),
+    )
+    assert _loop_iteration_result_row(event_name="call.done", payload={}, meta={}, **common) is None
+    assert (
+        _loop_iteration_result_row(
+            event_name="step.exit",
+            payload={"loop_event_id": "l", "loop_iteration_index": 0},
+            meta={},
+            **common,
+        )
+        is None
+    )
+    failed = _loop_iteration_result_row(
+        event_name="call.error",
+        payload={"loop_event_id": "l", "loop_iteration_index": 0},
+        meta={},
+        **common,
+    )
+    assert failed[1:3] == ("l", 0) and failed[6] == "FAILED"
+
+
+class _PagedCursor:
+    def __init__(self, rows, latest_loop_event_id="loop-1"):
+        self.rows = rows
+        self.latest_loop_event_id = latest_loop_event_id
+        self.executed = []
+        self._result = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def execute(self, query, params=None):
+        self.executed.append((query, params))
+        if "ORDER BY event_id DESC" in query:
+            self._result = [{"loop_event_id": self.latest_loop_event_id}] if self.rows else []
+            return
+        _exec_id, _loop_event_id, last_index, limit = params
+        self._result = [r for r in self.rows if r["iteration_index"] > last_index][:limit]
+
+    async def fetchone(self):
+        return self._result[0] if self._result else None
+
+    async def fetchall(self):
+        return list(self._result)
+
+
+class _Conn:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self, **_kwargs):
+        return self._cursor
+
+
+@pytest.mark.asyncio
+async def test_iter_loop_iteration_results_pages_in_index_order(monkeypatch):
+    from noetl.server.api.aggregate import service
+
+    rows = [
+        {"iteration_index": i, "loop_event_id": "loop-1", "result": {"status": "COMPLETED", "context": {"i": i}}}
+        for i in range(5)
+    ]
+    cursor = _PagedCursor(rows)
+
+    @asynccontextmanager
+    async def _fake_connection():
+        yield _Conn(cursor)
+
+    monkeypatch.setattr(service, "get_async_db_connection", _fake_connection)
+
+    seen = [
+        row["iteration_index"]
+        async for row in service.AggregateService.iter_loop_iteration_results("7", "fetch", page_size=2)
+    ]
+
+    assert seen == [0, 1, 2, 3, 4]
+    range_reads = [params for query, params in cursor.executed if "iteration_index >" in query]
+    assert [params[2] for params in range_reads] == [-1, 1, 3]
+    assert all(params[0] == 7 and params[1] == "loop-1" for params in range_reads)
+
+
+@pytest.mark.asyncio
+async def test_get_loop_iteration_results_prefers_materialized_rows(monkeypatch):
+    from noetl.server.api.aggregate import service
+
+    cursor = _PagedCursor([{"iteration_index": 0, "loop_event_id": "loop-1", "result": {"status": "COMPLETED"}}])
+
+    @asynccontextmanager
+    async def _fake_connection():
+        yield _Conn(cursor)
+
+    monkeypatch.setattr(service, "get_async_db_connection", _fake_connection)
+
+    response = await service.AggregateService.get_loop_iteration_results("7", "fetch")
+
+    assert response.method == "loop_iteration_result"
+    assert response.results == [{"status": "COMPLETED"}]
+    assert not any("noetl.event" in query for query, _ in cursor.executed)
+
+
+@pytest.mark.parametrize(
+    ("result_obj", "status"),
+    [
+        ({"status": "COMPLETED", "context": {"skipped": True}}, "SKIPPED"),
+        ({"status": "COMPLETED", "context": {"data": [{"reason": "control_step"}]}}, "SKIPPED"),
+        ({"status": "COMPLETED", "context": {"skipped": False, "reason": "other"}}, "COMPLETED"),
+    ],
+)
+def test_loop_iteration_result_row_classifies_skipped_results(result_obj, status):
+    from noetl.server.api.core.loop_results import _loop_iteration_result_row
+
+    row = _loop_iteration_result_row(
+        execution_id=1,
+        step="s",
+        event_name="call.done",
+        event_id=2,
+        command_id=None,
+        payload={"loop_event_id": "l", "loop_iteration_index": 0},
+        meta={},
+        result_obj=result_obj,
+        created_at=datetime.now(timezone.utc),
+    )
+
+    assert row[6] == status
+
+
+@pytest.mark.asyncio
+async def test_materialized_read_filters_on_status_only(monkeypatch):
+    from noetl.server.api.aggregate import service
+
+    cursor = _PagedCursor([{"iteration_index": 0, "loop_event_id": "loop-1", "result": {"status": "COMPLETED"}}])
+
+    @asynccontextmanager
+    async def _fake_connection():
+        yield _Conn(cursor)
+
+    monkeypatch.setattr(service, "get_async_db_connection", _fake_connection)
+
+    [row async for row in service.AggregateService.iter_loop_iteration_results("7", "fetch")]
+
+    range_query = next(query for query, _ in cursor.executed if "iteration_index >" in query)
+    assert "status = 'COMPLETED'" in range_query
+    assert "LIKE" not in range_query and "::text" not in range_query
+
+
+class _EventLogCursor(_PagedCursor):
+    async def execute(self, query, params=None):
+        self.executed.append((query, params))
+        if "noetl.event" in query:
+            self._result = [{"result": {"data": {"i": 1}}}]
+        else:
+            self._result = []
+
+
+@pytest.mark.asyncio
+async def test_event_log_fallback_keeps_the_requested_loop_epoch(monkeypatch):
+    from noetl.server.api.aggregate import service
+
+    cursor = _EventLogCursor([])
+
+    @asynccontextmanager
+    async def _fake_connection():
+        yield _Conn(cursor)
+
+    monkeypatch.setattr(service, "get_async_db_connection", _fake_connection)
+
+    response = await service.AggregateService.get_loop_iteration_results("7", "fetch", loop_event_id="loop-2")
+
+    assert response.method == "loop_metadata"
+    assert response.results == [{"i": 1}]
+    query, params = next((q, p) for q, p in cursor.executed if "noetl.event" in q)
+    assert "__loop_epoch_id') = %s" in query
+    assert params == (7, "fetch", "loop-2", "loop-2")
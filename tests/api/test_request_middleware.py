@@ -0,0 +1,86 @@
+import asyncio
+import logging
+
+import httpx
+import pytest
+
+from noetl.server import middleware
+from noetl.server.middleware import RequestMiddleware
+
+
+def _client(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_request_middleware_streams_body_without_wrapping_receive(monkeypatch):
+    monkeypatch.setattr(middleware.logger, "isEnabledFor", lambda level: False)
+    seen = {}
+    paths = []
+
+    async def app(scope, receive, send):
+        seen["receive"] = receive
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        await send({"type": "http.response.start", "status": 202, "headers": []})
+        await send({"type": "http.response.body", "body": str(len(body)).encode()})
+
+    outer_receive = {}
+    wrapped = RequestMiddleware(app, on_request=paths.append)
+
+    async def entry(scope, receive, send):
+        outer_receive["receive"] = receive
+        await wrapped(scope, receive, send)
+
+    async with _client(entry) as client:
+        response = await client.post("/api/events/batch", content=b"x" * 100_000)
+
+    assert response.status_code == 202
+    assert response.text == "100000"
+    assert seen["receive"] is outer_receive["receive"]
+    assert paths == ["/api/events/batch"]
+
+
+@pytest.mark.asyncio
+async def test_request_middleware_maps_errors_and_timeouts(monkeypatch):
+    monkeypatch.setattr(middleware.logger, "isEnabledFor", lambda level: False)
+
+    async def failing(scope, receive, send):
+        raise RuntimeError("boom")
+
+    async def slow(scope, receive, send):
+        await asyncio.sleep(1)
+
+    async with _client(RequestMiddleware(failing)) as client:
+        response = await client.get("/api/claim")
+    assert response.status_code == 500
+    assert response.text == "Detail: boom"
+
+    async with _client(RequestMiddleware(slow, timeout_seconds=0.01)) as client:
+        response = await client.get("/api/claim")
+    assert response.status_code == 504
+
+
+@pytest.mark.asyncio
+async def test_request_middleware_debug_logs_bounded_payload_meta(monkeypatch):
+    monkeypatch.setattr(middleware.logger, "isEnabledFor", lambda level: level == logging.DEBUG)
+    records = []
+    monkeypatch.setattr(middleware.logger, "debug", lambda msg, *args: records.append(args))
+
+    async def app(scope, receive, send):
+        await receive()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b'{"status": "ok"}'})
+
+    async with _client(RequestMiddleware(app)) as client:
+        response = await client.post("/api/events", json={"a": 1, "b": 2})
+
+    assert response.json() == {"status": "ok"}
+    method, url, _elapsed, status, request_meta, response_meta = records[0]
+    assert (method, url, status) == ("POST", "/api/events", 200)
+    assert request_meta == {"bytes": 13, "kind": "object", "key_count": 2, "keys": ["a", "b"]}
+    assert response_meta["keys"] == ["status"]
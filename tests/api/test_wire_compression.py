@@ -0,0 +1,173 @@
+import gzip
+import json
+
+import httpx
+import pytest
+
+from noetl.core import wire_compression
+from noetl.core.wire_compression import RequestCompressor, choose_encoding, post_json
+from noetl.server.middleware import WireCompressionMiddleware
+
+
+def _json_app(seen):
+    async def app(scope, receive, send):
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        seen.append({"headers": dict(scope["headers"]), "body": json.loads(body) if body else None})
+        size = (seen[-1]["body"] or {}).get("reply_bytes", 10)
+        payload = json.dumps({"context": "x" * size}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+    return app
+
+
+def _recording(app, wire):
+    async def entry(scope, receive, send):
+        wire.append(dict(scope.get("headers") or []).get(b"content-encoding"))
+        await app(scope, receive, send)
+
+    return entry
+
+
+def _client(app, **kwargs):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_middleware_decodes_requests_and_compresses_large_responses():
+    seen = []
+    app = WireCompressionMiddleware(_json_app(seen))
+    body = gzip.compress(json.dumps({"reply_bytes": 50_000, "payload": "y" * 20_000}).encode())
+
+    async with _client(app) as client:
+        response = await client.post(
+            "/api/commands/7/claim",
+            content=body,
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json", "Accept-Encoding": "gzip"},
+        )
+        small = await client.post("/api/events", json={"reply_bytes": 10}, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < 50_000
+    assert response.json() == {"context": "x" * 50_000}
+    assert "gzip" in response.headers["accept-encoding"]
+    assert seen[0]["body"]["payload"] == "y" * 20_000
+    assert b"content-encoding" not in seen[0]["headers"]
+
+    assert "content-encoding" not in small.headers
+    assert "gzip" in small.headers["accept-encoding"]
+
+
+@pytest.mark.asyncio
+async def test_middleware_rejects_unknown_and_oversized_encodings(monkeypatch):
+    seen = []
+    app = WireCompressionMiddleware(_json_app(seen))
+    monkeypatch.setenv("NOETL_WIRE_MAX_DECOMPRESSED_BYTES", "1000")
+
+    async with _client(app) as client:
+        unknown = await client.post("/api/events", content=b"{}", headers={"Content-Encoding": "br"})
+        bomb = await client.post(
+            "/api/events/batch",
+            content=gzip.compress(b"[" + b"0," * 10_000 + b"0]"),
+            headers={"Content-Encoding": "gzip"},
+        )
+        other = await client.post("/api/catalog/list", json={}, headers={"Accept-Encoding": "gzip"})
+
+    assert unknown.status_code == 415
+    assert "gzip" in unknown.headers["accept-encoding"]
+    assert bomb.status_code == 413
+    assert "accept-encoding" not in other.headers
+    assert len(seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_post_json_compresses_only_after_the_server_advertises_it(monkeypatch):
+    # zstd wins when ``zstandard`` is installed; pin the gzip path.
+    monkeypatch.setattr(wire_compression, "HAS_ZSTD", False)
+    monkeypatch.setenv("NOETL_WIRE_COMPRESSION_MIN_BYTES", "1024")
+    seen, wire = [], []
+    compressor = RequestCompressor()
+    app = _recording(WireCompressionMiddleware(_json_app(seen)), wire)
+    event = {"reply_bytes": 10, "payload": "z" * 5000}
+
+    async with _client(app, event_hooks={"response": [compressor.observe_response]}) as client:
+        first = await post_json(client, "http://test/api/events", event, request_compressor=compressor)
+        second = await post_json(client, "http://test/api/events", event, request_compressor=compressor)
+        small = await post_json(client, "http://test/api/events", {"reply_bytes": 1}, request_compressor=compressor)
+
+    assert [first.status_code, second.status_code, small.status_code] == [200, 200, 200]
+    assert wire == [None, b"gzip", None]
+    assert seen[0]["body"] == seen[1]["body"] == event
+
+
+@pytest.mark.asyncio
+async def test_post_json_resends_plain_json_when_compression_is_refused():
+    compressor = RequestCompressor()
+    compressor.observe("http://test/api/events", {"accept-encoding": "gzip"})
+    encodings = []
+
+    async def app(scope, receive, send):
+        encoding = dict(scope["headers"]).get(b"content-encoding")
+        encodings.append(encoding)
+        status = 415 if encoding else 200
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    async with _client(app) as client:
+        response = await post_json(
+            client, "http://test/api/events", {"payload": "z" * 20_000}, request_compressor=compressor
+        )
+
+    assert response.status_code == 200
+    assert encodings == [b"gzip", None]
+    assert compressor.encoding_for("http://test/api/events") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status", "body", "resent"),
+    [
+        (400, b"Detail: Invalid gzip body: incorrect header check", True),
+        (400, b'{"detail": "Invalid event payload"}', False),
+        (422, b'{"detail": [{"loc": ["body", "name"]}]}', False),
+    ],
+)
+async def test_post_json_resends_plain_json_only_for_decoding_errors(status, body, resent):
+    compressor = RequestCompressor()
+    compressor.observe("http://test/api/events", {"accept-encoding": "gzip"})
+    encodings = []
+
+    async def app(scope, receive, send):
+        encoding = dict(scope["headers"]).get(b"content-encoding")
+        encodings.append(encoding)
+        await send({"type": "http.response.start", "status": status if encoding else 200, "headers": []})
+        await send({"type": "http.response.body", "body": body if encoding else b"{}"})
+
+    async with _client(app) as client:
+        response = await post_json(
+            client, "http://test/api/events", {"payload": "z" * 20_000}, request_compressor=compressor
+        )
+
+    if resent:
+        assert (response.status_code, encodings) == (200, [b"gzip", None])
+        assert compressor.encoding_for("http://test/api/events") is None
+    else:
+        assert (response.status_code, encodings) == (status, [b"gzip"])
+        assert compressor.encoding_for("http://test/api/events") == "gzip"
+
+
+def test_choose_encoding_honours_quality_values():
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, deflate") is None
+    assert choose_encoding("*") is not None
+    assert choose_encoding(None) is None
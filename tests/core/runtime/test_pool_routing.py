@@ -16,6 +16,7 @@ from noetl.core.runtime.pool_routing import (
     POOL_FILTER_MAP,
     POOL_PATH_PREFIX_MAP,
     ROUTING_ENABLED_ENV,
+    affinity_subject,
     command_stream_subjects,
     is_routing_enabled,
     pool_segment_for_kind,
@@ -303,3 +304,11 @@ def test_route_subject_path_routing_disabled_when_flag_off(routing_off):
         )
         == "noetl.commands"
     )
+
+
+def test_affinity_subject_stays_outside_the_command_stream():
+    """Direct worker nudges must not be captured by ``<base>.>``."""
+    subject = affinity_subject("noetl.commands", "worker-1a2b.pod/0")
+    assert subject == "noetl.commands-affinity.worker-1a2b_pod_0"
+    assert not subject.startswith("noetl.commands.")
+    assert subject not in command_stream_subjects("noetl.commands")
@@ -139,6 +139,22 @@ def test_producer_scrub_payload_uses_context_secret_values():
     assert scrubbed["value"] == "[REDACTED]"
 
 
+def test_producer_scrub_payload_strips_manifest_namespaces_at_any_depth():
+    manifest = build_keychain_manifest([{"name": "openai_token", "kind": "secret", "map": {"api_key": "x"}}])
+    deep = {"rows": [{"id": 1, "openai_token": {"api_key": "x"}}]}
+    for _ in range(25):
+        deep = {"nested": deep}
+    payload = {"_keychain_manifest": manifest, "data": deep, "keychain": {"a": 1}}
+
+    scrubbed = producer_scrub_payload(payload, {"_keychain_manifest": manifest})
+
+    assert "keychain" not in scrubbed
+    node = scrubbed["data"]
+    for _ in range(25):
+        node = node["nested"]
+    assert node == {"rows": [{"id": 1}]}
+
+
 def test_scrub_arrow_ipc_bytes_redacts_valid_rows():
     from noetl.core.storage.arrow_ipc import arrow_ipc_to_rows, rows_to_arrow_ipc
 
@@ -156,3 +172,36 @@ def test_scrub_arrow_ipc_bytes_redacts_valid_rows():
     assert safe_schema_digest
     assert safe_row_count == 1
     assert arrow_ipc_to_rows(safe_payload) == [{"id": 1, "Authorization": "[REDACTED]"}]
+
+
+def test_scrub_arrow_ipc_bytes_skips_row_decode_for_value_safe_columns(monkeypatch):
+    import noetl.core.storage.arrow_ipc as arrow_ipc
+    from noetl.core.storage.arrow_ipc import rows_to_arrow_ipc
+
+    payload, schema_digest, _row_count = rows_to_arrow_ipc([{"id": 1, "amount": 2.5}, {"id": 2, "amount": None}])
+    monkeypatch.setattr(arrow_ipc, "arrow_ipc_to_rows", lambda _payload: pytest.fail("rows must not be decoded"))
+
+    safe_payload, safe_schema_digest, safe_row_count, scrubbed = scrub_arrow_ipc_bytes(
+        payload,
+        schema_digest=schema_digest,
+    )
+
+    assert scrubbed is False
+    assert safe_payload == payload
+    assert safe_schema_digest == schema_digest
+    assert safe_row_count == 2
+
+
+def test_scrub_arrow_ipc_bytes_redacts_numeric_columns_by_name():
+    from noetl.core.storage.arrow_ipc import arrow_ipc_to_rows, rows_to_arrow_ipc
+
+    payload, schema_digest, row_count = rows_to_arrow_ipc([{"id": 1, "x_api_key": 12345}])
+
+    safe_payload, _digest, _count, scrubbed = scrub_arrow_ipc_bytes(
+        payload,
+        schema_digest=schema_digest,
+        row_count=row_count,
+    )
+
+    assert scrubbed is True
+    assert arrow_ipc_to_rows(safe_payload) == [{"id": 1, "x_api_key": "[REDACTED]"}]
@@ -0,0 +1,163 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from noetl.core.cursor_drivers import (
+    CursorDriverError,
+    get_driver,
+    keyset_partitions,
+    registered_kinds,
+)
+from noetl.core.cursor_drivers.postgres import PostgresCursorDriver, _Handle
+
+
+def test_keyset_partitions_are_disjoint_and_pad_surplus_slots():
+    parts = keyset_partitions([10, 20, 20, None], 4)
+
+    assert [(p.lower, p.upper, p.empty) for p in parts] == [
+        (None, 10, False),
+        (10, 20, False),
+        (20, None, False),
+        (None, None, True),
+    ]
+    assert parts[1].as_params() == {
+        "partition_index": 1,
+        "partition_count": 4,
+        "partition_lower": 10,
+        "partition_upper": 20,
+    }
+
+
+def test_duckdb_driver_is_registered():
+    assert "duckdb" in registered_kinds()
+    assert get_driver("duckdb").kind == "duckdb"
+
+
+@pytest.fixture
+def parquet_source(tmp_path):
+    path = tmp_path / "items.parquet"
+    table = pa.table({"id": list(range(1000)), "payload": [f"row-{i}" for i in range(1000)]})
+    pq.write_table(table, path, row_group_size=100)
+    return f"SELECT * FROM read_parquet('{path}')"
+
+
+async def _drain(driver, spec, batch=64):
+    handle = await driver.open(None, spec)
+    rows = []
+    try:
+        while True:
+            claimed = await driver.claim_many(handle, {}, batch)
+            if not claimed:
+                return rows
+            rows.extend(claimed)
+    finally:
+        await driver.close(handle)
+
+
+@pytest.mark.asyncio
+async def test_duckdb_partitioned_slots_cover_source_exactly_once(parquet_source):
+    driver = get_driver("duckdb")
+    specs = [
+        {"claim": parquet_source, "options": {"partition": "id"}, "worker_slot_index": i, "worker_count": 4}
+        for i in range(4)
+    ]
+
+    per_slot = await asyncio.gather(*(_drain(driver, spec) for spec in specs))
+
+    ids = [row["id"] for rows in per_slot for row in rows]
+    assert sorted(ids) == list(range(1000))
+    assert all(200 <= len(rows) <= 300 for rows in per_slot)
+    assert per_slot[0][0] == {"id": 0, "payload": "row-0"}
+
+
+@pytest.mark.asyncio
+async def test_duckdb_multi_slot_without_partition_key_is_rejected(parquet_source):
+    with pytest.raises(CursorDriverError):
+        await get_driver("duckdb").open(None, {"claim": parquet_source, "worker_count": 2})
+
+
+class _ClaimCursor:
+    def __init__(self, results):
+        self.results = results
+        self.executed = []
+        self._rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=None):
+        self.executed.append(params)
+        self._rows = self.results.pop(0) if self.results else []
+
+    async def fetchmany(self, size):
+        return self._rows[:size]
+
+
+class _Pool:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    @asynccontextmanager
+    async def connection(self):
+        cursor = self._cursor
+
+        class _Conn:
+            async def set_autocommit(self, value):
+                return None
+
+            def cursor(self, **_kwargs):
+                return cursor
+
+        yield _Conn()
+
+
+@pytest.mark.asyncio
+async def test_postgres_claim_binds_partition_then_drains_remainder():
+    from noetl.core.cursor_drivers import KeysetPartition
+
+    cursor = _ClaimCursor([[{"id": 5}], [], [{"id": 99}], []])
+    handle = _Handle(
+        pool=_Pool(cursor),
+        claim_sql="UPDATE ... WHERE id > %(partition_lower)s AND id <= %(partition_upper)s",
+        options={},
+        partition=KeysetPartition(index=1, count=3, lower=0, upper=10),
+    )
+    driver = PostgresCursorDriver()
+
+    assert await driver.claim_many(handle, {}, 10) == [{"id": 5}]
+    assert await driver.claim_many(handle, {}, 10) == [{"id": 99}]
+    assert await driver.claim_many(handle, {}, 10) == []
+
+    bounds = [(p["partition_lower"], p["partition_upper"]) for p in cursor.executed]
+    assert bounds == [(0, 10), (0, 10), (None, None), (None, None)]
+
+
+@pytest.mark.asyncio
+async def test_postgres_unpartitioned_claim_passes_no_params():
+    cursor = _ClaimCursor([[{"id": 1}]])
+    handle = _Handle(pool=_Pool(cursor), claim_sql="UPDATE ...", options={})
+
+    assert await PostgresCursorDriver().claim(handle, {}) == {"id": 1}
+    assert cursor.executed == [None]
+
+
+@pytest.mark.asyncio
+async def test_postgres_claim_without_partition_placeholders_keeps_literal_percent():
+    from noetl.core.cursor_drivers import KeysetPartition
+
+    cursor = _ClaimCursor([[{"id": 1}]])
+    handle = _Handle(
+        pool=_Pool(cursor),
+        claim_sql="UPDATE q SET status = 'claimed' WHERE name LIKE 'batch-%' RETURNING id",
+        options={},
+        partition=KeysetPartition(index=0, count=2, lower=None, upper=10),
+    )
+
+    assert await PostgresCursorDriver().claim(handle, {}) == {"id": 1}
+    assert cursor.executed == [None]
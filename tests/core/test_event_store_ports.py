@@ -57,9 +57,11 @@ async def test_postgres_event_store_append_rejects_expected_version_conflict(mon
             self.query = query
 
         async def fetchone(self):
-            if "max(stream_version)" in self.query:
+            if "UPDATE noetl.event_stream_head" in self.query:
+                return None
+            if "SELECT version FROM noetl.event_stream_head" in self.query:
                 return {"version": 3}
-            return {"snowflake_id": 99}
+            raise AssertionError(f"unexpected query: {self.query}")
 
     class Conn:
         def cursor(self, row_factory=None):  # noqa: ARG002
@@ -109,12 +111,15 @@ async def test_postgres_event_store_append_enqueues_outbox_before_drain(monkeypa
             self.executed.append((query, params))
 
         async def fetchone(self):
-            if "max(stream_version)" in self.query:
-                return {"version": 0}
-            if "snowflake_id" in self.query:
-                return {"snowflake_id": 9001}
+            if "noetl.event_stream_head" in self.query:
+                return {"version": 1}
             return None
 
+        async def fetchall(self):
+            if "snowflake_id" in self.query:
+                return [{"snowflake_id": 9001}]
+            return []
+
     class Conn:
         def __init__(self, cursor):
             self.cursor_obj = cursor
@@ -170,3 +175,95 @@ async def test_postgres_event_store_append_enqueues_outbox_before_drain(monkeypa
     assert enqueued[0]["stream_version"] == 1
     assert enqueued[0]["tenant_id"] == "tenant-a"
     assert enqueued[0]["organization_id"] == "org-a"
+
+
+@pytest.mark.asyncio
+async def test_postgres_event_store_append_bumps_stream_head_and_inserts_in_one_statement(monkeypatch):
+    from noetl.core.event_store import EventRecord, PostgresEventStore
+    import noetl.core.event_store.postgres as postgres_module
+
+    class Cursor:
+        def __init__(self):
+            self.query = ""
+            self.executed = []
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        async def execute(self, query, params=None):
+            self.query = query
+            self.executed.append((query, params))
+
+        async def fetchone(self):
+            assert "UPDATE noetl.event_stream_head" in self.query
+            return {"version": 7}
+
+        async def fetchall(self):
+            assert "generate_series" in self.query
+            return [{"snowflake_id": 501}, {"snowflake_id": 502}, {"snowflake_id": 503}]
+
+    cursor = Cursor()
+
+    class Conn:
+        def cursor(self, row_factory=None):  # noqa: ARG002
+            return cursor
+
+        async def commit(self):
+            pass
+
+    class Ctx:
+        async def __aenter__(self):
+            return Conn()
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+    async def noop_drain():
+        pass
+
+    monkeypatch.setattr(postgres_module, "get_pool_connection", lambda: Ctx())
+    monkeypatch.setattr(postgres_module, "_drain_event_store_outbox", noop_drain)
+
+    version = await PostgresEventStore().append(
+        "execution/9",
+        [EventRecord(event_type=f"test.{index}", stream_id="execution/9") for index in range(3)],
+        expected_version=4,
+    )
+
+    assert version == 7
+    queries = [query for query, _ in cursor.executed]
+    assert len(queries) == 3
+    assert not any("max(stream_version)" in query or "pg_advisory" in query for query in queries)
+    assert cursor.executed[0][1] == {"stream_id": "execution/9", "count": 3, "expected": 4}
+    insert_sql, insert_params = cursor.executed[2]
+    assert insert_sql.count("now(), now())") == 3
+    width = len(postgres_module._EVENT_COLUMNS)
+    rows = [insert_params[offset:offset + width] for offset in range(0, len(insert_params), width)]
+    stream_version = postgres_module._EVENT_COLUMNS.index("stream_version")
+    assert [row[0] for row in rows] == [501, 502, 503]
+    assert [row[stream_version] for row in rows] == [5, 6, 7]
+
+
+@pytest.mark.asyncio
+async def test_advance_stream_head_bumps_or_creates_the_head_row():
+    from noetl.core.event_store.postgres import advance_stream_head
+
+    class Cursor:
+        def __init__(self):
+            self.executed = []
+
+        async def execute(self, query, params=None):
+            self.executed.append((query, params))
+
+        async def fetchone(self):
+            return {"version": 2}
+
+    cursor = Cursor()
+
+    assert await advance_stream_head(cursor, "execution/9/stage/3") == 2
+    query, params = cursor.executed[0]
+    assert "ON CONFLICT (stream_id) DO UPDATE" in query
+    assert params == {"stream_id": "execution/9/stage/3", "count": 1, "expected": None}
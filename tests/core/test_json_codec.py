@@ -0,0 +1,96 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from noetl.core import json_codec
+from noetl.core.json_codec import RawJson
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        if not json_codec.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return json_codec
+
+
+def test_dumps_embeds_raw_json_and_matches_jsonable_types(codec):
+    payload = {
+        "context": RawJson(b'{"a": [1, 2], "b": null}'),
+        "amount": Decimal("2.5"),
+        "count": Decimal("3"),
+        "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "big": 2**70,
+    }
+
+    decoded = json.loads(codec.dumps(payload))
+
+    assert decoded == {
+        "context": {"a": [1, 2], "b": None},
+        "amount": 2.5,
+        "count": 3,
+        "at": "2024-01-02T03:04:05+00:00",
+        "big": 2**70,
+    }
+
+
+def test_loads_round_trips(codec):
+    assert codec.loads(codec.dumps({"k": ["v", 1, 1.5, True]})) == {"k": ["v", 1, 1.5, True]}
+    assert codec.loads(memoryview(b'{"x": 1}')) == {"x": 1}
+
+
+def test_dumps_rejects_unknown_types(codec):
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        codec.dumps({"value": object()})
+
+
+def test_fast_json_is_opt_in(monkeypatch):
+    monkeypatch.delenv("NOETL_FAST_JSON", raising=False)
+    assert json_codec.fast_json_enabled() is False
+    monkeypatch.setenv("NOETL_FAST_JSON", "true")
+    assert json_codec.fast_json_enabled() is True
+
+
+def test_register_psycopg_json_sets_connection_adapters():
+    from psycopg.adapt import AdaptersMap
+    from psycopg.postgres import adapters as global_adapters
+
+    class _Context:
+        adapters = AdaptersMap(global_adapters)
+
+    context = _Context()
+    json_codec.register_psycopg_json(context)
+
+    loader = context.adapters.get_loader(global_adapters.types["jsonb"].oid, 0)
+    assert loader(global_adapters.types["jsonb"].oid).load(b"{\"x\": [1]}") == {"x": [1]}
+
+
+def test_psycopg_jsonb_round_trips_wide_integers(codec):
+    from psycopg.adapt import AdaptersMap, PyFormat
+    from psycopg.postgres import adapters as global_adapters
+    from psycopg.types.json import Jsonb
+
+    class _Context:
+        adapters = AdaptersMap(global_adapters)
+
+    context = _Context()
+    codec.register_psycopg_json(context)
+    oid = global_adapters.types["jsonb"].oid
+    dumper = context.adapters.get_dumper(Jsonb, PyFormat.TEXT)(Jsonb)
+    loader = context.adapters.get_loader(oid, 0)(oid)
+    payload = {"id": 123456789012345678901234567890, "low": -(2**63) - 1, "high": 2**64 - 1, "event_id": 2**62}
+
+    decoded = loader.load(dumper.dump(Jsonb(payload)))
+
+    assert decoded == payload
+    assert all(type(value) is int for value in decoded.values())
+
+def test_wide_integer_detection():
+    assert json_codec._has_wide_int(b'{"id": 123456789012345678901234567890}')
+    assert json_codec._has_wide_int('{"id": -9223372036854775809}')
+    assert not json_codec._has_wide_int(b'{"id": 18446744073709551615, "s": "9223372036854775807"}')
+    assert not json_codec._has_wide_int(b'{"id": 1}')
@@ -0,0 +1,75 @@
+"""Tests for the truncate-first, queued log formatting pipeline."""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+from noetl.core import logger as noetl_logger
+from noetl.core.sanitize import REDACTED
+
+
+def _record(msg, *args) -> logging.LogRecord:
+    return logging.LogRecord("noetl.test", logging.INFO, __file__, 1, msg, args, None)
+
+
+def test_safe_message_sanitizes_only_the_truncated_prefix(monkeypatch):
+    seen: list[int] = []
+    real = noetl_logger.sanitize_sensitive_data
+
+    def _spy(value):
+        seen.append(len(value))
+        return real(value)
+
+    monkeypatch.setattr(noetl_logger, "sanitize_sensitive_data", _spy)
+    message = noetl_logger._safe_message(_record("payload %s", "x " * 50_000))
+
+    assert len(message) == noetl_logger._LOG_VALUE_MAX_CHARS
+    assert message.endswith("...")
+    assert seen and max(seen) < noetl_logger._LOG_VALUE_MAX_CHARS
+
+
+def test_safe_message_redacts_token_cut_by_truncation():
+    assert noetl_logger._safe_message(_record("A" * 5000)) == REDACTED
+    assert noetl_logger._safe_message(_record("Bearer %s", "x" * 5000)) == REDACTED
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages: list[str] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+
+def test_queued_handler_formats_on_listener_thread_and_snapshots_mutable_args():
+    target = _Collect()
+    handler = noetl_logger.QueuedLogHandler(target)
+    log = logging.getLogger("noetl.test.queued")
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    try:
+        payload = {"step": "a"}
+        log.info("payload %s", payload)
+        payload["step"] = "b"
+        log.info("count=%d", 3)
+        log.debug("dropped %s", "debug")
+        assert noetl_logger.flush_logs()
+    finally:
+        log.removeHandler(handler)
+
+    assert target.messages == ["payload {'step': 'a'}", "count=3"]
+    assert threading.current_thread().name not in target.threads
+
+
+def test_hot_path_modules_log_lazily():
+    from pathlib import Path
+
+    from scripts.check_lazy_logging import HOT_PATHS, check
+
+    report = check(list(HOT_PATHS), Path(__file__).resolve().parents[2])
+    assert report["eager_calls"] == []
@@ -1,10 +1,11 @@
 import asyncio
+import json
 from types import SimpleNamespace
 
 import pytest
 
 from noetl.core import config as config_module
-from noetl.core.messaging.nats_client import NATSCommandSubscriber
+from noetl.core.messaging.nats_client import NATSCommandSubscriber, _HeartbeatWheel
 
 
 def _consumer_info(max_ack_pending: int):
@@ -274,42 +275,212 @@ def test_message_action_observer_failure_is_ignored():
 
 
 class _FakeMsg:
-    def __init__(self):
+    def __init__(self, payload=None):
+        self.data = json.dumps(payload or {}).encode()
         self.in_progress_calls = 0
+        self.actions = []
 
     async def in_progress(self):
         self.in_progress_calls += 1
 
+    async def ack(self):
+        self.actions.append("ack")
+
+    async def nak(self, delay=None):
+        self.actions.append(("nak", delay))
+
+    async def term(self):
+        self.actions.append("term")
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_wheel_extends_every_message_from_one_timer():
+    wheel = _HeartbeatWheel(tick_seconds=0.005)
+    messages = [_FakeMsg() for _ in range(50)]
+    entries = [wheel.add(msg, 0.02) for msg in messages]
+    tasks_before = len(asyncio.all_tasks())
+
+    async def _wait_for_heartbeats() -> None:
+        while min(msg.in_progress_calls for msg in messages) < 2:
+            await asyncio.sleep(0.005)
+
+    try:
+        await asyncio.wait_for(_wait_for_heartbeats(), timeout=2.0)
+        assert len(asyncio.all_tasks()) == tasks_before
+
+        wheel.discard(entries[0])
+        stopped_at = messages[0].in_progress_calls
+        await asyncio.sleep(0.06)
+        assert messages[0].in_progress_calls == stopped_at
+        assert messages[1].in_progress_calls > 2
+        assert len(wheel) == 49
+    finally:
+        await wheel.close()
+
+
+class _FakeSubscription:
+    def __init__(self, messages, batches):
+        self._messages = list(messages)
+        self.batches = batches
+        self.drained = asyncio.Event()
+
+    async def fetch(self, batch, timeout, heartbeat):
+        self.batches.append(batch)
+        if not self._messages:
+            self.drained.set()
+            await asyncio.sleep(3600)
+        # Deliver a short batch so the next fetch sees the leftover permits.
+        taken, self._messages = self._messages[:3], self._messages[3:]
+        return taken
+
+    async def unsubscribe(self):
+        return None
+
+
+class _SubscribeJetStream:
+    def __init__(self, subscription):
+        self._subscription = subscription
+
+    async def stream_info(self, _stream):
+        return SimpleNamespace(config=SimpleNamespace(subjects=[]))
+
+    async def update_stream(self, config):
+        return None
+
+    async def pull_subscribe(self, subject, durable):
+        return self._subscription
+
 
 @pytest.mark.asyncio
-async def test_keep_message_in_progress_sends_periodic_heartbeats():
+async def test_fetch_batch_follows_free_permits_and_acks_are_pipelined():
+    observed = []
     subscriber = NATSCommandSubscriber(
         consumer_name="test-consumer",
         stream_name="NOETL_COMMANDS",
         max_ack_pending=64,
-        max_inflight=1,
-    )
-    msg = _FakeMsg()
-    stop_event = asyncio.Event()
-
-    task = asyncio.create_task(
-        subscriber._keep_message_in_progress(
-            msg,
-            stop_event,
-            interval_seconds=0.01,
-        )
+        max_inflight=4,
+        message_action_observer=lambda action, delay: observed.append((action, delay)),
     )
-    async def _wait_for_heartbeats() -> None:
-        while msg.in_progress_calls < 2:
-            await asyncio.sleep(0.01)
+    messages = [_FakeMsg({"n": index}) for index in range(4)]
+    batches = []
+    subscription = _FakeSubscription(messages, batches)
+    subscriber._js = _SubscribeJetStream(subscription)
+
+    async def _noop():
+        return None
+
+    subscriber._ensure_consumer = _noop
+    release = asyncio.Event()
+
+    async def _callback(data):
+        await release.wait()
+        return "nak:2" if data["n"] == 3 else "ack"
+
+    task = asyncio.create_task(subscriber.subscribe(_callback))
+    try:
+        while len(batches) < 2:
+            await asyncio.sleep(0.005)
+        # All four permits are taken, so the loop waits instead of fetching.
+        await asyncio.sleep(0.02)
+        assert batches == [4, 1]
+
+        release.set()
+        await asyncio.wait_for(subscription.drained.wait(), timeout=1.0)
+        assert batches == [4, 1, 4]
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await subscriber.close()
+
+    assert [msg.actions for msg in messages] == [["ack"], ["ack"], ["ack"], [("nak", 2.0)]]
+    assert sorted(observed, key=str) == [("ack", None)] * 3 + [("nak", 2.0)]
+
+
+class _ParkedSubscription:
+    def __init__(self, messages, batches):
+        self._messages = messages
+        self.batches = batches
+        self.deliver = asyncio.Event()
+
+    async def fetch(self, batch, timeout, heartbeat):
+        self.batches.append(batch)
+        if not self.deliver.is_set():
+            await self.deliver.wait()
+            return self._messages[:batch]
+        await asyncio.sleep(3600)
+
+    async def unsubscribe(self):
+        return None
 
+
+class _AffinityNats:
+    def __init__(self):
+        self.handlers = {}
+
+    async def subscribe(self, subject, cb):
+        self.handlers[subject] = cb
+        return SimpleNamespace(unsubscribe=lambda: asyncio.sleep(0))
+
+    async def close(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_affinity_delivery_borrows_permits_from_a_parked_fetch():
+    subscriber = NATSCommandSubscriber(
+        subject="noetl.commands",
+        consumer_name="test-consumer",
+        stream_name="NOETL_COMMANDS",
+        max_ack_pending=64,
+        max_inflight=2,
+    )
+    messages = [_FakeMsg({"n": index}) for index in range(2)]
+    batches = []
+    subscription = _ParkedSubscription(messages, batches)
+    subscriber._js = _SubscribeJetStream(subscription)
+    subscriber._nc = _AffinityNats()
+
+    async def _noop():
+        return None
+
+    subscriber._ensure_consumer = _noop
+    seen = []
+    release = asyncio.Event()
+
+    async def _callback(data):
+        seen.append(data["n"])
+        await release.wait()
+        return "ack"
+
+    await subscriber.subscribe_affinity("worker-1", _callback)
+    task = asyncio.create_task(subscriber.subscribe(_callback))
     try:
-        await asyncio.wait_for(_wait_for_heartbeats(), timeout=1.0)
+        while not batches:
+            await asyncio.sleep(0.005)
+        # The idle fetch holds both permits, yet the affinity copy still runs.
+        on_message = subscriber._nc.handlers["noetl.commands-affinity.worker-1"]
+        await on_message(_FakeMsg({"n": "affinity"}))
+        await asyncio.sleep(0.01)
+        assert seen == ["affinity"]
+
+        # Every permit is now owned by running commands: further copies drop.
+        subscription.deliver.set()
+        while len(seen) < 2:
+            await asyncio.sleep(0.005)
+        await on_message(_FakeMsg({"n": "dropped"}))
+        await asyncio.sleep(0.01)
+        assert seen == ["affinity", 0]
+        # The fetch asked for two but only one permit was left for it.
+        assert messages[1].actions == [("nak", None)]
+        release.set()
     finally:
-        stop_event.set()
-        await task
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await subscriber.close()
 
-    assert msg.in_progress_calls >= 2
+    assert messages[0].actions == ["ack"]
 
 
 @pytest.mark.asyncio
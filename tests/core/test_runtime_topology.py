@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 
 def test_worker_locality_from_env_uses_topology_values():
     from noetl.core.runtime.topology import worker_locality_from_env
@@ -244,3 +246,41 @@ def test_locality_distance_prefers_closest_match():
         "max_distance": "zone",
         "within_max_distance": True,
     }
+
+
+@pytest.mark.asyncio
+async def test_large_local_result_refs_carry_producer_locality(monkeypatch):
+    from noetl.core.runtime import topology
+    from noetl.core.storage import result_store
+    from noetl.core.storage.models import Scope, StoreTier
+
+    monkeypatch.setattr(result_store, "LOCALITY_HINT_MIN_BYTES", 64)
+    monkeypatch.setenv("NOETL_NODE_ID", "node-a")
+    topology.set_local_worker_id("worker-a")
+    try:
+        store = result_store.TempStore(max_ref_cache_entries=10, max_memory_cache_entries=10)
+        small = await store.put(execution_id="1", name="small", data={"x": 1}, scope=Scope.EXECUTION, store=StoreTier.MEMORY)
+        large = await store.put(execution_id="1", name="large", data={"rows": list(range(100))}, scope=Scope.EXECUTION, store=StoreTier.MEMORY)
+    finally:
+        topology.set_local_worker_id(None)
+
+    assert small.locality is None
+    assert large.locality["worker_id"] == "worker-a"
+    assert large.locality["node_id"] == "node-a"
+
+    context = {"render_context": {"small": {"_ref": small.model_dump(mode="json")}, "large": {"_ref": large.model_dump(mode="json")}}}
+    hint = topology.locality_hint_from_refs(context, min_bytes=64)
+    assert hint["worker_id"] == "worker-a"
+    assert hint["bytes"] == large.meta.bytes
+    assert topology.locality_hint_from_refs(context, min_bytes=large.meta.bytes + 1) is None
+
+
+def test_locality_preference_wait_only_holds_back_other_workers():
+    from noetl.core.runtime.topology import locality_preference_wait
+
+    preference = {"worker_id": "worker-a", "window_seconds": 2.0}
+
+    assert locality_preference_wait(preference, worker_id="worker-a", command_age_seconds=0.0) == 0.0
+    assert locality_preference_wait(preference, worker_id="worker-b", command_age_seconds=0.5) == 1.5
+    assert locality_preference_wait(preference, worker_id="worker-b", command_age_seconds=3.0) == 0.0
+    assert locality_preference_wait(None, worker_id="worker-b", command_age_seconds=0.0) == 0.0
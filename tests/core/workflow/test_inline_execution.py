@@ -135,14 +135,52 @@ def test_disallowed_playbook_tool_kind_blocks_inline():
     assert "tool:block:step[0].kind=playbook" in decision.reasons
 
 
-def test_disallowed_http_tool_kind_blocks_inline():
+def test_disallowed_snowflake_tool_kind_blocks_inline():
     decision = detect_inline_child(
-        _playbook(workflow=[{"step": "call", "tool": {"kind": "http"}}]),
+        _playbook(workflow=[{"step": "call", "tool": {"kind": "snowflake"}}]),
         child_path="automation/agents/mcp/firestore",
     )
 
     assert decision.inline is False
-    assert "tool:block:step[0].kind=http" in decision.reasons
+    assert "tool:block:step[0].kind=snowflake" in decision.reasons
+
+
+def test_data_tool_kinds_are_inline_candidates():
+    decision = detect_inline_child(
+        _playbook(
+            workflow=[
+                {"step": "fetch", "tool": {"kind": "http", "url": "https://example.test"}},
+                {"step": "load", "tool": {"kind": "postgres", "auth": "pg_main"}},
+                {"step": "agg", "tool": {"kind": "duckdb"}},
+            ]
+        ),
+        child_path="automation/agents/mcp/firestore",
+    )
+
+    assert decision.inline is True
+    assert "tool:ok:step[0].kind=http" in decision.reasons
+    assert "tool:ok:step[1].kind=postgres" in decision.reasons
+    assert "tool:ok:step[2].kind=duckdb" in decision.reasons
+
+
+def test_paginating_http_retry_blocks_inline():
+    decision = detect_inline_child(
+        _playbook(
+            workflow=[
+                {
+                    "step": "fetch",
+                    "tool": {
+                        "kind": "http",
+                        "retry": [{"when": "{{ response.next }}", "then": {"next_call": {"url": "x"}}}],
+                    },
+                }
+            ]
+        ),
+        child_path="automation/agents/mcp/firestore",
+    )
+
+    assert decision.inline is False
+    assert "tool:block:step[0].http_pagination" in decision.reasons
 
 
 def test_pipeline_tool_kinds_must_all_be_allowed():
@@ -153,7 +191,7 @@ def test_pipeline_tool_kinds_must_all_be_allowed():
                     "step": "pipeline",
                     "tool": [
                         {"name": "safe", "kind": "python"},
-                        {"name": "unsafe", "kind": "http"},
+                        {"name": "unsafe", "kind": "snowflake"},
                     ],
                 }
             ]
@@ -163,7 +201,36 @@ def test_pipeline_tool_kinds_must_all_be_allowed():
 
     assert decision.inline is False
     assert "tool:ok:step[0].kind=python" in decision.reasons
-    assert "tool:block:step[0].kind=http" in decision.reasons
+    assert "tool:block:step[0].kind=snowflake" in decision.reasons
+
+
+def test_literal_loop_over_the_iteration_bound_blocks_inline(monkeypatch):
+    monkeypatch.setenv("NOETL_INLINE_MAX_LOOP_ITERATIONS", "2")
+    decision = detect_inline_child(
+        _playbook(
+            workflow=[
+                {
+                    "step": "loop",
+                    "loop": {"in": [1, 2, 3], "iterator": "item"},
+                    "tool": {"kind": "python"},
+                }
+            ]
+        ),
+        child_path="automation/agents/mcp/firestore",
+    )
+
+    assert decision.inline is False
+    assert "loop:block:step[0].items=3>2" in decision.reasons
+
+
+def test_loop_without_collection_blocks_inline():
+    decision = detect_inline_child(
+        _playbook(workflow=[{"step": "loop", "loop": {"iterator": "item"}, "tool": {"kind": "python"}}]),
+        child_path="automation/agents/mcp/firestore",
+    )
+
+    assert decision.inline is False
+    assert "loop:block:step[0].missing_in" in decision.reasons
 
 
 def test_parallel_loop_blocks_inline():
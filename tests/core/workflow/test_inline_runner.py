@@ -7,6 +7,7 @@ Covers:
 - Child step failure: terminal envelope status error.
 - Recursion depth = 3 then 4: depth 3 runs; depth 4 is refused.
 - noetl.command projection rows exist (emitted) for inline child.
+- postgres / http steps run through the tool executors, loops iterate inline.
 """
 
 from __future__ import annotations
@@ -846,3 +847,171 @@ async def test_inline_runner_legacy_emitter_without_set_catalog_id_still_works()
     assert result.status == "ok"
     # The legacy callable still received emissions.
     assert events, "legacy emitter must still receive events"
+
+
+@pytest.mark.asyncio
+async def test_inline_runner_postgres_and_http_steps_use_tool_results(monkeypatch):
+    events, emitter = _make_emitter()
+    calls = []
+
+    async def fake_postgres(task_config, context, jinja_env, task_with):
+        calls.append(("postgres", task_with.get("auth"), context["workload"]["facility"]))
+        return {"status": "success", "data": {"rows": [{"id": 1}]}}
+
+    async def fake_http(task_config, context, jinja_env, task_with):
+        calls.append(("http", task_config.get("url"), context["load"]))
+        return {"status": "success", "data": {"status_code": 200}}
+
+    async def fake_scrub(**kwargs):
+        return kwargs["result"]
+
+    monkeypatch.setattr("noetl.tools.postgres.execute_postgres_task_async", fake_postgres)
+    monkeypatch.setattr("noetl.tools.http.execute_http_task", fake_http)
+    monkeypatch.setattr("noetl.core.workflow.playbook.inline_runner._scrub_result", fake_scrub)
+
+    result = await run_inline(
+        parent_execution_id="parent-data",
+        parent_command_id="cmd-data",
+        parent_step="agent_step",
+        child_playbook={
+            "metadata": {"name": "test/data_child"},
+            "workflow": [
+                {"step": "load", "tool": {"kind": "postgres", "auth": "pg_main", "command": "SELECT 1"}},
+                {"step": "notify", "tool": {"kind": "http", "url": "https://example.test/hook"}},
+            ],
+        },
+        child_input={"facility": "A"},
+        inline_decision=_make_decision(),
+        jinja_env=Environment(),
+        cancellation_probe=_cancellation_probe_returning(False),
+        batch_event_emitter=emitter,
+        depth=0,
+    )
+
+    assert result.status == "ok"
+    assert result.data == {"status_code": 200}
+    assert calls == [
+        ("postgres", "pg_main", "A"),
+        ("http", "https://example.test/hook", {"rows": [{"id": 1}]}),
+    ]
+    completed = [e for e in events if e["name"] == "command.completed"]
+    assert [e["step"] for e in completed] == ["load", "notify"]
+
+
+@pytest.mark.asyncio
+async def test_inline_runner_tool_error_envelope_fails_the_child(monkeypatch):
+    events, emitter = _make_emitter()
+
+    async def fake_postgres(task_config, context, jinja_env, task_with):
+        return {"status": "error", "error": "relation does not exist"}
+
+    monkeypatch.setattr("noetl.tools.postgres.execute_postgres_task_async", fake_postgres)
+
+    result = await run_inline(
+        parent_execution_id="parent-err",
+        parent_command_id="cmd-err",
+        parent_step="agent_step",
+        child_playbook={
+            "metadata": {"name": "test/pg_err"},
+            "workflow": [{"step": "load", "tool": {"kind": "postgres", "auth": "pg_main"}}],
+        },
+        child_input={},
+        inline_decision=_make_decision(),
+        jinja_env=Environment(),
+        cancellation_probe=_cancellation_probe_returning(False),
+        batch_event_emitter=emitter,
+        depth=0,
+    )
+
+    assert result.status == "error"
+    assert "relation does not exist" in result.error["message"]
+    assert "playbook.failed" in [e["name"] for e in events]
+
+
+@pytest.mark.asyncio
+async def test_inline_runner_loop_step_iterates_and_aggregates(monkeypatch):
+    events, emitter = _make_emitter()
+    seen = []
+    emits = []
+
+    async def fake_python_task(task_config, context, jinja_env, args=None, **kwargs):
+        seen.append((context["item"], context["iter"]["_index"], context["iter"]["_last"]))
+        if context["item"] == "bad":
+            raise RuntimeError("boom")
+        return {"value": context["item"]}
+
+    async def fake_scrub(**kwargs):
+        return kwargs["result"]
+
+    def counting_emitter(execution_id, batch):
+        emits.append(len(batch))
+        return emitter(execution_id, batch)
+
+    monkeypatch.setattr("noetl.tools.python.execute_python_task_async", fake_python_task)
+    monkeypatch.setattr("noetl.core.workflow.playbook.inline_runner._scrub_result", fake_scrub)
+
+    result = await run_inline(
+        parent_execution_id="parent-loop",
+        parent_command_id="cmd-loop",
+        parent_step="agent_step",
+        child_playbook={
+            "metadata": {"name": "test/loop_child"},
+            "workflow": [
+                {
+                    "step": "each",
+                    "loop": {"in": "{{ workload.items }}", "iterator": "item"},
+                    "tool": {"kind": "python", "code": "result = {}"},
+                },
+            ],
+        },
+        child_input={"items": ["a", "bad", "c"]},
+        inline_decision=_make_decision(),
+        jinja_env=Environment(),
+        cancellation_probe=_cancellation_probe_returning(False),
+        batch_event_emitter=counting_emitter,
+        depth=0,
+    )
+
+    assert result.status == "ok"
+    assert seen == [("a", 0, False), ("bad", 1, False), ("c", 2, True)]
+    assert result.data == {"results": [{"value": "c"}], "stats": {"total": 3, "success": 2, "failed": 1}}
+    loop_events = [e for e in events if e["step"] == "each"]
+    assert [e["payload"]["meta"].get("iter_index") for e in loop_events if e["name"] == "command.started"] == [0, 1, 2]
+    assert loop_events[-1]["name"] == "loop.done"
+    # init, one batch for the whole loop, terminal events
+    assert len(emits) == 3
+
+
+@pytest.mark.asyncio
+async def test_inline_runner_loop_over_bound_fails_before_running(monkeypatch):
+    events, emitter = _make_emitter()
+    monkeypatch.setenv("NOETL_INLINE_MAX_LOOP_ITERATIONS", "2")
+    monkeypatch.setattr(
+        "noetl.tools.python.execute_python_task_async",
+        AsyncMock(side_effect=AssertionError("no iteration may run")),
+    )
+
+    result = await run_inline(
+        parent_execution_id="parent-bound",
+        parent_command_id="cmd-bound",
+        parent_step="agent_step",
+        child_playbook={
+            "metadata": {"name": "test/loop_bound"},
+            "workflow": [
+                {
+                    "step": "each",
+                    "loop": {"in": "{{ workload.items }}", "iterator": "item"},
+                    "tool": {"kind": "python"},
+                },
+            ],
+        },
+        child_input={"items": [1, 2, 3]},
+        inline_decision=_make_decision(),
+        jinja_env=Environment(),
+        cancellation_probe=_cancellation_probe_returning(False),
+        batch_event_emitter=emitter,
+        depth=0,
+    )
+
+    assert result.status == "error"
+    assert "NOETL_INLINE_MAX_LOOP_ITERATIONS" in result.error["message"]
@@ -42,3 +42,13 @@ def test_distributed_runtime_schema_contract_is_present():
     assert "idx_event_stream_version" in ddl
     assert "idx_event_aggregate_event_id" in ddl
     assert "idx_outbox_ready" in ddl
+
+
+def test_event_stream_head_backfill_runs_only_when_the_table_is_created():
+    ddl = SCHEMA.read_text(encoding="utf-8")
+    start = ddl.index("IF to_regclass('noetl.event_stream_head') IS NULL THEN")
+    guarded = ddl[start:ddl.index("END IF;", start)]
+
+    assert "CREATE TABLE noetl.event_stream_head" in guarded
+    assert "FROM noetl.event" in guarded
+    assert ddl.count("SELECT stream_id, max(stream_version)") == 1
@@ -0,0 +1,27 @@
+import json
+from pathlib import Path
+
+from scripts.check_lazy_logging import main
+
+
+def test_check_lazy_logging_flags_and_fixes_eager_calls(tmp_path: Path, capsys):
+    module = tmp_path / "hot.py"
+    module.write_text(
+        "def handle(logger, step, ms, rows):\n"
+        "    logger.info(f\"[PERF] {step} took {ms:.1f}ms (100% of {len(rows)!r})\")\n"
+        "    logger.debug(\"count {}\".format(len(rows)))\n"
+    )
+
+    assert main([str(module), "--root", str(tmp_path)]) == 1
+    output = json.loads(capsys.readouterr().out)
+    assert [(call["line"], call["kind"]) for call in output["eager_calls"]] == [
+        (2, "f-string"),
+        (3, "str.format"),
+    ]
+
+    assert main([str(module), "--root", str(tmp_path), "--fix"]) == 1
+    output = json.loads(capsys.readouterr().out)
+    assert output["fixed"] == 1
+    assert module.read_text().splitlines()[1] == (
+        "    logger.info(\"[PERF] %s took %.1fms (100%% of %r)\", step, ms, len(rows))"
+    )
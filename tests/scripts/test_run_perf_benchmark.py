@@ -0,0 +1,91 @@
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from scripts import run_perf_benchmark
+
+
+def _rows():
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    at = lambda ms: t0 + timedelta(milliseconds=ms)  # noqa: E731
+    return [
+        {"event_type": "playbook.initialized", "created_at": at(0), "command_id": None, "result": None},
+        {"event_type": "command.issued", "created_at": at(10), "command_id": 1, "result": None},
+        {"event_type": "command.issued", "created_at": at(20), "command_id": 2, "result": None},
+        {"event_type": "command.completed", "created_at": at(110), "command_id": 1, "result": None},
+        {"event_type": "command.completed", "created_at": at(420), "command_id": 2, "result": None},
+        {
+            "event_type": "batch.completed",
+            "created_at": at(500),
+            "command_id": None,
+            "result": {"status": "COMPLETED", "context": {"engine_total_ms": 4.5, "commit_ms": 1.0, "commands_generated": 1}},
+        },
+        {
+            "event_type": "batch.completed",
+            "created_at": at(1000),
+            "command_id": None,
+            "result": {"status": "COMPLETED", "context": {"engine_total_ms": 9.5}},
+        },
+    ]
+
+
+def test_summarize_execution_events_reports_rates_latency_and_phases():
+    summary = run_perf_benchmark.summarize_execution_events(_rows())
+
+    assert summary["events"] == 7
+    assert summary["commands"] == 2
+    assert summary["commands_completed"] == 2
+    assert summary["wall_seconds"] == 1.0
+    assert summary["commands_per_sec"] == 2.0
+    assert summary["events_per_sec"] == 7.0
+    assert summary["step_latency_ms"] == {"p50": 100.0, "p99": 400.0}
+    assert summary["timing_phases_ms"]["engine_total_ms"] == {"p50": 4.5, "p99": 9.5, "samples": 2}
+    assert summary["timing_phases_ms"]["commit_ms"]["samples"] == 1
+    assert "commands_generated" not in summary["timing_phases_ms"]
+
+
+def test_compare_to_baseline_flags_regressions_by_direction():
+    baseline = {"scenarios": {"loop_10k": {"commands_per_sec": 100.0, "step_latency_ms": {"p50": 10.0, "p99": 50.0}}}}
+    report = {"scenarios": {"loop_10k": {"commands_per_sec": 80.0, "step_latency_ms": {"p50": 10.5, "p99": 40.0}}}}
+
+    comparisons = {
+        item["metric"]: item
+        for item in run_perf_benchmark.compare_to_baseline(report, baseline, max_regression=0.15)
+    }
+
+    assert comparisons["commands_per_sec"]["regressed"] is True
+    assert comparisons["step_latency_ms.p50"]["regressed"] is False
+    assert comparisons["step_latency_ms.p99"]["regressed"] is False
+    assert "events_per_sec" not in comparisons
+
+
+def test_main_requires_dsn(monkeypatch, capsys):
+    monkeypatch.delenv("NOETL_BENCH_DSN", raising=False)
+
+    assert run_perf_benchmark.main([]) == 1
+    assert "NOETL_BENCH_DSN" in json.loads(capsys.readouterr().out)["error"]
+
+
+def test_main_writes_report_and_fails_on_baseline_regression(monkeypatch, tmp_path: Path):
+    def _run_scenario(name, **_kwargs):
+        return {"execution_id": "1", "failed": False, "commands_per_sec": 50.0}
+
+    monkeypatch.setattr(run_perf_benchmark, "run_scenario", _run_scenario)
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"scenarios": {"linear_steps": {"commands_per_sec": 100.0}}}))
+    output = tmp_path / "report.json"
+
+    exit_code = run_perf_benchmark.main(
+        ["--dsn", "postgresql://local", "--scenario", "linear_steps", "--output", str(output), "--baseline", str(baseline)]
+    )
+
+    report = json.loads(output.read_text())
+    assert exit_code == 1
+    assert report["matched"] is False
+    assert report["baseline"]["comparisons"][0]["regressed"] is True
+
+
+def test_scenario_playbooks_exist():
+    for playbook_path, helpers, _workload in run_perf_benchmark.SCENARIOS.values():
+        for path in (playbook_path, *helpers):
+            assert (Path(path) / f"{Path(path).name}.yaml").is_file()
@@ -0,0 +1,110 @@
+import json
+from collections import Counter
+
+import httpx
+import pytest
+
+from noetl.core.urls import EXECUTION_ID_HEADER
+from noetl.server.sharding import (
+    SHARD_HOP_HEADER,
+    ShardLayout,
+    ShardRouterMiddleware,
+    shard_for_execution,
+)
+
+
+def _recording_app(name, seen):
+    async def app(scope, receive, send):
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        headers = {key.decode(): value.decode() for key, value in scope["headers"]}
+        seen.append((name, scope["path"], body, headers))
+        await send({"type": "http.response.start", "status": 202, "headers": [(b"x-served-by", name.encode())]})
+        await send({"type": "http.response.body", "body": body or b"empty"})
+
+    return app
+
+
+def _sharded_pair(seen):
+    """Shard 0 middleware whose peer (shard 1) is reached in-process."""
+    shard1 = ShardRouterMiddleware(
+        _recording_app("shard-1", seen), layout=ShardLayout(shards=2, index=1, socket_dir="/tmp/x")
+    )
+    shard0 = ShardRouterMiddleware(
+        _recording_app("shard-0", seen),
+        layout=ShardLayout(shards=2, index=0, socket_dir="/tmp/x"),
+        transport_factory=lambda path: httpx.ASGITransport(app=shard1),
+    )
+    return shard0
+
+
+def _execution_owned_by(index, shards=2):
+    return next(eid for eid in range(626611573817082718, 626611573817083718) if shard_for_execution(eid, shards) == index)
+
+
+def test_shard_for_execution_is_stable_and_balanced_for_snowflake_ids():
+    ids = [626611573817082718 + (i << 22) for i in range(8000)]
+    counts = Counter(shard_for_execution(eid, 4) for eid in ids)
+    assert set(counts) == {0, 1, 2, 3}
+    assert max(counts.values()) < 1.1 * min(counts.values())
+    assert [shard_for_execution(eid, 4) for eid in ids[:50]] == [shard_for_execution(eid, 4) for eid in ids[:50]]
+    assert shard_for_execution(ids[0], 1) == 0
+
+
+@pytest.mark.asyncio
+async def test_router_serves_owned_and_unrouted_requests_locally():
+    seen = []
+    app = _sharded_pair(seen)
+    owned = _execution_owned_by(0)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        await client.post("/api/commands/1/claim", json={"worker_id": "w"}, headers={EXECUTION_ID_HEADER: str(owned)})
+        await client.get("/api/health")
+
+    assert [name for name, *_ in seen] == ["shard-0", "shard-0"]
+
+
+@pytest.mark.asyncio
+async def test_router_forwards_to_owner_once_by_header_path_or_body():
+    seen = []
+    app = _sharded_pair(seen)
+    other = _execution_owned_by(1)
+    batch = json.dumps({"execution_id": str(other), "events": [{"name": "call.done"}]}).encode()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        by_header = await client.post(
+            "/api/commands/9/claim", json={"worker_id": "w"}, headers={EXECUTION_ID_HEADER: str(other)}
+        )
+        by_path = await client.get(f"/api/executions/{other}/events?limit=5")
+        by_body = await client.post("/api/events/batch", content=batch, headers={"content-type": "application/json"})
+
+    assert [name for name, *_ in seen] == ["shard-1", "shard-1", "shard-1"]
+    assert by_header.status_code == 202 and by_header.headers["x-served-by"] == "shard-1"
+    assert json.loads(by_header.content) == {"worker_id": "w"}
+    assert by_path.headers["x-served-by"] == "shard-1"
+    # The buffered body is replayed intact to the owner.
+    assert by_body.content == batch and seen[2][2] == batch
+    # Forwarded requests are marked so the owner never forwards them again.
+    assert all(headers.get(SHARD_HOP_HEADER.lower()) == "0" for *_, headers in seen)
+
+
+@pytest.mark.asyncio
+async def test_router_returns_retryable_503_when_owner_is_down():
+    def _unreachable(path):
+        return httpx.AsyncHTTPTransport(uds=path)
+
+    app = ShardRouterMiddleware(
+        _recording_app("shard-0", []),
+        layout=ShardLayout(shards=2, index=0, socket_dir="/nonexistent-noetl-shards"),
+        transport_factory=_unreachable,
+    )
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(f"/api/executions/{_execution_owned_by(1)}/status")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert response.json()["detail"]["code"] == "shard_unavailable"
@@ -248,6 +248,9 @@ class _CancelCursor:
             return {"catalog_id": 5}
         return None
 
+    async def fetchall(self):
+        return []
+
 
 class _CancelConn:
     def __init__(self, cursor):
@@ -306,6 +309,28 @@ async def test_mark_execution_cancelled_enqueues_outbox_before_drain(monkeypatch
     assert enqueued[0]["catalog_id"] == 5
     assert enqueued[0]["result"]["context"]["restarted_execution_id"] == "8"
     assert enqueued[0]["meta"]["auto_resume"] is True
+    # The execution projection is updated in the same transaction.
+    projection = [params for query, params in cursor.executed if "UPDATE noetl.execution" in query]
+    assert len(projection) == 1 and projection[0][-1] == 7
+
+
+@pytest.mark.asyncio
+async def test_get_recovery_candidates_reads_live_parents_from_execution_projection(monkeypatch):
+    cursor = _CancelCursor()
+    conn = _CancelConn(cursor)
+    monkeypatch.setattr(auto_resume, "get_pool_connection", lambda *args, **kwargs: _CancelConnCtx(conn))
+
+    assert await auto_resume.get_recovery_candidates() == []
+
+    sql = cursor.query
+    assert "FROM noetl.execution x" in sql
+    # Same predicate as idx_execution_live_parent; FAILED parents stay
+    # candidates until a terminal event says otherwise.
+    assert "x.parent_execution_id IS NULL" in sql
+    assert "x.status NOT IN ('COMPLETED', 'CANCELLED')" in sql
+    assert "ev.event_type = 'playbook.initialized'" in sql
+    # No driving scan over noetl.event.
+    assert "FROM noetl.event e\n" not in sql
 
 
 @pytest.mark.asyncio
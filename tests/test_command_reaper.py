@@ -101,21 +101,31 @@ async def test_find_stale_active_commands_scans_command_table_and_filters_termin
     # Heartbeat join with noetl.runtime worker pool.
     assert "LEFT JOIN noetl.runtime r" in sql
     assert "r.kind = 'worker_pool'" in sql
-    # Status filter targets active non-terminal rows.
-    assert "c.status = ANY(%s)" in sql
+    # Status literals match the idx_command_active_lease predicate.
+    assert "c.status IN ('CLAIMED', 'RUNNING')" in sql
     # Stale worker / hard-timeout predicate.
     assert "r.heartbeat" in sql
     assert "c.claimed_at" in sql
-    # Execution-terminal exclusion via noetl.event.
+    # Execution-terminal exclusion runs once per distinct candidate
+    # execution: projection status, then the terminal event probe.
+    assert "SELECT DISTINCT execution_id FROM due" in sql
+    assert "x.status = ANY(%s)" in sql
     assert "FROM noetl.event et" in sql
     assert "et.event_type = ANY(%s)" in sql
-    # Bounded result set.
-    assert "LIMIT %s" in sql
+    # Due rows of concluded executions are retired out of the index, each
+    # with a matching command.cancelled event.
+    assert "UPDATE noetl.command c" in sql
+    assert "SET status = 'CANCELLED'" in sql
+    assert "INSERT INTO noetl.event" in sql
+    assert "'command.cancelled'" in sql
+    # Bounded scan and result set.
+    assert sql.count("LIMIT %s") == 2
 
     assert cursor.params == (
-        list(command_reaper._ACTIVE_COMMAND_STATUSES),
         90.0,
         1800.0,
+        50 * command_reaper._SWEEP_SCAN_FACTOR,
+        command_reaper._TERMINAL_EXECUTION_STATUSES,
         command_reaper._TERMINAL_EXECUTION_EVENT_TYPES,
         50,
     )
@@ -227,12 +237,17 @@ async def test_find_stranded_pending_commands_filters_non_pending_and_terminal_e
     assert "FROM noetl.command c" in sql
     assert "c.status = 'PENDING'" in sql
     assert "c.created_at" in sql
-    # Reaper must still exclude terminated executions.
+    # Reaper must still exclude (and retire) terminated executions.
+    assert "x.status = ANY(%s)" in sql
     assert "FROM noetl.event et" in sql
     assert "et.event_type = ANY(%s)" in sql
+    assert "UPDATE noetl.command c" in sql
+    assert "'command.cancelled'" in sql
 
     assert cursor.params == (
         60.0,
+        25 * command_reaper._SWEEP_SCAN_FACTOR,
+        command_reaper._TERMINAL_EXECUTION_STATUSES,
         command_reaper._TERMINAL_EXECUTION_EVENT_TYPES,
         25,
     )
@@ -390,6 +405,46 @@ async def test_reap_orphaned_commands_once_continues_on_publish_error(monkeypatc
     assert [item["command_id"] for item in published] == ["1:b:0"]
 
 
+@pytest.mark.asyncio
+async def test_reap_orphaned_commands_once_publishes_concurrently_up_to_limit(monkeypatch):
+    import asyncio
+
+    orphaned = [
+        {"event_id": i, "execution_id": i, "command_id": f"{i}:step:0", "step": "step"}
+        for i in range(6)
+    ]
+    started = []
+    in_flight = {"now": 0, "peak": 0}
+
+    class _Publisher:
+        async def publish_command(self, **kwargs):
+            started.append(kwargs["command_id"])
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+
+    async def _fake_stale(**_kwargs):
+        return orphaned
+
+    async def _fake_stranded(**_kwargs):
+        return []
+
+    async def _fake_get_nats_publisher():
+        return _Publisher()
+
+    monkeypatch.setattr(command_reaper, "_REAPER_PUBLISH_CONCURRENCY", 2)
+    monkeypatch.setattr(command_reaper, "_find_stale_active_commands", _fake_stale)
+    monkeypatch.setattr(command_reaper, "_find_stranded_pending_commands", _fake_stranded)
+    monkeypatch.setattr(command_reaper, "_get_nats_publisher", _fake_get_nats_publisher)
+
+    count = await command_reaper.reap_orphaned_commands_once("http://server")
+
+    assert count == 6
+    assert in_flight["peak"] == 2
+    assert started == [item["command_id"] for item in orphaned]
+
+
 @pytest.mark.asyncio
 async def test_run_command_reaper_skips_work_when_lease_not_acquired(monkeypatch):
     """Only the lease holder should sweep; followers must idle."""
@@ -438,3 +493,11 @@ async def test_run_command_reaper_skips_work_when_lease_not_acquired(monkeypatch
 
     assert lease.calls >= 1
     assert lease.released is True
+
+
+def test_failed_projection_alone_does_not_conclude_an_execution():
+    # noetl.execution.status reports FAILED on any command.failed, even with
+    # retries pending; only playbook/workflow terminal events conclude it.
+    assert "FAILED" not in command_reaper._TERMINAL_EXECUTION_STATUSES
+    assert "playbook.failed" in command_reaper._TERMINAL_EXECUTION_EVENT_TYPES
+    assert "workflow.failed" in command_reaper._TERMINAL_EXECUTION_EVENT_TYPES
@@ -0,0 +1,196 @@
+import pytest
+
+from noetl.core.dsl.engine.models import Playbook
+from noetl.core.scheduler import (
+    Dispatcher,
+    Edge,
+    StepDurationModel,
+    StepSpec,
+    build_plan,
+    critical_path_priorities,
+)
+
+
+def _playbook():
+    return Playbook(**{
+        "apiVersion": "noetl.io/v2",
+        "kind": "Playbook",
+        "metadata": {"name": "fanout", "path": "tests/fanout"},
+        "workflow": [
+            {"step": "start", "next": {"arcs": [{"step": "short"}, {"step": "long"}]}},
+            {"step": "short", "tool": {"kind": "python", "code": "x"}, "next": {"arcs": [{"step": "end"}]}},
+            {"step": "long", "tool": {"kind": "duckdb", "query": "x"}, "next": {"arcs": [{"step": "tail"}]}},
+            # Pagination-style loop back: must not break planning.
+            {"step": "tail", "tool": {"kind": "http", "url": "x"}, "next": {"arcs": [{"step": "end"}, {"step": "long"}]}},
+            {"step": "end"},
+        ],
+    })
+
+
+def test_build_plan_reads_v10_arcs_and_tool_objects():
+    steps, edges, _ = build_plan(_playbook().model_dump(exclude_none=True), {}, duration_fn=lambda sid, kind: 5)
+    kinds = {s.id: s.type for s in steps}
+    assert kinds == {"start": "router", "short": "python", "long": "duckdb", "tail": "http", "end": "router"}
+    assert {(e.u, e.v) for e in edges} == {
+        ("start", "short"), ("start", "long"), ("short", "end"),
+        ("long", "tail"), ("tail", "end"), ("tail", "long"),
+    }
+
+
+def test_critical_path_priorities_ignore_back_edges():
+    steps = [StepSpec(id=sid, type="python", resources={}, duration_ms=dur, tags={})
+             for sid, dur in (("a", 1), ("b", 10), ("c", 2), ("d", 3))]
+    edges = [Edge("a", "b"), Edge("a", "c"), Edge("b", "d"), Edge("c", "d"), Edge("d", "a")]
+    assert critical_path_priorities(steps, edges) == {"d": 3, "b": 13, "c": 5, "a": 14}
+
+
+def test_duration_model_learns_from_history_rows():
+    model = StepDurationModel(alpha=0.5, overrides={})
+    assert model.estimate("short", "python", path="tests/fanout") == 1000
+
+    folded = model.observe_rows([
+        {"event_id": 10, "path": "tests/fanout", "step": "short", "tool_kind": "python", "duration_ms": 4000},
+        {"event_id": 12, "path": "tests/fanout", "step": "short:task_sequence", "tool_kind": "python", "duration_ms": 2000},
+        {"event_id": 11, "path": "tests/other", "step": "x", "tool_kind": "python", "duration_ms": None},
+    ])
+
+    assert folded == 3
+    assert model.last_event_id == 12
+    assert model.samples("tests/fanout", "short", "python") == 2
+    assert model.estimate("short", "python", path="tests/fanout") == 3000
+    # Unseen step of a known kind falls back to the per-kind history.
+    assert model.estimate("other", "python", path="tests/fanout") == 3000
+    assert model.estimate("other", "http", path="tests/fanout") == 1200
+
+
+def test_dispatcher_priorities_follow_learned_durations():
+    model = StepDurationModel(overrides={})
+    dispatcher = Dispatcher(model=model)
+    playbook = _playbook()
+
+    before = dispatcher.priorities(playbook)
+    assert before["long"] > before["short"]
+    assert dispatcher.priorities(playbook) is before
+
+    model.observe("tests/fanout", "short", "python", 60_000)
+    after = dispatcher.priorities(playbook)
+    assert after["short"] > after["long"]
+    assert dispatcher.step_priority(playbook, "short") == 60_000
+
+
+def test_dispatcher_uses_solver_when_resources_are_capped():
+    pytest.importorskip("ortools")
+    playbook = {
+        "metadata": {"path": "tests/capped"},
+        "workflow": [
+            {"step": "start", "next": [{"step": "a"}, {"step": "b"}, {"step": "c"}]},
+            {"step": "a", "tool": "http", "next": [{"step": "end"}]},
+            {"step": "b", "tool": "http", "next": [{"step": "end"}]},
+            {"step": "c", "tool": "duckdb", "next": [{"step": "end"}]},
+            {"step": "end"},
+        ],
+    }
+    model = StepDurationModel(overrides={})
+    model.observe("tests/capped", "a", "http", 5000)
+    priorities = Dispatcher(model=model, resource_caps={"http_pool": 1}).priorities(playbook)
+    assert priorities["start"] > priorities["a"] > priorities["b"]
+    assert priorities["end"] == min(priorities.values())
+
+
+@pytest.mark.asyncio
+async def test_engine_publishes_commands_in_priority_order(monkeypatch):
+    from noetl.core.dsl.engine.executor import ControlFlowEngine
+    from noetl.core.dsl.engine.models import Command, ToolCall
+
+    engine = ControlFlowEngine.__new__(ControlFlowEngine)
+    commands = [
+        Command(execution_id="1", step=name, tool=ToolCall(kind="python", config={}), priority=priority)
+        for name, priority in (("short", 1000), ("long", 9000), ("other", 1000))
+    ]
+
+    async def _inner(event, conn=None, already_persisted=False, timing_capture=None):
+        return list(commands)
+
+    monkeypatch.setattr(engine, "_handle_event_inner", _inner)
+    ordered = await engine.handle_event(object())
+    assert [command.step for command in ordered] == ["long", "short", "other"]
+
+
+class _EstimateCursor:
+    """Serves noetl.step_duration_estimate and command history; records statements."""
+
+    def __init__(self, db):
+        self.db = db
+        self._result = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=None):
+        self.db.statements.append((query, params))
+        if "max(last_event_id)" in query:
+            marks = [row["last_event_id"] for row in self.db.estimates.values()]
+            self._result = [{"last_event_id": max(marks, default=0)}]
+        elif "FROM noetl.step_duration_estimate" in query:
+            self._result = list(self.db.estimates.values())
+        elif "command.completed" in query:
+            self._result = [row for row in self.db.history if row["event_id"] > params["after_event_id"]]
+        else:
+            raise AssertionError(query)
+
+    async def executemany(self, query, params_seq):
+        assert "INSERT INTO noetl.step_duration_estimate" in query
+        for path, step, tool_kind, ewma_ms, samples, last_event_id in params_seq:
+            self.db.estimates[(path, step, tool_kind)] = {
+                "path": path, "step": step, "tool_kind": tool_kind,
+                "ewma_ms": ewma_ms, "samples": samples, "last_event_id": last_event_id,
+            }
+
+    async def fetchone(self):
+        return self._result[0] if self._result else None
+
+    async def fetchall(self):
+        return list(self._result)
+
+
+class _EstimateDb:
+    def __init__(self, history):
+        self.history = history
+        self.estimates = {}
+        self.statements = []
+
+    def cursor(self, row_factory=None):
+        return _EstimateCursor(self)
+
+
+@pytest.mark.asyncio
+async def test_only_the_leader_reads_history_and_followers_load_its_estimates():
+    db = _EstimateDb([
+        {"event_id": 10, "path": "tests/fanout", "step": "short", "tool_kind": "python", "duration_ms": 4000},
+        {"event_id": 12, "path": "tests/fanout", "step": "long", "tool_kind": "duckdb", "duration_ms": 9000},
+    ])
+    leader = StepDurationModel(overrides={})
+    follower = StepDurationModel(overrides={})
+
+    assert await leader.sync(leader=True, conn=db) == 2
+    history_reads = [params for query, params in db.statements if "command.completed" in query]
+    assert history_reads[0]["after_event_id"] == 0
+    assert history_reads[0]["window_seconds"] > 0
+    assert db.estimates[("tests/fanout", "short", "python")]["ewma_ms"] == 4000
+    assert db.estimates[("", "", "duckdb")]["last_event_id"] == 12
+
+    db.statements.clear()
+    assert await follower.sync(leader=False, conn=db) == 0
+    assert not any("command.completed" in query for query, _ in db.statements)
+    assert follower.last_event_id == 12
+    assert follower.estimate("long", "duckdb", path="tests/fanout") == 9000
+    assert follower.estimate("other", "python", path="tests/x") == 4000
+
+    # A new leader resumes from the persisted watermark.
+    db.statements.clear()
+    assert await follower.sync(leader=True, conn=db) == 0
+    history_reads = [params for query, params in db.statements if "command.completed" in query]
+    assert history_reads[0]["after_event_id"] == 12
@@ -2,7 +2,8 @@ import pytest
 from jinja2 import Environment
 
 from noetl.tools import execute_task
-from noetl.tools.mcp import execute_mcp_task
+from noetl.tools.mcp import close_mcp_sessions, execute_mcp_task
+from noetl.tools.mcp import executor as mcp_executor
 
 
 class _FakeResponse:
@@ -18,23 +19,29 @@ class _FakeResponse:
 
 class _FakeAsyncClient:
     timeouts = []
+    instances = []
 
     def __init__(self, *args, **kwargs):
-        self.__class__.timeouts.append(kwargs.get("timeout"))
+        self.__class__.instances.append(self)
         self.posts = []
         self.gets = []
+        self.deletes = []
+        self.is_closed = False
 
-    async def __aenter__(self):
-        return self
+    async def aclose(self):
+        self.is_closed = True
 
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-
-    async def get(self, url):
+    async def get(self, url, timeout=None):
+        self.__class__.timeouts.append(timeout)
         self.gets.append(url)
         return _FakeResponse("ok")
 
-    async def post(self, endpoint, json, headers):
+    async def delete(self, url, headers, timeout=None):
+        self.deletes.append((url, headers))
+        return _FakeResponse("")
+
+    async def post(self, endpoint, json, headers, timeout=None):
+        self.__class__.timeouts.append(timeout)
         self.posts.append((endpoint, json, headers))
         if json["method"] == "initialize":
             return _FakeResponse(
@@ -42,13 +49,15 @@ class _FakeAsyncClient:
                 headers={"mcp-session-id": "session-1"},
             )
         assert headers["Mcp-Session-Id"] == "session-1"
+        if json["method"] == "tools/list":
+            return _FakeResponse('data: {"jsonrpc":"2.0","id":2,"result":{"tools":[{"name":"pods_list"}]}}')
         return _FakeResponse(
             'data: {"jsonrpc":"2.0","id":2,"result":{"content":[{"type":"text","text":"pod-a Running"}]}}'
         )
 
 
 class _FakeErrorAsyncClient(_FakeAsyncClient):
-    async def post(self, endpoint, json, headers):
+    async def post(self, endpoint, json, headers, timeout=None):
         self.posts.append((endpoint, json, headers))
         if json["method"] == "initialize":
             return _FakeResponse(
@@ -58,6 +67,19 @@ class _FakeErrorAsyncClient(_FakeAsyncClient):
         return _FakeResponse('data: {"jsonrpc":"2.0","id":2,"error":{"message":"tool failed"}}')
 
 
+@pytest.fixture(autouse=True)
+def _fresh_session_pool():
+    _FakeAsyncClient.timeouts = []
+    _FakeAsyncClient.instances = []
+    mcp_executor._MCP_CLIENTS.clear()
+    mcp_executor._MCP_SESSIONS.clear()
+    mcp_executor._MCP_SESSION_LOCKS.clear()
+    yield
+    mcp_executor._MCP_CLIENTS.clear()
+    mcp_executor._MCP_SESSIONS.clear()
+    mcp_executor._MCP_SESSION_LOCKS.clear()
+
+
 def test_tools_package_preserves_execute_task_export():
     assert callable(execute_task)
 
@@ -86,7 +108,7 @@ async def test_execute_mcp_tool_call(monkeypatch):
     assert result["tool"] == "pods_list_in_namespace"
     assert result["arguments"] == {"namespace": "noetl"}
     assert result["text"] == "pod-a Running"
-    assert _FakeAsyncClient.timeouts == [60.0]
+    assert _FakeAsyncClient.timeouts == [60.0, 60.0]
 
 
 @pytest.mark.asyncio
@@ -169,3 +191,116 @@ async def test_execute_mcp_returns_structured_error(monkeypatch):
 
     assert result["status"] == "error"
     assert result["error"] == "tool failed"
+
+
+def _tool_call(tool="pods_list", **extra):
+    return {"endpoint": "http://mcp.example/mcp", "method": "tools/call", "tool": tool, **extra}
+
+
+@pytest.mark.asyncio
+async def test_execute_mcp_reuses_initialized_session(monkeypatch):
+    monkeypatch.setattr("noetl.tools.mcp.executor.httpx.AsyncClient", _FakeAsyncClient)
+
+    first = await execute_mcp_task(_tool_call(), {}, Environment(), {})
+    second = await execute_mcp_task(_tool_call("pods_get"), {}, Environment(), {})
+    other_version = await execute_mcp_task(_tool_call(protocol_version="2024-11-05"), {}, Environment(), {})
+
+    assert [r["status"] for r in (first, second, other_version)] == ["ok", "ok", "ok"]
+    assert second["initialize"] == {"serverInfo": {"name": "fake"}}
+    (client,) = _FakeAsyncClient.instances
+    methods = [payload["method"] for _endpoint, payload, _headers in client.posts]
+    assert methods == ["initialize", "tools/call", "tools/call", "initialize", "tools/call"]
+    call_ids = [payload["id"] for _endpoint, payload, _headers in client.posts[:3]]
+    assert len(set(call_ids)) == 3
+
+    await close_mcp_sessions()
+    assert client.is_closed
+    assert [headers["Mcp-Session-Id"] for _url, headers in client.deletes] == ["session-1", "session-1"]
+
+
+@pytest.mark.asyncio
+async def test_execute_mcp_caches_tool_catalog_per_session(monkeypatch):
+    monkeypatch.setattr("noetl.tools.mcp.executor.httpx.AsyncClient", _FakeAsyncClient)
+    listing = {"endpoint": "http://mcp.example/mcp", "method": "tools/list"}
+
+    first = await execute_mcp_task(listing, {}, Environment(), {})
+    second = await execute_mcp_task(listing, {}, Environment(), {})
+
+    assert first["result"] == second["result"] == {"tools": [{"name": "pods_list"}]}
+    (client,) = _FakeAsyncClient.instances
+    assert [payload["method"] for _endpoint, payload, _headers in client.posts] == ["initialize", "tools/list"]
+
+
+class _ExpiringAsyncClient(_FakeAsyncClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sessions = 0
+        self.expired = set()
+
+    async def post(self, endpoint, json, headers, timeout=None):
+        self.posts.append((endpoint, json, headers))
+        if json["method"] == "initialize":
+            self.sessions += 1
+            return _FakeResponse(
+                '{"jsonrpc":"2.0","id":1,"result":{}}',
+                headers={"mcp-session-id": f"session-{self.sessions}"},
+            )
+        if headers["Mcp-Session-Id"] in self.expired:
+            return _FakeResponse("", status_code=404)
+        return _FakeResponse('{"jsonrpc":"2.0","id":2,"result":{"content":[{"type":"text","text":"ok"}]}}')
+
+
+@pytest.mark.asyncio
+async def test_execute_mcp_reinitializes_expired_session_once(monkeypatch):
+    monkeypatch.setattr("noetl.tools.mcp.executor.httpx.AsyncClient", _ExpiringAsyncClient)
+
+    assert (await execute_mcp_task(_tool_call(), {}, Environment(), {}))["status"] == "ok"
+    (client,) = _FakeAsyncClient.instances
+    client.expired.add("session-1")
+
+    result = await execute_mcp_task(_tool_call(), {}, Environment(), {})
+
+    assert result["status"] == "ok"
+    assert [headers.get("Mcp-Session-Id") for _endpoint, _payload, headers in client.posts] == [
+        None, "session-1", "session-1", None, "session-2",
+    ]
+
+
+class _SessionErrorAsyncClient(_FakeAsyncClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sessions = 0
+        self.errors = []
+
+    async def post(self, endpoint, json, headers, timeout=None):
+        self.posts.append((endpoint, json, headers))
+        if json["method"] == "initialize":
+            self.sessions += 1
+            return _FakeResponse(
+                '{"jsonrpc":"2.0","id":1,"result":{}}',
+                headers={"mcp-session-id": f"session-{self.sessions}"},
+            )
+        if self.errors:
+            return _FakeResponse(self.errors.pop(0))
+        return _FakeResponse('{"jsonrpc":"2.0","id":2,"result":{"content":[{"type":"text","text":"ok"}]}}')
+
+
+@pytest.mark.asyncio
+async def test_execute_mcp_only_treats_the_session_not_found_code_as_expiry(monkeypatch):
+    monkeypatch.setattr("noetl.tools.mcp.executor.httpx.AsyncClient", _SessionErrorAsyncClient)
+
+    assert (await execute_mcp_task(_tool_call(), {}, Environment(), {}))["status"] == "ok"
+    (client,) = _FakeAsyncClient.instances
+    client.errors.append('{"jsonrpc":"2.0","id":2,"error":{"code":-32603,"message":"tool session limit reached"}}')
+
+    tool_error = await execute_mcp_task(_tool_call(), {}, Environment(), {})
+
+    assert tool_error["status"] == "error"
+    assert tool_error["error"] == "tool session limit reached"
+    assert client.sessions == 1
+
+    client.errors.append('{"jsonrpc":"2.0","id":2,"error":{"code":-32001,"message":"Session not found"}}')
+    retried = await execute_mcp_task(_tool_call(), {}, Environment(), {})
+
+    assert retried["status"] == "ok"
+    assert client.sessions == 2
@@ -0,0 +1,220 @@
+import base64
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pyarrow as pa
+import pytest
+from jinja2 import Environment
+
+import noetl.tools.snowflake.execution as execution_module
+import noetl.tools.snowflake.executor as executor_module
+import noetl.tools.snowflake.session as session_module
+from noetl.core.storage.arrow_ipc import arrow_ipc_to_rows
+
+
+class _FakeCursor:
+    def __init__(self, conn, statement_results):
+        self._conn = conn
+        self._statement_results = statement_results
+        self._tables = None
+        self.description = None
+        self.rowcount = 0
+
+    def execute(self, statement):
+        self._conn.executed.append(statement)
+        tables = self._statement_results.get(statement.strip())
+        if tables is None:
+            self.description, self._tables, self.rowcount = None, None, 1
+        else:
+            self.description = [(name,) for name in tables[0].schema.names]
+            self._tables = tables
+
+    def fetch_arrow_batches(self):
+        if not self._conn.arrow:
+            raise NotImplementedError("result format is JSON")
+        return iter(self._tables)
+
+    def fetchall(self):
+        self._conn.fetchall_calls += 1
+        return [row for table in self._tables for row in table.to_pylist()]
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, statement_results, arrow=True):
+        self._statement_results = statement_results
+        self.arrow = arrow
+        self.executed = []
+        self.fetchall_calls = 0
+        self.closed = False
+
+    def cursor(self, _cursor_class=None):
+        return _FakeCursor(self, self._statement_results)
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_snowflake(monkeypatch):
+    monkeypatch.setattr(session_module, "_IDLE_SESSIONS", {})
+    state = SimpleNamespace(connects=[], connections=[], statement_results={}, arrow=True)
+
+    def fake_connect(**params):
+        state.connects.append(params)
+        conn = _FakeConnection(state.statement_results, arrow=state.arrow)
+        state.connections.append(conn)
+        return conn
+
+    monkeypatch.setattr(executor_module, "connect_to_snowflake", fake_connect)
+    return state
+
+
+def _task(sql, user="analyst"):
+    task_config = {"task": "load", "command_b64": base64.b64encode(sql.encode()).decode()}
+    task_with = {"account": "acme", "user": user, "password": "pw", "warehouse": "WH"}
+    return task_config, {"execution_id": "42"}, Environment(), task_with
+
+
+def test_sessions_are_reused_per_credential_fingerprint(fake_snowflake):
+    executor_module.execute_snowflake_task(*_task("INSERT INTO t VALUES (1);"))
+    executor_module.execute_snowflake_task(*_task("INSERT INTO t VALUES (2);"))
+    assert len(fake_snowflake.connects) == 1
+    assert fake_snowflake.connections[0].executed == ["INSERT INTO t VALUES (1)", "INSERT INTO t VALUES (2)"]
+
+    executor_module.execute_snowflake_task(*_task("INSERT INTO t VALUES (3);", user="other"))
+    assert len(fake_snowflake.connects) == 2
+
+
+def test_session_state_changes_close_the_connection(fake_snowflake):
+    executor_module.execute_snowflake_task(*_task("USE WAREHOUSE BIG; INSERT INTO t VALUES (1);"))
+    assert fake_snowflake.connections[0].closed is True
+
+    executor_module.execute_snowflake_task(*_task("INSERT INTO t VALUES (2);"))
+    assert len(fake_snowflake.connects) == 2
+    assert session_module.close_snowflake_sessions() == 1
+    assert fake_snowflake.connections[1].closed is True
+
+
+def test_session_scoped_objects_close_the_connection(fake_snowflake):
+    executor_module.execute_snowflake_task(*_task("CREATE OR REPLACE TEMPORARY TABLE scratch (id INT);"))
+    executor_module.execute_snowflake_task(*_task("CALL refresh_scratch();"))
+    executor_module.execute_snowflake_task(*_task("CREATE TABLE kept (id INT);"))
+
+    assert [conn.closed for conn in fake_snowflake.connections] == [True, True, False]
+
+
+def test_small_results_are_fetched_as_arrow_and_returned_inline(fake_snowflake):
+    # Snowflake sizes integer columns per chunk, so batches may disagree.
+    fake_snowflake.statement_results["SELECT * FROM t"] = [
+        pa.table({"ID": pa.array([1, 2], pa.int8()), "AMOUNT": pa.array([Decimal("1.50"), None], pa.decimal128(10, 2))}),
+        pa.table({"ID": pa.array([300], pa.int16()), "AMOUNT": pa.array([Decimal("2.25")], pa.decimal128(10, 2))}),
+    ]
+
+    result = executor_module.execute_snowflake_task(*_task("SELECT * FROM t;"))
+
+    statement = result["data"]["statement_0"]
+    assert result["status"] == "success"
+    assert statement["row_count"] == 3
+    assert statement["columns"] == ["ID", "AMOUNT"]
+    assert statement["result"] == [
+        {"ID": 1, "AMOUNT": 1.5},
+        {"ID": 2, "AMOUNT": None},
+        {"ID": 300, "AMOUNT": 2.25},
+    ]
+    assert fake_snowflake.connections[0].fetchall_calls == 0
+
+
+def test_json_result_sets_fall_back_to_fetchall(fake_snowflake):
+    fake_snowflake.arrow = False
+    fake_snowflake.statement_results["SELECT 1"] = [pa.table({"VALUE": [1]})]
+
+    result = executor_module.execute_snowflake_task(*_task("SELECT 1;"))
+
+    assert result["data"]["statement_0"]["result"] == [{"VALUE": 1}]
+    assert fake_snowflake.connections[0].fetchall_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_large_results_are_stored_as_arrow_ipc(fake_snowflake, monkeypatch):
+    from noetl.core.storage import default_store
+
+    stored = []
+
+    async def fake_put_ipc_bytes(execution_id, name, data_bytes, **kwargs):
+        stored.append((execution_id, name, bytes(data_bytes), kwargs))
+        return SimpleNamespace(model_dump=lambda mode: {"kind": "result_ref", "ref": f"noetl://{name}"})
+
+    monkeypatch.setattr(default_store, "put_ipc_bytes", fake_put_ipc_bytes)
+    monkeypatch.setattr(execution_module, "_INLINE_MAX_ROWS", 2)
+    fake_snowflake.statement_results["SELECT * FROM big"] = [
+        pa.table({"ID": pa.array([1, 2], pa.int8())}),
+        pa.table({"ID": pa.array([3, 4], pa.int32())}),
+    ]
+
+    result = await executor_module.execute_snowflake_task_async(*_task("SELECT * FROM big;"))
+
+    statement = result["data"]["statement_0"]
+    assert statement["row_count"] == 4
+    assert "result" not in statement
+    assert statement["rows_ref"] == {"kind": "result_ref", "ref": "noetl://snowflake-load-statement_0"}
+    assert statement["media_type"] == "application/vnd.apache.arrow.stream"
+    execution_id, name, payload, kwargs = stored[0]
+    assert (execution_id, name) == ("42", "snowflake-load-statement_0")
+    assert kwargs["row_count"] == 4
+    assert kwargs["schema_digest"] == statement["schema_digest"]
+    assert arrow_ipc_to_rows(payload) == [{"ID": 1}, {"ID": 2}, {"ID": 3}, {"ID": 4}]
+
+
+@pytest.mark.asyncio
+async def test_arrow_store_runs_while_the_default_executor_is_saturated(fake_snowflake, monkeypatch):
+    import asyncio
+    import concurrent.futures
+
+    from noetl.core.storage import default_store
+
+    async def fake_put_ipc_bytes(execution_id, name, data_bytes, **kwargs):
+        # put_ipc_bytes scrubs on the default executor.
+        await asyncio.to_thread(bytes, data_bytes)
+        return SimpleNamespace(model_dump=lambda mode: {"kind": "result_ref", "ref": f"noetl://{name}"})
+
+    monkeypatch.setattr(default_store, "put_ipc_bytes", fake_put_ipc_bytes)
+    monkeypatch.setattr(execution_module, "_INLINE_MAX_ROWS", 1)
+    fake_snowflake.statement_results["SELECT * FROM big"] = [pa.table({"ID": pa.array([1, 2])})]
+    single = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    asyncio.get_running_loop().set_default_executor(single)
+    try:
+        result = await asyncio.wait_for(
+            executor_module.execute_snowflake_task_async(*_task("SELECT * FROM big;")), timeout=10
+        )
+    finally:
+        single.shutdown(wait=False)
+
+    assert result["data"]["statement_0"]["rows_ref"]["ref"] == "noetl://snowflake-load-statement_0"
+
+
+@pytest.mark.asyncio
+async def test_arrow_store_timeout_fails_the_task(fake_snowflake, monkeypatch):
+    import asyncio
+
+    from noetl.core.storage import default_store
+
+    async def hung_put_ipc_bytes(execution_id, name, data_bytes, **kwargs):
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(default_store, "put_ipc_bytes", hung_put_ipc_bytes)
+    monkeypatch.setattr(execution_module, "_INLINE_MAX_ROWS", 1)
+    monkeypatch.setattr(executor_module, "_STORE_TIMEOUT_SECONDS", 0.05)
+    fake_snowflake.statement_results["SELECT * FROM big"] = [pa.table({"ID": pa.array([1, 2])})]
+
+    result = await asyncio.wait_for(
+        executor_module.execute_snowflake_task_async(*_task("SELECT * FROM big;")), timeout=10
+    )
+
+    assert result["status"] == "error"
+    assert "took longer than" in str(result)
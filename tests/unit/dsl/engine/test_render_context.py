@@ -0,0 +1,150 @@
+from jinja2 import Environment
+
+from noetl.core.credential_refs import KEYCHAIN_MANIFEST_KEY, strip_keychain_namespaces
+from noetl.core.dsl.engine.executor.rendering import RenderingMixin
+from noetl.core.dsl.engine.executor.state import ExecutionState, RenderContext
+from noetl.core.dsl.engine.models import Event, Playbook
+
+
+class _TemplateCache:
+    def get_or_compile(self, env, template_str):
+        return env.from_string(template_str)
+
+
+class _Renderer(RenderingMixin):
+    def __init__(self):
+        self.jinja_env = Environment()
+        self._template_cache = _TemplateCache()
+
+
+def _state() -> ExecutionState:
+    playbook = Playbook.model_validate(
+        {
+            "apiVersion": "noetl.io/v10",
+            "kind": "Playbook",
+            "metadata": {"name": "render-context-test"},
+            "workload": {"region": "us-central1", "execution_id": "spoofed"},
+            "workflow": [{"step": "start", "tool": {"kind": "python", "code": "result = {}"}}],
+        }
+    )
+    return ExecutionState("123", playbook, {}, catalog_id=42)
+
+
+def _event(step="start", payload=None) -> Event:
+    return Event(execution_id="123", step=step, name="call.done", payload=payload or {})
+
+
+def test_render_context_layers_keep_existing_precedence():
+    state = _state()
+    state.variables["fetch"] = {"from": "variables"}
+    state.variables["loop"] = "variable loop"
+    state.step_results["fetch"] = {"status": "success", "context": {"rows": [1]}}
+    state.variables["keychain"] = {"token": {"api_key": "secret"}}
+    state.variables["nested"] = {"keychain": {"api_key": "secret"}, "kept": 1}
+
+    context = state.get_render_context(_event())
+
+    assert isinstance(context, RenderContext)
+    assert context["region"] == "us-central1"
+    assert context["ctx"]["region"] == "us-central1"
+    assert context["workload"] is context["ctx"]
+    assert context["fetch"] == {"status": "success", "context": {"rows": [1]}}
+    assert context["loop"] == "variable loop"
+    assert context["execution_id"] == "123"
+    assert context["catalog_id"] == "42"
+    assert context["job"]["id"] == "123"
+    assert "keychain" not in context
+    assert "keychain" not in context["ctx"]
+    assert context["ctx"]["nested"] == {"kept": 1}
+    assert context["event"]["name"] == "call.done"
+    assert "output" in context.maps[0]
+
+
+def test_render_context_reuses_cached_layers_until_state_changes():
+    state = _state()
+    state.variables["first"] = 1
+    state.step_results["fetch"] = {"status": "success"}
+
+    before = state.get_render_context(_event())
+    again = state.get_render_context(_event())
+    assert again.maps[1:] == before.maps[1:]
+    assert all(a is b for a, b in zip(again.maps[1:], before.maps[1:]))
+
+    state.variables["second"] = 2
+    state.step_results.pop("fetch")
+    after = state.get_render_context(_event())
+
+    assert after["second"] == 2
+    assert after["ctx"]["second"] == 2
+    assert "fetch" not in after
+    # Contexts handed out earlier keep their snapshot.
+    assert "second" not in before
+    assert "second" not in before["ctx"]
+    assert before["fetch"] == {"status": "success"}
+
+
+def test_render_context_patches_released_layers_in_place():
+    state = _state()
+    state.variables["first"] = 1
+    state.step_results["fetch"] = {"status": "success"}
+    context = state.get_render_context(_event())
+    variables_layer, step_layer, ctx = context.maps[3], context.maps[2], context["ctx"]
+    del context
+
+    state.variables["second"] = 2
+    state.step_results["load"] = {"status": "success"}
+    after = state.get_render_context(_event())
+
+    assert after.maps[3] is variables_layer and after.maps[2] is step_layer
+    assert after["ctx"] is ctx
+    assert after["second"] == 2 and after["ctx"]["second"] == 2
+    assert after["load"] == {"status": "success"}
+
+    # A derived context still reads the layers, so the next patch copies them.
+    child = after.new_child()
+    del after
+    state.variables["third"] = 3
+    latest = state.get_render_context(_event())
+    assert latest.maps[3] is not variables_layer
+    assert latest["third"] == 3
+    assert "third" not in child and "third" not in child["ctx"]
+
+
+def test_render_context_rebuilds_when_keychain_manifest_changes():
+    state = _state()
+    state.variables["openai_token"] = {"api_key": "secret"}
+    assert "openai_token" in state.get_render_context(_event())
+
+    state.variables[KEYCHAIN_MANIFEST_KEY] = {"entries": {"openai_token": {"kind": "secret_manager"}}}
+    context = state.get_render_context(_event())
+
+    assert "openai_token" not in context
+    assert "openai_token" not in context["ctx"]
+
+
+def test_render_context_writes_stay_in_the_overlay():
+    state = _state()
+    context = state.get_render_context(_event())
+    context["region"] = "eu-west1"
+    context["__frame_max_rows"] = 10
+
+    fresh = state.get_render_context(_event())
+    assert fresh["region"] == "us-central1"
+    assert "__frame_max_rows" not in fresh
+    assert state.variables["region"] == "us-central1"
+
+
+def test_render_context_renders_and_strips_like_a_dict():
+    state = _state()
+    state.step_results["fetch"] = {"status": "success", "rows": [{"id": 7}], "keychain": {"api_key": "secret"}}
+    context = state.get_render_context(_event())
+    renderer = _Renderer()
+
+    assert renderer._render_template("{{ ctx.region }}", context) == "us-central1"
+    assert renderer._render_template("{{ fetch.rows[0].id }}-{{ region | upper }}", context) == "7-US-CENTRAL1"
+    assert renderer._render_template("{{ range(2) | list | length }}", context) == "2"
+
+    stripped = strip_keychain_namespaces(context)
+    assert type(stripped) is dict
+    assert "keychain" not in stripped["fetch"]
+    assert stripped["region"] == "us-central1"
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import socket
 import threading
 import time
+from types import SimpleNamespace
 from typing import Any, Optional
 from unittest.mock import AsyncMock, patch
 
@@ -19,7 +21,15 @@ pa = pytest.importorskip("pyarrow")
 from noetl.server.api.result.flight_server import (
     ARROW_STREAM_MEDIA_TYPE,
     NoetlFlightServer,
+    _decode_ticket,
+    _encode_ticket,
     _extract_rows,
+    _plan_partitions,
+    _slice_batches,
+    _store_uploaded_batches,
+    _ResultSource,
+    _SourceCache,
+    _UploadTooLarge,
 )
 
 
@@ -289,6 +299,136 @@ def test_flight_get_flight_info_non_tabular_raises_unavailable(monkeypatch):
         server.shutdown()
 
 
+# ---------------------------------------------------------------------------
+# Streaming DoGet / partitioned FlightInfo / DoPut
+# ---------------------------------------------------------------------------
+
+
+def test_ticket_round_trip_keeps_raw_ref_for_whole_results():
+    ref = "noetl://execution/1/result/s/x"
+    assert _encode_ticket(ref) == ref.encode()
+    assert _decode_ticket(_encode_ticket(ref)) == (ref, 0, None)
+    assert _decode_ticket(_encode_ticket(ref, 10, 5)) == (ref, 10, 5)
+
+
+def test_plan_partitions_splits_large_results():
+    assert _plan_partitions(10, 100) == [(None, None)]
+    assert _plan_partitions(250, 100) == [(0, 100), (100, 100), (200, 50)]
+
+
+def test_slice_batches_yields_row_window_across_batches():
+    batches = [pa.record_batch({"id": list(range(i, i + 4))}) for i in (0, 4, 8)]
+
+    window = list(_slice_batches(iter(batches), 3, 6))
+
+    assert [b.num_rows for b in window] == [1, 4, 1]
+    assert [v for b in window for v in b.column(0).to_pylist()] == [3, 4, 5, 6, 7, 8]
+
+
+def test_flight_do_put_then_partitioned_get(monkeypatch):
+    """A worker uploads batches via DoPut; FlightInfo advertises one
+    endpoint per row range and each DoGet streams only its range."""
+    from noetl.core.storage import TempStore
+
+    store = TempStore()
+    ipc_reads = []
+    get_arrow_ipc_bytes = store.get_arrow_ipc_bytes
+
+    async def counting_get_arrow_ipc_bytes(ref):
+        ipc_reads.append(ref)
+        return await get_arrow_ipc_bytes(ref)
+
+    monkeypatch.setattr(store, "get_arrow_ipc_bytes", counting_get_arrow_ipc_bytes)
+    monkeypatch.setattr("noetl.server.api.result.flight_server.default_store", store)
+    monkeypatch.setattr("noetl.server.api.result.flight_server._FLIGHT_ENDPOINT_ROWS", 40)
+    monkeypatch.setenv("NOETL_INTERNAL_API_TOKEN", "svc-token")
+
+    port = _find_free_port()
+    server = NoetlFlightServer(location=f"grpc://127.0.0.1:{port}")
+    server.start_in_thread()
+    _wait_until_listening(port)
+    try:
+        client = pyarrow_flight.connect(f"grpc://127.0.0.1:{port}")
+        table = pa.table({"id": list(range(100)), "name": [f"n{i}" for i in range(100)]})
+        descriptor = pyarrow_flight.FlightDescriptor.for_command(
+            b'{"execution_id": "777", "name": "upload", "step": "extract", "store": "memory"}'
+        )
+        with pytest.raises(pyarrow_flight.FlightUnauthenticatedError):
+            writer, _ = client.do_put(descriptor, table.schema)
+            writer.write_table(table)
+            writer.close()
+        options = pyarrow_flight.FlightCallOptions(headers=[(b"authorization", b"Bearer svc-token")])
+        writer, metadata_reader = client.do_put(descriptor, table.schema, options=options)
+        for batch in table.to_batches(max_chunksize=30):
+            writer.write_batch(batch)
+        writer.done_writing()
+        ref = json.loads(bytes(metadata_reader.read()).decode())
+        writer.close()
+
+        assert ref["meta"]["row_count"] == 100
+        assert ref["meta"]["media_type"] == ARROW_STREAM_MEDIA_TYPE
+
+        info = client.get_flight_info(
+            pyarrow_flight.FlightDescriptor.for_command(ref["ref"].encode())
+        )
+        assert info.total_records == 100
+        assert len(info.endpoints) == 3
+
+        parts = [client.do_get(ep.ticket).read_all() for ep in info.endpoints]
+        assert [p.num_rows for p in parts] == [40, 40, 20]
+        assert pa.concat_tables(parts).equals(table)
+
+        # The raw ref ticket still streams the whole result.
+        whole = client.do_get(pyarrow_flight.Ticket(ref["ref"].encode())).read_all()
+        assert whole.num_rows == 100
+        # FlightInfo and every DoGet sliced one store read.
+        assert ipc_reads == [ref["ref"]]
+    finally:
+        server.shutdown()
+
+
+def test_store_uploaded_batches_rejects_oversized_streams():
+    stored = []
+
+    class _Store:
+        async def put_ipc_bytes(self, *args, **kwargs):  # pragma: no cover - not reached
+            stored.append(args)
+
+    table = pa.table({"id": list(range(10_000))})
+    spec = {"execution_id": "777", "name": "upload"}
+
+    with pytest.raises(_UploadTooLarge, match="exceeds 4096 bytes"):
+        _store_uploaded_batches(
+            spec, table.schema, iter(table.to_batches(max_chunksize=1000)), store=_Store(), max_bytes=4096
+        )
+    assert stored == []
+
+
+def test_source_cache_loads_each_ref_once_and_counts_bytes_once():
+    loads = []
+
+    def load(ref_uri):
+        loads.append(ref_uri)
+        time.sleep(0.05)
+        return _ResultSource(schema=None, row_count=1, total_bytes=100, open_batches=iter)
+
+    cache = _SourceCache()
+    threads = [threading.Thread(target=cache.get, args=("noetl://r", load)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == ["noetl://r"]
+    assert cache._loading == {}
+    assert cache._bytes == 100
+
+    # Re-storing a ref replaces its entry instead of counting it twice.
+    cache._store("noetl://r", load("noetl://r"))
+    assert list(cache._entries) == ["noetl://r"]
+    assert cache._bytes == 100
+
+
 def test_arrow_stream_media_type_matches_python_constant():
     """The constant re-exported from this module matches the Python
     storage layer's own constant so cross-stack consumers can switch
@@ -445,11 +585,26 @@ def test_parse_bearer_tokens_splits_and_trims():
     assert _parse_bearer_tokens(", ,, alpha,,") == {"alpha"}
 
 
-def test_bearer_tokens_none_means_no_auth():
-    """Constructing without bearer_tokens leaves auth disabled."""
+_DO_GET = SimpleNamespace(method=pyarrow_flight.FlightMethod.DO_GET)
+_DO_PUT = SimpleNamespace(method=pyarrow_flight.FlightMethod.DO_PUT)
+
+
+def test_bearer_tokens_none_means_anonymous_reads_only(monkeypatch):
+    """Without bearer_tokens reads stay open, but DoPut is refused
+    unless it carries the internal service token."""
+    monkeypatch.delenv("NOETL_INTERNAL_API_TOKEN", raising=False)
     server = NoetlFlightServer(location="grpc://0.0.0.0:8083")
     assert server.bearer_tokens is None
-    assert server._build_middleware() is None
+    factory = server._build_middleware()["bearer-auth"]
+
+    assert factory.start_call(info=_DO_GET, headers={}) is None
+    with pytest.raises(pyarrow_flight.FlightUnauthenticatedError, match="DoPut is disabled"):
+        factory.start_call(info=_DO_PUT, headers={})
+
+    monkeypatch.setenv("NOETL_INTERNAL_API_TOKEN", "svc-token")
+    with pytest.raises(pyarrow_flight.FlightUnauthenticatedError):
+        factory.start_call(info=_DO_PUT, headers={"authorization": ["Bearer nope"]})
+    assert factory.start_call(info=_DO_PUT, headers={"authorization": ["Bearer svc-token"]}) is None
 
 
 def test_bearer_tokens_empty_set_normalised_to_none():
@@ -460,7 +615,6 @@ def test_bearer_tokens_empty_set_normalised_to_none():
         bearer_tokens=set(),
     )
     assert server.bearer_tokens is None
-    assert server._build_middleware() is None
 
 
 def test_bearer_tokens_builds_middleware_factory():
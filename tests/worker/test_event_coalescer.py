@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+from noetl.worker.event_coalescer import EventCoalescer
+from noetl.worker.nats_worker import Worker
+
+
+def _evt(step, name):
+    return {"step": step, "name": name, "payload": {}, "actionable": False, "informative": True}
+
+
+class _RecordingSender:
+    def __init__(self, delay=0.0, fail=False):
+        self.calls = []
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self, server_url, execution_id, events, timeout_seconds, max_retries):
+        self.calls.append((execution_id, [e["name"] for e in events], timeout_seconds, max_retries))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("batch rejected")
+        return True
+
+
+@pytest.mark.asyncio
+async def test_coalesces_events_from_concurrent_commands_into_one_batch():
+    sender = _RecordingSender()
+    coalescer = EventCoalescer(sender, linger_seconds=0.01, max_batch_events=64)
+
+    results = await asyncio.gather(
+        coalescer.submit("http://server", 1, [_evt("a", "call.done"), _evt("a", "step.exit")]),
+        coalescer.submit("http://server", 1, [_evt("b", "call.done"), _evt("b", "step.exit")]),
+        coalescer.submit("http://server", 2, [_evt("c", "call.done")]),
+    )
+
+    assert results == [True, True, True]
+    assert sorted(sender.calls) == [
+        ("1", ["call.done", "step.exit", "call.done", "step.exit"], None, None),
+        ("2", ["call.done"], None, None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_seals_early_and_keeps_order():
+    sender = _RecordingSender()
+    coalescer = EventCoalescer(sender, linger_seconds=10.0, max_batch_events=2)
+
+    await asyncio.gather(
+        coalescer.submit("http://server", 1, [_evt("a", "e1")]),
+        coalescer.submit("http://server", 1, [_evt("a", "e2")]),
+        coalescer.submit("http://server", 1, [_evt("a", "e3"), _evt("a", "e4")]),
+    )
+
+    assert [names for _, names, _, _ in sender.calls] == [["e1", "e2"], ["e3", "e4"]]
+
+
+@pytest.mark.asyncio
+async def test_next_bucket_grows_while_previous_batch_is_in_flight():
+    sender = _RecordingSender(delay=0.05)
+    coalescer = EventCoalescer(sender, linger_seconds=0.001, max_batch_events=64)
+
+    first = asyncio.create_task(coalescer.submit("http://server", 1, [_evt("a", "e1")]))
+    await asyncio.sleep(0.01)  # e1 flushed, sender still busy
+    rest = [
+        asyncio.create_task(coalescer.submit("http://server", 1, [_evt(step, "e2")]))
+        for step in ("b", "c", "d")
+    ]
+    await asyncio.gather(first, *rest)
+
+    assert [names for _, names, _, _ in sender.calls] == [["e1"], ["e2", "e2", "e2"]]
+
+
+@pytest.mark.asyncio
+async def test_retry_policies_are_not_mixed_and_failures_propagate():
+    sender = _RecordingSender(fail=True)
+    coalescer = EventCoalescer(sender, linger_seconds=0.01, max_batch_events=64)
+
+    outcomes = await asyncio.gather(
+        coalescer.submit("http://server", 1, [_evt("a", "command.started")], timeout_seconds=0.25, max_retries=1),
+        coalescer.submit("http://server", 1, [_evt("b", "call.done")]),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert {call[2:] for call in sender.calls} == {(0.25, 1), (None, None)}
+
+
+class _AcceptedResponse:
+    status_code = 202
+    headers = {}
+
+    def json(self):
+        return {"status": "accepted", "request_id": "r"}
+
+    def raise_for_status(self):
+        return None
+
+
+class _BatchHttpClient:
+    def __init__(self):
+        self.urls = []
+        self.bodies = []
+
+    async def post(self, url, **kwargs):
+        self.urls.append(url)
+        self.bodies.append(kwargs.get("json"))
+        return _AcceptedResponse()
+
+
+def _coalescing_worker(monkeypatch):
+    from noetl.core.config import get_worker_settings
+
+    monkeypatch.setenv("NOETL_WORKER_EVENT_LINGER_MS", "20")
+    get_worker_settings(reload=True)
+    try:
+        worker = Worker(worker_id="worker-test")
+    finally:
+        monkeypatch.undo()
+        get_worker_settings(reload=True)
+    worker._http_client = _BatchHttpClient()
+
+    async def _passthrough(**kwargs):
+        return kwargs["payload"]
+
+    monkeypatch.setattr(worker, "_prepare_event_payload_for_transport", _passthrough)
+    return worker
+
+
+@pytest.mark.asyncio
+async def test_worker_coalesces_terminal_batches_across_commands(monkeypatch):
+    worker = _coalescing_worker(monkeypatch)
+
+    await asyncio.gather(*[
+        worker._emit_terminal_event_batch(
+            "http://server",
+            42,
+            f"step_{i}",
+            primary_name="call.done",
+            primary_payload={"command_id": f"cmd-{i}"},
+            terminal_status="COMPLETED",
+            command_id=f"cmd-{i}",
+            command_terminal_name="command.completed",
+        )
+        for i in range(4)
+    ])
+
+    assert worker._http_client.urls == ["http://server/api/events/batch"]
+    events = worker._http_client.bodies[0]["events"]
+    assert len(events) == 12
+    for i in range(4):
+        per_command = [e["name"] for e in events if e["step"] == f"step_{i}"]
+        assert per_command == ["call.done", "step.exit", "command.completed"]
+
+
+@pytest.mark.asyncio
+async def test_single_events_keep_the_synchronous_events_endpoint(monkeypatch):
+    worker = _coalescing_worker(monkeypatch)
+
+    await asyncio.gather(
+        worker._emit_event("http://server", 42, "step_0", "command.heartbeat", {"command_id": "cmd-0"}),
+        worker._emit_batch_events("http://server", 42, [_evt("step_1", "command.failed")]),
+    )
+
+    assert worker._http_client.urls == ["http://server/api/events", "http://server/api/events"]
@@ -64,3 +64,34 @@ async def test_result_handler_scrubs_preview_extracted_and_stored_data(monkeypat
     assert store.puts[0]["data"]["headers"]["Authorization"] == "[REDACTED]"
     assert processed["Authorization"] == "[REDACTED]"
     assert "placeholder-token" not in str(processed["_preview"])
+
+
+@pytest.mark.asyncio
+async def test_result_handler_hands_store_the_encoded_scrubbed_payload():
+    import json
+
+    store = _CaptureStore()
+    handler = ResultHandler(execution_id="123", store=store, inline_max_bytes=64)
+    result = {
+        "status": "ok",
+        "headers": {"Authorization": "Bearer placeholder-token"},
+        "rows": [{"id": i, "name": f"row-{i}"} for i in range(30)],
+    }
+
+    processed = await handler.process_result(step_name="fetch_rows", result=result)
+
+    put = store.puts[0]
+    assert put["serialized"] == json.dumps(put["data"], default=str).encode("utf-8")
+    assert processed["_size_bytes"] == len(put["serialized"])
+    assert b"placeholder-token" not in put["serialized"]
+
+
+@pytest.mark.asyncio
+async def test_result_handler_keeps_small_results_inline_with_exact_size():
+    store = _CaptureStore()
+    handler = ResultHandler(execution_id="123", store=store, inline_max_bytes=1024)
+
+    processed = await handler.process_result(step_name="small", result={"status": "ok", "count": 3})
+
+    assert processed == {"status": "ok", "count": 3}
+    assert store.puts == []
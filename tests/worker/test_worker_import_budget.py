@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import noetl.worker.nats_worker as worker_module
+
+# Tool SDKs a worker must not pay for before its first claim.
+_HEAVY_TOOL_MODULES = ("snowflake.connector", "duckdb", "google.cloud.storage", "boto3", "aioboto3", "kubernetes")
+
+# Generous for CI noise; the import + Worker() takes ~0.75s on a dev box
+# and took ~1.6s while every tool was imported at module load.
+_BUDGET_MS = float(os.getenv("NOETL_WORKER_IMPORT_BUDGET_MS", "1400"))
+
+_PROBE = """
+import time
+started = time.perf_counter()
+import noetl.worker.nats_worker as m
+m.Worker(worker_id="import-probe")
+print((time.perf_counter() - started) * 1000.0)
+"""
+
+
+def _import_profile():
+    env = {**os.environ, "NOETL_WORKER_WARM_TOOLS": ""}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+        check=True,
+    )
+    imported = set()
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            imported.add(line.rsplit("|", 1)[1].strip())
+    return float(proc.stdout.strip().splitlines()[-1]), imported
+
+
+def test_worker_time_to_first_fetch_stays_within_import_budget():
+    elapsed_ms, imported = _import_profile()
+
+    heavy = sorted(name for name in imported if name.startswith(_HEAVY_TOOL_MODULES))
+    assert heavy == [], f"worker startup imports tool SDKs: {heavy[:10]}"
+    assert not any(name.startswith("noetl.tools.") for name in imported if name != "noetl.tools")
+    assert elapsed_ms < _BUDGET_MS, f"worker import + init took {elapsed_ms:.0f}ms (budget {_BUDGET_MS:.0f}ms)"
+
+
+def test_tool_executors_resolve_on_first_use_and_can_be_patched(monkeypatch):
+    async def fake_mcp(*_args):
+        return {"data": "ok"}
+
+    monkeypatch.setattr(worker_module, "execute_mcp_task", fake_mcp)
+    assert worker_module._tool_executor("execute_mcp_task") is fake_mcp
+
+    from noetl.tools.mcp import execute_mcp_task
+
+    monkeypatch.undo()
+    assert worker_module._tool_executor("execute_mcp_task") is execute_mcp_task
+
+
+def test_warm_tool_executors_skips_unknown_kinds():
+    assert worker_module.warm_tool_executors(["mcp", "not-a-tool"]) == ["mcp"]
+    with pytest.raises(AttributeError):
+        worker_module.execute_not_a_tool
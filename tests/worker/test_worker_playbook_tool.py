@@ -130,7 +130,7 @@ async def test_execute_playbook_waits_for_status_endpoint_not_transient_executio
         async def post(self, _url, json=None, timeout=None):
             return FakeResponse({"execution_id": "child-exec-2"})
 
-        async def get(self, url, timeout=None):
+        async def get(self, url, params=None, timeout=None):
             if url.endswith("/status"):
                 self.status_polls += 1
                 if self.status_polls == 1:
@@ -241,7 +241,7 @@ async def test_execute_playbook_retries_transient_errors_while_polling_status(mo
         async def post(self, _url, json=None, timeout=None):
             return FakeResponse({"execution_id": "child-exec-4"})
 
-        async def get(self, url, timeout=None):
+        async def get(self, url, params=None, timeout=None):
             if url.endswith("/status"):
                 self.status_calls += 1
                 if self.status_calls == 1:
@@ -276,6 +276,129 @@ async def test_execute_playbook_retries_transient_errors_while_polling_status(mo
     assert worker._http_client.status_calls == 2
 
 
+@pytest.mark.asyncio
+async def test_execute_playbook_batch_inputs_start_children_in_one_request(monkeypatch):
+    worker = Worker(worker_id="test-worker")
+    worker._current_execution_id = "99504"
+
+    class FakeResponse:
+        def __init__(self, payload, status_code=200):
+            self._payload = payload
+            self.status_code = status_code
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise RuntimeError(f"HTTP {self.status_code}")
+
+        def json(self):
+            return self._payload
+
+    class FakeHttpClient:
+        def __init__(self):
+            self.posts = []
+            self.status_params = []
+
+        async def post(self, url, json=None, timeout=None):
+            self.posts.append((url, json))
+            return FakeResponse(
+                {
+                    "status": "started",
+                    "executions": [
+                        {"execution_id": f"child-{index}", "status": "started", "commands_generated": 1}
+                        for index, _ in enumerate(json["payloads"])
+                    ],
+                }
+            )
+
+        async def get(self, url, params=None, timeout=None):
+            self.status_params.append(params)
+            execution_id = url.split("/executions/")[1].split("/")[0]
+            return FakeResponse(
+                {
+                    "execution_id": execution_id,
+                    "completed": True,
+                    "failed": execution_id == "child-1",
+                }
+            )
+
+    worker._http_client = FakeHttpClient()
+
+    result = await worker._execute_playbook(
+        {
+            "path": "tests/fixtures/playbooks/example_child",
+            "return_step": "end",
+            "timeout": 4,
+            "inputs": [{"item": 1}, {"item": 2}],
+        },
+        {"batch_number": 5},
+    )
+
+    assert len(worker._http_client.posts) == 1
+    url, body = worker._http_client.posts[0]
+    assert url.endswith("/execute/batch")
+    assert body["payloads"] == [{"batch_number": 5, "item": 1}, {"batch_number": 5, "item": 2}]
+    assert body["parent_execution_id"] == "99504"
+    assert result["execution_ids"] == ["child-0", "child-1"]
+    assert result["failed"] is True
+    assert [item["execution_id"] for item in result["results"]] == ["child-0", "child-1"]
+    assert all(params["wait_seconds"] > 0 for params in worker._http_client.status_params)
+
+
+@pytest.mark.asyncio
+async def test_execute_playbook_batch_inputs_fall_back_to_single_execute(monkeypatch):
+    worker = Worker(worker_id="test-worker")
+    worker._current_execution_id = "99504"
+
+    class FakeResponse:
+        def __init__(self, payload, status_code=200):
+            self._payload = payload
+            self.status_code = status_code
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise RuntimeError(f"HTTP {self.status_code}")
+
+        def json(self):
+            return self._payload
+
+    class FakeHttpClient:
+        def __init__(self):
+            self.posts = []
+
+        async def post(self, url, json=None, timeout=None):
+            self.posts.append((url, json))
+            if url.endswith("/execute/batch"):
+                return FakeResponse({"detail": "Not Found"}, status_code=404)
+            return FakeResponse({"execution_id": f"child-{json['payload']['item']}", "status": "started"})
+
+    worker._http_client = FakeHttpClient()
+
+    result = await worker._execute_playbook(
+        {"path": "tests/fixtures/playbooks/example_child", "inputs": [{"item": 1}, {"item": 2}]},
+        {"batch_number": 5},
+    )
+
+    assert [url.rsplit("/", 1)[-1] for url, _ in worker._http_client.posts] == ["batch", "execute", "execute"]
+    assert [body["payload"] for _, body in worker._http_client.posts[1:]] == [
+        {"batch_number": 5, "item": 1},
+        {"batch_number": 5, "item": 2},
+    ]
+    assert all(body["parent_execution_id"] == "99504" for _, body in worker._http_client.posts[1:])
+    assert result["execution_ids"] == ["child-1", "child-2"]
+
+
+@pytest.mark.asyncio
+async def test_execute_playbook_batch_inputs_reject_non_object_items():
+    worker = Worker(worker_id="test-worker")
+    worker._http_client = object()
+
+    with pytest.raises(ValueError, match="item 1 is str"):
+        await worker._execute_playbook(
+            {"path": "tests/fixtures/playbooks/example_child", "inputs": [{"item": 1}, "two"]},
+            {},
+        )
+
+
 @pytest.mark.asyncio
 async def test_execute_command_error_events_use_externalized_response(monkeypatch):
     worker = Worker(worker_id="test-worker")
@@ -524,7 +647,7 @@ async def test_handle_command_notification_applies_db_semaphore_for_postgres(mon
         def release(self):
             calls["release"] += 1
 
-    async def fake_claim(_server_url, _event_id):
+    async def fake_claim(_server_url, _event_id, _execution_id=None):
         return (
             {
                 "execution_id": 1,
@@ -579,7 +702,7 @@ async def test_handle_command_notification_skips_db_semaphore_for_non_db_tool(mo
         def release(self):
             calls["release"] += 1
 
-    async def fake_claim(_server_url, _event_id):
+    async def fake_claim(_server_url, _event_id, _execution_id=None):
         return (
             {
                 "execution_id": 1,
@@ -620,7 +743,7 @@ async def test_handle_command_notification_returns_delayed_nak_action_without_sl
     worker = Worker(worker_id="test-worker")
     worker._running = True
 
-    async def fake_claim(_server_url, _event_id):
+    async def fake_claim(_server_url, _event_id, _execution_id=None):
         return None, "retry_later", 2.5
 
     async def fail_sleep(_seconds):